@@ -0,0 +1,224 @@
+#! /usr/bin/env python3
+#
+# Benchmark runner
+#
+# Builds the boards of generators.py at each size tier and times the
+# placement, pour, preview, DRC, Gerber, SVG and PNG stages. Results are
+# written as JSON so that runs of different releases can be compared:
+#
+#   python bench.py --tier small --output base.json
+#   python bench.py --tier small --output new.json --compare base.json
+#
+
+import io
+import os
+import gc
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import datetime
+import contextlib
+
+import shapely
+
+from pcbflow import *
+from pcbflow import __version__
+from generators import GENERATORS, TIERS
+
+RESULTS_FORMAT = 1
+
+STAGES = ["place", "pour", "preview", "drc", "gerber", "svg", "png"]
+
+
+def board_size(brd):
+    """Returns the number of polygons and vertices of the copper, mask,
+    silkscreen and paste layers of brd"""
+    geoms = []
+    for layer in brd.layers.values():
+        if not layer.is_outline:
+            geoms.extend([g for _, g in layer.polys])
+            geoms.extend([g for _, g in layer.named_polys])
+            if layer.fill_poly is not None:
+                geoms.append(layer.fill_poly)
+    if not geoms:
+        return 0, 0
+    return len(geoms), int(shapely.get_num_coordinates(geoms).sum())
+
+
+def _bytes(path):
+    return sum([os.path.getsize(os.path.join(path, fn)) for fn in os.listdir(path)])
+
+
+def run_stages(brd, stages, path):
+    """Runs the stages after placement on brd, writing any files to the
+    directory path. Yields (stage, seconds, extra result fields)."""
+    for stage in stages:
+        extra = {}
+        t = time.perf_counter()
+        try:
+            if stage == "pour":
+                brd.fill_layer("GTL", "GND")
+                brd.fill_layer("GBL", "GND")
+            elif stage == "preview":
+                for layer in brd.layers.values():
+                    if not layer.is_outline:
+                        layer.preview()
+            elif stage == "drc":
+                extra["violations"] = len(brd.check(verbose=False))
+            elif stage == "gerber":
+                brd.save_gerbers(os.path.join(path, "gerber"), in_subdir=False)
+            elif stage == "svg":
+                brd.save_svg(os.path.join(path, "svg"), in_subdir=False)
+            elif stage == "png":
+                brd.save_png(os.path.join(path, "png"), in_subdir=False)
+        except (ImportError, OSError) as e:
+            # PNG output needs cairosvg and the native cairo library
+            error = "%s: %s" % (type(e).__name__, str(e).splitlines()[0])
+            yield stage, None, {"error": error}
+            continue
+        seconds = time.perf_counter() - t
+        if stage in ("gerber", "svg", "png"):
+            extra["bytes"] = _bytes(path)
+            shutil.rmtree(path)
+            os.mkdir(path)
+        yield stage, seconds, extra
+
+
+def run(generators, tiers, stages, verbose=True):
+    """Returns a list of result dicts, one for each generator, tier and
+    stage"""
+    results = []
+    for name in generators:
+        func, sizes = GENERATORS[name]
+        for tier in tiers:
+            gc.collect()
+            with contextlib.redirect_stdout(io.StringIO()):
+                t = time.perf_counter()
+                brd = func(sizes[tier])
+                placed = time.perf_counter() - t
+            polygons, vertices = board_size(brd)
+            timed = [("place", placed, {})]
+            path = tempfile.mkdtemp(prefix="pcbflow-bench-")
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    later = [s for s in stages if s != "place"]
+                    timed.extend(list(run_stages(brd, later, path)))
+            finally:
+                shutil.rmtree(path, ignore_errors=True)
+            for stage, seconds, extra in timed:
+                r = {
+                    "generator": name,
+                    "tier": tier,
+                    "size": sizes[tier],
+                    "stage": stage,
+                    "seconds": seconds,
+                    "polygons": polygons,
+                    "vertices": vertices,
+                    "polygons_per_second": (polygons / seconds if seconds else None),
+                }
+                r.update(extra)
+                results.append(r)
+                if verbose:
+                    print(format_result(r))
+    return results
+
+
+def format_result(r):
+    if r["seconds"] is None:
+        return "%-6s %-7s %-8s %s" % (r["generator"], r["tier"], r["stage"], r["error"])
+    return "%-6s %-7s %-8s %9.3f s %10.0f polys/s" % (
+        r["generator"],
+        r["tier"],
+        r["stage"],
+        r["seconds"],
+        r["polygons_per_second"] or 0,
+    )
+
+
+def environment():
+    return {
+        "format": RESULTS_FORMAT,
+        "pcbflow": __version__,
+        "python": platform.python_version(),
+        "shapely": shapely.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def compare(results, baseline, threshold):
+    """Prints the ratio of each result to the same result of baseline and
+    returns the keys of those slower by more than threshold"""
+    base = {
+        (r["generator"], r["tier"], r["stage"]): r["seconds"]
+        for r in baseline["results"]
+    }
+    slower = []
+    print("\nCompared with %s (%s):" % (baseline["pcbflow"], baseline["timestamp"]))
+    for r in results:
+        key = (r["generator"], r["tier"], r["stage"])
+        old = base.get(key)
+        if old is None or r["seconds"] is None or not old:
+            continue
+        ratio = r["seconds"] / old
+        flag = ""
+        if ratio > threshold:
+            flag = "  SLOWER"
+            slower.append(key)
+        print("%-6s %-7s %-8s %6.2fx%s" % (*key, ratio, flag))
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pcbflow benchmarks")
+    parser.add_argument(
+        "--generator",
+        action="append",
+        choices=list(GENERATORS),
+        help="generator to run (all by default, may be repeated)",
+    )
+    parser.add_argument(
+        "--tier",
+        action="append",
+        choices=TIERS,
+        help="size tier to run (small by default, may be repeated)",
+    )
+    parser.add_argument(
+        "--stage",
+        action="append",
+        choices=STAGES,
+        help="stage to time (all by default, may be repeated)",
+    )
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="JSON results of an earlier run")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="slowdown ratio reported as a regression (default 1.25)",
+    )
+    args = parser.parse_args()
+    stages = args.stage or STAGES
+    if "place" not in stages:
+        stages = ["place"] + stages
+
+    results = run(args.generator or list(GENERATORS), args.tier or ["small"], stages)
+    doc = environment()
+    doc["results"] = results
+    if args.output:
+        with open(args.output, "wt") as f:
+            json.dump(doc, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
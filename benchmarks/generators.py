@@ -0,0 +1,130 @@
+#! /usr/bin/env python3
+#
+# Parametric board generators for the benchmarks
+#
+
+import io
+import math
+
+from PIL import Image, ImageDraw
+
+from pcbflow import *
+
+
+def discrete_grid(n):
+    """A grid of n two terminal SMD parts, each with a GND fanout via and
+    a trace from its other pad"""
+    side = math.ceil(math.sqrt(n))
+    pitch = 5.0
+    brd = Board((side * pitch + 10, side * pitch + 10))
+    kinds = (R0603, C0402, C0805, R0402)
+    for i in range(n):
+        x = 5 + pitch * (i % side) + pitch / 2
+        y = 5 + pitch * (i // side) + pitch / 2
+        part = brd.add_part((x, y), kinds[i % len(kinds)], side="top")
+        part.assign_pads("S%d" % (i), "GND")
+        part.fanout("GND")
+        part.pads[0].copy().forward(1).wire()
+    brd.add_outline()
+    return brd
+
+
+def bga_fanout(n):
+    """n FTG256 BGAs with a dogbone fanout to a via from every ball"""
+    side = math.ceil(math.sqrt(n))
+    pitch = 22.0
+    brd = Board((side * pitch + 6, side * pitch + 6))
+    brd.drc.via_drill = 0.2
+    brd.drc.via_annular_ring = 0.1
+    brd.drc.trace_width = 0.15
+    brd.drc.clearance = 0.1
+    for i in range(n):
+        x = 3 + pitch * (i % side) + pitch / 2
+        y = 3 + pitch * (i // side) + pitch / 2
+        part = brd.add_part((x, y), FTG256, side="top")
+        for k, pad in enumerate(part.pads):
+            net = "%s.%d" % (part.id, k)
+            pad.set_name(net)
+            dc = pad.copy().right(135).forward(math.sqrt(0.5))
+            dc.wire(width=brd.drc.trace_width).via(net)
+    brd.add_outline()
+    return brd
+
+
+def dense_bus(n, width=16):
+    """n signals in buses of width signals, each routed with two bends
+    and length tuned with meanders"""
+    buses = math.ceil(n / width)
+    c = Board().drc.channel()
+    spacing = 3 * c
+    span = width * spacing + 10
+    brd = Board((buses * span + 10, 60))
+    for b in range(buses):
+        count = min(width, n - b * width)
+        x0 = 5 + b * span + 5
+        # signals are ordered right to left, so a right turn pivots on tt[0]
+        tt = [
+            brd.DC((x0 + (count - 1 - i) * spacing, 5)).set_name("B%d.%d" % (b, i))
+            for i in range(count)
+        ]
+        # stagger the starts so that the signals need tuning
+        for i, t in enumerate(tt):
+            t.forward(0.2 * i)
+        bus = Route(brd, tt)
+        bus.forward(5).right(30).forward(5).left(30).forward(5)
+        bus.tune(tolerance=0.05)
+        bus.forward(2).wire()
+    brd.add_outline()
+    return brd
+
+
+def pour(n):
+    """A board with an n by n grid of vias on mixed nets, to be poured"""
+    pitch = 2.5
+    brd = Board((n * pitch + 10, n * pitch + 10))
+    for j in range(n):
+        for i in range(n):
+            net = "GND" if (i + j) % 2 else "N%d" % ((i * 7 + j) % 13)
+            brd.DC((5 + pitch * (i + 0.5), 5 + pitch * (j + 0.5))).via(net)
+    brd.add_outline()
+    return brd
+
+
+def _logo_image(px):
+    # a synthetic logo: rings crossed by diagonal bars
+    im = Image.new("L", (px, px), 0)
+    draw = ImageDraw.Draw(im)
+    c = px // 2
+    for k, r in enumerate(range(px // 2, 0, -max(2, px // 12))):
+        draw.ellipse((c - r, c - r, c + r, c + r), fill=255 if k % 2 == 0 else 0)
+    for k in range(0, 2 * px, max(4, px // 6)):
+        draw.line((k, 0, k - px, px), fill=0, width=max(1, px // 32))
+    f = io.BytesIO()
+    im.save(f, format="PNG")
+    f.seek(0)
+    return f
+
+
+def logos(n, px=128):
+    """n bitmap logos of px by px pixels on the top and bottom silkscreen"""
+    side = math.ceil(math.sqrt(n))
+    size = px * Board().drc.bitmap_res + 2
+    brd = Board((side * size + 10, side * size + 10))
+    for i in range(n):
+        x = 5 + size * (i % side) + size / 2
+        y = 5 + size * (i // side) + size / 2
+        brd.add_bitmap((x, y), _logo_image(px), side="top" if i % 2 else "bottom")
+    brd.add_outline()
+    return brd
+
+
+# name: (generator, size of each tier)
+GENERATORS = {
+    "grid": (discrete_grid, {"small": 64, "medium": 400, "large": 2500}),
+    "bga": (bga_fanout, {"small": 1, "medium": 4, "large": 16}),
+    "bus": (dense_bus, {"small": 32, "medium": 128, "large": 512}),
+    "pour": (pour, {"small": 10, "medium": 30, "large": 80}),
+    "logo": (logos, {"small": 4, "medium": 16, "large": 64}),
+}
+
+TIERS = ["small", "medium", "large"]
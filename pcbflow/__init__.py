@@ -35,18 +35,51 @@ from .util import (
     col_str,
     pad_bound,
     max_bounds,
+    arc_segments,
+    bitmap_boxes,
     infer_family,
     full_path,
+    board_by_id,
 )
-from .gerber import Gerber
+from . import perf
+from .gerber import Gerber, gerber_filename
 from .excellon import excellon
 from .hershey import text, ltext, ctext
-from .drc import DRC
+from .drc import (
+    DRC,
+    ClearanceViolation,
+    ClearanceError,
+    LiveDRC,
+    check_clearance,
+    net_name,
+)
+from .connectivity import Connectivity
+from .ratsnest import Airwire, Ratsnest
+from .autorouter import AutoRouter
 from .part import PCBPart, pretty_parts
 from .footprints import *
-from .eagle import EaglePart, list_lbr_packages, show_lbr_package
-from .kicad import KiCadPart, SkiPart
+from .eagle import EaglePart, list_lbr_packages, show_lbr_package, lbr_packages
+from .fpcache import FootprintCache, FootprintIndex, footprint_cache
+from .kicad import KiCadPart, SkiPart, KiCadFootprint
+from .library import FootprintInfo, FootprintLibrary, load_library
 from .layer import Layer, OutlineLayer, DEFAULT_LAYERS, DEFAULT_LAYER_ORDER
-from .draw import Turtle, Draw
+from .draw import Turtle, Draw, path_length
+from .route import Route, extend, extend2
+from .snapshot import dump_board, load_board
+from .buildcache import BuildCache
+from .pipeline import SavePipeline, SaveTask
 from .board import Board
+from .panel import Panel
 from .svgout import svg_write
+from .equivalence import (
+    EquivalenceReport,
+    LayerDifference,
+    board_shapes,
+    changed_region,
+    compare_boards,
+    compare_layers,
+    compare_reference,
+    load_reference,
+    raster_xor,
+    save_reference,
+)
@@ -0,0 +1,694 @@
+#! /usr/bin/env python3
+#
+# Grid based autorouter
+#
+
+import heapq
+import math
+import os
+import time
+from collections import defaultdict
+
+import numpy as np
+import shapely
+import shapely.geometry as sg
+import shapely.ops as so
+
+from .drc import _islands
+from .ratsnest import Ratsnest
+
+# passes with fewer connections than this are routed serially without
+# waves since starting worker processes would take longer
+PARALLEL_MIN_CONNECTIONS = 32
+
+SQRT2 = math.sqrt(2)
+# (dx, dy, cost) of the in-layer moves
+MOVES = [
+    (1, 0, 1.0),
+    (-1, 0, 1.0),
+    (0, 1, 1.0),
+    (0, -1, 1.0),
+    (1, 1, SQRT2),
+    (1, -1, SQRT2),
+    (-1, 1, SQRT2),
+    (-1, -1, SQRT2),
+]
+
+
+def _paint(owner, cells, net):
+    # cells near copper of one net only keep that net, otherwise they are
+    # blocked for every net (-1)
+    cur = owner[cells]
+    owner[cells] = np.where((cur == 0) | (cur == net), net, -1)
+
+
+class _Occupancy:
+    """Counts of the routed copper halos covering each cell. The sum and sum
+    of squares of the net numbers are kept as well: all of the halos over a
+    cell belong to one net exactly when sum == count * net and
+    sq == count * net ** 2."""
+
+    def __init__(self, size):
+        self.count = np.zeros(size, dtype=np.int64)
+        self.sum = np.zeros(size, dtype=np.int64)
+        self.sq = np.zeros(size, dtype=np.int64)
+
+    def add(self, cells, net):
+        np.add.at(self.count, cells, 1)
+        np.add.at(self.sum, cells, net)
+        np.add.at(self.sq, cells, net * net)
+
+    def free_for(self, net):
+        c = self.count
+        return (c == 0) | ((self.sum == c * net) & (self.sq == c * net * net))
+
+
+class RoutedConnection:
+    """A connection found by the AutoRouter. points is a list of
+    (layer, x, y) tuples from pad to pad; consecutive points on different
+    layers are joined by a via."""
+
+    def __init__(self, airwire, net, points):
+        self.airwire = airwire
+        self.net = net
+        self.points = points
+        self.track_cells = None
+        self.via_cells = None
+
+    def vias(self):
+        return [
+            (x, y)
+            for (l0, _, _), (l1, x, y) in zip(self.points, self.points[1:])
+            if l0 != l1
+        ]
+
+    def segments(self):
+        """Returns a list of (layer, [(x, y), ...]) polylines"""
+        segs = []
+        for l, x, y in self.points:
+            if segs and segs[-1][0] == l:
+                segs[-1][1].append((x, y))
+            else:
+                segs.append((l, [(x, y)]))
+        return [s for s in segs if len(s[1]) > 1]
+
+
+class RoutingGrid:
+    """The occupancy grids of an AutoRouter: for each routing layer the net
+    (if any) each cell is reserved for by existing copper and keepouts, and
+    the halos of the connections routed so far. A grid holds no reference
+    to the board so it can be sent to worker processes."""
+
+    def __init__(self, size, layers, pitch, drc, via_cost, max_expansions):
+        self.layers = layers
+        self.pitch = pitch
+        self.nx = max(1, int(math.ceil(size[0] / pitch)))
+        self.ny = max(1, int(math.ceil(size[1] / pitch)))
+        self.ncells = self.nx * self.ny
+        self.width = drc.trace_width
+        self.via_radius = drc.via_drill / 2 + drc.via_annular_ring
+        # a track between adjacent cell centres passes up to half a cell
+        # diagonal closer to an obstacle than its end points
+        self.margin = pitch * SQRT2 / 2
+        self.track_r = drc.clearance + self.width / 2 + self.margin
+        self.via_r = drc.clearance + self.via_radius + self.margin
+        self.via_cost = via_cost
+        self.rip_cost = 50
+        # extra cost of the cells failed connections were blocked from,
+        # so that retries leave room for them
+        self.history = defaultdict(int)
+        self.history_cost = 5
+        self.max_expansions = max_expansions
+        n = len(layers) * self.ncells
+        self.fixed = np.zeros(n, dtype=np.int32)
+        self.core = np.zeros(n, dtype=np.int32)
+        self.fixed_via = np.zeros(self.ncells, dtype=np.int32)
+        self.clear()
+
+    def clear(self):
+        """Removes all routed connections"""
+        self.tracks = _Occupancy(len(self.layers) * self.ncells)
+        self.via_occ = _Occupancy(self.ncells)
+
+    def cells(self, g):
+        # flat indices of the cells whose centres lie inside g
+        if g.is_empty:
+            return np.zeros(0, dtype=np.int64)
+        p = self.pitch
+        x0, y0, x1, y1 = g.bounds
+        ix0, iy0 = max(0, int(x0 / p - 0.5)), max(0, int(y0 / p - 0.5))
+        ix1 = min(self.nx - 1, int(math.ceil(x1 / p - 0.5)))
+        iy1 = min(self.ny - 1, int(math.ceil(y1 / p - 0.5)))
+        if ix1 < ix0 or iy1 < iy0:
+            return np.zeros(0, dtype=np.int64)
+        iy, ix = np.mgrid[iy0 : iy1 + 1, ix0 : ix1 + 1]
+        shapely.prepare(g)
+        inside = shapely.contains_xy(g, (ix + 0.5) * p, (iy + 0.5) * p)
+        return (iy[inside] * self.nx + ix[inside]).astype(np.int64)
+
+    def cell(self, xy):
+        ix = min(self.nx - 1, max(0, int(xy[0] / self.pitch)))
+        iy = min(self.ny - 1, max(0, int(xy[1] / self.pitch)))
+        return iy * self.nx + ix
+
+    def window_mask(self, window):
+        ix0, iy0, ix1, iy1 = window
+        inside = np.zeros((self.ny, self.nx), dtype=bool)
+        inside[iy0 : iy1 + 1, ix0 : ix1 + 1] = True
+        return inside.reshape(-1)
+
+    def search(self, net, sources, targets, soft=False, window=None):
+        """Returns the cheapest list of grid states from one of sources to
+        one of targets for net, or None. With soft, cells only blocked by
+        routed copper of other nets may be crossed at a cost. window is an
+        (ix0, iy0, ix1, iy1) cell range which limits the search."""
+        if not sources or not targets:
+            return None
+        n = self.ncells
+        nx = self.nx
+        nl = len(self.layers)
+        track_ok = (self.fixed == 0) | (self.fixed == net) | (self.core == net)
+        via_ok = (self.fixed_via == 0) | (self.fixed_via == net)
+        track_free = self.tracks.free_for(net) | (self.core == net)
+        via_free = self.via_occ.free_for(net)
+        if soft:
+            penalty = (track_ok & ~track_free).astype(np.uint8).tobytes()
+            via_penalty = (via_ok & ~via_free).astype(np.uint8).tobytes()
+        else:
+            track_ok &= track_free
+            via_ok &= via_free
+        if window is not None:
+            inside = self.window_mask(window)
+            track_ok &= np.tile(inside, nl)
+            via_ok &= inside
+        # the border cells are always blocked, so moves never leave the grid
+        track_ok = track_ok.astype(np.uint8).tobytes()
+        via_ok = via_ok.astype(np.uint8).tobytes()
+        targets = set(targets)
+        ty, tx = divmod(next(iter(targets)) % n, nx)
+        moves = [(dy * nx + dx, dx, dy, cost) for dx, dy, cost in MOVES]
+        layer_starts = [k * n for k in range(nl)] if nl > 1 else []
+        via_cost = self.via_cost
+        rip_cost = self.rip_cost
+        history = self.history
+        history_cost = self.history_cost
+        diag = SQRT2 - 1
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        g = [math.inf] * (nl * n)
+        parent = {}
+        heap = []
+        for s in sources:
+            if track_ok[s]:
+                iy, ix = divmod(s % n, nx)
+                dx, dy = abs(ix - tx), abs(iy - ty)
+                h = max(dx, dy) + diag * min(dx, dy)
+                g[s] = 0.0
+                parent[s] = None
+                heappush(heap, (h, h, 0.0, s))
+        expansions = 0
+        while heap:
+            _, hs, gs, s = heappop(heap)
+            if gs > g[s]:
+                continue
+            if s in targets:
+                path = []
+                while s is not None:
+                    path.append(s)
+                    s = parent[s]
+                return path[::-1]
+            expansions += 1
+            if expansions > self.max_expansions:
+                break
+            c = s % n
+            iy, ix = divmod(c, nx)
+            for d, mx, my, cost in moves:
+                t = s + d
+                if not track_ok[t]:
+                    continue
+                if soft and penalty[t]:
+                    cost += rip_cost
+                if history and t in history:
+                    cost += history_cost * history[t]
+                gt = gs + cost
+                if gt < g[t]:
+                    g[t] = gt
+                    parent[t] = s
+                    dx, dy = abs(ix + mx - tx), abs(iy + my - ty)
+                    if dx < dy:
+                        h = dy + diag * dx
+                    else:
+                        h = dx + diag * dy
+                    heappush(heap, (gt + h, h, gt, t))
+            if layer_starts and via_ok[c]:
+                for base in layer_starts:
+                    t = base + c
+                    if t == s or not track_ok[t]:
+                        continue
+                    cost = via_cost
+                    if soft and (penalty[t] or via_penalty[c]):
+                        cost += rip_cost
+                    if history and t in history:
+                        cost += history_cost * history[t]
+                    gt = gs + cost
+                    if gt < g[t]:
+                        g[t] = gt
+                        parent[t] = s
+                        heappush(heap, (gt + hs, hs, gt, t))
+        return None
+
+    def points(self, path, xy_a, xy_b):
+        # corner points of a path of grid states, ends moved to pad centres
+        n, nx, p = self.ncells, self.nx, self.pitch
+        pts = []
+        for s in path:
+            l, c = divmod(s, n)
+            iy, ix = divmod(c, nx)
+            pts.append((l, ix, iy))
+        keep = [pts[0]]
+        for a, b, c in zip(pts, pts[1:], pts[2:]):
+            if a[0] == b[0] == c[0] and (b[1] - a[1], b[2] - a[2]) == (
+                c[1] - b[1],
+                c[2] - b[2],
+            ):
+                continue
+            keep.append(b)
+        if len(pts) > 1:
+            keep.append(pts[-1])
+        points = [
+            (self.layers[l], (ix + 0.5) * p, (iy + 0.5) * p) for l, ix, iy in keep
+        ]
+        points.insert(0, (points[0][0], *xy_a))
+        points.append((points[-1][0], *xy_b))
+        return points
+
+    def _copper(self, route):
+        # copper of a route on each routing layer and its vias
+        tracks = defaultdict(list)
+        for layer, xys in route.segments():
+            tracks[layer].append(sg.LineString(xys).buffer(self.width / 2))
+        vias = [sg.Point(xy).buffer(self.via_radius) for xy in route.vias()]
+        return tracks, vias
+
+    def halo(self, route):
+        # cells reserved by the copper of a routed connection
+        if route.track_cells is None:
+            tracks, vias = self._copper(route)
+            cells = []
+            for k, layer in enumerate(self.layers):
+                g = so.unary_union(tracks[layer] + vias)
+                cells.append(self.cells(g.buffer(self.track_r)) + k * self.ncells)
+            route.track_cells = np.concatenate(cells)
+            g = so.unary_union([g for v in tracks.values() for g in v] + vias)
+            route.via_cells = self.cells(g.buffer(self.via_r))
+        return route.track_cells, route.via_cells
+
+    def occupy(self, route, net):
+        track_cells, via_cells = self.halo(route)
+        self.tracks.add(track_cells, net)
+        self.via_occ.add(via_cells, net)
+
+    def conflicts(self, route, net):
+        """Returns True if route comes too close to routed copper of
+        another net"""
+        track_cells, via_cells = self.halo(route)
+        free = self.tracks.free_for(net)[track_cells] | (self.core[track_cells] == net)
+        return not free.all() or not self.via_occ.free_for(net)[via_cells].all()
+
+
+def _search_jobs(grid, jobs):
+    # the connections of a wave do not interact, so each is searched for
+    # against the same grid
+    return [
+        (k, grid.search(net, sources, targets, window=window))
+        for k, net, sources, targets, window in jobs
+    ]
+
+
+# the routing grid snapshot of a worker process
+_worker_grid = None
+
+
+def _init_worker(grid):
+    global _worker_grid
+    _worker_grid = grid
+
+
+def _route_group(jobs):
+    return _search_jobs(_worker_grid, jobs)
+
+
+class AutoRouter:
+    """Maze router for the unrouted connections (airwires) of a board.
+
+    The routing layers are rasterized into NumPy occupancy grids with a
+    cell pitch of half the DRC channel (trace width + clearance). A cell is
+    blocked for a net when a track centred on it would come closer than the
+    clearance to copper of another net, a keepout or the board edge. Each
+    airwire is then routed with an A* search over the grid in which a layer
+    change costs via_cost cells, and the routes are added to the board with
+    Draw.wire() and Draw.via().
+
+    If some connections cannot be routed, all routes are ripped up and the
+    connections are routed again with the failed ones first, while the
+    cells the failed connections were blocked from become dearer for the
+    others. rip_up limits the number of these retries; the pass with the
+    fewest failures is kept.
+
+    Passes of at least PARALLEL_MIN_CONNECTIONS connections first split the
+    connections into waves in which the search windows of the connections
+    (the bounds of their two pads plus window mm) are far enough apart that
+    their routes cannot interact. With more than one process, the
+    connections of a wave are searched for by a pool of worker processes
+    sharing a read-only snapshot of the grid, otherwise they are searched
+    for in-process, and the routes are merged in order before the next
+    wave. Connections which do not fit inside their window or conflict
+    with an earlier route are then retried serially on the whole board.
+    The result does not depend on the number of processes.
+
+    :param board: Board to route
+    :param nets: list of net names to route (all nets by default)
+    :param layers: routing layer names (all copper layers by default)
+    :param pitch: grid pitch (drc.channel() / 2 by default)
+    :param via_cost: cost of a via in grid cells
+    :param order: connection order: "short" or "long" first, "ratsnest"
+    order or a key function of an Airwire
+    :param rip_up: number of rip-up and retry passes
+    :param max_expansions: search limit for each connection
+    :param pad_nets: also group pads by their name if it is a net name
+    :param processes: number of worker processes (os.cpu_count() by
+    default, 1 routes every wave in-process)
+    :param window: margin in mm of the search window of each connection
+    when routing in waves
+    """
+
+    def __init__(
+        self,
+        board,
+        nets=None,
+        layers=None,
+        pitch=None,
+        via_cost=20,
+        order="short",
+        rip_up=2,
+        max_expansions=500000,
+        pad_nets=True,
+        processes=None,
+        window=5.0,
+    ):
+        self.board = board
+        self.layers = layers or board.get_copper_layers(as_names=True)
+        if pitch is None:
+            pitch = board.drc.channel() / 2
+        self.order = order
+        self.rip_up = rip_up
+        self.processes = processes if processes is not None else os.cpu_count() or 1
+        self.window = window
+        self.width = board.drc.trace_width
+        self.ratsnest = Ratsnest(board, pad_nets=pad_nets)
+        self.conn = self.ratsnest.connectivity
+        self.airwires = [
+            w
+            for w in self.ratsnest.airwires
+            if (nets is None or w.net in nets) and w.length > 0
+        ]
+        self.net_ids = {net: k + 1 for k, net in enumerate(sorted(self.conn.nets))}
+        self.routes = []
+        self.failed = []
+        self.ripped = 0
+        self.parallel = 0
+        self.seconds = 0.0
+        self.grid = RoutingGrid(
+            board.size, self.layers, pitch, board.drc, via_cost, max_expansions
+        )
+        self._rasterize()
+
+    def _conductor_nets(self):
+        # net number of each conductor: from its pads, else its copper names
+        conn = self.conn
+        nets = defaultdict(set)
+        names = defaultdict(set)
+        for t, c in conn.pads:
+            if c is not None and t in conn.pad_net:
+                nets[c].add(conn.pad_net[t])
+        for c, name in zip(conn.feature_component.tolist(), conn.feature_net):
+            if name is not None:
+                names[c].add(name)
+        for c in names:
+            if c not in nets:
+                nets[c] = names[c]
+        ids = {}
+        for c, names in nets.items():
+            ok = len(names) == 1 and next(iter(names)) in self.net_ids
+            ids[c] = self.net_ids[next(iter(names))] if ok else -1
+        return ids
+
+    def _rasterize(self):
+        grid = self.grid
+        conn = self.conn
+        n = grid.ncells
+        comp_net = self._conductor_nets()
+        li = {l: k for k, l in enumerate(self.layers)}
+        for g, layer, c in zip(
+            conn.geoms, conn.feature_layer, conn.feature_component.tolist()
+        ):
+            net = comp_net.get(c, -1)
+            _paint(grid.fixed_via, grid.cells(g.buffer(grid.via_r)), net)
+            if layer not in li:
+                continue
+            off = li[layer] * n
+            _paint(grid.fixed, grid.cells(g.buffer(grid.track_r)) + off, net)
+            if net > 0:
+                # tracks entirely inside copper of their own net
+                grid.core[grid.cells(g.buffer(-self.width / 2)) + off] = net
+        keepouts = list(self.board.keepouts)
+        # the board edge
+        x1, y1 = self.board.size
+        edge = sg.box(-1, -1, x1 + 1, y1 + 1).difference(sg.box(0, 0, x1, y1))
+        keepouts.append(edge.buffer(self.board.drc.outline_clearance))
+        for g in keepouts:
+            grid.fixed_via[grid.cells(g.buffer(grid.via_radius + grid.margin))] = -1
+            cells = grid.cells(g.buffer(self.width / 2 + grid.margin))
+            for k in range(len(self.layers)):
+                grid.fixed[cells + k * n] = -1
+        border = np.ones((grid.ny, grid.nx), dtype=bool)
+        border[1:-1, 1:-1] = False
+        border = np.nonzero(border.reshape(-1))[0]
+        grid.fixed_via[border] = -1
+        for k, layer in enumerate(self.layers):
+            grid.fixed[border + k * n] = -1
+            for g in self.board.layers[layer].keepouts:
+                cells = grid.cells(g.buffer(self.width / 2 + grid.margin))
+                grid.fixed[cells + k * n] = -1
+
+    def _pad_states(self, xy):
+        # grid states at a pad centre on each routing layer with copper there
+        c = self.grid.cell(xy)
+        pt = sg.Point(xy)
+        states = []
+        for k, layer in enumerate(self.layers):
+            tree = self.conn.trees.get(layer, None)
+            if tree is not None and len(tree.query(pt, predicate="intersects")):
+                states.append(k * self.grid.ncells + c)
+        return states
+
+    def _ordered(self):
+        if callable(self.order):
+            return sorted(self.airwires, key=self.order)
+        if self.order == "short":
+            return sorted(self.airwires, key=lambda w: w.length)
+        if self.order == "long":
+            return sorted(self.airwires, key=lambda w: -w.length)
+        return list(self.airwires)
+
+    def _window(self, w, margin):
+        # (x0, y0, x1, y1) bounds of the pads of airwire w plus margin
+        (xa, ya), (xb, yb) = w.xy_a, w.xy_b
+        return (
+            min(xa, xb) - margin,
+            min(ya, yb) - margin,
+            max(xa, xb) + margin,
+            max(ya, yb) + margin,
+        )
+
+    def waves(self, order):
+        """Splits the connections in order into waves of connections whose
+        search windows do not overlap, so that the connections of a wave
+        can be routed independently. Each connection goes in the first wave
+        after those of the earlier connections it overlaps.
+
+        :returns: :obj:`list` of lists of indices into order
+        """
+        if not order:
+            return []
+        # copper in one window must keep its clearance from another's
+        reach = self.grid.via_r / 2
+        boxes = np.array([self._window(w, self.window + reach) for w in order])
+        geoms = shapely.box(*boxes.T)
+        i, j = shapely.STRtree(geoms).query(geoms, predicate="intersects")
+        earlier = defaultdict(list)
+        for a, b in zip(i.tolist(), j.tolist()):
+            if b < a:
+                earlier[a].append(b)
+        wave_of = []
+        waves = []
+        for k in range(len(order)):
+            used = {wave_of[e] for e in earlier[k]}
+            wv = 0
+            while wv in used:
+                wv += 1
+            wave_of.append(wv)
+            if wv == len(waves):
+                waves.append([])
+            waves[wv].append(k)
+        return waves
+
+    def _jobs(self, order, wave):
+        grid = self.grid
+        p = grid.pitch
+        jobs = []
+        for k in wave:
+            w = order[k]
+            x0, y0, x1, y1 = self._window(w, self.window)
+            window = (
+                max(0, int(x0 / p)),
+                max(0, int(y0 / p)),
+                min(grid.nx - 1, int(x1 / p)),
+                min(grid.ny - 1, int(y1 / p)),
+            )
+            sources = self._pad_states(w.xy_a)
+            targets = self._pad_states(w.xy_b)
+            jobs.append((k, self.net_ids[w.net], sources, targets, window))
+        return jobs
+
+    def _route_waves(self, order, routes):
+        # routes the waves, in worker processes if there are several, and
+        # returns the connections which still have to be routed serially
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        grid = self.grid
+        # forked workers share the grid of the parent as it is at the start
+        # of each wave without copying it
+        context = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        retry = []
+        for wave in self.waves(order):
+            jobs = self._jobs(order, wave)
+            workers = min(self.processes, len(jobs))
+            if workers > 1:
+                chunks = [jobs[i::workers] for i in range(workers)]
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(grid,),
+                ) as ex:
+                    found = [r for rs in ex.map(_route_group, chunks) for r in rs]
+                found.sort()
+            else:
+                found = _search_jobs(grid, jobs)
+            for k, path in found:
+                w = order[k]
+                net = self.net_ids[w.net]
+                if path is not None:
+                    route = RoutedConnection(
+                        w, w.net, grid.points(path, w.xy_a, w.xy_b)
+                    )
+                    if not grid.conflicts(route, net):
+                        grid.occupy(route, net)
+                        routes.append(route)
+                        self.parallel += 1
+                        continue
+                retry.append(k)
+        return [order[k] for k in sorted(retry)]
+
+    def _route_pass(self, order, contest):
+        grid = self.grid
+        grid.clear()
+        routes = []
+        failed = []
+        if len(order) >= PARALLEL_MIN_CONNECTIONS:
+            order = self._route_waves(order, routes)
+        for w in order:
+            net = self.net_ids[w.net]
+            sources = self._pad_states(w.xy_a)
+            targets = self._pad_states(w.xy_b)
+            path = grid.search(net, sources, targets)
+            if path is None:
+                failed.append(w)
+                if contest:
+                    # make the cells it was blocked from dearer for the others
+                    path = grid.search(net, sources, targets, soft=True)
+                    for s in path or []:
+                        grid.history[s] += 1
+                continue
+            route = RoutedConnection(w, w.net, grid.points(path, w.xy_a, w.xy_b))
+            grid.occupy(route, net)
+            routes.append(route)
+        return routes, failed
+
+    def route(self, verbose=False):
+        """Routes every connection and adds the copper to the board.
+
+        :param verbose: print a summary when finished
+        :returns: :obj:`list` of RoutedConnection
+        """
+        t0 = time.perf_counter()
+        order = self._ordered()
+        best = None
+        for attempt in range(self.rip_up + 1):
+            retry = attempt < self.rip_up
+            self.parallel = 0
+            routes, failed = self._route_pass(order, retry)
+            if best is None or len(failed) < len(best[1]):
+                best = (routes, failed, self.parallel)
+            if not failed or not retry:
+                break
+            self.ripped += len(routes)
+            first = set(failed)
+            order = failed + [w for w in order if w not in first]
+        self.routes, self.failed, self.parallel = best
+        for route in self.routes:
+            self._emit(route)
+        self.seconds = time.perf_counter() - t0
+        if verbose:
+            print(self.report())
+        return self.routes
+
+    def _emit(self, route):
+        layer, x, y = route.points[0]
+        dc = self.board.DC((x, y))
+        dc.layer = layer
+        dc.width = self.width
+        dc.name = route.net
+        for layer, x, y in route.points[1:]:
+            if layer != dc.layer:
+                dc.wire()
+                dc.via(route.net)
+                dc.layer = layer
+            else:
+                dc.xy = (x, y)
+                dc.path.append(dc.xy)
+        dc.wire()
+
+    def connections_per_second(self):
+        return len(self.routes) / self.seconds if self.seconds > 0 else 0.0
+
+    def report(self):
+        """Returns a text summary of the routing run"""
+        s = (
+            "routed %d/%d connections (%d failed, %d ripped up) in %.2fs, %.1f connections/s"
+            % (
+                len(self.routes),
+                len(self.airwires),
+                len(self.failed),
+                self.ripped,
+                self.seconds,
+                self.connections_per_second(),
+            )
+        )
+        if self.parallel:
+            s += ", %d in independent waves" % (self.parallel)
+        return s
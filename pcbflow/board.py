@@ -9,30 +9,51 @@ import os
 import re
 import math
 import csv
+import uuid
 
-from PIL import Image
+import numpy as np
+import shapely
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 import math
 
 from pcbflow import *
+from .util import register_board, begin_board_load, end_board_load, restore_state
+from . import perf
 
 
 class Board:
-    def __init__(self, size=(80, 50)):
+    def __init__(self, size=(80, 50), quality="fab"):
         self.size = size
         self.drc = DRC()
+        self.drc.set_quality(quality)
         self.parts = defaultdict(list)
         self.holes = defaultdict(list)
         self.npth = defaultdict(list)
         self.keepouts = []
         self.layers = {}
 
-        self.counters = defaultdict(lambda: 0)
+        self.counters = defaultdict(int)
         self.nets = []
+        self.live_drc = None
+        self.uid = uuid.uuid4().hex
+        register_board(self)
         self.config_default_layers()
 
+    def __reduce__(self):
+        # the board is registered before its layers and parts are restored
+        # so that they can be rebound to it
+        state = dict(self.__dict__)
+        state["live_drc"] = None
+        del state["uid"]
+        return (_restore_board, (type(self), self.uid), state)
+
+    def __setstate__(self, state):
+        restore_state(self, state)
+        end_board_load(self._loaded_uid)
+        del self._loaded_uid
+
     def DC(self, xy, d=0):
         """Returns a drawing context from the current board.
 
@@ -80,7 +101,7 @@ class Board:
         """Resets all PCB layers and configures them to a default configuration."""
         self.layers = {}
         for k, v in DEFAULT_LAYERS.items():
-            self.layers[k] = Layer(board=self, drc=self.drc, **v)
+            self.layers[k] = Layer(board=self, drc=self.drc, name=k, **v)
         self.layers["GML"] = OutlineLayer(desc="Mechanical", function="Profile,NP")
         self.reorder_layer_stack()
 
@@ -133,7 +154,9 @@ class Board:
             cu_layers = self.get_copper_layers()
             n_inner = len(cu_layers)
             new_layer = "GP%d" % (n_inner)
-            self.layers[new_layer] = Layer(board=self, is_copper=True, is_inner=True)
+            self.layers[new_layer] = Layer(
+                board=self, drc=self.drc, name=new_layer, is_copper=True, is_inner=True
+            )
             self.reorder_layer_stack()
 
     def get_smd_pad_layers(self, side="top", as_names=False, ignore_paste=False):
@@ -229,6 +252,7 @@ class Board:
         """
         return self._get_layer("is_mask", side, as_name)
 
+    @perf.timed("Board.fill_layer")
     def fill_layer(self, layer, netname):
         """Fills a layer with copper poured region assigned to a net name.
 
@@ -240,11 +264,16 @@ class Board:
             return
         lyr = self.layers[layer]
         ko = so.unary_union([*lyr.keepouts, *self.keepouts])
-        g = self.body().buffer(-self.drc.clearance).difference(ko)
+        q = self.drc.clearance_segs(self.drc.clearance)
+        pour = dict(quad_segs=q, join_style=self.drc.pour_join)
+        g = self.body().buffer(-self.drc.clearance, **pour).difference(ko)
         ap = [p for (name, p) in lyr.polys if name != netname]
         np = [p for (name, p) in lyr.named_polys if name != netname]
         exclusions = so.unary_union([*ap, *np])
-        lyr.fill_poly = g.difference(exclusions.buffer(self.drc.clearance))
+        lyr.fill_poly = g.difference(exclusions.buffer(self.drc.clearance, **pour))
+        perf.count("unions", 2)
+        lyr.fill_net = netname
+        lyr.preview_poly = None
 
     def add_to_mask_layers(self, obj):
         """Adds a polygon object to both the solder mask layers.
@@ -326,16 +355,18 @@ class Board:
 
     def add_hole(self, xy, diameter):
         self.npth[diameter].append(xy)
-        self.keepouts.append(
-            sg.Point(xy).buffer(diameter / 2 + self.drc.hole_clearance)
-        )
-        gm = sg.Point(xy).buffer(diameter / 2 + self.drc.hole_mask)
+        r = diameter / 2 + self.drc.hole_clearance
+        self.keepouts.append(sg.Point(xy).buffer(r, quad_segs=self.drc.quad_segs(r)))
+        r = diameter / 2 + self.drc.hole_mask
+        gm = sg.Point(xy).buffer(r, quad_segs=self.drc.quad_segs(r))
         if self.drc.mask_holes:
             self.layers["GTS"].add(gm)
             self.layers["GBS"].add(gm)
 
     def add_drill(self, xy, diameter):
         self.holes[diameter].append(xy)
+        if self.live_drc is not None:
+            self.live_drc.add_drill(xy, diameter)
 
     def add_keepout(self, top_left, bottom_right, layer):
         coords = [
@@ -349,7 +380,9 @@ class Board:
 
     def add_keepout_to_obj(self, obj, layer=None):
         bb = obj.bounds
-        g = sg.box(bb[0], bb[1], bb[2], bb[3]).buffer(self.drc.clearance)
+        g = sg.box(bb[0], bb[1], bb[2], bb[3]).buffer(
+            self.drc.clearance, quad_segs=self.drc.quad_segs(self.drc.clearance)
+        )
         if layer is not None:
             self.layers[layer].keepouts.append(g)
         else:
@@ -357,12 +390,16 @@ class Board:
 
     def add_mask_to_obj(self, obj, side="top"):
         bb = obj.bounds
-        g = sg.box(bb[0], bb[1], bb[2], bb[3]).buffer(self.drc.soldermask_margin)
+        r = self.drc.soldermask_margin
+        g = sg.box(bb[0], bb[1], bb[2], bb[3]).buffer(
+            r, quad_segs=self.drc.quad_segs(r)
+        )
         if side == "top":
             self.layers["GTS"].add(g)
         else:
             self.layers["GBS"].add(g)
 
+    @perf.timed("Board.add_text")
     def add_text(
         self,
         xy,
@@ -376,13 +413,26 @@ class Board:
         justify="centre",
     ):
         (x, y) = xy
+        q = self.drc.quad_segs(scale * self.drc.text_silk_width / 2)
         if justify == "left":
             gt = hershey.ltext(
-                0, 0, text, scale=scale, side=side, linewidth=self.drc.text_silk_width
+                0,
+                0,
+                text,
+                scale=scale,
+                side=side,
+                linewidth=self.drc.text_silk_width,
+                quad_segs=q,
             )
         else:
             gt = hershey.text(
-                0, 0, text, scale=scale, side=side, linewidth=self.drc.text_silk_width
+                0,
+                0,
+                text,
+                scale=scale,
+                side=side,
+                linewidth=self.drc.text_silk_width,
+                quad_segs=q,
             )
         gt = sa.rotate(gt, angle)
         gt = sa.translate(gt, x, y)
@@ -393,6 +443,7 @@ class Board:
         if soldermask_box:
             self.add_mask_to_obj(gt, side)
 
+    @perf.timed("Board.add_bitmap")
     def add_bitmap(
         self,
         xy,
@@ -403,6 +454,8 @@ class Board:
         keepout_box=False,
         soldermask_box=False,
     ):
+        from PIL import Image
+
         (x, y) = xy
         im = Image.open(fn)
         im = im.convert("L")
@@ -412,31 +465,15 @@ class Board:
             w = int(im.size[0] * scale)
             h = int(im.size[1] * scale)
             im = im.resize((w, h), Image.BICUBIC)
-        im = im.point(lambda p: p > 127 and 255)
-        (w, h) = im.size
-        ar = im.load()
-        g = []
+        # pixel rows are flipped so that row 0 is at the bottom of the board
+        bits = np.asarray(im)[::-1] > 127
+        (h, w) = bits.shape
         s = self.drc.bitmap_res
-        ov = 1
-        for yh in range(h):
-            (y0, y1) = (yh * s, (yh + ov) * s)
-            slice = im.crop((0, (h - 1 - yh), w, (h - 1 - yh) + 1)).tobytes()
-            xb = 0
-            while 255 in slice:
-                assert len(slice) == (w - xb)
-                if slice[0] == 0:
-                    l = slice.index(255)
-                else:
-                    if 0 in slice:
-                        l = slice.index(0)
-                    else:
-                        l = len(slice)
-                    g.append(sg.box(xb * s, y0, (xb + l * ov) * s, y1))
-                slice = slice[l:]
-                xb += l
-        g = sa.translate(so.unary_union(g), x - 0.5 * w * s, y - 0.5 * h * s).buffer(
-            0.001
-        )
+        x0, y0, x1, y1 = bitmap_boxes(bits)
+        boxes = shapely.box(x0 * s, y0 * s, x1 * s, y1 * s)
+        g = sa.translate(
+            so.unary_union(boxes), x - 0.5 * w * s, y - 0.5 * h * s
+        ).buffer(0.001, quad_segs=self.drc.quad_segs(0.001))
         lyr = layer if layer is not None else self.get_silk_layer(side, as_name=True)
         self.layers[lyr].add(g)
         if keepout_box:
@@ -479,82 +516,110 @@ class Board:
         centroids=True,
         povray=False,
         subdir=None,
+        svg=False,
+        workers=None,
+        progress=None,
+        cache=None,
+        png=False,
     ):
-        assetpath = self._get_asset_path(basename, in_subdir, subdir=subdir)
+        """Writes the output files of the board. Independent outputs are
+        written concurrently (see :obj:`SavePipeline`).
 
-        if gerber:
-            self.save_gerbers(basename, in_subdir, subdir=subdir)
-
-        if pdf:
-            self.save_pdf(basename, in_subdir, subdir=subdir)
-
-        if povray:
-            substrate = self.substrate()
-            mask = substrate.preview()
-            with open(assetpath + ".sub.pov", "wt") as f:
-                substrate.povray(f, "prism { linear_sweep linear_spline 0 1")
-            with open(assetpath + ".gto.pov", "wt") as f:
-                self.layers["GTO"].povray(f, mask=mask)
-            with open(assetpath + ".gtl.pov", "wt") as f:
-                self.layers["GTL"].povray(f, mask=mask)
-            with open(assetpath + ".gts.pov", "wt") as f:
-                self.layers["GTS"].povray(f, mask=mask, invert=True)
-        if bom:
-            self.save_bom(basename, in_subdir, subdir=subdir)
-        if centroids:
-            self.save_centroids(basename, in_subdir, subdir=subdir)
+        :param workers: number of threads (os.cpu_count() if None)
+        :param progress: function called as progress(task, done, total)
+        after each output or intermediate task completes
+        :param cache: :obj:`BuildCache` of previously written outputs
+        :param png: write PNG previews
 
-    def save_gerbers(self, basename, in_subdir=True, subdir=None):
+        :returns: :obj:`SavePipeline` with the time taken by each task
+        """
         assetpath = self._get_asset_path(basename, in_subdir, subdir=subdir)
-
+        pipeline = SavePipeline(
+            self,
+            assetpath,
+            gerber=gerber,
+            pdf=pdf,
+            svg=svg,
+            bom=bom,
+            centroids=centroids,
+            povray=povray,
+            cache=cache,
+            png=png,
+        )
+        pipeline.run(workers=workers, progress=progress)
+        return pipeline
+
+    def perf_report(self):
+        """Returns a summary of the timings and counters collected while
+        instrumentation was enabled (see :mod:`pcbflow.perf`) followed by
+        the polygon and vertex counts of each layer of the board."""
+        s = [perf.report(), ""]
+        s.append("%-32s %8s %10s" % ("Layer", "Polygons", "Vertices"))
         for name, layer in self.layers.items():
-            print("Rendering Gerber %s..." % (name))
-            if name == "GTD":
-                fn = assetpath + "_top.GBR"
-            elif name == "GBD":
-                fn = assetpath + "_bot.GBR"
-            else:
-                fn = assetpath + "." + name
-            with open(fn, "wt") as f:
-                layer.save(f)
-        ls = "1,%d" % (len(self.get_copper_layers()))
-        print("Rendering excellon drill files...")
-        with open(assetpath + "_PTH.DRL", "wt") as f:
-            excellon(f, self.holes, "Plated,%s,PTH" % (ls))
-        with open(assetpath + "_NPTH.DRL", "wt") as f:
-            excellon(f, self.npth, "NonPlated,%s,NPTH" % (ls))
+            geoms = [g for _, g in layer.polys] + [g for _, g in layer.named_polys]
+            if layer.fill_poly is not None:
+                geoms.append(layer.fill_poly)
+            if layer.is_outline:
+                geoms = list(layer.lines)
+            vertices = int(shapely.get_num_coordinates(geoms).sum()) if geoms else 0
+            s.append("%-32s %8d %10d" % (name, len(geoms), vertices))
+        return "\n".join(s)
+
+    def dump(self, fn):
+        """Saves a compact binary snapshot of the board which can be
+        restored with Board.load without re-running the layout script.
+
+        :param fn: snapshot file name
+        """
+        dump_board(self, fn)
+
+    @staticmethod
+    def load(fn):
+        """Returns a board restored from a snapshot saved with dump.
+
+        :param fn: snapshot file name
+        """
+        return load_board(fn)
+
+    @perf.timed("Board.save_gerbers")
+    def save_gerbers(self, basename, in_subdir=True, subdir=None):
+        """Writes the Gerber and Excellon files of the board"""
+        return self.save(
+            basename,
+            in_subdir=in_subdir,
+            subdir=subdir,
+            pdf=False,
+            bom=False,
+            centroids=False,
+        )
 
     def save_pdf(self, basename, in_subdir=True, subdir=None):
-        self.save_svg(basename, in_subdir=in_subdir, formats=["pdf"], subdir=subdir)
+        return self.save_svg(
+            basename, in_subdir=in_subdir, formats=["pdf"], subdir=subdir
+        )
 
     def save_png(self, basename, in_subdir=True, subdir=None):
-        self.save_svg(basename, in_subdir=in_subdir, formats=["png"], subdir=subdir)
+        return self.save_svg(
+            basename, in_subdir=in_subdir, formats=["png"], subdir=subdir
+        )
 
+    @perf.timed("Board.save_svg")
     def save_svg(self, basename, in_subdir=True, formats=["svg"], subdir=None):
-        assetpath = self._get_asset_path(basename, in_subdir, subdir=subdir)
-
-        from pcbflow.svgout import svg_write
+        """Writes the previews of the board
 
-        print("Rendering preview_top.%s..." % (formats))
-        svg_write(self, assetpath + "_preview_top.svg", style="top", formats=formats)
-        print("Rendering preview_top_docu.%s..." % (formats))
-        svg_write(
-            self,
-            assetpath + "_preview_top_docu.svg",
-            style="top_docu",
-            formats=formats,
-        )
-        print("Rendering preview_bot.%s..." % (formats))
-        svg_write(self, assetpath + "_preview_bot.svg", style="bottom", formats=formats)
-        print("Rendering preview_bot_docu.%s..." % (formats))
-        svg_write(
-            self,
-            assetpath + "_preview_bot_docu.svg",
-            style="bottom_docu",
-            formats=formats,
+        :param formats: list of "svg", "png" and "pdf"
+        """
+        return self.save(
+            basename,
+            in_subdir=in_subdir,
+            subdir=subdir,
+            gerber=False,
+            bom=False,
+            centroids=False,
+            svg="svg" in formats,
+            pdf="pdf" in formats,
+            png="png" in formats,
         )
-        print("Rendering preview_all.%s..." % (formats))
-        svg_write(self, assetpath + "_preview_all.svg", style="all", formats=formats)
 
     def save_centroids(self, basename, in_subdir=True, subdir=None):
         fn = self._get_asset_path(basename, in_subdir, subdir=subdir)
@@ -622,15 +687,16 @@ class Board:
     def boundary_keepout(self):
         x0, y0 = (0, 0)
         x1, y1 = self.size
+        r = self.drc.outline_clearance
         bo = sg.LinearRing([(x0, y0), (x1, y0), (x1, y1), (x0, y1)]).buffer(
-            self.drc.outline_clearance
+            r, quad_segs=self.drc.quad_segs(r)
         )
         self.keepouts.append(bo)
 
     def oversize(self, r):
         self.layers["GML"].add(self.boundary(r))
         sr = self.drc.silk_width / 2
-        g = self.boundary(1.1 * sr).buffer(sr)
+        g = self.boundary(1.1 * sr).buffer(sr, quad_segs=self.drc.quad_segs(sr))
         self.layers["GTO"].add(g.buffer(0))
 
     def body(self):
@@ -640,17 +706,23 @@ class Board:
         mask = sg.Polygon(gml[-1], gml[:-1])
         for d, xys in self.holes.items():
             if d > 0.3:
-                hlist = so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
+                q = self.drc.quad_segs(d / 2)
+                hlist = so.unary_union(
+                    [sg.Point(xy).buffer(d / 2, quad_segs=q) for xy in xys]
+                )
                 mask = mask.difference(hlist)
         return mask
 
     def substrate(self):
-        substrate = Layer(None, None)
+        substrate = Layer()
         gml = self.layers["GML"].lines
         mask = sg.Polygon(gml[-1], gml[:-1])
         for d, xys in self.holes.items():
             if d > 0.3:
-                hlist = so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
+                q = self.drc.quad_segs(d / 2)
+                hlist = so.unary_union(
+                    [sg.Point(xy).buffer(d / 2, quad_segs=q) for xy in xys]
+                )
                 mask = mask.difference(hlist)
         substrate.add(mask)
         return substrate
@@ -707,56 +779,82 @@ class Board:
         assert (abs(c - z[0].distance(z[1]))) < 1e-3
         return Route(self, z)
 
-    def check(self):
-        def npoly(g):
-            if isinstance(g, sg.Polygon):
-                return 1
-            else:
-                return len(g)
+    def enable_live_drc(self, clearance=None, raise_errors=False):
+        """Enables checking of each copper feature as it is added to the board.
+        Violations are collected in live_drc.violations along with the
+        script line which created the offending feature.
 
-        g = self.layers["GTL"].preview()
+        :param clearance: minimum spacing (drc.clearance by default)
+        :param raise_errors: raise a ClearanceError at the offending statement
 
-        def clearance(g):
-            p0 = MICRONS(0)
-            p1 = MICRONS(256)
-            while (p1 - p0) > MICRONS(0.25):
-                p = (p0 + p1) / 2
-                if npoly(g) == npoly(g.buffer(p)):
-                    p0 = p
-                else:
-                    p1 = p
-            return 2 * p0
-
-        for l in ("GTL", "GBL"):
-            if self.layers[l].polys:
-                clr = clearance(self.layers[l].preview())
-                if clr < (self.space - MICRONS(1.5)):
-                    print(
-                        "space violation on layer %s, actual %.3f expected %.3f mm"
-                        % (l, clr, self.space)
-                    )
-
-        def h2pt(d, xys):
-            return so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
-
-        ghole = so.unary_union([h2pt(d, xys) for (d, xys) in self.holes.items()])
-        return
-        hot_vcc = ghole.intersection(self.layers["GL3"].powered)
-        hot_gnd = ghole.intersection(self.layers["GL2"].powered)
-
-        show = [po for po in self.layers["GTL"].p if po.intersects(hot_vcc)]
+        :returns: :obj:`LiveDRC` checker
+        """
+        self.live_drc = LiveDRC(self, clearance=clearance, raise_errors=raise_errors)
+        return self.live_drc
 
+    def disable_live_drc(self):
+        self.live_drc = None
 
-def extend(dst, traces):
-    # extend parallel traces so that they are all level with dst
-    assert len({t.dir for t in traces}) == 1, "All traces must be parallel"
+    @perf.timed("Board.check")
+    def check(self, verbose=True):
+        """Checks the clearance between copper features of different nets on
+        every copper layer.
 
-    finish_line = dst.copy()
-    finish_line.left(90)
-    for t in traces:
-        t.approach(0, finish_line)
+        :param verbose: print each violation found
+        :returns: :obj:`list` of ClearanceViolation
+        """
+        violations = check_clearance(self)
+        if verbose:
+            for v in violations:
+                print(v)
+        return violations
+
+    def connectivity(self, pad_nets=False, verbose=False):
+        """Extracts the conductors formed by the copper and plated holes and
+        compares them with the intended nets.
+
+        :param pad_nets: also treat non-numeric pad names as net names
+        :param verbose: print a summary of the opens and shorts found
+        :returns: :obj:`Connectivity` with opens and shorts lists
+        """
+        conn = Connectivity(self, pad_nets=pad_nets)
+        if verbose:
+            print(conn.report())
+        return conn
 
+    def ratsnest(self, pad_nets=True, layer=None):
+        """Computes the unrouted connections (airwires) of every net.
 
-def extend2(traces):
-    by_y = {p.seek(traces[0])[1]: p for p in traces}
-    extend(by_y[min(by_y)], traces)
+        :param pad_nets: also group pads by their name if it is a net name
+        :param layer: documentation layer to draw the airwires on (e.g. "GTD")
+        :returns: :obj:`Ratsnest` with airwires and unrouted lengths per net
+        """
+        rats = Ratsnest(self, pad_nets=pad_nets)
+        if layer is not None:
+            rats.draw(layer)
+        return rats
+
+    @perf.timed("Board.autoroute")
+    def autoroute(self, verbose=False, **kwargs):
+        """Routes the unrouted connections of the board on a grid.
+        Keyword arguments are passed to :obj:`AutoRouter`; large boards are
+        routed by a pool of os.cpu_count() worker processes unless
+        processes is given.
+
+        :param verbose: print a summary of the routing run
+        :returns: :obj:`AutoRouter` with routes and failed connections
+        """
+        router = AutoRouter(self, **kwargs)
+        router.route(verbose=verbose)
+        return router
+
+
+def _restore_board(cls, uid):
+    # a copy of a board which is still alive in this process gets a new uid
+    # so that references to the original keep resolving to it
+    board = cls.__new__(cls)
+    board.uid = uid if board_by_id(uid) is None else uuid.uuid4().hex
+    board._loaded_uid = uid
+    register_board(board)
+    begin_board_load(uid, board)
+    return board
@@ -0,0 +1,181 @@
+#! /usr/bin/env python3
+#
+# Content addressed cache of board output files
+#
+
+import os
+import hashlib
+import shutil
+
+import numpy as np
+import shapely
+
+from . import __version__
+from .fpcache import DEFAULT_CACHE_DIR
+from . import perf
+
+# Cache keys include the pcbflow version, so an upgrade never restores
+# files written by older output code. Bump this when a change to the
+# Gerber, Excellon, SVG or other writers alters their output within a
+# release.
+BUILD_CACHE_FORMAT = 1
+
+
+def _geometry_digests(features):
+    # sorted digests of (name, geometry) pairs so that the order in which
+    # features were added does not matter
+    features = [(n, g) for n, g in features if g is not None]
+    if not features:
+        return []
+    wkb = shapely.to_wkb(np.array([g for _, g in features], dtype=object))
+    return sorted(
+        [
+            hashlib.sha1(repr(n).encode() + b"\0" + w).digest()
+            for (n, _), w in zip(features, wkb.tolist())
+        ]
+    )
+
+
+def layer_digest(layer):
+    """Returns a digest of everything which determines the rendering of a
+    layer: its attributes, geometry, copper fill and keepouts."""
+    h = hashlib.sha256()
+    h.update(repr((layer.desc, layer.function, layer.fill_net)).encode())
+    groups = [
+        getattr(layer, "polys", []),
+        getattr(layer, "named_polys", []),
+        [(None, layer.fill_poly)],
+        [(None, g) for g in layer.keepouts],
+        [(None, g) for g in getattr(layer, "lines", [])],
+    ]
+    if layer.board is not None:
+        groups.append([(None, g) for g in layer.board.keepouts])
+    for features in groups:
+        h.update(b"\1")
+        for d in _geometry_digests(features):
+            h.update(d)
+    return h.hexdigest()
+
+
+def holes_digest(holes):
+    """Returns a digest of a dict of hole centre lists keyed by diameter"""
+    items = sorted([(d, sorted(map(tuple, xys))) for d, xys in holes.items()])
+    return hashlib.sha256(repr(items).encode()).hexdigest()
+
+
+def drc_digest(drc):
+    """Returns a digest of the DRC settings"""
+    return hashlib.sha256(repr(sorted(vars(drc).items())).encode()).hexdigest()
+
+
+class BuildCache:
+    """A local directory of previously written output files, addressed by a
+    digest of everything the files were generated from (see layer_digest).
+    Each entry holds the files of one artifact, such as a Gerber layer or a
+    preview. When the cache grows beyond max_size bytes the least recently
+    used entries are removed. Keys include the pcbflow version and
+    BUILD_CACHE_FORMAT, so files written by other output code are not
+    reused.
+
+    :param cache_dir: directory of the cache (PCBFLOW_CACHE_DIR/builds by
+    default)
+    :param max_size: maximum total size of the cached files in bytes
+    """
+
+    def __init__(self, cache_dir=None, max_size=512 * 1024 * 1024):
+        if cache_dir is None:
+            cache_dir = os.path.join(DEFAULT_CACHE_DIR, "builds")
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts):
+        """Returns the cache key of an artifact made from parts and the
+        pcbflow version"""
+        h = hashlib.sha256(b"%d" % (BUILD_CACHE_FORMAT))
+        h.update(b"\0" + __version__.encode())
+        for p in parts:
+            h.update(b"\0" + repr(p).encode())
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def restore(self, key, paths):
+        """Copies the files of a cached artifact to paths. Returns True on a
+        hit and False (without writing anything) on a miss."""
+        entry = self._entry(key)
+        files = [os.path.join(entry, str(i)) for i in range(len(paths))]
+        if not all(os.path.isfile(fn) for fn in files):
+            self.misses += 1
+            perf.count("build cache misses")
+            return False
+        for src, dst in zip(files, paths):
+            shutil.copyfile(src, dst)
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        self.hits += 1
+        perf.count("build cache hits")
+        return True
+
+    def store(self, key, paths):
+        """Adds the files at paths to the cache as an artifact. Failures are
+        ignored since a read-only or full cache should never stop a build."""
+        entry = self._entry(key)
+        if os.path.isdir(entry):
+            return
+        tmp = "%s.%d.tmp" % (entry, os.getpid())
+        try:
+            os.makedirs(tmp, exist_ok=True)
+            for i, src in enumerate(paths):
+                shutil.copyfile(src, os.path.join(tmp, str(i)))
+            os.replace(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def entries(self):
+        """Returns (last use, size, path) of each cache entry"""
+        found = []
+        if not os.path.isdir(self.cache_dir):
+            return found
+        for sub in os.listdir(self.cache_dir):
+            subdir = os.path.join(self.cache_dir, sub)
+            if not os.path.isdir(subdir):
+                continue
+            for key in os.listdir(subdir):
+                entry = os.path.join(subdir, key)
+                if key.endswith(".tmp") or not os.path.isdir(entry):
+                    continue
+                size = sum(
+                    [os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry)]
+                )
+                found.append((os.path.getmtime(entry), size, entry))
+        return found
+
+    def size(self):
+        """Returns the total size of the cached files in bytes"""
+        return sum([size for _, size, _ in self.entries()])
+
+    def evict(self):
+        """Removes the least recently used entries until the cache fits in
+        max_size. Returns the number of entries removed."""
+        entries = sorted(self.entries())
+        total = sum([size for _, size, _ in entries])
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self):
+        """Removes every entry of the cache"""
+        for _, _, entry in self.entries():
+            shutil.rmtree(entry, ignore_errors=True)
+        self.hits = 0
+        self.misses = 0
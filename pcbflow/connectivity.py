@@ -0,0 +1,260 @@
+#! /usr/bin/env python3
+#
+# Copper connectivity extraction
+#
+
+from collections import defaultdict
+
+import numpy as np
+import shapely
+
+from .drc import copper_features, net_name, _islands
+
+
+def terminal_str(t):
+    return "%s.%s" % t
+
+
+def _points(xys):
+    return shapely.points(np.array(xys, dtype=float).reshape(-1, 2))
+
+
+class Open:
+    """An intended net whose pads lie on more than one separate conductor.
+    islands is a list of tuples of the (part, pad) terminals found on each
+    conductor; pads which do not touch any copper form islands of their own.
+    """
+
+    def __init__(self, net, islands):
+        self.net = net
+        self.islands = islands
+
+    def __str__(self):
+        groups = [" ".join([terminal_str(t) for t in i]) for i in self.islands]
+        return "open in net %s: %s" % (self.net, " | ".join(groups))
+
+
+class Short:
+    """A conductor which joins copper or pads of different nets. layer and xy
+    locate a point where features of two of the nets touch, if there is one
+    (otherwise the nets only meet through a via or plated hole)."""
+
+    def __init__(self, nets, terminals, layer=None, xy=None):
+        self.nets = nets
+        self.terminals = terminals
+        self.layer = layer
+        self.xy = xy
+
+    def __str__(self):
+        s = "short between %s" % (" / ".join(self.nets))
+        if self.xy is not None:
+            s += " on layer %s at (%.3f, %.3f)" % (self.layer, *self.xy)
+        if self.terminals:
+            s += " (%s)" % (" ".join([terminal_str(t) for t in self.terminals]))
+        return s
+
+
+class Connectivity:
+    """Physical connectivity of the copper on a board.
+
+    Copper features on each layer are indexed with an STRtree and features
+    which touch are merged into conductors with a union-find. Plated holes
+    (vias and through hole pads) join the features they pass through on
+    every copper layer. Part pads are then located on their conductors and
+    compared with the intended nets: the connections recorded in Board.nets
+    and the net names carried by copper features (see net_name).
+
+    A conductor holding the pads of more than one Board.nets net, or copper
+    with more than one net name, is a short. A net whose pads are spread
+    over several conductors is an open.
+
+    :param board: Board to extract
+    :param layers: list of copper layer names (all copper layers by default)
+    :param pad_nets: also group pads by their name if it is a net name (as
+    assigned by SkiPart)
+    """
+
+    def __init__(self, board, layers=None, pad_nets=False):
+        if layers is None:
+            layers = board.get_copper_layers(as_names=True)
+        self.board = board
+        self.layers = layers
+        self.feature_layer = []
+        self.feature_net = []
+        geoms = []
+        spans = {}
+        for layer in layers:
+            lyr = board.layers[layer]
+            features = copper_features(lyr, lyr.fill_net)
+            spans[layer] = (len(geoms), len(geoms) + len(features))
+            self.feature_layer.extend([layer] * len(features))
+            self.feature_net.extend([net_name(name) for name, _ in features])
+            geoms.extend([g for _, g in features])
+        self.geoms = np.array(geoms, dtype=object)
+        n = len(geoms)
+
+        # features which touch on the same layer
+        self.trees = {}
+        ei, ej = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for layer, (a, b) in spans.items():
+            if a == b:
+                continue
+            self.trees[layer] = tree = shapely.STRtree(self.geoms[a:b])
+            i, j = tree.query(self.geoms[a:b], predicate="intersects")
+            ei.append(i[i < j] + a)
+            ej.append(j[i < j] + a)
+        self.pairs = (np.concatenate(ei), np.concatenate(ej))
+
+        # each plated hole is an extra node joined to the features it pierces
+        holes = [xy for xys in self.board.holes.values() for xy in xys]
+        if holes:
+            points = _points(holes)
+            for layer, tree in self.trees.items():
+                h, k = tree.query(points, predicate="intersects")
+                ei.append(h + n)
+                ej.append(k + spans[layer][0])
+        roots = _islands(n + len(holes), np.concatenate(ei), np.concatenate(ej))
+        _, component = np.unique(roots, return_inverse=True)
+        self.feature_component = component[:n]
+        self.count = int(component.max()) + 1 if len(component) else 0
+
+        # locate each part pad on the conductor(s) under its centre
+        self.pads = []
+        self.pad_xy = []
+        pad_features = []
+        by_layer = defaultdict(list)
+        for parts in board.parts.values():
+            for part in parts:
+                for pad in part.pads:
+                    layer = "GBL" if pad.is_bottom_layer() else "GTL"
+                    by_layer[layer].append((len(self.pads), pad.xy))
+                    self.pads.append(((part.id, pad.name), None))
+                    self.pad_xy.append(pad.xy)
+                    pad_features.append([])
+        for layer, found in by_layer.items():
+            if layer not in self.trees:
+                continue
+            p, k = self.trees[layer].query(
+                _points([xy for _, xy in found]), predicate="intersects"
+            )
+            for pk, fk in zip(p.tolist(), (k + spans[layer][0]).tolist()):
+                pi = found[pk][0]
+                pad_features[pi].append(fk)
+                self.pads[pi] = (self.pads[pi][0], int(self.feature_component[fk]))
+
+        self.pad_components = defaultdict(set)
+        for t, c in self.pads:
+            self.pad_components[t].add(c)
+
+        self.nets = self._intended_nets(pad_nets)
+        # net label of each feature: its own net name or that of a pad on it
+        self.feature_label = list(self.feature_net)
+        for (t, c), fks in zip(self.pads, pad_features):
+            if t in self.pad_net:
+                for fk in fks:
+                    if self.feature_label[fk] is None:
+                        self.feature_label[fk] = self.pad_net[t]
+        self.opens = self._find_opens()
+        self.shorts = self._find_shorts()
+
+    def _intended_nets(self, pad_nets):
+        # group the terminals joined by Board.nets (and optionally by name)
+        index = {}
+        pairs = []
+        for a, b in self.board.nets:
+            for t in (a, b):
+                index.setdefault(t, len(index))
+            pairs.append((index[a], index[b]))
+        if pad_nets:
+            names = {}
+            for t, _ in self.pads:
+                name = net_name(t[1])
+                if name is not None:
+                    index.setdefault(t, len(index))
+                    names.setdefault(name, index[t])
+                    pairs.append((index[t], names[name]))
+        terminals = list(index)
+        roots = _islands(
+            len(terminals),
+            np.array([a for a, _ in pairs], dtype=np.int64),
+            np.array([b for _, b in pairs], dtype=np.int64),
+        )
+        groups = defaultdict(list)
+        for t, r in zip(terminals, roots.tolist()):
+            groups[r].append(t)
+        nets = {}
+        self.pad_net = {}
+        for members in groups.values():
+            members.sort(key=str)
+            names = (
+                sorted({net_name(t[1]) for t in members} - {None}) if pad_nets else []
+            )
+            name = names[0] if names else "Net-(%s-%s)" % members[0]
+            nets[name] = members
+            for t in members:
+                self.pad_net[t] = name
+        return nets
+
+    def _find_opens(self):
+        opens = []
+        for net in sorted(self.nets):
+            islands = defaultdict(list)
+            for t in self.nets[net]:
+                for c in self.terminals(t):
+                    # pads off the copper are islands of their own
+                    islands[("pad", t) if c is None else c].append(t)
+            if len(islands) > 1:
+                opens.append(Open(net, sorted([tuple(i) for i in islands.values()])))
+        return opens
+
+    def _find_shorts(self):
+        comp_nets = defaultdict(set)
+        comp_names = defaultdict(set)
+        comp_terminals = defaultdict(list)
+        for t, c in self.pads:
+            if c is not None:
+                comp_terminals[c].append(t)
+                if t in self.pad_net:
+                    comp_nets[c].add(self.pad_net[t])
+        for c, name in zip(self.feature_component.tolist(), self.feature_net):
+            if name is not None:
+                comp_names[c].add(name)
+        shorts = {}
+        for c in set(comp_nets) | set(comp_names):
+            # copper names name the pads' net unless there are several of either
+            if len(comp_nets[c]) > 1 or len(comp_names[c]) > 1:
+                nets = sorted(comp_nets[c] | comp_names[c])
+                shorts[c] = Short(nets, sorted(comp_terminals[c], key=str))
+        if not shorts:
+            return []
+        # locate each short where two differently labelled features touch
+        label = np.array(self.feature_label, dtype=object)
+        i, j = self.pairs
+        same_comp = self.feature_component[i]
+        for k in np.nonzero(label[i] != label[j])[0].tolist():
+            a, b = int(i[k]), int(j[k])
+            s = shorts.get(int(same_comp[k]), None)
+            if s is None or s.xy is not None or None in (label[a], label[b]):
+                continue
+            xy = self.geoms[a].intersection(self.geoms[b]).representative_point()
+            s.layer = self.feature_layer[a]
+            s.xy = (xy.x, xy.y)
+        return [shorts[c] for c in sorted(shorts)]
+
+    def terminals(self, t):
+        """Returns the conductor numbers of the pads of terminal (part, pad)
+        (None for a pad which does not touch any copper)"""
+        comps = self.pad_components.get(t, ())
+        return sorted(comps, key=lambda c: (c is None, c))
+
+    def connected(self, a, b):
+        """Returns True if terminals a and b are on the same conductor"""
+        ca = set(self.terminals(a)) - {None}
+        return bool(ca & set(self.terminals(b)))
+
+    def report(self):
+        """Returns a text summary of the opens and shorts found"""
+        s = ["%d conductors, %d nets" % (self.count, len(self.nets))]
+        s.extend([str(o) for o in self.opens])
+        s.extend([str(e) for e in self.shorts])
+        return "\n".join(s)
@@ -4,11 +4,14 @@
 
 import math
 
+import numpy as np
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 
 from pcbflow import *
+from .util import board_state, rebind_board
+from . import perf
 
 SINGLE_TOKENS = ["i", "o"]
 PARAM_TOKENS = ["f", "r", "l", ".", ">"]
@@ -31,6 +34,34 @@ def token_splitter(tokens):
     return exp_tokens
 
 
+def path_length(path):
+    """Returns the length of the polyline through the points of path"""
+    xy = np.asarray(path, dtype=float)
+    if len(xy) < 2:
+        return 0.0
+    return float(np.hypot(*np.diff(xy, axis=0).T).sum())
+
+
+def meander_gain(style, amplitude, pitch):
+    # extra length of one meander period of the given amplitude
+    if style == "trombone":
+        return 2 * amplitude
+    if style == "sawtooth":
+        return 2 * math.hypot(pitch / 2, amplitude) - pitch
+    raise ValueError("unknown meander style %r" % (style,))
+
+
+def meander_advance(style, pitch):
+    # distance travelled along the path by one meander period
+    return 2 * pitch if style == "trombone" else pitch
+
+
+def _meander_amplitude(style, gain, pitch):
+    if style == "trombone":
+        return gain / 2
+    return math.sqrt(((gain + pitch) / 2) ** 2 - (pitch / 2) ** 2)
+
+
 class Turtle:
     """Turtle graphics command parser base class"""
 
@@ -95,6 +126,12 @@ class Draw(Turtle):
         self.side = "top"
         self.layer = "GTL"
 
+    def __getstate__(self):
+        return board_state(self)
+
+    def __setstate__(self, state):
+        rebind_board(self, state)
+
     def is_bottom_layer(self):
         if self.layer in ["GBS", "GBO", "GBL", "GBP", "GBD"]:
             return True
@@ -206,6 +243,44 @@ class Draw(Turtle):
         y = other.xy[1] - self.xy[1]
         return math.atan2(x, y)
 
+    def total_length(self):
+        """Returns the length of the wired and the current path"""
+        return self.length + path_length(self.path)
+
+    def meander(self, extra, amplitude, pitch=None, style="trombone", count=None):
+        """Goes forward in a meander which is extra mm longer than a straight
+        line. A "trombone" meander is a row of rectangular bumps and a
+        "sawtooth" meander a row of triangular teeth, both to the left.
+
+        :param extra: length to add
+        :param amplitude: maximum height of the meander
+        :param pitch: spacing of the meander legs (drc.channel() by default)
+        :param style: "trombone" or "sawtooth"
+        :param count: number of bumps or teeth (as few as possible by default)
+        """
+        if pitch is None:
+            pitch = self.board.drc.channel()
+        most = meander_gain(style, amplitude, pitch)
+        if count is None:
+            count = max(1, math.ceil(extra / most - 1e-9))
+        elif extra > count * most + 1e-9:
+            raise ValueError(
+                "cannot add %.3f mm with %d meanders of amplitude %.3f"
+                % (extra, count, amplitude)
+            )
+        a = _meander_amplitude(style, max(extra, 0) / count, pitch)
+        if a < 1e-6:
+            return self.forward(count * meander_advance(style, pitch))
+        for _ in range(count):
+            if style == "trombone":
+                self.left(90).forward(a).right(90).forward(pitch)
+                self.right(90).forward(a).left(90).forward(pitch)
+            else:
+                th = math.degrees(math.atan2(a, pitch / 2))
+                leg = math.hypot(pitch / 2, a)
+                self.left(th).forward(leg).right(2 * th).forward(leg).left(th)
+        return self
+
     def rect(self, w, h):
         self.push()
         self.forward(h / 2)
@@ -226,8 +301,11 @@ class Draw(Turtle):
         self.h = h  # used by inside, outside for pad escape
         return self
 
-    def n_agon(self, radius, sides):
-        # an n-agon approximating a circle radius r
+    def n_agon(self, radius, sides=None):
+        # an n-agon approximating a circle radius r, by default with enough
+        # sides (a multiple of four) to stay within the board's arc_error
+        if sides is None:
+            sides = 4 * self.board.drc.quad_segs(radius)
         ea = 360 / sides
         self.push()
         half_angle = math.pi / sides
@@ -327,13 +405,17 @@ class Draw(Turtle):
     def pin_pad(self):
         for layer in self.board.get_pad_stack_layers():
             if layer.is_mask:
-                g = sg.Polygon(self.path).buffer(self.board.drc.soldermask_margin)
+                r = self.board.drc.soldermask_margin
+                g = sg.Polygon(self.path).buffer(
+                    r, quad_segs=self.board.drc.quad_segs(r)
+                )
             else:
                 g = sg.Polygon(self.path)
             layer.add(g, self.name)
 
     def silk(self, side="top"):
-        g = sg.LineString(self.path).buffer(self.board.drc.silk_width / 2)
+        r = self.board.drc.silk_width / 2
+        g = sg.LineString(self.path).buffer(r, quad_segs=self.board.drc.quad_segs(r))
         self.board.get_silk_layer(side).add(g)
 
     def outline(self):
@@ -347,16 +429,18 @@ class Draw(Turtle):
         self.via(connect=self.name)
         self.layer = next_layer
 
+    @perf.timed("Draw.via")
     def via(self, connect=None):
         dv = self.board.drc.via_drill / 2 + self.board.drc.via_annular_ring
-        g = sg.Point(self.xy).buffer(dv)
+        g = sg.Point(self.xy).buffer(dv, quad_segs=self.board.drc.quad_segs(dv))
         for layer in self.board.get_copper_layers():
             layer.add(g, connect)
         if connect is not None:
             self.board.layers[self.layer].connected.append(g)
         self.board.add_drill(self.xy, self.board.drc.via_drill)
         if self.board.drc.mask_vias:
-            gm = sg.Point(self.xy).buffer(dv + self.board.drc.soldermask_margin)
+            r = dv + self.board.drc.soldermask_margin
+            gm = sg.Point(self.xy).buffer(r, quad_segs=self.board.drc.quad_segs(r))
             self.board.add_to_mask_layers(gm)
         self.newpath()
         return self
@@ -364,6 +448,7 @@ class Draw(Turtle):
     def preview(self):
         return sg.LineString(self.path)
 
+    @perf.timed("Draw.wire")
     def wire(self, layer=None, width=None):
         if layer is not None:
             self.layer = layer
@@ -372,7 +457,8 @@ class Draw(Turtle):
         if len(self.path) > 1:
             ls = sg.LineString(self.path)
             self.length += ls.length
-            g = ls.buffer(self.width / 2)
+            r = self.width / 2
+            g = ls.buffer(r, quad_segs=self.board.drc.quad_segs(r))
             self.board.layers[self.layer].add(g, self.name)
             self.newpath()
         return self
@@ -391,15 +477,16 @@ class Draw(Turtle):
 
     def platedslot(self, buf):
         brd = self.board
-        g1 = sg.LineString(self.path).buffer(buf)
+        q = brd.drc.quad_segs(buf)
+        g1 = sg.LineString(self.path).buffer(buf, quad_segs=q)
         g2 = sg.LinearRing(g1.exterior.coords)
         brd.layers["GML"].add(g2)
-        g3 = g1.buffer(
-            self.board.drc.soldermask_margin + self.board.drc.via_annular_ring
-        )
+        r = self.board.drc.soldermask_margin + self.board.drc.via_annular_ring
+        g3 = g1.buffer(r, quad_segs=brd.drc.quad_segs(buf + r))
         self.board.add_to_mask_layers(g3)
-        g3 = g1.buffer(self.board.drc.via_annular_ring)
-        g4 = g3.difference(g1.buffer(-self.board.drc.via_annular_ring / 2))
+        r = self.board.drc.via_annular_ring
+        g3 = g1.buffer(r, quad_segs=brd.drc.quad_segs(buf + r))
+        g4 = g3.difference(g1.buffer(-r / 2, quad_segs=q))
         for l in self.board.get_copper_layers(as_names=True):
             brd.layers[l].add(g4)
         strut_x = sa.scale(g4.envelope, yfact=0)
@@ -426,10 +513,15 @@ class Draw(Turtle):
         (x, y) = self.xy
         layer = self.board.get_silk_layer(side)
         linewidth = self.board.drc.text_silk_width
+        q = self.board.drc.quad_segs(linewidth / 2)
         if justify == "left":
-            layer.add(hershey.ltext(x, y, s, side=side, linewidth=linewidth))
+            layer.add(
+                hershey.ltext(x, y, s, side=side, linewidth=linewidth, quad_segs=q)
+            )
         else:
-            layer.add(hershey.ctext(x, y, s, side=side, linewidth=linewidth))
+            layer.add(
+                hershey.ctext(x, y, s, side=side, linewidth=linewidth, quad_segs=q)
+            )
         return self
 
     def text(self, s, side="top"):
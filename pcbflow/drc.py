@@ -3,8 +3,38 @@
 # Design Rules Check (DRC)
 #
 
+import os
+import sys
+import math
+from collections import defaultdict
+
+import numpy as np
+import shapely
+import shapely.geometry as sg
+
 from pcbflow import *
 
+# Geometry quality profiles. "fab" gives the precise output for
+# manufacturing; "draft" uses coarser arcs, simplification and pours for
+# faster builds while iterating on a layout.
+#   arc_error: largest chord error of arcs and circles in mm; the number
+#     of segments of each round feature follows from its radius
+#   simplify: tolerance of the simplification of added features in mm
+#   pour_join: join style of pour clearances; "mitre" corners always keep
+#     the full clearance however coarse the arcs of the copper are
+QUALITY_PROFILES = {
+    "fab": {
+        "arc_error": MICRONS(1),
+        "simplify": MICRONS(1),
+        "pour_join": "round",
+    },
+    "draft": {
+        "arc_error": MICRONS(50),
+        "simplify": MICRONS(10),
+        "pour_join": "mitre",
+    },
+}
+
 
 class DRC:
     def __init__(self):
@@ -26,6 +56,370 @@ class DRC:
         self.bitmap_res = 0.04
         self.silk_width = MILS(6)
         self.text_silk_width = MILS(6)
+        # Quality
+        self.set_quality("fab")
 
     def channel(self):
         return self.trace_width + self.clearance
+
+    def arc_segments(self, radius, angle=360):
+        """Returns the number of segments of an arc of radius and angle
+        degrees within the arc_error of the quality profile"""
+        return arc_segments(radius, self.arc_error, angle)
+
+    def quad_segs(self, radius):
+        """Returns the segments per quarter circle of a buffer by radius,
+        as passed to shapely's buffer"""
+        return arc_segments(radius, self.arc_error, 90)
+
+    def clearance_segs(self, radius):
+        """Returns the segments per quarter circle of a buffer which keeps a
+        clearance, such as the exclusions of a pour. GEOS rounds the number
+        of segments of each join, so a join chord can span 1.5 steps and
+        cut 2.25 times deeper; 1.5 times the segments keeps it within
+        arc_error."""
+        return math.ceil(1.5 * self.quad_segs(radius))
+
+    def set_quality(self, profile):
+        """Applies the settings of a geometry quality profile. Features keep
+        the quality they were added with, so this is normally called before
+        anything is placed on the board.
+
+        :param profile: name of a profile in QUALITY_PROFILES ("fab" or
+        "draft")
+        """
+        if profile not in QUALITY_PROFILES:
+            raise ValueError(
+                "unknown quality profile %s (choose from %s)"
+                % (profile, ", ".join(QUALITY_PROFILES))
+            )
+        self.quality = profile
+        for k, v in QUALITY_PROFILES[profile].items():
+            setattr(self, k, v)
+
+
+def net_name(name):
+    """Returns the net name implied by a copper feature name or None if the
+    feature is unnamed or only carries a numeric pad designator."""
+    if name is None or str(name).isdigit():
+        return None
+    return name
+
+
+class ClearanceViolation:
+    """A pair of copper features which are closer than the clearance rule
+    allows (or touch, if they belong to different nets)"""
+
+    def __init__(self, layer, xy, distance, required, nets, site=None):
+        self.layer = layer
+        self.xy = xy
+        self.distance = distance
+        self.required = required
+        self.nets = nets
+        self.site = site
+
+    def __str__(self):
+        kind = "short" if self.distance == 0 else "clearance violation"
+        s = "%s on layer %s at (%.3f, %.3f) actual %.3f expected %.3f mm (%s / %s)" % (
+            kind,
+            self.layer,
+            *self.xy,
+            self.distance,
+            self.required,
+            *self.nets,
+        )
+        if self.site is not None:
+            s += " at %s" % (self.site)
+        return s
+
+
+class ClearanceError(Exception):
+    pass
+
+
+def copper_features(layer, fill_net=None):
+    """Returns a list of (netname, polygon) tuples for every individual copper
+    feature on a layer including named regions and any copper fill."""
+    features = list(layer.polys)
+    features.extend(layer.named_copper())
+    if layer.fill_poly is not None:
+        features.append((fill_net, layer.fill_poly))
+    polys = []
+    for name, g in features:
+        if g.is_empty:
+            continue
+        if isinstance(g, sg.base.BaseMultipartGeometry):
+            polys.extend([(name, p) for p in g.geoms if not p.is_empty])
+        else:
+            polys.append((name, g))
+    return polys
+
+
+def _islands(n, i, j):
+    # union-find over the pairs of touching features
+    parent = list(range(n))
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for a, b in zip(i.tolist(), j.tolist()):
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[ra] = rb
+    return np.array([find(a) for a in range(n)])
+
+
+def check_clearance(board, layers=None, clearance=None, tolerance=None):
+    """Checks the spacing between copper features on different nets.
+
+    Features are indexed with an STRtree so that only pairs closer than the
+    clearance are measured. Features which touch are treated as the same
+    conductor; otherwise features are on the same net if they carry the
+    same net name (see net_name).
+
+    :param board: Board to check
+    :param layers: list of copper layer names (all copper layers by default)
+    :param clearance: minimum spacing (board.drc.clearance by default)
+    :param tolerance: allowance for arc approximation error (1.5 times
+    board.drc.arc_error by default)
+    :returns: :obj:`list` of ClearanceViolation
+    """
+    if layers is None:
+        layers = board.get_copper_layers(as_names=True)
+    if clearance is None:
+        clearance = board.drc.clearance
+    if tolerance is None:
+        tolerance = 1.5 * board.drc.arc_error
+    violations = []
+    for layer in layers:
+        lyr = board.layers[layer]
+        features = copper_features(lyr, lyr.fill_net)
+        if len(features) < 2:
+            continue
+        nets = [net_name(name) for name, _ in features]
+        geoms = np.array([g for _, g in features], dtype=object)
+        tree = shapely.STRtree(geoms)
+        i, j = tree.query(geoms, predicate="dwithin", distance=clearance)
+        i, j = i[i < j], j[i < j]
+        d = shapely.distance(geoms[i], geoms[j])
+        touching = d == 0
+        island = _islands(len(geoms), i[touching], j[touching])
+        island_nets = {}
+        for k, net in enumerate(nets):
+            if net is not None:
+                island_nets.setdefault(island[k], set()).add(net)
+        short = np.array(
+            [
+                nets[a] is not None and nets[b] is not None and nets[a] != nets[b]
+                for a, b in zip(i.tolist(), j.tolist())
+            ],
+            dtype=bool,
+        )
+        close = (d > 0) & (d < clearance - tolerance) & (island[i] != island[j])
+        bad = np.nonzero((touching & short) | close)[0]
+        keep = []
+        for k in bad.tolist():
+            if d[k] > 0:
+                na = island_nets.get(island[i[k]], set())
+                nb = island_nets.get(island[j[k]], set())
+                if na & nb:
+                    continue
+            keep.append(k)
+        if not keep:
+            continue
+        keep = np.array(keep)
+        # locate each violation at the midpoint of the shortest line between
+        # the pair (a point common to both for touching features)
+        lines = shapely.shortest_line(geoms[i[keep]], geoms[j[keep]])
+        xys = shapely.get_coordinates(lines).reshape(-1, 2, 2).mean(axis=1)
+        for k, xy in zip(keep.tolist(), xys.tolist()):
+            a, b = int(i[k]), int(j[k])
+            violations.append(
+                ClearanceViolation(
+                    layer, tuple(xy), float(d[k]), clearance, (nets[a], nets[b])
+                )
+            )
+    return violations
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+def call_site():
+    """Returns "file:line" of the innermost caller outside of pcbflow"""
+    f = sys._getframe(1)
+    while f is not None and f.f_code.co_filename.startswith(PACKAGE_DIR):
+        f = f.f_back
+    if f is None:
+        return None
+    return "%s:%d" % (f.f_code.co_filename, f.f_lineno)
+
+
+class LiveDRC:
+    """Incremental clearance checker which tests each copper feature as it is
+    added to a board. Features are hashed into a hierarchy of uniform grids
+    so each new feature is only compared with the features in the grid
+    cells within the clearance distance of its bounds. A feature goes into
+    the finest grid in which it spans at most max_cells cells; each grid
+    has cells coarsen times larger than the one below, so long traces and
+    copper pours only meet the features near them.
+
+    Features which touch are merged into conductor islands as they are added.
+    A violation is therefore judged against the copper present at the time,
+    i.e. copper which is only joined to its neighbour by a later statement
+    can be reported.
+    """
+
+    def __init__(self, board, clearance=None, cell_size=None, raise_errors=False):
+        self.board = board
+        self.clearance = clearance if clearance is not None else board.drc.clearance
+        self.cell_size = cell_size if cell_size is not None else 1.0
+        self.max_cells = 64
+        self.coarsen = 8
+        self.raise_errors = raise_errors
+        self.violations = []
+        # per-layer feature store and spatial hash
+        self.geoms = defaultdict(list)
+        self.nets = defaultdict(list)
+        self.pours = defaultdict(list)
+        # cells of each (layer, grid level) and the levels used on a layer
+        self.cells = defaultdict(lambda: defaultdict(list))
+        self.levels = defaultdict(int)
+        self.parent = {}
+        for layer in board.get_copper_layers():
+            for name, g in layer.polys:
+                self._insert(layer.name, name, g, False)
+            for name, g in layer.named_polys:
+                self._insert(layer.name, name, g, True)
+
+    @property
+    def tolerance(self):
+        # allowance for arc approximation error, following the board's
+        # current quality profile
+        return 1.5 * self.board.drc.arc_error
+
+    def _find(self, a):
+        parent = self.parent
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    def _union(self, a, b):
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            self.parent[ra] = rb
+
+    def _cell_range(self, bounds, margin=0.0, level=0):
+        s = self.cell_size * self.coarsen**level
+        x0, y0 = int((bounds[0] - margin) // s), int((bounds[1] - margin) // s)
+        x1, y1 = int((bounds[2] + margin) // s), int((bounds[3] + margin) // s)
+        return x0, y0, x1, y1
+
+    def _candidates(self, layer, bounds):
+        found = set()
+        for level in range(self.levels[layer] + 1):
+            x0, y0, x1, y1 = self._cell_range(bounds, self.clearance, level)
+            cells = self.cells[(layer, level)]
+            if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+                # fewer occupied cells than cells in range
+                for (ix, iy), c in cells.items():
+                    if x0 <= ix <= x1 and y0 <= iy <= y1:
+                        found.update(c)
+                continue
+            for ix in range(x0, x1 + 1):
+                for iy in range(y0, y1 + 1):
+                    c = cells.get((ix, iy), None)
+                    if c:
+                        found.update(c)
+        return sorted(found)
+
+    def _insert(self, layer, name, g, pour, bounds=None):
+        if bounds is None:
+            if g.is_empty:
+                return None
+            bounds = g.bounds
+        idx = len(self.geoms[layer])
+        self.geoms[layer].append(g)
+        self.nets[layer].append(net_name(name))
+        self.pours[layer].append(pour)
+        self.parent[(layer, idx)] = (layer, idx)
+        level = 0
+        x0, y0, x1, y1 = self._cell_range(bounds)
+        while (x1 - x0 + 1) * (y1 - y0 + 1) > self.max_cells:
+            level += 1
+            x0, y0, x1, y1 = self._cell_range(bounds, level=level)
+        self.levels[layer] = max(self.levels[layer], level)
+        cells = self.cells[(layer, level)]
+        for ix in range(x0, x1 + 1):
+            for iy in range(y0, y1 + 1):
+                cells[(ix, iy)].append(idx)
+        return idx
+
+    def _report(self, layer, xy, distance, nets, site):
+        v = ClearanceViolation(layer, xy, distance, self.clearance, nets, site=site)
+        self.violations.append(v)
+        if self.raise_errors:
+            raise ClearanceError(str(v))
+
+    def add(self, layer, name, g, pour=False):
+        """Checks and then indexes a new copper feature on layer"""
+        if g.is_empty:
+            return
+        bounds = g.bounds
+        candidates = self._candidates(layer, bounds)
+        idx = self._insert(layer, name, g, pour, bounds)
+        if not candidates:
+            return
+        geoms = self.geoms[layer]
+        nets = self.nets[layer]
+        pours = self.pours[layer]
+        net = nets[idx]
+        others = np.array([geoms[k] for k in candidates], dtype=object)
+        d = shapely.distance(others, g)
+        site = None
+        close = []
+        for k, dk in zip(candidates, d.tolist()):
+            if dk >= self.clearance - self.tolerance:
+                continue
+            other = nets[k]
+            if dk == 0:
+                if net is not None and other is not None and net != other:
+                    # copper pours are cleared from other nets when rendered
+                    if not pour and not pours[k]:
+                        site = site or call_site()
+                        xy = geoms[k].intersection(g).representative_point()
+                        self._report(layer, (xy.x, xy.y), 0.0, (other, net), site)
+                else:
+                    self._union((layer, k), (layer, idx))
+            elif not pour and not pours[k]:
+                close.append((k, dk))
+        for k, dk in close:
+            other = nets[k]
+            if net is not None and net == other:
+                continue
+            if self._find((layer, k)) == self._find((layer, idx)):
+                continue
+            site = site or call_site()
+            line = shapely.shortest_line(geoms[k], g)
+            xy = line.centroid
+            self._report(layer, (xy.x, xy.y), dk, (other, net), site)
+
+    def add_drill(self, xy, diameter):
+        """Checks that a plated hole does not join copper of different nets"""
+        q = self.board.drc.quad_segs(diameter / 2)
+        hole = sg.Point(xy).buffer(diameter / 2, quad_segs=q)
+        for layer in self.board.get_copper_layers(as_names=True):
+            geoms = self.geoms[layer]
+            nets = self.nets[layer]
+            hit = [
+                k
+                for k in self._candidates(layer, hole.bounds)
+                if not self.pours[layer][k] and geoms[k].intersects(hole)
+            ]
+            hit_nets = {nets[k] for k in hit if nets[k] is not None}
+            if len(hit_nets) > 1:
+                self._report(layer, xy, 0.0, tuple(sorted(hit_nets))[:2], call_site())
@@ -5,7 +5,7 @@
 
 import os, sys
 import math
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 
 import xml.etree.ElementTree as ET
 import shapely.geometry as sg
@@ -14,18 +14,38 @@ import shapely.ops as so
 
 from .part import PCBPart
 from .util import col_print, infer_family
+from .fpcache import file_signature
 
 LAYER_DIMENSION = "20"
 LAYER_TPLACE = "21"
 LAYER_TDOCU = "51"
 DOC_LAYERS = (LAYER_DIMENSION, LAYER_TPLACE, LAYER_TDOCU)
 
+# most recently used parsed .lbr files keyed by file signature
+LBR_CACHE_SIZE = 8
+_lbr_cache = OrderedDict()
+
+
+def lbr_packages(fn):
+    """Returns a dict of package name to package XML element for an Eagle
+    .lbr file. Parsed libraries are cached so that placing many parts from
+    the same library only parses the XML once."""
+    sig = file_signature(fn)
+    packages = _lbr_cache.get(sig, None)
+    if packages is not None:
+        _lbr_cache.move_to_end(sig)
+        return packages
+    root = ET.parse(fn).getroot()
+    x_packages = root.find("drawing").find("library").find("packages")
+    packages = {p.attrib["name"]: p for p in x_packages}
+    _lbr_cache[sig] = packages
+    while len(_lbr_cache) > LBR_CACHE_SIZE:
+        _lbr_cache.popitem(last=False)
+    return packages
+
 
 def list_lbr_packages(fn):
-    tree = ET.parse(fn)
-    root = tree.getroot()
-    x_packages = root.find("drawing").find("library").find("packages")
-    packages = sorted([p.attrib["name"] for p in x_packages])
+    packages = sorted(lbr_packages(fn).keys())
     col = 0
     s = []
     col_print(packages)
@@ -33,10 +53,7 @@ def list_lbr_packages(fn):
 
 
 def show_lbr_package(fn, package):
-    tree = ET.parse(fn)
-    root = tree.getroot()
-    x_packages = root.find("drawing").find("library").find("packages")
-    packages = {p.attrib["name"]: p for p in x_packages}
+    packages = lbr_packages(fn)
     for k, v in packages.items():
         if k == package:
             conn = {}
@@ -87,10 +104,7 @@ class EaglePart(PCBPart):
         self.libraryfile = libraryfile
         self.partname = partname
         self.use_silk = True
-        tree = ET.parse(self.libraryfile)
-        root = tree.getroot()
-        x_packages = root.find("drawing").find("library").find("packages")
-        packages = {p.attrib["name"]: p for p in x_packages}
+        packages = lbr_packages(self.libraryfile)
         if self.partname not in packages:
             raise ValueError("Part not found in library")
         self.pa = packages[self.partname]
@@ -112,7 +126,8 @@ class EaglePart(PCBPart):
         attr = {}
         self.labels = {}
         for c in self.pa:
-            attr = c.attrib
+            # copied since the package elements are shared by every instance
+            attr = dict(c.attrib)
             if c.tag == "text" and attr["layer"] in DOC_LAYERS:
                 if self.debug:
                     self._print_attr(c.tag, attr)
@@ -188,7 +203,8 @@ class EaglePart(PCBPart):
                 dc.board.add_drill(dc.xy, drill)
                 shape = attr.get("shape", "circle")
                 if shape in ["long", "circle", "octagon", "square"]:
-                    n = {"long": 60, "circle": 60, "octagon": 8, "square": 4}[shape]
+                    # round pads get the number of sides of their arc_error
+                    n = {"octagon": 8, "square": 4}.get(shape)
                     if shape == "square":
                         diameter /= 1.1
                     attr["shape"] = "circle"
@@ -204,12 +220,17 @@ class EaglePart(PCBPart):
             g = so.linemerge(ls[LAYER_DIMENSION])
             self.board.layers["GML"].add(g)
 
+        q = self.board.drc.quad_segs(self.board.drc.silk_width / 2)
         if ls[LAYER_TDOCU]:
-            g = so.linemerge(ls[LAYER_TDOCU]).buffer(self.board.drc.silk_width / 2)
+            g = so.linemerge(ls[LAYER_TDOCU]).buffer(
+                self.board.drc.silk_width / 2, quad_segs=q
+            )
             self.board.get_docu_layer(side=self.side).add(g)
 
         if self.use_silk and ls[LAYER_TPLACE]:
-            g = so.linemerge(ls[LAYER_TPLACE]).buffer(self.board.drc.silk_width / 2)
+            g = so.linemerge(ls[LAYER_TPLACE]).buffer(
+                self.board.drc.silk_width / 2, quad_segs=q
+            )
             self.board.get_silk_layer(side=self.side).add(g)
 
         if len(self.labels) > 0:
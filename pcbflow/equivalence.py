@@ -0,0 +1,349 @@
+#! /usr/bin/env python3
+#
+# Geometric equivalence of boards
+#
+
+import gzip
+import json
+
+import numpy as np
+import shapely
+import shapely.geometry as sg
+import shapely.ops as so
+
+from pcbflow import *
+
+# allowed area of the symmetric difference of two layers in mm^2
+AREA_TOLERANCE = 1e-6
+# allowed Hausdorff distance between two layers in mm
+DISTANCE_TOLERANCE = MICRONS(1)
+# pixel size of the raster comparison in mm
+RASTER_RESOLUTION = 0.05
+
+
+class LayerDifference:
+    """A region where one layer of two boards differs. area is the area of
+    the symmetric difference in the region (estimated from the differing
+    pixels if only the raster comparison was run) and distance is the
+    Hausdorff distance between the layers within it."""
+
+    def __init__(self, layer, bounds, area, distance, pixels=0):
+        self.layer = layer
+        self.bounds = bounds
+        self.area = area
+        self.distance = distance
+        self.pixels = pixels
+
+    def __str__(self):
+        s = "layer %s differs in (%.3f, %.3f)-(%.3f, %.3f) area %.6f mm2" % (
+            self.layer,
+            *self.bounds,
+            self.area,
+        )
+        if self.distance is not None:
+            s += " distance %.6f mm" % (self.distance)
+        if self.pixels:
+            s += " (%d pixels)" % (self.pixels)
+        return s
+
+
+class EquivalenceReport:
+    """The result of compare_boards: the regions where layers differ and the
+    holes which are only on one board."""
+
+    def __init__(self):
+        self.differences = []
+        # {"PTH" or "NPTH": (holes only on a, holes only on b)}
+        self.drills = {}
+
+    @property
+    def ok(self):
+        return not self.differences and not self.drills
+
+    def __bool__(self):
+        return self.ok
+
+    def __str__(self):
+        if self.ok:
+            return "boards are equivalent"
+        s = [str(d) for d in self.differences]
+        for kind, (only_a, only_b) in self.drills.items():
+            for d, xy in only_a:
+                s.append("%s hole %.3f at (%.4f, %.4f) only on a" % (kind, d, *xy))
+            for d, xy in only_b:
+                s.append("%s hole %.3f at (%.4f, %.4f) only on b" % (kind, d, *xy))
+        return "\n".join(s)
+
+
+def layer_shape(layer):
+    """Returns the geometry of a layer as it is written to the outputs"""
+    if layer.is_outline:
+        return so.unary_union([sg.LineString(ls.coords) for ls in layer.lines])
+    return layer.preview(as_collection=True)
+
+
+def rasterize(g, bounds, res=RASTER_RESOLUTION):
+    """Returns a boolean array of the pixels of size res within bounds
+    whose centres are covered by g (lines are drawn res wide)"""
+    x0, y0, x1, y1 = bounds
+    xs = x0 + res * (np.arange(max(1, int(np.ceil((x1 - x0) / res)))) + 0.5)
+    ys = y0 + res * (np.arange(max(1, int(np.ceil((y1 - y0) / res)))) + 0.5)
+    if g.is_empty:
+        return np.zeros((len(ys), len(xs)), dtype=bool)
+    if g.area == 0:
+        g = g.buffer(res / 2)
+    shapely.prepare(g)
+    x, y = np.meshgrid(xs, ys)
+    return shapely.contains_xy(g, x, y)
+
+
+def raster_xor(a, b, bounds, res=RASTER_RESOLUTION):
+    """Returns the pixels covered by exactly one of a and b"""
+    return np.logical_xor(rasterize(a, bounds, res), rasterize(b, bounds, res))
+
+
+def _pixels(xor, bounds, res):
+    # centres of the differing pixels
+    rows, cols = np.nonzero(xor)
+    return bounds[0] + res * (cols + 0.5), bounds[1] + res * (rows + 0.5)
+
+
+def _count(pixels, box):
+    # number of pixels with centres within box
+    x, y = pixels
+    x0, y0, x1, y1 = box
+    return int(((x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)).sum())
+
+
+def _regions(pixels, res):
+    # bounds of each group of touching differing pixels
+    x, y = pixels
+    g = so.unary_union(shapely.box(x - res / 2, y - res / 2, x + res / 2, y + res / 2))
+    return [p.bounds for p in getattr(g, "geoms", [g])]
+
+
+def _distance(a, b, box):
+    # Hausdorff distance of a and b clipped to box
+    ca, cb = a.intersection(box), b.intersection(box)
+    if ca.is_empty or cb.is_empty:
+        return float("inf") if ca.is_empty != cb.is_empty else 0.0
+    return ca.hausdorff_distance(cb)
+
+
+def _edges(g):
+    # (n, 4) array of the boundary edges of g, each with its end points in
+    # a canonical order
+    rings = []
+    for p in shapely.get_parts(g):
+        if p.geom_type == "Polygon":
+            rings.extend(shapely.get_rings(p))
+        elif p.geom_type in ("LineString", "LinearRing"):
+            rings.append(p)
+    if not rings:
+        return np.zeros((0, 4))
+    xy, index = shapely.get_coordinates(rings, return_index=True)
+    same = index[:-1] == index[1:]
+    e = np.hstack([xy[:-1][same], xy[1:][same]])
+    swap = (e[:, 0] > e[:, 2]) | ((e[:, 0] == e[:, 2]) & (e[:, 1] > e[:, 3]))
+    e[swap] = e[swap][:, [2, 3, 0, 1]]
+    return e
+
+
+def _keys(e):
+    # one comparable value for each edge
+    return np.ascontiguousarray(e).view(np.dtype((np.void, 4 * e.itemsize))).ravel()
+
+
+def changed_region(a, b, res=RASTER_RESOLUTION):
+    """Returns the region outside of which geometries a and b are the same.
+
+    Only the edges which are on the boundary of one of a and b but not the
+    other can bound their symmetric difference, so it lies within the
+    envelopes of the connected groups of these edges. Each envelope is
+    grown by res so that slivers along the edges are inside it too.
+    """
+    ea, eb = _edges(a), _edges(b)
+    ka, kb = _keys(ea), _keys(eb)
+    e = np.vstack([ea[~np.isin(ka, kb)], eb[~np.isin(kb, ka)]])
+    if not len(e):
+        return sg.Polygon()
+    lines = shapely.linestrings(e.reshape(-1, 2, 2))
+    groups = so.unary_union(shapely.buffer(lines, res, quad_segs=1))
+    boxes = shapely.envelope(shapely.get_parts(groups))
+    return so.unary_union(shapely.buffer(boxes, res, join_style="mitre"))
+
+
+def compare_layers(
+    name,
+    a,
+    b,
+    area_tolerance=AREA_TOLERANCE,
+    distance_tolerance=DISTANCE_TOLERANCE,
+    res=RASTER_RESOLUTION,
+    exact=True,
+):
+    """Returns a list of LayerDifference for the regions where geometries
+    a and b of layer name differ.
+
+    Unless exact is True, a and b are only rasterized with pixels of size
+    res and the groups of differing pixels are reported, which misses
+    differences smaller than a pixel. Otherwise a and b are clipped to
+    their changed_region and the symmetric difference within it is split
+    into separate regions. A region differs if its area exceeds
+    area_tolerance or the Hausdorff distance of the layers within it
+    exceeds distance_tolerance.
+    """
+    if a.equals_exact(b, 0):
+        return []
+    if not exact:
+        x0, y0, x1, y1 = so.unary_union([a, b]).bounds
+        bounds = (x0 - res, y0 - res, x1 + res, y1 + res)
+        pixels = _pixels(raster_xor(a, b, bounds, res), bounds, res)
+        found = []
+        for r in _regions(pixels, res):
+            n = _count(pixels, r)
+            found.append(LayerDifference(name, r, n * res * res, None, n))
+        return found
+    region = changed_region(a, b, res)
+    if region.is_empty:
+        return []
+    diff = a.intersection(region).symmetric_difference(b.intersection(region))
+    if a.area == 0 and b.area == 0:
+        # outlines and other line work only have a distance
+        parts = [diff] if not diff.is_empty else []
+    else:
+        grown = diff.buffer(distance_tolerance)
+        parts = [diff.intersection(p) for p in getattr(grown, "geoms", [grown])]
+    found = []
+    for part in parts:
+        if part.is_empty:
+            continue
+        px0, py0, px1, py1 = part.bounds
+        box = sg.box(px0 - res, py0 - res, px1 + res, py1 + res)
+        area = part.area
+        distance = _distance(a, b, box)
+        if area > area_tolerance or distance > distance_tolerance:
+            found.append(LayerDifference(name, part.bounds, area, distance))
+    return found
+
+
+def _drill_set(holes):
+    return {(d, tuple(xy)) for d, xys in holes.items() for xy in xys}
+
+
+def board_shapes(board):
+    """Returns the layer geometry of board as written to the outputs and
+    the sets of its plated and non-plated (diameter, (x, y)) holes
+
+    :returns: ({layer name: geometry}, {"PTH" or "NPTH": set of holes})
+    """
+    shapes = {name: layer_shape(layer) for name, layer in board.layers.items()}
+    drills = {"PTH": _drill_set(board.holes), "NPTH": _drill_set(board.npth)}
+    return shapes, drills
+
+
+def _compare(a, b, area_tolerance, distance_tolerance, res, exact):
+    # compares the board_shapes of two boards
+    (shapes_a, drills_a), (shapes_b, drills_b) = a, b
+    report = EquivalenceReport()
+    for name in sorted(set(shapes_a) | set(shapes_b)):
+        ga = shapes_a.get(name, sg.Polygon())
+        gb = shapes_b.get(name, sg.Polygon())
+        report.differences.extend(
+            compare_layers(name, ga, gb, area_tolerance, distance_tolerance, res, exact)
+        )
+    for kind in ("PTH", "NPTH"):
+        sa_, sb_ = drills_a[kind], drills_b[kind]
+        if sa_ != sb_:
+            report.drills[kind] = (sorted(sa_ - sb_), sorted(sb_ - sa_))
+    return report
+
+
+def compare_boards(
+    a,
+    b,
+    area_tolerance=AREA_TOLERANCE,
+    distance_tolerance=DISTANCE_TOLERANCE,
+    res=RASTER_RESOLUTION,
+    exact=True,
+):
+    """Compares the layer geometry and drills of two boards, typically the
+    same design built with a reference and an optimized configuration.
+    Layers are compared with compare_layers; plated and non-plated holes
+    must match exactly.
+
+    :param a: reference Board
+    :param b: Board to compare with it
+    :param area_tolerance: allowed symmetric difference area in mm^2
+    :param distance_tolerance: allowed Hausdorff distance in mm
+    :param res: pixel size of the raster comparison in mm
+    :param exact: compare the vector geometry rather than only the
+    rasterized layers
+    :returns: :obj:`EquivalenceReport`
+    """
+    return _compare(
+        board_shapes(a),
+        board_shapes(b),
+        area_tolerance,
+        distance_tolerance,
+        res,
+        exact,
+    )
+
+
+def save_reference(board, fn):
+    """Writes the layer geometry and drills of a known-good build of board
+    to fn, as gzipped JSON with the layers as hex WKB, so that later builds
+    can be checked against it with compare_reference.
+
+    :param board: Board to save
+    :param fn: reference file name
+    """
+    shapes, drills = board_shapes(board)
+    doc = {
+        "layers": {name: g.wkb_hex for name, g in shapes.items()},
+        "drills": {
+            kind: [[d, list(xy)] for d, xy in sorted(holes)]
+            for kind, holes in drills.items()
+        },
+    }
+    with gzip.open(fn, "wt") as f:
+        json.dump(doc, f, indent=0)
+
+
+def load_reference(fn):
+    """Returns the layer geometry and drills stored by save_reference in the
+    form of board_shapes"""
+    with gzip.open(fn, "rt") as f:
+        doc = json.load(f)
+    shapes = {name: shapely.from_wkb(wkb) for name, wkb in doc["layers"].items()}
+    drills = {
+        kind: {(d, tuple(xy)) for d, xy in holes}
+        for kind, holes in doc["drills"].items()
+    }
+    return shapes, drills
+
+
+def compare_reference(
+    board,
+    fn,
+    area_tolerance=AREA_TOLERANCE,
+    distance_tolerance=DISTANCE_TOLERANCE,
+    res=RASTER_RESOLUTION,
+    exact=True,
+):
+    """Compares the layer geometry and drills of board with a reference
+    written by save_reference, as compare_boards does.
+
+    :param board: Board to check
+    :param fn: reference file name
+    :returns: :obj:`EquivalenceReport`
+    """
+    return _compare(
+        load_reference(fn),
+        board_shapes(board),
+        area_tolerance,
+        distance_tolerance,
+        res,
+        exact,
+    )
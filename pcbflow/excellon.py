@@ -16,18 +16,33 @@ M71
 
 
 def excellon(f, holes, function):
-    tools = sorted(holes.keys())
+    excellon_repeat(f, [(holes, 1, 1, 0, 0)], function)
+
+
+def excellon_repeat(f, patterns, function):
+    """Writes the drill hits of several hole patterns, each repeated in an
+    array. Rows of hits are written as one hit and a repeat (R) command.
+
+    :param patterns: list of (holes, nx, ny, dx, dy) where holes is a
+    dict of lists of hole centres keyed by diameter
+    """
+    tools = sorted({d for p in patterns for d in p[0]})
     p0 = "".join(["T%dC%.3f\n" % (i + 2, d) for (i, d) in enumerate(tools)])
 
     def number(n):
         i = int(round(n * 1000))
         return "%03d" % i
 
-    def hits(i, xys):
-        return ("T%d\n" % (i + 2)) + "".join(
-            ["X%sY%s\n" % (number(xy[0]), number(xy[1])) for xy in xys]
-        )
+    def hits(i, d):
+        s = ["T%d\n" % (i + 2)]
+        for holes, nx, ny, dx, dy in patterns:
+            for x, y in holes.get(d, []):
+                for j in range(ny):
+                    s.append("X%sY%s\n" % (number(x), number(y + j * dy)))
+                    if nx > 1:
+                        s.append("R%dX%s\n" % (nx - 1, number(dx)))
+        return "".join(s)
 
     # f.write("%%TF.FileFunction,%s*%%\n" % function)
-    p1 = "".join([hits(i, holes[t]) for (i, t) in enumerate(tools)])
+    p1 = "".join([hits(i, t) for (i, t) in enumerate(tools)])
     f.write(preamble.format(p0, p1))
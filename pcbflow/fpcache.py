@@ -0,0 +1,246 @@
+#! /usr/bin/env python3
+#
+# Footprint library caching
+#
+
+import os
+import hashlib
+import pickle
+from collections import OrderedDict
+
+from . import perf
+
+CACHE_MAGIC = b"PCBFLOWFP"
+CACHE_FORMAT = 1
+INDEX_MAGIC = b"PCBFLOWIX"
+INDEX_FORMAT = 1
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "PCBFLOW_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "pcbflow")
+)
+
+
+def file_signature(fn):
+    """Returns a (path, size, mtime) tuple which identifies a particular
+    revision of a file on disk."""
+    st = os.stat(fn)
+    return (os.path.abspath(fn), st.st_size, st.st_mtime_ns)
+
+
+def load_pickle(fn, magic):
+    """Returns the object stored in fn with write_pickle, or None if the file
+    is missing, unreadable or was not written with the same magic bytes."""
+    try:
+        with open(fn, "rb") as f:
+            if f.read(len(magic)) != magic:
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+        return None
+
+
+def write_pickle(fn, magic, obj):
+    """Atomically writes obj to fn prefixed with magic bytes. Failures are
+    ignored since a read-only or full cache directory should never stop a
+    build."""
+    tmp = "%s.%d.tmp" % (fn, os.getpid())
+    try:
+        os.makedirs(os.path.dirname(fn), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(magic)
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, fn)
+    except OSError:
+        if os.path.isfile(tmp):
+            os.remove(tmp)
+
+
+class FootprintCache:
+    """In-memory LRU cache of parsed footprint records.
+    Records are keyed by file path, size and modification time so that an
+    edited footprint file is always re-parsed. If a cache directory is
+    specified, records are also persisted as compact binary files so that
+    subsequent runs of a board script do not need to re-parse anything.
+    """
+
+    def __init__(self, maxsize=512, cache_dir=None):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+        self._records = OrderedDict()
+
+    def __len__(self):
+        return len(self._records)
+
+    def clear(self):
+        """Clears the in-memory records (the on-disk store is left intact)."""
+        self._records.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def set_cache_dir(self, path):
+        """Enables the on-disk store in directory path (None disables it)."""
+        self.cache_dir = path
+
+    def get(self, fn, loader):
+        """Returns the parsed record for file fn, calling loader(fn) to parse
+        the file only if a valid cached record cannot be found."""
+        if not self.enabled:
+            return loader(fn)
+        sig = file_signature(fn)
+        record = self._records.get(sig)
+        if record is not None:
+            self._records.move_to_end(sig)
+            self.hits += 1
+            perf.count("footprint cache hits")
+            return record
+        record = self._load(sig)
+        if record is not None:
+            self.hits += 1
+            perf.count("footprint cache hits")
+        else:
+            self.misses += 1
+            perf.count("footprint cache misses")
+            record = loader(fn)
+            self._save(sig, record)
+        self._records[sig] = record
+        while len(self._records) > self.maxsize:
+            self._records.popitem(last=False)
+        return record
+
+    def _record_path(self, sig):
+        key = hashlib.sha1(sig[0].encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, key + ".fpc")
+
+    def _load(self, sig):
+        if self.cache_dir is None:
+            return None
+        data = load_pickle(self._record_path(sig), CACHE_MAGIC)
+        if data is None:
+            return None
+        fmt, fsig, record = data
+        if fmt != CACHE_FORMAT or tuple(fsig) != sig:
+            return None
+        return record
+
+    def _save(self, sig, record):
+        if self.cache_dir is None:
+            return
+        write_pickle(self._record_path(sig), CACHE_MAGIC, (CACHE_FORMAT, sig, record))
+
+
+footprint_cache = FootprintCache(cache_dir=os.environ.get("PCBFLOW_FP_CACHE", None))
+
+
+class FootprintIndex:
+    """Persistent index of the KiCad footprint files found under a root
+    directory. Footprints can be looked up either as "Library:Footprint"
+    (where Library is the name of the .pretty directory) or by their bare
+    footprint name. The index is stored on disk and refreshed incrementally:
+    only directories whose modification time has changed are re-scanned.
+    """
+
+    def __init__(self, root, index_file=None):
+        self.root = os.path.abspath(os.path.expanduser(root))
+        if index_file is None:
+            key = hashlib.sha1(self.root.encode("utf-8")).hexdigest()[:16]
+            index_file = os.path.join(DEFAULT_CACHE_DIR, "fpindex-%s.idx" % (key))
+        self.index_file = index_file
+        # directory path -> (mtime, footprint file names, sub-directory names)
+        self.dirs = {}
+        self.by_name = {}
+        self.by_lib_name = {}
+        self._load()
+        self.refresh()
+
+    def __len__(self):
+        return len(self.by_lib_name)
+
+    def __contains__(self, name):
+        return self.find(name) is not None
+
+    def _load(self):
+        data = load_pickle(self.index_file, INDEX_MAGIC)
+        if data is None:
+            return
+        fmt, root, dirs = data
+        if fmt == INDEX_FORMAT and root == self.root:
+            self.dirs = dirs
+
+    def _scan(self, path):
+        files = []
+        subdirs = []
+        with os.scandir(path) as it:
+            for e in it:
+                if e.is_dir():
+                    subdirs.append(e.name)
+                elif e.name.endswith(".kicad_mod"):
+                    files.append(e.name)
+        return (sorted(files), sorted(subdirs))
+
+    def refresh(self):
+        """Re-scans any directories which have changed since the index was
+        last built and returns True if the index was modified."""
+        changed = False
+        seen = set()
+        stack = [self.root]
+        while stack:
+            path = stack.pop()
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            entry = self.dirs.get(path)
+            if entry is None or entry[0] != mtime:
+                try:
+                    entry = (mtime, *self._scan(path))
+                except OSError:
+                    continue
+                self.dirs[path] = entry
+                changed = True
+            seen.add(path)
+            stack.extend([os.path.join(path, d) for d in entry[2]])
+        for path in set(self.dirs) - seen:
+            del self.dirs[path]
+            changed = True
+        if changed:
+            write_pickle(
+                self.index_file, INDEX_MAGIC, (INDEX_FORMAT, self.root, self.dirs)
+            )
+        if changed or not self.by_lib_name:
+            self._build_lookups()
+        return changed
+
+    def _build_lookups(self):
+        self.by_name = {}
+        self.by_lib_name = {}
+        for path in sorted(self.dirs):
+            files = self.dirs[path][1]
+            if not files:
+                continue
+            lib = os.path.basename(path)
+            if lib.endswith(".pretty"):
+                lib = lib[: -len(".pretty")]
+            for fn in files:
+                name = fn[: -len(".kicad_mod")]
+                fullpath = os.path.join(path, fn)
+                self.by_lib_name.setdefault("%s:%s" % (lib, name), fullpath)
+                self.by_name.setdefault(name, fullpath)
+
+    def find(self, name):
+        """Returns the path of footprint name ("Library:Footprint" or just
+        "Footprint") or None if it is not in the index."""
+        if name.endswith(".kicad_mod"):
+            name = name[: -len(".kicad_mod")]
+        if ":" in name:
+            path = self.by_lib_name.get(name, None)
+            if path is not None:
+                return path
+            name = name.split(":", 1)[1]
+        return self.by_name.get(name, None)
+
+    def paths(self):
+        """Returns a sorted list of every footprint file path in the index"""
+        return sorted(self.by_lib_name.values())
@@ -18,6 +18,15 @@ G01*
 """
 
 
+def gerber_filename(assetpath, name):
+    # the documentation layers are written as .GBR files
+    if name == "GTD":
+        return assetpath + "_top.GBR"
+    if name == "GBD":
+        return assetpath + "_bot.GBR"
+    return assetpath + "." + name
+
+
 class Gerber:
     def __init__(self, f, desc):
         self.f = f
@@ -50,5 +59,12 @@ class Gerber:
         self.f.write("G37*\n")
         self.f.write("\n")
 
+    def step_repeat(self, nx, ny, dx, dy):
+        # the following objects are repeated nx by ny times, dx and dy apart
+        self.f.write("%%SRX%dY%dI%.4fJ%.4f*%%\n" % (nx, ny, dx, dy))
+
+    def end_step_repeat(self):
+        self.f.write("%SR*%\n")
+
     def finish(self):
         self.f.write("M02*\n")
@@ -4,10 +4,17 @@
 #
 
 
+import os
+from collections.abc import Mapping
+from functools import lru_cache
+
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 
+# Glyph data in the original Hershey encoding, one glyph per line
+HERSHEY_FILE = os.path.join(os.path.dirname(__file__), "hershey-occidental.dat")
+
 
 def char2val(c):  # data is stored as signed bytes relative to ASCII R
     return ord(c) - ord("R")
@@ -28,7 +35,6 @@ def hersheyparse(dat):
         #     Y coordinates **increase** downwards
 
         assert len(s) % 2 == 0
-        line = map(None, *[iter(map(char2val, list(s)))] * 2)
         coords = [char2val(c) for c in s]
         line = list(zip(coords[0::2], coords[1::2]))
         lines.append(line)
@@ -44,6 +50,39 @@ def hersheyparse(dat):
     return (glyph["charcode"], glyph)
 
 
+class HersheyFont(Mapping):
+    """Read-only mapping of Hershey character code to glyph dict. The glyph
+    file is only read when the first glyph is requested and each glyph is
+    decoded on demand and then memoized."""
+
+    def __init__(self, fn):
+        self.fn = fn
+        self._index = None
+        self._glyphs = {}
+
+    def _lines(self):
+        if self._index is None:
+            with open(self.fn, "r") as f:
+                self._index = {int(l[:5]): l.rstrip("\n") for l in f if l.strip()}
+        return self._index
+
+    def __getitem__(self, code):
+        glyph = self._glyphs.get(code, None)
+        if glyph is None:
+            glyph = hersheyparse(self._lines()[code])[1]
+            self._glyphs[code] = glyph
+        return glyph
+
+    def __iter__(self):
+        return iter(self._lines())
+
+    def __len__(self):
+        return len(self._lines())
+
+
+hf = HersheyFont(HERSHEY_FILE)
+
+
 def plline(l):
     (ucode, h, _) = [int(i, 0) for i in l[:-1].split(",")]
     return (unichr(ucode), h)
@@ -79,19 +118,27 @@ codes = (
 )
 
 
+@lru_cache(maxsize=None)
+def glyph_geometry(code):
+    """Returns the unioned centreline geometry of Hershey glyph code"""
+    return so.unary_union([sg.LineString(l) for l in hf[code]["lines"]])
+
+
 def char(c):
-    lis = hf[codes[ord(c)]]["lines"]
-    return so.unary_union([sg.LineString(l) for l in lis])
+    return glyph_geometry(codes[ord(c)])
 
 
+@lru_cache(maxsize=1024)
 def chars(s):
+    """Returns the laid out centreline geometry of string s in Hershey
+    font units. The returned geometry is shared and must not be modified."""
     x = 0
     o = []
     for c in s:
-        glyph = hf[codes[ord(c)]]
+        code = codes[ord(c)]
+        glyph = hf[code]
         x -= glyph["left"]
-        go = so.unary_union([sg.LineString(l) for l in glyph["lines"]])
-        o.append(sa.translate(go, x, 0))
+        o.append(sa.translate(glyph_geometry(code), x, 0))
         x += glyph["right"]
     return so.unary_union(o)
 
@@ -99,6750 +146,35 @@ def chars(s):
 sf = 1 / 24
 
 
-def text(x, y, s, scale=1.0, side="top", linewidth=0.08):
+# Text outlines are computed once at the origin for each combination of
+# string, scale, side and line width and then translated into position.
+# Mirroring (about the text's own centre) and buffering commute with the
+# final translation so the results are identical.
+@lru_cache(maxsize=4096)
+def _outline(mode, s, scale, side, linewidth, quad_segs):
     o = chars(s)
     o = sa.scale(o, sf * scale, -sf * scale, origin=(0, 0))
-    cx = o.centroid.x
-    cy = o.centroid.y
-    # (cx, cy) = (0, 0)
-    o = sa.translate(o, -cx + x, -cy + y)
-    if side == "bottom":
-        o = sa.scale(o, -1.0, 1.0)
-    return o.buffer(scale * linewidth / 2)
-
-
-def ctext(x, y, s, side="top", linewidth=0.08):
-    o = chars(s)
-    o = sa.scale(o, sf, -sf, origin=(0, 0))
-    cx = o.envelope.centroid.x
-    cy = o.envelope.centroid.y
-    o = sa.translate(o, -cx + x, -cy + y)
+    if mode == "text":
+        c = o.centroid
+        o = sa.translate(o, -c.x, -c.y)
+    elif mode == "ctext":
+        c = o.envelope.centroid
+        o = sa.translate(o, -c.x, -c.y)
     if side == "bottom":
         o = sa.scale(o, -1.0, 1.0)
-    return o.buffer(linewidth / 2)
+    return o.buffer(scale * linewidth / 2, quad_segs=quad_segs)
 
 
-def ltext(x, y, s, scale=1.0, side="top", linewidth=0.08):
-    o = chars(s)
-    o = sa.scale(o, scale * sf, -sf * scale, origin=(0, 0))
-    o = sa.translate(o, x, y)
-    if side == "bottom":
-        o = sa.scale(o, -1.0, 1.0)
-    return o.buffer(scale * linewidth / 2)
+def text(x, y, s, scale=1.0, side="top", linewidth=0.08, quad_segs=16):
+    o = _outline("text", s, scale, side, linewidth, quad_segs)
+    return sa.translate(o, x, y)
 
 
-if __name__ == "__main__":
-    hf = dict([hersheyparse(l[:-1]) for l in open("hershey-occidental.dat")])
-    print("hf = " + repr(hf))
+def ctext(x, y, s, side="top", linewidth=0.08, quad_segs=16):
+    o = _outline("ctext", s, 1.0, side, linewidth, quad_segs)
+    return sa.translate(o, x, y)
 
-# fmt: off
-hf = {1: {'charcode': 1, 'left': -5, 'right': 5, 'lines': [[(0, -5),
-(-4, 4)], [(0, -5), (4, 4)], [(-2, 1), (2, 1)]]}, 2: {'charcode': 2,
-'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(-3, -5), (1, -5),
-(3, -4), (3, -2), (1, -1)], [(-3, -1), (1, -1), (3, 0), (3, 3), (1, 4),
-(-3, 4)]]}, 3: {'charcode': 3, 'left': -5, 'right': 6, 'lines': [[(4,
--4), (2, -5), (0, -5), (-2, -4), (-3, -2), (-3, 1), (-2, 3), (0, 4),
-(2, 4), (4, 3)]]}, 4: {'charcode': 4, 'left': -5, 'right': 5, 'lines':
-[[(-3, -5), (-3, 4)], [(-3, -5), (0, -5), (2, -4), (3, -2), (3, 1),
-(2, 3), (0, 4), (-3, 4)]]}, 5: {'charcode': 5, 'left': -5, 'right': 5,
-'lines': [[(-3, -5), (-3, 4)], [(-3, -5), (3, -5)], [(-3, -1), (1, -1)],
-[(-3, 4), (3, 4)]]}, 6: {'charcode': 6, 'left': -5, 'right': 4, 'lines':
-[[(-3, -5), (-3, 4)], [(-3, -5), (3, -5)], [(-3, -1), (1, -1)]]}, 7:
-{'charcode': 7, 'left': -5, 'right': 6, 'lines': [[(4, -4), (2, -5),
-(0, -5), (-2, -4), (-3, -2), (-3, 1), (-2, 3), (0, 4), (2, 4), (4, 3),
-(4, 0)], [(1, 0), (4, 0)]]}, 8: {'charcode': 8, 'left': -5, 'right':
-5, 'lines': [[(-3, -5), (-3, 4)], [(3, -5), (3, 4)], [(-3, -1), (3,
--1)]]}, 9: {'charcode': 9, 'left': -2, 'right': 2, 'lines': [[(0, -5),
-(0, 4)]]}, 10: {'charcode': 10, 'left': -4, 'right': 3, 'lines': [[(1,
--5), (1, 2), (0, 4), (-2, 4), (-3, 2), (-3, 1)]]}, 11: {'charcode': 11,
-'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(3, -5), (-3,
-1)], [(-1, -1), (3, 4)]]}, 12: {'charcode': 12, 'left': -5, 'right': 4,
-'lines': [[(-3, -5), (-3, 4)], [(-3, 4), (3, 4)]]}, 13: {'charcode': 13,
-'left': -6, 'right': 6, 'lines': [[(-4, -5), (-4, 4)], [(-4, -5), (0, 4)],
-[(4, -5), (0, 4)], [(4, -5), (4, 4)]]}, 14: {'charcode': 14, 'left': -5,
-'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(-3, -5), (3, 4)], [(3, -5),
-(3, 4)]]}, 15: {'charcode': 15, 'left': -5, 'right': 6, 'lines': [[(0,
--5), (-2, -4), (-3, -2), (-3, 1), (-2, 3), (0, 4), (1, 4), (3, 3), (4, 1),
-(4, -2), (3, -4), (1, -5), (0, -5)]]}, 16: {'charcode': 16, 'left': -5,
-'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(-3, -5), (1, -5), (3, -4),
-(3, -1), (1, 0), (-3, 0)]]}, 17: {'charcode': 17, 'left': -5, 'right': 6,
-'lines': [[(0, -5), (-2, -4), (-3, -2), (-3, 1), (-2, 3), (0, 4), (1, 4),
-(3, 3), (4, 1), (4, -2), (3, -4), (1, -5), (0, -5)], [(1, 2), (4, 5)]]},
-18: {'charcode': 18, 'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3,
-4)], [(-3, -5), (1, -5), (3, -4), (3, -1), (1, 0), (-3, 0)], [(0, 0), (3,
-4)]]}, 19: {'charcode': 19, 'left': -5, 'right': 5, 'lines': [[(3, -4),
-(1, -5), (-1, -5), (-3, -4), (-3, -3), (-2, -2), (2, 0), (3, 1), (3, 3),
-(1, 4), (-1, 4), (-3, 3)]]}, 20: {'charcode': 20, 'left': -5, 'right': 5,
-'lines': [[(0, -5), (0, 4)], [(-4, -5), (4, -5)]]}, 21: {'charcode': 21,
-'left': -5, 'right': 6, 'lines': [[(-3, -5), (-3, 1), (-2, 3), (0, 4), (1,
-4), (3, 3), (4, 1), (4, -5)]]}, 22: {'charcode': 22, 'left': -5, 'right':
-5, 'lines': [[(-4, -5), (0, 4)], [(4, -5), (0, 4)]]}, 23: {'charcode':
-23, 'left': -6, 'right': 6, 'lines': [[(-4, -5), (-2, 4)], [(0, -5),
-(-2, 4)], [(0, -5), (2, 4)], [(4, -5), (2, 4)]]}, 24: {'charcode': 24,
-'left': -5, 'right': 5, 'lines': [[(-3, -5), (3, 4)], [(3, -5), (-3,
-4)]]}, 25: {'charcode': 25, 'left': -5, 'right': 5, 'lines': [[(-4, -5),
-(0, -1), (0, 4)], [(4, -5), (0, -1)]]}, 26: {'charcode': 26, 'left': -5,
-'right': 5, 'lines': [[(3, -5), (-3, 4)], [(-3, -5), (3, -5)], [(-3, 4),
-(3, 4)]]}, 27: {'charcode': 27, 'left': -5, 'right': 5, 'lines': [[(0,
--5), (-4, 4)], [(0, -5), (4, 4)], [(-2, 1), (2, 1)]]}, 28: {'charcode':
-28, 'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(-3, -5),
-(1, -5), (3, -4), (3, -2), (1, -1)], [(-3, -1), (1, -1), (3, 0), (3, 3),
-(1, 4), (-3, 4)]]}, 29: {'charcode': 29, 'left': -5, 'right': 4, 'lines':
-[[(-3, -5), (-3, 4)], [(-3, -5), (3, -5)]]}, 30: {'charcode': 30, 'left':
--5, 'right': 5, 'lines': [[(0, -5), (-4, 4)], [(0, -5), (4, 4)], [(-4,
-4), (4, 4)]]}, 31: {'charcode': 31, 'left': -5, 'right': 5, 'lines':
-[[(-3, -5), (-3, 4)], [(-3, -5), (3, -5)], [(-3, -1), (1, -1)], [(-3,
-4), (3, 4)]]}, 32: {'charcode': 32, 'left': -5, 'right': 5, 'lines':
-[[(3, -5), (-3, 4)], [(-3, -5), (3, -5)], [(-3, 4), (3, 4)]]}, 33:
-{'charcode': 33, 'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3, 4)],
-[(3, -5), (3, 4)], [(-3, -1), (3, -1)]]}, 34: {'charcode': 34, 'left': -5,
-'right': 6, 'lines': [[(0, -5), (-2, -4), (-3, -2), (-3, 1), (-2, 3),
-(0, 4), (1, 4), (3, 3), (4, 1), (4, -2), (3, -4), (1, -5), (0, -5)],
-[(-1, -1), (2, 0)], [(2, -1), (-1, 0)]]}, 35: {'charcode': 35, 'left':
--2, 'right': 2, 'lines': [[(0, -5), (0, 4)]]}, 36: {'charcode': 36,
-'left': -5, 'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(3, -5), (-3,
-1)], [(-1, -1), (3, 4)]]}, 37: {'charcode': 37, 'left': -5, 'right': 5,
-'lines': [[(0, -5), (-4, 4)], [(0, -5), (4, 4)]]}, 38: {'charcode': 38,
-'left': -6, 'right': 6, 'lines': [[(-4, -5), (-4, 4)], [(-4, -5), (0, 4)],
-[(4, -5), (0, 4)], [(4, -5), (4, 4)]]}, 39: {'charcode': 39, 'left': -5,
-'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(-3, -5), (3, 4)], [(3, -5),
-(3, 4)]]}, 40: {'charcode': 40, 'left': -5, 'right': 5, 'lines': [[(-3,
--5), (3, -5)], [(-2, -1), (2, 0)], [(2, -1), (-2, 0)], [(-3, 4), (3,
-4)]]}, 41: {'charcode': 41, 'left': -5, 'right': 6, 'lines': [[(0, -5),
-(-2, -4), (-3, -2), (-3, 1), (-2, 3), (0, 4), (1, 4), (3, 3), (4, 1),
-(4, -2), (3, -4), (1, -5), (0, -5)]]}, 42: {'charcode': 42, 'left': -5,
-'right': 5, 'lines': [[(-3, -5), (-3, 4)], [(3, -5), (3, 4)], [(-3,
--5), (3, -5)]]}, 43: {'charcode': 43, 'left': -5, 'right': 5, 'lines':
-[[(-3, -5), (-3, 4)], [(-3, -5), (1, -5), (3, -4), (3, -1), (1, 0),
-(-3, 0)]]}, 44: {'charcode': 44, 'left': -5, 'right': 5, 'lines': [[(-3,
--5), (0, -1), (-3, 4)], [(-3, -5), (3, -5)], [(-3, 4), (3, 4)]]}, 45:
-{'charcode': 45, 'left': -5, 'right': 5, 'lines': [[(0, -5), (0, 4)],
-[(-4, -5), (4, -5)]]}, 46: {'charcode': 46, 'left': -5, 'right': 5,
-'lines': [[(-4, -3), (-4, -4), (-3, -5), (-2, -5), (-1, -4), (0, -2),
-(0, 4)], [(4, -3), (4, -4), (3, -5), (2, -5), (1, -4), (0, -2)]]},
-47: {'charcode': 47, 'left': -6, 'right': 6, 'lines': [[(0, -5), (0,
-4)], [(-2, -3), (-4, -2), (-4, 1), (-2, 2), (2, 2), (4, 1), (4, -2),
-(2, -3), (-2, -3)]]}, 48: {'charcode': 48, 'left': -5, 'right': 5,
-'lines': [[(-3, -5), (3, 4)], [(3, -5), (-3, 4)]]}, 49: {'charcode':
-49, 'left': -6, 'right': 6, 'lines': [[(0, -5), (0, 4)], [(-4, -3),
-(-3, -2), (-3, 1), (-1, 2), (1, 2), (3, 1), (3, -2), (4, -3)]]}, 50:
-{'charcode': 50, 'left': -5, 'right': 6, 'lines': [[(-3, 4), (-1, 4),
-(-3, 0), (-3, -2), (-2, -4), (0, -5), (1, -5), (3, -4), (4, -2), (4,
-0), (2, 4), (4, 4)]]}, 197: {'charcode': 197, 'left': 0, 'right': 0,
-'lines': [[]]}, 198: {'charcode': 198, 'left': -2, 'right': 2, 'lines':
-[[]]}, 199: {'charcode': 199, 'left': -4, 'right': 4, 'lines': [[]]}, 200:
-{'charcode': 200, 'left': -5, 'right': 5, 'lines': [[(0, -5), (-2, -4),
-(-3, -2), (-3, 1), (-2, 3), (0, 4), (2, 3), (3, 1), (3, -2), (2, -4), (0,
--5)]]}, 201: {'charcode': 201, 'left': -5, 'right': 5, 'lines': [[(-2,
--3), (0, -5), (0, 4)]]}, 202: {'charcode': 202, 'left': -5, 'right': 5,
-'lines': [[(-3, -4), (-1, -5), (1, -5), (3, -4), (3, -2), (2, 0), (-3,
-4), (3, 4)]]}, 203: {'charcode': 203, 'left': -5, 'right': 5, 'lines':
-[[(-3, -4), (-1, -5), (1, -5), (3, -4), (3, -2), (1, -1)], [(0, -1),
-(1, -1), (3, 0), (3, 3), (1, 4), (-1, 4), (-3, 3)]]}, 204: {'charcode':
-204, 'left': -5, 'right': 5, 'lines': [[(1, -5), (1, 4)], [(1, -5), (-4,
-1), (4, 1)]]}, 205: {'charcode': 205, 'left': -5, 'right': 5, 'lines':
-[[(-2, -5), (-3, -1), (-1, -2), (0, -2), (2, -1), (3, 1), (2, 3), (0,
-4), (-1, 4), (-3, 3)], [(-2, -5), (2, -5)]]}, 206: {'charcode': 206,
-'left': -5, 'right': 5, 'lines': [[(2, -5), (0, -5), (-2, -4), (-3, -2),
-(-3, 1), (-2, 3), (0, 4), (2, 3), (3, 1), (2, -1), (0, -2), (-2, -1),
-(-3, 1)]]}, 207: {'charcode': 207, 'left': -5, 'right': 5, 'lines': [[(3,
--5), (-1, 4)], [(-3, -5), (3, -5)]]}, 208: {'charcode': 208, 'left': -5,
-'right': 5, 'lines': [[(-1, -5), (-3, -4), (-3, -2), (-1, -1), (1, -1),
-(3, -2), (3, -4), (1, -5), (-1, -5)], [(-1, -1), (-3, 0), (-3, 3),
-(-1, 4), (1, 4), (3, 3), (3, 0), (1, -1)]]}, 209: {'charcode': 209,
-'left': -5, 'right': 5, 'lines': [[(3, -2), (2, 0), (0, 1), (-2, 0),
-(-3, -2), (-2, -4), (0, -5), (2, -4), (3, -2), (3, 1), (2, 3), (0, 4),
-(-2, 4)]]}, 210: {'charcode': 210, 'left': -2, 'right': 3, 'lines':
-[[(0, 3), (0, 4), (1, 4), (1, 3), (0, 3)]]}, 211: {'charcode': 211,
-'left': -2, 'right': 3, 'lines': [[(1, 4), (0, 4), (0, 3), (1, 3), (1,
-5), (0, 7)]]}, 212: {'charcode': 212, 'left': -2, 'right': 3, 'lines':
-[[(0, -2), (0, -1), (1, -1), (1, -2), (0, -2)], [(0, 3), (0, 4), (1,
-4), (1, 3), (0, 3)]]}, 213: {'charcode': 213, 'left': -2, 'right': 3,
-'lines': [[(0, -2), (0, -1), (1, -1), (1, -2), (0, -2)], [(1, 4), (0, 4),
-(0, 3), (1, 3), (1, 5), (0, 7)]]}, 214: {'charcode': 214, 'left': -2,
-'right': 3, 'lines': [[(0, -5), (0, 0)], [(1, -5), (1, 0)], [(0, 3),
-(0, 4), (1, 4), (1, 3), (0, 3)]]}, 215: {'charcode': 215, 'left': -4,
-'right': 5, 'lines': [[(-2, -4), (0, -5), (1, -5), (3, -4), (3, -2),
-(0, -1), (0, 0), (1, 0), (1, -1), (3, -2)], [(0, 3), (0, 4), (1, 4),
-(1, 3), (0, 3)]]}, 216: {'charcode': 216, 'left': -2, 'right': 2,
-'lines': [[(0, -5), (0, -1)]]}, 217: {'charcode': 217, 'left': -4,
-'right': 4, 'lines': [[(-2, -5), (-2, -1)], [(2, -5), (2, -1)]]}, 218:
-{'charcode': 218, 'left': -4, 'right': 4, 'lines': [[(-1, -5), (-2, -4),
-(-2, -2), (-1, -1), (1, -1), (2, -2), (2, -4), (1, -5), (-1, -5)]]}, 219:
-{'charcode': 219, 'left': -5, 'right': 5, 'lines': [[(3, -4), (1, -5),
-(-1, -5), (-3, -4), (-3, -2), (-1, -1), (2, 0), (3, 1), (3, 3), (1, 4),
-(-1, 4), (-3, 3)], [(0, -6), (0, 5)]]}, 220: {'charcode': 220, 'left':
--5, 'right': 5, 'lines': [[(4, -6), (-4, 5)]]}, 221: {'charcode': 221,
-'left': -3, 'right': 4, 'lines': [[(2, -6), (0, -4), (-1, -2), (-1,
-1), (0, 3), (2, 5)]]}, 222: {'charcode': 222, 'left': -4, 'right': 3,
-'lines': [[(-2, -6), (0, -4), (1, -2), (1, 1), (0, 3), (-2, 5)]]},
-223: {'charcode': 223, 'left': -2, 'right': 2, 'lines': [[(0, -6),
-(0, 5)]]}, 224: {'charcode': 224, 'left': -6, 'right': 6, 'lines':
-[[(-4, 0), (4, 0)]]}, 225: {'charcode': 225, 'left': -6, 'right': 6,
-'lines': [[(0, -4), (0, 4)], [(-4, 0), (4, 0)]]}, 226: {'charcode': 226,
-'left': -6, 'right': 6, 'lines': [[(-4, -2), (4, -2)], [(-4, 2), (4,
-2)]]}, 227: {'charcode': 227, 'left': -5, 'right': 5, 'lines': [[(-3,
--3), (3, 3)], [(3, -3), (-3, 3)]]}, 228: {'charcode': 228, 'left': -5,
-'right': 5, 'lines': [[(0, -3), (0, 3)], [(-3, -2), (3, 2)], [(3, -2),
-(-3, 2)]]}, 229: {'charcode': 229, 'left': -2, 'right': 3, 'lines':
-[[(0, -1), (0, 0), (1, 0), (1, -1), (0, -1)]]}, 230: {'charcode': 230,
-'left': -2, 'right': 3, 'lines': [[(1, -5), (0, -3), (0, -1), (1, -1),
-(1, -2), (0, -2)]]}, 231: {'charcode': 231, 'left': -2, 'right': 3,
-'lines': [[(1, -4), (0, -4), (0, -5), (1, -5), (1, -3), (0, -1)]]},
-232: {'charcode': 232, 'left': -6, 'right': 6, 'lines': [[(1, -3),
-(4, 0), (1, 3)], [(-4, 0), (4, 0)]]}, 233: {'charcode': 233, 'left':
--5, 'right': 6, 'lines': [[(0, -6), (-2, 5)], [(3, -6), (1, 5)], [(-3,
--2), (4, -2)], [(-3, 1), (4, 1)]]}, 234: {'charcode': 234, 'left': -6,
-'right': 6, 'lines': [[(4, 0), (3, 0), (2, 1), (1, 3), (0, 4), (-3,
-4), (-4, 3), (-4, 1), (-3, 0), (0, -1), (1, -2), (1, -4), (0, -5),
-(-2, -5), (-3, -4), (-3, -2), (-1, 1), (1, 3), (3, 4), (4, 4)]]}, 235:
-{'charcode': 235, 'left': -6, 'right': 6, 'lines': [[(-4, -4), (-3,
--1), (-3, 1), (-4, 4)], [(4, -4), (3, -1), (3, 1), (4, 4)], [(-4, -4),
-(-1, -3), (1, -3), (4, -4)], [(-4, 4), (-1, 3), (1, 3), (4, 4)]]}, 501:
-{'charcode': 501, 'left': -9, 'right': 9, 'lines': [[(0, -12), (-8, 9)],
-[(0, -12), (8, 9)], [(-5, 2), (5, 2)]]}, 502: {'charcode': 502, 'left':
--11, 'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12),
-(5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2)], [(-7,
--2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9),
-(-7, 9)]]}, 503: {'charcode': 503, 'left': -10, 'right': 11, 'lines':
-[[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9),
-(-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9),
-(5, 8), (7, 6), (8, 4)]]}, 504: {'charcode': 504, 'left': -11, 'right':
-10, 'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (0, -12), (3, -11),
-(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (0, 9),
-(-7, 9)]]}, 505: {'charcode': 505, 'left': -10, 'right': 9, 'lines':
-[[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)], [(-6,
-9), (7, 9)]]}, 506: {'charcode': 506, 'left': -10, 'right': 8, 'lines':
-[[(-6, -12), (-6, 9)], [(-6, -12), (7, -12)], [(-6, -2), (2, -2)]]}, 507:
-{'charcode': 507, 'left': -10, 'right': 11, 'lines': [[(8, -7), (7, -9),
-(5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4),
-(-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9), (5, 8), (7, 6),
-(8, 4), (8, 1)], [(3, 1), (8, 1)]]}, 508: {'charcode': 508, 'left': -11,
-'right': 11, 'lines': [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7,
--2), (7, -2)]]}, 509: {'charcode': 509, 'left': -4, 'right': 4, 'lines':
-[[(0, -12), (0, 9)]]}, 510: {'charcode': 510, 'left': -8, 'right': 8,
-'lines': [[(4, -12), (4, 4), (3, 7), (2, 8), (0, 9), (-2, 9), (-4,
-8), (-5, 7), (-6, 4), (-6, 2)]]}, 511: {'charcode': 511, 'left': -11,
-'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2,
--3), (7, 9)]]}, 512: {'charcode': 512, 'left': -10, 'right': 7, 'lines':
-[[(-6, -12), (-6, 9)], [(-6, 9), (6, 9)]]}, 513: {'charcode': 513, 'left':
--12, 'right': 12, 'lines': [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)],
-[(8, -12), (0, 9)], [(8, -12), (8, 9)]]}, 514: {'charcode': 514, 'left':
--11, 'right': 11, 'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)],
-[(7, -12), (7, 9)]]}, 515: {'charcode': 515, 'left': -11, 'right': 11,
-'lines': [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4),
-(8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)]]},
-516: {'charcode': 516, 'left': -11, 'right': 10, 'lines': [[(-7, -12),
-(-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -5),
-(6, -3), (5, -2), (2, -1), (-7, -1)]]}, 517: {'charcode': 517, 'left':
--11, 'right': 11, 'lines': [[(-2, -12), (-4, -11), (-6, -9), (-7, -7),
-(-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8),
-(6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12),
-(-2, -12)], [(1, 5), (7, 11)]]}, 518: {'charcode': 518, 'left': -11,
-'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5,
--11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (2, -2), (-7, -2)],
-[(0, -2), (7, 9)]]}, 519: {'charcode': 519, 'left': -10, 'right': 10,
-'lines': [[(7, -9), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9),
-(-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 1), (7, 3),
-(7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]}, 520: {'charcode':
-520, 'left': -8, 'right': 8, 'lines': [[(0, -12), (0, 9)], [(-7, -12),
-(7, -12)]]}, 521: {'charcode': 521, 'left': -11, 'right': 11, 'lines':
-[[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6,
-6), (7, 3), (7, -12)]]}, 522: {'charcode': 522, 'left': -9, 'right': 9,
-'lines': [[(-8, -12), (0, 9)], [(8, -12), (0, 9)]]}, 523: {'charcode':
-523, 'left': -12, 'right': 12, 'lines': [[(-10, -12), (-5, 9)], [(0, -12),
-(-5, 9)], [(0, -12), (5, 9)], [(10, -12), (5, 9)]]}, 524: {'charcode':
-524, 'left': -10, 'right': 10, 'lines': [[(-7, -12), (7, 9)], [(7, -12),
-(-7, 9)]]}, 525: {'charcode': 525, 'left': -9, 'right': 9, 'lines': [[(-8,
--12), (0, -2), (0, 9)], [(8, -12), (0, -2)]]}, 526: {'charcode': 526,
-'left': -10, 'right': 10, 'lines': [[(7, -12), (-7, 9)], [(-7, -12), (7,
--12)], [(-7, 9), (7, 9)]]}, 527: {'charcode': 527, 'left': -9, 'right': 9,
-'lines': [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]},
-528: {'charcode': 528, 'left': -11, 'right': 10, 'lines': [[(-7, -12),
-(-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6),
-(6, -4), (5, -3), (2, -2)], [(-7, -2), (2, -2), (5, -1), (6, 0), (7,
-2), (7, 5), (6, 7), (5, 8), (2, 9), (-7, 9)]]}, 529: {'charcode': 529,
-'left': -10, 'right': 7, 'lines': [[(-6, -12), (-6, 9)], [(-6, -12), (6,
--12)]]}, 530: {'charcode': 530, 'left': -9, 'right': 9, 'lines': [[(0,
--12), (-8, 9)], [(0, -12), (8, 9)], [(-8, 9), (8, 9)]]}, 531: {'charcode':
-531, 'left': -10, 'right': 9, 'lines': [[(-6, -12), (-6, 9)], [(-6, -12),
-(7, -12)], [(-6, -2), (2, -2)], [(-6, 9), (7, 9)]]}, 532: {'charcode':
-532, 'left': -10, 'right': 10, 'lines': [[(7, -12), (-7, 9)], [(-7,
--12), (7, -12)], [(-7, 9), (7, 9)]]}, 533: {'charcode': 533, 'left':
--11, 'right': 11, 'lines': [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)],
-[(-7, -2), (7, -2)]]}, 534: {'charcode': 534, 'left': -11, 'right': 11,
-'lines': [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8,
-1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-3, -2),
-(3, -2)]]}, 535: {'charcode': 535, 'left': -4, 'right': 4, 'lines': [[(0,
--12), (0, 9)]]}, 536: {'charcode': 536, 'left': -11, 'right': 10, 'lines':
-[[(-7, -12), (-7, 9)], [(7, -12), (-7, 2)], [(-2, -3), (7, 9)]]}, 537:
-{'charcode': 537, 'left': -9, 'right': 9, 'lines': [[(0, -12), (-8, 9)],
-[(0, -12), (8, 9)]]}, 538: {'charcode': 538, 'left': -12, 'right': 12,
-'lines': [[(-8, -12), (-8, 9)], [(-8, -12), (0, 9)], [(8, -12), (0, 9)],
-[(8, -12), (8, 9)]]}, 539: {'charcode': 539, 'left': -11, 'right': 11,
-'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (7, 9)], [(7, -12), (7, 9)]]},
-540: {'charcode': 540, 'left': -9, 'right': 9, 'lines': [[(-7, -12),
-(7, -12)], [(-3, -2), (3, -2)], [(-7, 9), (7, 9)]]}, 541: {'charcode':
-541, 'left': -11, 'right': 11, 'lines': [[(-2, -12), (-4, -11), (-6, -9),
-(-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9),
-(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11),
-(2, -12), (-2, -12)]]}, 542: {'charcode': 542, 'left': -11, 'right':
-11, 'lines': [[(-7, -12), (-7, 9)], [(7, -12), (7, 9)], [(-7, -12),
-(7, -12)]]}, 543: {'charcode': 543, 'left': -11, 'right': 10, 'lines':
-[[(-7, -12), (-7, 9)], [(-7, -12), (2, -12), (5, -11), (6, -10), (7, -8),
-(7, -5), (6, -3), (5, -2), (2, -1), (-7, -1)]]}, 544: {'charcode': 544,
-'left': -9, 'right': 9, 'lines': [[(-7, -12), (0, -2), (-7, 9)], [(-7,
--12), (7, -12)], [(-7, 9), (7, 9)]]}, 545: {'charcode': 545, 'left': -8,
-'right': 8, 'lines': [[(0, -12), (0, 9)], [(-7, -12), (7, -12)]]}, 546:
-{'charcode': 546, 'left': -9, 'right': 9, 'lines': [[(-7, -7), (-7,
--9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5),
-(0, 9)], [(7, -7), (7, -9), (6, -11), (5, -12), (3, -12), (2, -11),
-(1, -9), (0, -5)]]}, 547: {'charcode': 547, 'left': -10, 'right': 10,
-'lines': [[(0, -12), (0, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3),
-(-7, 0), (-6, 2), (-5, 3), (-2, 4), (2, 4), (5, 3), (6, 2), (7, 0),
-(7, -3), (6, -5), (5, -6), (2, -7), (-2, -7)]]}, 548: {'charcode': 548,
-'left': -10, 'right': 10, 'lines': [[(-7, -12), (7, 9)], [(-7, 9),
-(7, -12)]]}, 549: {'charcode': 549, 'left': -11, 'right': 11, 'lines':
-[[(0, -12), (0, 9)], [(-9, -6), (-8, -6), (-7, -5), (-6, -1), (-5, 1),
-(-4, 2), (-1, 3), (1, 3), (4, 2), (5, 1), (6, -1), (7, -5), (8, -6),
-(9, -6)]]}, 550: {'charcode': 550, 'left': -10, 'right': 10, 'lines':
-[[(-7, 9), (-3, 9), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11),
-(-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (3,
-9), (7, 9)]]}, 551: {'charcode': 551, 'left': -11, 'right': 9, 'lines':
-[[(-11, 9), (-9, 8), (-6, 5), (-3, 1), (1, -6), (4, -12), (4, 9), (3, 6),
-(1, 3), (-1, 1), (-4, -1), (-6, -1), (-7, 0), (-7, 2), (-6, 4), (-4, 6),
-(-1, 8), (2, 9), (7, 9)]]}, 552: {'charcode': 552, 'left': -12, 'right':
-11, 'lines': [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1), (-1, 3),
-(-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0), (-7, -3),
-(-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (6, -12), (8, -11),
-(9, -9), (9, -7), (8, -5), (7, -4), (5, -3), (2, -2)], [(1, -2), (2,
--2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9), (0, 9),
-(-2, 8), (-3, 6)]]}, 553: {'charcode': 553, 'left': -10, 'right': 10,
-'lines': [[(2, -6), (2, -5), (3, -4), (5, -4), (7, -5), (8, -7), (8, -9),
-(7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4),
-(-7, 0), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6),
-(5, 4)]]}, 554: {'charcode': 554, 'left': -11, 'right': 12, 'lines':
-[[(2, -12), (0, -11), (-1, -9), (-2, -5), (-3, 1), (-4, 4), (-5, 6),
-(-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11, 5), (-9, 5), (-7,
-6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (8, 2), (9, -3), (9, -7),
-(8, -10), (7, -11), (5, -12), (2, -12), (0, -10), (0, -8), (1, -5), (3,
--2), (5, 0), (8, 2), (10, 3)]]}, 555: {'charcode': 555, 'left': -10,
-'right': 10, 'lines': [[(4, -8), (4, -7), (5, -6), (7, -6), (8, -7),
-(8, -9), (7, -11), (4, -12), (0, -12), (-3, -11), (-4, -9), (-4, -6),
-(-3, -4), (-2, -3), (1, -2), (-2, -2), (-5, -1), (-6, 0), (-7, 2), (-7,
-5), (-6, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 6), (7, 4)]]}, 556:
-{'charcode': 556, 'left': -10, 'right': 10, 'lines': [[(0, -6), (-2, -6),
-(-4, -7), (-5, -9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11),
-(11, -12)], [(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6,
-9), (-8, 8), (-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)], [(-1, -2),
-(8, -2)]]}, 557: {'charcode': 557, 'left': -11, 'right': 12, 'lines':
-[[(-11, 9), (-9, 8), (-5, 4), (-2, -1), (-1, -4), (0, -8), (0, -11),
-(-1, -12), (-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-1, -3),
-(3, -3), (6, -4), (7, -5), (8, -7), (8, -1), (7, 4), (6, 6), (4, 8), (1,
-9), (-3, 9), (-6, 8), (-8, 6), (-9, 4), (-9, 2)]]}, 558: {'charcode': 558,
-'left': -12, 'right': 12, 'lines': [[(-5, -5), (-7, -6), (-8, -8), (-8,
--9), (-7, -11), (-5, -12), (-4, -12), (-2, -11), (-1, -9), (-1, -7),
-(-2, -3), (-4, 3), (-6, 7), (-8, 9), (-10, 9), (-11, 8), (-11, 6)],
-[(-5, 0), (4, -3), (6, -4), (9, -6), (11, -8), (12, -10), (12, -11),
-(11, -12), (10, -12), (8, -10), (6, -6), (4, 0), (3, 5), (3, 8), (4, 9),
-(5, 9), (7, 8), (8, 7), (10, 4)]]}, 559: {'charcode': 559, 'left': -9,
-'right': 8, 'lines': [[(5, 4), (3, 2), (1, -1), (0, -3), (-1, -6), (-1,
--9), (0, -11), (1, -12), (3, -12), (4, -11), (5, -9), (5, -6), (4, -1),
-(2, 4), (1, 6), (-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4),
-(-7, 3), (-5, 3), (-3, 4)]]}, 560: {'charcode': 560, 'left': -8, 'right':
-7, 'lines': [[(2, 12), (0, 9), (-2, 4), (-3, -2), (-3, -8), (-2, -11),
-(0, -12), (2, -12), (3, -11), (4, -8), (4, -5), (3, 0), (0, 9), (-2, 15),
-(-3, 18), (-4, 20), (-6, 21), (-7, 20), (-7, 18), (-6, 15), (-4, 12), (-2,
-10), (1, 8), (5, 6)]]}, 561: {'charcode': 561, 'left': -12, 'right': 12,
-'lines': [[(-5, -5), (-7, -6), (-8, -8), (-8, -9), (-7, -11), (-5, -12),
-(-4, -12), (-2, -11), (-1, -9), (-1, -7), (-2, -3), (-4, 3), (-6, 7),
-(-8, 9), (-10, 9), (-11, 8), (-11, 6)], [(12, -9), (12, -11), (11, -12),
-(10, -12), (8, -11), (6, -9), (4, -6), (2, -4), (0, -3), (-2, -3)], [(0,
--3), (1, -1), (1, 6), (2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]},
-562: {'charcode': 562, 'left': -9, 'right': 10, 'lines': [[(-5, 0), (-3,
-0), (1, -1), (4, -3), (6, -5), (7, -7), (7, -10), (6, -12), (4, -12),
-(3, -11), (2, -9), (1, -4), (0, 1), (-1, 4), (-2, 6), (-4, 8), (-6, 9),
-(-8, 9), (-9, 8), (-9, 6), (-8, 5), (-6, 5), (-4, 6), (-1, 8), (2, 9),
-(4, 9), (7, 8), (9, 6)]]}, 563: {'charcode': 563, 'left': -18, 'right':
-15, 'lines': [[(-13, -5), (-15, -6), (-16, -8), (-16, -9), (-15, -11),
-(-13, -12), (-12, -12), (-10, -11), (-9, -9), (-9, -7), (-10, -2), (-11,
-2), (-13, 9)], [(-11, 2), (-8, -6), (-6, -10), (-5, -11), (-3, -12), (-2,
--12), (0, -11), (1, -9), (1, -7), (0, -2), (-1, 2), (-3, 9)], [(-1, 2),
-(2, -6), (4, -10), (5, -11), (7, -12), (8, -12), (10, -11), (11, -9),
-(11, -7), (10, -2), (8, 5), (8, 8), (9, 9), (10, 9), (12, 8), (13, 7),
-(15, 4)]]}, 564: {'charcode': 564, 'left': -13, 'right': 11, 'lines':
-[[(-8, -5), (-10, -6), (-11, -8), (-11, -9), (-10, -11), (-8, -12),
-(-7, -12), (-5, -11), (-4, -9), (-4, -7), (-5, -2), (-6, 2), (-8, 9)],
-[(-6, 2), (-3, -6), (-1, -10), (0, -11), (2, -12), (4, -12), (6, -11),
-(7, -9), (7, -7), (6, -2), (4, 5), (4, 8), (5, 9), (6, 9), (8, 8),
-(9, 7), (11, 4)]]}, 565: {'charcode': 565, 'left': -10, 'right': 11,
-'lines': [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0),
-(-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7,
-1), (8, -3), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12), (0, -10),
-(0, -7), (1, -4), (3, -1), (5, 1), (8, 3), (10, 4)]]}, 566: {'charcode':
-566, 'left': -12, 'right': 13, 'lines': [[(1, -10), (2, -9), (2, -6),
-(1, -2), (0, 1), (-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8),
-(-9, 5), (-8, 0), (-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11),
-(3, -12), (8, -12), (10, -11), (11, -10), (12, -8), (12, -5), (11, -3),
-(10, -2), (8, -1), (5, -1), (3, -2), (2, -3)]]}, 567: {'charcode': 567,
-'left': -10, 'right': 12, 'lines': [[(3, -6), (2, -4), (1, -3), (-1, -2),
-(-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12),
-(7, -11), (8, -9), (8, -5), (7, -2), (5, 1), (1, 5), (-2, 7), (-4, 8),
-(-7, 9), (-9, 9), (-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8),
-(1, 9), (4, 9), (7, 8), (9, 6)]]}, 568: {'charcode': 568, 'left': -12,
-'right': 13, 'lines': [[(1, -10), (2, -9), (2, -6), (1, -2), (0, 1),
-(-1, 3), (-3, 6), (-5, 8), (-7, 9), (-8, 9), (-9, 8), (-9, 5), (-8, 0),
-(-7, -3), (-6, -5), (-4, -8), (-2, -10), (0, -11), (3, -12), (7, -12),
-(9, -11), (10, -10), (11, -8), (11, -5), (10, -3), (9, -2), (7, -1),
-(4, -1), (1, -2), (2, -1), (3, 1), (3, 6), (4, 8), (6, 9), (8, 8),
-(9, 7), (11, 4)]]}, 569: {'charcode': 569, 'left': -10, 'right': 10,
-'lines': [[(-10, 9), (-8, 8), (-6, 6), (-3, 2), (-1, -1), (1, -5), (2,
--8), (2, -11), (1, -12), (0, -12), (-1, -11), (-2, -9), (-2, -7), (-1,
--5), (1, -3), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9),
-(-2, 9), (-5, 8), (-7, 6), (-8, 4), (-8, 2)]]}, 570: {'charcode': 570,
-'left': -10, 'right': 9, 'lines': [[(0, -6), (-2, -6), (-4, -7), (-5,
--9), (-4, -11), (-1, -12), (2, -12), (6, -11), (9, -11), (11, -12)],
-[(6, -11), (4, -4), (2, 2), (0, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8),
-(-9, 6), (-9, 4), (-8, 3), (-6, 3), (-4, 4)]]}, 571: {'charcode': 571,
-'left': -13, 'right': 11, 'lines': [[(-8, -5), (-10, -6), (-11, -8),
-(-11, -9), (-10, -11), (-8, -12), (-7, -12), (-5, -11), (-4, -9), (-4,
--7), (-5, -3), (-6, 0), (-7, 4), (-7, 6), (-6, 8), (-4, 9), (-2, 9),
-(0, 8), (1, 7), (3, 3), (6, -5), (8, -12)], [(6, -5), (5, -1), (4, 5),
-(4, 8), (5, 9), (6, 9), (8, 8), (9, 7), (11, 4)]]}, 572: {'charcode':
-572, 'left': -12, 'right': 11, 'lines': [[(-7, -5), (-9, -6), (-10, -8),
-(-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4, -11), (-3, -9), (-3, -7),
-(-4, -3), (-5, 0), (-6, 4), (-6, 7), (-5, 9), (-3, 9), (-1, 8), (2, 5),
-(4, 2), (6, -2), (7, -5), (8, -9), (8, -11), (7, -12), (6, -12), (5,
--11), (4, -9), (4, -7), (5, -4), (7, -2), (9, -1)]]}, 573: {'charcode':
-573, 'left': -15, 'right': 13, 'lines': [[(-10, -5), (-12, -6), (-13,
--8), (-13, -9), (-12, -11), (-10, -12), (-9, -12), (-7, -11), (-6, -9),
-(-6, -6), (-7, 9)], [(3, -12), (-7, 9)], [(3, -12), (1, 9)], [(15, -12),
-(13, -11), (10, -8), (7, -4), (4, 2), (1, 9)]]}, 574: {'charcode': 574,
-'left': -12, 'right': 12, 'lines': [[(-4, -6), (-6, -6), (-7, -7), (-7,
--9), (-6, -11), (-4, -12), (-2, -12), (0, -11), (1, -9), (1, -6), (-1, 3),
-(-1, 6), (0, 8), (2, 9), (4, 9), (6, 8), (7, 6), (7, 4), (6, 3), (4, 3)],
-[(11, -9), (11, -11), (10, -12), (8, -12), (6, -11), (4, -9), (2, -6),
-(-2, 3), (-4, 6), (-6, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6)]]},
-575: {'charcode': 575, 'left': -12, 'right': 11, 'lines': [[(-7, -5),
-(-9, -6), (-10, -8), (-10, -9), (-9, -11), (-7, -12), (-6, -12), (-4,
--11), (-3, -9), (-3, -7), (-4, -3), (-5, 0), (-6, 4), (-6, 6), (-5, 8),
-(-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3), (5, 1), (7, -5)], [(9, -12),
-(7, -5), (4, 5), (2, 11), (0, 16), (-2, 20), (-4, 21), (-5, 20), (-5, 18),
-(-4, 15), (-2, 12), (1, 9), (4, 7), (9, 4)]]}, 576: {'charcode': 576,
-'left': -10, 'right': 11, 'lines': [[(3, -6), (2, -4), (1, -3), (-1, -2),
-(-3, -2), (-4, -4), (-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12),
-(7, -11), (8, -9), (8, -5), (7, -2), (5, 2), (2, 5), (-2, 8), (-4, 9),
-(-7, 9), (-8, 8), (-8, 6), (-7, 5), (-4, 5), (-2, 6), (-1, 7), (0, 9),
-(0, 12), (-1, 15), (-2, 17), (-4, 20), (-6, 21), (-7, 20), (-7, 18),
-(-6, 15), (-4, 12), (-1, 9), (2, 7), (8, 4)]]}, 583: {'charcode': 583,
-'left': -9, 'right': 9, 'lines': [[(-8, -12), (0, 9)], [(8, -12), (0, 9)],
-[(-8, -12), (8, -12)]]}, 601: {'charcode': 601, 'left': -9, 'right': 10,
-'lines': [[(6, -5), (6, 9)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3,
--4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4,
-8), (6, 6)]]}, 602: {'charcode': 602, 'left': -10, 'right': 9, 'lines':
-[[(-6, -12), (-6, 9)], [(-6, -2), (-4, -4), (-2, -5), (1, -5), (3, -4),
-(5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8), (-6,
-6)]]}, 603: {'charcode': 603, 'left': -9, 'right': 9, 'lines': [[(6, -2),
-(4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5,
-6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]}, 604: {'charcode': 604,
-'left': -9, 'right': 10, 'lines': [[(6, -12), (6, 9)], [(6, -2), (4, -4),
-(2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8),
-(-1, 9), (2, 9), (4, 8), (6, 6)]]}, 605: {'charcode': 605, 'left': -9,
-'right': 9, 'lines': [[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2,
--5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8),
-(-1, 9), (2, 9), (4, 8), (6, 6)]]}, 606: {'charcode': 606, 'left': -5,
-'right': 7, 'lines': [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9)],
-[(-3, -5), (4, -5)]]}, 607: {'charcode': 607, 'left': -9, 'right':
-10, 'lines': [[(6, -5), (6, 11), (5, 14), (4, 15), (2, 16), (-1, 16),
-(-3, 15)], [(6, -2), (4, -4), (2, -5), (-1, -5), (-3, -4), (-5, -2),
-(-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6)]]},
-608: {'charcode': 608, 'left': -9, 'right': 10, 'lines': [[(-5, -12),
-(-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6,
-9)]]}, 609: {'charcode': 609, 'left': -4, 'right': 4, 'lines': [[(-1,
--12), (0, -11), (1, -12), (0, -13), (-1, -12)], [(0, -5), (0, 9)]]},
-610: {'charcode': 610, 'left': -5, 'right': 5, 'lines': [[(0, -12),
-(1, -11), (2, -12), (1, -13), (0, -12)], [(1, -5), (1, 12), (0, 15),
-(-2, 16), (-4, 16)]]}, 611: {'charcode': 611, 'left': -9, 'right': 8,
-'lines': [[(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(-1, 1), (6, 9)]]},
-612: {'charcode': 612, 'left': -4, 'right': 4, 'lines': [[(0, -12),
-(0, 9)]]}, 613: {'charcode': 613, 'left': -15, 'right': 15, 'lines':
-[[(-11, -5), (-11, 9)], [(-11, -1), (-8, -4), (-6, -5), (-3, -5), (-1,
--4), (0, -1), (0, 9)], [(0, -1), (3, -4), (5, -5), (8, -5), (10, -4),
-(11, -1), (11, 9)]]}, 614: {'charcode': 614, 'left': -9, 'right': 10,
-'lines': [[(-5, -5), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5),
-(5, -4), (6, -1), (6, 9)]]}, 615: {'charcode': 615, 'left': -9, 'right':
-10, 'lines': [[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6),
-(-3, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4,
--4), (2, -5), (-1, -5)]]}, 616: {'charcode': 616, 'left': -10, 'right':
-9, 'lines': [[(-6, -5), (-6, 16)], [(-6, -2), (-4, -4), (-2, -5), (1,
--5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9), (-2, 9),
-(-4, 8), (-6, 6)]]}, 617: {'charcode': 617, 'left': -9, 'right': 10,
-'lines': [[(6, -5), (6, 16)], [(6, -2), (4, -4), (2, -5), (-1, -5),
-(-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2,
-9), (4, 8), (6, 6)]]}, 618: {'charcode': 618, 'left': -7, 'right': 6,
-'lines': [[(-3, -5), (-3, 9)], [(-3, 1), (-2, -2), (0, -4), (2, -5),
-(5, -5)]]}, 619: {'charcode': 619, 'left': -8, 'right': 9, 'lines':
-[[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2), (-4, 0),
-(-2, 1), (3, 2), (5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-1, 9), (-4,
-8), (-5, 6)]]}, 620: {'charcode': 620, 'left': -5, 'right': 7, 'lines':
-[[(0, -12), (0, 5), (1, 8), (3, 9), (5, 9)], [(-3, -5), (4, -5)]]}, 621:
-{'charcode': 621, 'left': -9, 'right': 10, 'lines': [[(-5, -5), (-5, 5),
-(-4, 8), (-2, 9), (1, 9), (3, 8), (6, 5)], [(6, -5), (6, 9)]]}, 622:
-{'charcode': 622, 'left': -8, 'right': 8, 'lines': [[(-6, -5), (0, 9)],
-[(6, -5), (0, 9)]]}, 623: {'charcode': 623, 'left': -11, 'right': 11,
-'lines': [[(-8, -5), (-4, 9)], [(0, -5), (-4, 9)], [(0, -5), (4, 9)],
-[(8, -5), (4, 9)]]}, 624: {'charcode': 624, 'left': -8, 'right': 9,
-'lines': [[(-5, -5), (6, 9)], [(6, -5), (-5, 9)]]}, 625: {'charcode':
-625, 'left': -8, 'right': 8, 'lines': [[(-6, -5), (0, 9)], [(6, -5),
-(0, 9), (-2, 13), (-4, 15), (-6, 16), (-7, 16)]]}, 626: {'charcode':
-626, 'left': -8, 'right': 9, 'lines': [[(6, -5), (-5, 9)], [(-5, -5),
-(6, -5)], [(-5, 9), (6, 9)]]}, 627: {'charcode': 627, 'left': -10,
-'right': 11, 'lines': [[(-1, -5), (-3, -4), (-5, -2), (-6, 0), (-7, 3),
-(-7, 6), (-6, 8), (-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2),
-(8, -5)], [(-1, -5), (1, -5), (2, -4), (3, -2), (5, 6), (6, 8), (7, 9),
-(8, 9)]]}, 628: {'charcode': 628, 'left': -9, 'right': 10, 'lines':
-[[(3, -12), (1, -11), (-1, -9), (-3, -5), (-4, -2), (-5, 2), (-6, 8),
-(-7, 16)], [(3, -12), (5, -12), (7, -10), (7, -7), (6, -5), (5, -4),
-(3, -3), (0, -3)], [(0, -3), (2, -2), (4, 0), (5, 2), (5, 5), (4, 7),
-(3, 8), (1, 9), (-1, 9), (-3, 8), (-4, 7), (-5, 4)]]}, 629: {'charcode':
-629, 'left': -9, 'right': 10, 'lines': [[(-8, -2), (-6, -4), (-4, -5),
-(-3, -5), (-1, -4), (0, -3), (1, 0), (1, 4), (0, 9)], [(8, -5), (7, -2),
-(6, 0), (0, 9), (-2, 13), (-3, 16)]]}, 630: {'charcode': 630, 'left': -9,
-'right': 9, 'lines': [[(2, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1),
-(-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3),
-(5, 0), (4, -3), (2, -5), (0, -7), (-1, -9), (-1, -11), (0, -12),
-(2, -12), (4, -11), (6, -9)]]}, 631: {'charcode': 631, 'left': -8,
-'right': 8, 'lines': [[(5, -3), (4, -4), (2, -5), (-1, -5), (-3, -4),
-(-3, -2), (-2, 0), (1, 1)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8),
-(-2, 9), (1, 9), (3, 8), (5, 6)]]}, 632: {'charcode': 632, 'left': -8,
-'right': 7, 'lines': [[(2, -12), (0, -11), (-1, -10), (-1, -9), (0,
--8), (3, -7), (6, -7)], [(6, -7), (2, -5), (-1, -3), (-4, 0), (-5, 3),
-(-5, 5), (-4, 7), (-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16),
-(-2, 14)]]}, 633: {'charcode': 633, 'left': -10, 'right': 10, 'lines':
-[[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2),
-(-6, 9)], [(-4, 2), (-2, -2), (0, -4), (2, -5), (4, -5), (6, -3), (6,
-0), (5, 5), (2, 16)]]}, 634: {'charcode': 634, 'left': -11, 'right': 10,
-'lines': [[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-4, -2),
-(-5, 3), (-5, 6), (-4, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 3),
-(5, 0), (6, -5), (6, -8), (5, -11), (3, -12), (1, -12), (0, -10),
-(0, -8), (1, -5), (3, -2), (5, 0), (8, 2)]]}, 635: {'charcode': 635,
-'left': -6, 'right': 5, 'lines': [[(0, -5), (-2, 2), (-3, 6), (-3, 8),
-(-2, 9), (0, 9), (2, 7), (3, 5)]]}, 636: {'charcode': 636, 'left': -9,
-'right': 9, 'lines': [[(-3, -5), (-7, 9)], [(7, -4), (6, -5), (5, -5),
-(3, -4), (-1, 0), (-3, 1), (-4, 1)], [(-4, 1), (-2, 2), (-1, 3), (1, 8),
-(2, 9), (3, 9), (4, 8)]]}, 637: {'charcode': 637, 'left': -8, 'right': 8,
-'lines': [[(-7, -12), (-5, -12), (-3, -11), (-2, -10), (6, 9)], [(0, -5),
-(-6, 9)]]}, 638: {'charcode': 638, 'left': -10, 'right': 11, 'lines':
-[[(-3, -5), (-9, 16)], [(-4, -1), (-5, 4), (-5, 7), (-3, 9), (-1, 9),
-(1, 8), (3, 6), (5, 2)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9), (7,
-9), (9, 7), (10, 5)]]}, 639: {'charcode': 639, 'left': -9, 'right': 9,
-'lines': [[(-6, -5), (-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5), (6,
--2), (5, 0), (3, 3), (0, 6), (-3, 8), (-6, 9)]]}, 640: {'charcode': 640,
-'left': -8, 'right': 8, 'lines': [[(2, -12), (0, -11), (-1, -10), (-1,
--9), (0, -8), (3, -7), (6, -7)], [(3, -7), (0, -6), (-2, -5), (-3, -3),
-(-3, -1), (-1, 1), (2, 2), (4, 2)], [(2, 2), (-2, 3), (-4, 4), (-5, 6),
-(-5, 8), (-3, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)]]}, 641:
-{'charcode': 641, 'left': -8, 'right': 9, 'lines': [[(0, -5), (-2, -4),
-(-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8),
-(5, 6), (6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5)]]}, 642:
-{'charcode': 642, 'left': -11, 'right': 11, 'lines': [[(-2, -5), (-6,
-9)], [(3, -5), (4, 1), (5, 6), (6, 9)], [(-9, -2), (-7, -4), (-4, -5),
-(9, -5)]]}, 643: {'charcode': 643, 'left': -9, 'right': 9, 'lines':
-[[(-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9), (1, 9), (3, 8), (5, 6),
-(6, 3), (6, 0), (5, -3), (4, -4), (2, -5), (0, -5), (-2, -4), (-4, -2),
-(-5, 1), (-9, 16)]]}, 644: {'charcode': 644, 'left': -9, 'right': 11,
-'lines': [[(9, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5,
-7), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (5, 0), (4, -3),
-(3, -4), (1, -5)]]}, 645: {'charcode': 645, 'left': -10, 'right': 10,
-'lines': [[(1, -5), (-2, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)]]},
-646: {'charcode': 646, 'left': -10, 'right': 10, 'lines': [[(-9, -1), (-8,
--3), (-6, -5), (-4, -5), (-3, -4), (-3, -2), (-5, 4), (-5, 7), (-3, 9),
-(-1, 9), (2, 8), (4, 6), (6, 2), (7, -2), (7, -5)]]}, 647: {'charcode':
-647, 'left': -11, 'right': 11, 'lines': [[(-3, -4), (-5, -3), (-7, -1),
-(-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (5, 6),
-(7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3), (0, 1), (-2, 6),
-(-5, 16)]]}, 648: {'charcode': 648, 'left': -9, 'right': 9, 'lines':
-[[(-7, -5), (-5, -5), (-3, -3), (3, 14), (5, 16), (7, 16)], [(8, -5),
-(7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]}, 649: {'charcode': 649,
-'left': -12, 'right': 11, 'lines': [[(4, -12), (-4, 16)], [(-11, -1),
-(-10, -3), (-8, -5), (-6, -5), (-5, -4), (-5, -2), (-6, 3), (-6, 6),
-(-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (8, -2), (9, -5)]]},
-650: {'charcode': 650, 'left': -12, 'right': 11, 'lines': [[(-4, -5),
-(-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3,
-8), (-1, 5)], [(0, 1), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5),
-(8, 2), (8, -1), (7, -4), (6, -5)]]}, 651: {'charcode': 651, 'left':
--6, 'right': 10, 'lines': [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1),
-(-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6),
-(4, 0), (3, 5), (3, 8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]}, 652:
-{'charcode': 652, 'left': -5, 'right': 9, 'lines': [[(-5, 4), (-3, 1),
-(0, -4), (1, -6), (2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3,
--5), (-4, 2), (-4, 8), (-3, 9), (-2, 9), (0, 8), (2, 6), (3, 3), (3, 0),
-(4, 4), (5, 5), (7, 5), (9, 4)]]}, 653: {'charcode': 653, 'left': -5,
-'right': 6, 'lines': [[(2, 2), (2, 1), (1, 0), (-1, 0), (-3, 1), (-4,
-2), (-5, 4), (-5, 6), (-4, 8), (-2, 9), (1, 9), (4, 7), (6, 4)]]}, 654:
-{'charcode': 654, 'left': -6, 'right': 10, 'lines': [[(3, 3), (2, 1),
-(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9),
-(-1, 9), (1, 8), (2, 6), (8, -12)], [(4, 0), (3, 5), (3, 8), (4, 9),
-(5, 9), (7, 8), (8, 7), (10, 4)]]}, 655: {'charcode': 655, 'left': -4,
-'right': 6, 'lines': [[(-3, 7), (-1, 6), (0, 5), (1, 3), (1, 1), (0, 0),
-(-1, 0), (-3, 1), (-4, 3), (-4, 6), (-3, 8), (-1, 9), (1, 9), (3, 8), (4,
-7), (6, 4)]]}, 656: {'charcode': 656, 'left': -3, 'right': 5, 'lines':
-[[(-3, 4), (1, -1), (3, -4), (4, -6), (5, -9), (5, -11), (4, -12),
-(2, -11), (1, -9), (-1, -1), (-4, 8), (-7, 15), (-8, 18), (-8, 20),
-(-7, 21), (-5, 20), (-4, 17), (-3, 8), (-2, 9), (0, 9), (2, 8), (3,
-7), (5, 4)]]}, 657: {'charcode': 657, 'left': -6, 'right': 9, 'lines':
-[[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6),
-(-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 7)], [(4, 0), (2, 7), (-2, 18),
-(-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10),
-(3, 9), (6, 7), (9, 4)]]}, 658: {'charcode': 658, 'left': -5, 'right':
-10, 'lines': [[(-5, 4), (-3, 1), (0, -4), (1, -6), (2, -9), (2, -11),
-(1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1), (-5, 9)], [(-5, 9),
-(-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3,
-8), (4, 9), (5, 9), (7, 8), (8, 7), (10, 4)]]}, 659: {'charcode': 659,
-'left': -2, 'right': 5, 'lines': [[(1, -5), (1, -4), (2, -4), (2, -5),
-(1, -5)], [(-2, 4), (0, 0), (-2, 6), (-2, 8), (-1, 9), (0, 9), (2, 8),
-(3, 7), (5, 4)]]}, 660: {'charcode': 660, 'left': -2, 'right': 5,
-'lines': [[(1, -5), (1, -4), (2, -4), (2, -5), (1, -5)], [(-2, 4),
-(0, 0), (-6, 18), (-7, 20), (-9, 21), (-10, 20), (-10, 18), (-9, 15),
-(-6, 12), (-3, 10), (-1, 9), (2, 7), (5, 4)]]}, 661: {'charcode': 661,
-'left': -5, 'right': 9, 'lines': [[(-5, 4), (-3, 1), (0, -4), (1, -6),
-(2, -9), (2, -11), (1, -12), (-1, -11), (-2, -9), (-3, -5), (-4, 1),
-(-5, 9)], [(-5, 9), (-4, 6), (-3, 4), (-1, 1), (1, 0), (3, 0), (4, 1),
-(4, 3), (2, 4), (-1, 4)], [(-1, 4), (1, 5), (2, 8), (3, 9), (4, 9), (6,
-8), (7, 7), (9, 4)]]}, 662: {'charcode': 662, 'left': -3, 'right': 5,
-'lines': [[(-3, 4), (-1, 1), (2, -4), (3, -6), (4, -9), (4, -11), (3,
--12), (1, -11), (0, -9), (-1, -5), (-2, 2), (-2, 8), (-1, 9), (0, 9),
-(2, 8), (3, 7), (5, 4)]]}, 663: {'charcode': 663, 'left': -13, 'right':
-12, 'lines': [[(-13, 4), (-11, 1), (-9, 0), (-8, 1), (-8, 2), (-9, 6),
-(-10, 9)], [(-9, 6), (-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1,
-2), (-2, 6), (-3, 9)], [(-2, 6), (-1, 4), (1, 1), (3, 0), (5, 0), (6, 1),
-(6, 3), (5, 6), (5, 8), (6, 9), (7, 9), (9, 8), (10, 7), (12, 4)]]}, 664:
-{'charcode': 664, 'left': -8, 'right': 10, 'lines': [[(-8, 4), (-6, 1),
-(-4, 0), (-3, 1), (-3, 2), (-4, 6), (-5, 9)], [(-4, 6), (-3, 4), (-1,
-1), (1, 0), (3, 0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9), (5, 9), (7,
-8), (8, 7), (10, 4)]]}, 665: {'charcode': 665, 'left': -6, 'right': 8,
-'lines': [[(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8),
-(-3, 9), (-1, 9), (1, 8), (2, 7), (3, 5), (3, 3), (2, 1), (0, 0), (-1, 1),
-(-1, 3), (0, 5), (2, 6), (5, 6), (7, 5), (8, 4)]]}, 666: {'charcode': 666,
-'left': -7, 'right': 8, 'lines': [[(-7, 4), (-5, 1), (-4, -1), (-5, 3),
-(-11, 21)], [(-5, 3), (-4, 1), (-2, 0), (0, 0), (2, 1), (3, 3), (3, 5),
-(2, 7), (1, 8), (-1, 9)], [(-5, 8), (-3, 9), (0, 9), (3, 8), (5, 7),
-(8, 4)]]}, 667: {'charcode': 667, 'left': -6, 'right': 9, 'lines':
-[[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6),
-(-5, 8), (-3, 9), (-1, 9), (1, 8)], [(4, 0), (3, 3), (1, 8), (-2, 15),
-(-3, 18), (-3, 20), (-2, 21), (0, 20), (1, 17), (1, 10), (3, 9), (6,
-7), (9, 4)]]}, 668: {'charcode': 668, 'left': -5, 'right': 8, 'lines':
-[[(-5, 4), (-3, 1), (-2, -1), (-2, 1), (1, 1), (2, 2), (2, 4), (1, 7),
-(1, 8), (2, 9), (3, 9), (5, 8), (6, 7), (8, 4)]]}, 669: {'charcode': 669,
-'left': -4, 'right': 7, 'lines': [[(-4, 4), (-2, 1), (-1, -1), (-1, 1),
-(1, 4), (2, 6), (2, 8), (0, 9)], [(-4, 8), (-2, 9), (2, 9), (4, 8), (5,
-7), (7, 4)]]}, 670: {'charcode': 670, 'left': -3, 'right': 6, 'lines':
-[[(-3, 4), (-1, 1), (1, -3)], [(4, -12), (-2, 6), (-2, 8), (-1, 9), (1,
-9), (3, 8), (4, 7), (6, 4)], [(-2, -4), (5, -4)]]}, 671: {'charcode':
-671, 'left': -6, 'right': 9, 'lines': [[(-6, 4), (-4, 0), (-6, 6),
-(-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0), (2, 6),
-(2, 8), (3, 9), (4, 9), (6, 8), (7, 7), (9, 4)]]}, 672: {'charcode': 672,
-'left': -6, 'right': 9, 'lines': [[(-6, 4), (-4, 0), (-5, 5), (-5, 8),
-(-4, 9), (-3, 9), (0, 8), (2, 6), (3, 3), (3, 0)], [(3, 0), (4, 4), (5,
-5), (7, 5), (9, 4)]]}, 673: {'charcode': 673, 'left': -9, 'right': 12,
-'lines': [[(-6, 0), (-8, 2), (-9, 5), (-9, 7), (-8, 9), (-6, 9), (-4, 8),
-(-2, 6)], [(0, 0), (-2, 6), (-2, 8), (-1, 9), (1, 9), (3, 8), (5, 6),
-(6, 3), (6, 0)], [(6, 0), (7, 4), (8, 5), (10, 5), (12, 4)]]}, 674:
-{'charcode': 674, 'left': -8, 'right': 8, 'lines': [[(-8, 4), (-6, 1),
-(-4, 0), (-2, 0), (-1, 1), (-1, 8), (0, 9), (3, 9), (6, 7), (8, 4)], [(5,
-1), (4, 0), (2, 0), (1, 1), (-3, 8), (-4, 9), (-6, 9), (-7, 8)]]}, 675:
-{'charcode': 675, 'left': -6, 'right': 9, 'lines': [[(-6, 4), (-4, 0),
-(-6, 6), (-6, 8), (-5, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(4, 0),
-(-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12),
-(1, 10), (3, 9), (6, 7), (9, 4)]]}, 676: {'charcode': 676, 'left': -6,
-'right': 8, 'lines': [[(-6, 4), (-4, 1), (-2, 0), (0, 0), (2, 2), (2,
-4), (1, 6), (-1, 8), (-4, 9), (-2, 10), (-1, 12), (-1, 15), (-2, 18),
-(-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-2, 12), (1, 10), (5,
-7), (8, 4)]]}, 677: {'charcode': 677, 'left': -8, 'right': 10, 'lines':
-[[(-7, 9), (-4, 8), (-1, 6), (1, 4), (3, 1), (5, -3), (6, -7), (6, -9),
-(5, -11), (3, -12), (1, -11), (0, -10), (-1, -8), (-2, -3), (-2, 2),
-(-1, 6), (0, 8), (2, 9), (4, 9), (6, 8), (7, 7)]]}, 683: {'charcode':
-683, 'left': -9, 'right': 9, 'lines': [[(5, 3), (5, 0), (4, -3), (3,
--4), (1, -5), (-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 4), (-5, 7),
-(-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (5, 3), (6, -2), (6, -7),
-(5, -10), (4, -11), (2, -12), (0, -12), (-2, -11), (-4, -9)]]}, 684:
-{'charcode': 684, 'left': -8, 'right': 8, 'lines': [[(5, -4), (3, -5),
-(0, -5), (-2, -4), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9),
-(2, 9), (4, 8)], [(-5, 2), (3, 2)]]}, 685: {'charcode': 685, 'left': -8,
-'right': 9, 'lines': [[(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3),
-(-5, 2), (-5, 6), (-4, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 3),
-(5, 0), (6, -5), (6, -9), (5, -11), (4, -12), (2, -12)], [(-4, -2),
-(5, -2)]]}, 686: {'charcode': 686, 'left': -10, 'right': 10, 'lines':
-[[(4, -12), (-4, 16)], [(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 4),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 0), (6,
--2), (4, -4), (1, -5), (-1, -5)]]}, 687: {'charcode': 687, 'left': -9,
-'right': 9, 'lines': [[(6, -3), (5, -4), (2, -5), (-1, -5), (-4, -4),
-(-5, -3), (-6, -1), (-6, 1), (-5, 3), (-3, 5), (1, 8), (2, 10), (2, 12),
-(1, 13), (-1, 13)]]}, 697: {'charcode': 697, 'left': 0, 'right': 0,
-'lines': [[]]}, 698: {'charcode': 698, 'left': -4, 'right': 4, 'lines':
-[[]]}, 699: {'charcode': 699, 'left': -8, 'right': 8, 'lines': [[]]},
-700: {'charcode': 700, 'left': -10, 'right': 10, 'lines': [[(-1, -12),
-(-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9),
-(1, 9), (4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12),
-(-1, -12)]]}, 701: {'charcode': 701, 'left': -10, 'right': 10, 'lines':
-[[(-4, -8), (-2, -9), (1, -12), (1, 9)]]}, 702: {'charcode': 702, 'left':
--10, 'right': 10, 'lines': [[(-6, -7), (-6, -8), (-5, -10), (-4, -11),
-(-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3,
--1), (-7, 9), (7, 9)]]}, 703: {'charcode': 703, 'left': -10, 'right': 10,
-'lines': [[(-5, -12), (6, -12), (0, -4), (3, -4), (5, -3), (6, -2), (7,
-1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5)]]},
-704: {'charcode': 704, 'left': -10, 'right': 10, 'lines': [[(3, -12), (-7,
-2), (8, 2)], [(3, -12), (3, 9)]]}, 705: {'charcode': 705, 'left': -10,
-'right': 10, 'lines': [[(5, -12), (-5, -12), (-6, -3), (-5, -4), (-2,
--5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9),
-(-2, 9), (-5, 8), (-6, 7), (-7, 5)]]}, 706: {'charcode': 706, 'left': -10,
-'right': 10, 'lines': [[(6, -9), (5, -11), (2, -12), (0, -12), (-3, -11),
-(-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8),
-(6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3),
-(-5, -1), (-6, 2)]]}, 707: {'charcode': 707, 'left': -10, 'right': 10,
-'lines': [[(7, -12), (-3, 9)], [(-7, -12), (7, -12)]]}, 708: {'charcode':
-708, 'left': -10, 'right': 10, 'lines': [[(-2, -12), (-5, -11), (-6, -9),
-(-6, -7), (-5, -5), (-3, -4), (1, -3), (4, -2), (6, 0), (7, 2), (7, 5),
-(6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 2), (-6,
-0), (-4, -2), (-1, -3), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11),
-(2, -12), (-2, -12)]]}, 709: {'charcode': 709, 'left': -10, 'right': 10,
-'lines': [[(6, -5), (5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0), (-6, -2),
-(-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12), (3, -11),
-(5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5, 8), (-6,
-6)]]}, 710: {'charcode': 710, 'left': -5, 'right': 5, 'lines': [[(0, 7),
-(-1, 8), (0, 9), (1, 8), (0, 7)]]}, 711: {'charcode': 711, 'left': -5,
-'right': 5, 'lines': [[(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10),
-(0, 12), (-1, 13)]]}, 712: {'charcode': 712, 'left': -5, 'right': 5,
-'lines': [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)], [(0, 7),
-(-1, 8), (0, 9), (1, 8), (0, 7)]]}, 713: {'charcode': 713, 'left': -5,
-'right': 5, 'lines': [[(0, -5), (-1, -4), (0, -3), (1, -4), (0, -5)],
-[(1, 8), (0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]},
-714: {'charcode': 714, 'left': -5, 'right': 5, 'lines': [[(0, -12),
-(0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]}, 715: {'charcode':
-715, 'left': -9, 'right': 9, 'lines': [[(-6, -7), (-6, -8), (-5, -10),
-(-4, -11), (-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6),
-(5, -4), (4, -3), (0, -1), (0, 2)], [(0, 7), (-1, 8), (0, 9), (1, 8),
-(0, 7)]]}, 716: {'charcode': 716, 'left': -4, 'right': 4, 'lines': [[(0,
--12), (0, -5)]]}, 717: {'charcode': 717, 'left': -8, 'right': 8, 'lines':
-[[(-4, -12), (-4, -5)], [(4, -12), (4, -5)]]}, 718: {'charcode': 718,
-'left': -7, 'right': 7, 'lines': [[(-1, -12), (-3, -11), (-4, -9), (-4,
--7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11),
-(1, -12), (-1, -12)]]}, 719: {'charcode': 719, 'left': -10, 'right': 10,
-'lines': [[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(7, -9), (5, -11),
-(2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4),
-(-3, -3), (3, -1), (5, 0), (6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2,
-9), (-5, 8), (-7, 6)]]}, 720: {'charcode': 720, 'left': -11, 'right':
-11, 'lines': [[(9, -16), (-9, 16)]]}, 721: {'charcode': 721, 'left': -7,
-'right': 7, 'lines': [[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2),
-(-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)]]}, 722: {'charcode': 722,
-'left': -7, 'right': 7, 'lines': [[(-4, -16), (-2, -14), (0, -11),
-(2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)]]},
-723: {'charcode': 723, 'left': -4, 'right': 4, 'lines': [[(0, -16),
-(0, 16)]]}, 724: {'charcode': 724, 'left': -13, 'right': 13, 'lines':
-[[(-9, 0), (9, 0)]]}, 725: {'charcode': 725, 'left': -13, 'right': 13,
-'lines': [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]}, 726: {'charcode': 726,
-'left': -13, 'right': 13, 'lines': [[(-9, -3), (9, -3)], [(-9, 3), (9,
-3)]]}, 727: {'charcode': 727, 'left': -11, 'right': 11, 'lines': [[(-7,
--7), (7, 7)], [(7, -7), (-7, 7)]]}, 728: {'charcode': 728, 'left': -8,
-'right': 8, 'lines': [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3),
-(-5, 3)]]}, 729: {'charcode': 729, 'left': -5, 'right': 5, 'lines':
-[[(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]}, 730: {'charcode': 730,
-'left': -5, 'right': 5, 'lines': [[(1, -12), (0, -11), (-1, -9), (-1, -7),
-(0, -6), (1, -7), (0, -8)]]}, 731: {'charcode': 731, 'left': -5, 'right':
-5, 'lines': [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7),
-(-1, -6)]]}, 732: {'charcode': 732, 'left': -13, 'right': 13, 'lines':
-[[(3, -5), (6, -2), (9, 0), (6, 2), (3, 5)], [(-9, 0), (9, 0)]]}, 733:
-{'charcode': 733, 'left': -10, 'right': 11, 'lines': [[(1, -16), (-6,
-16)], [(7, -16), (0, 16)], [(-6, -3), (8, -3)], [(-7, 3), (7, 3)]]},
-734: {'charcode': 734, 'left': -13, 'right': 13, 'lines': [[(10, -3),
-(10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8),
-(-2, 9), (-6, 9), (-8, 8), (-9, 7), (-10, 5), (-10, 3), (-9, 1), (-8,
-0), (-1, -4), (0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11),
-(-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6), (5, 8), (7, 9), (9, 9),
-(10, 8), (10, 7)]]}, 735: {'charcode': 735, 'left': -11, 'right': 11,
-'lines': [[(-9, -9), (-8, -7), (-7, -3), (-7, 3), (-8, 7), (-9, 9)],
-[(9, -9), (8, -7), (7, -3), (7, 3), (8, 7), (9, 9)], [(-9, -9), (-7, -8),
-(-3, -7), (3, -7), (7, -8), (9, -9)], [(-9, 9), (-7, 8), (-3, 7), (3,
-7), (7, 8), (9, 9)]]}, 737: {'charcode': 737, 'left': -7, 'right': 7,
-'lines': [[(-3, -16), (-3, 9)], [(3, -16), (3, 9)]]}, 738: {'charcode':
-738, 'left': -12, 'right': 12, 'lines': [[(0, -16), (0, 9)], [(-9, 9),
-(9, 9)]]}, 739: {'charcode': 739, 'left': -12, 'right': 12, 'lines':
-[[(9, -16), (-9, 9), (9, 9)]]}, 740: {'charcode': 740, 'left': -13,
-'right': 13, 'lines': [[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)],
-[(-9, 7), (-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(9, 7), (8, 8), (9, 9),
-(10, 8), (9, 7)]]}, 741: {'charcode': 741, 'left': -12, 'right': 12,
-'lines': [[(0, -10), (-4, -6), (-7, -2), (-8, 1), (-8, 3), (-7, 5), (-5,
-6), (-3, 6), (-1, 5), (0, 3)], [(0, -10), (4, -6), (7, -2), (8, 1), (8,
-3), (7, 5), (5, 6), (3, 6), (1, 5), (0, 3)], [(0, 3), (-1, 7), (-2, 10)],
-[(0, 3), (1, 7), (2, 10)], [(-2, 10), (2, 10)]]}, 742: {'charcode': 742,
-'left': -12, 'right': 12, 'lines': [[(0, -4), (-1, -7), (-2, -9), (-4,
--10), (-5, -10), (-7, -9), (-8, -7), (-8, -3), (-7, 0), (-6, 2), (-4, 5),
-(0, 10)], [(0, -4), (1, -7), (2, -9), (4, -10), (5, -10), (7, -9), (8,
--7), (8, -3), (7, 0), (6, 2), (4, 5), (0, 10)]]}, 743: {'charcode': 743,
-'left': -12, 'right': 12, 'lines': [[(0, -11), (-2, -8), (-6, -3), (-9,
-0)], [(0, -11), (2, -8), (6, -3), (9, 0)], [(-9, 0), (-6, 3), (-2, 8),
-(0, 11)], [(9, 0), (6, 3), (2, 8), (0, 11)]]}, 744: {'charcode': 744,
-'left': -12, 'right': 12, 'lines': [[(0, 2), (2, 5), (4, 6), (6, 6), (8,
-5), (9, 3), (9, 1), (8, -1), (6, -2), (4, -2), (1, -1)], [(1, -1), (3,
--3), (4, -5), (4, -7), (3, -9), (1, -10), (-1, -10), (-3, -9), (-4, -7),
-(-4, -5), (-3, -3), (-1, -1)], [(-1, -1), (-4, -2), (-6, -2), (-8, -1),
-(-9, 1), (-9, 3), (-8, 5), (-6, 6), (-4, 6), (-2, 5), (0, 2)], [(0, 2),
-(-1, 7), (-2, 10)], [(0, 2), (1, 7), (2, 10)], [(-2, 10), (2, 10)]]},
-745: {'charcode': 745, 'left': -12, 'right': 12, 'lines': [[(0, 0),
-(0, 9), (-1, 10)], [(0, 4), (-1, 10)], [(0, -9), (-1, -10), (-3, -10),
-(-4, -9), (-4, -7), (-3, -4), (0, 0)], [(0, -9), (1, -10), (3, -10),
-(4, -9), (4, -7), (3, -4), (0, 0)], [(0, 0), (-4, -3), (-6, -4), (-8,
--4), (-9, -3), (-9, -1), (-8, 0)], [(0, 0), (4, -3), (6, -4), (8, -4),
-(9, -3), (9, -1), (8, 0)], [(0, 0), (-4, 3), (-6, 4), (-8, 4), (-9, 3),
-(-9, 1), (-8, 0)], [(0, 0), (4, 3), (6, 4), (8, 4), (9, 3), (9, 1),
-(8, 0)]]}, 746: {'charcode': 746, 'left': -12, 'right': 12, 'lines':
-[[(-9, 1), (-8, 1), (-6, 2), (-5, 4), (-5, 6), (-6, 8)], [(-9, 1), (-9,
-0), (-8, -1), (-6, -1), (-5, 0), (-4, 2), (-4, 5), (-5, 7), (-6, 8)],
-[(0, -11), (-2, -9), (-3, -6), (-3, -3), (-1, 3), (-1, 6), (-2, 8), (0,
-10)], [(0, -11), (2, -9), (3, -6), (3, -3), (1, 3), (1, 6), (2, 8), (0,
-10)], [(9, 1), (9, 0), (8, -1), (6, -1), (5, 0), (4, 2), (4, 5), (5, 7),
-(6, 8)], [(9, 1), (8, 1), (6, 2), (5, 4), (5, 6), (6, 8)], [(-7, 4), (7,
-4)]]}, 750: {'charcode': 750, 'left': -2, 'right': 1, 'lines': [[(1, 0),
-(0, 1), (-1, 1), (-2, 0), (-2, -1), (-1, -2), (0, -2), (1, -1), (1, 1),
-(0, 3), (-1, 4)], [(-1, -1), (-1, 0), (0, 0), (0, -1), (-1, -1)]]}, 751:
-{'charcode': 751, 'left': -2, 'right': 2, 'lines': [[(-1, -2), (-2, -1),
-(-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1), (1, -2), (-1, -2)], [(0, -1),
-(-1, 0), (0, 1), (1, 0), (0, -1)]]}, 752: {'charcode': 752, 'left': -4,
-'right': 4, 'lines': [[(-2, -3), (2, 3)], [(2, -3), (-2, 3)], [(-4, 0),
-(4, 0)]]}, 753: {'charcode': 753, 'left': -5, 'right': 5, 'lines': [[(0,
--7), (-1, -5), (-3, -2), (-5, 0)], [(0, -7), (1, -5), (3, -2), (5, 0)],
-[(0, -5), (-3, -1)], [(0, -5), (3, -1)], [(0, -3), (-2, -1)], [(0, -3),
-(2, -1)], [(-1, -1), (1, -1)], [(-5, 0), (5, 0)]]}, 754: {'charcode':
-754, 'left': -5, 'right': 5, 'lines': [[(-5, 0), (-5, -1), (-4, -3),
-(-3, -4), (-1, -5), (1, -5), (3, -4), (4, -3), (5, -1), (5, 0)], [(-2,
--4), (2, -4)], [(-3, -3), (3, -3)], [(-4, -2), (4, -2)], [(-4, -1), (4,
--1)], [(-5, 0), (5, 0)]]}, 755: {'charcode': 755, 'left': -6, 'right':
-0, 'lines': [[(-6, -12), (-6, 0), (0, 0), (-6, -12)], [(-6, -9), (-2,
--1)], [(-6, -6), (-3, 0)], [(-6, -3), (-5, -1)]]}, 756: {'charcode': 756,
-'left': -5, 'right': 5, 'lines': [[(0, -7), (-1, -5), (-3, -2), (-5, 0)],
-[(0, -7), (1, -5), (3, -2), (5, 0)]]}, 757: {'charcode': 757, 'left':
--5, 'right': 5, 'lines': [[(5, 0), (5, -1), (4, -3), (3, -4), (1, -5),
-(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 0)]]}, 758: {'charcode':
-758, 'left': -11, 'right': 11, 'lines': [[(11, 0), (11, -2), (10, -5),
-(8, -8), (5, -10), (2, -11), (-2, -11), (-5, -10), (-8, -8), (-10, -5),
-(-11, -2), (-11, 0)]]}, 759: {'charcode': 759, 'left': -5, 'right': 5,
-'lines': [[(-5, 0), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4),
-(4, 3), (5, 1), (5, 0)]]}, 760: {'charcode': 760, 'left': -6, 'right': 6,
-'lines': [[(-6, -2), (-4, 0), (-1, 1), (1, 1), (4, 0), (6, -2)]]}, 761:
-{'charcode': 761, 'left': 0, 'right': 3, 'lines': [[(0, 3), (2, 2), (3,
-0), (2, -2), (0, -3)]]}, 762: {'charcode': 762, 'left': 0, 'right': 4,
-'lines': [[(0, 0), (3, -2), (4, -4), (4, -6), (3, -7), (2, -7)]]}, 763:
-{'charcode': 763, 'left': -4, 'right': 0, 'lines': [[(0, 0), (-3, -2),
-(-4, -4), (-4, -6), (-3, -7), (-2, -7)]]}, 764: {'charcode': 764,
-'left': -5, 'right': 5, 'lines': [[(5, -10), (4, -11), (2, -12), (-1,
--12), (-3, -11), (-4, -10), (-5, -8), (-5, -6), (-4, -4), (-3, -3),
-(3, 1), (4, 2), (5, 4), (5, 6), (4, 8), (3, 9), (1, 10), (-2, 10),
-(-4, 9), (-5, 8)]]}, 765: {'charcode': 765, 'left': -11, 'right': 11,
-'lines': [[(-9, 5), (-10, 4), (-11, 2), (-11, -1), (-10, -3), (-9,
--4), (-7, -5), (-5, -5), (-3, -4), (-2, -3), (2, 3), (3, 4), (5, 5),
-(7, 5), (9, 4), (10, 3), (11, 1), (11, -2), (10, -4), (9, -5)]]}, 766:
-{'charcode': 766, 'left': -11, 'right': 11, 'lines': [[(0, 0), (2, 3),
-(3, 4), (5, 5), (7, 5), (9, 4), (10, 3), (11, 1), (11, -1), (10, -3),
-(9, -4), (7, -5), (5, -5), (3, -4), (2, -3), (-2, 3), (-3, 4), (-5, 5),
-(-7, 5), (-9, 4), (-10, 3), (-11, 1), (-11, -1), (-10, -3), (-9, -4),
-(-7, -5), (-5, -5), (-3, -4), (-2, -3), (0, 0)]]}, 767: {'charcode': 767,
-'left': -10, 'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(-10, -12),
-(9, -12), (-1, -2), (9, 8)], [(8, 4), (9, 7), (10, 9)], [(8, 4), (8,
-7)], [(5, 7), (8, 7)], [(5, 7), (8, 8), (10, 9)]]}, 768: {'charcode':
-768, 'left': -7, 'right': 7, 'lines': [[(3, -17), (0, -16), (-2, -15),
-(-4, -13), (-6, -10), (-7, -6), (-7, 0), (-6, 3), (-4, 5), (-1, 6), (1,
-6), (4, 5), (6, 3), (7, 0)], [(-7, -2), (-6, -5), (-4, -7), (-1, -8),
-(1, -8), (4, -7), (6, -5), (7, -2), (7, 4), (6, 8), (4, 11), (2, 13),
-(0, 14), (-3, 15)]]}, 796: {'charcode': 796, 'left': -20, 'right': 20,
-'lines': [[(-20, 0), (20, 0)]]}, 797: {'charcode': 797, 'left': -14,
-'right': 14, 'lines': [[(-14, 14), (14, -14)]]}, 798: {'charcode':
-798, 'left': 0, 'right': 0, 'lines': [[(0, -20), (0, 20)]]}, 799:
-{'charcode': 799, 'left': -14, 'right': 14, 'lines': [[(-14, -14),
-(14, 14)]]}, 800: {'charcode': 800, 'left': -14, 'right': 14, 'lines':
-[[(-14, 0), (14, 0)]]}, 801: {'charcode': 801, 'left': -12, 'right': 12,
-'lines': [[(-12, 7), (12, -7)]]}, 802: {'charcode': 802, 'left': -7,
-'right': 7, 'lines': [[(-7, 12), (7, -12)]]}, 803: {'charcode': 803,
-'left': 0, 'right': 0, 'lines': [[(0, -14), (0, 14)]]}, 804: {'charcode':
-804, 'left': -7, 'right': 7, 'lines': [[(-7, -12), (7, 12)]]}, 805:
-{'charcode': 805, 'left': -12, 'right': 12, 'lines': [[(-12, -7), (12,
-7)]]}, 806: {'charcode': 806, 'left': -7, 'right': 7, 'lines': [[(-7,
-0), (7, 0)]]}, 807: {'charcode': 807, 'left': -5, 'right': 5, 'lines':
-[[(-5, 5), (5, -5)]]}, 808: {'charcode': 808, 'left': 0, 'right': 0,
-'lines': [[(0, -7), (0, 7)]]}, 809: {'charcode': 809, 'left': -5,
-'right': 5, 'lines': [[(-5, -5), (5, 5)]]}, 810: {'charcode': 810,
-'left': -11, 'right': 0, 'lines': [[(0, -11), (-2, -11), (-5, -10),
-(-8, -8), (-10, -5), (-11, -2), (-11, 0)]]}, 811: {'charcode': 811,
-'left': -11, 'right': 0, 'lines': [[(-11, 0), (-11, 2), (-10, 5), (-8,
-8), (-5, 10), (-2, 11), (0, 11)]]}, 812: {'charcode': 812, 'left': 0,
-'right': 11, 'lines': [[(0, 11), (2, 11), (5, 10), (8, 8), (10, 5),
-(11, 2), (11, 0)]]}, 813: {'charcode': 813, 'left': 0, 'right': 11,
-'lines': [[(11, 0), (11, -2), (10, -5), (8, -8), (5, -10), (2, -11),
-(0, -11)]]}, 814: {'charcode': 814, 'left': -14, 'right': 14, 'lines':
-[[(-14, -3), (-11, -1), (-7, 1), (-2, 2), (2, 2), (7, 1), (11, -1),
-(14, -3)]]}, 815: {'charcode': 815, 'left': -2, 'right': 3, 'lines':
-[[(3, -14), (1, -11), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (1, 11),
-(3, 14)]]}, 816: {'charcode': 816, 'left': -3, 'right': 2, 'lines':
-[[(-3, -14), (-1, -11), (1, -7), (2, -2), (2, 2), (1, 7), (-1, 11),
-(-3, 14)]]}, 817: {'charcode': 817, 'left': -14, 'right': 14, 'lines':
-[[(-14, 3), (-11, 1), (-7, -1), (-2, -2), (2, -2), (7, -1), (11, 1), (14,
-3)]]}, 818: {'charcode': 818, 'left': -7, 'right': 7, 'lines': [[(0, -8),
-(7, -4), (-7, 4), (0, 8)]]}, 819: {'charcode': 819, 'left': -8, 'right':
-8, 'lines': [[(-8, 0), (-4, -7), (4, 7), (8, 0)]]}, 820: {'charcode':
-820, 'left': -7, 'right': 7, 'lines': [[(-7, 4), (-7, -4), (7, 4), (7,
--4)]]}, 821: {'charcode': 821, 'left': -8, 'right': 8, 'lines': [[(-6,
-6), (-8, -2), (8, 2), (6, -6)]]}, 822: {'charcode': 822, 'left': -8,
-'right': 8, 'lines': [[(-8, 11), (-6, 11), (-3, 10), (-1, 9), (2, 6),
-(3, 4), (4, 1), (4, -3), (3, -6), (2, -8), (1, -9), (-1, -9), (-2, -8),
-(-3, -6), (-4, -3), (-4, 1), (-3, 4), (-2, 6), (1, 9), (3, 10), (6, 11),
-(8, 11)]]}, 823: {'charcode': 823, 'left': -9, 'right': 11, 'lines':
-[[(11, 8), (11, 6), (10, 3), (9, 1), (6, -2), (4, -3), (1, -4), (-3,
--4), (-6, -3), (-8, -2), (-9, -1), (-9, 1), (-8, 2), (-6, 3), (-3, 4),
-(1, 4), (4, 3), (6, 2), (9, -1), (10, -3), (11, -6), (11, -8)]]}, 824:
-{'charcode': 824, 'left': -8, 'right': 8, 'lines': [[(8, -11), (6, -11),
-(3, -10), (1, -9), (-2, -6), (-3, -4), (-4, -1), (-4, 3), (-3, 6), (-2,
-8), (-1, 9), (1, 9), (2, 8), (3, 6), (4, 3), (4, -1), (3, -4), (2, -6),
-(-1, -9), (-3, -10), (-6, -11), (-8, -11)]]}, 825: {'charcode': 825,
-'left': -11, 'right': 9, 'lines': [[(-11, -8), (-11, -6), (-10, -3),
-(-9, -1), (-6, 2), (-4, 3), (-1, 4), (3, 4), (6, 3), (8, 2), (9, 1),
-(9, -1), (8, -2), (6, -3), (3, -4), (-1, -4), (-4, -3), (-6, -2), (-9,
-1), (-10, 3), (-11, 6), (-11, 8)]]}, 826: {'charcode': 826, 'left': -13,
-'right': 9, 'lines': [[(-13, -2), (-12, 0), (-10, 2), (-8, 3), (-5, 4),
-(-1, 4), (3, 3), (6, 1), (8, -2), (9, -4), (8, -6), (5, -6), (1, -5),
-(-1, -4), (-4, -2), (-6, 1), (-7, 4), (-7, 7), (-6, 10), (-5, 12)]]},
-827: {'charcode': 827, 'left': -13, 'right': 7, 'lines': [[(-13, 2),
-(-10, 4), (-7, 5), (-2, 5), (1, 4), (4, 2), (6, -1), (7, -4), (7, -6),
-(6, -7), (4, -7), (1, -6), (-2, -4), (-4, -1), (-5, 2), (-5, 7), (-4,
-10), (-2, 13)]]}, 828: {'charcode': 828, 'left': -3, 'right': 3, 'lines':
-[[(-1, -3), (-3, -1), (-3, 1), (-1, 3), (1, 3), (3, 1), (3, -1), (1, -3),
-(-1, -3)], [(-1, -2), (-2, -1), (-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1),
-(1, -2), (-1, -2)], [(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]}, 829:
-{'charcode': 829, 'left': 0, 'right': 5, 'lines': [[(0, -5), (1, -5),
-(3, -4), (4, -3), (5, -1), (5, 1), (4, 3), (3, 4), (1, 5), (0, 5)]]},
-830: {'charcode': 830, 'left': -14, 'right': 14, 'lines': [[(-14, 0),
-(-8, 0)], [(-3, 0), (3, 0)], [(8, 0), (14, 0)]]}, 831: {'charcode': 831,
-'left': -14, 'right': 14, 'lines': [[(-14, 3), (-14, -3), (14, -3),
-(14, 3)]]}, 832: {'charcode': 832, 'left': -8, 'right': 8, 'lines':
-[[(0, -14), (-8, 0)], [(0, -14), (8, 0)]]}, 833: {'charcode': 833,
-'left': -14, 'right': 14, 'lines': [[(-14, 0), (14, 0)], [(-8, 7),
-(8, 7)], [(-2, 14), (2, 14)]]}, 834: {'charcode': 834, 'left': -14,
-'right': 14, 'lines': [[(-14, 0), (14, 0)], [(-14, 0), (0, 16)], [(14,
-0), (0, 16)]]}, 840: {'charcode': 840, 'left': -7, 'right': 7, 'lines':
-[[(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6),
-(-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6), (1,
--7), (-1, -7)]]}, 841: {'charcode': 841, 'left': -6, 'right': 6, 'lines':
-[[(-6, -6), (-6, 6), (6, 6), (6, -6), (-6, -6)]]}, 842: {'charcode': 842,
-'left': -7, 'right': 7, 'lines': [[(0, -8), (-7, 4), (7, 4), (0, -8)]]},
-843: {'charcode': 843, 'left': -6, 'right': 6, 'lines': [[(0, -10), (-6,
-0), (0, 10), (6, 0), (0, -10)]]}, 844: {'charcode': 844, 'left': -8,
-'right': 8, 'lines': [[(0, -9), (-2, -3), (-8, -3), (-3, 1), (-5, 7),
-(0, 3), (5, 7), (3, 1), (8, -3), (2, -3), (0, -9)]]}, 845: {'charcode':
-845, 'left': -7, 'right': 7, 'lines': [[(0, -7), (0, 7)], [(-7, 0), (7,
-0)]]}, 846: {'charcode': 846, 'left': -5, 'right': 5, 'lines': [[(-5,
--5), (5, 5)], [(5, -5), (-5, 5)]]}, 847: {'charcode': 847, 'left': -5,
-'right': 5, 'lines': [[(0, -6), (0, 6)], [(-5, -3), (5, 3)], [(5, -3),
-(-5, 3)]]}, 850: {'charcode': 850, 'left': -4, 'right': 4, 'lines':
-[[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4), (1, 4), (3,
-3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)], [(-3, -1), (-3, 1)],
-[(-2, -2), (-2, 2)], [(-1, -3), (-1, 3)], [(0, -3), (0, 3)], [(1, -3),
-(1, 3)], [(2, -2), (2, 2)], [(3, -1), (3, 1)]]}, 851: {'charcode': 851,
-'left': -4, 'right': 4, 'lines': [[(-4, -4), (-4, 4), (4, 4), (4, -4),
-(-4, -4)], [(-3, -3), (-3, 3)], [(-2, -3), (-2, 3)], [(-1, -3), (-1,
-3)], [(0, -3), (0, 3)], [(1, -3), (1, 3)], [(2, -3), (2, 3)], [(3, -3),
-(3, 3)]]}, 852: {'charcode': 852, 'left': -5, 'right': 5, 'lines': [[(0,
--6), (-5, 3), (5, 3), (0, -6)], [(0, -3), (-3, 2)], [(0, -3), (3, 2)],
-[(0, 0), (-1, 2)], [(0, 0), (1, 2)]]}, 853: {'charcode': 853, 'left':
--6, 'right': 3, 'lines': [[(-6, 0), (3, 5), (3, -5), (-6, 0)], [(-3, 0),
-(2, 3)], [(-3, 0), (2, -3)], [(0, 0), (2, 1)], [(0, 0), (2, -1)]]}, 854:
-{'charcode': 854, 'left': -5, 'right': 5, 'lines': [[(0, 6), (5, -3),
-(-5, -3), (0, 6)], [(0, 3), (3, -2)], [(0, 3), (-3, -2)], [(0, 0), (1,
--2)], [(0, 0), (-1, -2)]]}, 855: {'charcode': 855, 'left': -3, 'right': 6,
-'lines': [[(6, 0), (-3, -5), (-3, 5), (6, 0)], [(3, 0), (-2, -3)], [(3,
-0), (-2, 3)], [(0, 0), (-2, -1)], [(0, 0), (-2, 1)]]}, 856: {'charcode':
-856, 'left': -6, 'right': 6, 'lines': [[(0, -6), (-4, 5), (6, -2), (-6,
--2), (4, 5), (0, -6)], [(0, 0), (0, -6)], [(0, 0), (-6, -2)], [(0, 0),
-(-4, 5)], [(0, 0), (4, 5)], [(0, 0), (6, -2)]]}, 857: {'charcode': 857,
-'left': 0, 'right': 7, 'lines': [[(0, -7), (0, 7)], [(0, -7), (7, -4),
-(0, -1)], [(1, -5), (4, -4), (1, -3)]]}, 860: {'charcode': 860, 'left':
--5, 'right': 5, 'lines': [[(0, -6), (0, 6)], [(-3, -3), (3, -3)], [(-5,
-3), (-3, 5), (-1, 6), (1, 6), (3, 5), (5, 3)]]}, 861: {'charcode': 861,
-'left': -6, 'right': 6, 'lines': [[(0, -6), (0, 6)], [(-6, -1), (-5, -3),
-(5, -3), (6, -1)], [(-2, 5), (2, 5)]]}, 862: {'charcode': 862, 'left': -7,
-'right': 7, 'lines': [[(-5, -4), (5, 6)], [(5, -4), (-5, 6)], [(-3, -6),
-(-6, -3), (-7, -1)], [(3, -6), (6, -3), (7, -1)]]}, 863: {'charcode':
-863, 'left': -9, 'right': 9, 'lines': [[(-4, -9), (-9, 9)], [(4, -9),
-(9, 9)], [(-5, -5), (9, 9)], [(5, -5), (-9, 9)], [(-4, -9), (4, -9)],
-[(-5, -5), (5, -5)]]}, 864: {'charcode': 864, 'left': -9, 'right': 9,
-'lines': [[(0, -11), (0, 4)], [(-5, -8), (5, -2)], [(5, -8), (-5, -2)],
-[(-9, 4), (-6, 10)], [(9, 4), (6, 10)], [(-9, 4), (9, 4)], [(-6, 10),
-(6, 10)]]}, 865: {'charcode': 865, 'left': -11, 'right': 9, 'lines':
-[[(-5, -8), (1, 4)], [(-7, -2), (1, -6)], [(-11, 10), (9, 10), (9, 0),
-(-11, 10)]]}, 866: {'charcode': 866, 'left': -6, 'right': 6, 'lines':
-[[(-2, -6), (-2, -2), (-6, -2), (-6, 2), (-2, 2), (-2, 6), (2, 6), (2, 2),
-(6, 2), (6, -2), (2, -2), (2, -6), (-2, -6)]]}, 867: {'charcode': 867,
-'left': -7, 'right': 7, 'lines': [[(7, -2), (6, -4), (4, -6), (1, -7),
-(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6),
-(-1, 7), (1, 7), (4, 6), (6, 4), (7, 2)], [(7, -2), (5, -4), (3, -5),
-(1, -5), (-1, -4), (-2, -3), (-3, -1), (-3, 1), (-2, 3), (-1, 4), (1, 5),
-(3, 5), (5, 4), (7, 2)]]}, 868: {'charcode': 868, 'left': -7, 'right':
-7, 'lines': [[(0, -8), (-7, 4), (7, 4), (0, -8)], [(0, 8), (7, -4),
-(-7, -4), (0, 8)]]}, 869: {'charcode': 869, 'left': -11, 'right': 11,
-'lines': [[(-2, -9), (-2, -11), (-1, -12), (1, -12), (2, -11), (2, -9)],
-[(-11, 8), (-10, 6), (-8, 4), (-7, 2), (-6, -2), (-6, -7), (-5, -8),
-(-3, -9), (3, -9), (5, -8), (6, -7), (6, -2), (7, 2), (8, 4), (10, 6),
-(11, 8)], [(-11, 8), (11, 8)], [(-1, 8), (-2, 9), (-1, 10), (1, 10), (2,
-9), (1, 8)]]}, 870: {'charcode': 870, 'left': -8, 'right': 8, 'lines':
-[[(0, -5), (0, 1)], [(0, 1), (-1, 10)], [(0, 1), (1, 10)], [(-1, 10), (1,
-10)], [(0, -5), (-1, -8), (-2, -10), (-4, -11)], [(-1, -8), (-4, -11)],
-[(0, -5), (1, -8), (2, -10), (4, -11)], [(1, -8), (4, -11)], [(0, -5),
-(-4, -7), (-6, -7), (-8, -5)], [(-2, -6), (-6, -6), (-8, -5)], [(0, -5),
-(4, -7), (6, -7), (8, -5)], [(2, -6), (6, -6), (8, -5)], [(0, -5), (-2,
--4), (-3, -3), (-3, 0)], [(0, -5), (-2, -3), (-3, 0)], [(0, -5), (2, -4),
-(3, -3), (3, 0)], [(0, -5), (2, -3), (3, 0)]]}, 871: {'charcode': 871,
-'left': -8, 'right': 8, 'lines': [[(0, -9), (0, -7)], [(0, -4), (0,
--2)], [(0, 1), (0, 3)], [(0, 7), (-1, 10)], [(0, 7), (1, 10)], [(-1,
-10), (1, 10)], [(0, -11), (-1, -9), (-2, -8)], [(0, -11), (1, -9),
-(2, -8)], [(-2, -8), (0, -9), (2, -8)], [(0, -7), (-2, -4), (-4, -3),
-(-5, -4)], [(0, -7), (2, -4), (4, -3), (5, -4)], [(-4, -3), (-2, -3),
-(0, -4), (2, -3), (4, -3)], [(0, -2), (-2, 1), (-4, 2), (-6, 2), (-7,
-0), (-7, 1), (-6, 2)], [(0, -2), (2, 1), (4, 2), (6, 2), (7, 0), (7, 1),
-(6, 2)], [(-4, 2), (-2, 2), (0, 1), (2, 2), (4, 2)], [(0, 3), (-2, 6),
-(-3, 7), (-5, 8), (-6, 8), (-7, 7), (-8, 5), (-8, 7), (-6, 8)], [(0,
-3), (2, 6), (3, 7), (5, 8), (6, 8), (7, 7), (8, 5), (8, 7), (6, 8)],
-[(-5, 8), (-3, 8), (0, 7), (3, 8), (5, 8)]]}, 872: {'charcode': 872,
-'left': -8, 'right': 8, 'lines': [[(0, 7), (-1, 10)], [(0, 7), (1, 10)],
-[(-1, 10), (1, 10)], [(0, 7), (3, 8), (6, 8), (8, 6), (8, 3), (7, 2),
-(5, 2), (7, 0), (8, -3), (7, -5), (5, -6), (3, -5), (4, -8), (3, -10),
-(1, -11), (-1, -11), (-3, -10), (-4, -8), (-3, -5), (-5, -6), (-7, -5),
-(-8, -3), (-7, 0), (-5, 2), (-7, 2), (-8, 3), (-8, 6), (-6, 8), (-3, 8),
-(0, 7)]]}, 873: {'charcode': 873, 'left': -8, 'right': 8, 'lines': [[(0,
-7), (-1, 10)], [(0, 7), (1, 10)], [(-1, 10), (1, 10)], [(0, 7), (4, 6),
-(4, 4), (6, 3), (6, 0), (8, -1), (8, -6), (7, -9), (6, -10), (4, -10),
-(2, -11), (-2, -11), (-4, -10), (-6, -10), (-7, -9), (-8, -6), (-8, -1),
-(-6, 0), (-6, 3), (-4, 4), (-4, 6), (0, 7)]]}, 874: {'charcode': 874,
-'left': -9, 'right': 9, 'lines': [[(-9, -2), (-7, 0)], [(-6, -7), (-4,
--2)], [(0, -11), (0, -3)], [(6, -7), (4, -2)], [(9, -2), (7, 0)]]}, 899:
-{'charcode': 899, 'left': -1, 'right': 1, 'lines': [[(0, -1), (-1, 0),
-(0, 1), (1, 0), (0, -1)]]}, 900: {'charcode': 900, 'left': -2, 'right': 2,
-'lines': [[(-1, -2), (-2, -1), (-2, 1), (-1, 2), (1, 2), (2, 1), (2, -1),
-(1, -2), (-1, -2)]]}, 901: {'charcode': 901, 'left': -4, 'right': 4,
-'lines': [[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4),
-(1, 4), (3, 3), (4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)]]}, 902:
-{'charcode': 902, 'left': -5, 'right': 5, 'lines': [[(-1, -5), (-3, -4),
-(-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4),
-(4, 3), (5, 1), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)]]}, 903:
-{'charcode': 903, 'left': -7, 'right': 7, 'lines': [[(-1, -7), (-4,
--6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7),
-(4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6), (1, -7), (-1, -7)]]},
-904: {'charcode': 904, 'left': -11, 'right': 11, 'lines': [[(-2, -11),
-(-5, -10), (-8, -8), (-10, -5), (-11, -2), (-11, 2), (-10, 5), (-8, 8),
-(-5, 10), (-2, 11), (2, 11), (5, 10), (8, 8), (10, 5), (11, 2), (11, -2),
-(10, -5), (8, -8), (5, -10), (2, -11), (-2, -11)]]}, 905: {'charcode':
-905, 'left': -17, 'right': 17, 'lines': [[(-2, -17), (-6, -16), (-8,
--15), (-11, -13), (-13, -11), (-15, -8), (-16, -6), (-17, -2), (-17,
-2), (-16, 6), (-15, 8), (-13, 11), (-11, 13), (-8, 15), (-6, 16), (-2,
-17), (2, 17), (6, 16), (8, 15), (11, 13), (13, 11), (15, 8), (16, 6),
-(17, 2), (17, -2), (16, -6), (15, -8), (13, -11), (11, -13), (8, -15),
-(6, -16), (2, -17), (-2, -17)]]}, 906: {'charcode': 906, 'left': -22,
-'right': 22, 'lines': [[(-2, -22), (-7, -21), (-11, -19), (-14, -17),
-(-17, -14), (-19, -11), (-21, -7), (-22, -2), (-22, 2), (-21, 7), (-19,
-11), (-17, 14), (-14, 17), (-11, 19), (-7, 21), (-2, 22), (2, 22), (7,
-21), (11, 19), (14, 17), (17, 14), (19, 11), (21, 7), (22, 2), (22, -2),
-(21, -7), (19, -11), (17, -14), (14, -17), (11, -19), (7, -21), (2, -22),
-(-2, -22)]]}, 907: {'charcode': 907, 'left': -41, 'right': 41, 'lines':
-[[(-3, -41), (-9, -40), (-13, -39), (-18, -37), (-23, -34), (-27, -31),
-(-31, -27), (-34, -23), (-37, -18), (-39, -13), (-40, -9), (-41, -3),
-(-41, 3), (-40, 9), (-39, 13), (-37, 18), (-34, 23), (-31, 27), (-27,
-31), (-23, 34), (-18, 37), (-13, 39), (-9, 40), (-3, 41), (3, 41),
-(9, 40), (13, 39), (18, 37), (23, 34), (27, 31), (31, 27), (34, 23),
-(37, 18), (39, 13), (40, 9), (41, 3), (41, -3), (40, -9), (39, -13),
-(37, -18), (34, -23), (31, -27), (27, -31), (23, -34), (18, -37),
-(13, -39), (9, -40), (3, -41), (-3, -41)]]}, 908: {'charcode': 908,
-'left': -20, 'right': 20, 'lines': [[(0, -17), (-2, -15), (-5, -14),
-(-8, -14), (-11, -15), (-13, -17), (-20, -10), (-18, -8), (-17, -5),
-(-17, 8), (-16, 11), (-14, 13), (-11, 14), (-5, 14), (-2, 15), (0, 17)],
-[(0, -17), (2, -15), (5, -14), (8, -14), (11, -15), (13, -17), (20, -10),
-(18, -8), (17, -5), (17, 8), (16, 11), (14, 13), (11, 14), (5, 14),
-(2, 15), (0, 17)]]}, 909: {'charcode': 909, 'left': -17, 'right': 17,
-'lines': [[(0, -17), (-2, -15), (-5, -14), (-8, -14), (-11, -15), (-13,
--17), (-16, -11), (-17, -7), (-17, -2), (-16, 2), (-14, 6), (-11, 10),
-(-6, 14), (0, 17)], [(0, -17), (2, -15), (5, -14), (8, -14), (11, -15),
-(13, -17), (16, -11), (17, -7), (17, -2), (16, 2), (14, 6), (11, 10), (6,
-14), (0, 17)], [(-16, -10), (16, -10)]]}, 997: {'charcode': 997, 'left':
--5, 'right': 5, 'lines': [[(-5, 6), (5, 6)]]}, 998: {'charcode': 998,
-'left': -8, 'right': 8, 'lines': [[(-8, 8), (8, 8)]]}, 999: {'charcode':
-999, 'left': -8, 'right': 8, 'lines': [[(-8, 11), (8, 11)]]}, 1001:
-{'charcode': 1001, 'left': -7, 'right': 7, 'lines': [[(0, -7), (-5, 6)],
-[(0, -4), (4, 6)], [(0, -7), (5, 6)], [(-3, 2), (2, 2)], [(-7, 6), (-2,
-6)], [(2, 6), (7, 6)]]}, 1002: {'charcode': 1002, 'left': -8, 'right':
-8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-6, -7), (1,
--7), (4, -6), (5, -4), (4, -2), (1, -1)], [(1, -7), (3, -6), (4, -4),
-(3, -2), (1, -1)], [(-3, -1), (1, -1), (4, 0), (5, 2), (5, 3), (4, 5),
-(1, 6), (-6, 6)], [(1, -1), (3, 0), (4, 2), (4, 3), (3, 5), (1, 6)]]},
-1003: {'charcode': 1003, 'left': -7, 'right': 7, 'lines': [[(4, -6), (5,
--7), (5, -3), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2),
-(-5, 1), (-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5), (5, 3)], [(-1, -7),
-(-3, -5), (-4, -2), (-4, 1), (-3, 4), (-1, 6)]]}, 1004: {'charcode':
-1004, 'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7),
-(-3, 6)], [(-6, -7), (1, -7), (4, -6), (5, -5), (6, -2), (6, 1), (5, 4),
-(4, 5), (1, 6), (-6, 6)], [(1, -7), (3, -6), (4, -5), (5, -2), (5, 1),
-(4, 4), (3, 5), (1, 6)]]}, 1005: {'charcode': 1005, 'left': -8, 'right':
-7, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(1, -3), (1, 1)],
-[(-6, -7), (4, -7), (4, -3), (3, -7)], [(-3, -1), (1, -1)], [(-6, 6), (4,
-6), (4, 2), (3, 6)]]}, 1006: {'charcode': 1006, 'left': -8, 'right': 6,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(1, -3), (1, 1)],
-[(-6, -7), (4, -7), (4, -3), (3, -7)], [(-3, -1), (1, -1)], [(-6, 6),
-(-1, 6)]]}, 1007: {'charcode': 1007, 'left': -7, 'right': 9, 'lines':
-[[(4, -6), (5, -7), (5, -3), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4,
--5), (-5, -2), (-5, 1), (-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5)], [(-1,
--7), (-3, -5), (-4, -2), (-4, 1), (-3, 4), (-1, 6)], [(2, 6), (3, 5),
-(4, 3)], [(4, 1), (4, 6)], [(5, 1), (5, 6)], [(2, 1), (7, 1)]]}, 1008:
-{'charcode': 1008, 'left': -8, 'right': 9, 'lines': [[(-4, -7), (-4, 6)],
-[(-3, -7), (-3, 6)], [(4, -7), (4, 6)], [(5, -7), (5, 6)], [(-6, -7),
-(-1, -7)], [(2, -7), (7, -7)], [(-3, -1), (4, -1)], [(-6, 6), (-1, 6)],
-[(2, 6), (7, 6)]]}, 1009: {'charcode': 1009, 'left': -4, 'right': 5,
-'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-2, -7), (3, -7)],
-[(-2, 6), (3, 6)]]}, 1010: {'charcode': 1010, 'left': -6, 'right': 6,
-'lines': [[(1, -7), (1, 3), (0, 5), (-1, 6)], [(2, -7), (2, 3), (1,
-5), (-1, 6), (-2, 6), (-4, 5), (-5, 3), (-4, 2), (-3, 3), (-4, 4)],
-[(-1, -7), (4, -7)]]}, 1011: {'charcode': 1011, 'left': -8, 'right': 8,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(5, -7), (-3, 1)],
-[(-1, -1), (4, 6)], [(0, -1), (5, 6)], [(-6, -7), (-1, -7)], [(2, -7),
-(7, -7)], [(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]}, 1012: {'charcode':
-1012, 'left': -7, 'right': 6, 'lines': [[(-3, -7), (-3, 6)], [(-2, -7),
-(-2, 6)], [(-5, -7), (0, -7)], [(-5, 6), (5, 6), (5, 2), (4, 6)]]},
-1013: {'charcode': 1013, 'left': -9, 'right': 10, 'lines': [[(-5, -7),
-(-5, 6)], [(-4, -4), (0, 6)], [(-4, -7), (0, 3)], [(5, -7), (0, 6)],
-[(5, -7), (5, 6)], [(6, -7), (6, 6)], [(-7, -7), (-4, -7)], [(5, -7),
-(8, -7)], [(-7, 6), (-3, 6)], [(3, 6), (8, 6)]]}, 1014: {'charcode': 1014,
-'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -5), (4, 6)],
-[(-3, -7), (4, 4)], [(4, -7), (4, 6)], [(-6, -7), (-3, -7)], [(2, -7),
-(6, -7)], [(-6, 6), (-2, 6)]]}, 1015: {'charcode': 1015, 'left': -7,
-'right': 8, 'lines': [[(-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1),
-(-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5), (5, 4), (6, 1), (6, -2),
-(5, -5), (4, -6), (2, -7), (-1, -7)], [(-1, -7), (-3, -5), (-4, -2),
-(-4, 1), (-3, 4), (-1, 6)], [(2, 6), (4, 4), (5, 1), (5, -2), (4, -5),
-(2, -7)]]}, 1016: {'charcode': 1016, 'left': -8, 'right': 7, 'lines':
-[[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-6, -7), (1, -7), (4, -6),
-(5, -4), (5, -3), (4, -1), (1, 0), (-3, 0)], [(1, -7), (3, -6), (4, -4),
-(4, -3), (3, -1), (1, 0)], [(-6, 6), (-1, 6)]]}, 1017: {'charcode': 1017,
-'left': -7, 'right': 8, 'lines': [[(-1, -7), (-3, -6), (-4, -5), (-5, -2),
-(-5, 1), (-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5), (5, 4), (6, 1), (6,
--2), (5, -5), (4, -6), (2, -7), (-1, -7)], [(-1, -7), (-3, -5), (-4, -2),
-(-4, 1), (-3, 4), (-1, 6)], [(2, 6), (4, 4), (5, 1), (5, -2), (4, -5),
-(2, -7)], [(-2, 5), (-2, 3), (-1, 2), (1, 2), (2, 3), (3, 8), (4, 9),
-(5, 9), (6, 8)], [(2, 3), (3, 6), (4, 8), (5, 9)]]}, 1018: {'charcode':
-1018, 'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7),
-(-3, 6)], [(-6, -7), (1, -7), (4, -6), (5, -4), (5, -3), (4, -1), (1, 0),
-(-3, 0)], [(1, -7), (3, -6), (4, -4), (4, -3), (3, -1), (1, 0)], [(-6,
-6), (-1, 6)], [(1, 0), (2, 1), (3, 5), (4, 6), (5, 6), (6, 5)], [(1, 0),
-(3, 1), (4, 5), (5, 6)]]}, 1019: {'charcode': 1019, 'left': -7, 'right':
-8, 'lines': [[(4, -5), (5, -7), (5, -3), (4, -5), (3, -6), (1, -7),
-(-1, -7), (-3, -6), (-4, -5), (-4, -3), (-3, -2), (-1, -1), (2, 0),
-(4, 1), (5, 2)], [(-4, -4), (-3, -3), (-1, -2), (2, -1), (4, 0), (5,
-1), (5, 4), (4, 5), (2, 6), (0, 6), (-2, 5), (-3, 4), (-4, 2), (-4, 6),
-(-3, 4)]]}, 1020: {'charcode': 1020, 'left': -7, 'right': 8, 'lines':
-[[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-4, -7), (-5, -3), (-5, -7),
-(6, -7), (6, -3), (5, -7)], [(-2, 6), (3, 6)]]}, 1021: {'charcode': 1021,
-'left': -8, 'right': 9, 'lines': [[(-4, -7), (-4, 3), (-3, 5), (-1, 6),
-(2, 6), (4, 5), (5, 3), (5, -7)], [(-3, -7), (-3, 3), (-2, 5), (-1, 6)],
-[(-6, -7), (-1, -7)], [(3, -7), (7, -7)]]}, 1022: {'charcode': 1022,
-'left': -7, 'right': 7, 'lines': [[(-5, -7), (0, 6)], [(-4, -7), (0,
-3)], [(5, -7), (0, 6)], [(-7, -7), (-2, -7)], [(2, -7), (7, -7)]]},
-1023: {'charcode': 1023, 'left': -9, 'right': 9, 'lines': [[(-6, -7),
-(-3, 6)], [(-5, -7), (-3, 2)], [(0, -7), (-3, 6)], [(0, -7), (3, 6)],
-[(1, -7), (3, 2)], [(6, -7), (3, 6)], [(-8, -7), (-3, -7)], [(4, -7),
-(8, -7)]]}, 1024: {'charcode': 1024, 'left': -7, 'right': 8, 'lines':
-[[(-4, -7), (4, 6)], [(-3, -7), (5, 6)], [(5, -7), (-4, 6)], [(-6, -7),
-(-1, -7)], [(2, -7), (7, -7)], [(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]},
-1025: {'charcode': 1025, 'left': -6, 'right': 7, 'lines': [[(-4, -7), (0,
-0), (0, 6)], [(-3, -7), (1, 0)], [(5, -7), (1, 0), (1, 6)], [(-6, -7),
-(-1, -7)], [(2, -7), (7, -7)], [(-2, 6), (3, 6)]]}, 1026: {'charcode':
-1026, 'left': -6, 'right': 7, 'lines': [[(4, -7), (-4, 6)], [(5, -7),
-(-3, 6)], [(-3, -7), (-4, -3), (-4, -7), (5, -7)], [(-4, 6), (5, 6), (5,
-2), (4, 6)]]}, 1027: {'charcode': 1027, 'left': -7, 'right': 7, 'lines':
-[[(0, -7), (-5, 6)], [(0, -4), (4, 6)], [(0, -7), (5, 6)], [(-3, 2), (2,
-2)], [(-7, 6), (-2, 6)], [(2, 6), (7, 6)]]}, 1028: {'charcode': 1028,
-'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3,
-6)], [(-6, -7), (1, -7), (4, -6), (5, -4), (4, -2), (1, -1)], [(1, -7),
-(3, -6), (4, -4), (3, -2), (1, -1)], [(-3, -1), (1, -1), (4, 0), (5, 2),
-(5, 3), (4, 5), (1, 6), (-6, 6)], [(1, -1), (3, 0), (4, 2), (4, 3), (3,
-5), (1, 6)]]}, 1029: {'charcode': 1029, 'left': -7, 'right': 6, 'lines':
-[[(-3, -7), (-3, 6)], [(-2, -7), (-2, 6)], [(-5, -7), (5, -7), (5, -3),
-(4, -7)], [(-5, 6), (0, 6)]]}, 1030: {'charcode': 1030, 'left': -7,
-'right': 7, 'lines': [[(0, -7), (-6, 6)], [(0, -5), (5, 6)], [(0, -7),
-(6, 6)], [(-5, 5), (4, 5)], [(-6, 6), (6, 6)]]}, 1031: {'charcode': 1031,
-'left': -8, 'right': 7, 'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3,
-6)], [(1, -3), (1, 1)], [(-6, -7), (4, -7), (4, -3), (3, -7)], [(-3, -1),
-(1, -1)], [(-6, 6), (4, 6), (4, 2), (3, 6)]]}, 1032: {'charcode': 1032,
-'left': -6, 'right': 7, 'lines': [[(4, -7), (-4, 6)], [(5, -7), (-3,
-6)], [(-3, -7), (-4, -3), (-4, -7), (5, -7)], [(-4, 6), (5, 6), (5, 2),
-(4, 6)]]}, 1033: {'charcode': 1033, 'left': -8, 'right': 9, 'lines':
-[[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(4, -7), (4, 6)], [(5, -7),
-(5, 6)], [(-6, -7), (-1, -7)], [(2, -7), (7, -7)], [(-3, -1), (4, -1)],
-[(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]}, 1034: {'charcode': 1034, 'left':
--7, 'right': 8, 'lines': [[(-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5,
-1), (-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5), (5, 4), (6, 1), (6, -2),
-(5, -5), (4, -6), (2, -7), (-1, -7)], [(-1, -7), (-3, -5), (-4, -2),
-(-4, 1), (-3, 4), (-1, 6)], [(2, 6), (4, 4), (5, 1), (5, -2), (4, -5),
-(2, -7)], [(-1, -3), (-1, 2)], [(2, -3), (2, 2)], [(-1, -1), (2, -1)],
-[(-1, 0), (2, 0)]]}, 1035: {'charcode': 1035, 'left': -4, 'right': 5,
-'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-2, -7), (3, -7)],
-[(-2, 6), (3, 6)]]}, 1036: {'charcode': 1036, 'left': -8, 'right': 8,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(5, -7), (-3, 1)],
-[(-1, -1), (4, 6)], [(0, -1), (5, 6)], [(-6, -7), (-1, -7)], [(2, -7),
-(7, -7)], [(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]}, 1037: {'charcode':
-1037, 'left': -7, 'right': 7, 'lines': [[(0, -7), (-5, 6)], [(0, -4),
-(4, 6)], [(0, -7), (5, 6)], [(-7, 6), (-2, 6)], [(2, 6), (7, 6)]]},
-1038: {'charcode': 1038, 'left': -9, 'right': 10, 'lines': [[(-5, -7),
-(-5, 6)], [(-4, -4), (0, 6)], [(-4, -7), (0, 3)], [(5, -7), (0, 6)],
-[(5, -7), (5, 6)], [(6, -7), (6, 6)], [(-7, -7), (-4, -7)], [(5, -7),
-(8, -7)], [(-7, 6), (-3, 6)], [(3, 6), (8, 6)]]}, 1039: {'charcode': 1039,
-'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4, 6)], [(-3, -5), (4, 6)],
-[(-3, -7), (4, 4)], [(4, -7), (4, 6)], [(-6, -7), (-3, -7)], [(2, -7),
-(6, -7)], [(-6, 6), (-2, 6)]]}, 1040: {'charcode': 1040, 'left': -8,
-'right': 8, 'lines': [[(-5, -8), (-6, -5)], [(6, -8), (5, -5)], [(-2,
--2), (-3, 1)], [(3, -2), (2, 1)], [(-5, 4), (-6, 7)], [(6, 4), (5, 7)],
-[(-5, -7), (5, -7)], [(-5, -6), (5, -6)], [(-2, -1), (2, -1)], [(-2,
-0), (2, 0)], [(-5, 5), (5, 5)], [(-5, 6), (5, 6)]]}, 1041: {'charcode':
-1041, 'left': -7, 'right': 8, 'lines': [[(-1, -7), (-3, -6), (-4, -5),
-(-5, -2), (-5, 1), (-4, 4), (-3, 5), (-1, 6), (2, 6), (4, 5), (5, 4),
-(6, 1), (6, -2), (5, -5), (4, -6), (2, -7), (-1, -7)], [(-1, -7), (-3,
--5), (-4, -2), (-4, 1), (-3, 4), (-1, 6)], [(2, 6), (4, 4), (5, 1), (5,
--2), (4, -5), (2, -7)]]}, 1042: {'charcode': 1042, 'left': -8, 'right': 9,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(4, -7), (4, 6)],
-[(5, -7), (5, 6)], [(-6, -7), (7, -7)], [(-6, 6), (-1, 6)], [(2, 6),
-(7, 6)]]}, 1043: {'charcode': 1043, 'left': -8, 'right': 7, 'lines':
-[[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-6, -7), (1, -7), (4, -6),
-(5, -4), (5, -3), (4, -1), (1, 0), (-3, 0)], [(1, -7), (3, -6), (4, -4),
-(4, -3), (3, -1), (1, 0)], [(-6, 6), (-1, 6)]]}, 1044: {'charcode': 1044,
-'left': -7, 'right': 9, 'lines': [[(-5, -7), (0, -1)], [(-4, -7), (1,
--1), (-5, 6)], [(-5, -7), (5, -7), (6, -3), (4, -7)], [(-4, 5), (5, 5)],
-[(-5, 6), (5, 6), (6, 2), (4, 6)]]}, 1045: {'charcode': 1045, 'left': -7,
-'right': 8, 'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-4, -7),
-(-5, -3), (-5, -7), (6, -7), (6, -3), (5, -7)], [(-2, 6), (3, 6)]]}, 1046:
-{'charcode': 1046, 'left': -7, 'right': 8, 'lines': [[(-5, -3), (-4, -6),
-(-3, -7), (-2, -7), (-1, -6), (0, -3), (0, 6)], [(6, -3), (5, -6), (4,
--7), (3, -7), (2, -6), (1, -3), (1, 6)], [(-5, -3), (-4, -5), (-3, -6),
-(-2, -6), (-1, -5), (0, -3)], [(6, -3), (5, -5), (4, -6), (3, -6), (2,
--5), (1, -3)], [(-2, 6), (3, 6)]]}, 1047: {'charcode': 1047, 'left': -7,
-'right': 8, 'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-1, -4),
-(-4, -3), (-5, -1), (-5, 0), (-4, 2), (-1, 3), (2, 3), (5, 2), (6, 0),
-(6, -1), (5, -3), (2, -4), (-1, -4)], [(-1, -4), (-3, -3), (-4, -1),
-(-4, 0), (-3, 2), (-1, 3)], [(2, 3), (4, 2), (5, 0), (5, -1), (4, -3),
-(2, -4)], [(-2, -7), (3, -7)], [(-2, 6), (3, 6)]]}, 1048: {'charcode':
-1048, 'left': -7, 'right': 8, 'lines': [[(-4, -7), (4, 6)], [(-3, -7),
-(5, 6)], [(5, -7), (-4, 6)], [(-6, -7), (-1, -7)], [(2, -7), (7, -7)],
-[(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]}, 1049: {'charcode': 1049, 'left':
--8, 'right': 9, 'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-6, -2),
-(-5, -3), (-4, -3), (-3, 1), (-1, 3)], [(2, 3), (4, 1), (5, -3), (6, -3),
-(7, -2)], [(-5, -3), (-4, 0), (-3, 2), (-1, 3), (2, 3), (4, 2), (5, 0),
-(6, -3)], [(-2, -7), (3, -7)], [(-2, 6), (3, 6)]]}, 1050: {'charcode':
-1050, 'left': -7, 'right': 8, 'lines': [[(-5, 4), (-4, 6), (-1, 6), (-5,
-0), (-5, -3), (-4, -5), (-3, -6), (-1, -7), (2, -7), (4, -6), (5, -5),
-(6, -3), (6, 0), (2, 6), (5, 6), (6, 4)], [(-3, 3), (-4, 0), (-4, -3),
-(-3, -5), (-1, -7)], [(2, -7), (4, -5), (5, -3), (5, 0), (4, 3)], [(-4,
-5), (-2, 5)], [(3, 5), (5, 5)]]}, 1051: {'charcode': 1051, 'left': -7,
-'right': 7, 'lines': [[(2, -7), (-7, 6)], [(1, -5), (2, 6)], [(2, -7),
-(3, 6)], [(-4, 2), (2, 2)], [(-9, 6), (-4, 6)], [(0, 6), (5, 6)]]},
-1052: {'charcode': 1052, 'left': -8, 'right': 7, 'lines': [[(-2, -7),
-(-6, 6)], [(-1, -7), (-5, 6)], [(-4, -7), (3, -7), (5, -6), (5, -4),
-(4, -2), (1, -1)], [(3, -7), (4, -6), (4, -4), (3, -2), (1, -1)],
-[(-3, -1), (0, -1), (2, 0), (3, 1), (3, 3), (2, 5), (-1, 6), (-8, 6)],
-[(0, -1), (2, 1), (2, 3), (1, 5), (-1, 6)]]}, 1053: {'charcode': 1053,
-'left': -7, 'right': 6, 'lines': [[(4, -6), (5, -6), (6, -7), (5, -4),
-(4, -6), (2, -7), (0, -7), (-2, -6), (-3, -5), (-4, -3), (-5, 0), (-5,
-3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 3)], [(0, -7), (-2, -5), (-3,
--3), (-4, 0), (-4, 4), (-2, 6)]]}, 1054: {'charcode': 1054, 'left':
--8, 'right': 7, 'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)],
-[(-4, -7), (2, -7), (4, -6), (5, -4), (5, -1), (4, 2), (3, 4), (2, 5),
-(-1, 6), (-8, 6)], [(2, -7), (3, -6), (4, -4), (4, -1), (3, 2), (2, 4),
-(1, 5), (-1, 6)]]}, 1055: {'charcode': 1055, 'left': -8, 'right': 7,
-'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)], [(1, -3), (0, 1)],
-[(-4, -7), (6, -7), (5, -4), (5, -7)], [(-3, -1), (0, -1)], [(-8, 6), (2,
-6), (3, 3), (1, 6)]]}, 1056: {'charcode': 1056, 'left': -8, 'right': 6,
-'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)], [(1, -3), (0, 1)],
-[(-4, -7), (6, -7), (5, -4), (5, -7)], [(-3, -1), (0, -1)], [(-8, 6),
-(-3, 6)]]}, 1057: {'charcode': 1057, 'left': -7, 'right': 7, 'lines':
-[[(4, -6), (5, -6), (6, -7), (5, -4), (4, -6), (2, -7), (0, -7),
-(-2, -6), (-3, -5), (-4, -3), (-5, 0), (-5, 3), (-4, 5), (-2, 6), (0,
-6), (2, 5), (3, 4), (4, 1)], [(0, -7), (-2, -5), (-3, -3), (-4, 0),
-(-4, 4), (-2, 6)], [(0, 6), (2, 4), (3, 1)], [(1, 1), (6, 1)]]}, 1058:
-{'charcode': 1058, 'left': -8, 'right': 9, 'lines': [[(-2, -7), (-6, 6)],
-[(-1, -7), (-5, 6)], [(6, -7), (2, 6)], [(7, -7), (3, 6)], [(-4, -7),
-(1, -7)], [(4, -7), (9, -7)], [(-3, -1), (4, -1)], [(-8, 6), (-3, 6)],
-[(0, 6), (5, 6)]]}, 1059: {'charcode': 1059, 'left': -4, 'right': 5,
-'lines': [[(2, -7), (-2, 6)], [(3, -7), (-1, 6)], [(0, -7), (5, -7)],
-[(-4, 6), (1, 6)]]}, 1060: {'charcode': 1060, 'left': -6, 'right': 6,
-'lines': [[(3, -7), (0, 3), (-1, 5), (-2, 6)], [(4, -7), (1, 3), (0,
-5), (-2, 6), (-3, 6), (-5, 5), (-6, 3), (-5, 2), (-4, 3), (-5, 4)],
-[(1, -7), (6, -7)]]}, 1061: {'charcode': 1061, 'left': -8, 'right': 8,
-'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)], [(7, -7), (-3, 0)],
-[(0, -2), (2, 6)], [(1, -2), (3, 6)], [(-4, -7), (1, -7)], [(4, -7),
-(9, -7)], [(-8, 6), (-3, 6)], [(0, 6), (5, 6)]]}, 1062: {'charcode':
-1062, 'left': -7, 'right': 6, 'lines': [[(-1, -7), (-5, 6)], [(0, -7),
-(-4, 6)], [(-3, -7), (2, -7)], [(-7, 6), (3, 6), (4, 3), (2, 6)]]},
-1063: {'charcode': 1063, 'left': -9, 'right': 10, 'lines': [[(-3, -7),
-(-7, 6)], [(-3, -5), (-2, 6)], [(-2, -7), (-1, 4)], [(7, -7), (-2, 6)],
-[(7, -7), (3, 6)], [(8, -7), (4, 6)], [(-5, -7), (-2, -7)], [(7, -7),
-(10, -7)], [(-9, 6), (-5, 6)], [(1, 6), (6, 6)]]}, 1064: {'charcode':
-1064, 'left': -8, 'right': 8, 'lines': [[(-2, -7), (-6, 6)], [(-2, -7),
-(2, 6)], [(-1, -7), (2, 3)], [(6, -7), (2, 6)], [(-4, -7), (-1, -7)],
-[(4, -7), (8, -7)], [(-8, 6), (-4, 6)]]}, 1065: {'charcode': 1065,
-'left': -7, 'right': 7, 'lines': [[(0, -7), (-2, -6), (-3, -5), (-4,
--3), (-5, 0), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4,
-2), (5, -1), (5, -4), (4, -6), (2, -7), (0, -7)], [(0, -7), (-2, -5),
-(-3, -3), (-4, 0), (-4, 4), (-2, 6)], [(0, 6), (2, 4), (3, 2), (4, -1),
-(4, -5), (2, -7)]]}, 1066: {'charcode': 1066, 'left': -8, 'right': 7,
-'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)], [(-4, -7), (3, -7),
-(5, -6), (6, -5), (6, -3), (5, -1), (2, 0), (-3, 0)], [(3, -7), (5, -5),
-(5, -3), (4, -1), (2, 0)], [(-8, 6), (-3, 6)]]}, 1067: {'charcode': 1067,
-'left': -7, 'right': 7, 'lines': [[(0, -7), (-2, -6), (-3, -5), (-4, -3),
-(-5, 0), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4, 2), (5,
--1), (5, -4), (4, -6), (2, -7), (0, -7)], [(0, -7), (-2, -5), (-3, -3),
-(-4, 0), (-4, 4), (-2, 6)], [(0, 6), (2, 4), (3, 2), (4, -1), (4, -5),
-(2, -7)], [(-3, 5), (-3, 4), (-2, 3), (-1, 3), (0, 4), (0, 8), (1, 9),
-(2, 9), (3, 8)], [(0, 4), (1, 8), (2, 9)]]}, 1068: {'charcode': 1068,
-'left': -8, 'right': 8, 'lines': [[(-2, -7), (-6, 6)], [(-1, -7), (-5,
-6)], [(-4, -7), (3, -7), (5, -6), (6, -5), (6, -3), (5, -1), (2, 0),
-(-3, 0)], [(3, -7), (5, -5), (5, -3), (4, -1), (2, 0)], [(1, 0), (2, 5),
-(3, 6), (4, 6), (5, 5)], [(1, 0), (2, 1), (3, 5), (4, 6)], [(-8, 6),
-(-3, 6)]]}, 1069: {'charcode': 1069, 'left': -7, 'right': 8, 'lines':
-[[(5, -6), (6, -6), (7, -7), (6, -4), (5, -6), (3, -7), (0, -7), (-2,
--6), (-3, -5), (-3, -3), (-2, -2), (3, 1), (4, 2)], [(-3, -4), (-2,
--3), (3, 0), (4, 1), (4, 4), (3, 5), (1, 6), (-2, 6), (-4, 5), (-5,
-3), (-6, 6), (-5, 5), (-4, 5)]]}, 1070: {'charcode': 1070, 'left': -7,
-'right': 8, 'lines': [[(2, -7), (-2, 6)], [(3, -7), (-1, 6)], [(-2, -7),
-(-4, -4), (-3, -7), (8, -7), (7, -4), (7, -7)], [(-4, 6), (1, 6)]]},
-1071: {'charcode': 1071, 'left': -8, 'right': 9, 'lines': [[(-2, -7),
-(-5, 3), (-5, 5), (-3, 6), (1, 6), (3, 5), (4, 3), (7, -7)], [(-1, -7),
-(-4, 3), (-4, 5), (-3, 6)], [(-4, -7), (1, -7)], [(5, -7), (9, -7)]]},
-1072: {'charcode': 1072, 'left': -7, 'right': 7, 'lines': [[(-3, -7),
-(-2, 6)], [(-2, -7), (-1, 4)], [(7, -7), (-2, 6)], [(-5, -7), (0, -7)],
-[(4, -7), (9, -7)]]}, 1073: {'charcode': 1073, 'left': -9, 'right': 9,
-'lines': [[(-4, -7), (-5, 6)], [(-3, -7), (-4, 4)], [(2, -7), (-5, 6)],
-[(2, -7), (1, 6)], [(3, -7), (2, 4)], [(8, -7), (1, 6)], [(-6, -7),
-(-1, -7)], [(6, -7), (10, -7)]]}, 1074: {'charcode': 1074, 'left': -7,
-'right': 8, 'lines': [[(-2, -7), (2, 6)], [(-1, -7), (3, 6)], [(7, -7),
-(-6, 6)], [(-4, -7), (1, -7)], [(4, -7), (9, -7)], [(-8, 6), (-3, 6)],
-[(0, 6), (5, 6)]]}, 1075: {'charcode': 1075, 'left': -6, 'right': 7,
-'lines': [[(-2, -7), (0, -1), (-2, 6)], [(-1, -7), (1, -1)], [(7, -7),
-(1, -1), (-1, 6)], [(-4, -7), (1, -7)], [(4, -7), (9, -7)], [(-4, 6),
-(1, 6)]]}, 1076: {'charcode': 1076, 'left': -6, 'right': 7, 'lines':
-[[(6, -7), (-6, 6)], [(7, -7), (-5, 6)], [(-1, -7), (-3, -4), (-2, -7),
-(7, -7)], [(-6, 6), (3, 6), (4, 3), (2, 6)]]}, 1101: {'charcode': 1101,
-'left': -6, 'right': 8, 'lines': [[(-1, -3), (-2, -2), (-2, -1), (-3,
--1), (-3, -2), (-1, -3), (2, -3), (4, -1), (4, 5), (5, 6), (6, 6)],
-[(2, -3), (3, -1), (3, 5), (5, 6)], [(3, 0), (0, 1), (-2, 2), (-3, 3),
-(-3, 5), (-2, 6), (1, 6), (2, 5), (3, 3)], [(0, 1), (-2, 3), (-2, 5),
-(-1, 6)]]}, 1102: {'charcode': 1102, 'left': -8, 'right': 7, 'lines':
-[[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-3, 0), (-2, -2), (0, -3),
-(2, -3), (4, -2), (5, 0), (5, 3), (4, 5), (2, 6), (0, 6), (-2, 5), (-3,
-3)], [(2, -3), (3, -2), (4, 0), (4, 3), (3, 5), (2, 6)], [(-6, -7), (-3,
--7)]]}, 1103: {'charcode': 1103, 'left': -6, 'right': 6, 'lines': [[(4,
--1), (3, -1), (3, 0), (4, 0), (4, -1), (3, -2), (1, -3), (-1, -3), (-3,
--2), (-4, 0), (-4, 3), (-3, 5), (-1, 6), (1, 6), (3, 5), (4, 4)], [(-1,
--3), (-2, -2), (-3, 0), (-3, 3), (-2, 5), (-1, 6)]]}, 1104: {'charcode':
-1104, 'left': -6, 'right': 9, 'lines': [[(4, -7), (4, 6)], [(5, -7),
-(5, 6)], [(4, 0), (3, -2), (1, -3), (-1, -3), (-3, -2), (-4, 0), (-4, 3),
-(-3, 5), (-1, 6), (1, 6), (3, 5), (4, 3)], [(-1, -3), (-2, -2), (-3, 0),
-(-3, 3), (-2, 5), (-1, 6)], [(2, -7), (5, -7)], [(4, 6), (7, 6)]]}, 1105:
-{'charcode': 1105, 'left': -6, 'right': 6, 'lines': [[(-3, 1), (4, 1),
-(4, 0), (3, -2), (1, -3), (-1, -3), (-3, -2), (-4, 0), (-4, 3), (-3, 5),
-(-1, 6), (1, 6), (3, 5), (4, 4)], [(3, 1), (3, -1), (1, -3)], [(-1, -3),
-(-2, -2), (-3, 0), (-3, 3), (-2, 5), (-1, 6)]]}, 1106: {'charcode': 1106,
-'left': -6, 'right': 5, 'lines': [[(2, -7), (3, -6), (3, -5), (4, -5),
-(4, -6), (2, -7), (0, -7), (-2, -5), (-2, 6)], [(0, -7), (-1, -5),
-(-1, 6)], [(-4, -3), (1, -3)], [(-4, 6), (1, 6)]]}, 1107: {'charcode':
-1107, 'left': -6, 'right': 7, 'lines': [[(-1, -3), (-3, -1), (-3, 1),
-(-1, 3), (1, 3), (3, 1), (3, -1), (1, -3), (-1, -3)], [(-1, -3), (-2,
--1), (-2, 1), (-1, 3)], [(1, 3), (2, 1), (2, -1), (1, -3)], [(2, -2),
-(3, -3), (4, -3)], [(-2, 2), (-3, 3), (-3, 6), (-2, 7), (2, 7), (4, 8)],
-[(-3, 5), (-2, 6), (2, 6), (4, 7), (4, 9), (2, 10), (-2, 10), (-4, 9),
-(-4, 7), (-2, 6)]]}, 1108: {'charcode': 1108, 'left': -8, 'right': 9,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-3, 0), (-2, -2),
-(0, -3), (2, -3), (4, -2), (5, 0), (5, 6)], [(2, -3), (3, -2), (4, 0),
-(4, 6)], [(-6, -7), (-3, -7)], [(-6, 6), (-1, 6)], [(2, 6), (7, 6)]]},
-1109: {'charcode': 1109, 'left': -4, 'right': 5, 'lines': [[(0, -7),
-(0, -6), (1, -6), (1, -7), (0, -7)], [(0, -3), (0, 6)], [(1, -3), (1,
-6)], [(-2, -3), (1, -3)], [(-2, 6), (3, 6)]]}, 1110: {'charcode': 1110,
-'left': -4, 'right': 5, 'lines': [[(1, -7), (1, -6), (2, -6), (2, -7),
-(1, -7)], [(1, -3), (1, 8), (0, 10)], [(2, -3), (2, 8), (0, 10), (-2,
-10), (-3, 9), (-3, 8), (-2, 8), (-2, 9), (-3, 9)], [(-1, -3), (2, -3)]]},
-1111: {'charcode': 1111, 'left': -8, 'right': 8, 'lines': [[(-4, -7), (-4,
-6)], [(-3, -7), (-3, 6)], [(5, -3), (-3, 3)], [(0, 1), (4, 6)], [(1, 1),
-(5, 6)], [(-6, -7), (-3, -7)], [(2, -3), (7, -3)], [(-6, 6), (-1, 6)],
-[(2, 6), (7, 6)]]}, 1112: {'charcode': 1112, 'left': -4, 'right': 5,
-'lines': [[(0, -7), (0, 6)], [(1, -7), (1, 6)], [(-2, -7), (1, -7)],
-[(-2, 6), (3, 6)]]}, 1113: {'charcode': 1113, 'left': -12, 'right': 13,
-'lines': [[(-8, -3), (-8, 6)], [(-7, -3), (-7, 6)], [(-7, 0), (-6, -2),
-(-4, -3), (-2, -3), (0, -2), (1, 0), (1, 6)], [(-2, -3), (-1, -2), (0, 0),
-(0, 6)], [(1, 0), (2, -2), (4, -3), (6, -3), (8, -2), (9, 0), (9, 6)],
-[(6, -3), (7, -2), (8, 0), (8, 6)], [(-10, -3), (-7, -3)], [(-10, 6),
-(-5, 6)], [(-2, 6), (3, 6)], [(6, 6), (11, 6)]]}, 1114: {'charcode':
-1114, 'left': -8, 'right': 9, 'lines': [[(-4, -3), (-4, 6)], [(-3, -3),
-(-3, 6)], [(-3, 0), (-2, -2), (0, -3), (2, -3), (4, -2), (5, 0), (5,
-6)], [(2, -3), (3, -2), (4, 0), (4, 6)], [(-6, -3), (-3, -3)], [(-6,
-6), (-1, 6)], [(2, 6), (7, 6)]]}, 1115: {'charcode': 1115, 'left': -6,
-'right': 7, 'lines': [[(-1, -3), (-3, -2), (-4, 0), (-4, 3), (-3, 5),
-(-1, 6), (2, 6), (4, 5), (5, 3), (5, 0), (4, -2), (2, -3), (-1, -3)],
-[(-1, -3), (-2, -2), (-3, 0), (-3, 3), (-2, 5), (-1, 6)], [(2, 6),
-(3, 5), (4, 3), (4, 0), (3, -2), (2, -3)]]}, 1116: {'charcode': 1116,
-'left': -8, 'right': 7, 'lines': [[(-4, -3), (-4, 10)], [(-3, -3), (-3,
-10)], [(-3, 0), (-2, -2), (0, -3), (2, -3), (4, -2), (5, 0), (5, 3),
-(4, 5), (2, 6), (0, 6), (-2, 5), (-3, 3)], [(2, -3), (3, -2), (4, 0),
-(4, 3), (3, 5), (2, 6)], [(-6, -3), (-3, -3)], [(-6, 10), (-1, 10)]]},
-1117: {'charcode': 1117, 'left': -7, 'right': 7, 'lines': [[(3, -3), (3,
-10)], [(4, -3), (4, 10)], [(3, 0), (2, -2), (0, -3), (-2, -3), (-4, -2),
-(-5, 0), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 3)], [(-2, -3),
-(-3, -2), (-4, 0), (-4, 3), (-3, 5), (-2, 6)], [(1, 10), (6, 10)]]},
-1118: {'charcode': 1118, 'left': -7, 'right': 6, 'lines': [[(-3, -3),
-(-3, 6)], [(-2, -3), (-2, 6)], [(-2, 0), (-1, -2), (1, -3), (3, -3),
-(4, -2), (4, -1), (3, -1), (3, -2), (4, -2)], [(-5, -3), (-2, -3)],
-[(-5, 6), (0, 6)]]}, 1119: {'charcode': 1119, 'left': -6, 'right': 7,
-'lines': [[(2, -3), (3, -2), (3, -1), (4, -1), (4, -2), (2, -3), (-1,
--3), (-3, -2), (-3, 0), (-1, 1), (2, 2), (4, 3)], [(-3, -1), (-1, 0),
-(2, 1), (4, 2), (4, 5), (2, 6), (-1, 6), (-3, 5), (-3, 4), (-2, 4),
-(-2, 5), (-1, 6)]]}, 1120: {'charcode': 1120, 'left': -6, 'right': 5,
-'lines': [[(-2, -7), (-2, 4), (0, 6), (2, 6), (3, 5), (3, 4)], [(-1,
--7), (-1, 4), (0, 6)], [(-4, -3), (2, -3)]]}, 1121: {'charcode': 1121,
-'left': -8, 'right': 9, 'lines': [[(-4, -3), (-4, 3), (-3, 5), (-1, 6),
-(1, 6), (3, 5), (4, 3)], [(-3, -3), (-3, 3), (-2, 5), (-1, 6)], [(4, -3),
-(4, 6)], [(5, -3), (5, 6)], [(-6, -3), (-3, -3)], [(2, -3), (5, -3)],
-[(4, 6), (7, 6)]]}, 1122: {'charcode': 1122, 'left': -7, 'right': 7,
-'lines': [[(-4, -3), (0, 6)], [(-3, -3), (0, 4)], [(4, -3), (0, 6)],
-[(-6, -3), (-1, -3)], [(2, -3), (6, -3)]]}, 1123: {'charcode': 1123,
-'left': -9, 'right': 9, 'lines': [[(-6, -3), (-3, 6)], [(-5, -3),
-(-3, 3)], [(0, -3), (-3, 6)], [(0, -3), (3, 6)], [(1, -3), (3, 3)],
-[(6, -3), (3, 6)], [(-8, -3), (-3, -3)], [(4, -3), (8, -3)]]}, 1124:
-{'charcode': 1124, 'left': -7, 'right': 7, 'lines': [[(-4, -3), (3, 6)],
-[(-3, -3), (4, 6)], [(4, -3), (-4, 6)], [(-6, -3), (-1, -3)], [(2, -3),
-(6, -3)], [(-6, 6), (-2, 6)], [(1, 6), (6, 6)]]}, 1125: {'charcode':
-1125, 'left': -7, 'right': 7, 'lines': [[(-4, -3), (0, 6)], [(-3,
--3), (0, 4)], [(4, -3), (0, 6), (-2, 9), (-4, 10), (-5, 10), (-6, 9),
-(-6, 8), (-5, 8), (-5, 9), (-6, 9)], [(-6, -3), (-1, -3)], [(2, -3),
-(6, -3)]]}, 1126: {'charcode': 1126, 'left': -6, 'right': 6, 'lines':
-[[(3, -3), (-4, 6)], [(4, -3), (-3, 6)], [(-3, -3), (-4, -1), (-4, -3),
-(4, -3)], [(-4, 6), (4, 6), (4, 4), (3, 6)]]}, 1127: {'charcode': 1127,
-'left': -7, 'right': 9, 'lines': [[(-1, -3), (-3, -2), (-4, -1), (-5, 1),
-(-5, 3), (-4, 5), (-2, 6), (-1, 6), (1, 5), (3, 3), (5, 0), (6, -3)],
-[(-1, -3), (-3, -1), (-4, 1), (-4, 3), (-3, 5), (-2, 6)], [(-1, -3),
-(1, -3), (3, -2), (5, 5), (6, 6)], [(1, -3), (2, -2), (4, 5), (6, 6),
-(7, 6)]]}, 1128: {'charcode': 1128, 'left': -7, 'right': 6, 'lines':
-[[(0, -7), (-2, -5), (-3, -3), (-5, 3), (-7, 10)], [(-1, -6), (-2, -4),
-(-4, 2), (-6, 10)], [(0, -7), (2, -7), (4, -6), (4, -4), (3, -2), (0,
--1)], [(2, -7), (3, -6), (3, -4), (2, -2), (0, -1)], [(0, -1), (2, 0),
-(3, 2), (3, 4), (2, 5), (0, 6), (-1, 6), (-3, 5), (-4, 2)], [(0, -1),
-(1, 0), (2, 2), (2, 4), (0, 6)]]}, 1129: {'charcode': 1129, 'left': -7,
-'right': 7, 'lines': [[(-6, -1), (-4, -3), (-2, -3), (0, -2), (1, 1),
-(1, 6), (0, 10)], [(-6, -1), (-4, -2), (-2, -2), (0, -1), (1, 1)], [(5,
--3), (4, 0), (1, 6), (-1, 10)]]}, 1130: {'charcode': 1130, 'left': -7,
-'right': 7, 'lines': [[(1, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1),
-(-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4, 2), (4, 0), (3,
--2), (0, -4), (-1, -6), (-1, -7), (0, -8), (2, -8), (3, -7), (4, -5)],
-[(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)], [(0, 6), (2, 4), (3,
-2), (3, -1), (1, -3)], [(-1, -6), (0, -7), (2, -7), (4, -5)]]}, 1131:
-{'charcode': 1131, 'left': -6, 'right': 6, 'lines': [[(4, -2), (2, -3),
-(-1, -3), (-3, -2), (-3, -1), (-2, 0), (0, 1)], [(-1, -3), (-2, -2), (-2,
--1), (0, 1)], [(0, 1), (-3, 2), (-4, 3), (-4, 5), (-2, 6), (1, 6), (3,
-5)], [(0, 1), (-2, 2), (-3, 3), (-3, 5), (-2, 6)]]}, 1132: {'charcode':
-1132, 'left': -6, 'right': 5, 'lines': [[(0, -7), (-1, -6), (-1, -5),
-(1, -4), (4, -4), (4, -5), (1, -4), (-2, -3), (-3, -2), (-4, 0), (-4, 2),
-(-3, 4), (-2, 5), (0, 6), (1, 7), (1, 9), (0, 10), (-2, 10), (-3, 9)],
-[(1, -4), (-1, -3), (-2, -2), (-3, 0), (-3, 2), (-2, 4), (0, 6)]]},
-1133: {'charcode': 1133, 'left': -9, 'right': 7, 'lines': [[(-8, 0),
-(-7, -2), (-6, -3), (-4, -3), (-3, -2), (-3, -1), (-5, 6)], [(-5, -3),
-(-4, -2), (-4, -1), (-6, 6)], [(-3, -1), (-2, -2), (0, -3), (2, -3),
-(4, -2), (4, 0), (1, 10)], [(2, -3), (3, -2), (3, 0), (0, 10)]]}, 1134:
-{'charcode': 1134, 'left': -9, 'right': 7, 'lines': [[(-8, 1), (-7, -1),
-(-6, -2), (-4, -2), (-3, -1), (-3, 4), (-2, 6)], [(-5, -2), (-4, -1),
-(-4, 3), (-3, 5), (-2, 6), (-1, 6), (1, 5), (2, 4), (3, 2), (4, -1),
-(4, -4), (3, -6), (2, -7), (0, -7), (-1, -6), (-1, -4), (0, -2), (3, 0),
-(5, 1)], [(-1, 6), (1, 4), (2, 2), (3, -1), (3, -4), (2, -7)]]}, 1135:
-{'charcode': 1135, 'left': -4, 'right': 5, 'lines': [[(0, -3), (-2, 4),
-(-2, 5), (-1, 6), (1, 6), (3, 5), (4, 3)], [(1, -3), (-1, 4), (-1, 5),
-(0, 6)]]}, 1136: {'charcode': 1136, 'left': -7, 'right': 7, 'lines':
-[[(-3, -3), (-6, 6)], [(-2, -3), (-5, 6)], [(3, -3), (4, -2), (5, -2),
-(4, -3), (2, -3), (0, -1), (-3, 0)], [(-3, 0), (-2, 1), (0, 5), (2, 6),
-(4, 5), (5, 3)], [(-3, 0), (-1, 1), (1, 5), (2, 6)]]}, 1137: {'charcode':
-1137, 'left': -6, 'right': 6, 'lines': [[(-6, -7), (-4, -7), (-2, -6),
-(5, 6)], [(-4, -7), (-3, -6), (4, 6)], [(0, -2), (-5, 6)], [(0, -2),
-(-4, 6)]]}, 1138: {'charcode': 1138, 'left': -7, 'right': 8, 'lines':
-[[(-3, -3), (-7, 10)], [(-2, -3), (-6, 10)], [(-4, 3), (-4, 5), (-3, 6),
-(-1, 6), (1, 5), (2, 4)], [(4, -3), (2, 4), (2, 5), (3, 6), (5, 6), (6,
-5), (7, 3)], [(5, -3), (3, 4), (3, 5), (4, 6)]]}, 1139: {'charcode': 1139,
-'left': -8, 'right': 7, 'lines': [[(-4, -3), (-5, 6)], [(-3, -3), (-4, 3),
-(-5, 6)], [(4, 0), (4, -3), (5, -3), (4, 0), (2, 3), (-1, 5), (-4, 6),
-(-5, 6)], [(-6, -3), (-3, -3)]]}, 1140: {'charcode': 1140, 'left': -5,
-'right': 6, 'lines': [[(0, -7), (-1, -6), (-1, -5), (1, -4), (4, -4)],
-[(2, -4), (-1, -3), (-2, -2), (-2, 0), (0, 1), (3, 1)], [(2, -4), (0, -3),
-(-1, -2), (-1, 0), (0, 1)], [(1, 1), (-2, 2), (-3, 3), (-3, 5), (-1, 6),
-(1, 7), (2, 8), (2, 9), (1, 10), (-1, 10)], [(1, 1), (-1, 2), (-2, 3),
-(-2, 5), (-1, 6)]]}, 1141: {'charcode': 1141, 'left': -7, 'right': 6,
-'lines': [[(-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4, 5), (-2,
-6), (0, 6), (2, 5), (3, 4), (4, 2), (4, 0), (3, -2), (1, -3), (-1, -3)],
-[(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)], [(0, 6), (2, 4), (3, 2),
-(3, -1), (1, -3)]]}, 1142: {'charcode': 1142, 'left': -9, 'right': 8,
-'lines': [[(-2, -2), (-5, 6)], [(-2, -2), (-4, 6)], [(2, -2), (1, 6)],
-[(2, -2), (2, 6)], [(-7, -1), (-5, -3), (6, -3)], [(-7, -1), (-5, -2),
-(6, -2)]]}, 1143: {'charcode': 1143, 'left': -8, 'right': 6, 'lines':
-[[(1, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1), (-8, 10)], [(-1, -3),
-(-3, -1), (-4, 1), (-7, 10)], [(1, -3), (3, -2), (4, 0), (4, 2), (3, 4),
-(2, 5), (0, 6), (-2, 6), (-4, 5), (-5, 3)], [(1, -3), (3, -1), (3, 2),
-(2, 4), (0, 6)]]}, 1144: {'charcode': 1144, 'left': -7, 'right': 9,
-'lines': [[(7, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3),
-(-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4, 2), (4, 0), (3, -2),
-(7, -2)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)], [(0, 6), (2,
-4), (3, 2), (3, -1), (1, -3)]]}, 1145: {'charcode': 1145, 'left': -7,
-'right': 8, 'lines': [[(1, -2), (-1, 6)], [(1, -2), (0, 6)], [(-5, -1),
-(-3, -3), (6, -3)], [(-5, -1), (-3, -2), (6, -2)]]}, 1146: {'charcode':
-1146, 'left': -8, 'right': 6, 'lines': [[(-7, 0), (-6, -2), (-5, -3),
-(-3, -3), (-2, -2), (-2, 0), (-3, 3), (-3, 5), (-2, 6)], [(-4, -3),
-(-3, -2), (-3, 0), (-4, 3), (-4, 5), (-2, 6), (-1, 6), (1, 5), (3, 3),
-(4, 0), (4, -3), (3, -3), (4, -2)]]}, 1147: {'charcode': 1147, 'left':
--7, 'right': 8, 'lines': [[(-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4,
-5), (-2, 6), (0, 6), (3, 5), (5, 3), (6, 0), (6, -2), (5, -3), (3, -3),
-(2, -2), (1, 0), (0, 3), (-3, 10)], [(-5, 3), (-4, 4), (-2, 5), (0, 5),
-(3, 4), (5, 2), (6, 0)], [(6, -1), (5, -2), (3, -2), (1, 0)], [(0, 3),
-(-1, 6), (-2, 10)]]}, 1148: {'charcode': 1148, 'left': -7, 'right': 6,
-'lines': [[(-5, -3), (-4, -3), (-2, -2), (1, 9), (2, 10)], [(-4, -3),
-(-3, -2), (0, 9), (2, 10), (3, 10)], [(4, -3), (2, 0), (-4, 7), (-6,
-10)]]}, 1149: {'charcode': 1149, 'left': -9, 'right': 9, 'lines': [[(2,
--7), (-1, 10)], [(3, -7), (-2, 10)], [(-8, 0), (-7, -2), (-6, -3), (-4,
--3), (-3, -2), (-3, 4), (-2, 5), (1, 5), (3, 4), (5, 2)], [(-5, -3),
-(-4, -2), (-4, 2), (-3, 5), (-2, 6), (1, 6), (3, 5), (5, 2), (6, 0),
-(7, -3)]]}, 1150: {'charcode': 1150, 'left': -8, 'right': 8, 'lines':
-[[(-4, -2), (-2, -2), (-2, -3), (-4, -2), (-5, -1), (-6, 1), (-6, 3),
-(-5, 5), (-4, 6), (-2, 6), (-1, 5), (0, 3), (1, 0)], [(-6, 3), (-4,
-5), (-2, 5), (0, 3)], [(0, 0), (0, 5), (1, 6), (3, 6), (5, 4), (6, 2),
-(6, 0), (5, -2), (4, -3), (4, -2), (5, -2)], [(0, 3), (1, 5), (3, 5),
-(5, 4)]]}, 1151: {'charcode': 1151, 'left': -7, 'right': 8, 'lines':
-[[(4, -3), (2, 4), (2, 5), (3, 6), (5, 6), (6, 5), (7, 3)], [(5, -3),
-(3, 4), (3, 5), (4, 6)], [(3, 1), (3, -1), (1, -3), (-1, -3), (-3, -2),
-(-4, -1), (-5, 1), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 4)], [(-1, -3),
-(-3, -1), (-4, 1), (-4, 4), (-2, 6)]]}, 1152: {'charcode': 1152, 'left':
--8, 'right': 6, 'lines': [[(-3, -7), (-5, 0)], [(-2, -7), (-4, 0), (-4,
-4), (-2, 6)], [(-4, 0), (-3, -2), (-1, -3), (1, -3), (3, -2), (4, 0),
-(4, 2), (3, 4), (2, 5), (0, 6), (-2, 6), (-4, 5), (-5, 3), (-5, 0)],
-[(1, -3), (3, -1), (3, 2), (2, 4), (0, 6)], [(-5, -7), (-2, -7)]]},
-1153: {'charcode': 1153, 'left': -7, 'right': 6, 'lines': [[(3, -2),
-(3, -1), (4, -1), (3, -2), (1, -3), (-1, -3), (-3, -2), (-4, -1), (-5,
-1), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4)], [(-1, -3), (-3,
--1), (-4, 1), (-4, 4), (-2, 6)]]}, 1154: {'charcode': 1154, 'left': -7,
-'right': 8, 'lines': [[(5, -7), (2, 4), (2, 5), (3, 6), (5, 6), (6, 5),
-(7, 3)], [(6, -7), (3, 4), (3, 5), (4, 6)], [(3, 1), (3, -1), (1, -3),
-(-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4, 5), (-2, 6), (0,
-6), (2, 4)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)], [(3, -7),
-(6, -7)]]}, 1155: {'charcode': 1155, 'left': -7, 'right': 5, 'lines':
-[[(-4, 3), (0, 2), (2, 1), (3, 0), (3, -2), (1, -3), (-1, -3), (-3, -2),
-(-4, -1), (-5, 1), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4)],
-[(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)]]}, 1156: {'charcode':
-1156, 'left': -5, 'right': 6, 'lines': [[(5, -7), (6, -6), (6, -7),
-(4, -7), (2, -6), (1, -4), (-2, 7), (-3, 9), (-4, 10)], [(4, -7), (3,
--6), (2, -4), (-1, 7), (-2, 9), (-4, 10), (-6, 10), (-6, 9), (-5, 10)],
-[(-2, -3), (4, -3)]]}, 1157: {'charcode': 1157, 'left': -7, 'right':
-7, 'lines': [[(4, -3), (2, 4), (1, 7), (0, 9)], [(5, -3), (3, 4), (2,
-7), (0, 9), (-2, 10), (-5, 10), (-6, 9), (-5, 9), (-4, 10)], [(3, 1),
-(3, -1), (1, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4,
-5), (-2, 6), (0, 6), (2, 4)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4),
-(-2, 6)]]}, 1158: {'charcode': 1158, 'left': -7, 'right': 8, 'lines':
-[[(-2, -7), (-6, 6)], [(-1, -7), (-5, 6)], [(-3, -1), (-2, -2), (0, -3),
-(2, -3), (4, -2), (4, 0), (3, 3), (3, 5), (4, 6)], [(2, -3), (3, -2),
-(3, 0), (2, 3), (2, 5), (3, 6), (5, 6), (6, 5), (7, 3)], [(-4, -7),
-(-1, -7)]]}, 1159: {'charcode': 1159, 'left': -5, 'right': 5, 'lines':
-[[(1, -7), (1, -6), (2, -6), (2, -7), (1, -7)], [(-4, 0), (-3, -2),
-(-2, -3), (0, -3), (1, -2), (1, 0), (0, 3), (0, 5), (1, 6)], [(-1, -3),
-(0, -2), (0, 0), (-1, 3), (-1, 5), (0, 6), (2, 6), (3, 5), (4, 3)]]},
-1160: {'charcode': 1160, 'left': -5, 'right': 5, 'lines': [[(2, -7),
-(2, -6), (3, -6), (3, -7), (2, -7)], [(-3, 0), (-2, -2), (-1, -3), (1,
--3), (2, -2), (2, 0), (0, 7), (-1, 9), (-3, 10), (-5, 10), (-5, 9), (-4,
-10)], [(0, -3), (1, -2), (1, 0), (-1, 7), (-2, 9), (-3, 10)]]}, 1161:
-{'charcode': 1161, 'left': -7, 'right': 6, 'lines': [[(-2, -7), (-6,
-6)], [(-1, -7), (-5, 6)], [(4, -2), (3, -1), (4, -1), (4, -2), (3, -3),
-(2, -3), (0, -1), (-2, 0), (-3, 0)], [(-3, 0), (-2, 1), (-1, 5), (0, 6),
-(2, 6), (3, 5), (4, 3)], [(-3, 0), (-1, 1), (0, 5), (1, 6)], [(-4, -7),
-(-1, -7)]]}, 1162: {'charcode': 1162, 'left': -4, 'right': 4, 'lines':
-[[(1, -7), (-2, 4), (-2, 5), (-1, 6), (1, 6), (2, 5), (3, 3)], [(2, -7),
-(-1, 4), (-1, 5), (0, 6)], [(-1, -7), (2, -7)]]}, 1163: {'charcode':
-1163, 'left': -12, 'right': 12, 'lines': [[(-11, 0), (-10, -2), (-9, -3),
-(-7, -3), (-6, -2), (-6, -1), (-8, 6)], [(-8, -3), (-7, -2), (-7, -1),
-(-9, 6)], [(-6, -1), (-5, -2), (-3, -3), (-1, -3), (1, -2), (1, -1),
-(-1, 6)], [(-1, -3), (0, -2), (0, -1), (-2, 6)], [(1, -1), (2, -2), (4,
--3), (6, -3), (8, -2), (8, 0), (7, 3), (7, 5), (8, 6)], [(6, -3), (7,
--2), (7, 0), (6, 3), (6, 5), (7, 6), (9, 6), (10, 5), (11, 3)]]}, 1164:
-{'charcode': 1164, 'left': -8, 'right': 9, 'lines': [[(-7, 0), (-6, -2),
-(-5, -3), (-3, -3), (-2, -2), (-2, -1), (-4, 6)], [(-4, -3), (-3, -2),
-(-3, -1), (-5, 6)], [(-2, -1), (-1, -2), (1, -3), (3, -3), (5, -2), (5,
-0), (4, 3), (4, 5), (5, 6)], [(3, -3), (4, -2), (4, 0), (3, 3), (3, 5),
-(4, 6), (6, 6), (7, 5), (8, 3)]]}, 1165: {'charcode': 1165, 'left': -7,
-'right': 6, 'lines': [[(-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3),
-(-4, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4, 2), (4, 0), (3, -2),
-(1, -3), (-1, -3)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)],
-[(0, 6), (2, 4), (3, 2), (3, -1), (1, -3)]]}, 1166: {'charcode': 1166,
-'left': -8, 'right': 7, 'lines': [[(-7, 0), (-6, -2), (-5, -3), (-3, -3),
-(-2, -2), (-2, -1), (-5, 10)], [(-4, -3), (-3, -2), (-3, -1), (-6, 10)],
-[(-2, -1), (0, -3), (2, -3), (4, -2), (5, 0), (5, 2), (4, 4), (3, 5),
-(1, 6), (-1, 6), (-3, 4), (-3, 2)], [(2, -3), (4, -1), (4, 2), (3, 4),
-(1, 6)], [(-8, 10), (-3, 10)]]}, 1167: {'charcode': 1167, 'left': -7,
-'right': 7, 'lines': [[(4, -3), (0, 10)], [(5, -3), (1, 10)], [(3, 1),
-(3, -1), (1, -3), (-1, -3), (-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4,
-5), (-2, 6), (0, 6), (2, 4)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4),
-(-2, 6)], [(-2, 10), (3, 10)]]}, 1168: {'charcode': 1168, 'left': -6,
-'right': 6, 'lines': [[(-5, 0), (-4, -2), (-3, -3), (-1, -3), (0, -2),
-(0, -1), (-2, 6)], [(-2, -3), (-1, -2), (-1, -1), (-3, 6)], [(0, -1),
-(1, -2), (3, -3), (4, -3), (5, -2), (5, -1), (4, -1), (5, -2)]]}, 1169:
-{'charcode': 1169, 'left': -6, 'right': 7, 'lines': [[(4, -2), (4, -1),
-(5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-3, 0), (-1, 1), (2, 2),
-(4, 3)], [(-3, -1), (-1, 0), (2, 1), (4, 2), (4, 5), (2, 6), (-1, 6),
-(-3, 5), (-4, 4), (-3, 4), (-3, 5)]]}, 1170: {'charcode': 1170, 'left':
--4, 'right': 5, 'lines': [[(1, -7), (-2, 4), (-2, 5), (-1, 6), (1, 6),
-(2, 5), (3, 3)], [(2, -7), (-1, 4), (-1, 5), (0, 6)], [(-2, -3), (3,
--3)]]}, 1171: {'charcode': 1171, 'left': -9, 'right': 8, 'lines': [[(-8,
-0), (-7, -2), (-6, -3), (-4, -3), (-3, -2), (-3, 0), (-4, 3), (-4, 5),
-(-3, 6)], [(-5, -3), (-4, -2), (-4, 0), (-5, 3), (-5, 5), (-3, 6), (-1,
-6), (1, 5), (2, 4)], [(4, -3), (2, 4), (2, 5), (3, 6), (5, 6), (6, 5),
-(7, 3)], [(5, -3), (3, 4), (3, 5), (4, 6)]]}, 1172: {'charcode': 1172,
-'left': -8, 'right': 6, 'lines': [[(-7, 0), (-6, -2), (-5, -3), (-3, -3),
-(-2, -2), (-2, 0), (-3, 3), (-3, 5), (-2, 6)], [(-4, -3), (-3, -2), (-3,
-0), (-4, 3), (-4, 5), (-2, 6), (-1, 6), (1, 5), (3, 3), (4, 0), (4, -3),
-(3, -3), (4, -2)]]}, 1173: {'charcode': 1173, 'left': -10, 'right': 10,
-'lines': [[(-9, 0), (-8, -2), (-7, -3), (-5, -3), (-4, -2), (-4, 0),
-(-5, 3), (-5, 5), (-4, 6)], [(-6, -3), (-5, -2), (-5, 0), (-6, 3),
-(-6, 5), (-4, 6), (-3, 6), (-1, 5), (0, 4)], [(2, -3), (0, 4), (0, 5),
-(2, 6)], [(3, -3), (1, 4), (1, 5), (2, 6), (3, 6), (5, 5), (7, 3), (8,
-0), (8, -3), (7, -3), (8, -2)]]}, 1174: {'charcode': 1174, 'left': -8,
-'right': 8, 'lines': [[(-5, 0), (-4, -2), (-2, -3), (0, -3), (1, -2),
-(1, 0)], [(-1, -3), (0, -2), (0, 0), (-1, 3), (-2, 5), (-4, 6), (-5, 6),
-(-6, 5), (-6, 4), (-5, 4), (-6, 5)], [(6, -2), (5, -1), (6, -1), (6, -2),
-(5, -3), (4, -3), (2, -2), (1, 0), (0, 3), (0, 5), (1, 6)], [(-1, 3),
-(-1, 5), (0, 6), (2, 6), (4, 5), (5, 3)]]}, 1175: {'charcode': 1175,
-'left': -9, 'right': 7, 'lines': [[(-8, 0), (-7, -2), (-6, -3), (-4,
--3), (-3, -2), (-3, 0), (-4, 3), (-4, 5), (-3, 6)], [(-5, -3), (-4, -2),
-(-4, 0), (-5, 3), (-5, 5), (-3, 6), (-1, 6), (1, 5), (2, 4)], [(4, -3),
-(2, 4), (1, 7), (0, 9)], [(5, -3), (3, 4), (2, 7), (0, 9), (-2, 10),
-(-5, 10), (-6, 9), (-5, 9), (-4, 10)]]}, 1176: {'charcode': 1176,
-'left': -7, 'right': 7, 'lines': [[(5, -3), (5, -2), (4, -1), (-4, 4),
-(-5, 5), (-5, 6)], [(-4, -1), (-3, -3), (0, -3), (3, -1)], [(-3, -2),
-(0, -2), (3, -1), (4, -1)], [(-4, 4), (-3, 4), (0, 5), (3, 5)], [(-3,
-4), (0, 6), (3, 6), (4, 4)]]}, 1177: {'charcode': 1177, 'left': -10,
-'right': 9, 'lines': [[(0, -7), (1, -6), (1, -5), (2, -5), (2, -6), (0,
--7), (-3, -7), (-5, -6), (-6, -4), (-6, 6)], [(-3, -7), (-4, -6), (-5,
--4), (-5, 6)], [(6, -7), (7, -6), (7, -5), (8, -5), (8, -6), (6, -7),
-(4, -7), (2, -5), (2, 6)], [(4, -7), (3, -5), (3, 6)], [(-8, -3), (5,
--3)], [(-8, 6), (-3, 6)], [(0, 6), (5, 6)]]}, 1178: {'charcode': 1178,
-'left': -8, 'right': 9, 'lines': [[(3, -7), (4, -6), (5, -6), (5, -7),
-(-1, -7), (-3, -6), (-4, -4), (-4, 6)], [(-1, -7), (-2, -6), (-3, -4),
-(-3, 6)], [(4, -3), (4, 6)], [(5, -3), (5, 6)], [(-6, -3), (5, -3)], [(-6,
-6), (-1, 6)], [(2, 6), (7, 6)]]}, 1179: {'charcode': 1179, 'left': -8,
-'right': 9, 'lines': [[(5, -7), (-1, -7), (-3, -6), (-4, -4), (-4, 6)],
-[(-1, -7), (-2, -6), (-3, -4), (-3, 6)], [(3, -7), (4, -6), (4, 6)],
-[(5, -7), (5, 6)], [(-6, -3), (4, -3)], [(-6, 6), (-1, 6)], [(2, 6),
-(7, 6)]]}, 1180: {'charcode': 1180, 'left': -12, 'right': 13, 'lines':
-[[(-2, -7), (-1, -6), (-1, -5), (0, -5), (0, -6), (-2, -7), (-5, -7),
-(-7, -6), (-8, -4), (-8, 6)], [(-5, -7), (-6, -6), (-7, -4), (-7, 6)],
-[(7, -7), (8, -6), (9, -6), (9, -7), (3, -7), (1, -6), (0, -4), (0,
-6)], [(3, -7), (2, -6), (1, -4), (1, 6)], [(8, -3), (8, 6)], [(9, -3),
-(9, 6)], [(-10, -3), (9, -3)], [(-10, 6), (-5, 6)], [(-2, 6), (3, 6)],
-[(6, 6), (11, 6)]]}, 1181: {'charcode': 1181, 'left': -12, 'right': 13,
-'lines': [[(-2, -7), (-1, -6), (-1, -5), (0, -5), (0, -6), (-2, -7),
-(-5, -7), (-7, -6), (-8, -4), (-8, 6)], [(-5, -7), (-6, -6), (-7, -4),
-(-7, 6)], [(9, -7), (3, -7), (1, -6), (0, -4), (0, 6)], [(3, -7), (2,
--6), (1, -4), (1, 6)], [(7, -7), (8, -6), (8, 6)], [(9, -7), (9, 6)],
-[(-10, -3), (8, -3)], [(-10, 6), (-5, 6)], [(-2, 6), (3, 6)], [(6, 6),
-(11, 6)]]}, 1182: {'charcode': 1182, 'left': -4, 'right': 5, 'lines':
-[[(0, -3), (0, 6)], [(1, -3), (1, 6)], [(-2, -3), (1, -3)], [(-2, 6),
-(3, 6)]]}, 1184: {'charcode': 1184, 'left': -6, 'right': 6, 'lines':
-[[(4, -2), (2, -3), (0, -3), (-2, -2), (-3, -1), (-4, 1), (-4, 3),
-(-3, 5), (-1, 6), (1, 6), (3, 5)], [(0, -3), (-2, -1), (-3, 1), (-3,
-4), (-1, 6)], [(-3, 1), (1, 1)]]}, 1185: {'charcode': 1185, 'left': -6,
-'right': 7, 'lines': [[(1, -7), (-1, -6), (-2, -5), (-3, -3), (-4, 0),
-(-4, 3), (-3, 5), (-2, 6), (0, 6), (2, 5), (3, 4), (4, 2), (5, -1),
-(5, -4), (4, -6), (3, -7), (1, -7)], [(1, -7), (-1, -5), (-2, -3),
-(-3, 1), (-3, 4), (-2, 6)], [(0, 6), (2, 4), (3, 2), (4, -2), (4, -5),
-(3, -7)], [(-3, -1), (4, -1)]]}, 1186: {'charcode': 1186, 'left': -7,
-'right': 8, 'lines': [[(2, -7), (-1, 10)], [(3, -7), (-2, 10)], [(-1,
--3), (-4, -2), (-5, 0), (-5, 3), (-4, 5), (-1, 6), (2, 6), (5, 5), (6,
-3), (6, 0), (5, -2), (2, -3), (-1, -3)], [(-1, -3), (-3, -2), (-4, 0),
-(-4, 3), (-3, 5), (-1, 6)], [(2, 6), (4, 5), (5, 3), (5, 0), (4, -2),
-(2, -3)]]}, 1187: {'charcode': 1187, 'left': -6, 'right': 6, 'lines':
-[[(3, -2), (4, 0), (4, -1), (3, -2), (1, -3), (-1, -3), (-3, -2), (-4,
-0), (-4, 2), (-3, 4), (0, 6)], [(-1, -3), (-3, -1), (-3, 2), (-2, 4),
-(0, 6), (1, 7), (1, 9), (0, 10), (-2, 10)]]}, 1191: {'charcode': 1191,
-'left': -9, 'right': 9, 'lines': [[(4, -7), (5, -6), (6, -6), (4, -7),
-(1, -7), (-1, -6), (-2, -5), (-3, -3), (-6, 7), (-7, 9), (-8, 10)],
-[(1, -7), (-1, -5), (-2, -3), (-5, 7), (-6, 9), (-8, 10), (-10, 10),
-(-10, 9), (-9, 10)], [(8, -7), (9, -6), (9, -7), (7, -7), (5, -6),
-(4, -4), (1, 7), (0, 9), (-1, 10)], [(7, -7), (6, -6), (5, -4), (2, 7),
-(1, 9), (-1, 10), (-3, 10), (-3, 9), (-2, 10)], [(-6, -3), (7, -3)]]},
-1192: {'charcode': 1192, 'left': -9, 'right': 8, 'lines': [[(4, -7), (5,
--6), (6, -6), (6, -7), (1, -7), (-1, -6), (-2, -5), (-3, -3), (-6, 7),
-(-7, 9), (-8, 10)], [(1, -7), (-1, -5), (-2, -3), (-5, 7), (-6, 9), (-8,
-10), (-10, 10), (-10, 9), (-9, 10)], [(4, -3), (2, 4), (2, 5), (3, 6),
-(5, 6), (6, 5), (7, 3)], [(5, -3), (3, 4), (3, 5), (4, 6)], [(-6, -3),
-(5, -3)]]}, 1193: {'charcode': 1193, 'left': -9, 'right': 8, 'lines':
-[[(4, -7), (5, -6)], [(6, -7), (1, -7), (-1, -6), (-2, -5), (-3, -3),
-(-6, 7), (-7, 9), (-8, 10)], [(1, -7), (-1, -5), (-2, -3), (-5, 7),
-(-6, 9), (-8, 10), (-10, 10), (-10, 9), (-9, 10)], [(5, -7), (2, 4),
-(2, 5), (3, 6), (5, 6), (6, 5), (7, 3)], [(6, -7), (3, 4), (3, 5),
-(4, 6)], [(-6, -3), (4, -3)]]}, 1194: {'charcode': 1194, 'left': -12,
-'right': 12, 'lines': [[(1, -7), (2, -6), (2, -5)], [(3, -6), (1, -7),
-(-2, -7), (-4, -6), (-5, -5), (-6, -3), (-9, 7), (-10, 9), (-11, 10)],
-[(-2, -7), (-4, -5), (-5, -3), (-8, 7), (-9, 9), (-11, 10), (-13, 10),
-(-13, 9), (-12, 10)], [(8, -7), (9, -6), (10, -6), (10, -7), (5, -7),
-(3, -6)], [(2, -5), (1, -3), (-2, 7), (-3, 9), (-4, 10)], [(5, -7), (3,
--5), (2, -3), (-1, 7), (-2, 9), (-4, 10), (-6, 10), (-6, 9), (-5, 10)],
-[(8, -3), (6, 4), (6, 5), (7, 6), (9, 6), (10, 5), (11, 3)], [(9, -3),
-(7, 4), (7, 5), (8, 6)], [(-9, -3), (9, -3)]]}, 1195: {'charcode': 1195,
-'left': -12, 'right': 12, 'lines': [[(1, -7), (2, -6), (2, -5)], [(3,
--6), (1, -7), (-2, -7), (-4, -6), (-5, -5), (-6, -3), (-9, 7), (-10, 9),
-(-11, 10)], [(-2, -7), (-4, -5), (-5, -3), (-8, 7), (-9, 9), (-11, 10),
-(-13, 10), (-13, 9), (-12, 10)], [(8, -7), (9, -6)], [(10, -7), (5, -7),
-(3, -6)], [(2, -5), (1, -3), (-2, 7), (-3, 9), (-4, 10)], [(5, -7), (3,
--5), (2, -3), (-1, 7), (-2, 9), (-4, 10), (-6, 10), (-6, 9), (-5, 10)],
-[(9, -7), (6, 4), (6, 5), (7, 6), (9, 6), (10, 5), (11, 3)], [(10, -7),
-(7, 4), (7, 5), (8, 6)], [(-9, -3), (8, -3)]]}, 1196: {'charcode': 1196,
-'left': -5, 'right': 5, 'lines': [[(-4, 0), (-3, -2), (-2, -3), (0, -3),
-(1, -2), (1, 0), (0, 3), (0, 5), (1, 6)], [(-1, -3), (0, -2), (0, 0),
-(-1, 3), (-1, 5), (0, 6), (2, 6), (3, 5), (4, 3)]]}, 1197: {'charcode':
-1197, 'left': 0, 'right': 0, 'lines': [[]]}, 1198: {'charcode': 1198,
-'left': -3, 'right': 3, 'lines': [[]]}, 1199: {'charcode': 1199, 'left':
--6, 'right': 6, 'lines': [[]]}, 1200: {'charcode': 1200, 'left': -6,
-'right': 7, 'lines': [[(-1, -7), (-3, -6), (-4, -3), (-4, 2), (-3, 5),
-(-1, 6), (2, 6), (4, 5), (5, 2), (5, -3), (4, -6), (2, -7), (-1, -7)],
-[(-1, -7), (-2, -6), (-3, -3), (-3, 2), (-2, 5), (-1, 6)], [(2, 6), (3,
-5), (4, 2), (4, -3), (3, -6), (2, -7)]]}, 1201: {'charcode': 1201, 'left':
--6, 'right': 7, 'lines': [[(-2, -4), (1, -7), (1, 6)], [(0, -6), (0, 6)],
-[(-3, 6), (4, 6)]]}, 1202: {'charcode': 1202, 'left': -6, 'right': 7,
-'lines': [[(-3, -5), (-3, -4), (-4, -4), (-4, -5), (-3, -6), (-1, -7),
-(2, -7), (4, -6), (5, -4), (4, -2), (2, -1), (-1, 0), (-3, 1), (-4, 3),
-(-4, 6)], [(2, -7), (3, -6), (4, -4), (3, -2), (2, -1)], [(-4, 5), (-3,
-4), (-2, 4), (1, 5), (4, 5), (5, 4)], [(-2, 4), (1, 6), (4, 6), (5, 4),
-(5, 3)]]}, 1203: {'charcode': 1203, 'left': -6, 'right': 7, 'lines':
-[[(-3, -5), (-3, -4), (-4, -4), (-4, -5), (-3, -6), (-1, -7), (2, -7),
-(4, -6), (5, -4), (4, -2), (2, -1)], [(2, -7), (3, -6), (4, -4), (3, -2),
-(2, -1)], [(0, -1), (2, -1), (4, 0), (5, 2), (5, 3), (4, 5), (2, 6),
-(-1, 6), (-3, 5), (-4, 4), (-4, 3), (-3, 3), (-3, 4)], [(2, -1), (3, 0),
-(4, 2), (4, 3), (3, 5), (2, 6)]]}, 1204: {'charcode': 1204, 'left': -6,
-'right': 7, 'lines': [[(1, -5), (1, 6)], [(2, -7), (2, 6)], [(2, -7),
-(-5, 2), (6, 2)], [(-1, 6), (4, 6)]]}, 1205: {'charcode': 1205, 'left':
--6, 'right': 7, 'lines': [[(-3, -7), (-4, -1)], [(-3, -7), (4, -7)],
-[(-3, -6), (1, -6), (4, -7)], [(-4, -1), (-3, -2), (-1, -3), (2, -3),
-(4, -2), (5, 0), (5, 3), (4, 5), (2, 6), (-1, 6), (-3, 5), (-4, 4),
-(-4, 3), (-3, 3), (-3, 4)], [(2, -3), (3, -2), (4, 0), (4, 3), (3, 5),
-(2, 6)]]}, 1206: {'charcode': 1206, 'left': -6, 'right': 7, 'lines':
-[[(4, -5), (4, -4), (5, -4), (5, -5), (4, -6), (2, -7), (0, -7), (-2,
--6), (-3, -5), (-4, -2), (-4, 3), (-3, 5), (-1, 6), (2, 6), (4, 5), (5,
-3), (5, 1), (4, -1), (2, -2), (-1, -2), (-4, 0)], [(0, -7), (-2, -5),
-(-3, -2), (-3, 3), (-2, 5), (-1, 6)], [(2, 6), (3, 5), (4, 3), (4, 1),
-(3, -1), (2, -2)]]}, 1207: {'charcode': 1207, 'left': -6, 'right': 7,
-'lines': [[(-4, -7), (-4, -3)], [(4, -5), (0, 2), (-2, 6)], [(5, -7), (2,
--1), (-1, 6)], [(-4, -5), (-2, -7), (0, -7), (3, -5)], [(-4, -5), (-2,
--6), (0, -6), (3, -5), (4, -5)]]}, 1208: {'charcode': 1208, 'left': -6,
-'right': 7, 'lines': [[(-1, -7), (-3, -6), (-4, -4), (-3, -2), (-1, -1),
-(2, -1), (4, -2), (5, -4), (4, -6), (2, -7), (-1, -7)], [(-1, -7), (-2,
--6), (-3, -4), (-2, -2), (-1, -1)], [(2, -1), (3, -2), (4, -4), (3, -6),
-(2, -7)], [(-1, -1), (-3, 0), (-4, 2), (-4, 3), (-3, 5), (-1, 6), (2, 6),
-(4, 5), (5, 3), (5, 2), (4, 0), (2, -1)], [(-1, -1), (-2, 0), (-3, 2),
-(-3, 3), (-2, 5), (-1, 6)], [(2, 6), (3, 5), (4, 3), (4, 2), (3, 0),
-(2, -1)]]}, 1209: {'charcode': 1209, 'left': -6, 'right': 7, 'lines':
-[[(-3, 4), (-3, 3), (-4, 3), (-4, 4), (-3, 5), (-1, 6), (1, 6), (3, 5),
-(4, 4), (5, 1), (5, -4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -4),
-(-4, -2), (-3, 0), (-1, 1), (2, 1), (5, -1)], [(1, 6), (3, 4), (4, 1),
-(4, -4), (3, -6), (2, -7)], [(-1, -7), (-2, -6), (-3, -4), (-3, -2),
-(-2, 0), (-1, 1)]]}, 1210: {'charcode': 1210, 'left': -4, 'right': 4,
-'lines': [[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]}, 1211: {'charcode':
-1211, 'left': -4, 'right': 4, 'lines': [[(1, 5), (0, 6), (-1, 5), (0,
-4), (1, 5), (1, 7), (-1, 9)]]}, 1212: {'charcode': 1212, 'left': -4,
-'right': 4, 'lines': [[(0, -3), (-1, -2), (0, -1), (1, -2), (0, -3)],
-[(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]}, 1213: {'charcode': 1213,
-'left': -4, 'right': 4, 'lines': [[(0, -3), (-1, -2), (0, -1), (1, -2),
-(0, -3)], [(1, 5), (0, 6), (-1, 5), (0, 4), (1, 5), (1, 7), (-1, 9)]]},
-1214: {'charcode': 1214, 'left': -4, 'right': 4, 'lines': [[(0, -7), (-1,
--6), (0, 1), (1, -6), (0, -7)], [(0, -6), (0, -3)], [(0, 4), (-1, 5), (0,
-6), (1, 5), (0, 4)]]}, 1215: {'charcode': 1215, 'left': -6, 'right': 7,
-'lines': [[(-4, -4), (-3, -4), (-3, -3), (-4, -3), (-4, -4), (-3, -6),
-(-1, -7), (2, -7), (4, -6), (5, -4), (5, -3), (4, -1), (1, 0), (0, 1),
-(0, 2), (1, 2)], [(2, -7), (4, -5), (4, -2), (3, -1), (1, 0)], [(0, 5),
-(0, 6), (1, 6), (1, 5), (0, 5)]]}, 1216: {'charcode': 1216, 'left': -3,
-'right': 4, 'lines': [[(0, -7), (0, -2)], [(1, -7), (0, -2)]]}, 1217:
-{'charcode': 1217, 'left': -6, 'right': 6, 'lines': [[(-3, -7), (-3, -2)],
-[(-2, -7), (-3, -2)], [(3, -7), (3, -2)], [(4, -7), (3, -2)]]}, 1218:
-{'charcode': 1218, 'left': -5, 'right': 5, 'lines': [[(-1, -7), (-2, -6),
-(-2, -4), (-1, -3), (1, -3), (2, -4), (2, -6), (1, -7), (-1, -7)]]},
-1219: {'charcode': 1219, 'left': -5, 'right': 5, 'lines': [[(0, -8),
-(0, -2)], [(-3, -7), (3, -3)], [(3, -7), (-3, -3)]]}, 1220: {'charcode':
-1220, 'left': -7, 'right': 8, 'lines': [[(6, -10), (-5, 10)]]}, 1221:
-{'charcode': 1221, 'left': -5, 'right': 5, 'lines': [[(3, -10), (1, -8),
-(-1, -5), (-2, -2), (-2, 2), (-1, 5), (1, 8), (3, 10)], [(1, -8), (0, -6),
-(-1, -2), (-1, 2), (0, 6), (1, 8)]]}, 1222: {'charcode': 1222, 'left':
--5, 'right': 5, 'lines': [[(-3, -10), (-1, -8), (1, -5), (2, -2), (2, 2),
-(1, 5), (-1, 8), (-3, 10)], [(-1, -8), (0, -6), (1, -2), (1, 2), (0, 6),
-(-1, 8)]]}, 1223: {'charcode': 1223, 'left': -5, 'right': 5, 'lines':
-[[(-2, -10), (-2, 10)], [(-1, -10), (-1, 10)], [(-2, -10), (3, -10)],
-[(-2, 10), (3, 10)]]}, 1224: {'charcode': 1224, 'left': -5, 'right': 5,
-'lines': [[(1, -10), (1, 10)], [(2, -10), (2, 10)], [(-3, -10), (2, -10)],
-[(-3, 10), (2, 10)]]}, 1225: {'charcode': 1225, 'left': -6, 'right': 5,
-'lines': [[(1, -10), (-1, -9), (-2, -8), (-2, -6), (0, -4), (1, -2)],
-[(-1, -9), (-2, -6)], [(1, -4), (0, -1)], [(-2, -8), (-1, -6), (1, -4),
-(1, -2), (0, -1), (-2, 0), (0, 1), (1, 2), (1, 4), (-1, 6), (-2, 8)],
-[(0, 1), (1, 4)], [(-2, 6), (-1, 9)], [(1, 2), (0, 4), (-2, 6), (-2, 8),
-(-1, 9), (1, 10)]]}, 1226: {'charcode': 1226, 'left': -5, 'right': 6,
-'lines': [[(-1, -10), (1, -9), (2, -8), (2, -6), (0, -4), (-1, -2)],
-[(1, -9), (2, -6)], [(-1, -4), (0, -1)], [(2, -8), (1, -6), (-1, -4),
-(-1, -2), (0, -1), (2, 0), (0, 1), (-1, 2), (-1, 4), (1, 6), (2, 8)],
-[(0, 1), (-1, 4)], [(2, 6), (1, 9)], [(-1, 2), (0, 4), (2, 6), (2, 8),
-(1, 9), (-1, 10)]]}, 1227: {'charcode': 1227, 'left': -5, 'right': 5,
-'lines': [[(2, -10), (-2, 0), (2, 10)]]}, 1228: {'charcode': 1228,
-'left': -5, 'right': 5, 'lines': [[(-2, -10), (2, 0), (-2, 10)]]},
-1229: {'charcode': 1229, 'left': -3, 'right': 3, 'lines': [[(0, -10),
-(0, 10)]]}, 1230: {'charcode': 1230, 'left': -5, 'right': 5, 'lines':
-[[(-2, -10), (-2, 10)], [(2, -10), (2, 10)]]}, 1231: {'charcode':
-1231, 'left': -9, 'right': 9, 'lines': [[(-6, 0), (6, 0)]]}, 1232:
-{'charcode': 1232, 'left': -9, 'right': 9, 'lines': [[(0, -6), (0, 6)],
-[(-6, 0), (6, 0)]]}, 1233: {'charcode': 1233, 'left': -8, 'right': 8,
-'lines': [[(0, -5), (0, 6)], [(-5, 0), (5, 0)], [(-5, 6), (5, 6)]]},
-1234: {'charcode': 1234, 'left': -8, 'right': 8, 'lines': [[(0, -5),
-(0, 6)], [(-5, -5), (5, -5)], [(-5, 0), (5, 0)]]}, 1235: {'charcode':
-1235, 'left': -8, 'right': 8, 'lines': [[(-5, -5), (5, 5)], [(5, -5),
-(-5, 5)]]}, 1236: {'charcode': 1236, 'left': -4, 'right': 4, 'lines':
-[[(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]}, 1237: {'charcode': 1237,
-'left': -9, 'right': 9, 'lines': [[(0, -6), (-1, -5), (0, -4), (1, -5),
-(0, -6)], [(-6, 0), (6, 0)], [(0, 4), (-1, 5), (0, 6), (1, 5), (0, 4)]]},
-1238: {'charcode': 1238, 'left': -9, 'right': 9, 'lines': [[(-6, -2),
-(6, -2)], [(-6, 2), (6, 2)]]}, 1239: {'charcode': 1239, 'left': -9,
-'right': 9, 'lines': [[(5, -6), (-5, 6)], [(-6, -2), (6, -2)], [(-6, 2),
-(6, 2)]]}, 1240: {'charcode': 1240, 'left': -9, 'right': 9, 'lines':
-[[(-6, -4), (6, -4)], [(-6, 0), (6, 0)], [(-6, 4), (6, 4)]]}, 1241:
-{'charcode': 1241, 'left': -8, 'right': 8, 'lines': [[(5, -6), (-5, 0),
-(5, 6)]]}, 1242: {'charcode': 1242, 'left': -8, 'right': 8, 'lines':
-[[(-5, -6), (5, 0), (-5, 6)]]}, 1243: {'charcode': 1243, 'left': -8,
-'right': 8, 'lines': [[(5, -7), (-5, -3), (5, 1)], [(-5, 2), (5, 2)],
-[(-5, 6), (5, 6)]]}, 1244: {'charcode': 1244, 'left': -8, 'right': 8,
-'lines': [[(-5, -7), (5, -3), (-5, 1)], [(-5, 2), (5, 2)], [(-5, 6),
-(5, 6)]]}, 1245: {'charcode': 1245, 'left': -10, 'right': 9, 'lines':
-[[(7, 3), (5, 3), (3, 2), (2, 1), (0, -2), (-1, -3), (-3, -4), (-4,
--4), (-6, -3), (-7, -1), (-7, 0), (-6, 2), (-4, 3), (-3, 3), (-1, 2),
-(0, 1), (2, -2), (3, -3), (5, -4), (7, -4)]]}, 1246: {'charcode': 1246,
-'left': -8, 'right': 8, 'lines': [[(-6, 2), (-6, 0), (-5, -2), (-3, -2),
-(3, 1), (5, 1), (6, 0)], [(-6, 0), (-5, -1), (-3, -1), (3, 2), (5, 2),
-(6, 0), (6, -2)]]}, 1247: {'charcode': 1247, 'left': -8, 'right': 8,
-'lines': [[(-5, 1), (0, -2), (5, 1)], [(-5, 1), (0, -1), (5, 1)]]},
-1248: {'charcode': 1248, 'left': -4, 'right': 4, 'lines': [[(1, -7), (-2,
--3)], [(1, -7), (2, -6), (-2, -3)]]}, 1249: {'charcode': 1249, 'left':
--4, 'right': 4, 'lines': [[(-1, -7), (2, -3)], [(-1, -7), (-2, -6),
-(2, -3)]]}, 1250: {'charcode': 1250, 'left': -6, 'right': 6, 'lines':
-[[(-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5), (4, -7)], [(-4, -7),
-(-3, -4), (-1, -3), (1, -3), (3, -4), (4, -7)]]}, 1251: {'charcode': 1251,
-'left': -4, 'right': 4, 'lines': [[(1, -6), (0, -5), (-1, -6), (0, -7),
-(1, -6), (1, -4), (-1, -2)]]}, 1252: {'charcode': 1252, 'left': -4,
-'right': 4, 'lines': [[(1, -7), (-1, -5), (-1, -3), (0, -2), (1, -3),
-(0, -4), (-1, -3)]]}, 1253: {'charcode': 1253, 'left': -4, 'right': 4,
-'lines': [[(-1, -6), (0, -5), (1, -6), (0, -7), (-1, -6), (-1, -4),
-(1, -2)]]}, 1254: {'charcode': 1254, 'left': -4, 'right': 4, 'lines':
-[[(-1, -7), (1, -5), (1, -3), (0, -2), (-1, -3), (0, -4), (1, -3)]]},
-1256: {'charcode': 1256, 'left': -8, 'right': 8, 'lines': [[(5, -5),
-(-1, -5), (-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1,
-5), (5, 5)]]}, 1257: {'charcode': 1257, 'left': -8, 'right': 8, 'lines':
-[[(-5, -5), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3),
-(5, 1), (5, -5)]]}, 1258: {'charcode': 1258, 'left': -8, 'right': 8,
-'lines': [[(-5, -5), (1, -5), (3, -4), (4, -3), (5, -1), (5, 1), (4, 3),
-(3, 4), (1, 5), (-5, 5)]]}, 1259: {'charcode': 1259, 'left': -8, 'right':
-8, 'lines': [[(-5, 5), (-5, -1), (-4, -3), (-3, -4), (-1, -5), (1, -5),
-(3, -4), (4, -3), (5, -1), (5, 5)]]}, 1260: {'charcode': 1260, 'left': -8,
-'right': 8, 'lines': [[(5, -5), (-1, -5), (-3, -4), (-4, -3), (-5, -1),
-(-5, 1), (-4, 3), (-3, 4), (-1, 5), (5, 5)], [(-5, 0), (3, 0)]]}, 1261:
-{'charcode': 1261, 'left': -9, 'right': 9, 'lines': [[(2, -3), (3, -2),
-(6, 0), (3, 2), (2, 3)], [(3, -2), (5, 0), (3, 2)], [(-6, 0), (5, 0)]]},
-1262: {'charcode': 1262, 'left': -5, 'right': 5, 'lines': [[(0, -5),
-(0, 6)], [(-3, -2), (-2, -3), (0, -6), (2, -3), (3, -2)], [(-2, -3),
-(0, -5), (2, -3)]]}, 1263: {'charcode': 1263, 'left': -9, 'right': 9,
-'lines': [[(-2, -3), (-3, -2), (-6, 0), (-3, 2), (-2, 3)], [(-3, -2),
-(-5, 0), (-3, 2)], [(-5, 0), (6, 0)]]}, 1264: {'charcode': 1264, 'left':
--5, 'right': 5, 'lines': [[(0, -6), (0, 5)], [(-3, 2), (-2, 3), (0, 6),
-(2, 3), (3, 2)], [(-2, 3), (0, 5), (2, 3)]]}, 1265: {'charcode': 1265,
-'left': -7, 'right': 7, 'lines': [[(4, 1), (3, -2), (1, -3), (-1, -3),
-(-3, -2), (-4, -1), (-5, 1), (-5, 3), (-4, 5), (-2, 6), (0, 6), (2, 5),
-(3, 4), (4, 2), (5, -1), (5, -4), (4, -6), (2, -7), (-1, -7), (-2, -6),
-(-1, -6), (0, -7)], [(-1, -3), (-3, -1), (-4, 1), (-4, 4), (-2, 6)],
-[(0, 6), (2, 4), (3, 2), (4, -1), (4, -4), (3, -6), (2, -7)]]}, 1266:
-{'charcode': 1266, 'left': -8, 'right': 8, 'lines': [[(-6, -7), (0, 6)],
-[(-5, -7), (0, 4)], [(6, -7), (0, 6)], [(-6, -7), (6, -7)], [(-4, -6),
-(5, -6)]]}, 1267: {'charcode': 1267, 'left': -11, 'right': 9, 'lines':
-[[(-9, -3), (-6, -3), (0, 5)], [(-7, -3), (0, 6)], [(9, -12), (0, 6)]]},
-1268: {'charcode': 1268, 'left': -9, 'right': 9, 'lines': [[(6, -9),
-(6, -8), (7, -8), (7, -9), (6, -10), (4, -10), (2, -8), (1, -6), (0,
--3), (-1, 3), (-2, 7), (-3, 9)], [(3, -9), (2, -7), (1, -3), (0, 3),
-(-1, 6), (-2, 8), (-4, 10), (-6, 10), (-7, 9), (-7, 8), (-6, 8), (-6,
-9)]]}, 1269: {'charcode': 1269, 'left': -9, 'right': 9, 'lines': [[(6,
--9), (6, -8), (7, -8), (7, -9), (6, -10), (4, -10), (2, -8), (1, -6),
-(0, -3), (-1, 3), (-2, 7), (-3, 9)], [(3, -9), (2, -7), (1, -3), (0, 3),
-(-1, 6), (-2, 8), (-4, 10), (-6, 10), (-7, 9), (-7, 8), (-6, 8), (-6, 9)],
-[(-1, -4), (-3, -3), (-4, -1), (-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3),
-(4, 1), (4, -1), (3, -3), (1, -4), (-1, -4)]]}, 1270: {'charcode': 1270,
-'left': -10, 'right': 10, 'lines': [[(8, 0), (7, 2), (5, 3), (4, 3), (2,
-2), (1, 1), (-1, -2), (-2, -3), (-4, -4), (-5, -4), (-7, -3), (-8, -1),
-(-8, 0), (-7, 2), (-5, 3), (-4, 3), (-2, 2), (-1, 1), (1, -2), (2, -3),
-(4, -4), (5, -4), (7, -3), (8, -1), (8, 0)]]}, 1271: {'charcode': 1271,
-'left': -8, 'right': 8, 'lines': [[(6, -7), (-6, 6)], [(-3, -7), (-2, -6),
-(-2, -4), (-3, -3), (-5, -3), (-6, -4), (-6, -6), (-5, -7), (-3, -7),
-(1, -6), (4, -6), (6, -7)], [(3, 2), (2, 3), (2, 5), (3, 6), (5, 6),
-(6, 5), (6, 3), (5, 2), (3, 2)]]}, 1272: {'charcode': 1272, 'left': -8,
-'right': 9, 'lines': [[(7, -2), (6, -2), (6, -1), (7, -1), (7, -2),
-(6, -3), (5, -3), (4, -2), (3, 2), (2, 4), (1, 5), (-1, 6), (-3, 6),
-(-5, 5), (-6, 4), (-6, 2), (-5, 1), (-3, 0), (0, -2), (1, -4), (1, -6),
-(0, -7), (-2, -7), (-3, -6), (-3, -4), (-2, -1), (3, 5), (5, 6), (6, 6),
-(7, 5)], [(-3, 6), (-5, 4), (-5, 2), (-3, 0)], [(-3, -4), (-2, -2), (4,
-5), (5, 6)]]}, 1273: {'charcode': 1273, 'left': -8, 'right': 9, 'lines':
-[[(3, -2), (1, -3), (-1, -3), (-2, -1), (-2, 0), (-1, 2), (1, 2), (3, 1)],
-[(3, -3), (3, 1), (4, 2), (6, 2), (7, 0), (7, -1), (6, -4), (4, -6), (1,
--7), (0, -7), (-3, -6), (-5, -4), (-6, -1), (-6, 0), (-5, 3), (-3, 5),
-(0, 6), (1, 6), (4, 5)]]}, 1274: {'charcode': 1274, 'left': -7, 'right':
-8, 'lines': [[(-1, -10), (-1, 10)], [(2, -10), (2, 10)], [(5, -6), (4,
--6), (4, -5), (5, -5), (5, -6), (3, -7), (-2, -7), (-4, -6), (-4, -4),
-(-3, -2), (4, 1), (5, 2)], [(-4, -4), (-3, -3), (4, 0), (5, 2), (5, 4),
-(4, 5), (2, 6), (-1, 6), (-3, 5), (-4, 4), (-4, 3), (-3, 3), (-3, 4),
-(-4, 4)]]}, 1275: {'charcode': 1275, 'left': -7, 'right': 7, 'lines':
-[[(0, -7), (-4, 10)], [(4, -7), (0, 10)], [(-4, -1), (5, -1)], [(-5, 4),
-(4, 4)]]}, 1276: {'charcode': 1276, 'left': -6, 'right': 6, 'lines':
-[[(2, -6), (1, -6), (1, -5), (2, -5), (2, -6), (1, -7), (-1, -7), (-2,
--6), (-2, -4), (-1, -2), (2, 0), (3, 1)], [(-2, -4), (-1, -3), (2, -1),
-(3, 1), (3, 3), (1, 5)], [(-1, -2), (-3, 0), (-3, 2), (-2, 4), (1, 6),
-(2, 7)], [(-3, 2), (-2, 3), (1, 5), (2, 7), (2, 9), (1, 10), (-1, 10),
-(-2, 9), (-2, 8), (-1, 8), (-1, 9), (-2, 9)]]}, 1277: {'charcode': 1277,
-'left': -6, 'right': 6, 'lines': [[(0, -7), (-1, -6), (0, -5), (1, -6),
-(0, -7)], [(0, -5), (0, -1)], [(0, -1), (-1, 1), (0, 4), (1, 1), (0, -1)],
-[(0, 4), (0, 10)], [(-2, -3), (-3, -4), (-4, -3), (-3, -2), (-2, -3),
-(2, -3), (3, -4), (4, -3), (3, -2), (2, -3)]]}, 1278: {'charcode': 1278,
-'left': -6, 'right': 6, 'lines': [[(0, -5), (1, -6), (0, -7), (-1, -6),
-(0, -5), (0, -1), (-1, 0), (1, 3), (0, 4)], [(0, -1), (1, 0), (-1, 3),
-(0, 4), (0, 8), (-1, 9), (0, 10), (1, 9), (0, 8)], [(-2, -3), (-3, -4),
-(-4, -3), (-3, -2), (-2, -3), (2, -3), (3, -4), (4, -3), (3, -2), (2,
--3)], [(-2, 6), (-3, 5), (-4, 6), (-3, 7), (-2, 6), (2, 6), (3, 5), (4,
-6), (3, 7), (2, 6)]]}, 1279: {'charcode': 1279, 'left': -6, 'right': 7,
-'lines': [[(4, -7), (4, 6)], [(-4, -7), (4, -7)], [(-1, -1), (4, -1)],
-[(-4, 6), (4, 6)]]}, 1281: {'charcode': 1281, 'left': -10, 'right': 10,
-'lines': [[(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1), (-6, 4), (-4,
-6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6, -4), (4, -6),
-(1, -7), (-1, -7)], [(0, -1), (-1, 0), (0, 1), (1, 0), (0, -1)]]}, 1282:
-{'charcode': 1282, 'left': -6, 'right': 7, 'lines': [[(-1, -7), (-2, -6),
-(-2, -5), (-1, -4)], [(2, -7), (3, -6), (3, -5), (2, -4)], [(0, -4),
-(-2, -3), (-3, -1), (-3, 0), (-2, 2), (0, 3), (1, 3), (3, 2), (4, 0),
-(4, -1), (3, -3), (1, -4), (0, -4)], [(0, 3), (0, 7)], [(1, 3), (1, 7)],
-[(-3, 5), (4, 5)]]}, 1283: {'charcode': 1283, 'left': -6, 'right': 7,
-'lines': [[(0, -7), (-2, -6), (-3, -4), (-3, -3), (-2, -1), (0, 0),
-(1, 0), (3, -1), (4, -3), (4, -4), (3, -6), (1, -7), (0, -7)], [(0, 0),
-(0, 6)], [(1, 0), (1, 6)], [(-3, 3), (4, 3)]]}, 1284: {'charcode': 1284,
-'left': -10, 'right': 10, 'lines': [[(-1, -7), (-4, -6), (-6, -4), (-7,
--1), (-7, 1), (-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1),
-(7, -1), (6, -4), (4, -6), (1, -7), (-1, -7)], [(0, -7), (0, 7)], [(-7,
-0), (7, 0)]]}, 1285: {'charcode': 1285, 'left': -8, 'right': 7, 'lines':
-[[(0, 0), (-2, -1), (-3, -1), (-5, 0), (-6, 2), (-6, 3), (-5, 5), (-3, 6),
-(-2, 6), (0, 5), (1, 3), (1, 2), (0, 0)], [(5, -5), (0, 0)], [(0, -5),
-(5, -5), (5, 0)], [(0, -5), (4, -4), (5, 0)]]}, 1286: {'charcode': 1286,
-'left': -8, 'right': 8, 'lines': [[(-6, -6), (-5, -7), (-3, -7), (-1,
--6), (0, -4), (0, -2), (-1, 0), (-2, 1), (-4, 2)], [(-3, -7), (-2, -6),
-(-1, -4), (-1, -1), (-2, 1)], [(4, -7), (3, 6)], [(5, -7), (2, 6)], [(-4,
-2), (6, 2)]]}, 1287: {'charcode': 1287, 'left': -8, 'right': 7, 'lines':
-[[(-4, -7), (-4, 3)], [(-3, -7), (-4, 0)], [(-4, 0), (-3, -2), (-1, -3),
-(1, -3), (3, -2), (4, -1), (4, 2), (2, 4), (2, 6), (3, 7), (4, 7), (5,
-6)], [(1, -3), (3, -1), (3, 2), (2, 4)], [(-6, -7), (-3, -7)]]}, 1288:
-{'charcode': 1288, 'left': -6, 'right': 7, 'lines': [[(-3, -4), (0, -7),
-(0, -1)], [(4, -4), (1, -7), (1, -1)], [(0, -1), (-2, 0), (-3, 2), (-3,
-3), (-2, 5), (0, 6), (1, 6), (3, 5), (4, 3), (4, 2), (3, 0), (1, -1)],
-[(0, 2), (0, 3), (1, 3), (1, 2), (0, 2)]]}, 1289: {'charcode': 1289,
-'left': -8, 'right': 8, 'lines': [[(0, -7), (0, 7)], [(-5, -7), (-5, -2),
-(-4, 0), (-2, 1), (2, 1), (4, 0), (5, -2), (5, -7)], [(-6, -5), (-5, -7),
-(-4, -5)], [(-1, -5), (0, -7), (1, -5)], [(4, -5), (5, -7), (6, -5)],
-[(-3, 4), (3, 4)]]}, 1290: {'charcode': 1290, 'left': -8, 'right': 7,
-'lines': [[(-4, -7), (-4, 6)], [(-3, -7), (-3, 6)], [(-6, -7), (1, -7),
-(4, -6), (5, -4), (5, -3), (4, -1), (1, 0), (-3, 0)], [(1, -7), (3, -6),
-(4, -4), (4, -3), (3, -1), (1, 0)], [(-6, 6), (4, 6), (4, 3), (3, 6)]]},
-1291: {'charcode': 1291, 'left': -6, 'right': 7, 'lines': [[(5, -7), (2,
--7), (-1, -6), (-3, -4), (-4, -1), (-4, 1), (-3, 4), (-1, 6), (2, 7), (5,
-7)], [(5, -7), (2, -6), (0, -4), (-1, -1), (-1, 1), (0, 4), (2, 6), (5,
-7)]]}, 1292: {'charcode': 1292, 'left': -8, 'right': 8, 'lines': [[(0, 0),
-(-2, -1), (-3, -1), (-5, 0), (-6, 2), (-6, 3), (-5, 5), (-3, 6), (-2, 6),
-(0, 5), (1, 3), (1, 2), (0, 0)], [(1, -6), (-1, -1)], [(5, -5), (0, 0)],
-[(6, -1), (1, 1)]]}, 1293: {'charcode': 1293, 'left': -7, 'right': 7,
-'lines': [[(-2, -5), (2, 5)], [(2, -5), (-2, 5)], [(-5, -2), (5, 2)],
-[(5, -2), (-5, 2)]]}, 1294: {'charcode': 1294, 'left': -8, 'right': 9,
-'lines': [[(-3, 3), (-5, 3), (-6, 4), (-6, 6), (-5, 7), (-3, 7), (-2, 6),
-(-2, 4), (-4, 2), (-5, 0), (-5, -3), (-4, -5), (-3, -6), (-1, -7), (2,
--7), (4, -6), (5, -5), (6, -3), (6, 0), (5, 2), (3, 4), (3, 6), (4, 7),
-(6, 7), (7, 6), (7, 4), (6, 3), (4, 3)], [(-4, -5), (-2, -6), (3, -6),
-(5, -5)]]}, 1295: {'charcode': 1295, 'left': -8, 'right': 9, 'lines':
-[[(-3, -3), (-5, -3), (-6, -4), (-6, -6), (-5, -7), (-3, -7), (-2, -6),
-(-2, -4), (-4, -2), (-5, 0), (-5, 3), (-4, 5), (-3, 6), (-1, 7), (2,
-7), (4, 6), (5, 5), (6, 3), (6, 0), (5, -2), (3, -4), (3, -6), (4, -7),
-(6, -7), (7, -6), (7, -4), (6, -3), (4, -3)], [(-4, 5), (-2, 6), (3, 6),
-(5, 5)]]}, 1401: {'charcode': 1401, 'left': -12, 'right': 12, 'lines':
-[[(-7, -10), (-7, 10)], [(-6, -10), (-6, 10)], [(6, -10), (6, 10)], [(7,
--10), (7, 10)], [(-10, -10), (10, -10)], [(-10, 10), (-3, 10)], [(3, 10),
-(10, 10)]]}, 1402: {'charcode': 1402, 'left': -10, 'right': 11, 'lines':
-[[(-7, -10), (0, -1), (-8, 10)], [(-8, -10), (-1, -1)], [(-8, -10), (7,
--10), (8, -5), (6, -10)], [(-7, 9), (6, 9)], [(-8, 10), (7, 10), (8, 5),
-(6, 10)]]}, 1403: {'charcode': 1403, 'left': -7, 'right': 7, 'lines':
-[[(4, -16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7),
-(0, 11), (2, 14), (4, 16)], [(2, -14), (0, -10), (-1, -7), (-2, -2), (-2,
-2), (-1, 7), (0, 10), (2, 14)]]}, 1404: {'charcode': 1404, 'left': -7,
-'right': 7, 'lines': [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2),
-(3, 2), (2, 7), (0, 11), (-2, 14), (-4, 16)], [(-2, -14), (0, -10), (1,
--7), (2, -2), (2, 2), (1, 7), (0, 10), (-2, 14)]]}, 1405: {'charcode':
-1405, 'left': -7, 'right': 7, 'lines': [[(-3, -16), (-3, 16)], [(-2,
--16), (-2, 16)], [(-3, -16), (4, -16)], [(-3, 16), (4, 16)]]}, 1406:
-{'charcode': 1406, 'left': -7, 'right': 7, 'lines': [[(2, -16), (2, 16)],
-[(3, -16), (3, 16)], [(-4, -16), (3, -16)], [(-4, 16), (3, 16)]]}, 1407:
-{'charcode': 1407, 'left': -7, 'right': 7, 'lines': [[(2, -16), (0, -15),
-(-1, -14), (-2, -12), (-2, -10), (-1, -8), (0, -7), (1, -5), (1, -3),
-(-1, -1)], [(0, -15), (-1, -13), (-1, -11), (0, -9), (1, -8), (2, -6), (2,
--4), (1, -2), (-3, 0), (1, 2), (2, 4), (2, 6), (1, 8), (0, 9), (-1, 11),
-(-1, 13), (0, 15)], [(-1, 1), (1, 3), (1, 5), (0, 7), (-1, 8), (-2, 10),
-(-2, 12), (-1, 14), (0, 15), (2, 16)]]}, 1408: {'charcode': 1408, 'left':
--7, 'right': 7, 'lines': [[(-2, -16), (0, -15), (1, -14), (2, -12),
-(2, -10), (1, -8), (0, -7), (-1, -5), (-1, -3), (1, -1)], [(0, -15), (1,
--13), (1, -11), (0, -9), (-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0),
-(-1, 2), (-2, 4), (-2, 6), (-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)],
-[(1, 1), (-1, 3), (-1, 5), (0, 7), (1, 8), (2, 10), (2, 12), (1, 14),
-(0, 15), (-2, 16)]]}, 1409: {'charcode': 1409, 'left': -7, 'right': 7,
-'lines': [[(3, -18), (0, -15), (-2, -12), (-3, -9), (-3, -6), (-2, -3),
-(1, 4), (2, 7), (2, 10), (1, 13), (0, 15)], [(0, -15), (-1, -13), (-2,
--10), (-2, -7), (-1, -4), (2, 3), (3, 6), (3, 9), (2, 12), (0, 15),
-(-3, 18)]]}, 1410: {'charcode': 1410, 'left': -7, 'right': 7, 'lines':
-[[(-3, -18), (0, -15), (2, -12), (3, -9), (3, -6), (2, -3), (-1, 4),
-(-2, 7), (-2, 10), (-1, 13), (0, 15)], [(0, -15), (1, -13), (2, -10), (2,
--7), (1, -4), (-2, 3), (-3, 6), (-3, 9), (-2, 12), (0, 15), (3, 18)]]},
-1411: {'charcode': 1411, 'left': -17, 'right': 6, 'lines': [[(-15, 0),
-(-11, 0), (0, 14)], [(-11, 1), (0, 15)], [(-12, 1), (0, 16)], [(6, -24),
-(0, 16)]]}, 1412: {'charcode': 1412, 'left': -12, 'right': 12, 'lines':
-[[(9, -15), (8, -14), (9, -13), (10, -14), (10, -15), (9, -16), (7, -16),
-(5, -15), (3, -13), (2, -11), (1, -8), (0, -4), (-2, 8), (-3, 12), (-4,
-14)], [(4, -14), (3, -12), (2, -8), (0, 4), (-1, 8), (-2, 11), (-3, 13),
-(-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 14), (-9, 13), (-8, 14),
-(-9, 15)]]}, 2001: {'charcode': 2001, 'left': -10, 'right': 10, 'lines':
-[[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)], [(-5, 3),
-(4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]}, 2002: {'charcode': 2002,
-'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12),
-(-5, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -6),
-(7, -4), (6, -3), (3, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7,
--6), (6, -4), (5, -3), (3, -2)], [(-5, -2), (3, -2), (6, -1), (7, 0),
-(8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-9, 9)], [(3, -2), (5, -1),
-(6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]}, 2003: {'charcode':
-2003, 'left': -11, 'right': 10, 'lines': [[(6, -9), (7, -6), (7, -12),
-(6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7),
-(-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8),
-(6, 6), (7, 4)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4),
-(-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)]]}, 2004: {'charcode': 2004,
-'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12),
-(-5, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4),
-(8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)], [(1, -12), (3, -11),
-(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (1, 9)]]},
-2005: {'charcode': 2005, 'left': -11, 'right': 10, 'lines': [[(-6, -12),
-(-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12),
-(7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6,
-9)]]}, 2006: {'charcode': 2006, 'left': -11, 'right': 9, 'lines': [[(-6,
--12), (-6, 9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12),
-(7, -12), (7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (-2, 9)]]},
-2007: {'charcode': 2007, 'left': -11, 'right': 12, 'lines': [[(6, -9),
-(7, -6), (7, -12), (6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11),
-(-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1,
-9), (1, 9), (4, 8), (6, 6)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7),
-(-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(6, 1), (6, 9)],
-[(7, 1), (7, 9)], [(3, 1), (10, 1)]]}, 2008: {'charcode': 2008, 'left':
--12, 'right': 12, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)],
-[(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3,
--12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9),
-(10, 9)]]}, 2009: {'charcode': 2009, 'left': -5, 'right': 6, 'lines':
-[[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-3, -12), (4, -12)], [(-3,
-9), (4, 9)]]}, 2010: {'charcode': 2010, 'left': -7, 'right': 8, 'lines':
-[[(3, -12), (3, 5), (2, 8), (0, 9), (-2, 9), (-4, 8), (-5, 6), (-5, 4),
-(-4, 3), (-3, 4), (-4, 5)], [(2, -12), (2, 5), (1, 8), (0, 9)], [(-1,
--12), (6, -12)]]}, 2011: {'charcode': 2011, 'left': -12, 'right': 10,
-'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(7, -12), (-6,
-1)], [(-1, -3), (7, 9)], [(-2, -3), (6, 9)], [(-10, -12), (-3, -12)],
-[(3, -12), (9, -12)], [(-10, 9), (-3, 9)], [(3, 9), (9, 9)]]}, 2012:
-{'charcode': 2012, 'left': -9, 'right': 9, 'lines': [[(-4, -12), (-4,
-9)], [(-3, -12), (-3, 9)], [(-7, -12), (0, -12)], [(-7, 9), (8, 9),
-(8, 3), (7, 9)]]}, 2013: {'charcode': 2013, 'left': -12, 'right': 13,
-'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)], [(-7, -12), (0,
-9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12), (8, 9)], [(-10,
--12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9), (-4, 9)], [(4, 9),
-(11, 9)]]}, 2014: {'charcode': 2014, 'left': -11, 'right': 12, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -12), (7, 7)], [(-5, -10), (7, 9)], [(7,
--12), (7, 9)], [(-9, -12), (-5, -12)], [(4, -12), (10, -12)], [(-9, 9),
-(-3, 9)]]}, 2015: {'charcode': 2015, 'left': -11, 'right': 11, 'lines':
-[[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8,
--3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3,
--11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8),
-(-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7),
-(5, -9), (3, -11), (1, -12)]]}, 2016: {'charcode': 2016, 'left': -11,
-'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9,
--12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2),
-(3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5),
-(6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]}, 2017: {'charcode':
-2017, 'left': -11, 'right': 11, 'lines': [[(-1, -12), (-4, -11), (-6,
--9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9),
-(1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4,
--11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7),
-(-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8),
-(5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3, -11), (1, -12)],
-[(-4, 7), (-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 13),
-(5, 14), (7, 14), (8, 12), (8, 11)], [(3, 6), (4, 10), (5, 12), (6, 13),
-(7, 13), (8, 12)]]}, 2018: {'charcode': 2018, 'left': -11, 'right': 11,
-'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3,
--12), (6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2),
-(-5, -2)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4),
-(5, -3), (3, -2)], [(-9, 9), (-2, 9)], [(0, -2), (2, -1), (3, 0), (6, 7),
-(7, 8), (8, 8), (9, 7)], [(2, -1), (3, 1), (5, 8), (6, 9), (8, 9), (9, 7),
-(9, 6)]]}, 2019: {'charcode': 2019, 'left': -10, 'right': 10, 'lines':
-[[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12),
-(-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (3, -1),
-(5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3, -2), (5, -1), (6,
-0), (7, 2), (7, 6), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3),
-(-7, 9), (-6, 6)]]}, 2020: {'charcode': 2020, 'left': -9, 'right': 10,
-'lines': [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12), (-7, -6),
-(-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]}, 2021:
-{'charcode': 2021, 'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7,
-3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)],
-[(-6, -12), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(-10, -12), (-3, -12)],
-[(4, -12), (10, -12)]]}, 2022: {'charcode': 2022, 'left': -10, 'right':
-10, 'lines': [[(-7, -12), (0, 9)], [(-6, -12), (0, 6)], [(7, -12), (0,
-9)], [(-9, -12), (-3, -12)], [(3, -12), (9, -12)]]}, 2023: {'charcode':
-2023, 'left': -12, 'right': 12, 'lines': [[(-8, -12), (-4, 9)], [(-7,
--12), (-4, 4)], [(0, -12), (-4, 9)], [(0, -12), (4, 9)], [(1, -12),
-(4, 4)], [(8, -12), (4, 9)], [(-11, -12), (-4, -12)], [(5, -12), (11,
--12)]]}, 2024: {'charcode': 2024, 'left': -10, 'right': 10, 'lines':
-[[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9,
--12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9),
-(9, 9)]]}, 2025: {'charcode': 2025, 'left': -10, 'right': 11, 'lines':
-[[(-7, -12), (0, -1), (0, 9)], [(-6, -12), (1, -1), (1, 9)], [(8, -12),
-(1, -1)], [(-9, -12), (-3, -12)], [(4, -12), (10, -12)], [(-3, 9), (4,
-9)]]}, 2026: {'charcode': 2026, 'left': -10, 'right': 10, 'lines': [[(6,
--12), (-7, 9)], [(7, -12), (-6, 9)], [(-6, -12), (-7, -6), (-7, -12),
-(7, -12)], [(-7, 9), (7, 9), (7, 3), (6, 9)]]}, 2027: {'charcode': 2027,
-'left': -10, 'right': 10, 'lines': [[(0, -12), (-7, 9)], [(0, -12), (7,
-9)], [(0, -9), (6, 9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9),
-(9, 9)]]}, 2028: {'charcode': 2028, 'left': -11, 'right': 11, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6,
--11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12),
-(5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5,
--2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9),
-(-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8),
-(3, 9)]]}, 2029: {'charcode': 2029, 'left': -9, 'right': 9, 'lines':
-[[(-4, -12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8,
--6), (7, -12)], [(-7, 9), (0, 9)]]}, 2030: {'charcode': 2030, 'left':
--10, 'right': 10, 'lines': [[(0, -12), (-8, 9)], [(0, -12), (8, 9)],
-[(0, -9), (7, 9)], [(-7, 8), (7, 8)], [(-8, 9), (8, 9)]]}, 2031:
-{'charcode': 2031, 'left': -11, 'right': 10, 'lines': [[(-6, -12), (-6,
-9)], [(-5, -12), (-5, 9)], [(1, -6), (1, 2)], [(-9, -12), (7, -12),
-(7, -6), (6, -12)], [(-5, -2), (1, -2)], [(-9, 9), (7, 9), (7, 3), (6,
-9)]]}, 2032: {'charcode': 2032, 'left': -10, 'right': 10, 'lines': [[(6,
--12), (-7, 9)], [(7, -12), (-6, 9)], [(-6, -12), (-7, -6), (-7, -12),
-(7, -12)], [(-7, 9), (7, 9), (7, 3), (6, 9)]]}, 2033: {'charcode': 2033,
-'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12),
-(-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)],
-[(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9),
-(10, 9)]]}, 2034: {'charcode': 2034, 'left': -11, 'right': 11, 'lines':
-[[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8,
--3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3,
--11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8),
-(-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7),
-(5, -9), (3, -11), (1, -12)], [(-3, -5), (-3, 2)], [(3, -5), (3, 2)],
-[(-3, -2), (3, -2)], [(-3, -1), (3, -1)]]}, 2035: {'charcode': 2035,
-'left': -5, 'right': 6, 'lines': [[(0, -12), (0, 9)], [(1, -12), (1, 9)],
-[(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]}, 2036: {'charcode': 2036,
-'left': -12, 'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12),
-(-6, 9)], [(7, -12), (-6, 1)], [(-1, -3), (7, 9)], [(-2, -3), (6, 9)],
-[(-10, -12), (-3, -12)], [(3, -12), (9, -12)], [(-10, 9), (-3, 9)],
-[(3, 9), (9, 9)]]}, 2037: {'charcode': 2037, 'left': -10, 'right': 10,
-'lines': [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6, 9)],
-[(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]}, 2038: {'charcode': 2038, 'left':
--12, 'right': 13, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (0, 6)],
-[(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)], [(8, -12),
-(8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)], [(-10, 9),
-(-4, 9)], [(4, 9), (11, 9)]]}, 2039: {'charcode': 2039, 'left': -11,
-'right': 12, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (7, 7)], [(-5,
--10), (7, 9)], [(7, -12), (7, 9)], [(-9, -12), (-5, -12)], [(4, -12),
-(10, -12)], [(-9, 9), (-3, 9)]]}, 2040: {'charcode': 2040, 'left': -11,
-'right': 11, 'lines': [[(-7, -13), (-8, -8)], [(8, -13), (7, -8)],
-[(-3, -4), (-4, 1)], [(4, -4), (3, 1)], [(-7, 5), (-8, 10)], [(8, 5),
-(7, 10)], [(-7, -11), (7, -11)], [(-7, -10), (7, -10)], [(-3, -2),
-(3, -2)], [(-3, -1), (3, -1)], [(-7, 7), (7, 7)], [(-7, 8), (7, 8)]]},
-2041: {'charcode': 2041, 'left': -11, 'right': 11, 'lines': [[(-1, -12),
-(-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4,
-8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7),
-(6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3, -11), (-5,
--9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8), (-1, 9)],
-[(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7), (5, -9), (3,
--11), (1, -12)]]}, 2042: {'charcode': 2042, 'left': -12, 'right': 12,
-'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6,
-9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9), (-3, 9)],
-[(3, 9), (10, 9)]]}, 2043: {'charcode': 2043, 'left': -11, 'right': 11,
-'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3,
--12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1),
-(-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5,
--2), (3, -1)], [(-9, 9), (-2, 9)]]}, 2044: {'charcode': 2044, 'left':
--10, 'right': 11, 'lines': [[(-7, -12), (0, -2), (-8, 9)], [(-8, -12),
-(-1, -2)], [(-8, -12), (7, -12), (8, -6), (6, -12)], [(-7, 8), (6, 8)],
-[(-8, 9), (7, 9), (8, 3), (6, 9)]]}, 2045: {'charcode': 2045, 'left': -9,
-'right': 10, 'lines': [[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-6, -12),
-(-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9), (4, 9)]]},
-2046: {'charcode': 2046, 'left': -9, 'right': 10, 'lines': [[(-7, -7),
-(-7, -9), (-6, -11), (-5, -12), (-3, -12), (-2, -11), (-1, -9), (0, -5),
-(0, 9)], [(-7, -9), (-5, -11), (-3, -11), (-1, -9)], [(8, -7), (8, -9),
-(7, -11), (6, -12), (4, -12), (3, -11), (2, -9), (1, -5), (1, 9)], [(8,
--9), (6, -11), (4, -11), (2, -9)], [(-3, 9), (4, 9)]]}, 2047: {'charcode':
-2047, 'left': -10, 'right': 11, 'lines': [[(0, -12), (0, 9)], [(1, -12),
-(1, 9)], [(-2, -7), (-5, -6), (-6, -5), (-7, -3), (-7, 0), (-6, 2),
-(-5, 3), (-2, 4), (3, 4), (6, 3), (7, 2), (8, 0), (8, -3), (7, -5),
-(6, -6), (3, -7), (-2, -7)], [(-2, -7), (-4, -6), (-5, -5), (-6, -3),
-(-6, 0), (-5, 2), (-4, 3), (-2, 4)], [(3, 4), (5, 3), (6, 2), (7, 0),
-(7, -3), (6, -5), (5, -6), (3, -7)], [(-3, -12), (4, -12)], [(-3, 9),
-(4, 9)]]}, 2048: {'charcode': 2048, 'left': -10, 'right': 10, 'lines':
-[[(-7, -12), (6, 9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9,
--12), (-3, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9),
-(9, 9)]]}, 2049: {'charcode': 2049, 'left': -11, 'right': 12, 'lines':
-[[(0, -12), (0, 9)], [(1, -12), (1, 9)], [(-9, -5), (-8, -6), (-6, -5),
-(-5, -1), (-4, 1), (-3, 2), (-1, 3)], [(-8, -6), (-7, -5), (-6, -1),
-(-5, 1), (-4, 2), (-1, 3), (2, 3), (5, 2), (6, 1), (7, -1), (8, -5),
-(9, -6)], [(2, 3), (4, 2), (5, 1), (6, -1), (7, -5), (9, -6), (10, -5)],
-[(-3, -12), (4, -12)], [(-3, 9), (4, 9)]]}, 2050: {'charcode': 2050,
-'left': -11, 'right': 11, 'lines': [[(-8, 6), (-7, 9), (-3, 9), (-5, 5),
-(-7, 1), (-8, -2), (-8, -6), (-7, -9), (-5, -11), (-2, -12), (2, -12), (5,
--11), (7, -9), (8, -6), (8, -2), (7, 1), (5, 5), (3, 9), (7, 9), (8, 6)],
-[(-5, 5), (-6, 2), (-7, -2), (-7, -6), (-6, -9), (-4, -11), (-2, -12)],
-[(2, -12), (4, -11), (6, -9), (7, -6), (7, -2), (6, 2), (5, 5)], [(-7,
-8), (-4, 8)], [(4, 8), (7, 8)]]}, 2051: {'charcode': 2051, 'left': -10,
-'right': 10, 'lines': [[(3, -12), (-10, 9)], [(3, -12), (4, 9)], [(2,
--10), (3, 9)], [(-6, 3), (3, 3)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]},
-2052: {'charcode': 2052, 'left': -12, 'right': 12, 'lines': [[(-3, -12),
-(-9, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9),
-(9, -7), (8, -4), (7, -3), (4, -2)], [(5, -12), (7, -11), (8, -9), (8,
--7), (7, -4), (6, -3), (4, -2)], [(-5, -2), (4, -2), (6, -1), (7, 1),
-(7, 3), (6, 6), (4, 8), (0, 9), (-12, 9)], [(4, -2), (5, -1), (6, 1),
-(6, 3), (5, 6), (3, 8), (0, 9)]]}, 2053: {'charcode': 2053, 'left': -10,
-'right': 11, 'lines': [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8),
-(8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6),
-(-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (3, 8),
-(5, 6), (6, 4)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3),
-(-6, 1), (-6, 4), (-5, 7), (-4, 8), (-2, 9)]]}, 2054: {'charcode': 2054,
-'left': -12, 'right': 11, 'lines': [[(-3, -12), (-9, 9)], [(-2, -12),
-(-8, 9)], [(-6, -12), (3, -12), (6, -11), (7, -10), (8, -7), (8, -3),
-(7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-12, 9)], [(3, -12), (5, -11),
-(6, -10), (7, -7), (7, -3), (6, 1), (4, 5), (2, 7), (0, 8), (-3, 9)]]},
-2055: {'charcode': 2055, 'left': -12, 'right': 11, 'lines': [[(-3,
--12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)], [(-6, -12),
-(9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9), (3, 9),
-(5, 4), (2, 9)]]}, 2056: {'charcode': 2056, 'left': -12, 'right': 10,
-'lines': [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(2, -6), (0, 2)],
-[(-6, -12), (9, -12), (8, -6), (8, -12)], [(-5, -2), (1, -2)], [(-12, 9),
-(-5, 9)]]}, 2057: {'charcode': 2057, 'left': -10, 'right': 12, 'lines':
-[[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11),
-(5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1),
-(-7, 4), (-6, 7), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (7, 2)],
-[(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1), (-6, 4),
-(-5, 7), (-4, 8), (-2, 9)], [(0, 9), (2, 8), (4, 6), (6, 2)], [(3, 2),
-(10, 2)]]}, 2058: {'charcode': 2058, 'left': -13, 'right': 13, 'lines':
-[[(-4, -12), (-10, 9)], [(-3, -12), (-9, 9)], [(9, -12), (3, 9)], [(10,
--12), (4, 9)], [(-7, -12), (0, -12)], [(6, -12), (13, -12)], [(-6, -2),
-(6, -2)], [(-13, 9), (-6, 9)], [(0, 9), (7, 9)]]}, 2059: {'charcode':
-2059, 'left': -6, 'right': 7, 'lines': [[(3, -12), (-3, 9)], [(4, -12),
-(-2, 9)], [(0, -12), (7, -12)], [(-6, 9), (1, 9)]]}, 2060: {'charcode':
-2060, 'left': -9, 'right': 9, 'lines': [[(6, -12), (1, 5), (0, 7),
-(-1, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 4),
-(-7, 5)], [(5, -12), (0, 5), (-1, 7), (-3, 9)], [(2, -12), (9, -12)]]},
-2061: {'charcode': 2061, 'left': -12, 'right': 11, 'lines': [[(-3, -12),
-(-9, 9)], [(-2, -12), (-8, 9)], [(11, -12), (-6, 1)], [(1, -3), (5, 9)],
-[(0, -3), (4, 9)], [(-6, -12), (1, -12)], [(7, -12), (13, -12)], [(-12,
-9), (-5, 9)], [(1, 9), (7, 9)]]}, 2062: {'charcode': 2062, 'left': -10,
-'right': 10, 'lines': [[(-1, -12), (-7, 9)], [(0, -12), (-6, 9)], [(-4,
--12), (3, -12)], [(-10, 9), (5, 9), (7, 3), (4, 9)]]}, 2063: {'charcode':
-2063, 'left': -13, 'right': 14, 'lines': [[(-4, -12), (-10, 9)], [(-4,
--12), (-3, 9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(10, -12),
-(4, 9)], [(11, -12), (5, 9)], [(-7, -12), (-3, -12)], [(10, -12), (14,
--12)], [(-13, 9), (-7, 9)], [(1, 9), (8, 9)]]}, 2064: {'charcode': 2064,
-'left': -12, 'right': 13, 'lines': [[(-3, -12), (-9, 9)], [(-3, -12),
-(4, 6)], [(-3, -9), (4, 9)], [(10, -12), (4, 9)], [(-6, -12), (-3, -12)],
-[(7, -12), (13, -12)], [(-12, 9), (-6, 9)]]}, 2065: {'charcode': 2065,
-'left': -11, 'right': 11, 'lines': [[(1, -12), (-2, -11), (-4, -9), (-6,
--6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9),
-(2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11),
-(4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3),
-(-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3),
-(6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]}, 2066: {'charcode': 2066,
-'left': -12, 'right': 11, 'lines': [[(-3, -12), (-9, 9)], [(-2, -12),
-(-8, 9)], [(-6, -12), (6, -12), (9, -11), (10, -9), (10, -7), (9, -4),
-(7, -2), (3, -1), (-5, -1)], [(6, -12), (8, -11), (9, -9), (9, -7), (8,
--4), (6, -2), (3, -1)], [(-12, 9), (-5, 9)]]}, 2067: {'charcode': 2067,
-'left': -11, 'right': 11, 'lines': [[(1, -12), (-2, -11), (-4, -9), (-6,
--6), (-7, -3), (-8, 1), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-1, 9),
-(2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11),
-(4, -12), (1, -12)], [(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3),
-(-7, 1), (-7, 4), (-6, 7), (-4, 9)], [(-1, 9), (1, 8), (3, 6), (5, 3),
-(6, 0), (7, -4), (7, -7), (6, -10), (4, -12)], [(-6, 7), (-6, 6), (-5, 4),
-(-3, 3), (-2, 3), (0, 4), (1, 6), (1, 13), (2, 14), (4, 14), (5, 12), (5,
-11)], [(1, 6), (2, 12), (3, 13), (4, 13), (5, 12)]]}, 2068: {'charcode':
-2068, 'left': -12, 'right': 12, 'lines': [[(-3, -12), (-9, 9)], [(-2,
--12), (-8, 9)], [(-6, -12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4),
-(7, -3), (4, -2), (-5, -2)], [(5, -12), (7, -11), (8, -9), (8, -7), (7,
--4), (6, -3), (4, -2)], [(0, -2), (2, -1), (3, 0), (4, 8), (5, 9), (7,
-9), (8, 7), (8, 6)], [(3, 0), (5, 7), (6, 8), (7, 8), (8, 7)], [(-12, 9),
-(-5, 9)]]}, 2069: {'charcode': 2069, 'left': -11, 'right': 12, 'lines':
-[[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11),
-(4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5), (-3, -4),
-(4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2), (6, 5),
-(5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3),
-(-9, 9), (-8, 7), (-7, 7)]]}, 2070: {'charcode': 2070, 'left': -10,
-'right': 11, 'lines': [[(3, -12), (-3, 9)], [(4, -12), (-2, 9)], [(-3,
--12), (-6, -6), (-4, -12), (11, -12), (10, -6), (10, -12)], [(-6, 9),
-(1, 9)]]}, 2071: {'charcode': 2071, 'left': -12, 'right': 13, 'lines':
-[[(-4, -12), (-7, -1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (3,
-8), (5, 6), (6, 3), (10, -12)], [(-3, -12), (-6, -1), (-7, 3), (-7, 6),
-(-6, 8), (-4, 9)], [(-7, -12), (0, -12)], [(7, -12), (13, -12)]]}, 2072:
-{'charcode': 2072, 'left': -10, 'right': 10, 'lines': [[(-4, -12), (-3,
-9)], [(-3, -12), (-2, 7)], [(10, -12), (-3, 9)], [(-6, -12), (0, -12)],
-[(6, -12), (12, -12)]]}, 2073: {'charcode': 2073, 'left': -13, 'right':
-13, 'lines': [[(-5, -12), (-7, 9)], [(-4, -12), (-6, 7)], [(3, -12),
-(-7, 9)], [(3, -12), (1, 9)], [(4, -12), (2, 7)], [(11, -12), (1, 9)],
-[(-8, -12), (-1, -12)], [(8, -12), (14, -12)]]}, 2074: {'charcode': 2074,
-'left': -11, 'right': 11, 'lines': [[(-4, -12), (3, 9)], [(-3, -12),
-(4, 9)], [(10, -12), (-10, 9)], [(-6, -12), (0, -12)], [(6, -12), (12,
--12)], [(-12, 9), (-6, 9)], [(0, 9), (6, 9)]]}, 2075: {'charcode': 2075,
-'left': -10, 'right': 11, 'lines': [[(-4, -12), (0, -2), (-3, 9)], [(-3,
--12), (1, -2), (-2, 9)], [(11, -12), (1, -2)], [(-6, -12), (0, -12)],
-[(7, -12), (13, -12)], [(-6, 9), (1, 9)]]}, 2076: {'charcode': 2076,
-'left': -11, 'right': 11, 'lines': [[(9, -12), (-10, 9)], [(10, -12),
-(-9, 9)], [(-3, -12), (-6, -6), (-4, -12), (10, -12)], [(-10, 9), (4,
-9), (6, 3), (3, 9)]]}, 2077: {'charcode': 2077, 'left': -10, 'right':
-10, 'lines': [[(-7, -9), (-6, -7), (6, 5), (7, 7), (7, 9)], [(-6, -6),
-(6, 6)], [(-7, -9), (-7, -7), (-6, -5), (6, 7), (7, 9)], [(-2, -2), (-6,
-2), (-7, 4), (-7, 6), (-6, 8), (-7, 9)], [(-7, 4), (-5, 8)], [(-6, 2),
-(-6, 4), (-5, 6), (-5, 8), (-7, 9)], [(1, 1), (6, -4)], [(4, -9), (4,
--6), (5, -4), (7, -4), (7, -6), (5, -7), (4, -9)], [(4, -9), (5, -6),
-(7, -4)]]}, 2101: {'charcode': 2101, 'left': -9, 'right': 11, 'lines':
-[[(-4, -3), (-4, -2), (-5, -2), (-5, -3), (-4, -4), (-2, -5), (2, -5),
-(4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(5, -3), (5, 6),
-(6, 8), (8, 9), (9, 9)], [(5, -1), (4, 0), (-2, 1), (-5, 2), (-6, 4),
-(-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(-2, 1), (-4, 2),
-(-5, 4), (-5, 6), (-4, 8), (-2, 9)]]}, 2102: {'charcode': 2102, 'left':
--11, 'right': 10, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5,
-9)], [(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1),
-(7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5),
-(3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -12),
-(-5, -12)]]}, 2103: {'charcode': 2103, 'left': -10, 'right': 9, 'lines':
-[[(5, -2), (4, -1), (5, 0), (6, -1), (6, -2), (4, -4), (2, -5), (-1, -5),
-(-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6),
-(-3, 8), (-1, 9)]]}, 2104: {'charcode': 2104, 'left': -10, 'right': 11,
-'lines': [[(5, -12), (5, 9)], [(6, -12), (6, 9)], [(5, -2), (3, -4), (1,
--5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8),
-(-1, 9), (1, 9), (3, 8), (5, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6,
-1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(2, -12), (6, -12)], [(5, 9),
-(9, 9)]]}, 2105: {'charcode': 2105, 'left': -10, 'right': 9, 'lines':
-[[(-6, 1), (6, 1), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5), (-4,
--4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4,
-8), (6, 6)], [(5, 1), (5, -2), (4, -4)], [(-1, -5), (-3, -4), (-5, -2),
-(-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)]]}, 2106: {'charcode': 2106,
-'left': -7, 'right': 6, 'lines': [[(3, -11), (2, -10), (3, -9), (4, -10),
-(4, -11), (3, -12), (1, -12), (-1, -11), (-2, -9), (-2, 9)], [(1, -12),
-(0, -11), (-1, -9), (-1, 9)], [(-5, -5), (3, -5)], [(-5, 9), (2, 9)]]},
-2107: {'charcode': 2107, 'left': -9, 'right': 10, 'lines': [[(-1, -5),
-(-3, -4), (-4, -3), (-5, -1), (-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5),
-(3, 4), (4, 3), (5, 1), (5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)],
-[(-3, -4), (-4, -2), (-4, 2), (-3, 4)], [(3, 4), (4, 2), (4, -2), (3,
--4)], [(4, -3), (5, -4), (7, -5), (7, -4), (5, -4)], [(-4, 3), (-5, 4),
-(-6, 6), (-6, 7), (-5, 9), (-2, 10), (3, 10), (6, 11), (7, 12)], [(-6,
-7), (-5, 8), (-2, 9), (3, 9), (6, 10), (7, 12), (7, 13), (6, 15), (3,
-16), (-3, 16), (-6, 15), (-7, 13), (-7, 12), (-6, 10), (-3, 9)]]}, 2108:
-{'charcode': 2108, 'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6,
-9)], [(-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (0, -5), (2, -5), (5,
--4), (6, -2), (6, 9)], [(2, -5), (4, -4), (5, -2), (5, 9)], [(-9, -12),
-(-5, -12)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]}, 2109: {'charcode':
-2109, 'left': -5, 'right': 6, 'lines': [[(0, -12), (-1, -11), (0, -10),
-(1, -11), (0, -12)], [(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (1,
--5)], [(-3, 9), (4, 9)]]}, 2110: {'charcode': 2110, 'left': -5, 'right':
-6, 'lines': [[(1, -12), (0, -11), (1, -10), (2, -11), (1, -12)], [(2,
--5), (2, 13), (1, 15), (-1, 16), (-3, 16), (-4, 15), (-4, 14), (-3, 13),
-(-2, 14), (-3, 15)], [(1, -5), (1, 13), (0, 15), (-1, 16)], [(-2, -5),
-(2, -5)]]}, 2111: {'charcode': 2111, 'left': -11, 'right': 10, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(5, -5), (-5, 5)], [(0,
-1), (6, 9)], [(-1, 1), (5, 9)], [(-9, -12), (-5, -12)], [(2, -5), (8,
--5)], [(-9, 9), (-2, 9)], [(2, 9), (8, 9)]]}, 2112: {'charcode': 2112,
-'left': -5, 'right': 6, 'lines': [[(0, -12), (0, 9)], [(1, -12), (1, 9)],
-[(-3, -12), (1, -12)], [(-3, 9), (4, 9)]]}, 2113: {'charcode': 2113,
-'left': -16, 'right': 17, 'lines': [[(-11, -5), (-11, 9)], [(-10, -5),
-(-10, 9)], [(-10, -2), (-8, -4), (-5, -5), (-3, -5), (0, -4), (1, -2),
-(1, 9)], [(-3, -5), (-1, -4), (0, -2), (0, 9)], [(1, -2), (3, -4), (6,
--5), (8, -5), (11, -4), (12, -2), (12, 9)], [(8, -5), (10, -4), (11, -2),
-(11, 9)], [(-14, -5), (-10, -5)], [(-14, 9), (-7, 9)], [(-3, 9), (4, 9)],
-[(8, 9), (15, 9)]]}, 2114: {'charcode': 2114, 'left': -11, 'right': 11,
-'lines': [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(-5, -2), (-3, -4),
-(0, -5), (2, -5), (5, -4), (6, -2), (6, 9)], [(2, -5), (4, -4), (5, -2),
-(5, 9)], [(-9, -5), (-5, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]},
-2115: {'charcode': 2115, 'left': -10, 'right': 10, 'lines': [[(-1, -5),
-(-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)],
-[(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8),
-(-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1), (5, -2), (3, -4),
-(1, -5)]]}, 2116: {'charcode': 2116, 'left': -11, 'right': 10, 'lines':
-[[(-6, -5), (-6, 16)], [(-5, -5), (-5, 16)], [(-5, -2), (-3, -4), (-1,
--5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9),
-(-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3),
-(5, 6), (3, 8), (1, 9)], [(-9, -5), (-5, -5)], [(-9, 16), (-2, 16)]]},
-2117: {'charcode': 2117, 'left': -10, 'right': 10, 'lines': [[(5, -5),
-(5, 16)], [(6, -5), (6, 16)], [(5, -2), (3, -4), (1, -5), (-1, -5),
-(-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(3, 8), (5, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5,
-6), (-3, 8), (-1, 9)], [(2, 16), (9, 16)]]}, 2118: {'charcode': 2118,
-'left': -9, 'right': 8, 'lines': [[(-4, -5), (-4, 9)], [(-3, -5), (-3,
-9)], [(-3, 1), (-2, -2), (0, -4), (2, -5), (5, -5), (6, -4), (6, -3),
-(5, -2), (4, -3), (5, -4)], [(-7, -5), (-3, -5)], [(-7, 9), (0, 9)]]},
-2119: {'charcode': 2119, 'left': -8, 'right': 9, 'lines': [[(5, -3),
-(6, -5), (6, -1), (5, -3), (4, -4), (2, -5), (-2, -5), (-4, -4), (-5,
--3), (-5, -1), (-4, 0), (-2, 1), (3, 3), (5, 4), (6, 5)], [(-5, -2),
-(-4, -1), (-2, 0), (3, 2), (5, 3), (6, 4), (6, 7), (5, 8), (3, 9), (-1,
-9), (-3, 8), (-4, 7), (-5, 5), (-5, 9), (-4, 7)]]}, 2120: {'charcode':
-2120, 'left': -7, 'right': 8, 'lines': [[(-2, -12), (-2, 5), (-1, 8),
-(1, 9), (3, 9), (5, 8), (6, 6)], [(-1, -12), (-1, 5), (0, 8), (1, 9)],
-[(-5, -5), (3, -5)]]}, 2121: {'charcode': 2121, 'left': -11, 'right': 11,
-'lines': [[(-6, -5), (-6, 6), (-5, 8), (-2, 9), (0, 9), (3, 8), (5, 6)],
-[(-5, -5), (-5, 6), (-4, 8), (-2, 9)], [(5, -5), (5, 9)], [(6, -5),
-(6, 9)], [(-9, -5), (-5, -5)], [(2, -5), (6, -5)], [(5, 9), (9, 9)]]},
-2122: {'charcode': 2122, 'left': -9, 'right': 9, 'lines': [[(-6, -5),
-(0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9)], [(-8, -5), (-2, -5)],
-[(2, -5), (8, -5)]]}, 2123: {'charcode': 2123, 'left': -12, 'right': 12,
-'lines': [[(-8, -5), (-4, 9)], [(-7, -5), (-4, 6)], [(0, -5), (-4, 9)],
-[(0, -5), (4, 9)], [(1, -5), (4, 6)], [(8, -5), (4, 9)], [(-11, -5),
-(-4, -5)], [(5, -5), (11, -5)]]}, 2124: {'charcode': 2124, 'left': -10,
-'right': 10, 'lines': [[(-6, -5), (5, 9)], [(-5, -5), (6, 9)], [(6, -5),
-(-6, 9)], [(-8, -5), (-2, -5)], [(2, -5), (8, -5)], [(-8, 9), (-2, 9)],
-[(2, 9), (8, 9)]]}, 2125: {'charcode': 2125, 'left': -10, 'right': 9,
-'lines': [[(-6, -5), (0, 9)], [(-5, -5), (0, 7)], [(6, -5), (0, 9),
-(-2, 13), (-4, 15), (-6, 16), (-7, 16), (-8, 15), (-7, 14), (-6, 15)],
-[(-8, -5), (-2, -5)], [(2, -5), (8, -5)]]}, 2126: {'charcode': 2126,
-'left': -9, 'right': 9, 'lines': [[(5, -5), (-6, 9)], [(6, -5), (-5,
-9)], [(-5, -5), (-6, -1), (-6, -5), (6, -5)], [(-6, 9), (6, 9), (6, 5),
-(5, 9)]]}, 2127: {'charcode': 2127, 'left': -11, 'right': 12, 'lines':
-[[(-1, -5), (-4, -4), (-6, -2), (-7, 0), (-8, 3), (-8, 6), (-7, 8),
-(-4, 9), (-2, 9), (0, 8), (3, 5), (5, 2), (7, -2), (8, -5)], [(-1, -5),
-(-3, -4), (-5, -2), (-6, 0), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(-1,
--5), (1, -5), (3, -4), (4, -2), (6, 6), (7, 8), (8, 9)], [(1, -5), (2,
--4), (3, -2), (5, 6), (6, 8), (8, 9), (9, 9)]]}, 2128: {'charcode': 2128,
-'left': -11, 'right': 10, 'lines': [[(2, -12), (-1, -11), (-3, -9),
-(-5, -5), (-6, -2), (-7, 2), (-8, 8), (-9, 16)], [(2, -12), (0, -11),
-(-2, -9), (-4, -5), (-5, -2), (-6, 2), (-7, 8), (-8, 16)], [(2, -12), (4,
--12), (6, -11), (7, -10), (7, -7), (6, -5), (5, -4), (2, -3), (-2, -3)],
-[(4, -12), (6, -10), (6, -7), (5, -5), (4, -4), (2, -3)], [(-2, -3), (2,
--2), (4, 0), (5, 2), (5, 5), (4, 7), (3, 8), (0, 9), (-2, 9), (-4, 8),
-(-5, 7), (-6, 4)], [(-2, -3), (1, -2), (3, 0), (4, 2), (4, 5), (3, 7),
-(2, 8), (0, 9)]]}, 2129: {'charcode': 2129, 'left': -10, 'right': 10,
-'lines': [[(-9, -2), (-7, -4), (-5, -5), (-3, -5), (-1, -4), (0, -3),
-(1, 0), (1, 4), (0, 8), (-3, 16)], [(-8, -3), (-6, -4), (-2, -4), (0,
--3)], [(8, -5), (7, -2), (6, 0), (1, 7), (-2, 12), (-4, 16)], [(7, -5),
-(6, -2), (5, 0), (1, 7)]]}, 2130: {'charcode': 2130, 'left': -9, 'right':
-10, 'lines': [[(4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2),
-(-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6,
--1), (5, -3), (1, -8), (0, -10), (0, -12), (1, -13), (3, -13), (5, -12),
-(7, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)],
-[(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4), (2, -7), (1, -9),
-(1, -11), (2, -12), (4, -12), (7, -10)]]}, 2131: {'charcode': 2131,
-'left': -9, 'right': 9, 'lines': [[(6, -2), (4, -4), (2, -5), (-2, -5),
-(-4, -4), (-4, -2), (-2, 0), (1, 1)], [(-2, -5), (-3, -4), (-3, -2),
-(-1, 0), (1, 1)], [(1, 1), (-4, 2), (-6, 4), (-6, 6), (-5, 8), (-2, 9),
-(1, 9), (3, 8), (5, 6)], [(1, 1), (-3, 2), (-5, 4), (-5, 6), (-4, 8),
-(-2, 9)]]}, 2132: {'charcode': 2132, 'left': -9, 'right': 9, 'lines':
-[[(2, -12), (0, -11), (-1, -10), (-1, -9), (0, -8), (3, -7), (8, -7),
-(8, -8), (5, -7), (1, -5), (-2, -3), (-5, 0), (-6, 3), (-6, 5), (-5, 7),
-(-2, 9), (1, 11), (2, 13), (2, 15), (1, 16), (-1, 16), (-2, 15)], [(3,
--6), (-1, -3), (-4, 0), (-5, 3), (-5, 5), (-4, 7), (-2, 9)]]}, 2133:
-{'charcode': 2133, 'left': -11, 'right': 11, 'lines': [[(-10, -1),
-(-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -2), (-4, 2), (-6, 9)],
-[(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-4, 2), (-2, -2),
-(0, -4), (2, -5), (4, -5), (6, -4), (7, -3), (7, 0), (6, 5), (3, 16)],
-[(4, -5), (6, -3), (6, 0), (5, 5), (2, 16)]]}, 2134: {'charcode': 2134,
-'left': -12, 'right': 11, 'lines': [[(-11, -1), (-10, -3), (-8, -5),
-(-5, -5), (-4, -4), (-4, -2), (-5, 3), (-5, 6), (-4, 8), (-3, 9)], [(-6,
--5), (-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (-1, 9),
-(1, 8), (3, 6), (5, 3), (6, 0), (7, -5), (7, -9), (6, -11), (4, -12),
-(2, -12), (0, -10), (0, -8), (1, -5), (3, -2), (5, 0), (8, 2)], [(1,
-8), (3, 5), (4, 3), (5, 0), (6, -5), (6, -9), (5, -11), (4, -12)]]},
-2135: {'charcode': 2135, 'left': -6, 'right': 6, 'lines': [[(0, -5),
-(-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3, 7), (4, 5)], [(1, -5),
-(-1, 2), (-2, 6), (-2, 8), (-1, 9)]]}, 2136: {'charcode': 2136, 'left':
--10, 'right': 10, 'lines': [[(-4, -5), (-8, 9)], [(-3, -5), (-7, 9)],
-[(6, -5), (7, -4), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3,
-1), (-5, 1)], [(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2),
-(0, 8), (1, 9), (3, 9), (5, 8), (7, 5)]]}, 2137: {'charcode': 2137,
-'left': -10, 'right': 10, 'lines': [[(-7, -12), (-5, -12), (-3, -11),
-(-2, -10), (-1, -8), (5, 6), (6, 8), (7, 9)], [(-5, -12), (-3, -10),
-(-2, -8), (4, 6), (5, 8), (7, 9), (8, 9)], [(0, -5), (-8, 9)], [(0, -5),
-(-7, 9)]]}, 2138: {'charcode': 2138, 'left': -12, 'right': 11, 'lines':
-[[(-5, -5), (-11, 16)], [(-4, -5), (-10, 16)], [(-5, -2), (-6, 4),
-(-6, 7), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 3)], [(6, -5), (3, 6),
-(3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (4, 6), (4, 8),
-(5, 9)]]}, 2139: {'charcode': 2139, 'left': -10, 'right': 10, 'lines':
-[[(-4, -5), (-6, 9)], [(-3, -5), (-4, 1), (-5, 6), (-6, 9)], [(7, -5),
-(6, -1), (4, 3)], [(8, -5), (7, -2), (6, 0), (4, 3), (2, 5), (-1, 7),
-(-3, 8), (-6, 9)], [(-7, -5), (-3, -5)]]}, 2140: {'charcode': 2140,
-'left': -9, 'right': 8, 'lines': [[(2, -12), (0, -11), (-1, -10), (-1,
--9), (0, -8), (3, -7), (6, -7)], [(3, -7), (-1, -6), (-3, -5), (-4, -3),
-(-4, -1), (-2, 1), (1, 2), (4, 2)], [(3, -7), (0, -6), (-2, -5), (-3, -3),
-(-3, -1), (-1, 1), (1, 2)], [(1, 2), (-3, 3), (-5, 4), (-6, 6), (-6, 8),
-(-4, 10), (1, 12), (2, 13), (2, 15), (0, 16), (-2, 16)], [(1, 2), (-2, 3),
-(-4, 4), (-5, 6), (-5, 8), (-3, 10), (1, 12)]]}, 2141: {'charcode': 2141,
-'left': -9, 'right': 9, 'lines': [[(0, -5), (-3, -4), (-5, -1), (-6, 2),
-(-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5), (6, 2), (6,
--1), (5, -3), (4, -4), (2, -5), (0, -5)], [(0, -5), (-2, -4), (-4, -1),
-(-5, 2), (-5, 6), (-4, 8)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2),
-(4, -4)]]}, 2142: {'charcode': 2142, 'left': -11, 'right': 11, 'lines':
-[[(-2, -4), (-6, 9)], [(-2, -4), (-5, 9)], [(4, -4), (4, 9)], [(4, -4),
-(5, 9)], [(-9, -2), (-7, -4), (-4, -5), (9, -5)], [(-9, -2), (-7, -3),
-(-4, -4), (9, -4)]]}, 2143: {'charcode': 2143, 'left': -10, 'right': 9,
-'lines': [[(-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5),
-(6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1),
-(-6, 2), (-10, 16)], [(0, 9), (2, 8), (4, 5), (5, 2), (5, -2), (4, -4)],
-[(0, -5), (-2, -4), (-4, -1), (-5, 2), (-9, 16)]]}, 2144: {'charcode':
-2144, 'left': -10, 'right': 11, 'lines': [[(9, -5), (-1, -5), (-4, -4),
-(-6, -1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8),
-(4, 5), (5, 2), (5, -1), (4, -3), (3, -4), (1, -5)], [(-1, -5), (-3,
--4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-1, 9), (1, 8), (3, 5),
-(4, 2), (4, -2), (3, -4)], [(3, -4), (9, -4)]]}, 2145: {'charcode':
-2145, 'left': -10, 'right': 10, 'lines': [[(1, -4), (-2, 9)], [(1, -4),
-(-1, 9)], [(-8, -2), (-6, -4), (-3, -5), (8, -5)], [(-8, -2), (-6, -3),
-(-3, -4), (8, -4)]]}, 2146: {'charcode': 2146, 'left': -10, 'right': 10,
-'lines': [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -2),
-(-4, 4), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -2), (-5, 4),
-(-5, 7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0),
-(7, -3), (6, -5), (5, -4), (6, -3), (7, 0)], [(6, 3), (7, -3)]]}, 2147:
-{'charcode': 2147, 'left': -11, 'right': 11, 'lines': [[(-3, -4), (-5,
--3), (-7, -1), (-8, 2), (-8, 5), (-7, 7), (-6, 8), (-4, 9), (-1, 9),
-(2, 8), (5, 6), (7, 3), (8, 0), (8, -3), (6, -5), (4, -5), (2, -3),
-(0, 1), (-2, 6), (-5, 16)], [(-8, 5), (-6, 7), (-4, 8), (-1, 8), (2, 7),
-(5, 5), (7, 3)], [(8, -3), (6, -4), (4, -4), (2, -2), (0, 1), (-2, 7),
-(-4, 16)]]}, 2148: {'charcode': 2148, 'left': -9, 'right': 9, 'lines':
-[[(-7, -5), (-5, -5), (-3, -4), (-2, -2), (3, 13), (4, 15), (5, 16)],
-[(-5, -5), (-4, -4), (-3, -2), (2, 13), (3, 15), (5, 16), (7, 16)], [(8,
--5), (7, -3), (5, 0), (-5, 11), (-7, 14), (-8, 16)]]}, 2149: {'charcode':
-2149, 'left': -12, 'right': 11, 'lines': [[(3, -12), (-3, 16)], [(4, -12),
-(-4, 16)], [(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -2),
-(-5, 3), (-5, 6), (-3, 8), (0, 8), (2, 7), (5, 4), (7, 1)], [(-6, -5),
-(-5, -4), (-5, -2), (-6, 3), (-6, 6), (-5, 8), (-3, 9), (0, 9), (2, 8),
-(4, 6), (6, 3), (7, 1), (9, -5)]]}, 2150: {'charcode': 2150, 'left':
--12, 'right': 11, 'lines': [[(-8, -1), (-6, -3), (-3, -4), (-4, -5),
-(-6, -4), (-8, -1), (-9, 2), (-9, 5), (-8, 8), (-7, 9), (-5, 9), (-3,
-8), (-1, 5), (0, 2)], [(-9, 5), (-8, 7), (-7, 8), (-5, 8), (-3, 7), (-1,
-5)], [(-1, 2), (-1, 5), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5), (8, 2),
-(8, -1), (7, -4), (6, -5), (5, -4), (7, -3), (8, -1)], [(-1, 5), (0, 7),
-(1, 8), (3, 8), (5, 7), (7, 5)]]}, 2151: {'charcode': 2151, 'left': -10,
-'right': 11, 'lines': [[(6, -5), (4, 2), (3, 6), (3, 8), (4, 9), (7, 9),
-(9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6), (4, 8), (5, 9)], [(4, 2), (4,
--1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2), (-7, 5),
-(-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)], [(-1, -5),
-(-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]}, 2152: {'charcode':
-2152, 'left': -10, 'right': 9, 'lines': [[(-2, -12), (-6, 1), (-6, 4),
-(-5, 7), (-4, 8)], [(-1, -12), (-5, 1)], [(-5, 1), (-4, -2), (-2, -4),
-(0, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 2), (5, 5), (3, 8),
-(0, 9), (-2, 9), (-4, 8), (-5, 5), (-5, 1)], [(4, -4), (5, -2), (5, 2),
-(4, 5), (2, 8), (0, 9)], [(-5, -12), (-1, -12)]]}, 2153: {'charcode':
-2153, 'left': -9, 'right': 9, 'lines': [[(5, -2), (5, -1), (6, -1),
-(6, -2), (5, -4), (3, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6,
-5), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 5)], [(0, -5), (-2,
--4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)]]}, 2154: {'charcode': 2154,
-'left': -10, 'right': 11, 'lines': [[(8, -12), (4, 2), (3, 6), (3, 8),
-(4, 9), (7, 9), (9, 7), (10, 5)], [(9, -12), (5, 2), (4, 6), (4, 8),
-(5, 9)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6,
--1), (-7, 2), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3,
-5), (4, 2)], [(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)],
-[(5, -12), (9, -12)]]}, 2155: {'charcode': 2155, 'left': -9, 'right': 9,
-'lines': [[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5),
-(0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2,
-9), (0, 9), (3, 8), (5, 6)], [(0, -5), (-2, -4), (-4, -1), (-5, 2),
-(-5, 6), (-4, 8)]]}, 2156: {'charcode': 2156, 'left': -7, 'right': 8,
-'lines': [[(8, -11), (7, -10), (8, -9), (9, -10), (9, -11), (8, -12),
-(6, -12), (4, -11), (3, -10), (2, -8), (1, -5), (-2, 9), (-3, 13), (-4,
-15)], [(6, -12), (4, -10), (3, -8), (2, -4), (0, 5), (-1, 9), (-2, 12),
-(-3, 14), (-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13),
-(-7, 14), (-8, 15)], [(-3, -5), (7, -5)]]}, 2157: {'charcode': 2157,
-'left': -10, 'right': 10, 'lines': [[(7, -5), (3, 9), (2, 12), (0, 15),
-(-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 13), (-8, 12), (-7, 13),
-(-8, 14)], [(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)], [(4, 2),
-(4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2),
-(-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)],
-[(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)]]}, 2158:
-{'charcode': 2158, 'left': -10, 'right': 11, 'lines': [[(-2, -12),
-(-8, 9)], [(-1, -12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5),
-(3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5),
-(5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(-5,
--12), (-1, -12)]]}, 2159: {'charcode': 2159, 'left': -6, 'right': 7,
-'lines': [[(3, -12), (2, -11), (3, -10), (4, -11), (3, -12)], [(-5, -1),
-(-4, -3), (-2, -5), (1, -5), (2, -4), (2, -1), (0, 5), (0, 8), (1, 9)],
-[(0, -5), (1, -4), (1, -1), (-1, 5), (-1, 8), (0, 9), (3, 9), (5, 7),
-(6, 5)]]}, 2160: {'charcode': 2160, 'left': -6, 'right': 7, 'lines':
-[[(4, -12), (3, -11), (4, -10), (5, -11), (4, -12)], [(-4, -1), (-3,
--3), (-1, -5), (2, -5), (3, -4), (3, -1), (0, 9), (-1, 12), (-2, 14),
-(-3, 15), (-5, 16), (-7, 16), (-8, 15), (-8, 14), (-7, 13), (-6, 14),
-(-7, 15)], [(1, -5), (2, -4), (2, -1), (-1, 9), (-2, 12), (-3, 14),
-(-5, 16)]]}, 2161: {'charcode': 2161, 'left': -10, 'right': 10, 'lines':
-[[(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(6, -4), (5, -3), (6, -2),
-(7, -3), (7, -4), (6, -5), (5, -5), (3, -4), (-1, 0), (-3, 1), (-5, 1)],
-[(-3, 1), (-1, 2), (1, 8), (2, 9)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3,
-9), (5, 8), (7, 5)], [(-5, -12), (-1, -12)]]}, 2162: {'charcode': 2162,
-'left': -5, 'right': 7, 'lines': [[(3, -12), (-1, 2), (-2, 6), (-2, 8),
-(-1, 9), (2, 9), (4, 7), (5, 5)], [(4, -12), (0, 2), (-1, 6), (-1, 8),
-(0, 9)], [(0, -12), (4, -12)]]}, 2163: {'charcode': 2163, 'left': -17,
-'right': 16, 'lines': [[(-16, -1), (-15, -3), (-13, -5), (-10, -5), (-9,
--4), (-9, -2), (-10, 2), (-12, 9)], [(-11, -5), (-10, -4), (-10, -2),
-(-11, 2), (-13, 9)], [(-10, 2), (-8, -2), (-6, -4), (-4, -5), (-2, -5),
-(0, -4), (1, -3), (1, -1), (-2, 9)], [(-2, -5), (0, -3), (0, -1), (-3,
-9)], [(0, 2), (2, -2), (4, -4), (6, -5), (8, -5), (10, -4), (11, -3),
-(11, -1), (9, 5), (9, 8), (10, 9)], [(8, -5), (10, -3), (10, -1), (8, 5),
-(8, 8), (9, 9), (12, 9), (14, 7), (15, 5)]]}, 2164: {'charcode': 2164,
-'left': -12, 'right': 11, 'lines': [[(-11, -1), (-10, -3), (-8, -5),
-(-5, -5), (-4, -4), (-4, -2), (-5, 2), (-7, 9)], [(-6, -5), (-5, -4),
-(-5, -2), (-6, 2), (-8, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5),
-(3, -5), (5, -4), (6, -3), (6, -1), (4, 5), (4, 8), (5, 9)], [(3, -5),
-(5, -3), (5, -1), (3, 5), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)]]},
-2165: {'charcode': 2165, 'left': -9, 'right': 9, 'lines': [[(0, -5),
-(-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5, 7), (-4, 8), (-2, 9), (0, 9),
-(3, 8), (5, 5), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (0, -5)],
-[(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6), (-4, 8)], [(0, 9),
-(2, 8), (4, 5), (5, 2), (5, -2), (4, -4)]]}, 2166: {'charcode': 2166,
-'left': -11, 'right': 10, 'lines': [[(-10, -1), (-9, -3), (-7, -5),
-(-4, -5), (-3, -4), (-3, -2), (-4, 2), (-8, 16)], [(-5, -5), (-4, -4),
-(-4, -2), (-5, 2), (-9, 16)], [(-4, 2), (-3, -1), (-1, -4), (1, -5), (3,
--5), (5, -4), (6, -3), (7, -1), (7, 2), (6, 5), (4, 8), (1, 9), (-1, 9),
-(-3, 8), (-4, 5), (-4, 2)], [(5, -4), (6, -2), (6, 2), (5, 5), (3, 8),
-(1, 9)], [(-12, 16), (-5, 16)]]}, 2167: {'charcode': 2167, 'left': -10,
-'right': 10, 'lines': [[(6, -5), (0, 16)], [(7, -5), (1, 16)], [(4,
-2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -1), (-7, 2),
-(-7, 5), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 5), (4, 2)],
-[(-1, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 6), (-5, 8)], [(-3, 16),
-(4, 16)]]}, 2168: {'charcode': 2168, 'left': -9, 'right': 8, 'lines':
-[[(-8, -1), (-7, -3), (-5, -5), (-2, -5), (-1, -4), (-1, -2), (-2, 2),
-(-4, 9)], [(-3, -5), (-2, -4), (-2, -2), (-3, 2), (-5, 9)], [(-2, 2),
-(0, -2), (2, -4), (4, -5), (6, -5), (7, -4), (7, -3), (6, -2), (5, -3),
-(6, -4)]]}, 2169: {'charcode': 2169, 'left': -8, 'right': 9, 'lines':
-[[(6, -3), (6, -2), (7, -2), (7, -3), (6, -4), (3, -5), (0, -5), (-3, -4),
-(-4, -3), (-4, -1), (-3, 0), (4, 4), (5, 5)], [(-4, -2), (-3, -1), (4,
-3), (5, 4), (5, 7), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 6),
-(-5, 6), (-5, 7)]]}, 2170: {'charcode': 2170, 'left': -7, 'right': 7,
-'lines': [[(2, -12), (-2, 2), (-3, 6), (-3, 8), (-2, 9), (1, 9), (3,
-7), (4, 5)], [(3, -12), (-1, 2), (-2, 6), (-2, 8), (-1, 9)], [(-4, -5),
-(5, -5)]]}, 2171: {'charcode': 2171, 'left': -12, 'right': 11, 'lines':
-[[(-11, -1), (-10, -3), (-8, -5), (-5, -5), (-4, -4), (-4, -1), (-6,
-5), (-6, 7), (-4, 9)], [(-6, -5), (-5, -4), (-5, -1), (-7, 5), (-7, 7),
-(-6, 8), (-4, 9), (-2, 9), (0, 8), (2, 6), (4, 2)], [(6, -5), (4, 2), (3,
-6), (3, 8), (4, 9), (7, 9), (9, 7), (10, 5)], [(7, -5), (5, 2), (4, 6),
-(4, 8), (5, 9)]]}, 2172: {'charcode': 2172, 'left': -10, 'right': 10,
-'lines': [[(-9, -1), (-8, -3), (-6, -5), (-3, -5), (-2, -4), (-2, -1),
-(-4, 5), (-4, 7), (-2, 9)], [(-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5,
-7), (-4, 8), (-2, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, -1), (7, -5),
-(6, -5), (7, -3)]]}, 2173: {'charcode': 2173, 'left': -15, 'right': 14,
-'lines': [[(-14, -1), (-13, -3), (-11, -5), (-8, -5), (-7, -4), (-7,
--1), (-9, 5), (-9, 7), (-7, 9)], [(-9, -5), (-8, -4), (-8, -1), (-10,
-5), (-10, 7), (-9, 8), (-7, 9), (-5, 9), (-3, 8), (-1, 6), (0, 4)],
-[(2, -5), (0, 4), (0, 7), (1, 8), (3, 9), (5, 9), (7, 8), (9, 6), (10,
-4), (11, 0), (11, -5), (10, -5), (11, -3)], [(3, -5), (1, 4), (1, 7),
-(3, 9)]]}, 2174: {'charcode': 2174, 'left': -10, 'right': 10, 'lines':
-[[(-7, -1), (-5, -4), (-3, -5), (0, -5), (1, -3), (1, 0)], [(-1, -5),
-(0, -3), (0, 0), (-1, 4), (-2, 6), (-4, 8), (-6, 9), (-7, 9), (-8, 8),
-(-8, 7), (-7, 6), (-6, 7), (-7, 8)], [(-1, 4), (-1, 7), (0, 9), (3, 9),
-(5, 8), (7, 5)], [(7, -4), (6, -3), (7, -2), (8, -3), (8, -4), (7, -5),
-(6, -5), (4, -4), (2, -2), (1, 0), (0, 4), (0, 7), (1, 9)]]}, 2175:
-{'charcode': 2175, 'left': -11, 'right': 10, 'lines': [[(-10, -1),
-(-9, -3), (-7, -5), (-4, -5), (-3, -4), (-3, -1), (-5, 5), (-5, 7),
-(-3, 9)], [(-5, -5), (-4, -4), (-4, -1), (-6, 5), (-6, 7), (-5, 8),
-(-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(8, -5), (4, 9), (3, 12),
-(1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14), (-8, 13), (-7, 12),
-(-6, 13), (-7, 14)], [(7, -5), (3, 9), (2, 12), (0, 15), (-2, 16)]]},
-2176: {'charcode': 2176, 'left': -10, 'right': 10, 'lines': [[(7, -5),
-(6, -3), (4, -1), (-4, 5), (-6, 7), (-7, 9)], [(-6, -1), (-5, -3), (-3,
--5), (0, -5), (4, -3)], [(-5, -3), (-3, -4), (0, -4), (4, -3), (6, -3)],
-[(-6, 7), (-4, 7), (0, 8), (3, 8), (5, 7)], [(-4, 7), (0, 9), (3, 9),
-(5, 7), (6, 5)]]}, 2177: {'charcode': 2177, 'left': -11, 'right': 12,
-'lines': [[(4, -11), (3, -10), (4, -9), (5, -10), (5, -11), (3, -12),
-(0, -12), (-3, -11), (-5, -9), (-6, -6), (-6, 9)], [(0, -12), (-2, -11),
-(-4, -9), (-5, -6), (-5, 9)], [(10, -11), (9, -10), (10, -9), (11, -10),
-(11, -11), (10, -12), (8, -12), (6, -11), (5, -9), (5, 9)], [(8, -12),
-(7, -11), (6, -9), (6, 9)], [(-9, -5), (9, -5)], [(-9, 9), (-2, 9)],
-[(2, 9), (9, 9)]]}, 2178: {'charcode': 2178, 'left': -11, 'right': 11,
-'lines': [[(5, -11), (4, -10), (5, -9), (6, -10), (5, -11), (3, -12),
-(0, -12), (-3, -11), (-5, -9), (-6, -6), (-6, 9)], [(0, -12), (-2, -11),
-(-4, -9), (-5, -6), (-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9,
--5), (6, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]}, 2179: {'charcode':
-2179, 'left': -11, 'right': 11, 'lines': [[(4, -11), (3, -10), (4, -9),
-(5, -10), (5, -11), (3, -12)], [(6, -12), (0, -12), (-3, -11), (-5, -9),
-(-6, -6), (-6, 9)], [(0, -12), (-2, -11), (-4, -9), (-5, -6), (-5, 9)],
-[(5, -10), (5, 9)], [(6, -12), (6, 9)], [(-9, -5), (5, -5)], [(-9, 9),
-(-2, 9)], [(2, 9), (9, 9)]]}, 2180: {'charcode': 2180, 'left': -16,
-'right': 17, 'lines': [[(0, -11), (-1, -10), (0, -9), (1, -10), (0, -11),
-(-2, -12), (-5, -12), (-8, -11), (-10, -9), (-11, -6), (-11, 9)], [(-5,
--12), (-7, -11), (-9, -9), (-10, -6), (-10, 9)], [(11, -11), (10, -10),
-(11, -9), (12, -10), (11, -11), (9, -12), (6, -12), (3, -11), (1, -9),
-(0, -6), (0, 9)], [(6, -12), (4, -11), (2, -9), (1, -6), (1, 9)], [(11,
--5), (11, 9)], [(12, -5), (12, 9)], [(-14, -5), (12, -5)], [(-14, 9),
-(-7, 9)], [(-3, 9), (4, 9)], [(8, 9), (15, 9)]]}, 2181: {'charcode':
-2181, 'left': -16, 'right': 17, 'lines': [[(0, -11), (-1, -10), (0,
--9), (1, -10), (0, -11), (-2, -12), (-5, -12), (-8, -11), (-10, -9),
-(-11, -6), (-11, 9)], [(-5, -12), (-7, -11), (-9, -9), (-10, -6), (-10,
-9)], [(10, -11), (9, -10), (10, -9), (11, -10), (11, -11), (9, -12)],
-[(12, -12), (6, -12), (3, -11), (1, -9), (0, -6), (0, 9)], [(6, -12),
-(4, -11), (2, -9), (1, -6), (1, 9)], [(11, -10), (11, 9)], [(12, -12),
-(12, 9)], [(-14, -5), (11, -5)], [(-14, 9), (-7, 9)], [(-3, 9), (4, 9)],
-[(8, 9), (15, 9)]]}, 2182: {'charcode': 2182, 'left': -5, 'right': 6,
-'lines': [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (1, -5)],
-[(-3, 9), (4, 9)]]}, 2184: {'charcode': 2184, 'left': -9, 'right': 8,
-'lines': [[(5, -4), (3, -5), (0, -5), (-3, -4), (-5, -2), (-6, 1), (-6,
-4), (-5, 7), (-4, 8), (-1, 9), (2, 9), (4, 8)], [(0, -5), (-2, -4), (-4,
--2), (-5, 1), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(-5, 2), (3, 2)]]},
-2185: {'charcode': 2185, 'left': -9, 'right': 10, 'lines': [[(2, -12),
-(-1, -11), (-3, -8), (-4, -6), (-5, -3), (-6, 2), (-6, 6), (-5, 8), (-3,
-9), (-1, 9), (2, 8), (4, 5), (5, 3), (6, 0), (7, -5), (7, -9), (6, -11),
-(4, -12), (2, -12)], [(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3),
-(-5, 2), (-5, 6), (-4, 8), (-3, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3),
-(5, 0), (6, -5), (6, -9), (5, -11), (4, -12)], [(-4, -2), (5, -2)]]},
-2186: {'charcode': 2186, 'left': -11, 'right': 11, 'lines': [[(3, -12),
-(-3, 16)], [(4, -12), (-4, 16)], [(-1, -5), (-5, -4), (-7, -2), (-8, 1),
-(-8, 4), (-7, 6), (-5, 8), (-2, 9), (1, 9), (5, 8), (7, 6), (8, 3), (8,
-0), (7, -2), (5, -4), (2, -5), (-1, -5)], [(-1, -5), (-4, -4), (-6, -2),
-(-7, 1), (-7, 4), (-6, 6), (-4, 8), (-2, 9)], [(1, 9), (4, 8), (6, 6),
-(7, 3), (7, 0), (6, -2), (4, -4), (2, -5)]]}, 2187: {'charcode': 2187,
-'left': -9, 'right': 9, 'lines': [[(2, -5), (4, -4), (6, -2), (6, -3),
-(5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -3), (-6, -1), (-6, 1),
-(-5, 3), (-3, 5), (1, 8)], [(-1, -5), (-3, -4), (-4, -3), (-5, -1),
-(-5, 1), (-4, 3), (1, 8), (2, 10), (2, 12), (1, 13), (-1, 13)]]}, 2190:
-{'charcode': 2190, 'left': -11, 'right': 11, 'lines': [[(-6, -5), (-7,
--4), (-8, -2), (-8, 0), (-7, 3), (-3, 7), (-2, 9)], [(-8, 0), (-7, 2),
-(-3, 6), (-2, 9), (-2, 11), (-3, 14), (-5, 16), (-6, 16), (-7, 15),
-(-8, 13), (-8, 10), (-7, 6), (-5, 2), (-3, -1), (0, -4), (2, -5), (4,
--5), (7, -4), (8, -2), (8, 2), (7, 6), (5, 8), (3, 9), (2, 9), (1, 8),
-(1, 6), (2, 5), (3, 6), (2, 7)], [(4, -5), (6, -4), (7, -2), (7, 2),
-(6, 6), (5, 8)]]}, 2191: {'charcode': 2191, 'left': -13, 'right': 13,
-'lines': [[(7, -11), (6, -10), (7, -9), (8, -10), (7, -11), (5, -12),
-(2, -12), (-1, -11), (-3, -9), (-4, -7), (-5, -4), (-6, 0), (-8, 9),
-(-9, 13), (-10, 15)], [(2, -12), (0, -11), (-2, -9), (-3, -7), (-4, -4),
-(-6, 5), (-7, 9), (-8, 12), (-9, 14), (-10, 15), (-12, 16), (-14, 16),
-(-15, 15), (-15, 14), (-14, 13), (-13, 14), (-14, 15)], [(13, -11), (12,
--10), (13, -9), (14, -10), (14, -11), (13, -12), (11, -12), (9, -11), (8,
--10), (7, -8), (6, -5), (3, 9), (2, 13), (1, 15)], [(11, -12), (9, -10),
-(8, -8), (7, -4), (5, 5), (4, 9), (3, 12), (2, 14), (1, 15), (-1, 16),
-(-3, 16), (-4, 15), (-4, 14), (-3, 13), (-2, 14), (-3, 15)], [(-9, -5),
-(12, -5)]]}, 2192: {'charcode': 2192, 'left': -12, 'right': 12, 'lines':
-[[(9, -11), (8, -10), (9, -9), (10, -10), (9, -11), (6, -12), (3, -12),
-(0, -11), (-2, -9), (-3, -7), (-4, -4), (-5, 0), (-7, 9), (-8, 13),
-(-9, 15)], [(3, -12), (1, -11), (-1, -9), (-2, -7), (-3, -4), (-5, 5),
-(-6, 9), (-7, 12), (-8, 14), (-9, 15), (-11, 16), (-13, 16), (-14, 15),
-(-14, 14), (-13, 13), (-12, 14), (-13, 15)], [(7, -5), (5, 2), (4, 6),
-(4, 8), (5, 9), (8, 9), (10, 7), (11, 5)], [(8, -5), (6, 2), (5, 6), (5,
-8), (6, 9)], [(-8, -5), (8, -5)]]}, 2193: {'charcode': 2193, 'left': -12,
-'right': 12, 'lines': [[(7, -11), (6, -10), (7, -9), (8, -10), (8, -11),
-(6, -12)], [(10, -12), (3, -12), (0, -11), (-2, -9), (-3, -7), (-4, -4),
-(-5, 0), (-7, 9), (-8, 13), (-9, 15)], [(3, -12), (1, -11), (-1, -9),
-(-2, -7), (-3, -4), (-5, 5), (-6, 9), (-7, 12), (-8, 14), (-9, 15), (-11,
-16), (-13, 16), (-14, 15), (-14, 14), (-13, 13), (-12, 14), (-13, 15)],
-[(9, -12), (5, 2), (4, 6), (4, 8), (5, 9), (8, 9), (10, 7), (11, 5)],
-[(10, -12), (6, 2), (5, 6), (5, 8), (6, 9)], [(-8, -5), (7, -5)]]},
-2194: {'charcode': 2194, 'left': -18, 'right': 17, 'lines': [[(2, -11),
-(1, -10), (2, -9), (3, -10), (2, -11), (0, -12), (-3, -12), (-6, -11),
-(-8, -9), (-9, -7), (-10, -4), (-11, 0), (-13, 9), (-14, 13), (-15, 15)],
-[(-3, -12), (-5, -11), (-7, -9), (-8, -7), (-9, -4), (-11, 5), (-12, 9),
-(-13, 12), (-14, 14), (-15, 15), (-17, 16), (-19, 16), (-20, 15), (-20,
-14), (-19, 13), (-18, 14), (-19, 15)], [(14, -11), (13, -10), (14, -9),
-(15, -10), (14, -11), (11, -12), (8, -12), (5, -11), (3, -9), (2, -7),
-(1, -4), (0, 0), (-2, 9), (-3, 13), (-4, 15)], [(8, -12), (6, -11), (4,
--9), (3, -7), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14), (-4, 15),
-(-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14), (-8, 15)],
-[(12, -5), (10, 2), (9, 6), (9, 8), (10, 9), (13, 9), (15, 7), (16, 5)],
-[(13, -5), (11, 2), (10, 6), (10, 8), (11, 9)], [(-14, -5), (13, -5)]]},
-2195: {'charcode': 2195, 'left': -18, 'right': 17, 'lines': [[(2, -11),
-(1, -10), (2, -9), (3, -10), (2, -11), (0, -12), (-3, -12), (-6, -11),
-(-8, -9), (-9, -7), (-10, -4), (-11, 0), (-13, 9), (-14, 13), (-15, 15)],
-[(-3, -12), (-5, -11), (-7, -9), (-8, -7), (-9, -4), (-11, 5), (-12, 9),
-(-13, 12), (-14, 14), (-15, 15), (-17, 16), (-19, 16), (-20, 15), (-20,
-14), (-19, 13), (-18, 14), (-19, 15)], [(12, -11), (11, -10), (12, -9),
-(13, -10), (13, -11), (11, -12)], [(15, -12), (8, -12), (5, -11), (3,
--9), (2, -7), (1, -4), (0, 0), (-2, 9), (-3, 13), (-4, 15)], [(8, -12),
-(6, -11), (4, -9), (3, -7), (2, -4), (0, 5), (-1, 9), (-2, 12), (-3, 14),
-(-4, 15), (-6, 16), (-8, 16), (-9, 15), (-9, 14), (-8, 13), (-7, 14),
-(-8, 15)], [(14, -12), (10, 2), (9, 6), (9, 8), (10, 9), (13, 9), (15, 7),
-(16, 5)], [(15, -12), (11, 2), (10, 6), (10, 8), (11, 9)], [(-14, -5),
-(12, -5)]]}, 2196: {'charcode': 2196, 'left': -6, 'right': 7, 'lines':
-[[(-5, -1), (-4, -3), (-2, -5), (1, -5), (2, -4), (2, -1), (0, 5), (0,
-8), (1, 9)], [(0, -5), (1, -4), (1, -1), (-1, 5), (-1, 8), (0, 9), (3,
-9), (5, 7), (6, 5)]]}, 2197: {'charcode': 2197, 'left': 0, 'right': 0,
-'lines': [[]]}, 2198: {'charcode': 2198, 'left': -4, 'right': 4, 'lines':
-[[]]}, 2199: {'charcode': 2199, 'left': -8, 'right': 8, 'lines': [[]]},
-2200: {'charcode': 2200, 'left': -10, 'right': 10, 'lines': [[(-1, -12),
-(-4, -11), (-6, -8), (-7, -3), (-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 5), (7, 0), (7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)],
-[(-1, -12), (-3, -11), (-4, -10), (-5, -8), (-6, -3), (-6, 0), (-5, 5),
-(-4, 7), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 5), (6, 0), (6,
--3), (5, -8), (4, -10), (3, -11), (1, -12)]]}, 2201: {'charcode': 2201,
-'left': -10, 'right': 10, 'lines': [[(-4, -8), (-2, -9), (1, -12), (1,
-9)], [(0, -11), (0, 9)], [(-4, 9), (5, 9)]]}, 2202: {'charcode': 2202,
-'left': -10, 'right': 10, 'lines': [[(-6, -8), (-5, -7), (-6, -6), (-7,
--7), (-7, -8), (-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11),
-(6, -10), (7, -8), (7, -6), (6, -4), (3, -2), (-2, 0), (-4, 1), (-6,
-3), (-7, 6), (-7, 9)], [(2, -12), (4, -11), (5, -10), (6, -8), (6, -6),
-(5, -4), (2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 8), (4, 8),
-(6, 7), (7, 6)], [(-4, 6), (1, 9), (5, 9), (6, 8), (7, 6), (7, 4)]]},
-2203: {'charcode': 2203, 'left': -10, 'right': 10, 'lines': [[(-6, -8),
-(-5, -7), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11), (-2, -12),
-(2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3), (-1, -3)],
-[(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)], [(2, -3), (4,
--2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8),
-(-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5, -1), (6, 2),
-(6, 5), (5, 7), (4, 8), (2, 9)]]}, 2204: {'charcode': 2204, 'left': -10,
-'right': 10, 'lines': [[(2, -10), (2, 9)], [(3, -12), (3, 9)], [(3, -12),
-(-8, 3), (8, 3)], [(-1, 9), (6, 9)]]}, 2205: {'charcode': 2205, 'left':
--10, 'right': 10, 'lines': [[(-5, -12), (-7, -2)], [(-7, -2), (-5, -4),
-(-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8),
-(1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4),
-(-6, 5)], [(1, -5), (3, -4), (5, -2), (6, 1), (6, 3), (5, 6), (3, 8),
-(1, 9)], [(-5, -12), (5, -12)], [(-5, -11), (0, -11), (5, -12)]]}, 2206:
-{'charcode': 2206, 'left': -10, 'right': 10, 'lines': [[(5, -9), (4,
--8), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12), (-3, -11),
-(-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1,
-9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4),
-(-3, -3), (-5, -1), (-6, 2)], [(0, -12), (-2, -11), (-4, -9), (-5, -7),
-(-6, -3), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6),
-(6, 3), (6, 2), (5, -1), (3, -3), (1, -4)]]}, 2207: {'charcode': 2207,
-'left': -10, 'right': 10, 'lines': [[(-7, -12), (-7, -6)], [(-7, -8),
-(-6, -10), (-4, -12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)],
-[(-6, -10), (-4, -11), (-2, -11), (3, -9)], [(7, -12), (7, -9), (6, -6),
-(2, -1), (1, 1), (0, 4), (0, 9)], [(6, -6), (1, -1), (0, 1), (-1, 4),
-(-1, 9)]]}, 2208: {'charcode': 2208, 'left': -10, 'right': 10, 'lines':
-[[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3),
-(5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-2, -12),
-(-4, -11), (-5, -9), (-5, -6), (-4, -4), (-2, -3)], [(2, -3), (4, -4),
-(5, -6), (5, -9), (4, -11), (2, -12)], [(-2, -3), (-5, -2), (-6, -1),
-(-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8), (6, 7), (7,
-5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-2, -3), (-4, -2), (-5, -1),
-(-6, 1), (-6, 5), (-5, 7), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 7),
-(6, 5), (6, 1), (5, -1), (4, -2), (2, -3)]]}, 2209: {'charcode': 2209,
-'left': -10, 'right': 10, 'lines': [[(6, -5), (5, -2), (3, 0), (0, 1),
-(-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11),
-(-1, -12), (1, -12), (4, -11), (6, -9), (7, -6), (7, 0), (6, 4), (5, 6),
-(3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6, 5), (-5, 4), (-4, 5),
-(-5, 6)], [(-1, 1), (-3, 0), (-5, -2), (-6, -5), (-6, -6), (-5, -9),
-(-3, -11), (-1, -12)], [(1, -12), (3, -11), (5, -9), (6, -6), (6, 0),
-(5, 4), (4, 6), (2, 8), (0, 9)]]}, 2210: {'charcode': 2210, 'left': -5,
-'right': 5, 'lines': [[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]}, 2211:
-{'charcode': 2211, 'left': -5, 'right': 5, 'lines': [[(0, 9), (-1, 8),
-(0, 7), (1, 8), (1, 10), (0, 12), (-1, 13)]]}, 2212: {'charcode': 2212,
-'left': -5, 'right': 5, 'lines': [[(0, -5), (-1, -4), (0, -3), (1, -4),
-(0, -5)], [(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]}, 2213: {'charcode':
-2213, 'left': -5, 'right': 5, 'lines': [[(0, -5), (-1, -4), (0, -3),
-(1, -4), (0, -5)], [(0, 9), (-1, 8), (0, 7), (1, 8), (1, 10), (0, 12),
-(-1, 13)]]}, 2214: {'charcode': 2214, 'left': -5, 'right': 5, 'lines':
-[[(0, -12), (-1, -10), (0, 2), (1, -10), (0, -12)], [(0, -10), (0, -4)],
-[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]}, 2215: {'charcode': 2215,
-'left': -9, 'right': 9, 'lines': [[(-5, -8), (-4, -7), (-5, -6), (-6, -7),
-(-6, -8), (-5, -10), (-4, -11), (-2, -12), (1, -12), (4, -11), (5, -10),
-(6, -8), (6, -6), (5, -4), (4, -3), (0, -1), (0, 2)], [(1, -12), (3,
--11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -2)], [(0, 7), (-1,
-8), (0, 9), (1, 8), (0, 7)]]}, 2216: {'charcode': 2216, 'left': -4,
-'right': 4, 'lines': [[(0, -12), (-1, -5)], [(1, -12), (-1, -5)]]}, 2217:
-{'charcode': 2217, 'left': -8, 'right': 8, 'lines': [[(-4, -12), (-5,
--5)], [(-3, -12), (-5, -5)], [(4, -12), (3, -5)], [(5, -12), (3, -5)]]},
-2218: {'charcode': 2218, 'left': -7, 'right': 7, 'lines': [[(-1, -12),
-(-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5),
-(4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)]]}, 2219: {'charcode':
-2219, 'left': -8, 'right': 8, 'lines': [[(0, -12), (0, 0)], [(-5, -9),
-(5, -3)], [(5, -9), (-5, -3)]]}, 2220: {'charcode': 2220, 'left': -11,
-'right': 11, 'lines': [[(9, -16), (-9, 16)]]}, 2221: {'charcode': 2221,
-'left': -7, 'right': 7, 'lines': [[(4, -16), (2, -14), (0, -11), (-2, -7),
-(-3, -2), (-3, 2), (-2, 7), (0, 11), (2, 14), (4, 16)], [(2, -14), (0,
--10), (-1, -7), (-2, -2), (-2, 2), (-1, 7), (0, 10), (2, 14)]]}, 2222:
-{'charcode': 2222, 'left': -7, 'right': 7, 'lines': [[(-4, -16), (-2,
--14), (0, -11), (2, -7), (3, -2), (3, 2), (2, 7), (0, 11), (-2, 14), (-4,
-16)], [(-2, -14), (0, -10), (1, -7), (2, -2), (2, 2), (1, 7), (0, 10),
-(-2, 14)]]}, 2223: {'charcode': 2223, 'left': -7, 'right': 7, 'lines':
-[[(-3, -16), (-3, 16)], [(-2, -16), (-2, 16)], [(-3, -16), (4, -16)],
-[(-3, 16), (4, 16)]]}, 2224: {'charcode': 2224, 'left': -7, 'right': 7,
-'lines': [[(2, -16), (2, 16)], [(3, -16), (3, 16)], [(-4, -16), (3, -16)],
-[(-4, 16), (3, 16)]]}, 2225: {'charcode': 2225, 'left': -7, 'right': 7,
-'lines': [[(2, -16), (0, -15), (-1, -14), (-2, -12), (-2, -10), (-1, -8),
-(0, -7), (1, -5), (1, -3), (-1, -1)], [(0, -15), (-1, -13), (-1, -11),
-(0, -9), (1, -8), (2, -6), (2, -4), (1, -2), (-3, 0), (1, 2), (2, 4),
-(2, 6), (1, 8), (0, 9), (-1, 11), (-1, 13), (0, 15)], [(-1, 1), (1,
-3), (1, 5), (0, 7), (-1, 8), (-2, 10), (-2, 12), (-1, 14), (0, 15),
-(2, 16)]]}, 2226: {'charcode': 2226, 'left': -7, 'right': 7, 'lines':
-[[(-2, -16), (0, -15), (1, -14), (2, -12), (2, -10), (1, -8), (0, -7),
-(-1, -5), (-1, -3), (1, -1)], [(0, -15), (1, -13), (1, -11), (0, -9),
-(-1, -8), (-2, -6), (-2, -4), (-1, -2), (3, 0), (-1, 2), (-2, 4), (-2, 6),
-(-1, 8), (0, 9), (1, 11), (1, 13), (0, 15)], [(1, 1), (-1, 3), (-1, 5),
-(0, 7), (1, 8), (2, 10), (2, 12), (1, 14), (0, 15), (-2, 16)]]}, 2227:
-{'charcode': 2227, 'left': -7, 'right': 7, 'lines': [[(3, -16), (-4, 0),
-(3, 16)]]}, 2228: {'charcode': 2228, 'left': -7, 'right': 7, 'lines':
-[[(-3, -16), (4, 0), (-3, 16)]]}, 2229: {'charcode': 2229, 'left': -4,
-'right': 4, 'lines': [[(0, -16), (0, 16)]]}, 2230: {'charcode': 2230,
-'left': -7, 'right': 7, 'lines': [[(-3, -16), (-3, 16)], [(3, -16),
-(3, 16)]]}, 2231: {'charcode': 2231, 'left': -13, 'right': 13, 'lines':
-[[(-9, 0), (9, 0)]]}, 2232: {'charcode': 2232, 'left': -13, 'right': 13,
-'lines': [[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]}, 2233: {'charcode':
-2233, 'left': -12, 'right': 12, 'lines': [[(0, -8), (0, 9)], [(-8, 0),
-(8, 0)], [(-8, 9), (8, 9)]]}, 2234: {'charcode': 2234, 'left': -12,
-'right': 12, 'lines': [[(0, -8), (0, 9)], [(-8, -8), (8, -8)], [(-8, 0),
-(8, 0)]]}, 2235: {'charcode': 2235, 'left': -11, 'right': 11, 'lines':
-[[(-7, -7), (7, 7)], [(7, -7), (-7, 7)]]}, 2236: {'charcode': 2236,
-'left': -5, 'right': 5, 'lines': [[(0, -1), (-1, 0), (0, 1), (1, 0),
-(0, -1)]]}, 2237: {'charcode': 2237, 'left': -13, 'right': 13, 'lines':
-[[(0, -9), (-1, -8), (0, -7), (1, -8), (0, -9)], [(-9, 0), (9, 0)],
-[(0, 7), (-1, 8), (0, 9), (1, 8), (0, 7)]]}, 2238: {'charcode': 2238,
-'left': -13, 'right': 13, 'lines': [[(-9, -3), (9, -3)], [(-9, 3),
-(9, 3)]]}, 2239: {'charcode': 2239, 'left': -13, 'right': 13, 'lines':
-[[(7, -9), (-7, 9)], [(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]}, 2240:
-{'charcode': 2240, 'left': -13, 'right': 13, 'lines': [[(-9, -5),
-(9, -5)], [(-9, 0), (9, 0)], [(-9, 5), (9, 5)]]}, 2241: {'charcode':
-2241, 'left': -12, 'right': 12, 'lines': [[(8, -9), (-8, 0), (8, 9)]]},
-2242: {'charcode': 2242, 'left': -12, 'right': 12, 'lines': [[(-8, -9),
-(8, 0), (-8, 9)]]}, 2243: {'charcode': 2243, 'left': -12, 'right': 12,
-'lines': [[(8, -12), (-8, -5), (8, 2)], [(-8, 4), (8, 4)], [(-8, 9),
-(8, 9)]]}, 2244: {'charcode': 2244, 'left': -12, 'right': 12, 'lines':
-[[(-8, -12), (8, -5), (-8, 2)], [(-8, 4), (8, 4)], [(-8, 9), (8, 9)]]},
-2245: {'charcode': 2245, 'left': -12, 'right': 13, 'lines': [[(9, 5),
-(7, 5), (5, 4), (3, 2), (0, -2), (-1, -3), (-3, -4), (-5, -4), (-7, -3),
-(-8, -1), (-8, 1), (-7, 3), (-5, 4), (-3, 4), (-1, 3), (0, 2), (3, -2),
-(5, -4), (7, -5), (9, -5)]]}, 2246: {'charcode': 2246, 'left': -12,
-'right': 12, 'lines': [[(-9, 3), (-9, 1), (-8, -2), (-6, -3), (-4, -3),
-(-2, -2), (2, 1), (4, 2), (6, 2), (8, 1), (9, -1)], [(-9, 1), (-8, -1),
-(-6, -2), (-4, -2), (-2, -1), (2, 2), (4, 3), (6, 3), (8, 2), (9, -1),
-(9, -3)]]}, 2247: {'charcode': 2247, 'left': -11, 'right': 11, 'lines':
-[[(-8, 2), (0, -3), (8, 2)], [(-8, 2), (0, -2), (8, 2)]]}, 2248:
-{'charcode': 2248, 'left': -6, 'right': 6, 'lines': [[(2, -12), (-3,
--6)], [(2, -12), (3, -11), (-3, -6)]]}, 2249: {'charcode': 2249, 'left':
--6, 'right': 6, 'lines': [[(-2, -12), (3, -6)], [(-2, -12), (-3, -11),
-(3, -6)]]}, 2250: {'charcode': 2250, 'left': -10, 'right': 10, 'lines':
-[[(-7, -12), (-6, -10), (-4, -8), (-1, -7), (1, -7), (4, -8), (6, -10),
-(7, -12)], [(-7, -12), (-6, -9), (-4, -7), (-1, -6), (1, -6), (4, -7),
-(6, -9), (7, -12)]]}, 2251: {'charcode': 2251, 'left': -5, 'right': 5,
-'lines': [[(0, -10), (-1, -11), (0, -12), (1, -11), (1, -9), (0, -7),
-(-1, -6)]]}, 2252: {'charcode': 2252, 'left': -5, 'right': 5, 'lines':
-[[(1, -12), (0, -11), (-1, -9), (-1, -7), (0, -6), (1, -7), (0, -8)]]},
-2253: {'charcode': 2253, 'left': -5, 'right': 5, 'lines': [[(0, -10),
-(1, -11), (0, -12), (-1, -11), (-1, -9), (0, -7), (1, -6)]]}, 2254:
-{'charcode': 2254, 'left': -5, 'right': 5, 'lines': [[(-1, -12), (0,
--11), (1, -9), (1, -7), (0, -6), (-1, -7), (0, -8)]]}, 2255: {'charcode':
-2255, 'left': -13, 'right': 9, 'lines': [[(-10, -5), (-6, -5), (0, 7)],
-[(-7, -5), (0, 9)], [(9, -16), (0, 9)]]}, 2256: {'charcode': 2256,
-'left': -12, 'right': 12, 'lines': [[(8, -8), (1, -8), (-3, -7), (-5,
--6), (-7, -4), (-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8),
-(8, 8)]]}, 2257: {'charcode': 2257, 'left': -12, 'right': 12, 'lines':
-[[(-8, -8), (-8, -1), (-7, 3), (-6, 5), (-4, 7), (-1, 8), (1, 8), (4, 7),
-(6, 5), (7, 3), (8, -1), (8, -8)]]}, 2258: {'charcode': 2258, 'left':
--12, 'right': 12, 'lines': [[(-8, -8), (-1, -8), (3, -7), (5, -6),
-(7, -4), (8, -1), (8, 1), (7, 4), (5, 6), (3, 7), (-1, 8), (-8, 8)]]},
-2259: {'charcode': 2259, 'left': -12, 'right': 12, 'lines': [[(-8, 8),
-(-8, 1), (-7, -3), (-6, -5), (-4, -7), (-1, -8), (1, -8), (4, -7), (6,
--5), (7, -3), (8, 1), (8, 8)]]}, 2260: {'charcode': 2260, 'left': -12,
-'right': 12, 'lines': [[(8, -8), (1, -8), (-3, -7), (-5, -6), (-7, -4),
-(-8, -1), (-8, 1), (-7, 4), (-5, 6), (-3, 7), (1, 8), (8, 8)], [(-8, 0),
-(4, 0)]]}, 2261: {'charcode': 2261, 'left': -13, 'right': 13, 'lines':
-[[(6, -2), (9, 0), (6, 2)], [(3, -5), (8, 0), (3, 5)], [(-9, 0), (8,
-0)]]}, 2262: {'charcode': 2262, 'left': -8, 'right': 8, 'lines': [[(-2,
--6), (0, -9), (2, -6)], [(-5, -3), (0, -8), (5, -3)], [(0, -8), (0, 9)]]},
-2263: {'charcode': 2263, 'left': -13, 'right': 13, 'lines': [[(-6, -2),
-(-9, 0), (-6, 2)], [(-3, -5), (-8, 0), (-3, 5)], [(-8, 0), (9, 0)]]},
-2264: {'charcode': 2264, 'left': -8, 'right': 8, 'lines': [[(-2, 6),
-(0, 9), (2, 6)], [(-5, 3), (0, 8), (5, 3)], [(0, -9), (0, 8)]]}, 2265:
-{'charcode': 2265, 'left': -9, 'right': 10, 'lines': [[(6, 0), (5, -3),
-(4, -4), (2, -5), (0, -5), (-3, -4), (-5, -1), (-6, 2), (-6, 5), (-5,
-7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5, 6), (6, 3), (7, -2), (7, -7),
-(6, -10), (5, -11), (3, -12), (0, -12), (-2, -11), (-3, -10), (-3, -9),
-(-2, -9), (-2, -10)], [(0, -5), (-2, -4), (-4, -1), (-5, 2), (-5, 6),
-(-4, 8)], [(0, 9), (2, 8), (4, 6), (5, 3), (6, -2), (6, -7), (5, -10),
-(3, -12)]]}, 2266: {'charcode': 2266, 'left': -10, 'right': 10, 'lines':
-[[(-8, -12), (0, 9)], [(-7, -12), (0, 7)], [(8, -12), (0, 9)], [(-8, -12),
-(8, -12)], [(-7, -11), (7, -11)]]}, 2267: {'charcode': 2267, 'left': -17,
-'right': 16, 'lines': [[(-14, -5), (-9, -5), (0, 7)], [(-10, -4), (0, 9)],
-[(16, -24), (0, 9)]]}, 2268: {'charcode': 2268, 'left': -12, 'right': 12,
-'lines': [[(9, -15), (8, -14), (9, -13), (10, -14), (10, -15), (9, -16),
-(7, -16), (5, -15), (3, -13), (2, -11), (1, -8), (0, -4), (-2, 8), (-3,
-12), (-4, 14)], [(4, -14), (3, -12), (2, -8), (0, 4), (-1, 8), (-2, 11),
-(-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 14), (-9, 13),
-(-8, 14), (-9, 15)]]}, 2269: {'charcode': 2269, 'left': -12, 'right': 12,
-'lines': [[(9, -15), (8, -14), (9, -13), (10, -14), (10, -15), (9, -16),
-(7, -16), (5, -15), (3, -13), (2, -11), (1, -8), (0, -4), (-2, 8), (-3,
-12), (-4, 14)], [(4, -14), (3, -12), (2, -8), (0, 4), (-1, 8), (-2, 11),
-(-3, 13), (-5, 15), (-7, 16), (-9, 16), (-10, 15), (-10, 14), (-9, 13),
-(-8, 14), (-9, 15)], [(-1, -7), (-4, -6), (-6, -4), (-7, -1), (-7, 1),
-(-6, 4), (-4, 6), (-1, 7), (1, 7), (4, 6), (6, 4), (7, 1), (7, -1), (6,
--4), (4, -6), (1, -7), (-1, -7)]]}, 2270: {'charcode': 2270, 'left': -12,
-'right': 13, 'lines': [[(10, 1), (9, 3), (7, 4), (5, 4), (3, 3), (2, 2),
-(-1, -2), (-2, -3), (-4, -4), (-6, -4), (-8, -3), (-9, -1), (-9, 1),
-(-8, 3), (-6, 4), (-4, 4), (-2, 3), (-1, 2), (2, -2), (3, -3), (5, -4),
-(7, -4), (9, -3), (10, -1), (10, 1)]]}, 2271: {'charcode': 2271, 'left':
--12, 'right': 12, 'lines': [[(9, -12), (-9, 9)], [(-4, -12), (-2, -10),
-(-2, -8), (-3, -6), (-5, -5), (-7, -5), (-9, -7), (-9, -9), (-8, -11),
-(-6, -12), (-4, -12), (-2, -11), (1, -10), (4, -10), (7, -11), (9, -12)],
-[(5, 2), (3, 3), (2, 5), (2, 7), (4, 9), (6, 9), (8, 8), (9, 6), (9, 4),
-(7, 2), (5, 2)]]}, 2272: {'charcode': 2272, 'left': -12, 'right': 13,
-'lines': [[(9, -4), (8, -3), (9, -2), (10, -3), (10, -4), (9, -5), (8,
--5), (7, -4), (6, -2), (4, 3), (2, 6), (0, 8), (-2, 9), (-5, 9), (-8, 8),
-(-9, 6), (-9, 3), (-8, 1), (-2, -3), (0, -5), (1, -7), (1, -9), (0, -11),
-(-2, -12), (-4, -11), (-5, -9), (-5, -7), (-4, -4), (-2, -1), (3, 6),
-(5, 8), (8, 9), (9, 9), (10, 8), (10, 7)], [(-5, 9), (-7, 8), (-8, 6),
-(-8, 3), (-7, 1), (-5, -1)], [(-5, -7), (-4, -5), (4, 6), (6, 8), (8,
-9)]]}, 2273: {'charcode': 2273, 'left': -13, 'right': 14, 'lines': [[(5,
--4), (4, -6), (2, -7), (-1, -7), (-3, -6), (-4, -5), (-5, -2), (-5, 1),
-(-4, 3), (-2, 4), (1, 4), (3, 3), (4, 1)], [(-1, -7), (-3, -5), (-4, -2),
-(-4, 1), (-3, 3), (-2, 4)], [(5, -7), (4, 1), (4, 3), (6, 4), (8, 4),
-(10, 2), (11, -1), (11, -3), (10, -6), (9, -8), (7, -10), (5, -11), (2,
--12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3),
-(-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8),
-(7, 7), (8, 6)], [(6, -7), (5, 1), (5, 3), (6, 4)]]}, 2274: {'charcode':
-2274, 'left': -10, 'right': 10, 'lines': [[(-2, -16), (-2, 13)], [(2,
--16), (2, 13)], [(6, -9), (5, -8), (6, -7), (7, -8), (7, -9), (5, -11),
-(2, -12), (-2, -12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4),
-(-3, -3), (3, -1), (5, 0), (7, 2)], [(-7, -7), (-5, -5), (-3, -4), (3,
--2), (5, -1), (6, 0), (7, 2), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8),
-(-7, 6), (-7, 5), (-6, 4), (-5, 5), (-6, 6)]]}, 2275: {'charcode': 2275,
-'left': -10, 'right': 11, 'lines': [[(1, -12), (-6, 16)], [(7, -12), (0,
-16)], [(-6, -1), (8, -1)], [(-7, 5), (7, 5)]]}, 2276: {'charcode': 2276,
-'left': -8, 'right': 8, 'lines': [[(3, -9), (2, -8), (3, -7), (4, -8),
-(4, -9), (3, -11), (1, -12), (-1, -12), (-3, -11), (-4, -9), (-4, -7),
-(-3, -5), (-1, -3), (4, 0)], [(-3, -5), (2, -2), (4, 0), (5, 2), (5, 4),
-(4, 6), (2, 8)], [(-2, -4), (-4, -2), (-5, 0), (-5, 2), (-4, 4), (-2, 6),
-(3, 9)], [(-4, 4), (1, 7), (3, 9), (4, 11), (4, 13), (3, 15), (1, 16),
-(-1, 16), (-3, 15), (-4, 13), (-4, 12), (-3, 11), (-2, 12), (-3, 13)]]},
-2277: {'charcode': 2277, 'left': -8, 'right': 8, 'lines': [[(0, -12),
-(-1, -10), (0, -8), (1, -10), (0, -12)], [(0, -12), (0, 16)], [(0, -1),
-(-1, 2), (0, 16), (1, 2), (0, -1)], [(-6, -5), (-4, -4), (-2, -5), (-4,
--6), (-6, -5)], [(-6, -5), (6, -5)], [(2, -5), (4, -4), (6, -5), (4, -6),
-(2, -5)]]}, 2278: {'charcode': 2278, 'left': -8, 'right': 8, 'lines':
-[[(0, -12), (-1, -10), (0, -8), (1, -10), (0, -12)], [(0, -12), (0, 2)],
-[(0, -2), (-1, 0), (1, 4), (0, 6), (-1, 4), (1, 0), (0, -2)], [(0, 2),
-(0, 16)], [(0, 12), (-1, 14), (0, 16), (1, 14), (0, 12)], [(-6, -5),
-(-4, -4), (-2, -5), (-4, -6), (-6, -5)], [(-6, -5), (6, -5)], [(2, -5),
-(4, -4), (6, -5), (4, -6), (2, -5)], [(-6, 9), (-4, 10), (-2, 9), (-4, 8),
-(-6, 9)], [(-6, 9), (6, 9)], [(2, 9), (4, 10), (6, 9), (4, 8), (2, 9)]]},
-2279: {'charcode': 2279, 'left': -9, 'right': 10, 'lines': [[(6, -12),
-(6, 9)], [(-7, -12), (6, -12)], [(-2, -2), (6, -2)], [(-7, 9), (6, 9)]]},
-2281: {'charcode': 2281, 'left': -13, 'right': 14, 'lines': [[(-1, -12),
-(-4, -11), (-7, -9), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-7, 6),
-(-4, 8), (-1, 9), (2, 9), (5, 8), (8, 6), (10, 3), (11, 0), (11, -3),
-(10, -6), (8, -9), (5, -11), (2, -12), (-1, -12)], [(0, -3), (-1, -2),
-(-1, -1), (0, 0), (1, 0), (2, -1), (2, -2), (1, -3), (0, -3)], [(0, -2),
-(0, -1), (1, -1), (1, -2), (0, -2)]]}, 2282: {'charcode': 2282, 'left':
--8, 'right': 9, 'lines': [[(-2, -12), (-4, -11), (-3, -9), (-1, -8)],
-[(-2, -12), (-3, -11), (-3, -9)], [(3, -12), (5, -11), (4, -9), (2, -8)],
-[(3, -12), (4, -11), (4, -9)], [(-1, -8), (-3, -7), (-4, -6), (-5, -4),
-(-5, -1), (-4, 1), (-3, 2), (-1, 3), (2, 3), (4, 2), (5, 1), (6, -1),
-(6, -4), (5, -6), (4, -7), (2, -8), (-1, -8)], [(0, 3), (0, 9)], [(1,
-3), (1, 9)], [(-4, 6), (5, 6)]]}, 2283: {'charcode': 2283, 'left': -9,
-'right': 10, 'lines': [[(0, -12), (-3, -11), (-5, -9), (-6, -6), (-6, -5),
-(-5, -2), (-3, 0), (0, 1), (1, 1), (4, 0), (6, -2), (7, -5), (7, -6), (6,
--9), (4, -11), (1, -12), (0, -12)], [(0, 1), (0, 9)], [(1, 1), (1, 9)],
-[(-4, 5), (5, 5)]]}, 2284: {'charcode': 2284, 'left': -14, 'right': 14,
-'lines': [[(-2, -12), (-5, -11), (-8, -9), (-10, -6), (-11, -3), (-11, 1),
-(-10, 4), (-8, 7), (-5, 9), (-2, 10), (2, 10), (5, 9), (8, 7), (10, 4),
-(11, 1), (11, -3), (10, -6), (8, -9), (5, -11), (2, -12), (-2, -12)],
-[(0, -12), (0, 10)], [(-11, -1), (11, -1)]]}, 2285: {'charcode': 2285,
-'left': -11, 'right': 14, 'lines': [[(-2, -5), (-5, -4), (-7, -2), (-8,
-1), (-8, 2), (-7, 5), (-5, 7), (-2, 8), (-1, 8), (2, 7), (4, 5), (5, 2),
-(5, 1), (4, -2), (2, -4), (-1, -5), (-2, -5)], [(11, -11), (5, -11),
-(9, -10), (3, -4)], [(11, -11), (11, -5), (10, -9), (4, -3)], [(10, -10),
-(4, -4)]]}, 2286: {'charcode': 2286, 'left': -12, 'right': 10, 'lines':
-[[(-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -9), (0, -6),
-(-1, -3), (-2, -1), (-4, 1), (-7, 3)], [(-3, -12), (-2, -11), (-1, -9),
-(-1, -5), (-2, -2), (-4, 1)], [(4, -12), (2, 9)], [(5, -12), (1, 9)],
-[(-7, 3), (7, 3)]]}, 2287: {'charcode': 2287, 'left': -9, 'right': 10,
-'lines': [[(-5, -12), (-5, 3)], [(-4, -12), (-5, -1)], [(-5, -1), (-4,
--3), (-3, -4), (-1, -5), (2, -5), (5, -4), (6, -2), (6, 0), (5, 2), (3,
-4)], [(2, -5), (4, -4), (5, -2), (5, 0), (2, 6), (2, 8), (3, 9), (5, 9),
-(7, 7)], [(-7, -12), (-4, -12)]]}, 2288: {'charcode': 2288, 'left': -9,
-'right': 10, 'lines': [[(0, -4), (-3, -3), (-5, -1), (-6, 2), (-6, 3),
-(-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6,
--1), (4, -3), (1, -4), (0, -4)], [(0, -10), (-4, -8), (0, -12), (0, -4)],
-[(1, -10), (5, -8), (1, -12), (1, -4)], [(0, 1), (-1, 2), (-1, 3), (0,
-4), (1, 4), (2, 3), (2, 2), (1, 1), (0, 1)], [(0, 2), (0, 3), (1, 3),
-(1, 2), (0, 2)]]}, 2289: {'charcode': 2289, 'left': -11, 'right': 12,
-'lines': [[(-1, -10), (0, -12), (0, 9)], [(2, -10), (1, -12), (1, 9)],
-[(-8, -10), (-7, -12), (-7, -5), (-6, -2), (-4, 0), (-1, 1), (0, 1)],
-[(-5, -10), (-6, -12), (-6, -4), (-5, -1)], [(9, -10), (8, -12), (8, -5),
-(7, -2), (5, 0), (2, 1), (1, 1)], [(6, -10), (7, -12), (7, -4), (6, -1)],
-[(-4, 5), (5, 5)]]}, 2290: {'charcode': 2290, 'left': -11, 'right': 11,
-'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3,
--12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (3, -1),
-(-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5,
--2), (3, -1)], [(-9, 9), (7, 9), (7, 4), (6, 9)]]}, 2291: {'charcode':
-2291, 'left': -10, 'right': 9, 'lines': [[(7, -11), (3, -11), (-1, -10),
-(-4, -8), (-6, -5), (-7, -2), (-7, 1), (-6, 4), (-4, 7), (-1, 9), (3, 10),
-(7, 10)], [(7, -11), (4, -10), (1, -8), (-1, -5), (-2, -2), (-2, 1), (-1,
-4), (1, 7), (4, 9), (7, 10)]]}, 2292: {'charcode': 2292, 'left': -12,
-'right': 13, 'lines': [[(-3, -1), (-5, -1), (-7, 0), (-8, 1), (-9, 3),
-(-9, 5), (-8, 7), (-7, 8), (-5, 9), (-3, 9), (-1, 8), (0, 7), (1, 5),
-(1, 3), (0, 1), (-1, 0), (-3, -1)], [(1, -10), (-2, -1)], [(8, -8),
-(0, 0)], [(10, -1), (1, 2)]]}, 2293: {'charcode': 2293, 'left': -10,
-'right': 10, 'lines': [[(-3, -7), (3, 7)], [(3, -7), (-3, 7)], [(-7, -3),
-(7, 3)], [(7, -3), (-7, 3)]]}, 2294: {'charcode': 2294, 'left': -12,
-'right': 12, 'lines': [[(-4, 4), (-6, 3), (-7, 3), (-9, 4), (-10, 6),
-(-10, 7), (-9, 9), (-7, 10), (-6, 10), (-4, 9), (-3, 7), (-3, 6), (-4, 4),
-(-7, 0), (-8, -3), (-8, -5), (-7, -8), (-5, -10), (-2, -11), (2, -11),
-(5, -10), (7, -8), (8, -5), (8, -3), (7, 0), (4, 4), (3, 6), (3, 7), (4,
-9), (6, 10), (7, 10), (9, 9), (10, 7), (10, 6), (9, 4), (7, 3), (6, 3),
-(4, 4)], [(-8, -5), (-7, -7), (-5, -9), (-2, -10), (2, -10), (5, -9),
-(7, -7), (8, -5)]]}, 2295: {'charcode': 2295, 'left': -12, 'right': 12,
-'lines': [[(-4, -5), (-6, -4), (-7, -4), (-9, -5), (-10, -7), (-10, -8),
-(-9, -10), (-7, -11), (-6, -11), (-4, -10), (-3, -8), (-3, -7), (-4, -5),
-(-7, -1), (-8, 2), (-8, 4), (-7, 7), (-5, 9), (-2, 10), (2, 10), (5, 9),
-(7, 7), (8, 4), (8, 2), (7, -1), (4, -5), (3, -7), (3, -8), (4, -10),
-(6, -11), (7, -11), (9, -10), (10, -8), (10, -7), (9, -5), (7, -4),
-(6, -4), (4, -5)], [(-8, 4), (-7, 6), (-5, 8), (-2, 9), (2, 9), (5, 8),
-(7, 6), (8, 4)]]}, 2301: {'charcode': 2301, 'left': -12, 'right': 13,
-'lines': [[(-8, -5), (-9, -6), (-9, -8), (-8, -10), (-6, -11), (-4, -11),
-(-2, -10), (-1, -9), (0, -7), (1, -2)], [(-9, -8), (-7, -10), (-5, -10),
-(-3, -9), (-2, -8), (-1, -6), (0, -2), (0, 9)], [(9, -5), (10, -6),
-(10, -8), (9, -10), (7, -11), (5, -11), (3, -10), (2, -9), (1, -7), (0,
--2)], [(10, -8), (8, -10), (6, -10), (4, -9), (3, -8), (2, -6), (1, -2),
-(1, 9)]]}, 2302: {'charcode': 2302, 'left': -12, 'right': 12, 'lines':
-[[(-9, -11), (-8, -7), (-7, -5), (-5, -3), (-2, -2), (2, -2), (5, -3),
-(7, -5), (8, -7), (9, -11)], [(-9, -11), (-8, -8), (-7, -6), (-5, -4),
-(-2, -3), (2, -3), (5, -4), (7, -6), (8, -8), (9, -11)], [(-2, -3),
-(-4, -2), (-5, -1), (-6, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (1, 9),
-(3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3)], [(-2, -2),
-(-4, -1), (-5, 1), (-5, 4), (-4, 7)], [(4, 7), (5, 4), (5, 1), (4, -1),
-(2, -2)]]}, 2303: {'charcode': 2303, 'left': -12, 'right': 12, 'lines':
-[[(-5, -8), (-5, 4)], [(-4, -7), (-4, 3)], [(4, -7), (4, 3)], [(5, -8),
-(5, 4)], [(-9, -11), (-7, -9), (-5, -8), (-2, -7), (2, -7), (5, -8),
-(7, -9), (9, -11)], [(-9, 7), (-7, 5), (-5, 4), (-2, 3), (2, 3), (5, 4),
-(7, 5), (9, 7)]]}, 2304: {'charcode': 2304, 'left': -12, 'right': 12,
-'lines': [[(9, -9), (-6, -9), (-8, -8), (-9, -6), (-9, -4), (-8, -2),
-(-6, -1), (-4, -1), (-2, -2), (-1, -4), (-1, -6), (-2, -8), (9, -8)],
-[(-9, -5), (-8, -3), (-7, -2), (-5, -1)], [(-1, -5), (-2, -7), (-3, -8),
-(-5, -9)], [(-9, 6), (6, 6), (8, 5), (9, 3), (9, 1), (8, -1), (6, -2), (4,
--2), (2, -1), (1, 1), (1, 3), (2, 5), (-9, 5)], [(9, 2), (8, 0), (7, -1),
-(5, -2)], [(1, 2), (2, 4), (3, 5), (5, 6)]]}, 2305: {'charcode': 2305,
-'left': -12, 'right': 11, 'lines': [[(-3, 3), (-5, 2), (-6, 2), (-8, 3),
-(-9, 5), (-9, 6), (-8, 8), (-6, 9), (-5, 9), (-3, 8), (-2, 6), (-2, 5),
-(-3, 3), (-8, -2), (-9, -4), (-9, -7), (-8, -9), (-6, -10), (-3, -11),
-(1, -11), (5, -10), (7, -8), (8, -6), (8, -3), (7, 0), (4, 3), (3, 5),
-(3, 7), (4, 9), (6, 9), (7, 8), (8, 6)], [(-5, 1), (-7, -2), (-8, -4),
-(-8, -7), (-7, -9), (-6, -10)], [(1, -11), (4, -10), (6, -8), (7, -6), (7,
--3), (6, 0), (4, 3)]]}, 2306: {'charcode': 2306, 'left': -11, 'right': 13,
-'lines': [[(-10, -7), (-7, -10), (-5, -7), (-5, 4)], [(-8, -9), (-6, -6),
-(-6, 4)], [(-5, -7), (-2, -10), (0, -7), (0, 3)], [(-3, -9), (-1, -6),
-(-1, 3)], [(0, -7), (3, -10), (5, -7), (5, 9)], [(2, -9), (4, -6), (4,
-9)], [(5, -7), (8, -10), (9, -8), (10, -5), (10, -2), (9, 1), (8, 3),
-(6, 5), (3, 7), (-2, 9)], [(7, -9), (8, -8), (9, -5), (9, -2), (8, 1),
-(7, 3), (5, 5), (2, 7), (-2, 9)]]}, 2307: {'charcode': 2307, 'left': -12,
-'right': 12, 'lines': [[(-9, 1), (-5, 1), (-6, 0), (-7, -3), (-7, -5),
-(-6, -8), (-4, -10), (-1, -11), (1, -11), (4, -10), (6, -8), (7, -5),
-(7, -3), (6, 0), (5, 1), (9, 1)], [(-9, 2), (-3, 2), (-5, 0), (-6, -3),
-(-6, -5), (-5, -8), (-3, -10), (-1, -11)], [(1, -11), (3, -10), (5, -8),
-(6, -5), (6, -3), (5, 0), (3, 2), (9, 2)], [(-7, 6), (7, 6)], [(-7, 7),
-(7, 7)]]}, 2308: {'charcode': 2308, 'left': -12, 'right': 13, 'lines':
-[[(-11, -6), (-8, -9), (-5, -6), (-5, 6)], [(-9, -8), (-6, -5), (-6,
-6)], [(-5, -6), (-2, -9), (1, -6), (1, 6)], [(-3, -8), (0, -5), (0, 6)],
-[(1, -6), (4, -9), (7, -6), (7, 5), (9, 7)], [(3, -8), (6, -5), (6, 6),
-(8, 8), (11, 5)]]}, 2309: {'charcode': 2309, 'left': -11, 'right': 11,
-'lines': [[(8, -9), (-8, 7)], [(8, -9), (5, -8), (-1, -8)], [(6, -7),
-(3, -7), (-1, -8)], [(8, -9), (7, -6), (7, 0)], [(6, -7), (6, -4),
-(7, 0)], [(-1, 0), (-8, 0)], [(-2, 1), (-5, 1), (-8, 0)], [(-1, 0),
-(-1, 7)], [(-2, 1), (-2, 4), (-1, 7)]]}, 2310: {'charcode': 2310,
-'left': -12, 'right': 12, 'lines': [[(-10, -3), (-8, -7), (-3, 3)],
-[(-8, -5), (-3, 5), (0, -2), (5, -2), (8, -3), (9, -5), (9, -7), (8,
--9), (6, -10), (5, -10), (3, -9), (2, -7), (2, -5), (3, -2), (4, 0),
-(5, 3), (5, 6), (3, 8)], [(5, -10), (4, -9), (3, -7), (3, -5), (5, -1),
-(6, 2), (6, 5), (5, 7), (3, 8)]]}, 2311: {'charcode': 2311, 'left':
--12, 'right': 12, 'lines': [[(-9, -3), (-6, -6), (-2, -4)], [(-7, -5),
-(-3, -3), (0, -6), (3, -4)], [(-1, -5), (2, -3), (5, -6), (7, -4)],
-[(4, -5), (6, -3), (9, -6)], [(-9, 3), (-6, 0), (-2, 2)], [(-7, 1),
-(-3, 3), (0, 0), (3, 2)], [(-1, 1), (2, 3), (5, 0), (7, 2)], [(4, 1),
-(6, 3), (9, 0)]]}, 2312: {'charcode': 2312, 'left': -12, 'right': 12,
-'lines': [[(-8, -10), (-4, -8), (-2, -6), (-1, -3), (-1, 0), (-2, 3),
-(-4, 5), (-8, 7)], [(-8, -10), (-5, -9), (-3, -8), (-1, -6), (0, -3)],
-[(0, 0), (-1, 3), (-3, 5), (-5, 6), (-8, 7)], [(8, -10), (5, -9), (3, -8),
-(1, -6), (0, -3)], [(0, 0), (1, 3), (3, 5), (5, 6), (8, 7)], [(8, -10),
-(4, -8), (2, -6), (1, -3), (1, 0), (2, 3), (4, 5), (8, 7)], [(-9, -2),
-(9, -2)], [(-9, -1), (9, -1)]]}, 2317: {'charcode': 2317, 'left': -4,
-'right': 4, 'lines': [[(-1, -1), (-1, 1), (1, 1), (1, -1), (-1, -1)],
-[(-1, -1), (1, 1)], [(1, -1), (-1, 1)]]}, 2318: {'charcode': 2318,
-'left': -8, 'right': 8, 'lines': [[(-5, -2), (-1, 0), (2, 2), (4, 4),
-(5, 7), (5, 9), (4, 11), (3, 12)], [(-5, -1), (1, 2)], [(-5, 0), (-2,
-1), (2, 3), (4, 5), (5, 7)]]}, 2319: {'charcode': 2319, 'left': -8,
-'right': 8, 'lines': [[(5, -7), (4, -5), (2, -3), (-2, -1), (-5, 0)],
-[(1, -2), (-5, 1)], [(3, -12), (4, -11), (5, -9), (5, -7), (4, -4), (2,
--2), (-1, 0), (-5, 2)]]}, 2320: {'charcode': 2320, 'left': -10, 'right':
-10, 'lines': [[(1, -5), (-3, -4), (-6, -2), (-7, 0), (-7, 2), (-6, 4),
-(-4, 5), (-1, 5), (3, 4), (6, 2), (7, 0), (7, -2), (6, -4), (4, -5), (1,
--5)], [(6, -4), (1, -5)], [(4, -5), (-1, -4), (-6, -2)], [(-3, -4), (-7,
-0)], [(-6, 4), (-1, 5)], [(-4, 5), (1, 4), (6, 2)], [(3, 4), (7, 0)]]},
-2321: {'charcode': 2321, 'left': -10, 'right': 10, 'lines': [[(1, -5),
-(-3, -4), (-6, -2), (-7, 0), (-7, 2), (-6, 4), (-4, 5), (-1, 5), (3, 4),
-(6, 2), (7, 0), (7, -2), (6, -4), (4, -5), (1, -5)], [(6, -4), (1, -5)],
-[(4, -5), (-1, -4), (-6, -2)], [(-3, -4), (-7, 0)], [(-6, 4), (-1, 5)],
-[(-4, 5), (1, 4), (6, 2)], [(3, 4), (7, 0)]]}, 2322: {'charcode': 2322,
-'left': -8, 'right': 9, 'lines': [[(1, -5), (-2, -4), (-4, -2), (-5, 0),
-(-5, 2), (-4, 4), (-2, 5), (0, 5), (3, 4), (5, 2), (6, 0), (6, -2),
-(5, -4), (3, -5), (1, -5)], [(-3, -2), (3, -5)], [(-4, 0), (4, -4)],
-[(-5, 2), (5, -3)], [(-4, 3), (6, -2)], [(-3, 4), (5, 0)], [(-2, 5),
-(4, 2)]]}, 2323: {'charcode': 2323, 'left': -8, 'right': 8, 'lines':
-[[(-3, -11), (-3, 12)], [(3, -12), (3, 11)], [(-5, -4), (5, -6)], [(-5,
--3), (5, -5)], [(-5, 5), (5, 3)], [(-5, 6), (5, 4)]]}, 2324: {'charcode':
-2324, 'left': -8, 'right': 8, 'lines': [[(-4, -12), (-4, 6)], [(4, -6),
-(4, 12)], [(-4, -4), (4, -6)], [(-4, -3), (4, -5)], [(-4, 5), (4, 3)],
-[(-4, 6), (4, 4)]]}, 2325: {'charcode': 2325, 'left': -8, 'right': 8,
-'lines': [[(-4, -16), (-4, 5)], [(-4, -4), (-1, -6), (2, -6), (4, -5),
-(5, -3), (5, -1), (4, 1), (1, 3), (-1, 4), (-4, 5)], [(-4, -4), (-1, -5),
-(2, -5), (4, -4)], [(3, -5), (4, -3), (4, -1), (3, 1), (1, 3)]]}, 2326:
-{'charcode': 2326, 'left': -13, 'right': 13, 'lines': [[(-10, -9), (-10,
--6)], [(10, -9), (10, -6)], [(-10, -9), (10, -9)], [(-10, -8), (10, -8)],
-[(-10, -7), (10, -7)], [(-10, -6), (10, -6)]]}, 2327: {'charcode': 2327,
-'left': -8, 'right': 8, 'lines': [[(-5, -4), (-5, -1)], [(5, -4), (5,
--1)], [(-5, -4), (5, -4)], [(-5, -3), (5, -3)], [(-5, -2), (5, -2)],
-[(-5, -1), (5, -1)]]}, 2328: {'charcode': 2328, 'left': -8, 'right': 8,
-'lines': [[(-5, -6), (5, 6)], [(-5, -6), (-3, -4), (-1, -3), (2, -3), (4,
--4), (5, -5), (5, -7), (3, -7), (3, -5), (2, -3)], [(-3, -4), (2, -3)],
-[(-1, -3), (5, -5)], [(4, -7), (4, -4)], [(3, -6), (5, -6)], [(5, 6),
-(3, 4), (1, 3), (-2, 3), (-4, 4), (-5, 5), (-5, 7), (-3, 7), (-3, 5),
-(-2, 3)], [(3, 4), (-2, 3)], [(1, 3), (-5, 5)], [(-4, 4), (-4, 7)],
-[(-5, 6), (-3, 6)]]}, 2329: {'charcode': 2329, 'left': -8, 'right': 8,
-'lines': [[(-2, -3), (-3, -5), (-3, -7), (-5, -7), (-5, -5), (-4, -4),
-(-2, -3), (1, -3), (3, -4), (5, -6)], [(-4, -7), (-4, -4)], [(-5, -6),
-(-3, -6)], [(-5, -5), (1, -3)], [(-2, -3), (3, -4)], [(5, -6), (5, 7)]]},
-2330: {'charcode': 2330, 'left': -17, 'right': 12, 'lines': [[(-11, 20),
-(-10, 20), (-9, 19), (-9, 18), (-10, 17), (-11, 17), (-12, 18), (-12, 20),
-(-11, 22), (-9, 23), (-7, 23), (-4, 22), (-2, 20), (-1, 18), (0, 14),
-(0, 3), (-1, -23), (-1, -30), (0, -35), (1, -37), (3, -38), (4, -38),
-(6, -37), (7, -35), (7, -31), (6, -28), (5, -26), (3, -23), (-2, -19),
-(-8, -15), (-10, -13), (-12, -10), (-13, -8), (-14, -4), (-14, 0), (-13,
-4), (-11, 7), (-8, 9), (-4, 10), (0, 10), (4, 9), (6, 8), (8, 5), (9, 2),
-(9, -2), (8, -5), (7, -7), (5, -9), (2, -10), (-2, -10), (-5, -9), (-7,
--7), (-8, -4), (-8, 0), (-7, 3), (-5, 5)], [(-11, 18), (-11, 19), (-10,
-19), (-10, 18), (-11, 18)], [(3, -23), (-1, -19), (-6, -15), (-9, -12),
-(-11, -9), (-12, -7), (-13, -4), (-13, 0), (-12, 4), (-11, 6), (-8, 9)],
-[(0, 10), (3, 9), (5, 8), (7, 5), (8, 2), (8, -2), (7, -5), (6, -7),
-(4, -9), (2, -10)]]}, 2331: {'charcode': 2331, 'left': -13, 'right':
-20, 'lines': [[(-4, 1), (-3, 3), (-1, 4), (1, 4), (3, 3), (4, 1), (4,
--1), (3, -3), (1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4),
-(-4, 7), (-2, 9), (1, 10), (4, 10), (7, 9), (9, 7), (10, 5), (11, 2),
-(11, -2), (10, -5), (8, -8), (6, -9), (3, -10), (0, -10), (-3, -9),
-(-5, -8), (-7, -6), (-9, -3), (-10, 1), (-10, 6), (-9, 11), (-7, 15),
-(-5, 17), (-2, 19), (2, 20), (7, 20), (11, 19), (14, 17), (16, 15)],
-[(-7, -6), (-8, -4), (-9, 0), (-9, 6), (-8, 10), (-6, 14), (-4, 16),
-(-1, 18), (3, 19), (7, 19), (11, 18), (13, 17), (16, 15)], [(-2, -3),
-(2, -3)], [(-3, -2), (3, -2)], [(-4, -1), (4, -1)], [(-4, 0), (4, 0)],
-[(-4, 1), (4, 1)], [(-3, 2), (3, 2)], [(-2, 3), (2, 3)], [(15, -6), (15,
--4), (17, -4), (17, -6), (15, -6)], [(16, -6), (16, -4)], [(15, -5),
-(17, -5)], [(15, 4), (15, 6), (17, 6), (17, 4), (15, 4)], [(16, 4),
-(16, 6)], [(15, 5), (17, 5)]]}, 2332: {'charcode': 2332, 'left': -14,
-'right': 14, 'lines': [[(-10, -18), (-10, 18)], [(-5, -18), (-5, 18)],
-[(5, -18), (5, 18)], [(10, -18), (10, 18)], [(-5, -5), (5, -7)], [(-5,
--4), (5, -6)], [(-5, -3), (5, -5)], [(-5, 5), (5, 3)], [(-5, 6), (5, 4)],
-[(-5, 7), (5, 5)]]}, 2367: {'charcode': 2367, 'left': -4, 'right': 4,
-'lines': [[(-1, -1), (-1, 1), (1, 1), (1, -1), (-1, -1)], [(-1, -1),
-(1, 1)], [(1, -1), (-1, 1)]]}, 2368: {'charcode': 2368, 'left': -8,
-'right': 8, 'lines': [[(-5, -2), (-1, 0), (2, 2), (4, 4), (5, 7), (5,
-9), (4, 11), (3, 12)], [(-5, -1), (1, 2)], [(-5, 0), (-2, 1), (2, 3),
-(4, 5), (5, 7)]]}, 2369: {'charcode': 2369, 'left': -8, 'right': 8,
-'lines': [[(5, -7), (4, -5), (2, -3), (-2, -1), (-5, 0)], [(1, -2), (-5,
-1)], [(3, -12), (4, -11), (5, -9), (5, -7), (4, -4), (2, -2), (-1, 0),
-(-5, 2)]]}, 2370: {'charcode': 2370, 'left': -10, 'right': 10, 'lines':
-[[(-2, -5), (-5, -4), (-6, -3), (-7, -1), (-7, 1), (-6, 3), (-5, 4),
-(-2, 5), (2, 5), (5, 4), (6, 3), (7, 1), (7, -1), (6, -3), (5, -4),
-(2, -5), (-2, -5)], [(-5, -4), (-6, -2), (-6, 1), (-5, 3), (-4, 4),
-(-2, 5)], [(5, 4), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5)]]},
-2371: {'charcode': 2371, 'left': -10, 'right': 10, 'lines': [[(1, -5),
-(-3, -4), (-6, -2), (-7, 0), (-7, 2), (-6, 4), (-4, 5), (-1, 5), (3, 4),
-(6, 2), (7, 0), (7, -2), (6, -4), (4, -5), (1, -5)], [(6, -4), (1, -5)],
-[(4, -5), (-1, -4), (-6, -2)], [(-3, -4), (-7, 0)], [(-6, 4), (-1, 5)],
-[(-4, 5), (1, 4), (6, 2)], [(3, 4), (7, 0)]]}, 2372: {'charcode': 2372,
-'left': -8, 'right': 9, 'lines': [[(1, -5), (-2, -4), (-4, -2), (-5, 0),
-(-5, 2), (-4, 4), (-2, 5), (0, 5), (3, 4), (5, 2), (6, 0), (6, -2),
-(5, -4), (3, -5), (1, -5)], [(-3, -2), (3, -5)], [(-4, 0), (4, -4)],
-[(-5, 2), (5, -3)], [(-4, 3), (6, -2)], [(-3, 4), (5, 0)], [(-2, 5),
-(4, 2)]]}, 2373: {'charcode': 2373, 'left': -8, 'right': 8, 'lines':
-[[(-3, -11), (-3, 12)], [(3, -12), (3, 11)], [(-5, -4), (5, -6)], [(-5,
--3), (5, -5)], [(-5, 5), (5, 3)], [(-5, 6), (5, 4)]]}, 2374: {'charcode':
-2374, 'left': -8, 'right': 8, 'lines': [[(-4, -12), (-4, 6)], [(4, -6),
-(4, 12)], [(-4, -4), (4, -6)], [(-4, -3), (4, -5)], [(-4, 5), (4, 3)],
-[(-4, 6), (4, 4)]]}, 2375: {'charcode': 2375, 'left': -8, 'right': 8,
-'lines': [[(-4, -16), (-4, 5)], [(-4, -4), (-1, -6), (2, -6), (4, -5),
-(5, -3), (5, -1), (4, 1), (1, 3), (-1, 4), (-4, 5)], [(-4, -4), (-1, -5),
-(2, -5), (4, -4)], [(3, -5), (4, -3), (4, -1), (3, 1), (1, 3)]]}, 2376:
-{'charcode': 2376, 'left': -13, 'right': 13, 'lines': [[(-10, -9), (-10,
--6)], [(10, -9), (10, -6)], [(-10, -9), (10, -9)], [(-10, -8), (10, -8)],
-[(-10, -7), (10, -7)], [(-10, -6), (10, -6)]]}, 2377: {'charcode': 2377,
-'left': -8, 'right': 8, 'lines': [[(-5, -4), (-5, -1)], [(5, -4), (5,
--1)], [(-5, -4), (5, -4)], [(-5, -3), (5, -3)], [(-5, -2), (5, -2)],
-[(-5, -1), (5, -1)]]}, 2378: {'charcode': 2378, 'left': -8, 'right':
-8, 'lines': [[(-1, -15), (4, -5), (0, 2), (0, 3)], [(3, -6), (-1, 1)],
-[(2, -9), (2, -7), (-2, 0), (0, 3), (3, 7)], [(5, 10), (3, 7), (1, 6),
-(-1, 6), (-3, 7), (-4, 9), (-4, 11), (-3, 13), (0, 15)], [(5, 10), (3,
-8), (1, 7), (-3, 7), (-3, 11), (-2, 13), (0, 15)], [(1, 6), (-2, 8),
-(-4, 11)]]}, 2379: {'charcode': 2379, 'left': -8, 'right': 8, 'lines':
-[[(-2, -3), (-3, -5), (-3, -7), (-5, -7), (-5, -5), (-4, -4), (-2, -3),
-(1, -3), (3, -4), (5, -6)], [(-4, -7), (-4, -4)], [(-5, -6), (-3, -6)],
-[(-5, -5), (1, -3)], [(-2, -3), (3, -4)], [(5, -6), (1, 7)]]}, 2380:
-{'charcode': 2380, 'left': -17, 'right': 12, 'lines': [[(-11, 20), (-10,
-20), (-9, 19), (-9, 18), (-10, 17), (-11, 17), (-12, 18), (-12, 20),
-(-11, 22), (-9, 23), (-7, 23), (-4, 22), (-2, 20), (-1, 18), (0, 14),
-(0, 3), (-1, -23), (-1, -30), (0, -35), (1, -37), (3, -38), (4, -38),
-(6, -37), (7, -35), (7, -31), (6, -28), (5, -26), (3, -23), (-2, -19),
-(-8, -15), (-10, -13), (-12, -10), (-13, -8), (-14, -4), (-14, 0), (-13,
-4), (-11, 7), (-8, 9), (-4, 10), (0, 10), (4, 9), (6, 8), (8, 5), (9,
-2), (9, -2), (8, -5), (7, -7), (5, -9), (2, -10), (-2, -10), (-5, -9),
-(-7, -7), (-8, -4), (-8, 0), (-7, 3), (-5, 5)], [(-11, 18), (-11, 19),
-(-10, 19), (-10, 18), (-11, 18)], [(3, -23), (-1, -19), (-6, -15), (-9,
--12), (-11, -9), (-12, -7), (-13, -4), (-13, 0), (-12, 4), (-11, 6),
-(-8, 9)], [(0, 10), (3, 9), (5, 8), (7, 5), (8, 2), (8, -2), (7, -5),
-(6, -7), (4, -9), (2, -10)]]}, 2381: {'charcode': 2381, 'left': -9,
-'right': 24, 'lines': [[(-4, -1), (-3, -3), (-1, -4), (1, -4), (3, -3),
-(4, -1), (4, 1), (3, 3), (1, 4), (-1, 4), (-3, 3), (-4, 2), (-5, -1),
-(-5, -4), (-4, -7), (-2, -9), (1, -10), (5, -10), (9, -9), (12, -7),
-(14, -4), (15, 0), (15, 5), (14, 9), (13, 11), (11, 14), (8, 17), (4,
-20), (-1, 23), (-5, 25)], [(5, -10), (8, -9), (11, -7), (13, -4), (14,
-0), (14, 5), (13, 9), (12, 11), (10, 14), (7, 17), (2, 21), (-1, 23)],
-[(-2, -3), (2, -3)], [(-3, -2), (3, -2)], [(-4, -1), (4, -1)], [(-4, 0),
-(4, 0)], [(-4, 1), (4, 1)], [(-3, 2), (3, 2)], [(-2, 3), (2, 3)], [(19,
--6), (19, -4), (21, -4), (21, -6), (19, -6)], [(20, -6), (20, -4)], [(19,
--5), (21, -5)], [(19, 4), (19, 6), (21, 6), (21, 4), (19, 4)], [(20, 4),
-(20, 6)], [(19, 5), (21, 5)]]}, 2382: {'charcode': 2382, 'left': -14,
-'right': 14, 'lines': [[(-10, -20), (-10, 20)], [(-9, -20), (-9, 20)],
-[(-5, -20), (-5, 20)], [(-1, -16), (1, -16), (1, -14), (-1, -14), (-1,
--17), (0, -19), (2, -20), (5, -20), (7, -19), (9, -17), (10, -14), (10,
--9), (9, -6), (7, -4), (5, -3), (3, -3), (1, -4), (0, -6), (-1, -4),
-(-3, -1), (-4, 0), (-3, 1), (-1, 4), (0, 6), (1, 4), (3, 3), (5, 3),
-(7, 4), (9, 6), (10, 9), (10, 14), (9, 17), (7, 19), (5, 20), (2, 20),
-(0, 19), (-1, 17), (-1, 14), (1, 14), (1, 16), (-1, 16)], [(0, -16),
-(0, -14)], [(-1, -15), (1, -15)], [(7, -19), (8, -17), (9, -14), (9, -9),
-(8, -6), (7, -4)], [(0, -6), (0, -4), (-2, -1), (-4, 0), (-2, 1), (0, 4),
-(0, 6)], [(7, 4), (8, 6), (9, 9), (9, 14), (8, 17), (7, 19)], [(0, 14),
-(0, 16)], [(-1, 15), (1, 15)]]}, 2401: {'charcode': 2401, 'left': -17,
-'right': 17, 'lines': [[(-10, -16), (-10, 16)], [(-9, -16), (-9, 16)],
-[(9, -16), (9, 16)], [(10, -16), (10, 16)], [(-14, -16), (14, -16)],
-[(-14, 16), (-5, 16)], [(5, 16), (14, 16)]]}, 2402: {'charcode': 2402,
-'left': -16, 'right': 15, 'lines': [[(-11, -16), (-1, -2), (-12, 16)],
-[(-12, -16), (-2, -2)], [(-13, -16), (-2, -1)], [(-13, -16), (10, -16),
-(12, -9), (9, -16)], [(-11, 15), (10, 15)], [(-12, 16), (10, 16), (12, 9),
-(9, 16)]]}, 2403: {'charcode': 2403, 'left': -9, 'right': 9, 'lines':
-[[(6, -39), (3, -33), (0, -26), (-2, -21), (-3, -17), (-4, -12), (-5,
--4), (-5, 4), (-4, 12), (-3, 17), (-2, 21), (0, 26), (3, 33), (6, 39)],
-[(3, -33), (1, -28), (-1, -22), (-2, -18), (-3, -12), (-4, -4), (-4, 4),
-(-3, 12), (-2, 18), (-1, 22), (1, 28), (3, 33)]]}, 2404: {'charcode':
-2404, 'left': -9, 'right': 9, 'lines': [[(-6, -39), (-3, -33), (0, -26),
-(2, -21), (3, -17), (4, -12), (5, -4), (5, 4), (4, 12), (3, 17), (2, 21),
-(0, 26), (-3, 33), (-6, 39)], [(-3, -33), (-1, -28), (1, -22), (2, -18),
-(3, -12), (4, -4), (4, 4), (3, 12), (2, 18), (1, 22), (-1, 28), (-3,
-33)]]}, 2405: {'charcode': 2405, 'left': -9, 'right': 9, 'lines': [[(-5,
--39), (-5, 0), (-5, 39)], [(-4, -39), (-4, 0), (-4, 39)], [(-5, -39),
-(6, -39)], [(-5, 39), (6, 39)]]}, 2406: {'charcode': 2406, 'left': -9,
-'right': 9, 'lines': [[(4, -39), (4, 0), (4, 39)], [(5, -39), (5, 0), (5,
-39)], [(-6, -39), (5, -39)], [(-6, 39), (5, 39)]]}, 2407: {'charcode':
-2407, 'left': -9, 'right': 9, 'lines': [[(4, -39), (1, -37), (-1, -35),
-(-2, -33), (-3, -30), (-3, -26), (-2, -22), (2, -14), (3, -11), (3, -8),
-(2, -5), (0, -2)], [(1, -37), (-1, -34), (-2, -30), (-2, -26), (-1, -23),
-(3, -15), (4, -11), (4, -8), (3, -5), (0, -2), (-4, 0), (0, 2), (3, 5),
-(4, 8), (4, 11), (3, 15), (-1, 23), (-2, 26), (-2, 30), (-1, 34), (1,
-37)], [(0, 2), (2, 5), (3, 8), (3, 11), (2, 14), (-2, 22), (-3, 26),
-(-3, 30), (-2, 33), (-1, 35), (1, 37), (4, 39)]]}, 2408: {'charcode':
-2408, 'left': -9, 'right': 9, 'lines': [[(-4, -39), (-1, -37), (1, -35),
-(2, -33), (3, -30), (3, -26), (2, -22), (-2, -14), (-3, -11), (-3, -8),
-(-2, -5), (0, -2)], [(-1, -37), (1, -34), (2, -30), (2, -26), (1, -23),
-(-3, -15), (-4, -11), (-4, -8), (-3, -5), (0, -2), (4, 0), (0, 2), (-3,
-5), (-4, 8), (-4, 11), (-3, 15), (1, 23), (2, 26), (2, 30), (1, 34), (-1,
-37)], [(0, 2), (-2, 5), (-3, 8), (-3, 11), (-2, 14), (2, 22), (3, 26),
-(3, 30), (2, 33), (1, 35), (-1, 37), (-4, 39)]]}, 2409: {'charcode': 2409,
-'left': -9, 'right': 9, 'lines': [[(4, -36), (1, -33), (-1, -30), (-3,
--26), (-4, -21), (-4, -15), (-3, -9), (-2, -5), (1, 6), (2, 10), (3, 16),
-(3, 21), (2, 26), (1, 29), (-1, 33)], [(1, -33), (-1, -29), (-2, -26),
-(-3, -21), (-3, -16), (-2, -10), (-1, -6), (2, 5), (3, 9), (4, 15), (4,
-21), (3, 26), (1, 30), (-1, 33), (-4, 36)]]}, 2410: {'charcode': 2410,
-'left': -9, 'right': 9, 'lines': [[(-4, -36), (-1, -33), (1, -30), (3,
--26), (4, -21), (4, -15), (3, -9), (2, -5), (-1, 6), (-2, 10), (-3, 16),
-(-3, 21), (-2, 26), (-1, 29), (1, 33)], [(-1, -33), (1, -29), (2, -26),
-(3, -21), (3, -16), (2, -10), (1, -6), (-2, 5), (-3, 9), (-4, 15), (-4,
-21), (-3, 26), (-1, 30), (1, 33), (4, 36)]]}, 2411: {'charcode': 2411,
-'left': -27, 'right': 8, 'lines': [[(-24, 0), (-17, 0), (0, 29)], [(-18,
-0), (-1, 29)], [(-19, 0), (0, 32)], [(8, -48), (4, -8), (0, 32)]]}, 2412:
-{'charcode': 2412, 'left': -15, 'right': 15, 'lines': [[(11, -36), (10,
--36), (9, -35), (9, -34), (10, -33), (11, -33), (12, -34), (12, -36),
-(11, -38), (9, -39), (7, -39), (5, -38), (3, -36), (2, -34), (1, -31),
-(0, -24), (-1, -8), (-1, 24), (-2, 33), (-3, 36)], [(10, -35), (10, -34),
-(11, -34), (11, -35), (10, -35)], [(0, -24), (0, 24)], [(3, -36), (2,
--33), (1, -24), (1, 8), (0, 24), (-1, 31), (-2, 34), (-3, 36), (-5, 38),
-(-7, 39), (-9, 39), (-11, 38), (-12, 36), (-12, 34), (-11, 33), (-10,
-33), (-9, 34), (-9, 35), (-10, 36), (-11, 36)], [(-11, 34), (-11, 35),
-(-10, 35), (-10, 34), (-11, 34)]]}, 2501: {'charcode': 2501, 'left':
--10, 'right': 10, 'lines': [[(0, -12), (-8, 9)], [(0, -9), (-7, 9), (-8,
-9)], [(0, -9), (7, 9), (8, 9)], [(0, -12), (8, 9)], [(-5, 3), (5, 3)],
-[(-6, 4), (6, 4)]]}, 2502: {'charcode': 2502, 'left': -10, 'right': 10,
-'lines': [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-6, -12), (2,
--12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1)],
-[(-5, -11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2)],
-[(-5, -2), (2, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2,
-9), (-6, 9)], [(-5, -1), (2, -1), (5, 0), (6, 2), (6, 5), (5, 7), (2, 8),
-(-5, 8)]]}, 2503: {'charcode': 2503, 'left': -10, 'right': 11, 'lines':
-[[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9),
-(-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9),
-(5, 8), (7, 6), (8, 4)], [(8, -7), (7, -7), (6, -9), (5, -10), (3, -11),
-(-1, -11), (-3, -10), (-5, -7), (-6, -4), (-6, 1), (-5, 4), (-3, 7), (-1,
-8), (3, 8), (5, 7), (6, 6), (7, 4), (8, 4)]]}, 2504: {'charcode': 2504,
-'left': -10, 'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11),
-(-5, 8)], [(-6, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4),
-(8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-6, 9)], [(-5, -11), (1, -11),
-(4, -10), (5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (4, 7),
-(1, 8), (-5, 8)]]}, 2505: {'charcode': 2505, 'left': -9, 'right': 10,
-'lines': [[(-5, -12), (-5, 9)], [(-4, -11), (-4, 8)], [(-5, -12), (7,
--12)], [(-4, -11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)],
-[(-4, -1), (2, -1)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]},
-2506: {'charcode': 2506, 'left': -9, 'right': 9, 'lines': [[(-5, -12),
-(-5, 9)], [(-4, -11), (-4, 9), (-5, 9)], [(-5, -12), (7, -12)], [(-4,
--11), (7, -11), (7, -12)], [(-4, -2), (2, -2), (2, -1)], [(-4, -1),
-(2, -1)]]}, 2507: {'charcode': 2507, 'left': -10, 'right': 11, 'lines':
-[[(8, -7), (7, -9), (5, -11), (3, -12), (-1, -12), (-3, -11), (-5, -9),
-(-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9), (3, 9),
-(5, 8), (7, 6), (8, 4), (8, 0), (3, 0)], [(8, -7), (7, -7), (6, -9),
-(5, -10), (3, -11), (-1, -11), (-3, -10), (-4, -9), (-5, -7), (-6, -4),
-(-6, 1), (-5, 4), (-4, 6), (-3, 7), (-1, 8), (3, 8), (5, 7), (6, 6),
-(7, 4), (7, 1), (3, 1), (3, 0)]]}, 2508: {'charcode': 2508, 'left': -11,
-'right': 11, 'lines': [[(-7, -12), (-7, 9)], [(-7, -12), (-6, -12), (-6,
-9), (-7, 9)], [(7, -12), (6, -12), (6, 9), (7, 9)], [(7, -12), (7, 9)],
-[(-6, -2), (6, -2)], [(-6, -1), (6, -1)]]}, 2509: {'charcode': 2509,
-'left': -4, 'right': 5, 'lines': [[(0, -12), (0, 9), (1, 9)], [(0, -12),
-(1, -12), (1, 9)]]}, 2510: {'charcode': 2510, 'left': -8, 'right': 9,
-'lines': [[(4, -12), (4, 4), (3, 7), (1, 8), (-1, 8), (-3, 7), (-4, 4),
-(-5, 4)], [(4, -12), (5, -12), (5, 4), (4, 7), (3, 8), (1, 9), (-1, 9),
-(-3, 8), (-4, 7), (-5, 4)]]}, 2511: {'charcode': 2511, 'left': -10,
-'right': 11, 'lines': [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12), (-5,
--12), (-5, 9)], [(8, -12), (7, -12), (-5, 0)], [(8, -12), (-5, 1)], [(-2,
--3), (7, 9), (8, 9)], [(-1, -3), (8, 9)]]}, 2512: {'charcode': 2512,
-'left': -9, 'right': 8, 'lines': [[(-5, -12), (-5, 9)], [(-5, -12),
-(-4, -12), (-4, 8)], [(-4, 8), (7, 8), (7, 9)], [(-5, 9), (7, 9)]]},
-2513: {'charcode': 2513, 'left': -12, 'right': 12, 'lines': [[(-8, -12),
-(-8, 9)], [(-7, -7), (-7, 9), (-8, 9)], [(-7, -7), (0, 9)], [(-8, -12),
-(0, 6)], [(8, -12), (0, 6)], [(7, -7), (0, 9)], [(7, -7), (7, 9), (8, 9)],
-[(8, -12), (8, 9)]]}, 2514: {'charcode': 2514, 'left': -11, 'right': 11,
-'lines': [[(-7, -12), (-7, 9)], [(-6, -9), (-6, 9), (-7, 9)], [(-6, -9),
-(7, 9)], [(-7, -12), (6, 6)], [(6, -12), (6, 6)], [(6, -12), (7, -12),
-(7, 9)]]}, 2515: {'charcode': 2515, 'left': -11, 'right': 11, 'lines':
-[[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7,
-4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4), (8, 1),
-(8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1, -11),
-(-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8), (1,
-8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11), (-1,
--11)]]}, 2516: {'charcode': 2516, 'left': -10, 'right': 10, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (3,
--12), (5, -11), (6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (3, -1),
-(-5, -1)], [(-5, -11), (3, -11), (5, -10), (6, -8), (6, -5), (5, -3),
-(3, -2), (-5, -2)]]}, 2517: {'charcode': 2517, 'left': -11, 'right': 11,
-'lines': [[(-2, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8), (-2, 9), (2, 9), (4, 8), (6, 6), (7, 4),
-(8, 1), (8, -4), (7, -7), (6, -9), (4, -11), (2, -12), (-2, -12)], [(-1,
--11), (-4, -10), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-4, 7), (-1, 8),
-(1, 8), (4, 7), (6, 4), (7, 1), (7, -4), (6, -7), (4, -10), (1, -11),
-(-1, -11)], [(1, 6), (6, 11), (7, 11)], [(1, 6), (2, 6), (7, 11)]]},
-2518: {'charcode': 2518, 'left': -10, 'right': 10, 'lines': [[(-6, -12),
-(-6, 9)], [(-5, -11), (-5, 9), (-6, 9)], [(-6, -12), (2, -12), (5, -11),
-(6, -10), (7, -8), (7, -5), (6, -3), (5, -2), (2, -1), (-5, -1)], [(-5,
--11), (2, -11), (5, -10), (6, -8), (6, -5), (5, -3), (2, -2), (-5, -2)],
-[(0, -1), (6, 9), (7, 9)], [(1, -1), (7, 9)]]}, 2519: {'charcode': 2519,
-'left': -10, 'right': 10, 'lines': [[(7, -9), (5, -11), (2, -12), (-2,
--12), (-5, -11), (-7, -9), (-7, -7), (-6, -5), (-5, -4), (-3, -3), (2,
--1), (4, 0), (5, 1), (6, 3), (6, 6), (5, 7), (2, 8), (-2, 8), (-4, 7),
-(-5, 6), (-7, 6)], [(7, -9), (5, -9), (4, -10), (2, -11), (-2, -11),
-(-5, -10), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (2, -2), (4, -1),
-(6, 1), (7, 3), (7, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 6)]]},
-2520: {'charcode': 2520, 'left': -8, 'right': 9, 'lines': [[(0, -11),
-(0, 9)], [(1, -11), (1, 9), (0, 9)], [(-6, -12), (7, -12), (7, -11)],
-[(-6, -12), (-6, -11), (7, -11)]]}, 2521: {'charcode': 2521, 'left':
--11, 'right': 11, 'lines': [[(-7, -12), (-7, 3), (-6, 6), (-4, 8), (-1,
-9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -12)], [(-7, -12), (-6, -12),
-(-6, 3), (-5, 6), (-4, 7), (-1, 8), (1, 8), (4, 7), (5, 6), (6, 3),
-(6, -12), (7, -12)]]}, 2522: {'charcode': 2522, 'left': -10, 'right':
-10, 'lines': [[(-8, -12), (0, 9)], [(-8, -12), (-7, -12), (0, 6)], [(8,
--12), (7, -12), (0, 6)], [(8, -12), (0, 9)]]}, 2523: {'charcode': 2523,
-'left': -13, 'right': 13, 'lines': [[(-11, -12), (-5, 9)], [(-11, -12),
-(-10, -12), (-5, 6)], [(0, -12), (-5, 6)], [(0, -9), (-5, 9)], [(0, -9),
-(5, 9)], [(0, -12), (5, 6)], [(11, -12), (10, -12), (5, 6)], [(11, -12),
-(5, 9)]]}, 2524: {'charcode': 2524, 'left': -10, 'right': 10, 'lines':
-[[(-7, -12), (6, 9), (7, 9)], [(-7, -12), (-6, -12), (7, 9)], [(7, -12),
-(6, -12), (-7, 9)], [(7, -12), (-6, 9), (-7, 9)]]}, 2525: {'charcode':
-2525, 'left': -9, 'right': 10, 'lines': [[(-7, -12), (0, -2), (0, 9),
-(1, 9)], [(-7, -12), (-6, -12), (1, -2)], [(8, -12), (7, -12), (0, -2)],
-[(8, -12), (1, -2), (1, 9)]]}, 2526: {'charcode': 2526, 'left': -10,
-'right': 10, 'lines': [[(6, -12), (-7, 9)], [(7, -12), (-6, 9)], [(-7,
--12), (7, -12)], [(-7, -12), (-7, -11), (6, -11)], [(-6, 8), (7, 8),
-(7, 9)], [(-7, 9), (7, 9)]]}, 2551: {'charcode': 2551, 'left': -13,
-'right': 10, 'lines': [[(6, -12), (4, -10), (2, -7), (-1, -2), (-3, 1),
-(-6, 5), (-9, 8), (-11, 9), (-13, 9), (-14, 8), (-14, 6), (-13, 5), (-12,
-6), (-13, 7)], [(6, -12), (5, -8), (3, 2), (2, 9)], [(6, -12), (3, 9)],
-[(2, 9), (2, 7), (1, 4), (0, 2), (-2, 0), (-4, -1), (-6, -1), (-7, 0),
-(-7, 2), (-6, 5), (-3, 8), (0, 9), (4, 9), (6, 8)]]}, 2552: {'charcode':
-2552, 'left': -12, 'right': 12, 'lines': [[(3, -11), (2, -10), (1, -8),
-(-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1,
-1), (-2, 4), (-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6),
-(-10, 5), (-9, 6), (-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3),
-(-8, -4), (-8, -6), (-7, -8), (-5, -10), (-3, -11), (0, -12), (6, -12),
-(8, -11), (9, -9), (9, -7), (8, -5), (6, -4), (2, -3), (0, -3)], [(6,
--12), (7, -11), (8, -9), (8, -7), (7, -5), (6, -4)], [(2, -3), (5,
--2), (6, -1), (7, 1), (7, 4), (6, 7), (5, 8), (3, 9), (1, 9), (0, 8),
-(0, 6), (1, 3)], [(2, -3), (4, -2), (5, -1), (6, 1), (6, 4), (5, 7),
-(3, 9)]]}, 2553: {'charcode': 2553, 'left': -10, 'right': 11, 'lines':
-[[(-7, -10), (-8, -8), (-8, -6), (-7, -4), (-4, -3), (-1, -3), (3, -4),
-(5, -5), (7, -7), (8, -9), (8, -11), (7, -12), (5, -12), (2, -11), (-1,
--8), (-3, -5), (-5, -1), (-6, 3), (-6, 6), (-5, 8), (-2, 9), (0, 9),
-(3, 8), (5, 6), (6, 4), (6, 2), (5, 0), (3, 0), (1, 1), (0, 3)], [(5,
--12), (3, -11), (0, -8), (-2, -5), (-4, -1), (-5, 3), (-5, 6), (-4, 8),
-(-2, 9)]]}, 2554: {'charcode': 2554, 'left': -12, 'right': 11, 'lines':
-[[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3), (-4, 5), (-6, 8), (-8,
-9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3, 6), (-5, 8), (-8, 9),
-(-10, 9), (-11, 8), (-11, 6), (-10, 5), (-8, 5), (-6, 6), (-4, 8), (-2,
-9), (1, 9), (3, 8), (5, 6), (7, 2), (8, -3), (8, -6), (7, -9), (5, -11),
-(3, -12), (-2, -12), (-5, -11), (-7, -9), (-8, -7), (-8, -5), (-7, -4),
-(-5, -4), (-4, -5), (-3, -7)]]}, 2555: {'charcode': 2555, 'left': -9,
-'right': 10, 'lines': [[(5, -9), (4, -8), (4, -6), (5, -5), (7, -5),
-(8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (0, -11), (-1, -10),
-(-2, -8), (-2, -6), (-1, -4), (1, -3)], [(2, -12), (0, -10), (-1, -8),
-(-1, -5), (1, -3)], [(1, -3), (-1, -3), (-4, -2), (-6, 0), (-7, 2), (-7,
-5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6), (6, 4), (6, 2),
-(5, 0), (3, 0), (1, 1), (0, 3)], [(-1, -3), (-3, -2), (-5, 0), (-6, 2),
-(-6, 6), (-5, 8)]]}, 2556: {'charcode': 2556, 'left': -11, 'right':
-10, 'lines': [[(5, -10), (4, -8), (2, -3), (0, 3), (-1, 5), (-3, 8),
-(-5, 9)], [(-1, -6), (-2, -4), (-4, -3), (-6, -3), (-7, -5), (-7, -7),
-(-6, -9), (-4, -11), (-1, -12), (9, -12), (6, -11), (5, -10), (4, -7),
-(2, 1), (1, 4), (0, 6), (-2, 8), (-5, 9), (-7, 9), (-9, 8), (-10, 7),
-(-10, 6), (-9, 5), (-8, 6), (-9, 7)], [(1, -12), (5, -11), (6, -11)],
-[(-3, 1), (-2, 0), (0, -1), (4, -1), (6, -2), (8, -5), (6, 2)]]}, 2557:
-{'charcode': 2557, 'left': -11, 'right': 11, 'lines': [[(-8, -9), (-9,
--7), (-9, -5), (-8, -3), (-6, -2), (-3, -2), (0, -3), (2, -4), (5, -7),
-(6, -10), (6, -11), (5, -12), (4, -12), (2, -11), (0, -9), (-1, -7),
-(-2, -4), (-2, -1), (-1, 1), (1, 2), (3, 2), (5, 1), (7, -1), (8, -3)],
-[(5, -12), (3, -11), (1, -9), (0, -7), (-1, -4), (-1, 0), (1, 2)], [(8,
--3), (7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-6, 9), (-8, 8), (-9, 6),
-(-9, 5), (-8, 4), (-7, 5), (-8, 6)], [(7, 1), (5, 4), (3, 6), (0, 8),
-(-3, 9)]]}, 2558: {'charcode': 2558, 'left': -12, 'right': 12, 'lines':
-[[(-6, -6), (-7, -7), (-7, -9), (-6, -11), (-3, -12), (0, -12), (-3,
--1), (-5, 5), (-6, 7), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6),
-(-11, 5), (-10, 6), (-11, 7)], [(0, -12), (-3, -3), (-4, 0), (-6, 5),
-(-7, 7), (-9, 9)], [(-8, 2), (-7, 1), (-5, 0), (4, -3), (6, -4), (9,
--6), (11, -8), (12, -10), (12, -11), (11, -12), (10, -12), (8, -11),
-(6, -8), (5, -6), (3, 0), (2, 4), (2, 7), (4, 9), (5, 9), (7, 8), (9,
-6)], [(10, -12), (8, -10), (6, -6), (4, 0), (3, 4), (3, 7), (4, 9)]]},
-2559: {'charcode': 2559, 'left': -9, 'right': 7, 'lines': [[(5, -10),
-(3, -7), (1, -2), (-1, 3), (-2, 5), (-4, 8), (-6, 9)], [(7, -6), (5, -4),
-(2, -3), (-1, -3), (-3, -4), (-4, -6), (-4, -8), (-3, -10), (-1, -11),
-(3, -12), (7, -12), (5, -10), (4, -8), (2, -2), (0, 4), (-1, 6), (-3,
-8), (-6, 9), (-8, 9), (-9, 8), (-9, 6), (-8, 5), (-7, 6), (-8, 7)]]},
-2560: {'charcode': 2560, 'left': -9, 'right': 8, 'lines': [[(7, -12), (5,
--10), (3, -7), (1, -2), (-2, 7), (-4, 11)], [(7, -5), (5, -3), (2, -2),
-(-1, -2), (-3, -3), (-4, -5), (-4, -7), (-3, -9), (-1, -11), (3, -12),
-(7, -12), (5, -9), (4, -7), (1, 2), (-1, 6), (-2, 8), (-4, 11), (-5,
-12), (-7, 13), (-8, 12), (-8, 10), (-7, 8), (-5, 6), (-3, 5), (0, 4),
-(4, 3)]]}, 2561: {'charcode': 2561, 'left': -12, 'right': 12, 'lines':
-[[(-6, -6), (-7, -7), (-7, -9), (-5, -11), (-2, -12), (0, -12), (-3, -1),
-(-5, 5), (-6, 7), (-7, 8), (-9, 9), (-11, 9), (-12, 8), (-12, 6), (-11,
-5), (-10, 6), (-11, 7)], [(0, -12), (-3, -3), (-4, 0), (-6, 5), (-7, 7),
-(-9, 9)], [(8, -11), (5, -7), (3, -5), (1, -4), (-2, -3)], [(11, -11),
-(10, -10), (11, -9), (12, -10), (12, -11), (11, -12), (10, -12), (8,
--11), (5, -6), (4, -5), (2, -4), (-2, -3)], [(-2, -3), (1, -2), (2, 0),
-(3, 7), (4, 9)], [(-2, -3), (0, -2), (1, 0), (2, 7), (4, 9), (5, 9),
-(7, 8), (9, 6)]]}, 2562: {'charcode': 2562, 'left': -9, 'right': 9,
-'lines': [[(-5, -9), (-6, -7), (-6, -5), (-5, -3), (-3, -2), (0, -2),
-(3, -3), (5, -4), (8, -7), (9, -10), (9, -11), (8, -12), (7, -12), (5,
--11), (4, -10), (2, -7), (-2, 3), (-3, 5), (-5, 8), (-7, 9)], [(4, -10),
-(2, -6), (0, 1), (-1, 4), (-2, 6), (-4, 8), (-7, 9), (-9, 9), (-10, 8),
-(-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (0, 9), (3, 9), (5, 8), (7,
-6)]]}, 2563: {'charcode': 2563, 'left': -14, 'right': 14, 'lines': [[(0,
--12), (-4, -3), (-7, 3), (-9, 6), (-11, 8), (-13, 9), (-15, 9), (-16, 8),
-(-16, 6), (-15, 5), (-14, 6), (-15, 7)], [(0, -12), (-2, -5), (-3, -1),
-(-4, 4), (-4, 8), (-2, 9)], [(0, -12), (-1, -8), (-2, -3), (-3, 4), (-3,
-8), (-2, 9)], [(9, -12), (5, -3), (0, 6), (-2, 9)], [(9, -12), (7, -5),
-(6, -1), (5, 4), (5, 8), (7, 9), (8, 9), (10, 8), (12, 6)], [(9, -12),
-(8, -8), (7, -3), (6, 4), (6, 8), (7, 9)]]}, 2564: {'charcode': 2564,
-'left': -11, 'right': 12, 'lines': [[(0, -12), (-1, -8), (-3, -2), (-5,
-3), (-6, 5), (-8, 8), (-10, 9), (-12, 9), (-13, 8), (-13, 6), (-12, 5),
-(-11, 6), (-12, 7)], [(0, -12), (0, -7), (1, 4), (2, 9)], [(0, -12),
-(1, -7), (2, 4), (2, 9)], [(14, -11), (13, -10), (14, -9), (15, -10),
-(15, -11), (14, -12), (12, -12), (10, -11), (8, -8), (7, -6), (5, -1),
-(3, 5), (2, 9)]]}, 2565: {'charcode': 2565, 'left': -10, 'right': 11,
-'lines': [[(1, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -4), (-7, 0),
-(-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7,
-1), (8, -3), (8, -7), (7, -10), (6, -11), (5, -11), (3, -10), (1, -8),
-(-1, -4), (-2, 1), (-2, 4)], [(-1, -11), (-3, -8), (-5, -4), (-6, 0),
-(-6, 4), (-5, 7), (-3, 9)]]}, 2566: {'charcode': 2566, 'left': -12,
-'right': 11, 'lines': [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3,
-3), (-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4),
-(-3, 6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5),
-(-9, 6), (-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3), (-8, -4),
-(-8, -6), (-7, -8), (-5, -10), (-3, -11), (0, -12), (4, -12), (7, -11),
-(8, -10), (9, -8), (9, -5), (8, -3), (7, -2), (4, -1), (2, -1), (0, -2)],
-[(4, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2), (4,
--1)]]}, 2567: {'charcode': 2567, 'left': -10, 'right': 11, 'lines':
-[[(3, -8), (3, -6), (2, -4), (1, -3), (-1, -2), (-3, -2), (-4, -4),
-(-4, -6), (-3, -9), (-1, -11), (2, -12), (5, -12), (7, -11), (8, -9),
-(8, -5), (7, -2), (5, 1), (1, 5), (-2, 7), (-4, 8), (-7, 9), (-9, 9),
-(-10, 8), (-10, 6), (-9, 5), (-7, 5), (-5, 6), (-2, 8), (1, 9), (4, 9),
-(6, 8), (8, 6)], [(5, -12), (6, -11), (7, -9), (7, -5), (6, -2), (4,
-1), (1, 4), (-3, 7), (-7, 9)]]}, 2568: {'charcode': 2568, 'left': -12,
-'right': 12, 'lines': [[(3, -11), (2, -10), (1, -8), (-1, -3), (-3, 3),
-(-4, 5), (-6, 8), (-8, 9)], [(2, -10), (1, -7), (-1, 1), (-2, 4), (-3,
-6), (-5, 8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6),
-(-10, 7)], [(-3, -6), (-4, -4), (-5, -3), (-7, -3), (-8, -4), (-8, -6),
-(-7, -8), (-5, -10), (-3, -11), (0, -12), (5, -12), (8, -11), (9, -9),
-(9, -7), (8, -5), (7, -4), (4, -3), (0, -3)], [(5, -12), (7, -11), (8,
--9), (8, -7), (7, -5), (6, -4), (4, -3)], [(0, -3), (3, -2), (4, 0), (5,
-7), (6, 9)], [(0, -3), (2, -2), (3, 0), (4, 7), (6, 9), (7, 9), (9, 8),
-(11, 6)]]}, 2569: {'charcode': 2569, 'left': -10, 'right': 10, 'lines':
-[[(-4, -9), (-5, -7), (-5, -5), (-4, -3), (-2, -2), (1, -2), (4, -3),
-(6, -4), (9, -7), (10, -10), (10, -11), (9, -12), (8, -12), (6, -11),
-(5, -10), (4, -8), (3, -5), (1, 2), (0, 5), (-2, 8), (-4, 9)], [(4, -8),
-(3, -4), (2, 3), (1, 6), (-1, 8), (-4, 9), (-7, 9), (-9, 8), (-10, 6),
-(-10, 5), (-9, 4), (-8, 5), (-9, 6)]]}, 2570: {'charcode': 2570, 'left':
--9, 'right': 9, 'lines': [[(7, -10), (6, -8), (4, -3), (2, 3), (1, 5),
-(-1, 8), (-3, 9)], [(1, -6), (0, -4), (-2, -3), (-4, -3), (-5, -5), (-5,
--7), (-4, -9), (-2, -11), (1, -12), (10, -12), (8, -11), (7, -10), (6,
--7), (4, 1), (3, 4), (2, 6), (0, 8), (-3, 9), (-5, 9), (-7, 8), (-8, 7),
-(-8, 6), (-7, 5), (-6, 6), (-7, 7)], [(3, -12), (7, -11), (8, -11)]]},
-2571: {'charcode': 2571, 'left': -11, 'right': 11, 'lines': [[(-10,
--8), (-8, -11), (-6, -12), (-5, -12), (-3, -10), (-3, -7), (-4, -4),
-(-7, 4), (-7, 7), (-6, 9)], [(-5, -12), (-4, -10), (-4, -7), (-7, 1),
-(-8, 4), (-8, 7), (-6, 9), (-4, 9), (-2, 8), (1, 5), (3, 2), (4, 0)],
-[(8, -12), (4, 0), (3, 4), (3, 7), (5, 9), (6, 9), (8, 8), (10, 6)],
-[(9, -12), (5, 0), (4, 4), (4, 7), (5, 9)]]}, 2572: {'charcode': 2572,
-'left': -11, 'right': 10, 'lines': [[(-10, -8), (-8, -11), (-6, -12),
-(-5, -12), (-3, -10), (-3, -7), (-4, -3), (-6, 4), (-6, 7), (-5, 9)],
-[(-5, -12), (-4, -10), (-4, -7), (-6, 0), (-7, 4), (-7, 7), (-5, 9),
-(-4, 9), (-1, 8), (2, 5), (4, 2), (6, -2), (7, -5), (8, -9), (8, -11),
-(7, -12), (6, -12), (5, -11), (4, -9), (4, -6), (5, -4), (7, -2), (9,
--1), (11, -1)]]}, 2573: {'charcode': 2573, 'left': -12, 'right': 11,
-'lines': [[(-9, -6), (-10, -6), (-11, -7), (-11, -9), (-10, -11), (-8,
--12), (-4, -12), (-5, -10), (-6, -6), (-7, 3), (-8, 9)], [(-6, -6),
-(-6, 3), (-7, 9)], [(4, -12), (2, -10), (0, -6), (-3, 3), (-5, 7),
-(-7, 9)], [(4, -12), (3, -10), (2, -6), (1, 3), (0, 9)], [(2, -6), (2,
-3), (1, 9)], [(14, -12), (12, -11), (10, -9), (8, -6), (5, 3), (3, 7),
-(1, 9)]]}, 2574: {'charcode': 2574, 'left': -10, 'right': 10, 'lines':
-[[(-2, -7), (-3, -6), (-5, -6), (-6, -7), (-6, -9), (-5, -11), (-3, -12),
-(-1, -12), (1, -11), (2, -9), (2, -6), (1, -2), (-1, 3), (-3, 6), (-5,
-8), (-8, 9), (-10, 9), (-11, 8), (-11, 6), (-10, 5), (-9, 6), (-10, 7)],
-[(-1, -12), (0, -11), (1, -9), (1, -6), (0, -2), (-2, 3), (-4, 6), (-6,
-8), (-8, 9)], [(11, -11), (10, -10), (11, -9), (12, -10), (12, -11),
-(11, -12), (9, -12), (7, -11), (5, -9), (3, -6), (1, -2), (0, 3), (0,
-6), (1, 8), (2, 9), (3, 9), (5, 8), (7, 6)]]}, 2575: {'charcode': 2575,
-'left': -11, 'right': 11, 'lines': [[(-8, -8), (-6, -11), (-4, -12),
-(-3, -12), (-1, -11), (-1, -9), (-3, -3), (-3, 0), (-2, 2)], [(-3, -12),
-(-2, -11), (-2, -9), (-4, -3), (-4, 0), (-2, 2), (0, 2), (3, 1), (5, -1),
-(7, -4), (8, -6)], [(10, -12), (8, -6), (5, 2), (3, 6)], [(11, -12),
-(9, -6), (7, -1), (5, 3), (3, 6), (1, 8), (-2, 9), (-6, 9), (-8, 8),
-(-9, 6), (-9, 5), (-8, 4), (-7, 5), (-8, 6)]]}, 2576: {'charcode': 2576,
-'left': -11, 'right': 10, 'lines': [[(8, -10), (7, -8), (5, -3), (4, 0),
-(3, 2), (1, 5), (-1, 7), (-3, 8), (-6, 9)], [(1, -6), (0, -4), (-2, -3),
-(-4, -3), (-5, -5), (-5, -7), (-4, -9), (-2, -11), (1, -12), (11, -12),
-(9, -11), (8, -10), (7, -7), (6, -3), (4, 3), (2, 6), (-1, 8), (-6, 9),
-(-10, 9), (-11, 8), (-11, 6), (-10, 5), (-8, 5), (-6, 6), (-3, 8), (-1,
-9), (2, 9), (5, 8), (7, 6)], [(4, -12), (8, -11), (9, -11)]]}, 2601:
-{'charcode': 2601, 'left': -10, 'right': 10, 'lines': [[(5, -5), (5, 9),
-(6, 9)], [(5, -5), (6, -5), (6, 9)], [(5, -2), (3, -4), (1, -5), (-2, -5),
-(-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9),
-(3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1),
-(-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]}, 2602: {'charcode':
-2602, 'left': -10, 'right': 10, 'lines': [[(-6, -12), (-6, 9), (-5, 9)],
-[(-6, -12), (-5, -12), (-5, 9)], [(-5, -2), (-3, -4), (-1, -5), (2, -5),
-(4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (2, 9), (-1, 9), (-3,
-8), (-5, 6)], [(-5, -2), (-1, -4), (2, -4), (4, -3), (5, -2), (6, 1), (6,
-3), (5, 6), (4, 7), (2, 8), (-1, 8), (-5, 6)]]}, 2603: {'charcode': 2603,
-'left': -9, 'right': 9, 'lines': [[(6, -2), (4, -4), (2, -5), (-1, -5),
-(-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9),
-(4, 8), (6, 6)], [(6, -2), (5, -1), (4, -3), (2, -4), (-1, -4), (-3, -3),
-(-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8), (4, 7),
-(5, 5), (6, 6)]]}, 2604: {'charcode': 2604, 'left': -10, 'right': 10,
-'lines': [[(5, -12), (5, 9), (6, 9)], [(5, -12), (6, -12), (6, 9)], [(5,
--2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3),
-(-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4),
-(-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2,
-8), (1, 8), (5, 6)]]}, 2605: {'charcode': 2605, 'left': -9, 'right': 9,
-'lines': [[(-5, 2), (6, 2), (6, -1), (5, -3), (4, -4), (2, -5), (-1, -5),
-(-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9),
-(4, 8), (6, 6)], [(-5, 1), (5, 1), (5, -1), (4, -3), (2, -4), (-1, -4),
-(-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1, 8), (2, 8),
-(4, 7), (5, 5), (6, 6)]]}, 2606: {'charcode': 2606, 'left': -6, 'right':
-8, 'lines': [[(5, -12), (3, -12), (1, -11), (0, -8), (0, 9), (1, 9)],
-[(5, -12), (5, -11), (3, -11), (1, -10)], [(2, -11), (1, -8), (1, 9)],
-[(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4), (4, -4)]]}, 2607:
-{'charcode': 2607, 'left': -10, 'right': 10, 'lines': [[(6, -5), (5, -5),
-(5, 10), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-4, 13), (-6,
-13)], [(6, -5), (6, 10), (5, 13), (3, 15), (1, 16), (-2, 16), (-4, 15),
-(-6, 13)], [(5, -2), (3, -4), (1, -5), (-2, -5), (-4, -4), (-6, -2),
-(-7, 1), (-7, 3), (-6, 6), (-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)],
-[(5, -2), (1, -4), (-2, -4), (-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5,
-6), (-4, 7), (-2, 8), (1, 8), (5, 6)]]}, 2608: {'charcode': 2608, 'left':
--10, 'right': 10, 'lines': [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12),
-(-5, -12), (-5, 9)], [(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4),
-(6, -1), (6, 9)], [(-5, -1), (-2, -3), (0, -4), (2, -4), (4, -3), (5,
--1), (5, 9), (6, 9)]]}, 2609: {'charcode': 2609, 'left': -4, 'right': 5,
-'lines': [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1, -9), (2, -10),
-(2, -11), (1, -12), (0, -12)], [(0, -11), (0, -10), (1, -10), (1, -11),
-(0, -11)], [(0, -5), (0, 9), (1, 9)], [(0, -5), (1, -5), (1, 9)]]}, 2610:
-{'charcode': 2610, 'left': -4, 'right': 5, 'lines': [[(0, -12), (-1, -11),
-(-1, -10), (0, -9), (1, -9), (2, -10), (2, -11), (1, -12), (0, -12)],
-[(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)], [(0, -5), (0, 16),
-(1, 16)], [(0, -5), (1, -5), (1, 16)]]}, 2611: {'charcode': 2611, 'left':
--10, 'right': 9, 'lines': [[(-6, -12), (-6, 9), (-5, 9)], [(-6, -12),
-(-5, -12), (-5, 9)], [(6, -5), (5, -5), (-5, 5)], [(6, -5), (-5, 6)],
-[(-2, 2), (4, 9), (6, 9)], [(-1, 1), (6, 9)]]}, 2612: {'charcode': 2612,
-'left': -4, 'right': 5, 'lines': [[(0, -12), (0, 9), (1, 9)], [(0, -12),
-(1, -12), (1, 9)]]}, 2613: {'charcode': 2613, 'left': -15, 'right': 16,
-'lines': [[(-11, -5), (-11, 9), (-10, 9)], [(-11, -5), (-10, -5),
-(-10, 9)], [(-10, -1), (-7, -4), (-5, -5), (-2, -5), (0, -4), (1, -1),
-(1, 9)], [(-10, -1), (-7, -3), (-5, -4), (-3, -4), (-1, -3), (0, -1),
-(0, 9), (1, 9)], [(1, -1), (4, -4), (6, -5), (9, -5), (11, -4), (12,
--1), (12, 9)], [(1, -1), (4, -3), (6, -4), (8, -4), (10, -3), (11, -1),
-(11, 9), (12, 9)]]}, 2614: {'charcode': 2614, 'left': -10, 'right': 10,
-'lines': [[(-6, -5), (-6, 9), (-5, 9)], [(-6, -5), (-5, -5), (-5, 9)],
-[(-5, -1), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -1), (6, 9)], [(-5,
--1), (-2, -3), (0, -4), (2, -4), (4, -3), (5, -1), (5, 9), (6, 9)]]},
-2615: {'charcode': 2615, 'left': -9, 'right': 10, 'lines': [[(-1, -5),
-(-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9), (2, 9),
-(4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (2, -5), (-1, -5)],
-[(-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 3), (-4, 6), (-3, 7), (-1,
-8), (2, 8), (4, 7), (5, 6), (6, 3), (6, 1), (5, -2), (4, -3), (2, -4),
-(-1, -4)]]}, 2616: {'charcode': 2616, 'left': -10, 'right': 10, 'lines':
-[[(-6, -5), (-6, 16), (-5, 16)], [(-6, -5), (-5, -5), (-5, 16)], [(-5,
--2), (-3, -4), (-1, -5), (2, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6,
-6), (4, 8), (2, 9), (-1, 9), (-3, 8), (-5, 6)], [(-5, -2), (-1, -4), (2,
--4), (4, -3), (5, -2), (6, 1), (6, 3), (5, 6), (4, 7), (2, 8), (-1, 8),
-(-5, 6)]]}, 2617: {'charcode': 2617, 'left': -10, 'right': 10, 'lines':
-[[(5, -5), (5, 16), (6, 16)], [(5, -5), (6, -5), (6, 16)], [(5, -2), (3,
--4), (1, -5), (-2, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6),
-(-4, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(5, -2), (1, -4), (-2, -4),
-(-4, -3), (-5, -2), (-6, 1), (-6, 3), (-5, 6), (-4, 7), (-2, 8), (1, 8),
-(5, 6)]]}, 2618: {'charcode': 2618, 'left': -7, 'right': 7, 'lines':
-[[(-3, -5), (-3, 9), (-2, 9)], [(-3, -5), (-2, -5), (-2, 9)], [(-2, 1),
-(-1, -2), (1, -4), (3, -5), (6, -5)], [(-2, 1), (-1, -1), (1, -3), (3,
--4), (6, -4), (6, -5)]]}, 2619: {'charcode': 2619, 'left': -8, 'right':
-9, 'lines': [[(6, -2), (5, -4), (2, -5), (-1, -5), (-4, -4), (-5, -2),
-(-4, 0), (-2, 1), (3, 3), (5, 4)], [(4, 3), (5, 5), (5, 6), (4, 8)], [(5,
-7), (2, 8), (-1, 8), (-4, 7)], [(-3, 8), (-4, 6), (-5, 6)], [(6, -2),
-(5, -2), (4, -4)], [(5, -3), (2, -4), (-1, -4), (-4, -3)], [(-3, -4),
-(-4, -2), (-3, 0)], [(-4, -1), (-2, 0), (3, 2), (5, 3), (6, 5), (6, 6),
-(5, 8), (2, 9), (-1, 9), (-4, 8), (-5, 6)]]}, 2620: {'charcode': 2620,
-'left': -5, 'right': 6, 'lines': [[(0, -12), (0, 9), (1, 9)], [(0, -12),
-(1, -12), (1, 9)], [(-3, -5), (4, -5), (4, -4)], [(-3, -5), (-3, -4),
-(4, -4)]]}, 2621: {'charcode': 2621, 'left': -10, 'right': 10, 'lines':
-[[(-6, -5), (-6, 5), (-5, 8), (-3, 9), (0, 9), (2, 8), (5, 5)], [(-6, -5),
-(-5, -5), (-5, 5), (-4, 7), (-2, 8), (0, 8), (2, 7), (5, 5)], [(5, -5),
-(5, 9), (6, 9)], [(5, -5), (6, -5), (6, 9)]]}, 2622: {'charcode': 2622,
-'left': -8, 'right': 8, 'lines': [[(-6, -5), (0, 9)], [(-6, -5), (-5,
--5), (0, 7)], [(6, -5), (5, -5), (0, 7)], [(6, -5), (0, 9)]]}, 2623:
-{'charcode': 2623, 'left': -12, 'right': 12, 'lines': [[(-9, -5), (-4,
-9)], [(-9, -5), (-8, -5), (-4, 6)], [(0, -5), (-4, 6)], [(0, -2), (-4,
-9)], [(0, -2), (4, 9)], [(0, -5), (4, 6)], [(9, -5), (8, -5), (4, 6)],
-[(9, -5), (4, 9)]]}, 2624: {'charcode': 2624, 'left': -9, 'right': 9,
-'lines': [[(-6, -5), (5, 9), (6, 9)], [(-6, -5), (-5, -5), (6, 9)], [(6,
--5), (5, -5), (-6, 9)], [(6, -5), (-5, 9), (-6, 9)]]}, 2625: {'charcode':
-2625, 'left': -8, 'right': 8, 'lines': [[(-6, -5), (0, 9)], [(-6, -5),
-(-5, -5), (0, 7)], [(6, -5), (5, -5), (0, 7), (-4, 16)], [(6, -5), (0, 9),
-(-3, 16), (-4, 16)]]}, 2626: {'charcode': 2626, 'left': -9, 'right': 9,
-'lines': [[(4, -4), (-6, 9)], [(6, -5), (-4, 8)], [(-6, -5), (6, -5)],
-[(-6, -5), (-6, -4), (4, -4)], [(-4, 8), (6, 8), (6, 9)], [(-6, 9),
-(6, 9)]]}, 2651: {'charcode': 2651, 'left': -7, 'right': 9, 'lines':
-[[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6),
-(-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4, 2), (-5, 4),
-(-5, 7), (-3, 9)], [(4, 0), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9,
-4)], [(5, 0), (3, 6), (3, 8), (4, 9)]]}, 2652: {'charcode': 2652, 'left':
--6, 'right': 8, 'lines': [[(-6, 4), (-4, 1), (-2, -3)], [(1, -12), (-5,
-6), (-5, 8), (-3, 9), (-2, 9), (0, 8), (2, 6), (3, 3), (3, 0), (4, 4),
-(5, 5), (6, 5), (8, 4)], [(2, -12), (-4, 6), (-4, 8), (-3, 9)]]}, 2653:
-{'charcode': 2653, 'left': -6, 'right': 6, 'lines': [[(2, 1), (1, 2), (2,
-2), (2, 1), (1, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8),
-(-2, 9), (1, 9), (4, 7), (6, 4)], [(-1, 0), (-3, 2), (-4, 4), (-4, 7),
-(-2, 9)]]}, 2654: {'charcode': 2654, 'left': -7, 'right': 9, 'lines':
-[[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6),
-(-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4, 2), (-5, 4),
-(-5, 7), (-3, 9)], [(8, -12), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7),
-(9, 4)], [(9, -12), (3, 6), (3, 8), (4, 9)]]}, 2655: {'charcode': 2655,
-'left': -6, 'right': 6, 'lines': [[(-3, 7), (-1, 6), (0, 5), (1, 3),
-(1, 1), (0, 0), (-1, 0), (-3, 1), (-4, 2), (-5, 4), (-5, 6), (-4, 8),
-(-2, 9), (1, 9), (4, 7), (6, 4)], [(-1, 0), (-3, 2), (-4, 4), (-4, 7),
-(-2, 9)]]}, 2656: {'charcode': 2656, 'left': -3, 'right': 6, 'lines':
-[[(0, 0), (3, -3), (5, -6), (6, -9), (6, -11), (5, -12), (3, -11), (2,
--9), (-7, 18), (-7, 20), (-6, 21), (-4, 20), (-3, 17), (-2, 8), (-1, 9),
-(1, 9), (3, 8), (4, 7), (6, 4)], [(2, -9), (1, -4), (0, 0), (-3, 9),
-(-5, 14), (-7, 18)]]}, 2657: {'charcode': 2657, 'left': -7, 'right': 9,
-'lines': [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4),
-(-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (2, 6)], [(-2, 0), (-4,
-2), (-5, 4), (-5, 7), (-3, 9)], [(4, 0), (-2, 18)], [(5, 0), (2, 9),
-(0, 14), (-2, 18), (-3, 20), (-5, 21), (-6, 20), (-6, 18), (-5, 15),
-(-3, 13), (0, 11), (4, 9), (7, 7), (9, 4)]]}, 2658: {'charcode': 2658,
-'left': -6, 'right': 9, 'lines': [[(-6, 4), (-4, 1), (-2, -3)], [(1,
--12), (-6, 9)], [(2, -12), (-5, 9)], [(-3, 3), (-1, 1), (1, 0), (2,
-0), (4, 1), (4, 3), (3, 6), (3, 8), (4, 9)], [(2, 0), (3, 1), (3, 3),
-(2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)]]}, 2659: {'charcode':
-2659, 'left': -4, 'right': 4, 'lines': [[(1, -6), (0, -5), (1, -4),
-(2, -5), (1, -6)], [(-1, 0), (-3, 6), (-3, 8), (-1, 9), (1, 8), (2, 7),
-(4, 4)], [(0, 0), (-2, 6), (-2, 8), (-1, 9)]]}, 2660: {'charcode': 2660,
-'left': -4, 'right': 4, 'lines': [[(1, -6), (0, -5), (1, -4), (2, -5),
-(1, -6)], [(-1, 0), (-7, 18)], [(0, 0), (-3, 9), (-5, 14), (-7, 18),
-(-8, 20), (-10, 21), (-11, 20), (-11, 18), (-10, 15), (-8, 13), (-5,
-11), (-1, 9), (2, 7), (4, 4)]]}, 2661: {'charcode': 2661, 'left': -6,
-'right': 8, 'lines': [[(-6, 4), (-4, 1), (-2, -3)], [(1, -12), (-6, 9)],
-[(2, -12), (-5, 9)], [(3, 0), (3, 1), (4, 1), (3, 0), (2, 0), (0, 2),
-(-3, 3)], [(-3, 3), (0, 4), (1, 8), (2, 9)], [(-3, 3), (-1, 4), (0, 8),
-(2, 9), (3, 9), (6, 7), (8, 4)]]}, 2662: {'charcode': 2662, 'left': -4,
-'right': 4, 'lines': [[(-4, 4), (-2, 1), (0, -3)], [(3, -12), (-3, 6),
-(-3, 8), (-1, 9), (1, 8), (2, 7), (4, 4)], [(4, -12), (-2, 6), (-2, 8),
-(-1, 9)]]}, 2663: {'charcode': 2663, 'left': -13, 'right': 12, 'lines':
-[[(-13, 4), (-11, 1), (-9, 0), (-7, 1), (-7, 3), (-9, 9)], [(-9, 0),
-(-8, 1), (-8, 3), (-10, 9)], [(-7, 3), (-5, 1), (-3, 0), (-2, 0), (0, 1),
-(0, 3), (-2, 9)], [(-2, 0), (-1, 1), (-1, 3), (-3, 9)], [(0, 3), (2, 1),
-(4, 0), (5, 0), (7, 1), (7, 3), (6, 6), (6, 8), (7, 9)], [(5, 0), (6,
-1), (6, 3), (5, 6), (5, 8), (7, 9), (9, 8), (10, 7), (12, 4)]]}, 2664:
-{'charcode': 2664, 'left': -9, 'right': 9, 'lines': [[(-9, 4), (-7, 1),
-(-5, 0), (-3, 1), (-3, 3), (-5, 9)], [(-5, 0), (-4, 1), (-4, 3), (-6,
-9)], [(-3, 3), (-1, 1), (1, 0), (2, 0), (4, 1), (4, 3), (3, 6), (3, 8),
-(4, 9)], [(2, 0), (3, 1), (3, 3), (2, 6), (2, 8), (4, 9), (6, 8), (7,
-7), (9, 4)]]}, 2665: {'charcode': 2665, 'left': -7, 'right': 7, 'lines':
-[[(0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4), (-6, 6), (-5, 8), (-3, 9),
-(-1, 9), (1, 8), (2, 7), (3, 5), (3, 3), (2, 1), (0, 0), (-1, 1), (-1,
-3), (0, 5), (2, 6), (4, 6), (6, 5), (7, 4)], [(-2, 0), (-4, 2), (-5, 4),
-(-5, 7), (-3, 9)]]}, 2666: {'charcode': 2666, 'left': -6, 'right': 9,
-'lines': [[(-6, 4), (-4, 1), (-2, -3)], [(-1, -6), (-10, 21)], [(0, -6),
-(-9, 21)], [(-3, 3), (-1, 1), (1, 0), (2, 0), (4, 1), (4, 3), (3, 6),
-(3, 8), (4, 9)], [(2, 0), (3, 1), (3, 3), (2, 6), (2, 8), (4, 9), (6,
-8), (7, 7), (9, 4)]]}, 2667: {'charcode': 2667, 'left': -7, 'right': 9,
-'lines': [[(3, 3), (2, 1), (0, 0), (-2, 0), (-4, 1), (-5, 2), (-6, 4),
-(-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8)], [(-2, 0), (-4, 2), (-5,
-4), (-5, 7), (-3, 9)], [(4, 0), (-2, 18), (-2, 20), (-1, 21), (1, 20),
-(2, 17), (2, 9), (4, 9), (7, 7), (9, 4)], [(5, 0), (2, 9), (0, 14),
-(-2, 18)]]}, 2668: {'charcode': 2668, 'left': -6, 'right': 8, 'lines':
-[[(-6, 4), (-4, 1), (-2, 0), (0, 1), (0, 3), (-2, 9)], [(-2, 0), (-1, 1),
-(-1, 3), (-3, 9)], [(0, 3), (2, 1), (4, 0), (5, 0), (4, 3)], [(4, 0),
-(4, 3), (5, 5), (6, 5), (8, 4)]]}, 2669: {'charcode': 2669, 'left': -4,
-'right': 8, 'lines': [[(-4, 4), (-2, 1), (-1, -1), (-1, 1), (2, 3), (3,
-5), (3, 7), (2, 8), (0, 9)], [(-1, 1), (1, 3), (2, 5), (2, 7), (0, 9)],
-[(-4, 8), (-2, 9), (3, 9), (6, 7), (8, 4)]]}, 2670: {'charcode': 2670,
-'left': -4, 'right': 4, 'lines': [[(-4, 4), (-2, 1), (0, -3)], [(3, -12),
-(-3, 6), (-3, 8), (-1, 9), (1, 8), (2, 7), (4, 4)], [(4, -12), (-2,
-6), (-2, 8), (-1, 9)], [(-2, -4), (4, -4)]]}, 2671: {'charcode': 2671,
-'left': -7, 'right': 9, 'lines': [[(-4, 0), (-6, 6), (-6, 8), (-4, 9),
-(-3, 9), (-1, 8), (1, 6), (3, 3)], [(-3, 0), (-5, 6), (-5, 8), (-4, 9)],
-[(4, 0), (2, 6), (2, 8), (4, 9), (6, 8), (7, 7), (9, 4)], [(5, 0), (3,
-6), (3, 8), (4, 9)]]}, 2672: {'charcode': 2672, 'left': -7, 'right': 8,
-'lines': [[(-4, 0), (-5, 2), (-6, 5), (-6, 8), (-4, 9), (-3, 9), (0, 8),
-(2, 6), (3, 3), (3, 0)], [(-3, 0), (-4, 2), (-5, 5), (-5, 8), (-4, 9)],
-[(3, 0), (4, 4), (5, 5), (6, 5), (8, 4)]]}, 2673: {'charcode': 2673,
-'left': -10, 'right': 11, 'lines': [[(-6, 0), (-8, 2), (-9, 5), (-9, 8),
-(-7, 9), (-6, 9), (-4, 8), (-2, 6)], [(-5, 0), (-7, 2), (-8, 5), (-8,
-8), (-7, 9)], [(0, 0), (-2, 6), (-2, 8), (0, 9), (1, 9), (3, 8), (5, 6),
-(6, 3), (6, 0)], [(1, 0), (-1, 6), (-1, 8), (0, 9)], [(6, 0), (7, 4), (8,
-5), (9, 5), (11, 4)]]}, 2674: {'charcode': 2674, 'left': -8, 'right': 8,
-'lines': [[(-8, 4), (-6, 1), (-4, 0), (-2, 0), (-1, 1), (-1, 3), (-2, 6),
-(-3, 8), (-5, 9), (-6, 9), (-7, 8), (-7, 7), (-6, 7), (-7, 8)], [(5,
-1), (4, 2), (5, 2), (5, 1), (4, 0), (3, 0), (1, 1), (0, 3), (-1, 6),
-(-1, 8), (0, 9), (3, 9), (6, 7), (8, 4)], [(-1, 1), (0, 3)], [(1, 1),
-(-1, 3)], [(-2, 6), (-1, 8)], [(-1, 6), (-3, 8)]]}, 2675: {'charcode':
-2675, 'left': -7, 'right': 9, 'lines': [[(-4, 0), (-6, 6), (-6, 8),
-(-4, 9), (-3, 9), (-1, 8), (1, 6), (3, 3)], [(-3, 0), (-5, 6), (-5, 8),
-(-4, 9)], [(4, 0), (-2, 18)], [(5, 0), (2, 9), (0, 14), (-2, 18), (-3,
-20), (-5, 21), (-6, 20), (-6, 18), (-5, 15), (-3, 13), (0, 11), (4, 9),
-(7, 7), (9, 4)]]}, 2676: {'charcode': 2676, 'left': -6, 'right': 7,
-'lines': [[(-6, 4), (-4, 1), (-2, 0), (0, 0), (2, 1), (2, 4), (1, 6),
-(-2, 8), (-4, 9)], [(0, 0), (1, 1), (1, 4), (0, 6), (-2, 8)], [(-4, 9),
-(-2, 10), (-1, 12), (-1, 15), (-2, 18), (-4, 20), (-6, 21), (-7, 20),
-(-7, 18), (-6, 15), (-3, 12), (0, 10), (4, 7), (7, 4)], [(-4, 9), (-3,
-10), (-2, 12), (-2, 15), (-3, 18), (-4, 20)]]}, 2697: {'charcode':
-2697, 'left': 0, 'right': 0, 'lines': [[]]}, 2698: {'charcode': 2698,
-'left': -4, 'right': 4, 'lines': [[]]}, 2699: {'charcode': 2699, 'left':
--8, 'right': 8, 'lines': [[]]}, 2700: {'charcode': 2700, 'left': -10,
-'right': 10, 'lines': [[(-1, -12), (-4, -11), (-6, -8), (-7, -3), (-7,
-0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0), (7, -3),
-(6, -8), (4, -11), (1, -12), (-1, -12)], [(-3, -11), (-5, -8), (-6, -3),
-(-6, 0), (-5, 5), (-3, 8)], [(-4, 7), (-1, 8), (1, 8), (4, 7)], [(3, 8),
-(5, 5), (6, 0), (6, -3), (5, -8), (3, -11)], [(4, -10), (1, -11), (-1,
--11), (-4, -10)]]}, 2701: {'charcode': 2701, 'left': -10, 'right': 10,
-'lines': [[(-4, -8), (-2, -9), (1, -12), (1, 9)], [(-4, -8), (-4, -7),
-(-2, -8), (0, -10), (0, 9), (1, 9)]]}, 2702: {'charcode': 2702, 'left':
--10, 'right': 10, 'lines': [[(-6, -7), (-6, -8), (-5, -10), (-4, -11),
-(-2, -12), (2, -12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3,
--1), (-6, 9)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-2, -11), (2,
--11), (4, -10), (5, -8), (5, -6), (4, -4), (2, -1), (-7, 9)], [(-6, 8),
-(7, 8), (7, 9)], [(-7, 9), (7, 9)]]}, 2703: {'charcode': 2703, 'left':
--10, 'right': 10, 'lines': [[(-5, -12), (6, -12), (-1, -3)], [(-5, -12),
-(-5, -11), (5, -11)], [(5, -12), (-2, -3)], [(-1, -4), (1, -4), (4, -3),
-(6, -1), (7, 2), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6,
-7), (-7, 5), (-6, 5)], [(-2, -3), (1, -3), (4, -2), (6, 1)], [(2, -3),
-(5, -1), (6, 2), (6, 3), (5, 6), (2, 8)], [(6, 4), (4, 7), (1, 8), (-2,
-8), (-5, 7), (-6, 5)], [(-3, 8), (-6, 6)]]}, 2704: {'charcode': 2704,
-'left': -10, 'right': 10, 'lines': [[(3, -9), (3, 9), (4, 9)], [(4, -12),
-(4, 9)], [(4, -12), (-7, 4), (8, 4)], [(3, -9), (-6, 4)], [(-6, 3),
-(8, 3), (8, 4)]]}, 2705: {'charcode': 2705, 'left': -10, 'right': 10,
-'lines': [[(-5, -12), (-6, -3)], [(-4, -11), (-5, -4)], [(-5, -12), (5,
--12), (5, -11)], [(-4, -11), (5, -11)], [(-5, -4), (-2, -5), (1, -5),
-(4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9),
-(-5, 8), (-6, 7), (-7, 5), (-6, 5)], [(-6, -3), (-5, -3), (-3, -4),
-(1, -4), (4, -3), (6, 0)], [(2, -4), (5, -2), (6, 1), (6, 3), (5, 6),
-(2, 8)], [(6, 4), (4, 7), (1, 8), (-2, 8), (-5, 7), (-6, 5)], [(-3, 8),
-(-6, 6)]]}, 2706: {'charcode': 2706, 'left': -10, 'right': 10, 'lines':
-[[(4, -11), (5, -9), (6, -9), (5, -11), (2, -12), (0, -12), (-3, -11),
-(-5, -8), (-6, -3), (-6, 2), (-5, 6), (-3, 8), (0, 9), (1, 9), (4, 8),
-(6, 6), (7, 3), (7, 2), (6, -1), (4, -3), (1, -4), (0, -4), (-3, -3),
-(-5, -1)], [(5, -10), (2, -11), (0, -11), (-3, -10)], [(-2, -11), (-4,
--8), (-5, -3), (-5, 2), (-4, 6), (-1, 8)], [(-5, 4), (-3, 7), (0, 8),
-(1, 8), (4, 7), (6, 4)], [(2, 8), (5, 6), (6, 3), (6, 2), (5, -1), (2,
--3)], [(6, 1), (4, -2), (1, -3), (0, -3), (-3, -2), (-5, 1)], [(-1, -3),
-(-4, -1), (-5, 2)]]}, 2707: {'charcode': 2707, 'left': -10, 'right': 10,
-'lines': [[(-7, -12), (7, -12), (-3, 9)], [(-7, -12), (-7, -11), (6,
--11)], [(6, -12), (-4, 9), (-3, 9)]]}, 2708: {'charcode': 2708, 'left':
--10, 'right': 10, 'lines': [[(-2, -12), (-5, -11), (-6, -9), (-6, -7),
-(-5, -5), (-4, -4), (-2, -3), (2, -2), (4, -1), (5, 0), (6, 2), (6, 5),
-(5, 7), (2, 8), (-2, 8), (-5, 7), (-6, 5), (-6, 2), (-5, 0), (-4, -1),
-(-2, -2), (2, -3), (4, -4), (5, -5), (6, -7), (6, -9), (5, -11), (2, -12),
-(-2, -12)], [(-4, -11), (-5, -9), (-5, -7), (-4, -5), (-2, -4), (2, -3),
-(4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8),
-(-6, 7), (-7, 5), (-7, 2), (-6, 0), (-4, -2), (-2, -3), (2, -4), (4, -5),
-(5, -7), (5, -9), (4, -11)], [(5, -10), (2, -11), (-2, -11), (-5, -10)],
-[(-6, 6), (-3, 8)], [(3, 8), (6, 6)]]}, 2709: {'charcode': 2709, 'left':
--10, 'right': 10, 'lines': [[(5, -2), (3, 0), (0, 1), (-1, 1), (-4, 0),
-(-6, -2), (-7, -5), (-7, -6), (-6, -9), (-4, -11), (-1, -12), (0, -12),
-(3, -11), (5, -9), (6, -5), (6, 0), (5, 5), (3, 8), (0, 9), (-2, 9), (-5,
-8), (-6, 6), (-5, 6), (-4, 8)], [(5, -5), (4, -2), (1, 0)], [(5, -4),
-(3, -1), (0, 0), (-1, 0), (-4, -1), (-6, -4)], [(-2, 0), (-5, -2), (-6,
--5), (-6, -6), (-5, -9), (-2, -11)], [(-6, -7), (-4, -10), (-1, -11),
-(0, -11), (3, -10), (5, -7)], [(1, -11), (4, -9), (5, -5), (5, 0), (4,
-5), (2, 8)], [(3, 7), (0, 8), (-2, 8), (-5, 7)]]}, 2710: {'charcode':
-2710, 'left': -5, 'right': 6, 'lines': [[(0, 6), (-1, 7), (-1, 8), (0,
-9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8),
-(1, 7), (0, 7)]]}, 2711: {'charcode': 2711, 'left': -5, 'right': 6,
-'lines': [[(2, 8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6),
-(2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7),
-(0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]}, 2712: {'charcode': 2712,
-'left': -5, 'right': 6, 'lines': [[(0, -5), (-1, -4), (-1, -3), (0, -2),
-(1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3),
-(1, -4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8),
-(2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]},
-2713: {'charcode': 2713, 'left': -5, 'right': 6, 'lines': [[(0, -5), (-1,
--4), (-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)],
-[(0, -4), (0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9),
-(-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)],
-[(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8),
-(1, 12)]]}, 2714: {'charcode': 2714, 'left': -5, 'right': 6, 'lines':
-[[(0, -12), (0, 2), (1, 2)], [(0, -12), (1, -12), (1, 2)], [(0, 6), (-1,
-7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7),
-(0, 8), (1, 8), (1, 7), (0, 7)]]}, 2715: {'charcode': 2715, 'left': -9,
-'right': 10, 'lines': [[(-6, -7), (-6, -8), (-5, -10), (-4, -11), (-1,
--12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3),
-(3, -2), (0, -1)], [(-6, -7), (-5, -7), (-5, -8), (-4, -10), (-1, -11),
-(2, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -3), (0, -2)], [(-5,
--9), (-2, -11)], [(3, -11), (6, -9)], [(6, -5), (2, -2)], [(0, -2), (0,
-2), (1, 2), (1, -2)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8),
-(2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]}, 2716:
-{'charcode': 2716, 'left': -5, 'right': 6, 'lines': [[(2, -12), (0, -11),
-(-1, -9), (-1, -6), (0, -5), (1, -5), (2, -6), (2, -7), (1, -8), (0, -8),
-(-1, -7)], [(0, -7), (0, -6), (1, -6), (1, -7), (0, -7)], [(0, -11),
-(-1, -7)], [(-1, -9), (0, -8)]]}, 2717: {'charcode': 2717, 'left': -5,
-'right': 6, 'lines': [[(2, -10), (1, -9), (0, -9), (-1, -10), (-1, -11),
-(0, -12), (1, -12), (2, -11), (2, -8), (1, -6), (-1, -5)], [(0, -11),
-(0, -10), (1, -10), (1, -11), (0, -11)], [(1, -9), (2, -8)], [(2, -10),
-(1, -6)]]}, 2718: {'charcode': 2718, 'left': -12, 'right': 13, 'lines':
-[[(10, -5), (8, -5), (6, -4), (5, -2), (3, 4), (2, 6), (1, 7), (-1, 8),
-(-5, 8), (-7, 7), (-8, 5), (-8, 3), (-7, 1), (-6, 0), (-1, -3), (1, -5),
-(2, -7), (2, -9), (1, -11), (-1, -12), (-2, -12), (-4, -11), (-5, -9),
-(-5, -7), (-4, -4), (-2, -1), (3, 5), (6, 8), (8, 9), (10, 9)], [(10, -5),
-(10, -4), (8, -4), (6, -3)], [(7, -4), (6, -2), (4, 4), (3, 6), (1, 8),
-(-1, 9), (-5, 9), (-7, 8), (-8, 7), (-9, 5), (-9, 3), (-8, 1), (-6, -1),
-(-1, -4), (0, -5), (1, -7), (1, -9), (0, -11)], [(1, -10), (-1, -11),
-(-2, -11), (-4, -10)], [(-3, -11), (-4, -9), (-4, -7), (-3, -4), (-1,
--1), (4, 5), (6, 7), (8, 8), (10, 8), (10, 9)]]}, 2719: {'charcode':
-2719, 'left': -9, 'right': 10, 'lines': [[(0, -16), (0, 13), (1, 13)],
-[(0, -16), (1, -16), (1, 13)], [(5, -9), (7, -9), (5, -11), (2, -12),
-(-1, -12), (-4, -11), (-6, -9), (-6, -7), (-5, -5), (-4, -4), (4, 0),
-(5, 1), (6, 3), (6, 5), (5, 7), (2, 8), (-1, 8), (-3, 7), (-4, 6)],
-[(5, -9), (4, -10), (2, -11), (-1, -11), (-4, -10), (-5, -9), (-5, -7),
-(-4, -5), (4, -1), (6, 1), (7, 3), (7, 5), (6, 7), (5, 8), (2, 9), (-1,
-9), (-4, 8), (-6, 6), (-4, 6)], [(6, 6), (3, 8)]]}, 2720: {'charcode':
-2720, 'left': -11, 'right': 12, 'lines': [[(9, -16), (-9, 16), (-8, 16)],
-[(9, -16), (10, -16), (-8, 16)]]}, 2721: {'charcode': 2721, 'left': -7,
-'right': 7, 'lines': [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2),
-(-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16), (4, 16)], [(3, -16), (4,
--16), (2, -14), (0, -11), (-2, -7), (-3, -2), (-3, 2), (-2, 7), (0, 11),
-(2, 14), (4, 16)]]}, 2722: {'charcode': 2722, 'left': -7, 'right': 7,
-'lines': [[(-4, -16), (-2, -14), (0, -11), (2, -7), (3, -2), (3, 2),
-(2, 7), (0, 11), (-2, 14), (-4, 16), (-3, 16)], [(-4, -16), (-3, -16),
-(-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14),
-(-3, 16)]]}, 2723: {'charcode': 2723, 'left': -8, 'right': 8, 'lines':
-[[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)], [(0, -12),
-(1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3), (5, -3)],
-[(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)], [(5, -9),
-(4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9), (5, -8),
-(-5, -4), (-5, -3)]]}, 2724: {'charcode': 2724, 'left': -12, 'right': 13,
-'lines': [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]},
-2725: {'charcode': 2725, 'left': -12, 'right': 13, 'lines': [[(0, -9),
-(0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9, -1), (9,
-0)], [(-8, -1), (-8, 0), (9, 0)]]}, 2726: {'charcode': 2726, 'left':
--12, 'right': 13, 'lines': [[(-8, -5), (9, -5), (9, -4)], [(-8, -5),
-(-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4), (9,
-4)]]}, 2727: {'charcode': 2727, 'left': -4, 'right': 5, 'lines': [[(1,
--12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11),
-(0, -5)]]}, 2728: {'charcode': 2728, 'left': -9, 'right': 9, 'lines':
-[[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12),
-(-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)],
-[(5, -12), (6, -11), (4, -5)]]}, 2729: {'charcode': 2729, 'left': -7,
-'right': 7, 'lines': [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3,
--5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12),
-(-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11),
-(-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9),
-(1, -12)]]}, 2747: {'charcode': 2747, 'left': 0, 'right': 0, 'lines':
-[[]]}, 2748: {'charcode': 2748, 'left': -4, 'right': 4, 'lines': [[]]},
-2749: {'charcode': 2749, 'left': -8, 'right': 8, 'lines': [[]]}, 2750:
-{'charcode': 2750, 'left': -10, 'right': 11, 'lines': [[(2, -12), (-1,
--11), (-3, -9), (-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8),
-(-3, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4), (8, -7),
-(7, -10), (6, -11), (4, -12), (2, -12)], [(2, -12), (0, -11), (-2, -9),
-(-4, -6), (-5, -3), (-6, 1), (-6, 4), (-5, 7), (-3, 9)], [(-1, 9), (1,
-8), (3, 6), (5, 3), (6, 0), (7, -4), (7, -7), (6, -10), (4, -12)]]},
-2751: {'charcode': 2751, 'left': -10, 'right': 11, 'lines': [[(2, -8),
-(-3, 9)], [(4, -12), (-2, 9)], [(4, -12), (1, -9), (-2, -7), (-4, -6)],
-[(3, -9), (-1, -7), (-4, -6)]]}, 2752: {'charcode': 2752, 'left': -10,
-'right': 11, 'lines': [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8),
-(-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7,
--5), (5, -3), (2, -1), (-2, 1), (-5, 3), (-7, 5), (-9, 9)], [(4, -12),
-(6, -11), (7, -9), (7, -7), (6, -5), (4, -3), (-2, 1)], [(-8, 7), (-7,
-6), (-5, 6), (0, 8), (3, 8), (5, 7), (6, 5)], [(-5, 6), (0, 9), (3, 9),
-(5, 8), (6, 5)]]}, 2753: {'charcode': 2753, 'left': -10, 'right': 11,
-'lines': [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8), (-3, -10),
-(-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5),
-(4, -3), (1, -2)], [(4, -12), (6, -11), (7, -9), (7, -7), (6, -5),
-(4, -3)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7),
-(4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 4), (-7, 3),
-(-6, 4), (-7, 5)], [(1, -2), (3, -1), (4, 0), (5, 2), (5, 5), (4, 7),
-(3, 8), (1, 9)]]}, 2754: {'charcode': 2754, 'left': -10, 'right': 11,
-'lines': [[(6, -11), (0, 9)], [(7, -12), (1, 9)], [(7, -12), (-8, 3),
-(8, 3)]]}, 2755: {'charcode': 2755, 'left': -10, 'right': 11, 'lines':
-[[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (4, -11),
-(9, -12)], [(-6, -2), (-5, -3), (-2, -4), (1, -4), (4, -3), (5, -2), (6,
-0), (6, 3), (5, 6), (3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5),
-(-8, 4), (-7, 3), (-6, 4), (-7, 5)], [(1, -4), (3, -3), (4, -2), (5, 0),
-(5, 3), (4, 6), (2, 8), (0, 9)]]}, 2756: {'charcode': 2756, 'left': -10,
-'right': 11, 'lines': [[(7, -9), (6, -8), (7, -7), (8, -8), (8, -9),
-(7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3),
-(-7, 1), (-7, 5), (-6, 7), (-5, 8), (-3, 9), (0, 9), (3, 8), (5, 6),
-(6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3), (-3, -2), (-5, 0),
-(-6, 2)], [(2, -12), (0, -11), (-2, -9), (-4, -6), (-5, -3), (-6, 1),
-(-6, 6), (-5, 8)], [(0, 9), (2, 8), (4, 6), (5, 4), (5, 0), (4, -2)]]},
-2757: {'charcode': 2757, 'left': -10, 'right': 11, 'lines': [[(-4, -12),
-(-6, -6)], [(9, -12), (8, -9), (6, -6), (1, 0), (-1, 3), (-2, 5), (-3,
-9)], [(6, -6), (0, 0), (-2, 3), (-3, 5), (-4, 9)], [(-5, -9), (-2, -12),
-(0, -12), (5, -9)], [(-4, -10), (-2, -11), (0, -11), (5, -9), (7, -9),
-(8, -10), (9, -12)]]}, 2758: {'charcode': 2758, 'left': -10, 'right': 11,
-'lines': [[(1, -12), (-2, -11), (-3, -10), (-4, -8), (-4, -5), (-3, -3),
-(-1, -2), (2, -2), (6, -3), (7, -4), (8, -6), (8, -9), (7, -11), (4, -12),
-(1, -12)], [(1, -12), (-1, -11), (-2, -10), (-3, -8), (-3, -5), (-2, -3),
-(-1, -2)], [(2, -2), (5, -3), (6, -4), (7, -6), (7, -9), (6, -11), (4,
--12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3), (-8, 6), (-7, 8), (-4, 9),
-(0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5, 0), (4, -1), (2, -2)], [(-1,
--2), (-4, -1), (-6, 1), (-7, 3), (-7, 6), (-6, 8), (-4, 9)], [(0, 9),
-(3, 8), (4, 7), (5, 5), (5, 1), (4, -1)]]}, 2759: {'charcode': 2759,
-'left': -10, 'right': 11, 'lines': [[(7, -5), (6, -3), (4, -1), (2, 0),
-(-1, 0), (-3, -1), (-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11),
-(1, -12), (4, -12), (6, -11), (7, -10), (8, -8), (8, -4), (7, 0), (6, 3),
-(4, 6), (2, 8), (-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 5), (-6, 4),
-(-5, 5), (-6, 6)], [(-3, -1), (-4, -3), (-4, -7), (-3, -9), (-1, -11),
-(1, -12)], [(6, -11), (7, -9), (7, -4), (6, 0), (5, 3), (3, 6), (1, 8),
-(-1, 9)]]}, 2760: {'charcode': 2760, 'left': -5, 'right': 6, 'lines':
-[[(-2, 7), (-3, 8), (-2, 9), (-1, 8), (-2, 7)]]}, 2761: {'charcode': 2761,
-'left': -5, 'right': 6, 'lines': [[(-2, 9), (-3, 8), (-2, 7), (-1, 8),
-(-1, 9), (-2, 11), (-4, 13)]]}, 2762: {'charcode': 2762, 'left': -5,
-'right': 6, 'lines': [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)],
-[(-2, 7), (-3, 8), (-2, 9), (-1, 8)]]}, 2763: {'charcode': 2763, 'left':
--5, 'right': 6, 'lines': [[(1, -5), (0, -4), (1, -3), (2, -4), (1, -5)],
-[(-2, 9), (-3, 8), (-2, 7), (-1, 8), (-1, 9), (-2, 11), (-4, 13)]]}, 2764:
-{'charcode': 2764, 'left': -5, 'right': 6, 'lines': [[(3, -12), (2, -11),
-(0, 1)], [(3, -11), (0, 1)], [(3, -12), (4, -11), (0, 1)], [(-2, 7), (-3,
-8), (-2, 9), (-1, 8), (-2, 7)]]}, 2765: {'charcode': 2765, 'left': -10,
-'right': 11, 'lines': [[(-3, -8), (-2, -7), (-3, -6), (-4, -7), (-4, -8),
-(-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7),
-(8, -5), (7, -4), (1, -2), (-1, -1), (-1, 1), (0, 2), (2, 2)], [(5, -12),
-(7, -11), (8, -9), (8, -7), (7, -5), (6, -4), (4, -3)], [(-2, 7), (-3,
-8), (-2, 9), (-1, 8), (-2, 7)]]}, 2766: {'charcode': 2766, 'left': -5,
-'right': 6, 'lines': [[(4, -12), (2, -10), (1, -8), (1, -7), (2, -6),
-(3, -7), (2, -8)]]}, 2767: {'charcode': 2767, 'left': -5, 'right': 6,
-'lines': [[(3, -10), (2, -11), (3, -12), (4, -11), (4, -10), (3, -8),
-(1, -6)]]}, 2768: {'charcode': 2768, 'left': -13, 'right': 13, 'lines':
-[[(10, -4), (9, -3), (10, -2), (11, -3), (11, -4), (10, -5), (9, -5),
-(7, -4), (5, -2), (0, 6), (-2, 8), (-4, 9), (-7, 9), (-10, 8), (-11, 6),
-(-11, 4), (-10, 2), (-9, 1), (-7, 0), (-2, -2), (0, -3), (2, -5), (3, -7),
-(3, -9), (2, -11), (0, -12), (-2, -11), (-3, -9), (-3, -6), (-2, 0), (-1,
-3), (1, 6), (3, 8), (5, 9), (7, 9), (8, 7), (8, 6)], [(-7, 9), (-9, 8),
-(-10, 6), (-10, 4), (-9, 2), (-8, 1), (-2, -2)], [(-3, -6), (-2, -1),
-(-1, 2), (1, 5), (3, 7), (5, 8), (7, 8), (8, 7)]]}, 2769: {'charcode':
-2769, 'left': -10, 'right': 11, 'lines': [[(2, -16), (-6, 13)], [(7,
--16), (-1, 13)], [(8, -8), (7, -7), (8, -6), (9, -7), (9, -8), (8, -10),
-(7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -7), (-4, -5),
-(-3, -4), (4, 0), (6, 2)], [(-5, -7), (-3, -5), (4, -1), (5, 0), (6, 2),
-(6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8,
-4), (-7, 3), (-6, 4), (-7, 5)]]}, 2770: {'charcode': 2770, 'left': -11,
-'right': 11, 'lines': [[(13, -16), (-13, 16)]]}, 2771: {'charcode': 2771,
-'left': -7, 'right': 8, 'lines': [[(8, -16), (4, -13), (1, -10), (-1, -7),
-(-3, -3), (-4, 2), (-4, 6), (-3, 11), (-2, 14), (-1, 16)], [(4, -13),
-(1, -9), (-1, -5), (-2, -2), (-3, 3), (-3, 8), (-2, 13), (-1, 16)]]},
-2772: {'charcode': 2772, 'left': -8, 'right': 7, 'lines': [[(1, -16),
-(2, -14), (3, -11), (4, -6), (4, -2), (3, 3), (1, 7), (-1, 10), (-4,
-13), (-8, 16)], [(1, -16), (2, -13), (3, -8), (3, -3), (2, 2), (1, 5),
-(-1, 9), (-4, 13)]]}, 2773: {'charcode': 2773, 'left': -8, 'right': 9,
-'lines': [[(2, -12), (2, 0)], [(-3, -9), (7, -3)], [(7, -9), (-3, -3)]]},
-2774: {'charcode': 2774, 'left': -13, 'right': 13, 'lines': [[(-9, 0),
-(9, 0)]]}, 2775: {'charcode': 2775, 'left': -13, 'right': 13, 'lines':
-[[(0, -9), (0, 9)], [(-9, 0), (9, 0)]]}, 2776: {'charcode': 2776, 'left':
--13, 'right': 13, 'lines': [[(-9, -3), (9, -3)], [(-9, 3), (9, 3)]]},
-2777: {'charcode': 2777, 'left': -4, 'right': 5, 'lines': [[(3, -12),
-(1, -5)], [(4, -12), (1, -5)]]}, 2778: {'charcode': 2778, 'left': -9,
-'right': 9, 'lines': [[(-2, -12), (-4, -5)], [(-1, -12), (-4, -5)],
-[(7, -12), (5, -5)], [(8, -12), (5, -5)]]}, 2779: {'charcode': 2779,
-'left': -7, 'right': 8, 'lines': [[(1, -12), (-1, -11), (-2, -9), (-2,
--7), (-1, -5), (1, -4), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11),
-(3, -12), (1, -12)]]}, 2801: {'charcode': 2801, 'left': -10, 'right':
-10, 'lines': [[(0, -12), (-7, 9)], [(0, -12), (7, 9)], [(0, -9), (6,
-9)], [(-5, 3), (4, 3)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]}, 2802:
-{'charcode': 2802, 'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6,
-9)], [(-5, -12), (-5, 9)], [(-9, -12), (7, -12), (7, -6), (6, -12)],
-[(-5, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3,
-9), (-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8),
-(3, 9)]]}, 2803: {'charcode': 2803, 'left': -11, 'right': 11, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9, -12), (3, -12), (6,
--11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(3, -12),
-(5, -11), (6, -10), (7, -8), (7, -6), (6, -4), (5, -3), (3, -2)], [(-5,
--2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5), (7, 7), (6, 8), (3, 9),
-(-9, 9)], [(3, -2), (5, -1), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (3,
-9)]]}, 2804: {'charcode': 2804, 'left': -9, 'right': 9, 'lines': [[(-4,
--12), (-4, 9)], [(-3, -12), (-3, 9)], [(-7, -12), (8, -12), (8, -6),
-(7, -12)], [(-7, 9), (0, 9)]]}, 2805: {'charcode': 2805, 'left': -12,
-'right': 12, 'lines': [[(-4, -12), (-4, -6), (-5, 2), (-6, 6), (-7, 8),
-(-8, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-7, -12), (10, -12)],
-[(-11, 9), (10, 9)], [(-11, 9), (-11, 16)], [(-10, 9), (-11, 16)], [(9,
-9), (10, 16)], [(10, 9), (10, 16)]]}, 2806: {'charcode': 2806, 'left':
--11, 'right': 10, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)],
-[(1, -6), (1, 2)], [(-9, -12), (7, -12), (7, -6), (6, -12)], [(-5, -2),
-(1, -2)], [(-9, 9), (7, 9), (7, 3), (6, 9)]]}, 2807: {'charcode': 2807,
-'left': -15, 'right': 16, 'lines': [[(0, -12), (0, 9)], [(1, -12),
-(1, 9)], [(-3, -12), (4, -12)], [(-11, -11), (-10, -10), (-11, -9),
-(-12, -10), (-12, -11), (-11, -12), (-10, -12), (-9, -11), (-8, -9),
-(-7, -5), (-6, -3), (-4, -2), (5, -2), (7, -3), (8, -5), (9, -9), (10,
--11), (11, -12), (12, -12), (13, -11), (13, -10), (12, -9), (11, -10),
-(12, -11)], [(-4, -2), (-6, -1), (-7, 1), (-8, 6), (-9, 8), (-10, 9)],
-[(-4, -2), (-5, -1), (-6, 1), (-7, 6), (-8, 8), (-9, 9), (-11, 9), (-12,
-8), (-13, 6)], [(5, -2), (7, -1), (8, 1), (9, 6), (10, 8), (11, 9)],
-[(5, -2), (6, -1), (7, 1), (8, 6), (9, 8), (10, 9), (12, 9), (13, 8),
-(14, 6)], [(-3, 9), (4, 9)]]}, 2808: {'charcode': 2808, 'left': -10,
-'right': 10, 'lines': [[(-6, -9), (-7, -12), (-7, -6), (-6, -9), (-4,
--11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6), (5, -4), (2, -3),
-(-1, -3)], [(2, -12), (4, -11), (5, -9), (5, -6), (4, -4), (2, -3)],
-[(2, -3), (4, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-3,
-9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(5,
--1), (6, 2), (6, 5), (5, 7), (4, 8), (2, 9)]]}, 2809: {'charcode': 2809,
-'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12),
-(-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3,
--12)], [(3, -12), (10, -12)], [(6, -10), (-6, 7)], [(-10, 9), (-3, 9)],
-[(3, 9), (10, 9)]]}, 2810: {'charcode': 2810, 'left': -12, 'right': 12,
-'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6, -12), (6,
-9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)], [(3, -12), (10, -12)],
-[(6, -10), (-6, 7)], [(-10, 9), (-3, 9)], [(3, 9), (10, 9)], [(-4, -18),
-(-4, -19), (-5, -19), (-5, -18), (-4, -16), (-2, -15), (2, -15), (4, -16),
-(5, -18)]]}, 2811: {'charcode': 2811, 'left': -12, 'right': 12, 'lines':
-[[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(-10, -12), (-3, -12)],
-[(-6, -2), (1, -2), (3, -3), (4, -5), (5, -9), (6, -11), (7, -12), (8,
--12), (9, -11), (9, -10), (8, -9), (7, -10), (8, -11)], [(1, -2), (3,
--1), (4, 1), (5, 6), (6, 8), (7, 9)], [(1, -2), (2, -1), (3, 1), (4, 6),
-(5, 8), (6, 9), (8, 9), (9, 8), (10, 6)], [(-10, 9), (-3, 9)]]}, 2812:
-{'charcode': 2812, 'left': -13, 'right': 12, 'lines': [[(-5, -12), (-5,
--6), (-6, 2), (-7, 6), (-8, 8), (-9, 9), (-10, 9), (-11, 8), (-11, 7),
-(-10, 6), (-9, 7), (-10, 8)], [(6, -12), (6, 9)], [(7, -12), (7, 9)],
-[(-8, -12), (10, -12)], [(3, 9), (10, 9)]]}, 2813: {'charcode': 2813,
-'left': -12, 'right': 13, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12),
-(0, 6)], [(-7, -12), (0, 9)], [(7, -12), (0, 9)], [(7, -12), (7, 9)],
-[(8, -12), (8, 9)], [(-10, -12), (-6, -12)], [(7, -12), (11, -12)],
-[(-10, 9), (-4, 9)], [(4, 9), (11, 9)]]}, 2814: {'charcode': 2814,
-'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12),
-(-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (-3, -12)],
-[(3, -12), (10, -12)], [(-6, -2), (6, -2)], [(-10, 9), (-3, 9)], [(3, 9),
-(10, 9)]]}, 2815: {'charcode': 2815, 'left': -11, 'right': 11, 'lines':
-[[(-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8,
--3), (7, -7), (6, -9), (4, -11), (1, -12), (-1, -12)], [(-1, -12), (-3,
--11), (-5, -9), (-6, -7), (-7, -3), (-7, 0), (-6, 4), (-5, 6), (-3, 8),
-(-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 4), (7, 0), (7, -3), (6, -7),
-(5, -9), (3, -11), (1, -12)]]}, 2816: {'charcode': 2816, 'left': -12,
-'right': 12, 'lines': [[(-7, -12), (-7, 9)], [(-6, -12), (-6, 9)], [(6,
--12), (6, 9)], [(7, -12), (7, 9)], [(-10, -12), (10, -12)], [(-10, 9),
-(-3, 9)], [(3, 9), (10, 9)]]}, 2817: {'charcode': 2817, 'left': -11,
-'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -12), (-5, 9)], [(-9,
--12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5), (7, -3), (6, -2),
-(3, -1), (-5, -1)], [(3, -12), (5, -11), (6, -10), (7, -8), (7, -5),
-(6, -3), (5, -2), (3, -1)], [(-9, 9), (-2, 9)]]}, 2818: {'charcode':
-2818, 'left': -11, 'right': 10, 'lines': [[(6, -9), (7, -6), (7, -12),
-(6, -9), (4, -11), (1, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7),
-(-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8),
-(6, 6), (7, 4)], [(-1, -12), (-3, -11), (-5, -9), (-6, -7), (-7, -4),
-(-7, 1), (-6, 4), (-5, 6), (-3, 8), (-1, 9)]]}, 2819: {'charcode': 2819,
-'left': -9, 'right': 10, 'lines': [[(0, -12), (0, 9)], [(1, -12), (1, 9)],
-[(-6, -12), (-7, -6), (-7, -12), (8, -12), (8, -6), (7, -12)], [(-3, 9),
-(4, 9)]]}, 2820: {'charcode': 2820, 'left': -10, 'right': 11, 'lines':
-[[(-7, -12), (0, 4)], [(-6, -12), (1, 4)], [(8, -12), (1, 4), (-1, 7),
-(-2, 8), (-4, 9), (-5, 9), (-6, 8), (-6, 7), (-5, 6), (-4, 7), (-5, 8)],
-[(-9, -12), (-3, -12)], [(4, -12), (10, -12)]]}, 2821: {'charcode':
-2821, 'left': -12, 'right': 13, 'lines': [[(0, -12), (0, 9)], [(1, -12),
-(1, 9)], [(-3, -12), (4, -12)], [(-2, -9), (-6, -8), (-8, -6), (-9, -3),
-(-9, 0), (-8, 3), (-6, 5), (-2, 6), (3, 6), (7, 5), (9, 3), (10, 0), (10,
--3), (9, -6), (7, -8), (3, -9), (-2, -9)], [(-2, -9), (-5, -8), (-7, -6),
-(-8, -3), (-8, 0), (-7, 3), (-5, 5), (-2, 6)], [(3, 6), (6, 5), (8, 3),
-(9, 0), (9, -3), (8, -6), (6, -8), (3, -9)], [(-3, 9), (4, 9)]]}, 2822:
-{'charcode': 2822, 'left': -10, 'right': 10, 'lines': [[(-7, -12), (6,
-9)], [(-6, -12), (7, 9)], [(7, -12), (-7, 9)], [(-9, -12), (-3, -12)],
-[(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(3, 9), (9, 9)]]}, 2823:
-{'charcode': 2823, 'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7,
-9)], [(-6, -12), (-6, 9)], [(6, -12), (6, 9)], [(7, -12), (7, 9)], [(-10,
--12), (-3, -12)], [(3, -12), (10, -12)], [(-10, 9), (10, 9)], [(9, 9),
-(10, 16)], [(10, 9), (10, 16)]]}, 2824: {'charcode': 2824, 'left': -12,
-'right': 11, 'lines': [[(-7, -12), (-7, -1), (-6, 1), (-3, 2), (0, 2),
-(3, 1), (5, -1)], [(-6, -12), (-6, -1), (-5, 1), (-3, 2)], [(5, -12), (5,
-9)], [(6, -12), (6, 9)], [(-10, -12), (-3, -12)], [(2, -12), (9, -12)],
-[(2, 9), (9, 9)]]}, 2825: {'charcode': 2825, 'left': -16, 'right': 17,
-'lines': [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12),
-(0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)],
-[(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)],
-[(-14, 9), (15, 9)]]}, 2826: {'charcode': 2826, 'left': -16, 'right':
-17, 'lines': [[(-11, -12), (-11, 9)], [(-10, -12), (-10, 9)], [(0, -12),
-(0, 9)], [(1, -12), (1, 9)], [(11, -12), (11, 9)], [(12, -12), (12, 9)],
-[(-14, -12), (-7, -12)], [(-3, -12), (4, -12)], [(8, -12), (15, -12)],
-[(-14, 9), (15, 9)], [(14, 9), (15, 16)], [(15, 9), (15, 16)]]}, 2827:
-{'charcode': 2827, 'left': -12, 'right': 14, 'lines': [[(-2, -12), (-2,
-9)], [(-1, -12), (-1, 9)], [(-9, -12), (-10, -6), (-10, -12), (2, -12)],
-[(-1, -2), (6, -2), (9, -1), (10, 0), (11, 2), (11, 5), (10, 7), (9, 8),
-(6, 9), (-5, 9)], [(6, -2), (8, -1), (9, 0), (10, 2), (10, 5), (9, 7),
-(8, 8), (6, 9)]]}, 2828: {'charcode': 2828, 'left': -15, 'right': 15,
-'lines': [[(-10, -12), (-10, 9)], [(-9, -12), (-9, 9)], [(-13, -12),
-(-6, -12)], [(-9, -2), (-2, -2), (1, -1), (2, 0), (3, 2), (3, 5), (2, 7),
-(1, 8), (-2, 9), (-13, 9)], [(-2, -2), (0, -1), (1, 0), (2, 2), (2, 5),
-(1, 7), (0, 8), (-2, 9)], [(9, -12), (9, 9)], [(10, -12), (10, 9)],
-[(6, -12), (13, -12)], [(6, 9), (13, 9)]]}, 2829: {'charcode': 2829,
-'left': -10, 'right': 11, 'lines': [[(-5, -12), (-5, 9)], [(-4, -12),
-(-4, 9)], [(-8, -12), (-1, -12)], [(-4, -2), (3, -2), (6, -1), (7, 0),
-(8, 2), (8, 5), (7, 7), (6, 8), (3, 9), (-8, 9)], [(3, -2), (5, -1), (6,
-0), (7, 2), (7, 5), (6, 7), (5, 8), (3, 9)]]}, 2830: {'charcode': 2830,
-'left': -10, 'right': 11, 'lines': [[(-6, -9), (-7, -12), (-7, -6), (-6,
--9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -7), (8, -4),
-(8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-7,
-5), (-7, 4), (-6, 3), (-5, 4), (-6, 5)], [(1, -12), (3, -11), (5, -9),
-(6, -7), (7, -4), (7, 1), (6, 4), (5, 6), (3, 8), (1, 9)], [(-2, -2),
-(7, -2)]]}, 2831: {'charcode': 2831, 'left': -15, 'right': 16, 'lines':
-[[(-10, -12), (-10, 9)], [(-9, -12), (-9, 9)], [(-13, -12), (-6, -12)],
-[(-13, 9), (-6, 9)], [(4, -12), (1, -11), (-1, -9), (-2, -7), (-3, -3),
-(-3, 0), (-2, 4), (-1, 6), (1, 8), (4, 9), (6, 9), (9, 8), (11, 6),
-(12, 4), (13, 0), (13, -3), (12, -7), (11, -9), (9, -11), (6, -12),
-(4, -12)], [(4, -12), (2, -11), (0, -9), (-1, -7), (-2, -3), (-2, 0),
-(-1, 4), (0, 6), (2, 8), (4, 9)], [(6, 9), (8, 8), (10, 6), (11, 4),
-(12, 0), (12, -3), (11, -7), (10, -9), (8, -11), (6, -12)], [(-9, -2),
-(-3, -2)]]}, 2832: {'charcode': 2832, 'left': -11, 'right': 11, 'lines':
-[[(5, -12), (5, 9)], [(6, -12), (6, 9)], [(9, -12), (-3, -12), (-6, -11),
-(-7, -10), (-8, -8), (-8, -6), (-7, -4), (-6, -3), (-3, -2), (5, -2)],
-[(-3, -12), (-5, -11), (-6, -10), (-7, -8), (-7, -6), (-6, -4), (-5, -3),
-(-3, -2)], [(0, -2), (-2, -1), (-3, 0), (-6, 7), (-7, 8), (-8, 8), (-9,
-7)], [(-2, -1), (-3, 1), (-5, 8), (-6, 9), (-8, 9), (-9, 7), (-9, 6)],
-[(2, 9), (9, 9)]]}, 2901: {'charcode': 2901, 'left': -9, 'right': 11,
-'lines': [[(-4, -3), (-4, -2), (-5, -2), (-5, -3), (-4, -4), (-2, -5),
-(2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)], [(5, -3),
-(5, 6), (6, 8), (8, 9), (9, 9)], [(5, -1), (4, 0), (-2, 1), (-5, 2),
-(-6, 4), (-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6)], [(-2, 1),
-(-4, 2), (-5, 4), (-5, 6), (-4, 8), (-2, 9)]]}, 2902: {'charcode': 2902,
-'left': -10, 'right': 10, 'lines': [[(6, -12), (5, -11), (-1, -9), (-4,
--7), (-6, -4), (-7, -1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5),
-(-4, -4), (-6, -2), (-7, 1)], [(6, -12), (5, -10), (3, -9), (-1, -8),
-(-4, -6), (-6, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3),
-(-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6), (6, 3), (6, 1),
-(5, -2), (3, -4), (1, -5)]]}, 2903: {'charcode': 2903, 'left': -10,
-'right': 10, 'lines': [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8,
--5), (3, -5), (6, -4), (7, -2), (7, -1), (6, 1), (3, 2)], [(3, -5), (5,
--4), (6, -2), (6, -1), (5, 1), (3, 2)], [(-4, 2), (3, 2), (6, 3), (7, 5),
-(7, 6), (6, 8), (3, 9), (-8, 9)], [(3, 2), (5, 3), (6, 5), (6, 6), (5, 8),
-(3, 9)]]}, 2904: {'charcode': 2904, 'left': -10, 'right': 8, 'lines':
-[[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (6, -5), (6, 0),
-(5, -5)], [(-8, 9), (-1, 9)]]}, 2905: {'charcode': 2905, 'left': -12,
-'right': 11, 'lines': [[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9)],
-[(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5), (9, -5)], [(-9, 9),
-(-10, 14), (-10, 9), (9, 9), (9, 14), (8, 9)]]}, 2906: {'charcode':
-2906, 'left': -10, 'right': 9, 'lines': [[(-6, 1), (6, 1), (6, -1), (5,
--3), (4, -4), (2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 1), (5, -2),
-(4, -4)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6, 3), (-5, 6),
-(-3, 8), (-1, 9)]]}, 2907: {'charcode': 2907, 'left': -13, 'right': 14,
-'lines': [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-3, -5), (4, -5)],
-[(-8, -4), (-9, -3), (-10, -4), (-9, -5), (-8, -5), (-7, -4), (-5, 0),
-(-4, 1), (-2, 2), (3, 2), (5, 1), (6, 0), (8, -4), (9, -5), (10, -5),
-(11, -4), (10, -3), (9, -4)], [(-2, 2), (-4, 3), (-5, 4), (-7, 8), (-8,
-9)], [(-2, 2), (-4, 4), (-6, 8), (-7, 9), (-9, 9), (-10, 8), (-11, 6)],
-[(3, 2), (5, 3), (6, 4), (8, 8), (9, 9)], [(3, 2), (5, 4), (7, 8), (8, 9),
-(10, 9), (11, 8), (12, 6)], [(-3, 9), (4, 9)]]}, 2908: {'charcode': 2908,
-'left': -9, 'right': 9, 'lines': [[(-5, -3), (-6, -5), (-6, -1), (-5, -3),
-(-4, -4), (-2, -5), (2, -5), (5, -4), (6, -2), (6, -1), (5, 1), (2, 2)],
-[(2, -5), (4, -4), (5, -2), (5, -1), (4, 1), (2, 2)], [(-1, 2), (2, 2),
-(5, 3), (6, 5), (6, 6), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 6), (-6,
-5), (-5, 4), (-4, 5), (-5, 6)], [(2, 2), (4, 3), (5, 5), (5, 6), (4, 8),
-(2, 9)]]}, 2909: {'charcode': 2909, 'left': -11, 'right': 11, 'lines':
-[[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5),
-(6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-9, 9), (-2, 9)],
-[(2, 9), (9, 9)], [(5, -4), (-5, 8)]]}, 2910: {'charcode': 2910, 'left':
--11, 'right': 11, 'lines': [[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)],
-[(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5),
-(9, -5)], [(-9, 9), (-2, 9)], [(2, 9), (9, 9)], [(5, -4), (-5, 8)],
-[(-3, -11), (-3, -12), (-4, -12), (-4, -11), (-3, -9), (-1, -8), (1, -8),
-(3, -9), (4, -11)]]}, 2911: {'charcode': 2911, 'left': -10, 'right': 10,
-'lines': [[(-5, -5), (-5, 9)], [(-4, -5), (-4, 9)], [(-8, -5), (-1, -5)],
-[(-4, 2), (-2, 2), (1, 1), (2, 0), (4, -4), (5, -5), (6, -5), (7, -4),
-(6, -3), (5, -4)], [(-2, 2), (1, 3), (2, 4), (4, 8), (5, 9)], [(-2,
-2), (0, 3), (1, 4), (3, 8), (4, 9), (6, 9), (7, 8), (8, 6)], [(-8, 9),
-(-1, 9)]]}, 2912: {'charcode': 2912, 'left': -11, 'right': 11, 'lines':
-[[(-4, -5), (-4, -1), (-5, 5), (-6, 8), (-7, 9), (-8, 9), (-9, 8),
-(-8, 7), (-7, 8)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-7, -5),
-(9, -5)], [(2, 9), (9, 9)]]}, 2913: {'charcode': 2913, 'left': -11,
-'right': 12, 'lines': [[(-6, -5), (-6, 9)], [(-6, -5), (0, 9)], [(-5,
--5), (0, 7)], [(6, -5), (0, 9)], [(6, -5), (6, 9)], [(7, -5), (7, 9)],
-[(-9, -5), (-5, -5)], [(6, -5), (10, -5)], [(-9, 9), (-3, 9)], [(3, 9),
-(10, 9)]]}, 2914: {'charcode': 2914, 'left': -11, 'right': 11, 'lines':
-[[(-6, -5), (-6, 9)], [(-5, -5), (-5, 9)], [(5, -5), (5, 9)], [(6, -5),
-(6, 9)], [(-9, -5), (-2, -5)], [(2, -5), (9, -5)], [(-5, 2), (5, 2)],
-[(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]}, 2915: {'charcode': 2915, 'left':
--10, 'right': 10, 'lines': [[(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7,
-3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 1),
-(6, -2), (4, -4), (1, -5), (-1, -5)], [(-1, -5), (-3, -4), (-5, -2),
-(-6, 1), (-6, 3), (-5, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 6),
-(6, 3), (6, 1), (5, -2), (3, -4), (1, -5)]]}, 2916: {'charcode': 2916,
-'left': -11, 'right': 11, 'lines': [[(-6, -5), (-6, 9)], [(-5, -5),
-(-5, 9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (9, -5)],
-[(-9, 9), (-2, 9)], [(2, 9), (9, 9)]]}, 2917: {'charcode': 2917, 'left':
--11, 'right': 10, 'lines': [[(-6, -5), (-6, 16)], [(-5, -5), (-5, 16)],
-[(-5, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3),
-(6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-5, 6)], [(1, -5), (3, -4),
-(5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(-9, -5), (-5, -5)],
-[(-9, 16), (-2, 16)]]}, 2918: {'charcode': 2918, 'left': -10, 'right': 9,
-'lines': [[(5, -2), (4, -1), (5, 0), (6, -1), (6, -2), (4, -4), (2, -5),
-(-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9),
-(1, 9), (4, 8), (6, 6)], [(-1, -5), (-3, -4), (-5, -2), (-6, 1), (-6,
-3), (-5, 6), (-3, 8), (-1, 9)]]}, 2919: {'charcode': 2919, 'left': -9,
-'right': 10, 'lines': [[(0, -5), (0, 9)], [(1, -5), (1, 9)], [(-5, -5),
-(-6, 0), (-6, -5), (7, -5), (7, 0), (6, -5)], [(-3, 9), (4, 9)]]}, 2920:
-{'charcode': 2920, 'left': -9, 'right': 9, 'lines': [[(-6, -5), (0, 9)],
-[(-5, -5), (0, 7)], [(6, -5), (0, 9), (-2, 13), (-4, 15), (-6, 16),
-(-7, 16), (-8, 15), (-7, 14), (-6, 15)], [(-8, -5), (-2, -5)], [(2, -5),
-(8, -5)]]}, 2921: {'charcode': 2921, 'left': -10, 'right': 11, 'lines':
-[[(0, -12), (0, 16)], [(1, -12), (1, 16)], [(-3, -12), (1, -12)], [(0,
--2), (-1, -4), (-2, -5), (-4, -5), (-6, -4), (-7, -1), (-7, 5), (-6,
-8), (-4, 9), (-2, 9), (-1, 8), (0, 6)], [(-4, -5), (-5, -4), (-6, -1),
-(-6, 5), (-5, 8), (-4, 9)], [(5, -5), (6, -4), (7, -1), (7, 5), (6, 8),
-(5, 9)], [(1, -2), (2, -4), (3, -5), (5, -5), (7, -4), (8, -1), (8, 5),
-(7, 8), (5, 9), (3, 9), (2, 8), (1, 6)], [(-3, 16), (4, 16)]]}, 2922:
-{'charcode': 2922, 'left': -10, 'right': 10, 'lines': [[(-6, -5), (5, 9)],
-[(-5, -5), (6, 9)], [(6, -5), (-6, 9)], [(-8, -5), (-2, -5)], [(2, -5),
-(8, -5)], [(-8, 9), (-2, 9)], [(2, 9), (8, 9)]]}, 2923: {'charcode': 2923,
-'left': -11, 'right': 11, 'lines': [[(-6, -5), (-6, 9)], [(-5, -5), (-5,
-9)], [(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2,
--5), (9, -5)], [(-9, 9), (9, 9), (9, 14), (8, 9)]]}, 2924: {'charcode':
-2924, 'left': -11, 'right': 11, 'lines': [[(-6, -5), (-6, 2), (-5, 4),
-(-2, 5), (0, 5), (3, 4), (5, 2)], [(-5, -5), (-5, 2), (-4, 4), (-2, 5)],
-[(5, -5), (5, 9)], [(6, -5), (6, 9)], [(-9, -5), (-2, -5)], [(2, -5),
-(9, -5)], [(2, 9), (9, 9)]]}, 2925: {'charcode': 2925, 'left': -15,
-'right': 16, 'lines': [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0,
--5), (0, 9)], [(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11,
-9)], [(-13, -5), (-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)],
-[(-13, 9), (14, 9)]]}, 2926: {'charcode': 2926, 'left': -15, 'right': 16,
-'lines': [[(-10, -5), (-10, 9)], [(-9, -5), (-9, 9)], [(0, -5), (0, 9)],
-[(1, -5), (1, 9)], [(10, -5), (10, 9)], [(11, -5), (11, 9)], [(-13, -5),
-(-6, -5)], [(-3, -5), (4, -5)], [(7, -5), (14, -5)], [(-13, 9), (14, 9),
-(14, 14), (13, 9)]]}, 2927: {'charcode': 2927, 'left': -10, 'right': 11,
-'lines': [[(-1, -5), (-1, 9)], [(0, -5), (0, 9)], [(-6, -5), (-7, 0),
-(-7, -5), (3, -5)], [(0, 2), (4, 2), (7, 3), (8, 5), (8, 6), (7, 8),
-(4, 9), (-4, 9)], [(4, 2), (6, 3), (7, 5), (7, 6), (6, 8), (4, 9)]]},
-2928: {'charcode': 2928, 'left': -13, 'right': 13, 'lines': [[(-8, -5),
-(-8, 9)], [(-7, -5), (-7, 9)], [(-11, -5), (-4, -5)], [(-7, 2), (-3, 2),
-(0, 3), (1, 5), (1, 6), (0, 8), (-3, 9), (-11, 9)], [(-3, 2), (-1, 3),
-(0, 5), (0, 6), (-1, 8), (-3, 9)], [(7, -5), (7, 9)], [(8, -5), (8,
-9)], [(4, -5), (11, -5)], [(4, 9), (11, 9)]]}, 2929: {'charcode': 2929,
-'left': -8, 'right': 9, 'lines': [[(-3, -5), (-3, 9)], [(-2, -5), (-2,
-9)], [(-6, -5), (1, -5)], [(-2, 2), (2, 2), (5, 3), (6, 5), (6, 6),
-(5, 8), (2, 9), (-6, 9)], [(2, 2), (4, 3), (5, 5), (5, 6), (4, 8),
-(2, 9)]]}, 2930: {'charcode': 2930, 'left': -9, 'right': 10, 'lines':
-[[(-5, -3), (-6, -5), (-6, -1), (-5, -3), (-4, -4), (-2, -5), (1, -5),
-(4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-2, 9), (-4,
-8), (-6, 6), (-6, 5), (-5, 4), (-4, 5), (-5, 6)], [(1, -5), (3, -4),
-(5, -2), (6, 1), (6, 3), (5, 6), (3, 8), (1, 9)], [(0, 2), (6, 2)]]},
-2931: {'charcode': 2931, 'left': -14, 'right': 15, 'lines': [[(-9, -5),
-(-9, 9)], [(-8, -5), (-8, 9)], [(-12, -5), (-5, -5)], [(-12, 9), (-5, 9)],
-[(4, -5), (1, -4), (-1, -2), (-2, 1), (-2, 3), (-1, 6), (1, 8), (4, 9),
-(6, 9), (9, 8), (11, 6), (12, 3), (12, 1), (11, -2), (9, -4), (6, -5),
-(4, -5)], [(4, -5), (2, -4), (0, -2), (-1, 1), (-1, 3), (0, 6), (2, 8),
-(4, 9)], [(6, 9), (8, 8), (10, 6), (11, 3), (11, 1), (10, -2), (8, -4),
-(6, -5)], [(-8, 2), (-2, 2)]]}, 2932: {'charcode': 2932, 'left': -11,
-'right': 10, 'lines': [[(4, -5), (4, 9)], [(5, -5), (5, 9)], [(8, -5),
-(-3, -5), (-6, -4), (-7, -2), (-7, -1), (-6, 1), (-3, 2), (4, 2)], [(-3,
--5), (-5, -4), (-6, -2), (-6, -1), (-5, 1), (-3, 2)], [(2, 2), (-1, 3),
-(-2, 4), (-4, 8), (-5, 9)], [(2, 2), (0, 3), (-1, 4), (-3, 8), (-4, 9),
-(-6, 9), (-7, 8), (-8, 6)], [(1, 9), (8, 9)]]}, 3001: {'charcode': 3001,
-'left': -10, 'right': 10, 'lines': [[(0, -12), (-7, 8)], [(-1, -9),
-(5, 9)], [(0, -9), (6, 9)], [(0, -12), (7, 9)], [(-5, 3), (4, 3)],
-[(-9, 9), (-3, 9)], [(2, 9), (9, 9)], [(-7, 8), (-8, 9)], [(-7, 8),
-(-5, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(6, 7), (8, 9)]]}, 3002:
-{'charcode': 3002, 'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6,
-9)], [(-5, -11), (-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12),
-(6, -11), (7, -10), (8, -8), (8, -6), (7, -4), (6, -3), (3, -2)], [(6,
--10), (7, -8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5),
-(5, -3), (3, -2)], [(-4, -2), (3, -2), (6, -1), (7, 0), (8, 2), (8, 5),
-(7, 7), (6, 8), (3, 9), (-9, 9)], [(6, 0), (7, 2), (7, 5), (6, 7)], [(3,
--2), (5, -1), (6, 1), (6, 6), (5, 8), (3, 9)], [(-8, -12), (-6, -11)],
-[(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)],
-[(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8),
-(-2, 9)]]}, 3003: {'charcode': 3003, 'left': -11, 'right': 10, 'lines':
-[[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (2, -12), (-1, -12),
-(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6),
-(-4, 8), (-1, 9), (2, 9), (4, 8), (6, 6), (7, 4)], [(-5, -9), (-6, -7),
-(-7, -4), (-7, 1), (-6, 4), (-5, 6)], [(-1, -12), (-3, -11), (-5, -8),
-(-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)]]}, 3004: {'charcode': 3004,
-'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11),
-(-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (1, -12), (4, -11), (6, -9),
-(7, -7), (8, -4), (8, 1), (7, 4), (6, 6), (4, 8), (1, 9), (-9, 9)],
-[(5, -9), (6, -7), (7, -4), (7, 1), (6, 4), (5, 6)], [(1, -12), (3,
--11), (5, -8), (6, -4), (6, 1), (5, 5), (3, 8), (1, 9)], [(-8, -12),
-(-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12),
-(-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)],
-[(-4, 8), (-2, 9)]]}, 3005: {'charcode': 3005, 'left': -11, 'right':
-10, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12),
-(-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2, -6),
-(2, 2)], [(-9, 9), (7, 9), (7, 3)], [(-8, -12), (-6, -11)], [(-7, -12),
-(-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12),
-(7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7,
--6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3),
-(-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7),
-(-3, 9)], [(-4, 8), (-2, 9)], [(2, 9), (7, 8)], [(4, 9), (7, 7)], [(5,
-9), (7, 6)], [(6, 9), (7, 3)]]}, 3006: {'charcode': 3006, 'left': -11,
-'right': 9, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4,
--12), (-4, 9)], [(-9, -12), (7, -12), (7, -6)], [(-4, -2), (2, -2)], [(2,
--6), (2, 2)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12),
-(-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)], [(2, -12),
-(7, -11)], [(4, -12), (7, -10)], [(5, -12), (7, -9)], [(6, -12), (7,
--6)], [(2, -6), (1, -2), (2, 2)], [(2, -4), (0, -2), (2, 0)], [(2, -3),
-(-2, -2), (2, -1)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7),
-(-3, 9)], [(-4, 8), (-2, 9)]]}, 3007: {'charcode': 3007, 'left': -11,
-'right': 12, 'lines': [[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11),
-(2, -12), (-1, -12), (-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 8), (7, 9),
-(7, 1)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4), (-5, 6)],
-[(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8),
-(-1, 9)], [(6, 2), (6, 7)], [(5, 1), (5, 7), (4, 8)], [(2, 1), (10, 1)],
-[(3, 1), (5, 2)], [(4, 1), (5, 3)], [(8, 1), (7, 3)], [(9, 1), (7, 2)]]},
-3008: {'charcode': 3008, 'left': -12, 'right': 12, 'lines': [[(-7, -12),
-(-7, 9)], [(-6, -11), (-6, 8)], [(-5, -12), (-5, 9)], [(5, -12), (5, 9)],
-[(6, -11), (6, 8)], [(7, -12), (7, 9)], [(-10, -12), (-2, -12)], [(2,
--12), (10, -12)], [(-5, -2), (5, -2)], [(-10, 9), (-2, 9)], [(2, 9),
-(10, 9)], [(-9, -12), (-7, -11)], [(-8, -12), (-7, -10)], [(-4, -12),
-(-5, -10)], [(-3, -12), (-5, -11)], [(3, -12), (5, -11)], [(4, -12),
-(5, -10)], [(8, -12), (7, -10)], [(9, -12), (7, -11)], [(-7, 8), (-9,
-9)], [(-7, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5,
-8), (3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]},
-3009: {'charcode': 3009, 'left': -6, 'right': 6, 'lines': [[(-1, -12),
-(-1, 9)], [(0, -11), (0, 8)], [(1, -12), (1, 9)], [(-4, -12), (4, -12)],
-[(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)], [(2,
--12), (1, -10)], [(3, -12), (1, -11)], [(-1, 8), (-3, 9)], [(-1, 7),
-(-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]}, 3010: {'charcode': 3010,
-'left': -8, 'right': 7, 'lines': [[(1, -12), (1, 5), (0, 8), (-1, 9)],
-[(2, -11), (2, 5), (1, 8)], [(3, -12), (3, 5), (2, 8), (-1, 9), (-3, 9),
-(-5, 8), (-6, 6), (-6, 4), (-5, 3), (-4, 3), (-3, 4), (-3, 5), (-4, 6),
-(-5, 6)], [(-5, 4), (-5, 5), (-4, 5), (-4, 4), (-5, 4)], [(-2, -12),
-(6, -12)], [(-1, -12), (1, -11)], [(0, -12), (1, -10)], [(4, -12), (3,
--10)], [(5, -12), (3, -11)]]}, 3011: {'charcode': 3011, 'left': -12,
-'right': 10, 'lines': [[(-7, -12), (-7, 9)], [(-6, -11), (-6, 8)],
-[(-5, -12), (-5, 9)], [(6, -11), (-5, 0)], [(-2, -2), (5, 9)], [(-1,
--2), (6, 9)], [(-1, -4), (7, 9)], [(-10, -12), (-2, -12)], [(3, -12),
-(9, -12)], [(-10, 9), (-2, 9)], [(2, 9), (9, 9)], [(-9, -12), (-7, -11)],
-[(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)],
-[(5, -12), (6, -11)], [(8, -12), (6, -11)], [(-7, 8), (-9, 9)], [(-7,
-7), (-8, 9)], [(-5, 7), (-4, 9)], [(-5, 8), (-3, 9)], [(5, 7), (3, 9)],
-[(5, 7), (8, 9)]]}, 3012: {'charcode': 3012, 'left': -9, 'right': 9,
-'lines': [[(-4, -12), (-4, 9)], [(-3, -11), (-3, 8)], [(-2, -12),
-(-2, 9)], [(-7, -12), (1, -12)], [(-7, 9), (8, 9), (8, 3)], [(-6, -12),
-(-4, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-2, -10)], [(0, -12),
-(-2, -11)], [(-4, 8), (-6, 9)], [(-4, 7), (-5, 9)], [(-2, 7), (-1, 9)],
-[(-2, 8), (0, 9)], [(3, 9), (8, 8)], [(5, 9), (8, 7)], [(6, 9), (8, 6)],
-[(7, 9), (8, 3)]]}, 3013: {'charcode': 3013, 'left': -13, 'right': 13,
-'lines': [[(-8, -12), (-8, 8)], [(-8, -12), (-1, 9)], [(-7, -12), (-1,
-6)], [(-6, -12), (0, 6)], [(6, -12), (-1, 9)], [(6, -12), (6, 9)], [(7,
--11), (7, 8)], [(8, -12), (8, 9)], [(-11, -12), (-6, -12)], [(6, -12),
-(11, -12)], [(-11, 9), (-5, 9)], [(3, 9), (11, 9)], [(-10, -12), (-8,
--11)], [(9, -12), (8, -10)], [(10, -12), (8, -11)], [(-8, 8), (-10, 9)],
-[(-8, 8), (-6, 9)], [(6, 8), (4, 9)], [(6, 7), (5, 9)], [(8, 7), (9, 9)],
-[(8, 8), (10, 9)]]}, 3014: {'charcode': 3014, 'left': -12, 'right': 12,
-'lines': [[(-7, -12), (-7, 8)], [(-7, -12), (7, 9)], [(-6, -12), (6, 6)],
-[(-5, -12), (7, 6)], [(7, -11), (7, 9)], [(-10, -12), (-5, -12)], [(4,
--12), (10, -12)], [(-10, 9), (-4, 9)], [(-9, -12), (-7, -11)], [(5, -12),
-(7, -11)], [(9, -12), (7, -11)], [(-7, 8), (-9, 9)], [(-7, 8), (-5, 9)]]},
-3015: {'charcode': 3015, 'left': -11, 'right': 11, 'lines': [[(-1, -12),
-(-4, -11), (-6, -9), (-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4,
-8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7),
-(6, -9), (4, -11), (1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4),
-(-7, 1), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7),
-(5, -9)], [(-1, -12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5),
-(-3, 8), (-1, 9)], [(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8),
-(3, -11), (1, -12)]]}, 3016: {'charcode': 3016, 'left': -11, 'right':
-11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-4, -12),
-(-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10), (8, -8), (8, -5),
-(7, -3), (6, -2), (3, -1), (-4, -1)], [(6, -10), (7, -8), (7, -5), (6,
--3)], [(3, -12), (5, -11), (6, -9), (6, -4), (5, -2), (3, -1)], [(-9, 9),
-(-1, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(-3, -12),
-(-4, -10)], [(-2, -12), (-4, -11)], [(-6, 8), (-8, 9)], [(-6, 7), (-7,
-9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)]]}, 3017: {'charcode': 3017,
-'left': -11, 'right': 11, 'lines': [[(-1, -12), (-4, -11), (-6, -9),
-(-7, -7), (-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -7), (6, -9), (4, -11),
-(1, -12), (-1, -12)], [(-5, -9), (-6, -7), (-7, -4), (-7, 1), (-6, 4),
-(-5, 6)], [(5, 6), (6, 4), (7, 1), (7, -4), (6, -7), (5, -9)], [(-1,
--12), (-3, -11), (-5, -8), (-6, -4), (-6, 1), (-5, 5), (-3, 8), (-1, 9)],
-[(1, 9), (3, 8), (5, 5), (6, 1), (6, -4), (5, -8), (3, -11), (1, -12)],
-[(-4, 6), (-3, 4), (-1, 3), (0, 3), (2, 4), (3, 6), (4, 12), (5, 14),
-(7, 14), (8, 12), (8, 10)], [(4, 10), (5, 12), (6, 13), (7, 13)], [(3,
-6), (5, 11), (6, 12), (7, 12), (8, 11)]]}, 3018: {'charcode': 3018,
-'left': -11, 'right': 11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11),
-(-5, 8)], [(-4, -12), (-4, 9)], [(-9, -12), (3, -12), (6, -11), (7, -10),
-(8, -8), (8, -6), (7, -4), (6, -3), (3, -2), (-4, -2)], [(6, -10), (7,
--8), (7, -6), (6, -4)], [(3, -12), (5, -11), (6, -9), (6, -5), (5, -3),
-(3, -2)], [(0, -2), (2, -1), (3, 1), (5, 7), (6, 9), (8, 9), (9, 7),
-(9, 5)], [(5, 5), (6, 7), (7, 8), (8, 8)], [(2, -1), (3, 0), (6, 6),
-(7, 7), (8, 7), (9, 6)], [(-9, 9), (-1, 9)], [(-8, -12), (-6, -11)],
-[(-7, -12), (-6, -10)], [(-3, -12), (-4, -10)], [(-2, -12), (-4, -11)],
-[(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8),
-(-2, 9)]]}, 3019: {'charcode': 3019, 'left': -10, 'right': 10, 'lines':
-[[(6, -9), (7, -12), (7, -6), (6, -9), (4, -11), (1, -12), (-2, -12),
-(-5, -11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3),
-(6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)],
-[(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7,
-2), (7, 5), (6, 7), (5, 8), (2, 9), (-1, 9), (-4, 8), (-6, 6), (-7, 3),
-(-7, 9), (-6, 6)]]}, 3020: {'charcode': 3020, 'left': -10, 'right': 10,
-'lines': [[(-8, -12), (-8, -6)], [(-1, -12), (-1, 9)], [(0, -11), (0, 8)],
-[(1, -12), (1, 9)], [(8, -12), (8, -6)], [(-8, -12), (8, -12)], [(-4, 9),
-(4, 9)], [(-7, -12), (-8, -6)], [(-6, -12), (-8, -9)], [(-5, -12), (-8,
--10)], [(-3, -12), (-8, -11)], [(3, -12), (8, -11)], [(5, -12), (8, -10)],
-[(6, -12), (8, -9)], [(7, -12), (8, -6)], [(-1, 8), (-3, 9)], [(-1, 7),
-(-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]}, 3021: {'charcode': 3021,
-'left': -12, 'right': 12, 'lines': [[(-7, -12), (-7, 3), (-6, 6), (-4,
-8), (-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, -11)], [(-6, -11),
-(-6, 4), (-5, 6)], [(-5, -12), (-5, 4), (-4, 7), (-3, 8), (-1, 9)],
-[(-10, -12), (-2, -12)], [(4, -12), (10, -12)], [(-9, -12), (-7, -11)],
-[(-8, -12), (-7, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)],
-[(5, -12), (7, -11)], [(9, -12), (7, -11)]]}, 3022: {'charcode': 3022,
-'left': -10, 'right': 10, 'lines': [[(-7, -12), (0, 9)], [(-6, -12),
-(0, 6), (0, 9)], [(-5, -12), (1, 6)], [(7, -11), (0, 9)], [(-9, -12),
-(-2, -12)], [(3, -12), (9, -12)], [(-8, -12), (-6, -10)], [(-4, -12),
-(-5, -10)], [(-3, -12), (-5, -11)], [(5, -12), (7, -11)], [(8, -12),
-(7, -11)]]}, 3023: {'charcode': 3023, 'left': -12, 'right': 12, 'lines':
-[[(-8, -12), (-4, 9)], [(-7, -12), (-4, 4), (-4, 9)], [(-6, -12), (-3,
-4)], [(0, -12), (-3, 4), (-4, 9)], [(0, -12), (4, 9)], [(1, -12), (4, 4),
-(4, 9)], [(2, -12), (5, 4)], [(8, -11), (5, 4), (4, 9)], [(-11, -12),
-(-3, -12)], [(0, -12), (2, -12)], [(5, -12), (11, -12)], [(-10, -12), (-7,
--11)], [(-9, -12), (-7, -10)], [(-5, -12), (-6, -10)], [(-4, -12), (-6,
--11)], [(6, -12), (8, -11)], [(10, -12), (8, -11)]]}, 3024: {'charcode':
-3024, 'left': -10, 'right': 10, 'lines': [[(-7, -12), (5, 9)], [(-6,
--12), (6, 9)], [(-5, -12), (7, 9)], [(6, -11), (-6, 8)], [(-9, -12),
-(-2, -12)], [(3, -12), (9, -12)], [(-9, 9), (-3, 9)], [(2, 9), (9, 9)],
-[(-8, -12), (-5, -10)], [(-4, -12), (-5, -10)], [(-3, -12), (-5, -11)],
-[(4, -12), (6, -11)], [(8, -12), (6, -11)], [(-6, 8), (-8, 9)], [(-6,
-8), (-4, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)], [(5, 7), (8, 9)]]},
-3025: {'charcode': 3025, 'left': -11, 'right': 11, 'lines': [[(-8, -12),
-(-1, -1), (-1, 9)], [(-7, -12), (0, -1), (0, 8)], [(-6, -12), (1, -1),
-(1, 9)], [(7, -11), (1, -1)], [(-10, -12), (-3, -12)], [(4, -12), (10,
--12)], [(-4, 9), (4, 9)], [(-9, -12), (-7, -11)], [(-4, -12), (-6, -11)],
-[(5, -12), (7, -11)], [(9, -12), (7, -11)], [(-1, 8), (-3, 9)], [(-1, 7),
-(-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]}, 3026: {'charcode': 3026,
-'left': -10, 'right': 10, 'lines': [[(7, -12), (-7, -12), (-7, -6)],
-[(5, -12), (-7, 9)], [(6, -12), (-6, 9)], [(7, -12), (-5, 9)], [(-7, 9),
-(7, 9), (7, 3)], [(-6, -12), (-7, -6)], [(-5, -12), (-7, -9)], [(-4, -12),
-(-7, -10)], [(-2, -12), (-7, -11)], [(2, 9), (7, 8)], [(4, 9), (7, 7)],
-[(5, 9), (7, 6)], [(6, 9), (7, 3)]]}, 3051: {'charcode': 3051, 'left':
--10, 'right': 10, 'lines': [[(3, -12), (-9, 8)], [(1, -8), (2, 9)], [(2,
--10), (3, 8)], [(3, -12), (3, -10), (4, 7), (4, 9)], [(-6, 3), (2, 3)],
-[(-12, 9), (-6, 9)], [(-1, 9), (6, 9)], [(-9, 8), (-11, 9)], [(-9, 8),
-(-7, 9)], [(2, 8), (0, 9)], [(2, 7), (1, 9)], [(4, 7), (5, 9)]]}, 3052:
-{'charcode': 3052, 'left': -12, 'right': 12, 'lines': [[(-3, -12), (-9,
-9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (5, -12),
-(8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2)], [(7, -11), (8,
--9), (8, -7), (7, -4), (6, -3)], [(5, -12), (6, -11), (7, -9), (7, -7),
-(6, -4), (4, -2)], [(-4, -2), (4, -2), (6, -1), (7, 1), (7, 3), (6, 6),
-(4, 8), (0, 9), (-12, 9)], [(5, -1), (6, 1), (6, 3), (5, 6), (3, 8)],
-[(4, -2), (5, 0), (5, 3), (4, 6), (2, 8), (0, 9)], [(-5, -12), (-2, -11)],
-[(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)],
-[(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8),
-(-5, 9)]]}, 3053: {'charcode': 3053, 'left': -10, 'right': 11, 'lines':
-[[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10), (7, -11),
-(5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3), (-7, 1),
-(-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9), (3, 8), (5, 6), (6, 4)],
-[(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)],
-[(2, -12), (0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6),
-(-4, 8), (-2, 9)]]}, 3054: {'charcode': 3054, 'left': -12, 'right':
-11, 'lines': [[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12),
-(-7, 9)], [(-6, -12), (3, -12), (6, -11), (7, -10), (8, -7), (8, -3),
-(7, 1), (5, 5), (3, 7), (1, 8), (-3, 9), (-12, 9)], [(5, -11), (6, -10),
-(7, -7), (7, -3), (6, 1), (4, 5), (2, 7)], [(3, -12), (5, -10), (6, -7),
-(6, -3), (5, 1), (3, 5), (0, 8), (-3, 9)], [(-5, -12), (-2, -11)], [(-4,
--12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(-8, 8),
-(-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)]]},
-3055: {'charcode': 3055, 'left': -12, 'right': 11, 'lines': [[(-3, -12),
-(-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(3, -6), (1, 2)],
-[(-6, -12), (9, -12), (8, -6)], [(-4, -2), (2, -2)], [(-12, 9), (3, 9),
-(5, 4)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2,
--10)], [(1, -12), (-2, -11)], [(5, -12), (8, -11)], [(6, -12), (8, -10)],
-[(7, -12), (8, -9)], [(8, -12), (8, -6)], [(3, -6), (1, -2), (1, 2)], [(2,
--4), (0, -2), (1, 0)], [(2, -3), (-1, -2), (1, -1)], [(-8, 8), (-11, 9)],
-[(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8), (-5, 9)], [(-2, 9),
-(3, 8)], [(0, 9), (3, 7)], [(3, 7), (5, 4)]]}, 3056: {'charcode': 3056,
-'left': -12, 'right': 10, 'lines': [[(-3, -12), (-9, 9)], [(-2, -12), (-8,
-9)], [(-1, -12), (-7, 9)], [(3, -6), (1, 2)], [(-6, -12), (9, -12), (8,
--6)], [(-4, -2), (2, -2)], [(-12, 9), (-4, 9)], [(-5, -12), (-2, -11)],
-[(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)], [(5,
--12), (8, -11)], [(6, -12), (8, -10)], [(7, -12), (8, -9)], [(8, -12), (8,
--6)], [(3, -6), (1, -2), (1, 2)], [(2, -4), (0, -2), (1, 0)], [(2, -3),
-(-1, -2), (1, -1)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7),
-(-6, 9)], [(-8, 8), (-5, 9)]]}, 3057: {'charcode': 3057, 'left': -10,
-'right': 12, 'lines': [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8),
-(8, -10), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9), (-5, -6),
-(-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (0, 9), (3, 8),
-(5, 6), (7, 2)], [(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1),
-(-6, 5), (-5, 7)], [(4, 6), (5, 5), (6, 2)], [(2, -12), (0, -11), (-2,
--8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-2, 9)], [(0, 9),
-(2, 8), (4, 5), (5, 2)], [(2, 2), (10, 2)], [(3, 2), (5, 3)], [(4, 2),
-(5, 5)], [(8, 2), (6, 4)], [(9, 2), (6, 3)]]}, 3058: {'charcode': 3058,
-'left': -13, 'right': 13, 'lines': [[(-4, -12), (-10, 9)], [(-3, -12),
-(-9, 9)], [(-2, -12), (-8, 9)], [(8, -12), (2, 9)], [(9, -12), (3, 9)],
-[(10, -12), (4, 9)], [(-7, -12), (1, -12)], [(5, -12), (13, -12)],
-[(-6, -2), (6, -2)], [(-13, 9), (-5, 9)], [(-1, 9), (7, 9)], [(-6, -12),
-(-3, -11)], [(-5, -12), (-4, -10)], [(-1, -12), (-3, -10)], [(0, -12),
-(-3, -11)], [(6, -12), (9, -11)], [(7, -12), (8, -10)], [(11, -12),
-(9, -10)], [(12, -12), (9, -11)], [(-9, 8), (-12, 9)], [(-9, 7), (-11,
-9)], [(-8, 7), (-7, 9)], [(-9, 8), (-6, 9)], [(3, 8), (0, 9)], [(3, 7),
-(1, 9)], [(4, 7), (5, 9)], [(3, 8), (6, 9)]]}, 3059: {'charcode': 3059,
-'left': -7, 'right': 7, 'lines': [[(2, -12), (-4, 9)], [(3, -12), (-3,
-9)], [(4, -12), (-2, 9)], [(-1, -12), (7, -12)], [(-7, 9), (1, 9)], [(0,
--12), (3, -11)], [(1, -12), (2, -10)], [(5, -12), (3, -10)], [(6, -12),
-(3, -11)], [(-3, 8), (-6, 9)], [(-3, 7), (-5, 9)], [(-2, 7), (-1, 9)],
-[(-3, 8), (0, 9)]]}, 3060: {'charcode': 3060, 'left': -9, 'right': 10,
-'lines': [[(5, -12), (0, 5), (-1, 7), (-3, 9)], [(6, -12), (2, 1), (1, 4),
-(0, 6)], [(7, -12), (3, 1), (1, 6), (-1, 8), (-3, 9), (-5, 9), (-7, 8),
-(-8, 6), (-8, 4), (-7, 3), (-6, 3), (-5, 4), (-5, 5), (-6, 6), (-7, 6)],
-[(-7, 4), (-7, 5), (-6, 5), (-6, 4), (-7, 4)], [(2, -12), (10, -12)], [(3,
--12), (6, -11)], [(4, -12), (5, -10)], [(8, -12), (6, -10)], [(9, -12),
-(6, -11)]]}, 3061: {'charcode': 3061, 'left': -12, 'right': 11, 'lines':
-[[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(10,
--11), (-5, 0)], [(-1, -3), (3, 9)], [(0, -3), (4, 9)], [(1, -4), (5, 8)],
-[(-6, -12), (2, -12)], [(7, -12), (13, -12)], [(-12, 9), (-4, 9)], [(0,
-9), (7, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)], [(0, -12),
-(-2, -10)], [(1, -12), (-2, -11)], [(8, -12), (10, -11)], [(12, -12),
-(10, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6,
-9)], [(-8, 8), (-5, 9)], [(3, 8), (1, 9)], [(3, 7), (2, 9)], [(4, 7),
-(6, 9)]]}, 3062: {'charcode': 3062, 'left': -10, 'right': 10, 'lines':
-[[(-1, -12), (-7, 9)], [(0, -12), (-6, 9)], [(1, -12), (-5, 9)], [(-4,
--12), (4, -12)], [(-10, 9), (5, 9), (7, 3)], [(-3, -12), (0, -11)],
-[(-2, -12), (-1, -10)], [(2, -12), (0, -10)], [(3, -12), (0, -11)],
-[(-6, 8), (-9, 9)], [(-6, 7), (-8, 9)], [(-5, 7), (-4, 9)], [(-6, 8),
-(-3, 9)], [(0, 9), (5, 8)], [(2, 9), (6, 6)], [(4, 9), (7, 3)]]}, 3063:
-{'charcode': 3063, 'left': -14, 'right': 14, 'lines': [[(-5, -12), (-11,
-8)], [(-5, -11), (-4, 7), (-4, 9)], [(-4, -12), (-3, 7)], [(-3, -12),
-(-2, 6)], [(9, -12), (-2, 6), (-4, 9)], [(9, -12), (3, 9)], [(10, -12),
-(4, 9)], [(11, -12), (5, 9)], [(-8, -12), (-3, -12)], [(9, -12), (14,
--12)], [(-14, 9), (-8, 9)], [(0, 9), (8, 9)], [(-7, -12), (-5, -11)],
-[(-6, -12), (-5, -10)], [(12, -12), (10, -10)], [(13, -12), (10, -11)],
-[(-11, 8), (-13, 9)], [(-11, 8), (-9, 9)], [(4, 8), (1, 9)], [(4, 7),
-(2, 9)], [(5, 7), (6, 9)], [(4, 8), (7, 9)]]}, 3064: {'charcode': 3064,
-'left': -12, 'right': 13, 'lines': [[(-3, -12), (-9, 8)], [(-3, -12),
-(4, 9)], [(-2, -12), (4, 6)], [(-1, -12), (5, 6)], [(10, -11), (5, 6),
-(4, 9)], [(-6, -12), (-1, -12)], [(7, -12), (13, -12)], [(-12, 9),
-(-6, 9)], [(-5, -12), (-2, -11)], [(-4, -12), (-2, -10)], [(8, -12),
-(10, -11)], [(12, -12), (10, -11)], [(-9, 8), (-11, 9)], [(-9, 8), (-7,
-9)]]}, 3065: {'charcode': 3065, 'left': -11, 'right': 11, 'lines': [[(1,
--12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4), (-7,
-7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0), (8, -4),
-(8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(-3, -9), (-5, -6),
-(-6, -3), (-7, 1), (-7, 5), (-6, 7)], [(3, 6), (5, 3), (6, 0), (7, -4),
-(7, -8), (6, -10)], [(1, -12), (-1, -11), (-3, -8), (-4, -6), (-5, -3),
-(-6, 1), (-6, 6), (-5, 8), (-4, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3),
-(5, 0), (6, -4), (6, -9), (5, -11), (4, -12)]]}, 3066: {'charcode': 3066,
-'left': -12, 'right': 11, 'lines': [[(-3, -12), (-9, 9)], [(-2, -12),
-(-8, 9)], [(-1, -12), (-7, 9)], [(-6, -12), (6, -12), (9, -11), (10,
--9), (10, -7), (9, -4), (7, -2), (3, -1), (-5, -1)], [(8, -11), (9, -9),
-(9, -7), (8, -4), (6, -2)], [(6, -12), (7, -11), (8, -9), (8, -7), (7,
--4), (5, -2), (3, -1)], [(-12, 9), (-4, 9)], [(-5, -12), (-2, -11)],
-[(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12), (-2, -11)],
-[(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)], [(-8, 8),
-(-5, 9)]]}, 3067: {'charcode': 3067, 'left': -11, 'right': 11, 'lines':
-[[(1, -12), (-2, -11), (-4, -9), (-6, -6), (-7, -3), (-8, 1), (-8, 4),
-(-7, 7), (-6, 8), (-4, 9), (-1, 9), (2, 8), (4, 6), (6, 3), (7, 0),
-(8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (1, -12)], [(-3, -9),
-(-5, -6), (-6, -3), (-7, 1), (-7, 5), (-6, 7)], [(3, 6), (5, 3), (6, 0),
-(7, -4), (7, -8), (6, -10)], [(1, -12), (-1, -11), (-3, -8), (-4, -6),
-(-5, -3), (-6, 1), (-6, 6), (-5, 8), (-4, 9)], [(-1, 9), (1, 8), (3, 5),
-(4, 3), (5, 0), (6, -4), (6, -9), (5, -11), (4, -12)], [(-6, 6), (-5, 4),
-(-3, 3), (-2, 3), (0, 4), (1, 6), (2, 11), (3, 12), (4, 12), (5, 11)],
-[(2, 12), (3, 13), (4, 13)], [(1, 6), (1, 13), (2, 14), (4, 14), (5, 11),
-(5, 10)]]}, 3068: {'charcode': 3068, 'left': -12, 'right': 12, 'lines':
-[[(-3, -12), (-9, 9)], [(-2, -12), (-8, 9)], [(-1, -12), (-7, 9)], [(-6,
--12), (5, -12), (8, -11), (9, -9), (9, -7), (8, -4), (7, -3), (4, -2),
-(-4, -2)], [(7, -11), (8, -9), (8, -7), (7, -4), (6, -3)], [(5, -12),
-(6, -11), (7, -9), (7, -7), (6, -4), (4, -2)], [(0, -2), (2, -1), (3,
-0), (5, 6), (6, 7), (7, 7), (8, 6)], [(5, 7), (6, 8), (7, 8)], [(3, 0),
-(4, 8), (5, 9), (7, 9), (8, 6), (8, 5)], [(-12, 9), (-4, 9)], [(-5, -12),
-(-2, -11)], [(-4, -12), (-3, -10)], [(0, -12), (-2, -10)], [(1, -12),
-(-2, -11)], [(-8, 8), (-11, 9)], [(-8, 7), (-10, 9)], [(-7, 7), (-6, 9)],
-[(-8, 8), (-5, 9)]]}, 3069: {'charcode': 3069, 'left': -11, 'right': 12,
-'lines': [[(8, -10), (9, -10), (10, -12), (9, -6), (9, -8), (8, -10),
-(7, -11), (4, -12), (0, -12), (-3, -11), (-5, -9), (-5, -6), (-4, -4),
-(-2, -2), (4, 1), (5, 3), (5, 6), (4, 8)], [(-4, -6), (-3, -4), (4, 0),
-(5, 2)], [(-3, -11), (-4, -9), (-4, -7), (-3, -5), (3, -2), (5, 0),
-(6, 2), (6, 5), (5, 7), (4, 8), (1, 9), (-3, 9), (-6, 8), (-7, 7), (-8,
-5), (-8, 3), (-9, 9), (-8, 7), (-7, 7)]]}, 3070: {'charcode': 3070,
-'left': -11, 'right': 11, 'lines': [[(2, -12), (-4, 9)], [(3, -12),
-(-3, 9)], [(4, -12), (-2, 9)], [(-5, -12), (-7, -6)], [(11, -12), (10,
--6)], [(-5, -12), (11, -12)], [(-7, 9), (1, 9)], [(-4, -12), (-7, -6)],
-[(-2, -12), (-6, -9)], [(0, -12), (-5, -11)], [(7, -12), (10, -11)],
-[(8, -12), (10, -10)], [(9, -12), (10, -9)], [(10, -12), (10, -6)],
-[(-3, 8), (-6, 9)], [(-3, 7), (-5, 9)], [(-2, 7), (-1, 9)], [(-3, 8),
-(0, 9)]]}, 3071: {'charcode': 3071, 'left': -12, 'right': 13, 'lines':
-[[(-4, -12), (-7, -1), (-8, 3), (-8, 6), (-7, 8), (-4, 9), (0, 9), (3,
-8), (5, 6), (6, 3), (10, -11)], [(-3, -12), (-6, -1), (-7, 3), (-7, 7),
-(-6, 8)], [(-2, -12), (-5, -1), (-6, 3), (-6, 7), (-4, 9)], [(-7, -12),
-(1, -12)], [(7, -12), (13, -12)], [(-6, -12), (-3, -11)], [(-5, -12),
-(-4, -10)], [(-1, -12), (-3, -10)], [(0, -12), (-3, -11)], [(8, -12),
-(10, -11)], [(12, -12), (10, -11)]]}, 3072: {'charcode': 3072, 'left':
--10, 'right': 10, 'lines': [[(-4, -12), (-4, -10), (-3, 7), (-3, 9)],
-[(-3, -11), (-2, 6)], [(-2, -12), (-1, 5)], [(9, -11), (-3, 9)], [(-6,
--12), (1, -12)], [(6, -12), (12, -12)], [(-5, -12), (-4, -10)], [(-1,
--12), (-2, -10)], [(0, -12), (-3, -11)], [(7, -12), (9, -11)], [(11,
--12), (9, -11)]]}, 3073: {'charcode': 3073, 'left': -13, 'right': 13,
-'lines': [[(-5, -12), (-5, -10), (-7, 7), (-7, 9)], [(-4, -11), (-6, 6)],
-[(-3, -12), (-5, 5)], [(3, -12), (-5, 5), (-7, 9)], [(3, -12), (3, -10),
-(1, 7), (1, 9)], [(4, -11), (2, 6)], [(5, -12), (3, 5)], [(11, -11),
-(3, 5), (1, 9)], [(-8, -12), (0, -12)], [(3, -12), (5, -12)], [(8, -12),
-(14, -12)], [(-7, -12), (-4, -11)], [(-6, -12), (-5, -10)], [(-2, -12),
-(-4, -9)], [(-1, -12), (-4, -11)], [(9, -12), (11, -11)], [(13, -12),
-(11, -11)]]}, 3074: {'charcode': 3074, 'left': -11, 'right': 11, 'lines':
-[[(-4, -12), (2, 9)], [(-3, -12), (3, 9)], [(-2, -12), (4, 9)], [(9,
--11), (-9, 8)], [(-6, -12), (1, -12)], [(6, -12), (12, -12)], [(-12,
-9), (-6, 9)], [(-1, 9), (6, 9)], [(-5, -12), (-3, -10)], [(-1, -12),
-(-2, -10)], [(0, -12), (-2, -11)], [(7, -12), (9, -11)], [(11, -12),
-(9, -11)], [(-9, 8), (-11, 9)], [(-9, 8), (-7, 9)], [(2, 8), (0, 9)],
-[(2, 7), (1, 9)], [(3, 7), (5, 9)]]}, 3075: {'charcode': 3075, 'left':
--11, 'right': 11, 'lines': [[(-5, -12), (-1, -2), (-4, 9)], [(-4, -12),
-(0, -2), (-3, 9)], [(-3, -12), (1, -2), (-2, 9)], [(10, -11), (1, -2)],
-[(-7, -12), (0, -12)], [(7, -12), (13, -12)], [(-7, 9), (1, 9)], [(-6,
--12), (-4, -11)], [(-2, -12), (-3, -10)], [(-1, -12), (-4, -11)], [(8,
--12), (10, -11)], [(12, -12), (10, -11)], [(-3, 8), (-6, 9)], [(-3, 7),
-(-5, 9)], [(-2, 7), (-1, 9)], [(-3, 8), (0, 9)]]}, 3076: {'charcode':
-3076, 'left': -11, 'right': 11, 'lines': [[(8, -12), (-10, 9)], [(9,
--12), (-9, 9)], [(10, -12), (-8, 9)], [(10, -12), (-4, -12), (-6, -6)],
-[(-10, 9), (4, 9), (6, 3)], [(-3, -12), (-6, -6)], [(-2, -12), (-5, -9)],
-[(0, -12), (-4, -11)], [(0, 9), (4, 8)], [(2, 9), (5, 6)], [(3, 9),
-(6, 3)]]}, 3101: {'charcode': 3101, 'left': -9, 'right': 11, 'lines':
-[[(-4, -2), (-4, -3), (-3, -3), (-3, -1), (-5, -1), (-5, -3), (-4, -4),
-(-2, -5), (2, -5), (4, -4), (5, -3), (6, -1), (6, 6), (7, 8), (8, 9)],
-[(4, -3), (5, -1), (5, 6), (6, 8)], [(2, -5), (3, -4), (4, -2), (4, 6),
-(5, 8), (8, 9), (9, 9)], [(4, 0), (3, 1), (-2, 2), (-5, 3), (-6, 5),
-(-6, 6), (-5, 8), (-2, 9), (1, 9), (3, 8), (4, 6)], [(-4, 3), (-5, 5),
-(-5, 6), (-4, 8)], [(3, 1), (-1, 2), (-3, 3), (-4, 5), (-4, 6), (-3, 8),
-(-2, 9)]]}, 3102: {'charcode': 3102, 'left': -11, 'right': 10, 'lines':
-[[(-6, -12), (-6, 9), (-5, 8), (-3, 8)], [(-5, -11), (-5, 7)], [(-9,
--12), (-4, -12), (-4, 8)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4,
--4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8),
-(-4, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3),
-(5, 0), (5, 4), (4, 7), (3, 8), (1, 9)], [(-8, -12), (-6, -11)], [(-7,
--12), (-6, -10)]]}, 3103: {'charcode': 3103, 'left': -10, 'right': 9,
-'lines': [[(5, -1), (5, -2), (4, -2), (4, 0), (6, 0), (6, -2), (4, -4),
-(2, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4,
-8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5,
-6)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8),
-(-1, 9)]]}, 3104: {'charcode': 3104, 'left': -10, 'right': 11, 'lines':
-[[(4, -12), (4, 9), (9, 9)], [(5, -11), (5, 8)], [(1, -12), (6, -12),
-(6, 9)], [(4, -2), (3, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2),
-(-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9), (3, 8), (4, 6)],
-[(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3, -4), (-4, -3),
-(-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(2, -12), (4, -11)], [(3,
--12), (4, -10)], [(6, 7), (7, 9)], [(6, 8), (8, 9)]]}, 3105: {'charcode':
-3105, 'left': -10, 'right': 9, 'lines': [[(-5, 1), (6, 1), (6, -1), (5,
--3), (4, -4), (1, -5), (-1, -5), (-4, -4), (-6, -2), (-7, 1), (-7, 3),
-(-6, 6), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 6)], [(5, 0), (5, -1),
-(4, -3)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(4, 1), (4, -2),
-(3, -4), (1, -5)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4),
-(-4, 7), (-3, 8), (-1, 9)]]}, 3106: {'charcode': 3106, 'left': -7,
-'right': 7, 'lines': [[(5, -10), (5, -11), (4, -11), (4, -9), (6, -9),
-(6, -11), (5, -12), (2, -12), (0, -11), (-1, -10), (-2, -7), (-2, 9)],
-[(0, -10), (-1, -7), (-1, 8)], [(2, -12), (1, -11), (0, -9), (0, 9)],
-[(-5, -5), (4, -5)], [(-5, 9), (3, 9)], [(-2, 8), (-4, 9)], [(-2, 7),
-(-3, 9)], [(0, 7), (1, 9)], [(0, 8), (2, 9)]]}, 3107: {'charcode': 3107,
-'left': -9, 'right': 10, 'lines': [[(6, -4), (7, -3), (8, -4), (7, -5),
-(6, -5), (4, -4), (3, -3)], [(-1, -5), (-3, -4), (-4, -3), (-5, -1),
-(-5, 1), (-4, 3), (-3, 4), (-1, 5), (1, 5), (3, 4), (4, 3), (5, 1),
-(5, -1), (4, -3), (3, -4), (1, -5), (-1, -5)], [(-3, -3), (-4, -1),
-(-4, 1), (-3, 3)], [(3, 3), (4, 1), (4, -1), (3, -3)], [(-1, -5), (-2,
--4), (-3, -2), (-3, 2), (-2, 4), (-1, 5)], [(1, 5), (2, 4), (3, 2), (3,
--2), (2, -4), (1, -5)], [(-4, 3), (-5, 4), (-6, 6), (-6, 7), (-5, 9),
-(-4, 10), (-1, 11), (3, 11), (6, 12), (7, 13)], [(-4, 9), (-1, 10),
-(3, 10), (6, 11)], [(-6, 7), (-5, 8), (-2, 9), (3, 9), (6, 10), (7,
-12), (7, 13), (6, 15), (3, 16), (-3, 16), (-6, 15), (-7, 13), (-7, 12),
-(-6, 10), (-3, 9)], [(-3, 16), (-5, 15), (-6, 13), (-6, 12), (-5, 10),
-(-3, 9)]]}, 3108: {'charcode': 3108, 'left': -11, 'right': 12, 'lines':
-[[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12), (-4, -12), (-4,
-9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5), (3, -5), (5, -4), (6, -3),
-(7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)], [(3, -5), (4, -4), (5, -1),
-(5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10, 9)], [(-8, -12), (-6, -11)],
-[(-7, -12), (-6, -10)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)], [(-4,
-7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8), (3, 9)], [(5, 7), (4, 9)],
-[(7, 7), (8, 9)], [(7, 8), (9, 9)]]}, 3109: {'charcode': 3109, 'left':
--6, 'right': 6, 'lines': [[(-1, -12), (-1, -10), (1, -10), (1, -12),
-(-1, -12)], [(0, -12), (0, -10)], [(-1, -11), (1, -11)], [(-1, -5), (-1,
-9)], [(0, -4), (0, 8)], [(-4, -5), (1, -5), (1, 9)], [(-4, 9), (4, 9)],
-[(-3, -5), (-1, -4)], [(-2, -5), (-1, -3)], [(-1, 8), (-3, 9)], [(-1,
-7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]}, 3110: {'charcode':
-3110, 'left': -7, 'right': 6, 'lines': [[(0, -12), (0, -10), (2, -10),
-(2, -12), (0, -12)], [(1, -12), (1, -10)], [(0, -11), (2, -11)], [(0,
--5), (0, 12), (-1, 15), (-2, 16)], [(1, -4), (1, 11), (0, 14)], [(-3,
--5), (2, -5), (2, 11), (1, 14), (0, 15), (-2, 16), (-5, 16), (-6, 15),
-(-6, 13), (-4, 13), (-4, 15), (-5, 15), (-5, 14)], [(-2, -5), (0, -4)],
-[(-1, -5), (0, -3)]]}, 3111: {'charcode': 3111, 'left': -11, 'right':
-11, 'lines': [[(-6, -12), (-6, 9)], [(-5, -11), (-5, 8)], [(-9, -12),
-(-4, -12), (-4, 9)], [(5, -4), (-4, 5)], [(0, 1), (7, 9)], [(0, 2),
-(6, 9)], [(-1, 2), (5, 9)], [(2, -5), (9, -5)], [(-9, 9), (-1, 9)], [(2,
-9), (9, 9)], [(-8, -12), (-6, -11)], [(-7, -12), (-6, -10)], [(3, -5),
-(5, -4)], [(8, -5), (5, -4)], [(-6, 8), (-8, 9)], [(-6, 7), (-7, 9)],
-[(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 7), (3, 9)], [(4, 7),
-(8, 9)]]}, 3112: {'charcode': 3112, 'left': -6, 'right': 6, 'lines':
-[[(-1, -12), (-1, 9)], [(0, -11), (0, 8)], [(-4, -12), (1, -12), (1,
-9)], [(-4, 9), (4, 9)], [(-3, -12), (-1, -11)], [(-2, -12), (-1, -10)],
-[(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8),
-(3, 9)]]}, 3113: {'charcode': 3113, 'left': -17, 'right': 17, 'lines':
-[[(-12, -5), (-12, 9)], [(-11, -4), (-11, 8)], [(-15, -5), (-10, -5),
-(-10, 9)], [(-10, -1), (-9, -3), (-8, -4), (-6, -5), (-3, -5), (-1, -4),
-(0, -3), (1, 0), (1, 9)], [(-1, -3), (0, 0), (0, 8)], [(-3, -5), (-2,
--4), (-1, -1), (-1, 9)], [(1, -1), (2, -3), (3, -4), (5, -5), (8, -5),
-(10, -4), (11, -3), (12, 0), (12, 9)], [(10, -3), (11, 0), (11, 8)],
-[(8, -5), (9, -4), (10, -1), (10, 9)], [(-15, 9), (-7, 9)], [(-4, 9),
-(4, 9)], [(7, 9), (15, 9)], [(-14, -5), (-12, -4)], [(-13, -5), (-12,
--3)], [(-12, 8), (-14, 9)], [(-12, 7), (-13, 9)], [(-10, 7), (-9, 9)],
-[(-10, 8), (-8, 9)], [(-1, 8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7),
-(2, 9)], [(1, 8), (3, 9)], [(10, 8), (8, 9)], [(10, 7), (9, 9)], [(12,
-7), (13, 9)], [(12, 8), (14, 9)]]}, 3114: {'charcode': 3114, 'left':
--11, 'right': 12, 'lines': [[(-6, -5), (-6, 9)], [(-5, -4), (-5, 8)],
-[(-9, -5), (-4, -5), (-4, 9)], [(-4, -1), (-3, -3), (-2, -4), (0, -5),
-(3, -5), (5, -4), (6, -3), (7, 0), (7, 9)], [(5, -3), (6, 0), (6, 8)],
-[(3, -5), (4, -4), (5, -1), (5, 9)], [(-9, 9), (-1, 9)], [(2, 9), (10,
-9)], [(-8, -5), (-6, -4)], [(-7, -5), (-6, -3)], [(-6, 8), (-8, 9)],
-[(-6, 7), (-7, 9)], [(-4, 7), (-3, 9)], [(-4, 8), (-2, 9)], [(5, 8),
-(3, 9)], [(5, 7), (4, 9)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]}, 3115:
-{'charcode': 3115, 'left': -10, 'right': 10, 'lines': [[(-1, -5), (-4,
--4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(4, 8), (6, 6), (7, 3), (7, 1), (6, -2), (4, -4), (1, -5), (-1, -5)],
-[(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(5, 6), (6, 4), (6, 0), (5,
--2)], [(-1, -5), (-3, -4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8),
-(-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 0), (4, -3), (3, -4),
-(1, -5)]]}, 3116: {'charcode': 3116, 'left': -11, 'right': 10, 'lines':
-[[(-6, -5), (-6, 16)], [(-5, -4), (-5, 15)], [(-9, -5), (-4, -5), (-4,
-16)], [(-4, -2), (-3, -4), (-1, -5), (1, -5), (4, -4), (6, -2), (7, 1),
-(7, 3), (6, 6), (4, 8), (1, 9), (-1, 9), (-3, 8), (-4, 6)], [(5, -2),
-(6, 0), (6, 4), (5, 6)], [(1, -5), (3, -4), (4, -3), (5, 0), (5, 4),
-(4, 7), (3, 8), (1, 9)], [(-9, 16), (-1, 16)], [(-8, -5), (-6, -4)],
-[(-7, -5), (-6, -3)], [(-6, 15), (-8, 16)], [(-6, 14), (-7, 16)], [(-4,
-14), (-3, 16)], [(-4, 15), (-2, 16)]]}, 3117: {'charcode': 3117, 'left':
--10, 'right': 10, 'lines': [[(4, -4), (4, 16)], [(5, -3), (5, 15)], [(3,
--4), (5, -4), (6, -5), (6, 16)], [(4, -2), (3, -4), (1, -5), (-1, -5),
-(-4, -4), (-6, -2), (-7, 1), (-7, 3), (-6, 6), (-4, 8), (-1, 9), (1, 9),
-(3, 8), (4, 6)], [(-5, -2), (-6, 0), (-6, 4), (-5, 6)], [(-1, -5), (-3,
--4), (-4, -3), (-5, 0), (-5, 4), (-4, 7), (-3, 8), (-1, 9)], [(1, 16),
-(9, 16)], [(4, 15), (2, 16)], [(4, 14), (3, 16)], [(6, 14), (7, 16)],
-[(6, 15), (8, 16)]]}, 3118: {'charcode': 3118, 'left': -9, 'right': 8,
-'lines': [[(-4, -5), (-4, 9)], [(-3, -4), (-3, 8)], [(-7, -5), (-2,
--5), (-2, 9)], [(5, -3), (5, -4), (4, -4), (4, -2), (6, -2), (6, -4),
-(5, -5), (3, -5), (1, -4), (-1, -2), (-2, 1)], [(-7, 9), (1, 9)], [(-6,
--5), (-4, -4)], [(-5, -5), (-4, -3)], [(-4, 8), (-6, 9)], [(-4, 7), (-5,
-9)], [(-2, 7), (-1, 9)], [(-2, 8), (0, 9)]]}, 3119: {'charcode': 3119,
-'left': -8, 'right': 9, 'lines': [[(5, -3), (6, -5), (6, -1), (5, -3),
-(4, -4), (2, -5), (-2, -5), (-4, -4), (-5, -3), (-5, -1), (-4, 1), (-2,
-2), (3, 3), (5, 4), (6, 7)], [(-4, -4), (-5, -1)], [(-4, 0), (-2, 1),
-(3, 2), (5, 3)], [(6, 4), (5, 8)], [(-5, -3), (-4, -1), (-2, 0), (3,
-1), (5, 2), (6, 4), (6, 7), (5, 8), (3, 9), (-1, 9), (-3, 8), (-4, 7),
-(-5, 5), (-5, 9), (-4, 7)]]}, 3120: {'charcode': 3120, 'left': -7,
-'right': 8, 'lines': [[(-2, -10), (-2, 4), (-1, 7), (0, 8), (2, 9),
-(4, 9), (6, 8), (7, 6)], [(-1, -10), (-1, 5), (0, 7)], [(-2, -10), (0,
--12), (0, 5), (1, 8), (2, 9)], [(-5, -5), (4, -5)]]}, 3121: {'charcode':
-3121, 'left': -11, 'right': 12, 'lines': [[(-6, -5), (-6, 4), (-5, 7),
-(-4, 8), (-2, 9), (1, 9), (3, 8), (4, 7), (5, 5)], [(-5, -4), (-5, 5),
-(-4, 7)], [(-9, -5), (-4, -5), (-4, 5), (-3, 8), (-2, 9)], [(5, -5), (5,
-9), (10, 9)], [(6, -4), (6, 8)], [(2, -5), (7, -5), (7, 9)], [(-8, -5),
-(-6, -4)], [(-7, -5), (-6, -3)], [(7, 7), (8, 9)], [(7, 8), (9, 9)]]},
-3122: {'charcode': 3122, 'left': -9, 'right': 9, 'lines': [[(-6, -5),
-(0, 9)], [(-5, -5), (0, 7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (0,
-9)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)],
-[(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]}, 3123:
-{'charcode': 3123, 'left': -12, 'right': 12, 'lines': [[(-8, -5), (-4,
-9)], [(-7, -5), (-4, 6)], [(-6, -5), (-3, 6)], [(0, -5), (-3, 6), (-4,
-9)], [(0, -5), (4, 9)], [(1, -5), (4, 6)], [(0, -5), (2, -5), (5, 6)],
-[(8, -4), (5, 6), (4, 9)], [(-11, -5), (-3, -5)], [(5, -5), (11, -5)],
-[(-10, -5), (-7, -4)], [(-4, -5), (-6, -4)], [(6, -5), (8, -4)], [(10,
--5), (8, -4)]]}, 3124: {'charcode': 3124, 'left': -10, 'right': 10,
-'lines': [[(-6, -5), (4, 9)], [(-5, -5), (5, 9)], [(-4, -5), (6, 9)],
-[(5, -4), (-5, 8)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-8, 9),
-(-2, 9)], [(1, 9), (8, 9)], [(-7, -5), (-5, -4)], [(-2, -5), (-4, -4)],
-[(3, -5), (5, -4)], [(7, -5), (5, -4)], [(-5, 8), (-7, 9)], [(-5, 8),
-(-3, 9)], [(4, 8), (2, 9)], [(5, 8), (7, 9)]]}, 3125: {'charcode': 3125,
-'left': -10, 'right': 9, 'lines': [[(-6, -5), (0, 9)], [(-5, -5), (0,
-7)], [(-4, -5), (1, 7)], [(6, -4), (1, 7), (-2, 13), (-4, 15), (-6,
-16), (-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8,
-14)], [(-8, -5), (-1, -5)], [(2, -5), (8, -5)], [(-7, -5), (-4, -3)],
-[(-2, -5), (-4, -4)], [(4, -5), (6, -4)], [(7, -5), (6, -4)]]}, 3126:
-{'charcode': 3126, 'left': -9, 'right': 9, 'lines': [[(4, -5), (-6, 9)],
-[(5, -5), (-5, 9)], [(6, -5), (-4, 9)], [(6, -5), (-6, -5), (-6, -1)],
-[(-6, 9), (6, 9), (6, 5)], [(-5, -5), (-6, -1)], [(-4, -5), (-6, -2)],
-[(-3, -5), (-6, -3)], [(-1, -5), (-6, -4)], [(1, 9), (6, 8)], [(3, 9),
-(6, 7)], [(4, 9), (6, 6)], [(5, 9), (6, 5)]]}, 3151: {'charcode': 3151,
-'left': -11, 'right': 11, 'lines': [[(5, -5), (3, 2), (3, 6), (4, 8),
-(5, 9), (7, 9), (9, 7), (10, 5)], [(6, -5), (4, 2), (4, 8)], [(5, -5),
-(7, -5), (5, 2), (4, 6)], [(3, 2), (3, -1), (2, -4), (0, -5), (-2, -5),
-(-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4, 9), (-2, 9),
-(0, 8), (1, 7), (2, 5), (3, 2)], [(-4, -4), (-6, -1), (-7, 2), (-7, 5),
-(-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 8),
-(-4, 9)]]}, 3152: {'charcode': 3152, 'left': -9, 'right': 10, 'lines':
-[[(-2, -12), (-4, -5), (-5, 1), (-5, 5), (-4, 7), (-3, 8), (-1, 9), (1,
-9), (4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (3, -5), (1, -5),
-(-1, -4), (-2, -3), (-3, -1), (-4, 2)], [(-1, -12), (-3, -5), (-4, -1),
-(-4, 5), (-3, 8)], [(4, 7), (5, 5), (6, 2), (6, -1), (5, -3)], [(-5, -12),
-(0, -12), (-2, -5), (-4, 2)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1),
-(4, -4), (3, -5)], [(-4, -12), (-1, -11)], [(-3, -12), (-2, -10)]]}, 3153:
-{'charcode': 3153, 'left': -9, 'right': 9, 'lines': [[(5, -1), (5, -2),
-(4, -2), (4, 0), (6, 0), (6, -2), (5, -4), (3, -5), (0, -5), (-3, -4),
-(-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0, 9), (3, 8), (5,
-5)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)], [(0, -5), (-2, -3),
-(-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]}, 3154: {'charcode': 3154,
-'left': -11, 'right': 11, 'lines': [[(7, -12), (4, -1), (3, 3), (3, 6),
-(4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(8, -12), (5, -1), (4, 3),
-(4, 8)], [(4, -12), (9, -12), (5, 2), (4, 6)], [(3, 2), (3, -1), (2,
--4), (0, -5), (-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7),
-(-6, 8), (-4, 9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3),
-(-6, -1), (-7, 2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1),
-(-6, 2), (-6, 5), (-5, 8), (-4, 9)], [(5, -12), (8, -11)], [(6, -12),
-(7, -10)]]}, 3155: {'charcode': 3155, 'left': -9, 'right': 9, 'lines':
-[[(-5, 4), (-1, 3), (2, 2), (5, 0), (6, -2), (5, -4), (3, -5), (0, -5),
-(-3, -4), (-5, -1), (-6, 2), (-6, 4), (-5, 7), (-4, 8), (-2, 9), (0,
-9), (3, 8), (5, 6)], [(-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 7)],
-[(0, -5), (-2, -3), (-3, -1), (-4, 2), (-4, 5), (-3, 8), (-2, 9)]]},
-3156: {'charcode': 3156, 'left': -8, 'right': 8, 'lines': [[(8, -10),
-(8, -11), (7, -11), (7, -9), (9, -9), (9, -11), (8, -12), (6, -12), (4,
--11), (2, -9), (1, -7), (0, -4), (-1, 0), (-3, 9), (-4, 12), (-5, 14),
-(-7, 16)], [(2, -8), (1, -5), (0, 0), (-2, 9), (-3, 12)], [(6, -12), (4,
--10), (3, -8), (2, -5), (1, 0), (-1, 8), (-2, 11), (-3, 13), (-5, 15),
-(-7, 16), (-9, 16), (-10, 15), (-10, 13), (-8, 13), (-8, 15), (-9, 15),
-(-9, 14)], [(-4, -5), (7, -5)]]}, 3157: {'charcode': 3157, 'left': -10,
-'right': 11, 'lines': [[(6, -5), (2, 9), (1, 12), (-1, 15), (-3, 16)],
-[(7, -5), (3, 9), (1, 13)], [(6, -5), (8, -5), (4, 9), (2, 13), (0, 15),
-(-3, 16), (-6, 16), (-8, 15), (-9, 14), (-9, 12), (-7, 12), (-7, 14),
-(-8, 14), (-8, 13)], [(4, 2), (4, -1), (3, -4), (1, -5), (-1, -5), (-4,
--4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9),
-(1, 8), (2, 7), (3, 5), (4, 2)], [(-4, -3), (-5, -1), (-6, 2), (-6, 5),
-(-5, 7)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5), (-4, 8),
-(-3, 9)]]}, 3158: {'charcode': 3158, 'left': -11, 'right': 11, 'lines':
-[[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12), (-8, 9)], [(-6, -12), (-1,
--12), (-7, 9)], [(-5, 2), (-3, -2), (-1, -4), (1, -5), (3, -5), (5, -4),
-(6, -2), (6, 1), (4, 6)], [(5, -4), (5, 0), (4, 4), (4, 8)], [(5, -2),
-(3, 3), (3, 6), (4, 8), (5, 9), (7, 9), (9, 7), (10, 5)], [(-5, -12),
-(-2, -11)], [(-4, -12), (-3, -10)]]}, 3159: {'charcode': 3159, 'left':
--7, 'right': 6, 'lines': [[(1, -12), (1, -10), (3, -10), (3, -12), (1,
--12)], [(2, -12), (2, -10)], [(1, -11), (3, -11)], [(-6, -1), (-5, -3),
-(-3, -5), (-1, -5), (0, -4), (1, -2), (1, 1), (-1, 6)], [(0, -4), (0,
-0), (-1, 4), (-1, 8)], [(0, -2), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2,
-9), (4, 7), (5, 5)]]}, 3160: {'charcode': 3160, 'left': -7, 'right': 6,
-'lines': [[(3, -12), (3, -10), (5, -10), (5, -12), (3, -12)], [(4, -12),
-(4, -10)], [(3, -11), (5, -11)], [(-5, -1), (-4, -3), (-2, -5), (0, -5),
-(1, -4), (2, -2), (2, 1), (0, 8), (-1, 11), (-2, 13), (-4, 15), (-6, 16),
-(-8, 16), (-9, 15), (-9, 13), (-7, 13), (-7, 15), (-8, 15), (-8, 14)],
-[(1, -4), (1, 1), (-1, 8), (-2, 11), (-3, 13)], [(1, -2), (0, 2), (-2,
-9), (-3, 12), (-4, 14), (-6, 16)]]}, 3161: {'charcode': 3161, 'left':
--11, 'right': 11, 'lines': [[(-3, -12), (-9, 9), (-7, 9)], [(-2, -12),
-(-8, 9)], [(-6, -12), (-1, -12), (-7, 9)], [(7, -3), (7, -4), (6, -4),
-(6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (-1, 0), (-3, 1)],
-[(-5, 1), (-3, 1), (-1, 2), (0, 3), (2, 7), (3, 8), (5, 8)], [(-1, 3), (1,
-7), (2, 8)], [(-3, 1), (-2, 2), (0, 8), (1, 9), (3, 9), (5, 8), (7, 5)],
-[(-5, -12), (-2, -11)], [(-4, -12), (-3, -10)]]}, 3162: {'charcode': 3162,
-'left': -6, 'right': 6, 'lines': [[(2, -12), (-1, -1), (-2, 3), (-2, 6),
-(-1, 8), (0, 9), (2, 9), (4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3),
-(-1, 8)], [(-1, -12), (4, -12), (0, 2), (-1, 6)], [(0, -12), (3, -11)],
-[(1, -12), (2, -10)]]}, 3163: {'charcode': 3163, 'left': -18, 'right': 17,
-'lines': [[(-17, -1), (-16, -3), (-14, -5), (-12, -5), (-11, -4), (-10,
--2), (-10, 1), (-12, 9)], [(-11, -4), (-11, 1), (-13, 9)], [(-11, -2),
-(-12, 2), (-14, 9), (-12, 9)], [(-10, 1), (-8, -2), (-6, -4), (-4, -5),
-(-2, -5), (0, -4), (1, -2), (1, 1), (-1, 9)], [(0, -4), (0, 1), (-2, 9)],
-[(0, -2), (-1, 2), (-3, 9), (-1, 9)], [(1, 1), (3, -2), (5, -4), (7,
--5), (9, -5), (11, -4), (12, -2), (12, 1), (10, 6)], [(11, -4), (11, 0),
-(10, 4), (10, 8)], [(11, -2), (9, 3), (9, 6), (10, 8), (11, 9), (13, 9),
-(15, 7), (16, 5)]]}, 3164: {'charcode': 3164, 'left': -12, 'right': 12,
-'lines': [[(-11, -1), (-10, -3), (-8, -5), (-6, -5), (-5, -4), (-4,
--2), (-4, 1), (-6, 9)], [(-5, -4), (-5, 1), (-7, 9)], [(-5, -2), (-6,
-2), (-8, 9), (-6, 9)], [(-4, 1), (-2, -2), (0, -4), (2, -5), (4, -5),
-(6, -4), (7, -2), (7, 1), (5, 6)], [(6, -4), (6, 0), (5, 4), (5, 8)],
-[(6, -2), (4, 3), (4, 6), (5, 8), (6, 9), (8, 9), (10, 7), (11, 5)]]},
-3165: {'charcode': 3165, 'left': -10, 'right': 10, 'lines': [[(-1, -5),
-(-4, -4), (-6, -1), (-7, 2), (-7, 4), (-6, 7), (-5, 8), (-2, 9), (1, 9),
-(4, 8), (6, 5), (7, 2), (7, 0), (6, -3), (5, -4), (2, -5), (-1, -5)],
-[(-4, -3), (-5, -1), (-6, 2), (-6, 5), (-5, 7)], [(4, 7), (5, 5), (6,
-2), (6, -1), (5, -3)], [(-1, -5), (-3, -3), (-4, -1), (-5, 2), (-5, 5),
-(-4, 8), (-2, 9)], [(1, 9), (3, 7), (4, 5), (5, 2), (5, -1), (4, -4),
-(2, -5)]]}, 3166: {'charcode': 3166, 'left': -11, 'right': 11, 'lines':
-[[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1),
-(-4, 5), (-7, 16)], [(-4, -4), (-4, 1), (-5, 5), (-8, 16)], [(-4, -2),
-(-5, 2), (-9, 16)], [(-3, 2), (-2, -1), (-1, -3), (0, -4), (2, -5),
-(4, -5), (6, -4), (7, -3), (8, 0), (8, 2), (7, 5), (5, 8), (2, 9),
-(0, 9), (-2, 8), (-3, 5), (-3, 2)], [(6, -3), (7, -1), (7, 2), (6, 5),
-(5, 7)], [(4, -5), (5, -4), (6, -1), (6, 2), (5, 5), (4, 7), (2, 9)],
-[(-12, 16), (-4, 16)], [(-8, 15), (-11, 16)], [(-8, 14), (-10, 16)],
-[(-7, 14), (-6, 16)], [(-8, 15), (-5, 16)]]}, 3167: {'charcode': 3167,
-'left': -11, 'right': 10, 'lines': [[(5, -5), (-1, 16)], [(6, -5), (0,
-16)], [(5, -5), (7, -5), (1, 16)], [(3, 2), (3, -1), (2, -4), (0, -5),
-(-2, -5), (-5, -4), (-7, -1), (-8, 2), (-8, 4), (-7, 7), (-6, 8), (-4,
-9), (-2, 9), (0, 8), (1, 7), (2, 5), (3, 2)], [(-5, -3), (-6, -1), (-7,
-2), (-7, 5), (-6, 7)], [(-2, -5), (-4, -3), (-5, -1), (-6, 2), (-6, 5),
-(-5, 8), (-4, 9)], [(-4, 16), (4, 16)], [(0, 15), (-3, 16)], [(0, 14),
-(-2, 16)], [(1, 14), (2, 16)], [(0, 15), (3, 16)]]}, 3168: {'charcode':
-3168, 'left': -9, 'right': 9, 'lines': [[(-8, -1), (-7, -3), (-5, -5),
-(-3, -5), (-2, -4), (-1, -2), (-1, 2), (-3, 9)], [(-2, -4), (-2, 2),
-(-4, 9)], [(-2, -2), (-3, 2), (-5, 9), (-3, 9)], [(7, -3), (7, -4), (6,
--4), (6, -2), (8, -2), (8, -4), (7, -5), (5, -5), (3, -4), (1, -2), (-1,
-2)]]}, 3169: {'charcode': 3169, 'left': -8, 'right': 9, 'lines': [[(6,
--2), (6, -3), (5, -3), (5, -1), (7, -1), (7, -3), (6, -4), (3, -5), (0,
--5), (-3, -4), (-4, -3), (-4, -1), (-3, 1), (-1, 2), (2, 3), (4, 4), (5,
-6)], [(-3, -4), (-4, -1)], [(-3, 0), (-1, 1), (2, 2), (4, 3)], [(5, 4),
-(4, 8)], [(-4, -3), (-3, -1), (-1, 0), (2, 1), (4, 2), (5, 4), (5, 6),
-(4, 8), (1, 9), (-2, 9), (-5, 8), (-6, 7), (-6, 5), (-4, 5), (-4, 7),
-(-5, 7), (-5, 6)]]}, 3170: {'charcode': 3170, 'left': -7, 'right': 7,
-'lines': [[(2, -12), (-1, -1), (-2, 3), (-2, 6), (-1, 8), (0, 9), (2, 9),
-(4, 7), (5, 5)], [(3, -12), (0, -1), (-1, 3), (-1, 8)], [(2, -12), (4,
--12), (0, 2), (-1, 6)], [(-4, -5), (6, -5)]]}, 3171: {'charcode': 3171,
-'left': -12, 'right': 12, 'lines': [[(-11, -1), (-10, -3), (-8, -5),
-(-6, -5), (-5, -4), (-4, -2), (-4, 1), (-6, 6)], [(-5, -4), (-5, 0),
-(-6, 4), (-6, 8)], [(-5, -2), (-7, 3), (-7, 6), (-6, 8), (-4, 9), (-2,
-9), (0, 8), (2, 6), (4, 3)], [(6, -5), (4, 3), (4, 6), (5, 8), (6, 9),
-(8, 9), (10, 7), (11, 5)], [(7, -5), (5, 3), (5, 8)], [(6, -5), (8, -5),
-(6, 2), (5, 6)]]}, 3172: {'charcode': 3172, 'left': -10, 'right': 10,
-'lines': [[(-9, -1), (-8, -3), (-6, -5), (-4, -5), (-3, -4), (-2, -2),
-(-2, 1), (-4, 6)], [(-3, -4), (-3, 0), (-4, 4), (-4, 8)], [(-3, -2),
-(-5, 3), (-5, 6), (-4, 8), (-2, 9), (0, 9), (2, 8), (4, 6), (6, 3), (7,
--1), (7, -5), (6, -5), (6, -4), (7, -2)]]}, 3173: {'charcode': 3173,
-'left': -15, 'right': 15, 'lines': [[(-14, -1), (-13, -3), (-11, -5),
-(-9, -5), (-8, -4), (-7, -2), (-7, 1), (-9, 6)], [(-8, -4), (-8, 0),
-(-9, 4), (-9, 8)], [(-8, -2), (-10, 3), (-10, 6), (-9, 8), (-7, 9),
-(-5, 9), (-3, 8), (-1, 6), (0, 3)], [(2, -5), (0, 3), (0, 6), (1, 8),
-(3, 9), (5, 9), (7, 8), (9, 6), (11, 3), (12, -1), (12, -5), (11, -5),
-(11, -4), (12, -2)], [(3, -5), (1, 3), (1, 8)], [(2, -5), (4, -5),
-(2, 2), (1, 6)]]}, 3174: {'charcode': 3174, 'left': -11, 'right': 11,
-'lines': [[(-8, -1), (-6, -4), (-4, -5), (-2, -5), (0, -4), (1, -2), (1,
-0)], [(-2, -5), (-1, -4), (-1, 0), (-2, 4), (-3, 6), (-5, 8), (-7, 9),
-(-9, 9), (-10, 8), (-10, 6), (-8, 6), (-8, 8), (-9, 8), (-9, 7)], [(0,
--3), (0, 0), (-1, 4), (-1, 7)], [(8, -3), (8, -4), (7, -4), (7, -2),
-(9, -2), (9, -4), (8, -5), (6, -5), (4, -4), (2, -2), (1, 0), (0, 4),
-(0, 8), (1, 9)], [(-2, 4), (-2, 6), (-1, 8), (1, 9), (3, 9), (5, 8),
-(7, 5)]]}, 3175: {'charcode': 3175, 'left': -11, 'right': 11, 'lines':
-[[(-10, -1), (-9, -3), (-7, -5), (-5, -5), (-4, -4), (-3, -2), (-3, 1),
-(-5, 6)], [(-4, -4), (-4, 0), (-5, 4), (-5, 8)], [(-4, -2), (-6, 3),
-(-6, 6), (-5, 8), (-3, 9), (-1, 9), (1, 8), (3, 6), (5, 2)], [(7, -5),
-(3, 9), (2, 12), (0, 15), (-2, 16)], [(8, -5), (4, 9), (2, 13)], [(7, -5),
-(9, -5), (5, 9), (3, 13), (1, 15), (-2, 16), (-5, 16), (-7, 15), (-8, 14),
-(-8, 12), (-6, 12), (-6, 14), (-7, 14), (-7, 13)]]}, 3176: {'charcode':
-3176, 'left': -10, 'right': 10, 'lines': [[(7, -5), (6, -3), (4, -1),
-(-4, 5), (-6, 7), (-7, 9)], [(6, -3), (-3, -3), (-5, -2), (-6, 0)], [(4,
--3), (0, -4), (-3, -4), (-4, -3)], [(4, -3), (0, -5), (-3, -5), (-5, -3),
-(-6, 0)], [(-6, 7), (3, 7), (5, 6), (6, 4)], [(-4, 7), (0, 8), (3, 8),
-(4, 7)], [(-4, 7), (0, 9), (3, 9), (5, 7), (6, 4)]]}, 3197: {'charcode':
-3197, 'left': 0, 'right': 0, 'lines': [[]]}, 3198: {'charcode': 3198,
-'left': -4, 'right': 4, 'lines': [[]]}, 3199: {'charcode': 3199, 'left':
--8, 'right': 8, 'lines': [[]]}, 3200: {'charcode': 3200, 'left': -10,
-'right': 10, 'lines': [[(-1, -12), (-4, -11), (-6, -8), (-7, -3),
-(-7, 0), (-6, 5), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 5), (7, 0),
-(7, -3), (6, -8), (4, -11), (1, -12), (-1, -12)], [(-4, -10), (-5, -8),
-(-6, -4), (-6, 1), (-5, 5), (-4, 7)], [(4, 7), (5, 5), (6, 1), (6, -4),
-(5, -8), (4, -10)], [(-1, -12), (-3, -11), (-4, -9), (-5, -4), (-5, 1),
-(-4, 6), (-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 6), (5, 1), (5, -4),
-(4, -9), (3, -11), (1, -12)]]}, 3201: {'charcode': 3201, 'left': -10,
-'right': 10, 'lines': [[(-1, -10), (-1, 9)], [(0, -10), (0, 8)], [(1,
--12), (1, 9)], [(1, -12), (-2, -9), (-4, -8)], [(-5, 9), (5, 9)], [(-1,
-8), (-3, 9)], [(-1, 7), (-2, 9)], [(1, 7), (2, 9)], [(1, 8), (3, 9)]]},
-3202: {'charcode': 3202, 'left': -10, 'right': 10, 'lines': [[(-6, -8),
-(-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9), (-5, -9), (-4, -8),
-(-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8), (-6, -10), (-5, -11),
-(-2, -12), (2, -12), (5, -11), (6, -10), (7, -8), (7, -6), (6, -4),
-(3, -2), (-2, 0), (-4, 1), (-6, 3), (-7, 6), (-7, 9)], [(5, -10), (6,
--8), (6, -6), (5, -4)], [(2, -12), (4, -11), (5, -8), (5, -6), (4, -4),
-(2, -2), (-2, 0)], [(-7, 7), (-6, 6), (-4, 6), (1, 7), (5, 7), (7, 6)],
-[(-4, 6), (1, 8), (5, 8), (6, 7)], [(-4, 6), (1, 9), (5, 9), (6, 8),
-(7, 6), (7, 4)]]}, 3203: {'charcode': 3203, 'left': -10, 'right': 10,
-'lines': [[(-6, -8), (-6, -7), (-5, -7), (-5, -8), (-6, -8)], [(-6, -9),
-(-5, -9), (-4, -8), (-4, -7), (-5, -6), (-6, -6), (-7, -7), (-7, -8),
-(-6, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (6, -9), (6, -6),
-(5, -4), (2, -3)], [(4, -11), (5, -9), (5, -6), (4, -4)], [(1, -12),
-(3, -11), (4, -9), (4, -6), (3, -4), (1, -3)], [(-1, -3), (2, -3), (4,
--2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8),
-(-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3), (-4, 4), (-4, 5), (-5, 6),
-(-6, 6)], [(5, 0), (6, 2), (6, 5), (5, 7)], [(1, -3), (3, -2), (4, -1),
-(5, 2), (5, 5), (4, 8), (2, 9)], [(-6, 4), (-6, 5), (-5, 5), (-5, 4),
-(-6, 4)]]}, 3204: {'charcode': 3204, 'left': -10, 'right': 10, 'lines':
-[[(1, -9), (1, 9)], [(2, -10), (2, 8)], [(3, -12), (3, 9)], [(3, -12),
-(-8, 3), (8, 3)], [(-2, 9), (6, 9)], [(1, 8), (-1, 9)], [(1, 7), (0,
-9)], [(3, 7), (4, 9)], [(3, 8), (5, 9)]]}, 3205: {'charcode': 3205,
-'left': -10, 'right': 10, 'lines': [[(-5, -12), (-7, -2), (-5, -4),
-(-2, -5), (1, -5), (4, -4), (6, -2), (7, 1), (7, 3), (6, 6), (4, 8),
-(1, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5), (-7, 4), (-6, 3), (-5, 3),
-(-4, 4), (-4, 5), (-5, 6), (-6, 6)], [(5, -2), (6, 0), (6, 4), (5, 6)],
-[(1, -5), (3, -4), (4, -3), (5, 0), (5, 4), (4, 7), (3, 8), (1, 9)],
-[(-6, 4), (-6, 5), (-5, 5), (-5, 4), (-6, 4)], [(-5, -12), (5, -12)],
-[(-5, -11), (3, -11)], [(-5, -10), (-1, -10), (3, -11), (5, -12)]]},
-3206: {'charcode': 3206, 'left': -10, 'right': 10, 'lines': [[(4, -9),
-(4, -8), (5, -8), (5, -9), (4, -9)], [(5, -10), (4, -10), (3, -9), (3,
--8), (4, -7), (5, -7), (6, -8), (6, -9), (5, -11), (3, -12), (0, -12),
-(-3, -11), (-5, -9), (-6, -7), (-7, -3), (-7, 3), (-6, 6), (-4, 8),
-(-1, 9), (1, 9), (4, 8), (6, 6), (7, 3), (7, 2), (6, -1), (4, -3),
-(1, -4), (-1, -4), (-3, -3), (-4, -2), (-5, 0)], [(-4, -9), (-5, -7),
-(-6, -3), (-6, 3), (-5, 6), (-4, 7)], [(5, 6), (6, 4), (6, 1), (5, -1)],
-[(0, -12), (-2, -11), (-3, -10), (-4, -8), (-5, -4), (-5, 3), (-4, 6),
-(-3, 8), (-1, 9)], [(1, 9), (3, 8), (4, 7), (5, 4), (5, 1), (4, -2),
-(3, -3), (1, -4)]]}, 3207: {'charcode': 3207, 'left': -10, 'right': 10,
-'lines': [[(-7, -12), (-7, -6)], [(7, -12), (7, -9), (6, -6), (2, -1),
-(1, 1), (0, 5), (0, 9)], [(1, 0), (0, 2), (-1, 5), (-1, 9)], [(6, -6),
-(1, -1), (-1, 2), (-2, 5), (-2, 9), (0, 9)], [(-7, -8), (-6, -10), (-4,
--12), (-2, -12), (3, -9), (5, -9), (6, -10), (7, -12)], [(-5, -10), (-4,
--11), (-2, -11), (0, -10)], [(-7, -8), (-6, -9), (-4, -10), (-2, -10),
-(3, -9)]]}, 3208: {'charcode': 3208, 'left': -10, 'right': 10, 'lines':
-[[(-2, -12), (-5, -11), (-6, -9), (-6, -6), (-5, -4), (-2, -3), (2, -3),
-(5, -4), (6, -6), (6, -9), (5, -11), (2, -12), (-2, -12)], [(-4, -11),
-(-5, -9), (-5, -6), (-4, -4)], [(4, -4), (5, -6), (5, -9), (4, -11)],
-[(-2, -12), (-3, -11), (-4, -9), (-4, -6), (-3, -4), (-2, -3)], [(2, -3),
-(3, -4), (4, -6), (4, -9), (3, -11), (2, -12)], [(-2, -3), (-5, -2),
-(-6, -1), (-7, 1), (-7, 5), (-6, 7), (-5, 8), (-2, 9), (2, 9), (5, 8),
-(6, 7), (7, 5), (7, 1), (6, -1), (5, -2), (2, -3)], [(-5, -1), (-6, 1),
-(-6, 5), (-5, 7)], [(5, 7), (6, 5), (6, 1), (5, -1)], [(-2, -3), (-4, -2),
-(-5, 1), (-5, 5), (-4, 8), (-2, 9)], [(2, 9), (4, 8), (5, 5), (5, 1),
-(4, -2), (2, -3)]]}, 3209: {'charcode': 3209, 'left': -10, 'right': 10,
-'lines': [[(-5, 5), (-5, 6), (-4, 6), (-4, 5), (-5, 5)], [(5, -3), (4,
--1), (3, 0), (1, 1), (-1, 1), (-4, 0), (-6, -2), (-7, -5), (-7, -6),
-(-6, -9), (-4, -11), (-1, -12), (1, -12), (4, -11), (6, -9), (7, -6),
-(7, 0), (6, 4), (5, 6), (3, 8), (0, 9), (-3, 9), (-5, 8), (-6, 6), (-6,
-5), (-5, 4), (-4, 4), (-3, 5), (-3, 6), (-4, 7), (-5, 7)], [(-5, -2),
-(-6, -4), (-6, -7), (-5, -9)], [(4, -10), (5, -9), (6, -6), (6, 0), (5,
-4), (4, 6)], [(-1, 1), (-3, 0), (-4, -1), (-5, -4), (-5, -7), (-4, -10),
-(-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9), (5, -6), (5, 1),
-(4, 5), (3, 7), (2, 8), (0, 9)]]}, 3210: {'charcode': 3210, 'left':
--5, 'right': 6, 'lines': [[(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9),
-(2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0,
-7)]]}, 3211: {'charcode': 3211, 'left': -5, 'right': 6, 'lines': [[(2,
-8), (1, 9), (0, 9), (-1, 8), (-1, 7), (0, 6), (1, 6), (2, 7), (2, 10),
-(1, 12), (-1, 13)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9),
-(2, 10)], [(2, 8), (1, 12)]]}, 3212: {'charcode': 3212, 'left': -5,
-'right': 6, 'lines': [[(0, -5), (-1, -4), (-1, -3), (0, -2), (1, -2),
-(2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4), (0, -3), (1, -3), (1,
--4), (0, -4)], [(0, 6), (-1, 7), (-1, 8), (0, 9), (1, 9), (2, 8), (2,
-7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1, 8), (1, 7), (0, 7)]]}, 3213:
-{'charcode': 3213, 'left': -5, 'right': 6, 'lines': [[(0, -5), (-1, -4),
-(-1, -3), (0, -2), (1, -2), (2, -3), (2, -4), (1, -5), (0, -5)], [(0, -4),
-(0, -3), (1, -3), (1, -4), (0, -4)], [(2, 8), (1, 9), (0, 9), (-1, 8),
-(-1, 7), (0, 6), (1, 6), (2, 7), (2, 10), (1, 12), (-1, 13)], [(0, 7),
-(0, 8), (1, 8), (1, 7), (0, 7)], [(1, 9), (2, 10)], [(2, 8), (1, 12)]]},
-3214: {'charcode': 3214, 'left': -5, 'right': 6, 'lines': [[(0, -12),
-(-1, -11), (-1, -9), (0, -1)], [(0, -12), (0, 2), (1, 2)], [(0, -12),
-(1, -12), (1, 2)], [(1, -12), (2, -11), (2, -9), (1, -1)], [(0, 6), (-1,
-7), (-1, 8), (0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7),
-(0, 8), (1, 8), (1, 7), (0, 7)]]}, 3215: {'charcode': 3215, 'left': -9,
-'right': 10, 'lines': [[(-5, -7), (-5, -8), (-4, -8), (-4, -6), (-6, -6),
-(-6, -8), (-5, -10), (-4, -11), (-2, -12), (2, -12), (5, -11), (6, -10),
-(7, -8), (7, -6), (6, -4), (5, -3), (1, -1)], [(5, -10), (6, -9), (6,
--5), (5, -4)], [(2, -12), (4, -11), (5, -9), (5, -5), (4, -3), (3, -2)],
-[(0, -1), (0, 2), (1, 2), (1, -1), (0, -1)], [(0, 6), (-1, 7), (-1, 8),
-(0, 9), (1, 9), (2, 8), (2, 7), (1, 6), (0, 6)], [(0, 7), (0, 8), (1,
-8), (1, 7), (0, 7)]]}, 3216: {'charcode': 3216, 'left': -5, 'right': 6,
-'lines': [[(2, -12), (0, -11), (-1, -9), (-1, -6), (0, -5), (1, -5), (2,
--6), (2, -7), (1, -8), (0, -8), (-1, -7)], [(0, -7), (0, -6), (1, -6),
-(1, -7), (0, -7)], [(0, -11), (-1, -7)], [(-1, -9), (0, -8)]]}, 3217:
-{'charcode': 3217, 'left': -5, 'right': 6, 'lines': [[(2, -10), (1, -9),
-(0, -9), (-1, -10), (-1, -11), (0, -12), (1, -12), (2, -11), (2, -8),
-(1, -6), (-1, -5)], [(0, -11), (0, -10), (1, -10), (1, -11), (0, -11)],
-[(1, -9), (2, -8)], [(2, -10), (1, -6)]]}, 3218: {'charcode': 3218,
-'left': -13, 'right': 13, 'lines': [[(9, -3), (9, -4), (8, -4), (8, -2),
-(10, -2), (10, -4), (9, -5), (8, -5), (7, -4), (6, -2), (4, 3), (2, 6),
-(0, 8), (-2, 9), (-6, 9), (-8, 8), (-9, 6), (-9, 3), (-8, 1), (-2, -3),
-(0, -5), (1, -7), (1, -9), (0, -11), (-2, -12), (-4, -11), (-5, -9),
-(-5, -6), (-4, -3), (-2, 0), (2, 5), (5, 8), (7, 9), (9, 9), (10, 7),
-(10, 6)], [(-7, 8), (-8, 6), (-8, 3), (-7, 1), (-6, 0)], [(0, -5), (1,
--9)], [(1, -7), (0, -11)], [(-4, -11), (-5, -7)], [(-4, -4), (-2, -1),
-(2, 4), (5, 7), (7, 8)], [(-4, 9), (-6, 8), (-7, 6), (-7, 3), (-6, 1),
-(-2, -3)], [(-5, -9), (-4, -5), (-1, -1), (3, 4), (6, 7), (8, 8), (9, 8),
-(10, 7)]]}, 3219: {'charcode': 3219, 'left': -10, 'right': 10, 'lines':
-[[(-2, -16), (-2, 13)], [(2, -16), (2, 13)], [(6, -7), (6, -8), (5, -8),
-(5, -6), (7, -6), (7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5,
--11), (-7, -9), (-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3),
-(6, 6), (5, 8)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0), (6, 2)],
-[(-5, -11), (-6, -9), (-6, -7), (-5, -5), (-3, -4), (3, -2), (6, 0), (7,
-2), (7, 5), (6, 7), (5, 8), (2, 9), (-2, 9), (-5, 8), (-6, 7), (-7, 5),
-(-7, 3), (-5, 3), (-5, 5), (-6, 5), (-6, 4)]]}, 3220: {'charcode': 3220,
-'left': -11, 'right': 12, 'lines': [[(9, -16), (-9, 16), (-8, 16)],
-[(9, -16), (10, -16), (-8, 16)]]}, 3221: {'charcode': 3221, 'left': -7,
-'right': 7, 'lines': [[(3, -16), (1, -14), (-1, -11), (-3, -7), (-4, -2),
-(-4, 2), (-3, 7), (-1, 11), (1, 14), (3, 16)], [(-1, -10), (-2, -7),
-(-3, -3), (-3, 3), (-2, 7), (-1, 10)], [(1, -14), (0, -12), (-1, -9),
-(-2, -3), (-2, 3), (-1, 9), (0, 12), (1, 14)]]}, 3222: {'charcode': 3222,
-'left': -7, 'right': 7, 'lines': [[(-3, -16), (-1, -14), (1, -11), (3,
--7), (4, -2), (4, 2), (3, 7), (1, 11), (-1, 14), (-3, 16)], [(1, -10),
-(2, -7), (3, -3), (3, 3), (2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9),
-(2, -3), (2, 3), (1, 9), (0, 12), (-1, 14)]]}, 3223: {'charcode': 3223,
-'left': -8, 'right': 8, 'lines': [[(0, -12), (-1, -11), (1, -1), (0, 0)],
-[(0, -12), (0, 0)], [(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9),
-(-4, -9), (4, -3), (5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8),
-(5, -4), (5, -3)], [(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9),
-(-5, -3)], [(5, -9), (5, -8), (-5, -4), (-5, -3)]]}, 3224: {'charcode':
-3224, 'left': -12, 'right': 13, 'lines': [[(-8, -1), (9, -1), (9, 0)],
-[(-8, -1), (-8, 0), (9, 0)]]}, 3225: {'charcode': 3225, 'left': -12,
-'right': 13, 'lines': [[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9),
-(1, 8)], [(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]},
-3226: {'charcode': 3226, 'left': -12, 'right': 13, 'lines': [[(-8, -5),
-(9, -5), (9, -4)], [(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3),
-(9, 4)], [(-8, 3), (-8, 4), (9, 4)]]}, 3227: {'charcode': 3227, 'left':
--4, 'right': 5, 'lines': [[(1, -12), (0, -11), (0, -5)], [(1, -11),
-(0, -5)], [(1, -12), (2, -11), (0, -5)]]}, 3228: {'charcode': 3228,
-'left': -9, 'right': 9, 'lines': [[(-4, -12), (-5, -11), (-5, -5)],
-[(-4, -11), (-5, -5)], [(-4, -12), (-3, -11), (-5, -5)], [(5, -12), (4,
--11), (4, -5)], [(5, -11), (4, -5)], [(5, -12), (6, -11), (4, -5)]]},
-3229: {'charcode': 3229, 'left': -7, 'right': 7, 'lines': [[(-1, -12),
-(-3, -11), (-4, -9), (-4, -7), (-3, -5), (-1, -4), (1, -4), (3, -5),
-(4, -7), (4, -9), (3, -11), (1, -12), (-1, -12)], [(-1, -12), (-4, -9),
-(-3, -5), (1, -4), (4, -7), (3, -11), (-1, -12)], [(1, -12), (-3, -11),
-(-4, -7), (-1, -4), (3, -5), (4, -9), (1, -12)]]}, 3247: {'charcode':
-3247, 'left': 0, 'right': 0, 'lines': [[]]}, 3248: {'charcode': 3248,
-'left': -4, 'right': 4, 'lines': [[]]}, 3249: {'charcode': 3249, 'left':
--8, 'right': 8, 'lines': [[]]}, 3250: {'charcode': 3250, 'left': -10,
-'right': 11, 'lines': [[(2, -12), (-1, -11), (-3, -9), (-5, -6), (-6, -3),
-(-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (-1, 9), (2, 8), (4, 6), (6,
-3), (7, 0), (8, -4), (8, -7), (7, -10), (6, -11), (4, -12), (2, -12)],
-[(-1, -10), (-3, -8), (-4, -6), (-5, -3), (-6, 1), (-6, 5), (-5, 7)],
-[(2, 7), (4, 5), (5, 3), (6, 0), (7, -4), (7, -8), (6, -10)], [(2, -12),
-(0, -11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8),
-(-3, 9)], [(-1, 9), (1, 8), (3, 5), (4, 3), (5, 0), (6, -4), (6, -9),
-(5, -11), (4, -12)]]}, 3251: {'charcode': 3251, 'left': -10, 'right':
-11, 'lines': [[(2, -8), (-3, 9), (-1, 9)], [(5, -12), (3, -8), (-2, 9)],
-[(5, -12), (-1, 9)], [(5, -12), (2, -9), (-1, -7), (-3, -6)], [(2, -8),
-(0, -7), (-3, -6)]]}, 3252: {'charcode': 3252, 'left': -10, 'right': 11,
-'lines': [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8),
-(-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7),
-(7, -5), (5, -3), (-5, 3), (-7, 5), (-9, 9)], [(6, -11), (7, -9), (7,
--7), (6, -5), (4, -3), (1, -1)], [(4, -12), (5, -11), (6, -9), (6, -7),
-(5, -5), (3, -3), (-5, 3)], [(-8, 7), (-7, 6), (-5, 6), (0, 7), (5, 7),
-(6, 6)], [(-5, 6), (0, 8), (5, 8)], [(-5, 6), (0, 9), (3, 9), (5, 8),
-(6, 6), (6, 5)]]}, 3253: {'charcode': 3253, 'left': -10, 'right': 11,
-'lines': [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8),
-(-3, -10), (-2, -11), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7),
-(7, -5), (6, -4), (4, -3), (1, -2)], [(6, -11), (7, -9), (7, -7), (6,
--5), (5, -4)], [(4, -12), (5, -11), (6, -9), (6, -7), (5, -5), (3, -3),
-(1, -2)], [(-1, -2), (1, -2), (4, -1), (5, 0), (6, 2), (6, 5), (5, 7),
-(3, 8), (0, 9), (-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3),
-(-6, 5), (-7, 5), (-7, 4)], [(4, 0), (5, 2), (5, 5), (4, 7)], [(1, -2),
-(3, -1), (4, 1), (4, 5), (3, 7), (2, 8), (0, 9)]]}, 3254: {'charcode':
-3254, 'left': -10, 'right': 11, 'lines': [[(5, -8), (0, 9), (2, 9)],
-[(8, -12), (6, -8), (1, 9)], [(8, -12), (2, 9)], [(8, -12), (-8, 3),
-(8, 3)]]}, 3255: {'charcode': 3255, 'left': -10, 'right': 11, 'lines':
-[[(-1, -12), (-6, -2)], [(-1, -12), (9, -12)], [(-1, -11), (7, -11)],
-[(-2, -10), (3, -10), (7, -11), (9, -12)], [(-6, -2), (-5, -3), (-2,
--4), (1, -4), (4, -3), (5, -2), (6, 0), (6, 3), (5, 6), (3, 8), (-1, 9),
-(-4, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5),
-(-7, 4)], [(4, -2), (5, 0), (5, 3), (4, 6), (2, 8)], [(1, -4), (3, -3),
-(4, -1), (4, 3), (3, 6), (1, 8), (-1, 9)]]}, 3256: {'charcode': 3256,
-'left': -10, 'right': 11, 'lines': [[(7, -8), (7, -9), (6, -9), (6, -7),
-(8, -7), (8, -9), (7, -11), (5, -12), (2, -12), (-1, -11), (-3, -9),
-(-5, -6), (-6, -3), (-7, 1), (-7, 4), (-6, 7), (-5, 8), (-3, 9), (0, 9),
-(3, 8), (5, 6), (6, 4), (6, 1), (5, -1), (4, -2), (2, -3), (-1, -3),
-(-3, -2), (-4, -1), (-5, 1)], [(-2, -9), (-4, -6), (-5, -3), (-6, 1),
-(-6, 5), (-5, 7)], [(4, 6), (5, 4), (5, 1), (4, -1)], [(2, -12), (0,
--11), (-2, -8), (-3, -6), (-4, -3), (-5, 1), (-5, 6), (-4, 8), (-3,
-9)], [(0, 9), (2, 8), (3, 7), (4, 4), (4, 0), (3, -2), (2, -3)]]},
-3257: {'charcode': 3257, 'left': -10, 'right': 11, 'lines': [[(-4,
--12), (-6, -6)], [(9, -12), (8, -9), (6, -6), (2, -1), (0, 2), (-1,
-5), (-2, 9)], [(0, 1), (-2, 5), (-3, 9)], [(6, -6), (0, 0), (-2, 3),
-(-3, 5), (-4, 9), (-2, 9)], [(-5, -9), (-2, -12), (0, -12), (5, -9)],
-[(-3, -11), (0, -11), (5, -9)], [(-5, -9), (-3, -10), (0, -10), (5,
--9), (7, -9), (8, -10), (9, -12)]]}, 3258: {'charcode': 3258, 'left':
--10, 'right': 11, 'lines': [[(1, -12), (-2, -11), (-3, -10), (-4, -8),
-(-4, -5), (-3, -3), (-1, -2), (2, -2), (5, -3), (7, -4), (8, -6), (8,
--9), (7, -11), (5, -12), (1, -12)], [(3, -12), (-2, -11)], [(-2, -10),
-(-3, -8), (-3, -4), (-2, -3)], [(-3, -3), (0, -2)], [(1, -2), (5, -3)],
-[(6, -4), (7, -6), (7, -9), (6, -11)], [(7, -11), (3, -12)], [(1, -12),
-(-1, -10), (-2, -8), (-2, -4), (-1, -2)], [(2, -2), (4, -3), (5, -4),
-(6, -6), (6, -10), (5, -12)], [(-1, -2), (-5, -1), (-7, 1), (-8, 3),
-(-8, 6), (-7, 8), (-4, 9), (0, 9), (4, 8), (5, 7), (6, 5), (6, 2), (5,
-0), (4, -1), (2, -2)], [(0, -2), (-5, -1)], [(-4, -1), (-6, 1), (-7, 3),
-(-7, 6), (-6, 8)], [(-7, 8), (-2, 9), (4, 8)], [(4, 7), (5, 5), (5, 2),
-(4, 0)], [(4, -1), (1, -2)], [(-1, -2), (-3, -1), (-5, 1), (-6, 3),
-(-6, 6), (-5, 8), (-4, 9)], [(0, 9), (2, 8), (3, 7), (4, 5), (4, 1),
-(3, -1), (2, -2)]]}, 3259: {'charcode': 3259, 'left': -10, 'right':
-11, 'lines': [[(6, -4), (5, -2), (4, -1), (2, 0), (-1, 0), (-3, -1),
-(-4, -2), (-5, -4), (-5, -7), (-4, -9), (-2, -11), (1, -12), (4, -12),
-(6, -11), (7, -10), (8, -7), (8, -4), (7, 0), (6, 3), (4, 6), (2, 8),
-(-1, 9), (-4, 9), (-6, 8), (-7, 6), (-7, 4), (-5, 4), (-5, 6), (-6, 6),
-(-6, 5)], [(-3, -2), (-4, -4), (-4, -7), (-3, -9)], [(6, -10), (7, -8),
-(7, -4), (6, 0), (5, 3), (3, 6)], [(-1, 0), (-2, -1), (-3, -3), (-3, -7),
-(-2, -10), (-1, -11), (1, -12)], [(4, -12), (5, -11), (6, -9), (6, -4),
-(5, 0), (4, 3), (3, 5), (1, 8), (-1, 9)]]}, 3260: {'charcode': 3260,
-'left': -5, 'right': 6, 'lines': [[(-2, 6), (-3, 7), (-3, 8), (-2, 9),
-(-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8),
-(-1, 7), (-2, 7)]]}, 3261: {'charcode': 3261, 'left': -5, 'right': 6,
-'lines': [[(-1, 9), (-2, 9), (-3, 8), (-3, 7), (-2, 6), (-1, 6), (0,
-7), (0, 9), (-1, 11), (-2, 12), (-4, 13)], [(-2, 7), (-2, 8), (-1, 8),
-(-1, 7), (-2, 7)], [(-1, 9), (-1, 10), (-2, 12)]]}, 3262: {'charcode':
-3262, 'left': -5, 'right': 6, 'lines': [[(1, -5), (0, -4), (0, -3),
-(1, -2), (2, -2), (3, -3), (3, -4), (2, -5), (1, -5)], [(1, -4), (1,
--3), (2, -3), (2, -4), (1, -4)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9),
-(-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8),
-(-1, 7), (-2, 7)]]}, 3263: {'charcode': 3263, 'left': -5, 'right': 6,
-'lines': [[(1, -5), (0, -4), (0, -3), (1, -2), (2, -2), (3, -3), (3,
--4), (2, -5), (1, -5)], [(1, -4), (1, -3), (2, -3), (2, -4), (1, -4)],
-[(-1, 9), (-2, 9), (-3, 8), (-3, 7), (-2, 6), (-1, 6), (0, 7), (0, 9),
-(-1, 11), (-2, 12), (-4, 13)], [(-2, 7), (-2, 8), (-1, 8), (-1, 7),
-(-2, 7)], [(-1, 9), (-1, 10), (-2, 12)]]}, 3264: {'charcode': 3264,
-'left': -5, 'right': 6, 'lines': [[(4, -12), (3, -12), (2, -11), (0,
-2)], [(4, -11), (3, -11), (0, 2)], [(4, -11), (4, -10), (0, 2)], [(4,
--12), (5, -11), (5, -10), (0, 2)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9),
-(-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8),
-(-1, 7), (-2, 7)]]}, 3265: {'charcode': 3265, 'left': -10, 'right': 11,
-'lines': [[(-3, -7), (-3, -8), (-2, -8), (-2, -6), (-4, -6), (-4, -8),
-(-3, -10), (-2, -11), (1, -12), (5, -12), (8, -11), (9, -9), (9, -7),
-(8, -5), (7, -4), (5, -3), (1, -2), (-1, -1), (-1, 1), (1, 2), (2, 2)],
-[(3, -12), (8, -11)], [(7, -11), (8, -9), (8, -7), (7, -5), (6, -4),
-(4, -3)], [(5, -12), (6, -11), (7, -9), (7, -7), (6, -5), (5, -4),
-(1, -2), (0, -1), (0, 1), (1, 2)], [(-2, 6), (-3, 7), (-3, 8), (-2, 9),
-(-1, 9), (0, 8), (0, 7), (-1, 6), (-2, 6)], [(-2, 7), (-2, 8), (-1, 8),
-(-1, 7), (-2, 7)]]}, 3266: {'charcode': 3266, 'left': -5, 'right': 6,
-'lines': [[(5, -12), (3, -11), (2, -10), (1, -8), (1, -6), (2, -5), (3,
--5), (4, -6), (4, -7), (3, -8), (2, -8)], [(3, -11), (2, -9), (2, -8)],
-[(2, -7), (2, -6), (3, -6), (3, -7), (2, -7)]]}, 3267: {'charcode': 3267,
-'left': -5, 'right': 6, 'lines': [[(4, -9), (3, -9), (2, -10), (2, -11),
-(3, -12), (4, -12), (5, -11), (5, -9), (4, -7), (3, -6), (1, -5)],
-[(3, -11), (3, -10), (4, -10), (4, -11), (3, -11)], [(4, -9), (4, -8),
-(3, -6)]]}, 3268: {'charcode': 3268, 'left': -13, 'right': 13, 'lines':
-[[(10, -3), (10, -4), (9, -4), (9, -2), (11, -2), (11, -4), (10, -5),
-(9, -5), (7, -4), (5, -2), (0, 6), (-2, 8), (-4, 9), (-7, 9), (-10, 8),
-(-11, 6), (-11, 4), (-10, 2), (-9, 1), (-7, 0), (-2, -2), (0, -3),
-(2, -5), (3, -7), (3, -9), (2, -11), (0, -12), (-2, -11), (-3, -9),
-(-3, -6), (-2, 0), (-1, 3), (0, 5), (2, 8), (4, 9), (6, 9), (7, 7),
-(7, 6)], [(-6, 9), (-10, 8)], [(-9, 8), (-10, 6), (-10, 4), (-9, 2),
-(-8, 1), (-6, 0)], [(-2, -2), (-1, 1), (2, 7), (4, 8)], [(-7, 9), (-8,
-8), (-9, 6), (-9, 4), (-8, 2), (-7, 1), (-5, 0), (0, -3)], [(-3, -6),
-(-2, -3), (-1, 0), (1, 4), (3, 7), (5, 8), (6, 8), (7, 7)]]}, 3269:
-{'charcode': 3269, 'left': -10, 'right': 11, 'lines': [[(2, -16),
-(-6, 13)], [(7, -16), (-1, 13)], [(8, -7), (8, -8), (7, -8), (7, -6),
-(9, -6), (9, -8), (8, -10), (7, -11), (4, -12), (0, -12), (-3, -11),
-(-5, -9), (-5, -6), (-4, -4), (-2, -2), (4, 1), (5, 3), (5, 6), (4, 8)],
-[(-4, -6), (-3, -4), (4, 0), (5, 2)], [(-3, -11), (-4, -9), (-4, -7),
-(-3, -5), (3, -2), (5, 0), (6, 2), (6, 5), (5, 7), (4, 8), (1, 9),
-(-3, 9), (-6, 8), (-7, 7), (-8, 5), (-8, 3), (-6, 3), (-6, 5), (-7, 5),
-(-7, 4)]]}, 3270: {'charcode': 3270, 'left': -11, 'right': 12, 'lines':
-[[(13, -16), (-13, 16), (-12, 16)], [(13, -16), (14, -16), (-12, 16)]]},
-3271: {'charcode': 3271, 'left': -8, 'right': 8, 'lines': [[(8, -16), (6,
--15), (3, -13), (0, -10), (-2, -7), (-4, -3), (-5, 1), (-5, 6), (-4, 10),
-(-3, 13), (-1, 16)], [(1, -10), (-1, -7), (-3, -3), (-4, 2), (-4, 10)],
-[(8, -16), (5, -14), (2, -11), (0, -8), (-1, -6), (-2, -3), (-3, 1),
-(-4, 10)], [(-4, 2), (-3, 11), (-2, 14), (-1, 16)]]}, 3272: {'charcode':
-3272, 'left': -8, 'right': 8, 'lines': [[(1, -16), (3, -13), (4, -10),
-(5, -6), (5, -1), (4, 3), (2, 7), (0, 10), (-3, 13), (-6, 15), (-8, 16)],
-[(4, -10), (4, -2), (3, 3), (1, 7), (-1, 10)], [(1, -16), (2, -14), (3,
--11), (4, -2)], [(4, -10), (3, -1), (2, 3), (1, 6), (0, 8), (-2, 11),
-(-5, 14), (-8, 16)]]}, 3273: {'charcode': 3273, 'left': -8, 'right': 9,
-'lines': [[(2, -12), (1, -11), (3, -1), (2, 0)], [(2, -12), (2, 0)],
-[(2, -12), (3, -11), (1, -1), (2, 0)], [(-3, -9), (-2, -9), (6, -3),
-(7, -3)], [(-3, -9), (7, -3)], [(-3, -9), (-3, -8), (7, -4), (7, -3)],
-[(7, -9), (6, -9), (-2, -3), (-3, -3)], [(7, -9), (-3, -3)], [(7, -9),
-(7, -8), (-3, -4), (-3, -3)]]}, 3274: {'charcode': 3274, 'left': -12,
-'right': 13, 'lines': [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0),
-(9, 0)]]}, 3275: {'charcode': 3275, 'left': -12, 'right': 13, 'lines':
-[[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9,
--1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]}, 3276: {'charcode': 3276,
-'left': -12, 'right': 13, 'lines': [[(-8, -5), (9, -5), (9, -4)],
-[(-8, -5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3),
-(-8, 4), (9, 4)]]}, 3277: {'charcode': 3277, 'left': -5, 'right': 5,
-'lines': [[(3, -12), (2, -11), (0, -5)], [(3, -11), (0, -5)], [(3, -12),
-(4, -11), (0, -5)]]}, 3278: {'charcode': 3278, 'left': -10, 'right': 10,
-'lines': [[(-2, -12), (-3, -11), (-5, -5)], [(-2, -11), (-5, -5)], [(-2,
--12), (-1, -11), (-5, -5)], [(8, -12), (7, -11), (5, -5)], [(8, -11),
-(5, -5)], [(8, -12), (9, -11), (5, -5)]]}, 3279: {'charcode': 3279,
-'left': -7, 'right': 8, 'lines': [[(1, -12), (-1, -11), (-2, -9), (-2,
--7), (-1, -5), (1, -4), (3, -4), (5, -5), (6, -7), (6, -9), (5, -11),
-(3, -12), (1, -12)], [(1, -12), (-2, -9), (-1, -5), (3, -4), (6, -7),
-(5, -11), (1, -12)], [(3, -12), (-1, -11), (-2, -7), (1, -4), (5, -5),
-(6, -9), (3, -12)]]}, 3301: {'charcode': 3301, 'left': -12, 'right': 12,
-'lines': [[(-9, -10), (-8, -9), (-9, -8), (-10, -9), (-9, -11), (-7, -12),
-(-5, -12), (-3, -11), (-2, -10), (-1, -7), (-1, -3), (-2, 0), (-4, 2),
-(-6, 3), (-9, 4)], [(-3, -10), (-2, -7), (-2, -2), (-3, 0)], [(-5, -12),
-(-4, -11), (-3, -8), (-3, -2), (-4, 1), (-6, 3)], [(-6, 4), (-3, 7)],
-[(-7, 4), (-3, 8)], [(-9, 4), (-4, 9), (3, 4)], [(10, -11), (9, -10),
-(10, -10), (10, -11), (9, -12), (7, -12), (5, -11), (4, -10), (3, -8),
-(3, 7), (5, 9), (9, 5)], [(5, -10), (4, -8), (4, 6), (6, 8)], [(7, -12),
-(6, -11), (5, -8), (5, 5), (7, 7)]]}, 3302: {'charcode': 3302, 'left':
--13, 'right': 13, 'lines': [[(-11, -1), (-11, 0), (-10, 1), (-8, 1),
-(-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3),
-(-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9),
-(-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0),
-(-1, 3), (-3, 5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11),
-(-2, -8), (-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12),
-(7, -11), (8, -10), (9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12),
-(6, -11), (7, -8), (8, -7), (10, -7)], [(10, -7), (0, -2)], [(7, -5),
-(9, -3), (10, 0), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8,
-5), (-9, 5), (-10, 6)], [(6, -4), (7, -4), (9, -2)], [(4, -4), (7, -3),
-(9, -1), (10, 1)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8),
-(3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9),
-(-8, 8), (-9, 7)]]}, 3303: {'charcode': 3303, 'left': -12, 'right': 12,
-'lines': [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9,
--4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7,
-7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7),
-(-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3),
-(-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10),
-(-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1,
--7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4),
-(4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12),
-(4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2,
--11), (4, -9), (6, -9), (8, -10), (9, -11)]]}, 3304: {'charcode': 3304,
-'left': -13, 'right': 13, 'lines': [[(-10, -6), (-10, -7), (-9, -9),
-(-7, -11), (-4, -12), (0, -12), (3, -11), (5, -10), (7, -8), (9, -5),
-(10, -1), (10, 3), (9, 6), (7, 8), (4, 9), (1, 9), (-2, 8), (-8, 5),
-(-9, 5), (-10, 6)], [(-7, -10), (-5, -11), (0, -11), (3, -10), (5, -9),
-(7, -7), (9, -4)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(-10, -7), (-8,
--9), (-5, -10), (0, -10), (3, -9), (5, -8), (7, -6), (9, -3), (10, 0)],
-[(8, 7), (6, 8), (3, 8), (0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6),
-(-10, 8), (-9, 9), (-8, 8), (-9, 7)], [(-2, -10), (-5, -7), (-6, -5),
-(-6, -3), (-4, 1), (-4, 3)], [(-5, -4), (-5, -3), (-4, -1), (-4, 0)],
-[(-5, -7), (-5, -5), (-3, -1), (-3, 1), (-4, 3), (-5, 4), (-7, 4),
-(-8, 3), (-8, 2)]]}, 3305: {'charcode': 3305, 'left': -12, 'right': 12,
-'lines': [[(0, -10), (-2, -12), (-4, -12), (-6, -11), (-8, -8), (-9,
--4), (-9, 0), (-8, 4), (-6, 7), (-4, 8), (-1, 9), (2, 9), (5, 8), (7,
-7), (9, 5)], [(-6, -10), (-7, -8), (-8, -5), (-8, 0), (-7, 4), (-5, 7),
-(-2, 8)], [(-4, -12), (-5, -11), (-6, -9), (-7, -5), (-7, -1), (-6, 3),
-(-5, 5), (-3, 7), (0, 8), (3, 8), (6, 7), (9, 5)], [(3, -12), (0, -10),
-(-1, -9), (-2, -7), (-2, -6), (-1, -4), (2, -2), (3, 0), (3, 2)], [(-1,
--7), (-1, -6), (3, -2), (3, -1)], [(-1, -9), (-1, -8), (0, -6), (3, -4),
-(4, -2), (4, 0), (3, 2), (1, 3), (0, 3), (-2, 2), (-3, 0)], [(3, -12),
-(4, -11), (6, -10), (8, -10)], [(3, -11), (4, -10), (5, -10)], [(2, -11),
-(4, -9), (6, -9), (8, -10), (9, -11)], [(3, -4), (7, -7)], [(7, -7), (8,
--6), (10, -6)], [(6, -6), (7, -5), (8, -5)], [(5, -5), (6, -4), (8, -4),
-(10, -6)]]}, 3306: {'charcode': 3306, 'left': -12, 'right': 12, 'lines':
-[[(-5, -4), (-7, -5), (-8, -7), (-8, -9), (-7, -11), (-4, -12), (-1,
--12), (2, -11), (6, -9)], [(-7, -10), (-5, -11), (0, -11), (3, -10)],
-[(-8, -7), (-7, -9), (-5, -10), (0, -10), (6, -9), (8, -9), (9, -10),
-(9, -11), (8, -12), (7, -12)], [(1, -10), (0, -9), (-1, -7), (-1, -5),
-(0, -3), (4, 1), (5, 4), (5, 7), (4, 10), (3, 11), (1, 12)], [(2, -2),
-(5, 1), (6, 4), (6, 7), (5, 9)], [(-1, -5), (1, -3), (4, -1), (6, 1),
-(7, 4), (7, 7), (6, 9), (4, 11), (1, 12), (-3, 12), (-6, 11), (-7, 10),
-(-8, 8), (-8, 5), (-6, 2), (-6, 0), (-7, -1)], [(-6, 10), (-7, 9), (-7,
-5), (-6, 3)], [(-3, 12), (-5, 11), (-6, 9), (-6, 5), (-5, 2), (-5, 0),
-(-6, -1), (-8, -1), (-9, 0), (-9, 1)], [(3, -2), (7, -6)], [(7, -6), (8,
--5), (10, -5)], [(6, -5), (7, -4), (8, -4)], [(5, -4), (6, -3), (8, -3),
-(10, -5)]]}, 3307: {'charcode': 3307, 'left': -13, 'right': 13, 'lines':
-[[(3, -8), (2, -10), (1, -11), (-1, -12), (-4, -12), (-7, -11), (-9,
--8), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9),
-(2, 9), (5, 8), (7, 7), (9, 5), (10, 2), (10, -1), (9, -4), (7, -6)],
-[(-7, -10), (-8, -8), (-9, -5), (-9, 0), (-8, 3), (-7, 5)], [(8, 5),
-(9, 3), (9, -1), (8, -4), (7, -5)], [(-4, -12), (-6, -11), (-7, -9),
-(-8, -5), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(5, 8), (7, 6), (8, 3),
-(8, -1), (7, -3), (5, -5)], [(3, -12), (0, -10), (-2, -8), (-3, -6),
-(-3, -5), (-2, -3), (1, -1), (2, 1), (2, 3)], [(-2, -6), (-2, -5), (2,
--1), (2, 0)], [(-2, -8), (-2, -7), (-1, -5), (2, -3), (3, -1), (3, 1),
-(2, 3), (0, 4), (-1, 4), (-3, 3), (-4, 1)], [(2, -3), (7, -6), (8, -8)],
-[(10, -12), (8, -8)], [(7, -11), (11, -9)], [(10, -12), (9, -11), (7,
--11), (8, -10), (8, -8), (9, -9), (11, -9), (10, -10), (10, -12)]]},
-3308: {'charcode': 3308, 'left': -12, 'right': 13, 'lines': [[(0, -12),
-(-2, -11), (-4, -9), (-5, -7), (-5, -5), (-4, -3), (-2, -1), (-1, 1),
-(-1, 3)], [(-4, -6), (-4, -5), (-1, -1), (-1, 0)], [(-4, -9), (-4, -7),
-(-3, -5), (-1, -3), (0, -1), (0, 1), (-1, 3), (-2, 4), (-4, 5), (-6, 5),
-(-8, 4), (-9, 3), (-10, 1), (-10, -1), (-9, -2), (-8, -1), (-9, 0)], [(0,
--12), (2, -10), (4, -10), (6, -11)], [(-1, -11), (1, -10)], [(-2, -11),
-(-1, -10), (1, -9), (3, -9), (6, -11)], [(0, -2), (7, -7)], [(7, -7),
-(9, -4), (10, -1), (10, 2), (9, 5), (7, 7), (4, 8), (0, 9)], [(6, -6),
-(8, -4), (9, -1), (9, 3), (8, 5)], [(4, -5), (5, -5), (7, -3), (8, 0),
-(8, 4), (7, 6), (6, 7), (4, 8)], [(4, 8), (2, 8), (0, 7), (-2, 7), (-4,
-8), (-5, 10), (-4, 12), (-2, 13), (0, 13), (2, 12)], [(1, 8), (-1, 8)],
-[(0, 9), (-2, 8), (-4, 8)]]}, 3309: {'charcode': 3309, 'left': -12,
-'right': 13, 'lines': [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8,
--6), (-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11),
-(5, -8), (7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)],
-[(-8, -8), (-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7),
-(9, -7), (10, -8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7),
-(-8, 8), (-9, 7), (-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10),
-(2, 12)], [(-4, 6), (-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5),
-(-4, 7), (-2, 10), (-1, 11), (1, 12), (4, 12), (6, 11), (7, 10), (8,
-8), (8, 5), (7, 3), (5, 0), (4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0),
-(4, -1)], [(6, 11), (7, 9), (7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5,
--4), (7, -4), (8, -3), (8, -2)]]}, 3310: {'charcode': 3310, 'left': -12,
-'right': 13, 'lines': [[(-2, -2), (-4, -2), (-6, -3), (-7, -4), (-8, -6),
-(-8, -8), (-7, -10), (-6, -11), (-3, -12), (-1, -12), (2, -11), (5, -8),
-(7, -7)], [(-6, -10), (-4, -11), (0, -11), (2, -10), (3, -9)], [(-8, -8),
-(-7, -9), (-5, -10), (-1, -10), (2, -9), (4, -8), (7, -7), (9, -7), (10,
--8), (10, -10), (9, -11), (7, -11)], [(-8, 6), (-7, 7), (-8, 8), (-9, 7),
-(-9, 5), (-8, 4), (-6, 4), (-4, 5), (-2, 7), (0, 10), (2, 12)], [(-4, 6),
-(-3, 7), (-1, 10), (0, 11)], [(-6, 4), (-5, 5), (-4, 7), (-2, 10), (-1,
-11), (1, 12), (4, 12), (6, 11), (7, 10), (8, 8), (8, 5), (7, 3), (5, 0),
-(4, -2), (4, -3)], [(7, 6), (7, 5), (4, 0), (4, -1)], [(6, 11), (7, 9),
-(7, 7), (6, 5), (4, 2), (3, 0), (3, -2), (5, -4), (7, -4), (8, -3),
-(8, -2)]]}, 3311: {'charcode': 3311, 'left': -13, 'right': 13, 'lines':
-[[(9, -7), (8, -9), (6, -11), (3, -12), (0, -12), (-3, -11), (-5, -9),
-(-6, -7), (-6, -4), (-5, -1), (-2, 5), (-2, 7), (-4, 9)], [(-5, -4),
-(-5, -3), (-2, 3), (-2, 4)], [(-4, -10), (-5, -8), (-5, -5), (-4, -3),
-(-2, 1), (-1, 4), (-1, 6), (-2, 8), (-4, 9), (-6, 9), (-8, 8)], [(-10, 4),
-(-8, 8)], [(-11, 7), (-7, 5)], [(-10, 4), (-10, 6), (-11, 7), (-9, 7),
-(-8, 8), (-8, 6), (-7, 5), (-9, 5), (-10, 4)], [(-4, -3), (-4, -5), (-3,
--7), (-1, -8), (2, -8), (4, -7), (6, -5), (7, -5)], [(3, -7), (5, -5)],
-[(0, -8), (2, -7), (3, -6), (4, -4)], [(7, -5), (-2, -1)], [(3, -3),
-(7, 6), (8, 7), (9, 7)], [(2, -2), (6, 6), (8, 8)], [(1, -2), (5, 7),
-(7, 9), (10, 6)]]}, 3312: {'charcode': 3312, 'left': -11, 'right': 12,
-'lines': [[(8, 1), (7, 2), (4, 2), (3, 1), (3, -1), (4, -3), (6, -6),
-(7, -8), (7, -10)], [(4, -1), (4, -2), (7, -6), (7, -7)], [(5, 2),
-(4, 1), (4, 0), (5, -2), (7, -4), (8, -6), (8, -8), (7, -10), (6, -11),
-(3, -12), (-2, -12), (-5, -11), (-6, -10), (-7, -8), (-7, -6), (-6, -4),
-(-4, -1), (-3, 1), (-3, 2), (-4, 4)], [(-6, -7), (-6, -6), (-3, -1),
-(-3, 0)], [(-6, -10), (-6, -8), (-5, -6), (-3, -3), (-2, -1), (-2, 1),
-(-3, 3), (-5, 5), (-8, 7)], [(-5, 5), (-3, 5), (0, 7), (3, 8), (6, 8),
-(8, 7)], [(-4, 6), (-3, 6), (1, 8), (2, 8)], [(-8, 7), (-6, 6), (-5, 6),
-(-1, 8), (2, 9), (4, 9), (7, 8), (8, 7), (9, 5)]]}, 3313: {'charcode':
-3313, 'left': -16, 'right': 16, 'lines': [[(-13, -1), (-13, 0), (-12,
-1), (-10, 1), (-8, 0), (-8, -3), (-9, -5), (-11, -8), (-11, -10), (-9,
--12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9, 0), (-9, -2), (-11, -5),
-(-12, -7), (-12, -9), (-11, -11), (-9, -12), (-7, -12), (-5, -11), (-3,
--9), (-2, -6), (-2, 0), (-3, 3), (-4, 5), (-6, 7), (-9, 9), (-10, 8),
-(-11, 8)], [(-4, -9), (-3, -6), (-3, 0), (-4, 3), (-5, 5)], [(-8, 8),
-(-9, 7), (-10, 7)], [(-7, -12), (-5, -10), (-4, -7), (-4, 0), (-5, 4),
-(-6, 6), (-7, 7), (-8, 6), (-9, 6), (-12, 9)], [(-4, -11), (-2, -12),
-(0, -12), (2, -11), (4, -9), (5, -6), (5, 0), (4, 3), (3, 5), (1, 7),
-(-1, 9), (-2, 8), (-3, 8)], [(3, -9), (4, -6), (4, 0), (3, 4)], [(0, 8),
-(-1, 7), (-2, 7)], [(0, -12), (2, -10), (3, -7), (3, 1), (2, 5), (1, 7),
-(0, 6), (-1, 6), (-4, 9)], [(3, -10), (4, -11), (6, -12), (8, -12), (10,
--11), (11, -10), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12),
-(9, -11), (10, -8), (11, -7), (13, -7)], [(13, -7), (10, -5), (9, -4),
-(8, -1), (8, 2), (9, 6), (11, 9), (14, 6)], [(10, -4), (9, -2), (9, 2),
-(10, 5), (12, 8)], [(13, -7), (11, -5), (10, -3), (10, 1), (11, 5),
-(13, 7)]]}, 3314: {'charcode': 3314, 'left': -14, 'right': 14, 'lines':
-[[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3), (-7, -5),
-(-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8, 1), (-7,
-0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7, -12),
-(-4, -12), (-2, -11), (0, -9), (1, -6), (1, 0), (0, 3), (-1, 5), (-3,
-7), (-6, 9), (-7, 8), (-9, 8), (-11, 9)], [(-1, -9), (0, -7), (0, 0),
-(-1, 3), (-2, 5), (-3, 6)], [(-5, 8), (-7, 7), (-9, 7)], [(-4, -12), (-2,
--10), (-1, -7), (-1, 0), (-2, 4), (-4, 7), (-6, 6), (-8, 6), (-11, 9)],
-[(0, -10), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10), (9, -8),
-(10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8), (8, -7),
-(10, -7)], [(10, -7), (7, -5), (6, -4), (5, -1), (5, 2), (6, 6), (8,
-9), (11, 6)], [(7, -4), (6, -2), (6, 2), (7, 5), (9, 8)], [(10, -7),
-(8, -5), (7, -3), (7, 1), (8, 5), (10, 7)]]}, 3315: {'charcode': 3315,
-'left': -14, 'right': 14, 'lines': [[(-2, -12), (-4, -11), (-6, -9),
-(-7, -7), (-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3),
-(-5, -2)], [(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2),
-(-8, 2), (-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7),
-(9, -5), (10, -2), (10, 1), (9, 4), (8, 6), (6, 8), (3, 9), (0, 9),
-(-3, 8), (-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8),
-(7, -7), (8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6),
-(9, -4), (10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(7, 7), (5, 8),
-(2, 8), (-1, 7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9),
-(-9, 8), (-10, 7)]]}, 3316: {'charcode': 3316, 'left': -13, 'right': 14,
-'lines': [[(-10, -1), (-10, 0), (-9, 1), (-7, 1), (-5, 0), (-5, -3), (-6,
--5), (-8, -8), (-8, -10), (-6, -12)], [(-6, -3), (-8, -7)], [(-7, 1),
-(-6, 0), (-6, -2), (-8, -5), (-9, -7), (-9, -9), (-8, -11), (-6, -12),
-(-3, -12), (-1, -11), (0, -10), (1, -8), (1, 3)], [(1, 5), (1, 10), (0,
-12), (-2, 13), (-5, 13), (-6, 12), (-6, 10), (-5, 9), (-4, 10), (-5, 11)],
-[(-1, -10), (0, -8), (0, 10), (-1, 12)], [(-3, -12), (-2, -11), (-1, -8),
-(-1, 3)], [(-1, 5), (-1, 10), (-2, 12), (-3, 13)], [(1, -8), (6, -12)],
-[(6, -12), (8, -9), (9, -7), (10, -3), (10, 0), (9, 3), (7, 6), (4, 9)],
-[(5, -11), (8, -7), (9, -4), (9, -3)], [(4, -10), (6, -8), (8, -5),
-(9, -2), (9, 1), (8, 4), (7, 6)], [(5, 7), (3, 4), (1, 3)], [(-1, 3),
-(-3, 4), (-5, 6)], [(5, 8), (3, 5), (1, 4), (-2, 4)], [(4, 9), (2, 6),
-(1, 5)], [(-1, 5), (-3, 5), (-5, 6)]]}, 3317: {'charcode': 3317, 'left':
--14, 'right': 14, 'lines': [[(-2, -12), (-4, -11), (-6, -9), (-7, -7),
-(-7, -5), (-5, -1), (-5, 1)], [(-6, -6), (-6, -5), (-5, -3), (-5, -2)],
-[(-6, -9), (-6, -7), (-4, -3), (-4, -1), (-5, 1), (-6, 2), (-8, 2),
-(-9, 1), (-9, 0)], [(-2, -12), (-1, -11), (5, -9), (8, -7), (9, -5),
-(10, -2), (10, 1), (9, 4), (8, 6)], [(6, 8), (3, 9), (0, 9), (-3, 8),
-(-9, 5), (-10, 5), (-11, 6)], [(-2, -11), (-1, -10), (5, -8), (7, -7),
-(8, -6)], [(-2, -12), (-2, -10), (-1, -9), (5, -7), (7, -6), (9, -4),
-(10, -2)], [(1, 8), (-1, 8), (-7, 5), (-8, 5)], [(6, 8), (2, 8), (-1,
-7), (-5, 5), (-8, 4), (-10, 4), (-11, 6), (-11, 8), (-10, 9), (-9, 8),
-(-10, 7)], [(2, 6), (4, 4), (6, 4), (10, 8), (11, 8)], [(5, 5), (6, 5),
-(9, 8)], [(3, 5), (4, 5), (8, 9), (10, 9), (12, 7)]]}, 3318: {'charcode':
-3318, 'left': -14, 'right': 14, 'lines': [[(-11, -1), (-11, 0), (-10, 1),
-(-8, 1), (-6, 0), (-6, -3), (-7, -5), (-9, -8), (-9, -10), (-7, -12)],
-[(-7, -3), (-9, -7)], [(-8, 1), (-7, 0), (-7, -2), (-9, -5), (-10, -7),
-(-10, -9), (-9, -11), (-7, -12), (-4, -12), (-2, -11), (-1, -10), (0,
--8), (0, 4), (-1, 6), (-3, 8), (-5, 9), (-7, 9), (-9, 8)], [(-2, -10),
-(-1, -8), (-1, 4), (-2, 6)], [(-4, -12), (-3, -11), (-2, -8), (-2, 4),
-(-3, 7), (-5, 9)], [(-11, 4), (-9, 8)], [(-12, 7), (-8, 5)], [(-11,
-4), (-11, 6), (-12, 7), (-10, 7), (-9, 8), (-9, 6), (-8, 5), (-10, 5),
-(-11, 4)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11), (8, -10),
-(9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8),
-(8, -7), (10, -7)], [(10, -7), (0, -2)], [(2, -3), (6, 7), (8, 9), (11,
-6)], [(3, -3), (7, 6), (9, 8)], [(4, -4), (8, 6), (9, 7), (10, 7)]]},
-3319: {'charcode': 3319, 'left': -13, 'right': 14, 'lines': [[(10, -10),
-(9, -11), (10, -12), (11, -11), (11, -9), (10, -7), (8, -7), (4, -9),
-(1, -10), (-3, -10), (-7, -9), (-9, -7)], [(7, -8), (4, -10), (1, -11),
-(-3, -11), (-6, -10)], [(11, -9), (10, -8), (8, -8), (4, -11), (1, -12),
-(-3, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3),
-(-8, 5), (-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7), (10, 5),
-(11, 2), (11, -1), (10, -3), (8, -4), (5, -4), (3, -3), (1, 0), (-1, 1),
-(-3, 1)], [(-6, 6), (-4, 7), (-1, 8), (3, 8), (7, 7)], [(-9, 3), (-7, 5),
-(-5, 6), (-2, 7), (3, 7), (7, 6), (9, 5), (10, 4), (11, 2)], [(6, -3),
-(5, -3), (1, 1), (0, 1)], [(11, -1), (9, -3), (7, -3), (5, -2), (3, 1),
-(1, 2), (-1, 2), (-3, 1), (-4, -1), (-4, -3), (-3, -5), (-1, -6)]]},
-3320: {'charcode': 3320, 'left': -12, 'right': 13, 'lines': [[(-6, -4),
-(-8, -5), (-9, -7), (-9, -9), (-8, -11), (-5, -12), (0, -12), (3, -11),
-(7, -8), (9, -8), (10, -9)], [(-8, -10), (-6, -11), (0, -11), (3, -10),
-(6, -8)], [(-9, -7), (-8, -9), (-6, -10), (0, -10), (3, -9), (7, -7),
-(9, -7), (10, -9), (10, -11), (9, -12), (8, -11), (9, -10)], [(3, -9),
-(0, -6), (-1, -4), (-1, -2), (1, 2), (1, 4)], [(0, -3), (0, -2), (1, 0),
-(1, 1)], [(0, -6), (0, -4), (2, 0), (2, 2), (1, 4), (0, 5), (-2, 5), (-3,
-4), (-3, 2)], [(-8, 7), (-7, 8), (-8, 9), (-9, 8), (-9, 6), (-8, 4), (-6,
-4), (-3, 5), (1, 7), (4, 8), (7, 8), (9, 7)], [(-6, 5), (-5, 5), (1, 8),
-(3, 8)], [(-9, 6), (-8, 5), (-7, 5), (-5, 6), (-1, 8), (2, 9), (5, 9),
-(8, 8), (10, 6)]]}, 3321: {'charcode': 3321, 'left': -11, 'right': 11,
-'lines': [[(-8, -10), (-7, -10), (-6, -9), (-6, 5), (-8, 6)], [(-7, -11),
-(-5, -10), (-5, 6), (-2, 8)], [(-9, -9), (-6, -12), (-4, -10), (-4, 5),
-(-2, 7), (0, 7)], [(-8, 6), (-7, 6), (-5, 7), (-3, 9), (0, 7), (4, 4)],
-[(2, -10), (3, -10), (4, -9), (4, 7), (6, 9), (9, 6)], [(3, -11), (5,
--10), (5, 7), (7, 8)], [(1, -9), (4, -12), (7, -10), (6, -9), (6, 6),
-(7, 7), (8, 7)]]}, 3322: {'charcode': 3322, 'left': -14, 'right': 14,
-'lines': [[(-11, -1), (-11, 0), (-10, 1), (-8, 1), (-6, 0), (-6, -3),
-(-7, -5), (-9, -8), (-9, -10), (-7, -12)], [(-7, -3), (-9, -7)], [(-8,
-1), (-7, 0), (-7, -2), (-9, -5), (-10, -7), (-10, -9), (-9, -11), (-7,
--12), (-4, -12), (-2, -11), (-1, -10), (0, -8), (0, 0), (-1, 3), (-3,
-5)], [(-2, -10), (-1, -8), (-1, 2)], [(-4, -12), (-3, -11), (-2, -8),
-(-2, 3), (-3, 5)], [(0, -9), (1, -11), (3, -12), (5, -12), (7, -11),
-(9, -8), (10, -7)], [(7, -10), (8, -8)], [(5, -12), (6, -11), (7, -8),
-(8, -7), (10, -7)], [(8, -7), (6, -7), (5, -6), (5, -4), (6, -2), (9,
-0), (10, 2)], [(6, -3), (9, -1)], [(5, -5), (6, -4), (9, -2), (10, 0),
-(10, 4), (9, 6), (7, 8), (5, 9), (1, 9), (-2, 8), (-8, 5), (-9, 5),
-(-10, 6)], [(2, 8), (0, 8), (-6, 5), (-7, 5)], [(8, 7), (6, 8), (3, 8),
-(0, 7), (-4, 5), (-7, 4), (-9, 4), (-10, 6), (-10, 8), (-9, 9), (-8, 8),
-(-9, 7)]]}, 3323: {'charcode': 3323, 'left': -16, 'right': 17, 'lines':
-[[(-13, -1), (-13, 0), (-12, 1), (-10, 1), (-8, 0), (-8, -3), (-9, -5),
-(-11, -8), (-11, -10), (-9, -12)], [(-9, -3), (-11, -7)], [(-10, 1), (-9,
-0), (-9, -2), (-11, -5), (-12, -7), (-12, -9), (-11, -11), (-9, -12),
-(-6, -12), (-4, -11), (-3, -10), (-2, -8), (-2, -4), (-3, -1), (-5, 2),
-(-7, 4)], [(-4, -10), (-3, -8), (-3, -3), (-4, 0)], [(-6, -12), (-5,
--11), (-4, -8), (-4, -3), (-5, 1), (-7, 4)], [(-4, -11), (-2, -12), (1,
--12), (3, -11)], [(5, -12), (2, -11), (1, -9), (1, -5), (2, -2), (4, 1),
-(5, 3), (5, 5), (4, 7)], [(2, -5), (2, -4), (5, 1), (5, 2)], [(5, -12),
-(3, -11), (2, -9), (2, -6), (3, -4), (5, -1), (6, 2), (6, 4), (5, 6),
-(3, 8), (1, 9), (-3, 9), (-5, 8), (-7, 6), (-9, 5), (-11, 5), (-12, 6)],
-[(-4, 8), (-7, 5), (-8, 5)], [(-1, 9), (-3, 8), (-6, 5), (-8, 4), (-11,
-4), (-12, 6), (-12, 8), (-11, 9), (-10, 8), (-11, 7)], [(5, -12), (8,
--12), (10, -11), (12, -8), (13, -7)], [(10, -10), (11, -8)], [(8, -12),
-(9, -11), (10, -8), (11, -7), (13, -7)], [(11, -7), (9, -7), (8, -6),
-(8, -4), (9, -2), (12, 0), (13, 2)], [(9, -3), (12, -1)], [(8, -5),
-(9, -4), (12, -2), (13, 0), (13, 5), (12, 7), (11, 8), (9, 9), (6, 9),
-(3, 8)], [(7, 8), (6, 8), (4, 7)], [(12, 7), (10, 8), (8, 8), (6, 7),
-(5, 6)]]}, 3324: {'charcode': 3324, 'left': -12, 'right': 12, 'lines':
-[[(-7, -10), (-5, -10), (-3, -9), (-2, -8), (-1, -5), (-1, -3)], [(-1,
--1), (-1, 3), (-2, 6), (-5, 9), (-7, 8), (-9, 9)], [(-4, 8), (-6, 7),
-(-7, 7)], [(-3, 7), (-4, 7), (-6, 6), (-9, 9)], [(-5, -11), (-2, -10),
-(-1, -9), (0, -6), (0, 3), (1, 5), (3, 7), (5, 8)], [(-9, -9), (-4, -12),
-(-2, -11), (0, -9), (1, -6), (1, -3)], [(1, -1), (1, 2), (2, 5), (3, 6),
-(5, 7), (7, 7)], [(-1, 3), (0, 6), (2, 8), (4, 9), (9, 6)], [(1, -6),
-(2, -9), (5, -12), (7, -11), (9, -12)], [(4, -11), (6, -10), (7, -10)],
-[(3, -10), (4, -10), (6, -9), (9, -12)], [(-7, 1), (-5, -3), (-1, -3)],
-[(1, -3), (5, -3), (7, -5)], [(-5, -2), (5, -2)], [(-7, 1), (-5, -1),
-(-1, -1)], [(1, -1), (5, -1), (7, -5)]]}, 3325: {'charcode': 3325,
-'left': -13, 'right': 13, 'lines': [[(-10, -1), (-10, 0), (-9, 1),
-(-7, 1), (-5, 0), (-5, -3), (-6, -5), (-8, -8), (-8, -10), (-6, -12)],
-[(-6, -3), (-8, -7)], [(-7, 1), (-6, 0), (-6, -2), (-8, -5), (-9, -7),
-(-9, -9), (-8, -11), (-6, -12), (-3, -12), (-1, -11), (0, -10), (1, -8),
-(1, -3), (0, 0), (-1, 2), (-1, 3), (1, 5), (2, 5)], [(-1, -10), (0, -8),
-(0, -2), (-1, 1), (-2, 3), (1, 6)], [(-3, -12), (-2, -11), (-1, -8),
-(-1, -2), (-2, 2), (-3, 4), (0, 7), (3, 4)], [(1, -8), (9, -12)], [(7,
--11), (7, 8), (6, 11)], [(8, -11), (8, 6), (7, 9)], [(9, -12), (9, 4),
-(8, 8), (7, 10), (5, 12), (2, 13), (-2, 13), (-5, 12), (-7, 10), (-8,
-8), (-7, 7), (-6, 8), (-7, 9)]]}, 3326: {'charcode': 3326, 'left': -12,
-'right': 12, 'lines': [[(-4, -9), (-3, -11), (-1, -12), (2, -12), (4,
--11), (5, -10), (6, -8), (6, -5), (5, -3), (4, -2), (2, -1)], [(-1, -1),
-(-3, -2), (-4, -4)], [(4, -10), (5, -9), (5, -4), (4, -3)], [(2, -12),
-(3, -11), (4, -9), (4, -4), (3, -2), (2, -1)], [(-5, 3), (-4, 1), (-3,
-0), (-1, -1), (2, -1), (5, 0), (7, 2), (8, 4), (8, 8), (7, 10), (5,
-12), (2, 13), (-2, 13), (-4, 12), (-7, 8), (-8, 7)], [(6, 2), (7, 4),
-(7, 8), (6, 10)], [(2, -1), (5, 1), (6, 3), (6, 9), (5, 11), (4, 12),
-(2, 13)], [(-3, 12), (-4, 11), (-6, 8), (-7, 7)], [(0, 13), (-2, 12),
-(-3, 11), (-5, 8), (-6, 7), (-9, 7), (-10, 8), (-10, 10), (-9, 11),
-(-8, 11)]]}, 3401: {'charcode': 3401, 'left': -8, 'right': 9, 'lines':
-[[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3,
-9), (3, 6)], [(-4, 4), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1),
-(-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9),
-(8, 6)], [(1, -4), (4, -2), (4, 6), (6, 8)], [(2, -5), (3, -4), (5, -3),
-(6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]}, 3402:
-{'charcode': 3402, 'left': -8, 'right': 9, 'lines': [[(-6, -10), (-5, -9),
-(-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6), (-5, 7)],
-[(-2, -9), (-3, -7), (-3, 6), (0, 8)], [(2, -12), (0, -11), (-1, -10),
-(-2, -7), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9),
-(2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7),
-(2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5,
-3), (4, 6), (2, 8)]]}, 3403: {'charcode': 3403, 'left': -7, 'right': 6,
-'lines': [[(0, -4), (2, -2), (4, -3), (2, -5), (0, -4), (-3, -2), (-4,
-0), (-4, 5), (-3, 7), (-1, 9), (3, 7)], [(1, -4), (3, -3)], [(-2, -2),
-(-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(-1, -3), (-2, -1), (-2, 4),
-(-1, 6), (1, 8)]]}, 3404: {'charcode': 3404, 'left': -8, 'right': 9,
-'lines': [[(-1, -12), (-4, -9), (-4, -7), (-3, -6), (1, -4), (4, -2),
-(5, 0), (5, 3), (4, 6), (2, 8)], [(-3, -8), (-3, -7), (1, -5), (4, -3),
-(5, -2)], [(-3, -10), (-3, -9), (-2, -8), (3, -5), (5, -3), (6, 0),
-(6, 3), (5, 6), (2, 8), (-1, 9)], [(0, -4), (-4, -2), (-4, 6), (-5, 7)],
-[(-3, -2), (-3, 6), (0, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 8)], [(-5,
-7), (-4, 7), (-2, 8), (-1, 9)]]}, 3405: {'charcode': 3405, 'left': -7,
-'right': 6, 'lines': [[(-2, 3), (4, -1), (1, -5), (-3, -2), (-4, 0),
-(-4, 5), (-3, 7), (-1, 9), (3, 7)], [(3, -1), (0, -4)], [(-2, -2),
-(-3, 0), (-3, 5), (-2, 7), (-1, 8)], [(2, 0), (0, -3), (-1, -3), (-2,
--1), (-2, 4), (-1, 6), (1, 8)]]}, 3406: {'charcode': 3406, 'left': -6,
-'right': 7, 'lines': [[(6, -12), (5, -11), (3, -11), (1, -12), (-1,
--12), (-2, -10), (-2, -5), (-3, -3), (-4, -2)], [(4, -10), (2, -10),
-(0, -11), (-1, -11)], [(6, -12), (5, -10), (4, -9), (2, -9), (0, -10),
-(-1, -10), (-2, -9)], [(-2, -7), (-1, -5), (0, -4), (2, -3), (4, -3),
-(4, -2)], [(-4, -2), (-2, -2)], [(0, -2), (4, -2)], [(-2, -2), (-2, 2),
-(-1, 14)], [(1, -3), (-2, -3), (-1, -4), (-1, 9)], [(0, -2), (0, 2),
-(-1, 14)]]}, 3407: {'charcode': 3407, 'left': -8, 'right': 9, 'lines':
-[[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3,
-9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1),
-(-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 9),
-(4, 11), (3, 13)], [(1, -4), (4, -2), (4, 8)], [(2, -5), (3, -4), (5,
--3), (6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 10), (4, 12), (3, 13),
-(1, 14), (-2, 14), (-4, 13), (-5, 12), (-5, 11), (-4, 11), (-4, 12)]]},
-3408: {'charcode': 3408, 'left': -8, 'right': 9, 'lines': [[(-6, -10),
-(-5, -9), (-4, -7)], [(2, -12), (-1, -11), (-3, -9), (-4, -7), (-4, 6),
-(-5, 7)], [(-2, -9), (-3, -7), (-3, 7), (-2, 8)], [(2, -12), (0, -11),
-(-1, -10), (-2, -7), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2,
-9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4,
-10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1),
-(5, 2), (5, 5), (4, 9), (2, 12)]]}, 3409: {'charcode': 3409, 'left':
--5, 'right': 5, 'lines': [[(0, -12), (-1, -11), (-1, -10), (0, -9), (1,
--10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10), (1, -11)],
-[(-3, -3), (-2, -3), (-1, -2), (-1, 7), (1, 9), (4, 6)], [(-2, -4), (0,
--3), (0, 6), (2, 8)], [(-4, -2), (-1, -5), (0, -4), (2, -3)], [(1, -2),
-(2, -3)], [(1, -2), (1, 6), (2, 7), (3, 7)]]}, 3410: {'charcode': 3410,
-'left': -5, 'right': 5, 'lines': [[(0, -12), (-1, -11), (-1, -10), (0,
--9), (1, -10), (1, -11), (0, -12)], [(-1, -11), (1, -10)], [(-1, -10),
-(1, -11)], [(-3, -3), (-2, -3), (-1, -2), (-1, 9), (-2, 12), (-3, 13),
-(-5, 14)], [(-2, -4), (0, -3), (0, 9), (-1, 11)], [(-4, -2), (-1, -5),
-(0, -4), (2, -3)], [(1, -2), (2, -3)], [(1, -2), (1, 9), (0, 11), (-2,
-13), (-5, 14)], [(1, 9), (2, 11), (3, 12)]]}, 3411: {'charcode': 3411,
-'left': -7, 'right': 7, 'lines': [[(-4, -10), (-3, -9), (-2, -7)],
-[(3, -12), (1, -11), (-1, -9), (-2, -7), (-2, -5), (-3, -3), (-4, -2)],
-[(-2, -2), (-2, 6), (-3, 7)], [(0, -9), (-1, -7), (-1, -5)], [(-1, -3),
-(-2, -3), (-1, -5), (-1, 6), (1, 8)], [(3, -12), (1, -10), (0, -7),
-(0, -3)], [(0, -2), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9),
-(3, 6)], [(0, -6), (4, -9), (5, -8), (5, -6), (3, -4), (1, -3)], [(3,
--8), (4, -7), (4, -6), (3, -4)], [(0, -3), (5, -3), (5, -2)], [(-4, -2),
-(-2, -2)], [(0, -2), (5, -2)]]}, 3412: {'charcode': 3412, 'left': -5,
-'right': 5, 'lines': [[(-3, -10), (-2, -9), (-1, -7)], [(5, -12), (2,
--11), (0, -9), (-1, -7), (-1, 6), (-2, 7)], [(1, -9), (0, -7), (0, 7),
-(2, 8)], [(5, -12), (3, -11), (2, -10), (1, -7), (1, 6), (2, 7), (3, 7)],
-[(-2, 7), (0, 8), (1, 9), (4, 6)]]}, 3413: {'charcode': 3413, 'left': -13,
-'right': 13, 'lines': [[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7),
-(-8, 9)], [(-10, -4), (-8, -2), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8,
-6)], [(-12, -2), (-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-4,
--4), (-2, -3), (-1, -1), (-1, 6), (-2, 7), (0, 9)], [(-2, -4), (-1, -3),
-(0, -1), (0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(-7, -2), (-4, -4),
-(-2, -5), (0, -4), (1, -2), (1, 6), (2, 7), (0, 9)], [(4, -4), (5, -3),
-(7, -2), (7, 7), (9, 9), (12, 6)], [(5, -4), (8, -2), (8, 6), (10, 8)],
-[(1, -2), (4, -4), (6, -5), (7, -4), (9, -3), (10, -3)], [(9, -2), (10,
--3)], [(9, -2), (9, 6), (10, 7), (11, 7)]]}, 3414: {'charcode': 3414,
-'left': -9, 'right': 9, 'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5,
-6), (-6, 7), (-4, 9)], [(-6, -4), (-4, -2), (-4, 6), (-5, 7), (-4, 8),
-(-3, 7), (-4, 6)], [(-8, -2), (-5, -5), (-3, -3), (-3, 6), (-2, 7),
-(-4, 9)], [(0, -4), (1, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(1, -4),
-(4, -2), (4, 6), (6, 8)], [(-3, -2), (0, -4), (2, -5), (3, -4), (5, -3),
-(6, -3)], [(5, -2), (6, -3)], [(5, -2), (5, 6), (6, 7), (7, 7)]]}, 3415:
-{'charcode': 3415, 'left': -8, 'right': 9, 'lines': [[(-4, -2), (-4, 6),
-(-5, 7)], [(-3, -2), (-3, 6), (0, 8)], [(-1, -3), (-2, -2), (-2, 6), (0,
-7), (1, 8)], [(-5, 7), (-4, 7), (-2, 8), (-1, 9), (2, 8)], [(-4, -2),
-(-1, -3), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)],
-[(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6),
-(2, 8)]]}, 3416: {'charcode': 3416, 'left': -8, 'right': 9, 'lines':
-[[(-3, -8), (-5, -6), (-5, -4), (-4, -1), (-4, 6), (-6, 8)], [(-4, 7),
-(-3, 14)], [(-4, -5), (-4, -4), (-3, -1), (-3, 9)], [(-4, -7), (-4, -6),
-(-3, -4), (-2, -1), (-2, 6), (-1, 6), (1, 7), (2, 8)], [(-2, 7), (-3,
-14)], [(1, 8), (-1, 7)], [(2, 8), (0, 9), (-2, 7)], [(-4, 7), (-6, 8)],
-[(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3), (5, 6), (4, 7), (2, 8)],
-[(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2), (5, 1), (5, 3), (4, 6),
-(2, 8)]]}, 3417: {'charcode': 3417, 'left': -8, 'right': 9, 'lines':
-[[(2, -5), (-1, -4), (-3, -3), (-4, -2), (-5, 1), (-5, 4), (-4, 7), (-3,
-9), (3, 6)], [(-4, 5), (-3, 7), (-2, 8)], [(-1, -4), (-3, -2), (-4, 1),
-(-4, 3), (-3, 6), (-1, 8)], [(0, -4), (1, -3), (3, -2), (3, 6), (4, 14)],
-[(1, -4), (4, -2), (4, 9)], [(2, -5), (3, -4), (5, -3), (6, -3)], [(5,
--2), (6, -3)], [(5, -2), (5, 6), (4, 14)]]}, 3418: {'charcode': 3418,
-'left': -7, 'right': 7, 'lines': [[(-4, -3), (-3, -3), (-2, -2), (-2, 6),
-(-3, 7)], [(-3, -4), (-1, -2), (-1, 7), (1, 8)], [(-5, -2), (-2, -5),
-(0, -3), (0, 6), (1, 7), (2, 7)], [(-3, 7), (-1, 8), (0, 9), (3, 6)],
-[(2, -4), (3, -2), (5, -3), (4, -5), (0, -3)], [(3, -4), (4, -3)]]},
-3419: {'charcode': 3419, 'left': -6, 'right': 5, 'lines': [[(6, -12),
-(5, -11), (3, -11), (1, -12), (-1, -12), (-2, -10), (-2, -5), (-3, -3),
-(-4, -2)], [(4, -10), (2, -10), (0, -11), (-1, -11)], [(6, -12), (5, -10),
-(4, -9), (2, -9), (0, -10), (-1, -10), (-2, -9)], [(-2, -7), (0, -2)],
-[(-2, -2), (-2, 2), (-1, 14)], [(-1, -3), (-2, -3), (-1, -4), (-1, 9)],
-[(0, -2), (0, 2), (-1, 14)], [(-4, -2), (-2, -2)]]}, 3420: {'charcode':
-3420, 'left': -6, 'right': 6, 'lines': [[(1, -9), (0, -6), (-1, -4),
-(-2, -3), (-4, -2)], [(1, -9), (1, -3), (4, -3), (4, -2)], [(-4, -2),
-(-1, -2)], [(1, -2), (4, -2)], [(-1, -2), (-1, 6), (-2, 7)], [(0, -3),
-(-1, -3), (0, -5), (0, 6), (2, 8)], [(1, -2), (1, 6), (2, 7), (3, 7)],
-[(-2, 7), (0, 8), (1, 9), (4, 6)]]}, 3421: {'charcode': 3421, 'left': -9,
-'right': 9, 'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7)],
-[(-6, -4), (-4, -2), (-4, 6), (-2, 8)], [(-8, -2), (-5, -5), (-3, -3),
-(-3, 6), (-1, 7), (0, 8)], [(-6, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8),
-(3, 6)], [(4, -5), (2, -3), (3, -2), (3, 7), (5, 9), (8, 6)], [(4, -2),
-(5, -3), (4, -4), (3, -3), (4, -2), (4, 6), (6, 8)], [(4, -5), (6, -3),
-(5, -2), (5, 6), (6, 7), (7, 7)]]}, 3422: {'charcode': 3422, 'left': -8,
-'right': 9, 'lines': [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6),
-(-5, 7)], [(-4, -4), (-4, -3), (-3, 0), (-3, 6), (0, 8)], [(-4, -6),
-(-4, -5), (-3, -3), (-2, 0), (-2, 6), (0, 7), (1, 8)], [(-5, 7), (-4, 7),
-(-2, 8), (-1, 9), (2, 8)], [(-2, -2), (4, -5), (5, -3), (6, 0), (6, 3),
-(5, 6), (4, 7), (2, 8)], [(3, -4), (4, -3), (5, -1)], [(2, -4), (4, -2),
-(5, 1), (5, 3), (4, 6), (2, 8)]]}, 3423: {'charcode': 3423, 'left': -12,
-'right': 13, 'lines': [[(-7, -7), (-9, -5), (-9, -3), (-8, 0), (-8, 6),
-(-9, 7), (-7, 9)], [(-8, -4), (-8, -3), (-7, 0), (-7, 6), (-8, 7),
-(-7, 8), (-6, 7), (-7, 6)], [(-8, -6), (-8, -5), (-7, -3), (-6, 0),
-(-6, 6), (-5, 7), (-7, 9)], [(-3, -4), (-1, -3), (0, -1), (0, 6), (-1,
-7)], [(-1, -4), (0, -3), (1, -1), (1, 6), (4, 8)], [(-6, -2), (-3, -4),
-(-1, -5), (1, -4), (2, -2), (2, 6), (4, 7), (5, 8)], [(-1, 7), (0, 7),
-(2, 8), (3, 9), (6, 8)], [(2, -2), (8, -5), (9, -3), (10, 0), (10, 2),
-(9, 6), (8, 7), (6, 8)], [(7, -4), (8, -3), (9, -1)], [(6, -4), (8, -2),
-(9, 1), (9, 3), (8, 6), (6, 8)]]}, 3424: {'charcode': 3424, 'left': -7,
-'right': 8, 'lines': [[(-3, -3), (-2, -3), (-1, -2), (-1, 6), (-2, 6),
-(-4, 7), (-5, 9), (-5, 11), (-4, 13), (-2, 14), (1, 14), (4, 13), (4,
-12), (3, 12), (3, 13)], [(-2, -4), (0, -2), (0, 6), (3, 8)], [(-4, -2),
-(-1, -5), (1, -3), (1, 6), (3, 7), (4, 8)], [(6, 7), (2, 9), (1, 8), (-1,
-7), (-3, 7), (-5, 9)], [(3, -4), (4, -2), (6, -3), (5, -5), (1, -3)],
-[(4, -4), (5, -3)]]}, 3425: {'charcode': 3425, 'left': -8, 'right': 9,
-'lines': [[(-3, -7), (-5, -5), (-5, -3), (-4, 0), (-4, 6), (-5, 7)],
-[(-4, -4), (-4, -3), (-3, 0), (-3, 7), (-1, 8)], [(-4, -6), (-4, -5),
-(-3, -3), (-2, 0), (-2, 6), (-1, 7), (0, 7)], [(-5, 7), (-3, 8), (-2,
-9), (1, 6)], [(-2, -2), (4, -5), (5, -3), (6, 1), (6, 5), (5, 8), (4,
-10), (2, 12), (-1, 14)], [(3, -4), (4, -3), (5, 0)], [(2, -4), (4, -1),
-(5, 2), (5, 5), (4, 9), (2, 12)]]}, 3426: {'charcode': 3426, 'left':
--7, 'right': 7, 'lines': [[(-4, -2), (1, -5), (3, -4), (4, -2), (4,
-0), (3, 2), (-1, 4)], [(1, -4), (3, -3)], [(0, -4), (2, -3), (3, -1),
-(3, 0), (2, 2), (1, 3)], [(1, 3), (3, 5), (4, 7), (4, 11), (3, 13), (1,
-14), (-1, 14), (-3, 13), (-4, 11), (-4, 9), (-3, 7), (-1, 6), (5, 4)],
-[(0, 4), (2, 5), (3, 7)], [(-1, 4), (2, 6), (3, 8), (3, 11), (2, 13),
-(1, 14)]]}, 3427: {'charcode': 3427, 'left': -8, 'right': 8, 'lines':
-[[(0, -5), (-2, -4), (-5, -2), (-5, 0), (-4, 3)], [(-4, -2), (-4, 0),
-(-3, 2)], [(-2, -4), (-3, -3), (-3, 0), (-2, 2)], [(-2, -4), (0, -3), (2,
--3), (4, -4), (5, -5), (5, -7), (4, -8), (2, -8)], [(-1, -4), (1, -4)],
-[(0, -5), (2, -4), (4, -4)], [(-4, 3), (4, 0), (5, 3), (5, 5), (4, 7),
-(0, 9)], [(3, 1), (4, 3), (4, 6), (3, 7)], [(2, 1), (3, 3), (3, 6),
-(2, 8)], [(2, 8), (0, 7), (-3, 7), (-6, 9)], [(1, 8), (-1, 8)], [(0,
-9), (-2, 8), (-4, 8), (-6, 9)]]}, 3428: {'charcode': 3428, 'left': -8,
-'right': 9, 'lines': [[(4, -12), (3, -11), (1, -11), (-1, -12), (-3, -12),
-(-4, -10), (-4, -5), (-5, -3), (-6, -2)], [(2, -10), (0, -10), (-2, -11),
-(-3, -11)], [(4, -12), (3, -10), (2, -9), (0, -9), (-2, -10), (-3, -10),
-(-4, -9)], [(-4, -7), (-2, -2)], [(-4, -2), (-4, 2), (-3, 14)], [(-3, -3),
-(-4, -3), (-3, -4), (-3, 9)], [(-2, -2), (-2, 2), (-3, 14)], [(-6, -2),
-(-4, -2)], [(-2, -2), (3, -5), (5, -4), (6, -2), (6, 0), (5, 2), (1,
-4)], [(3, -4), (5, -3)], [(2, -4), (4, -3), (5, -1), (5, 0), (4, 2),
-(3, 3)], [(3, 3), (5, 4), (6, 6), (6, 9), (5, 11), (3, 13), (0, 14)],
-[(3, 4), (5, 5)], [(1, 4), (2, 4), (4, 5), (5, 7), (5, 10), (4, 12)]]},
-3429: {'charcode': 3429, 'left': -8, 'right': 9, 'lines': [[(-2, -9),
-(-3, -6), (-4, -4), (-5, -3), (-7, -2)], [(-2, -9), (-2, 6), (-1, 7),
-(-3, 9)], [(-3, -3), (-4, -3), (-3, -4), (-3, 6), (-4, 7), (-3, 8), (-2,
-7), (-3, 6)], [(-7, -2), (-4, -2), (-4, 6), (-5, 7), (-3, 9)], [(-2, -2),
-(3, -5), (5, -4), (6, -2), (6, 0), (5, 2), (1, 4)], [(3, -4), (5, -3)],
-[(2, -4), (4, -3), (5, -1), (5, 0), (4, 2), (3, 3)], [(3, 3), (5, 4),
-(6, 6), (6, 9), (5, 11), (3, 13), (0, 14)], [(3, 4), (5, 5)], [(1, 4),
-(2, 4), (4, 5), (5, 7), (5, 10), (4, 12)]]}, 3501: {'charcode': 3501,
-'left': -11, 'right': 11, 'lines': [[(-6, -9), (-4, -11), (-2, -12),
-(0, -12), (1, -11), (8, 5), (9, 6), (11, 6)], [(-1, -11), (0, -10), (7,
-6), (8, 8), (9, 7), (7, 6)], [(-4, -11), (-2, -11), (-1, -10), (6, 6),
-(7, 8), (8, 9), (9, 9), (11, 6)], [(-6, -5), (-5, -6), (-3, -7), (-2,
--7), (-1, -6)], [(-2, -6), (-2, -5)], [(-5, -6), (-3, -6), (-2, -4)],
-[(-11, 9), (-9, 7), (-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-4, 7),
-(-3, 8)], [(-11, 9), (-8, 8), (-5, 8), (-4, 9), (-2, 7)], [(0, -8),
-(-6, 6)], [(-4, 1), (4, 1)]]}, 3502: {'charcode': 3502, 'left': -12,
-'right': 12, 'lines': [[(-10, -10), (-8, -12), (-5, -12), (-3, -11),
-(-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10),
-(-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3),
-(-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)],
-[(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(0, -9),
-(-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0),
-(-1, 2), (-2, 3)], [(0, -9), (6, -12), (8, -11), (9, -9), (9, -7),
-(7, -5), (3, -3)], [(6, -11), (8, -9), (8, -7)], [(4, -11), (6, -10),
-(7, -9), (7, -6), (5, -4)], [(5, -4), (8, -2), (9, 0), (9, 6)], [(7, -2),
-(8, 0), (8, 5)], [(5, -4), (6, -3), (7, -1), (7, 6)], [(-8, 9), (-5, 7),
-(-2, 6), (2, 6), (5, 7)], [(-6, 8), (-3, 7), (2, 7), (4, 8)], [(-8, 9),
-(-4, 8), (1, 8), (3, 9), (5, 7), (7, 6), (9, 6)], [(3, -3), (3, 6)],
-[(3, 0), (7, 0)], [(3, 3), (7, 3)]]}, 3503: {'charcode': 3503, 'left':
--13, 'right': 11, 'lines': [[(-4, -11), (-6, -10), (-8, -8), (-9, -6),
-(-10, -3), (-10, 1), (-9, 4), (-8, 6), (-5, 8), (-2, 9), (1, 9), (4, 8),
-(6, 7), (8, 5), (9, 3)], [(-8, -7), (-9, -4), (-9, 1), (-7, 5), (-4, 7),
-(-1, 8), (2, 8), (5, 7)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8,
-0), (-7, 3), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5), (9, 3)], [(-2,
--8), (-2, 4)], [(-1, -8), (-1, 2)], [(0, -9), (0, 1), (-1, 3), (-2, 4)],
-[(-2, -8), (0, -9), (3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11),
-(4, -10), (6, -10)], [(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)],
-[(5, -9), (5, 6)]]}, 3504: {'charcode': 3504, 'left': -11, 'right': 12,
-'lines': [[(-9, -12), (5, -12), (7, -11), (8, -9), (8, 6)], [(-7, -11),
-(5, -11), (7, -9), (7, 5)], [(-9, -12), (-8, -11), (-6, -10), (5, -10),
-(6, -9), (6, 6)], [(-3, -7), (-4, -6), (-5, -4), (-5, -3), (-7, -3),
-(-8, -2), (-8, 0), (-7, -1), (-5, -1), (-5, 4)], [(-4, -5), (-4, 2)],
-[(-7, -2), (-4, -2)], [(-3, -7), (-3, 1), (-4, 3), (-5, 4)], [(-9, 9),
-(-6, 7), (-3, 6), (1, 6), (4, 7)], [(-7, 8), (-4, 7), (1, 7), (3, 8)],
-[(-9, 9), (-5, 8), (0, 8), (2, 9), (4, 7), (6, 6), (8, 6)], [(0, -10),
-(0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2, 0), (4, 0),
-(6, 1)]]}, 3505: {'charcode': 3505, 'left': -11, 'right': 11, 'lines':
-[[(-9, -10), (-7, -12), (-5, -12), (-3, -11), (-1, -12)], [(-6, -11),
-(-4, -11)], [(-9, -10), (-7, -11), (-5, -10), (-3, -10), (-1, -12)], [(-4,
--7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0), (-8, -1),
-(-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)], [(-4, -7),
-(-4, 2), (-5, 4), (-6, 5)], [(-1, -5), (0, -8), (1, -10), (2, -11), (4,
--12), (6, -12), (9, -11)], [(2, -10), (4, -11), (6, -11), (8, -10)],
-[(0, -8), (1, -9), (3, -10), (5, -10), (7, -9), (9, -11)], [(-1, 3),
-(0, 0), (1, -2), (2, -3), (4, -3), (6, -2)], [(2, -2), (4, -2), (5, -1)],
-[(0, 0), (1, -1), (3, -1), (4, 0), (6, -2)], [(-7, 9), (-4, 7), (0, 6),
-(5, 6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8),
-(4, 8), (7, 9), (9, 7)], [(-1, -5), (-1, 6)]]}, 3506: {'charcode': 3506,
-'left': -12, 'right': 11, 'lines': [[(-8, -10), (-6, -12), (-3, -12),
-(-1, -11), (1, -12)], [(-5, -11), (-2, -11)], [(-8, -10), (-6, -11),
-(-4, -10), (-1, -10), (1, -12)], [(-2, -7), (-3, -6), (-4, -4), (-4, -3),
-(-6, -3), (-7, -2), (-7, 0), (-6, -1), (-4, -1), (-4, 4)], [(-3, -5),
-(-3, 2)], [(-6, -2), (-3, -2)], [(-2, -7), (-2, 1), (-3, 3), (-4, 4)],
-[(1, -8), (1, 7), (0, 8), (-1, 8), (-5, 6), (-7, 6), (-9, 7), (-11, 9)],
-[(2, -8), (2, 6)], [(2, -2), (6, -2)], [(-2, 8), (-3, 8), (-5, 7), (-8,
-7)], [(3, -9), (3, -3), (6, -3)], [(6, -1), (3, -1), (3, 5), (2, 7),
-(-2, 9), (-4, 9), (-6, 8), (-8, 8), (-11, 9)], [(1, -8), (3, -9), (6,
--12), (8, -11), (10, -11), (11, -12)], [(5, -11), (7, -10), (9, -10)],
-[(4, -10), (6, -9), (8, -9), (10, -10), (11, -12)], [(6, -9), (6, 5)]]},
-3507: {'charcode': 3507, 'left': -13, 'right': 12, 'lines': [[(-4, -11),
-(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5),
-(-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 6), (9, 4), (9, 1), (8,
--1), (7, -2), (5, -3), (3, -3)], [(-8, -7), (-9, -4), (-9, 1), (-8, 4)],
-[(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1), (-7, 4), (-6, 6),
-(-4, 8)], [(7, 6), (8, 5), (8, 1), (7, -1)], [(3, 9), (5, 8), (6, 7),
-(7, 5), (7, 1), (6, -1), (5, -2), (3, -3)], [(-2, -8), (-2, 5)], [(-1,
--8), (-1, 3)], [(0, -9), (0, 2), (-1, 4), (-2, 5)], [(-2, -8), (0, -9),
-(3, -12), (5, -11), (7, -11), (8, -12)], [(2, -11), (4, -10), (6, -10)],
-[(1, -10), (3, -9), (5, -9), (7, -10), (8, -12)], [(7, -10), (3, -3),
-(3, 9)], [(3, 1), (7, 1)], [(3, 4), (7, 4)]]}, 3508: {'charcode': 3508,
-'left': -12, 'right': 12, 'lines': [[(-10, -10), (-8, -12), (-5, -12),
-(-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11),
-(-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3),
-(-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5),
-(-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)],
-[(-8, 9), (-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-3, 7), (0, 7),
-(2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1,
--8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2),
-(-2, 3)], [(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11),
-(6, -11), (7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3),
-(5, -4), (7, -6), (8, -5), (9, -2), (9, 2), (8, 6), (6, 9)], [(6, -5),
-(7, -4), (8, -2), (8, 3), (7, 6)], [(5, -4), (6, -4), (7, -2), (7, 3),
-(6, 9)], [(3, -3), (3, 7)], [(3, 0), (7, 0)], [(3, 3), (7, 3)]]}, 3509:
-{'charcode': 3509, 'left': -9, 'right': 10, 'lines': [[(-6, -10), (-4,
--12), (-1, -12), (2, -11), (4, -12)], [(-3, -11), (1, -11)], [(-6, -10),
-(-4, -11), (-1, -10), (2, -10), (4, -12)], [(1, -7), (0, -6), (-1, -4),
-(-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3, -1), (-1, -1), (-1, 4)], [(0,
--5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7), (1, 1), (0, 3), (-1, 4)],
-[(7, -10), (5, -8), (4, -5), (4, 6), (3, 8), (1, 8), (-3, 6), (-5, 6),
-(-7, 7), (-9, 9)], [(5, -7), (5, 5)], [(0, 8), (-1, 8), (-3, 7), (-6, 7)],
-[(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (1, 9), (-2, 9), (-4, 8),
-(-7, 8), (-9, 9)]]}, 3510: {'charcode': 3510, 'left': -10, 'right': 10,
-'lines': [[(-6, -10), (-4, -12), (-1, -12), (2, -11), (4, -12)], [(-3,
--11), (1, -11)], [(-6, -10), (-4, -11), (-1, -10), (2, -10), (4, -12)],
-[(1, -7), (0, -6), (-1, -4), (-1, -3), (-3, -3), (-4, -2), (-4, 0), (-3,
--1), (-1, -1), (-1, 4)], [(0, -5), (0, 2)], [(-3, -2), (0, -2)], [(1, -7),
-(1, 1), (0, 3), (-1, 4)], [(7, -10), (5, -8), (4, -5), (4, 6), (3, 8)],
-[(5, -7), (5, 5)], [(7, -10), (6, -8), (6, 4), (5, 6), (3, 8), (0, 9),
-(-3, 9), (-6, 8), (-8, 6), (-8, 4), (-7, 3), (-6, 3), (-5, 4), (-6, 5),
-(-7, 5)], [(-8, 4), (-5, 4)]]}, 3511: {'charcode': 3511, 'left': -12,
-'right': 12, 'lines': [[(-10, -10), (-8, -12), (-5, -12), (-3, -11),
-(-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11), (-6, -10),
-(-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3), (-9, -3),
-(-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5), (-6, 3)],
-[(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)], [(-8, 9),
-(-5, 7), (-2, 6), (1, 6), (3, 7)], [(-6, 8), (-4, 7), (0, 7), (2, 8)],
-[(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9), (-1, -8), (-2, -6),
-(-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0), (-1, 2), (-2, 3)],
-[(0, -9), (2, -11), (4, -12), (6, -12), (8, -11)], [(5, -11), (6, -11),
-(7, -10)], [(2, -11), (4, -11), (6, -9), (8, -11)], [(3, -3), (6, -6),
-(7, -5), (9, -4)], [(5, -5), (7, -4), (9, -4)], [(9, -4), (7, -1),
-(5, 1), (3, 3)], [(5, 1), (7, 2), (8, 6), (9, 8), (10, 8)], [(7, 4),
-(8, 8)], [(5, 1), (6, 2), (7, 8), (8, 9), (9, 9), (10, 8)], [(3, -3),
-(3, 7)]]}, 3512: {'charcode': 3512, 'left': -11, 'right': 11, 'lines':
-[[(-9, -10), (-7, -12), (-4, -12), (-2, -11), (0, -12)], [(-6, -11),
-(-3, -11)], [(-9, -10), (-7, -11), (-5, -10), (-2, -10), (0, -12)],
-[(-4, -7), (-5, -6), (-6, -4), (-6, -3), (-8, -3), (-9, -2), (-9, 0),
-(-8, -1), (-6, -1), (-6, 5)], [(-5, -5), (-5, 3)], [(-8, -2), (-5, -2)],
-[(-4, -7), (-4, 2), (-5, 4), (-6, 5)], [(-7, 9), (-4, 7), (0, 6), (5,
-6), (9, 7)], [(-5, 8), (-2, 7), (5, 7), (8, 8)], [(-7, 9), (-3, 8), (4,
-8), (7, 9), (9, 7)], [(1, -9), (0, -8), (-1, -6), (-1, 3)], [(0, -7),
-(0, 1)], [(1, -9), (1, 0), (0, 2), (-1, 3)], [(1, -9), (3, -11), (5,
--12), (7, -12), (9, -11)], [(6, -11), (7, -11), (8, -10)], [(3, -11),
-(5, -11), (7, -9), (9, -11)], [(5, -11), (5, 6)]]}, 3513: {'charcode':
-3513, 'left': -14, 'right': 14, 'lines': [[(-6, -8), (-7, -7), (-8, -5),
-(-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 3)],
-[(-7, -6), (-7, 1)], [(-10, -2), (-7, -2)], [(-6, -8), (-6, 0), (-7, 2),
-(-8, 3)], [(-13, 9), (-11, 7), (-9, 6), (-7, 6), (-5, 7), (-4, 7), (-3,
-6)], [(-10, 7), (-7, 7), (-5, 8)], [(-13, 9), (-11, 8), (-8, 8), (-6,
-9), (-5, 9), (-4, 8), (-3, 6)], [(-6, -8), (-2, -12), (2, -8), (2, 5),
-(3, 7), (4, 7)], [(-2, -11), (1, -8), (1, 6), (0, 7), (1, 8), (2, 7),
-(1, 6)], [(-2, -2), (1, -2)], [(-4, -10), (-3, -10), (0, -7), (0, -3),
-(-3, -3)], [(-3, -1), (0, -1), (0, 6), (-1, 7), (1, 9), (4, 7), (5, 6)],
-[(2, -8), (6, -12), (10, -8), (10, 5), (11, 7), (12, 7)], [(6, -11),
-(9, -8), (9, 6), (11, 8)], [(6, -2), (9, -2)], [(4, -10), (5, -10), (8,
--7), (8, -3), (5, -3)], [(5, -1), (8, -1), (8, 7), (10, 9), (12, 7)],
-[(-3, -10), (-3, 6)], [(5, -10), (5, 6)]]}, 3514: {'charcode': 3514,
-'left': -13, 'right': 12, 'lines': [[(-11, -9), (-9, -11), (-7, -12),
-(-5, -12), (-3, -11), (-1, -8), (4, 3), (6, 6), (7, 7)], [(-5, -11),
-(-3, -9), (-2, -7), (4, 5), (7, 8)], [(-9, -11), (-7, -11), (-5, -10),
-(-3, -7), (2, 4), (4, 7), (5, 8), (7, 9)], [(4, -10), (6, -9), (8, -9),
-(10, -10), (11, -12)], [(5, -11), (7, -10), (9, -10)], [(4, -10), (6,
--12), (8, -11), (10, -11), (11, -12)], [(-7, -3), (-9, -3), (-10, -2),
-(-10, 0), (-9, -1), (-7, -1)], [(-9, -2), (-7, -2)], [(-11, 9), (-9, 7),
-(-7, 6), (-4, 6), (-2, 7)], [(-8, 7), (-5, 7), (-3, 8)], [(-11, 9), (-8,
-8), (-5, 8), (-4, 9), (-2, 7)], [(-7, -11), (-7, 6)], [(7, -9), (7, 9)],
-[(0, -6), (1, -5), (3, -4), (5, -4), (7, -5)], [(-7, 2), (-5, 1), (-1, 1),
-(1, 2)]]}, 3515: {'charcode': 3515, 'left': -13, 'right': 13, 'lines':
-[[(-4, -12), (-6, -11), (-8, -9), (-9, -7), (-10, -4), (-10, 0), (-9, 3),
-(-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9,
-3), (10, 0), (10, -4), (9, -7), (8, -9), (6, -11), (4, -12), (3, -11),
-(0, -9), (-3, -8)], [(-8, -8), (-9, -5), (-9, 1), (-8, 4)], [(-4, -12),
-(-6, -10), (-7, -8), (-8, -5), (-8, 1), (-7, 4), (-6, 6), (-4, 8)],
-[(8, 4), (9, 1), (9, -5), (7, -9), (6, -10)], [(4, 8), (6, 6), (7, 4),
-(8, 1), (8, -5), (7, -7), (5, -10), (3, -11)], [(-3, -8), (-3, 5)],
-[(-2, -8), (-2, 3)], [(-1, -8), (-1, 2), (-2, 4), (-3, 5)], [(3, -11),
-(3, 8)], [(3, -5), (5, -4), (6, -4), (8, -5)], [(3, 1), (5, 0), (6, 0),
-(8, 1)]]}, 3516: {'charcode': 3516, 'left': -10, 'right': 12, 'lines':
-[[(-7, -12), (-6, -11), (-5, -9), (-5, -3), (-7, -3), (-8, -2), (-8, 0),
-(-7, -1), (-5, -1), (-5, 7), (-8, 9), (-5, 8), (-5, 16), (-3, 14)], [(-5,
--10), (-4, -8), (-4, 14)], [(-7, -2), (-4, -2)], [(-7, -12), (-5, -11),
-(-4, -10), (-3, -8), (-3, 14)], [(-3, -7), (0, -9), (4, -12), (8, -8),
-(8, 6)], [(4, -11), (7, -8), (7, 6)], [(2, -10), (3, -10), (6, -7), (6,
-7)], [(0, 6), (3, 6), (6, 7)], [(1, 7), (3, 7), (5, 8)], [(0, 8), (2, 8),
-(4, 9), (6, 7), (8, 6)], [(0, -9), (0, 13)], [(0, -5), (2, -4), (4, -4),
-(6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]}, 3517: {'charcode': 3517,
-'left': -13, 'right': 13, 'lines': [[(-4, -12), (-6, -11), (-8, -9),
-(-9, -7), (-10, -4), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-2,
-9), (2, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7),
-(8, -9), (6, -11), (4, -12), (3, -11), (0, -9), (-3, -8)], [(-8, -8),
-(-9, -5), (-9, 1), (-8, 4)], [(-4, -12), (-6, -10), (-7, -8), (-8, -5),
-(-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -5), (7, -9),
-(6, -10)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -5), (7, -7), (5, -10),
-(3, -11)], [(-3, -8), (-3, 5)], [(-2, -8), (-2, 3)], [(-1, -8), (-1, 2),
-(-2, 4), (-3, 5)], [(3, -11), (3, 8)], [(3, -5), (5, -4), (6, -4), (8,
--5)], [(3, 1), (5, 0), (6, 0), (8, 1)], [(-2, 9), (-1, 8), (0, 8), (2, 9),
-(6, 14), (8, 15), (9, 15)], [(2, 10), (4, 13), (6, 15), (7, 15)], [(0, 8),
-(1, 9), (4, 15), (6, 16), (8, 16), (9, 15)]]}, 3518: {'charcode': 3518,
-'left': -12, 'right': 12, 'lines': [[(-10, -10), (-8, -12), (-5, -12),
-(-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11),
-(-6, -10), (-3, -10), (-1, -12)], [(-5, -7), (-6, -6), (-7, -4), (-7, -3),
-(-9, -3), (-10, -2), (-10, 0), (-9, -1), (-7, -1), (-7, 5)], [(-6, -5),
-(-6, 3)], [(-9, -2), (-6, -2)], [(-5, -7), (-5, 2), (-6, 4), (-7, 5)],
-[(-8, 9), (-5, 7), (-2, 6), (0, 6), (3, 7)], [(-6, 8), (-4, 7), (0,
-7), (2, 8)], [(-8, 9), (-4, 8), (-1, 8), (1, 9), (3, 7)], [(0, -9),
-(-1, -8), (-2, -6), (-2, 3)], [(-1, -7), (-1, 1)], [(0, -9), (0, 0),
-(-1, 2), (-2, 3)], [(0, -9), (3, -11), (5, -12), (7, -11), (8, -9),
-(8, -6), (7, -4), (6, -3), (2, -1), (0, 0)], [(5, -11), (6, -11), (7,
--9), (7, -5), (6, -4)], [(3, -11), (5, -10), (6, -8), (6, -5), (5, -3),
-(2, -1)], [(2, -1), (4, 0), (5, 1), (8, 6), (9, 7), (10, 7)], [(5, 2),
-(7, 6), (9, 8)], [(2, -1), (4, 1), (6, 7), (8, 9), (10, 7)]]}, 3519:
-{'charcode': 3519, 'left': -11, 'right': 12, 'lines': [[(3, -9), (2,
--10), (0, -11), (-3, -12)], [(4, -10), (2, -11)], [(5, -11), (1, -12),
-(-3, -12), (-6, -11), (-7, -10), (-8, -8), (-7, -6), (-6, -5), (-3, -4),
-(5, -4), (7, -3), (8, -2), (8, 0), (7, 3)], [(-7, -7), (-6, -6), (-3, -5),
-(6, -5), (8, -4), (9, -3), (9, -1), (8, 1)], [(-7, -10), (-7, -8), (-6,
--7), (-3, -6), (7, -6), (9, -5), (10, -3), (10, -1), (7, 3), (3, 9)],
-[(-9, -3), (-8, -2), (-6, -1), (3, -1), (4, 0), (4, 1), (3, 3)], [(-8,
--1), (-6, 0), (2, 0), (3, 1)], [(-9, -3), (-9, -2), (-8, 0), (-6, 1),
-(1, 1), (3, 2), (3, 3)], [(-9, 9), (-6, 7), (-2, 6), (1, 6), (4, 7)],
-[(-7, 8), (-4, 7), (0, 7), (3, 8)], [(-9, 9), (-5, 8), (0, 8), (3, 9)],
-[(5, -11), (3, -9), (1, -6)], [(0, -4), (-2, -1)], [(-3, 1), (-5, 3),
-(-7, 4), (-8, 4), (-8, 3), (-7, 4)]]}, 3520: {'charcode': 3520, 'left':
--13, 'right': 11, 'lines': [[(-8, -8), (-9, -6), (-10, -3), (-10, 1),
-(-9, 4), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 5),
-(9, 3)], [(-9, 1), (-8, 4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)],
-[(-8, -8), (-9, -5), (-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7),
-(5, 6), (7, 5), (9, 3)], [(-10, -9), (-9, -11), (-7, -12), (-3, -12), (3,
--11), (7, -11), (9, -12)], [(-2, -11), (2, -10), (6, -10)], [(-10, -9),
-(-9, -10), (-7, -11), (-4, -11), (2, -9), (5, -9), (7, -10), (9, -12)],
-[(1, -9), (0, -8), (-2, -7), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8),
-(0, 1), (-1, 3), (-2, 4)], [(5, -9), (5, 6)]]}, 3521: {'charcode': 3521,
-'left': -12, 'right': 12, 'lines': [[(-10, -10), (-8, -12), (-6, -12),
-(-3, -11), (-1, -12)], [(-7, -11), (-4, -11)], [(-10, -10), (-8, -11),
-(-5, -10), (-3, -10), (-1, -12)], [(-7, -8), (-8, -6), (-9, -3), (-9, 1),
-(-8, 4), (-7, 6), (-5, 8), (-2, 9), (1, 9), (4, 8), (6, 7), (8, 9), (10,
-7)], [(-8, 1), (-7, 4), (-4, 7), (-1, 8), (2, 8)], [(-7, -8), (-8, -4),
-(-8, -1), (-7, 2), (-6, 4), (-4, 6), (-1, 7), (3, 7), (6, 6)], [(3, -9),
-(-1, -8), (-2, -6), (-2, 4)], [(-1, -7), (-1, 2)], [(0, -8), (0, 1),
-(-1, 3), (-2, 4)], [(3, -9), (5, -10), (7, -12), (8, -11), (10, -10),
-(8, -9), (8, 5), (9, 7), (10, 7)], [(7, -9), (8, -10), (7, -11), (6,
--10), (7, -9), (7, 6), (9, 8)], [(5, -10), (6, -9), (6, 6)], [(3, -9),
-(3, 7)], [(3, -4), (6, -4)], [(3, 0), (6, 0)]]}, 3522: {'charcode': 3522,
-'left': -11, 'right': 12, 'lines': [[(-8, -12), (-7, -11), (-6, -9), (-6,
--3), (-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)],
-[(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7),
-(1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6),
-(3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6), (8, 6)],
-[(0, -8), (3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9),
-(8, 6)], [(7, -9), (8, -10), (7, -11), (6, -10), (7, -9), (7, 5)], [(5,
--10), (6, -9), (6, 6)], [(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4),
-(6, -5)], [(0, 1), (2, 0), (4, 0), (6, 1)]]}, 3523: {'charcode': 3523,
-'left': -13, 'right': 14, 'lines': [[(-10, -12), (-9, -11), (-8, -9),
-(-8, -3), (-10, -3), (-11, -2), (-11, 0), (-10, -1), (-8, -1), (-8, 6),
-(-10, 7)], [(-8, -10), (-7, -8), (-7, 6)], [(-10, -2), (-7, -2)], [(-6,
-7), (-4, 7), (-2, 8)], [(-10, -12), (-8, -11), (-7, -10), (-6, -8), (-6,
-6), (-3, 6), (-1, 7)], [(-10, 7), (-7, 7), (-4, 8), (-3, 9), (-1, 7),
-(2, 6), (4, 7), (5, 9), (7, 7), (10, 6)], [(-3, -10), (0, -12), (2, -10),
-(2, 6), (5, 6), (7, 7)], [(0, -11), (1, -10), (1, 6)], [(-3, -10), (-1,
--10), (0, -9), (0, 6), (-1, 7)], [(5, 7), (6, 8)], [(5, -10), (8, -12),
-(10, -10), (10, 6)], [(8, -11), (9, -10), (9, 6)], [(5, -10), (7, -10),
-(8, -9), (8, 6), (7, 7)], [(-3, -10), (-3, 6)], [(5, -10), (5, 6)],
-[(-3, -4), (0, -4)], [(-3, 0), (0, 0)], [(5, -4), (8, -4)], [(5, 0),
-(8, 0)]]}, 3524: {'charcode': 3524, 'left': -11, 'right': 11, 'lines':
-[[(-10, -9), (-8, -11), (-6, -12), (-4, -12), (-3, -11), (5, 7), (6, 8),
-(8, 8)], [(-5, -11), (-4, -10), (4, 7), (5, 8)], [(-8, -11), (-6, -11),
-(-5, -10), (3, 8), (4, 9), (6, 9), (8, 8), (10, 6)], [(5, -12), (7,
--11), (9, -11), (10, -12)], [(5, -11), (6, -10), (8, -10)], [(4, -10),
-(5, -9), (7, -9), (9, -10), (10, -12)], [(-10, 9), (-9, 7), (-7, 6),
-(-5, 6), (-4, 7)], [(-8, 7), (-6, 7), (-5, 8)], [(-10, 9), (-9, 8),
-(-7, 8), (-5, 9)], [(5, -12), (1, -3)], [(-1, 0), (-5, 9)], [(-6, -2),
-(-2, -2)], [(1, -2), (6, -2)]]}, 3525: {'charcode': 3525, 'left': -11,
-'right': 12, 'lines': [[(-8, -12), (-7, -11), (-6, -9), (-6, -3),
-(-8, -3), (-9, -2), (-9, 0), (-8, -1), (-6, -1), (-6, 6), (-8, 7)],
-[(-6, -10), (-5, -8), (-5, 6)], [(-8, -2), (-5, -2)], [(-4, 7), (-1, 7),
-(1, 8)], [(-8, -12), (-6, -11), (-5, -10), (-4, -8), (-4, 6), (0, 6),
-(3, 7)], [(-8, 7), (-5, 7), (-2, 8), (0, 9), (3, 7), (6, 6)], [(0, -8),
-(3, -9), (5, -10), (7, -12), (8, -11), (10, -10), (8, -9), (8, 12),
-(7, 14), (5, 16), (3, 15), (-1, 14), (-6, 14)], [(7, -9), (8, -10), (7,
--11), (6, -10), (7, -9), (7, 7)], [(5, -10), (6, -9), (6, 6), (8, 9)],
-[(6, 15), (4, 14), (1, 14)], [(7, 14), (4, 13), (-2, 13), (-6, 14)],
-[(0, -8), (0, 6)], [(0, -5), (2, -4), (4, -4), (6, -5)], [(0, 1), (2,
-0), (4, 0), (6, 1)]]}, 3526: {'charcode': 3526, 'left': -10, 'right':
-10, 'lines': [[(6, -11), (5, -9), (0, -3), (-3, 1), (-5, 5), (-8, 9)],
-[(4, -7), (-4, 4)], [(8, -12), (5, -8), (3, -4), (0, 0), (-5, 6), (-6,
-8)], [(-8, -10), (-6, -12), (-3, -11), (3, -11), (8, -12)], [(-7, -11),
-(-3, -10), (1, -10), (5, -11)], [(-8, -10), (-4, -9), (0, -9), (4, -10),
-(6, -11)], [(-6, 8), (-4, 7), (0, 6), (4, 6), (8, 7)], [(-5, 8), (-1, 7),
-(3, 7), (7, 8)], [(-8, 9), (-3, 8), (3, 8), (6, 9), (8, 7)], [(-5, -2),
-(-1, -2)], [(2, -2), (6, -2)]]}, 3601: {'charcode': 3601, 'left': -8,
-'right': 9, 'lines': [[(-2, 0), (-4, 2), (-5, 4), (-5, 6), (-4, 8),
-(-2, 9), (0, 7), (3, 6)], [(-5, 4), (-4, 6), (-3, 7), (-1, 8)], [(-4,
-2), (-4, 4), (-3, 6), (-1, 7), (0, 7)], [(-4, -2), (-2, -2), (1, -3),
-(3, -4), (4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(-3, -4),
-(-4, -3), (-1, -3)], [(2, -3), (5, -3), (4, -4), (4, 7), (5, 8)], [(-5,
--3), (-3, -5), (-2, -4), (0, -3), (3, -2), (3, 7), (5, 9), (7, 7)],
-[(-5, -3), (0, 2)]]}, 3602: {'charcode': 3602, 'left': -9, 'right': 9,
-'lines': [[(-6, -10), (-5, -8), (-5, 6), (-7, 7)], [(-4, -8), (-5, -10),
-(-4, -11), (-4, 6), (-1, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7),
-(0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)],
-[(-3, -2), (0, -3), (2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5,
--2), (5, 7)], [(2, -4), (4, -3), (4, 6)], [(0, -3), (1, -3), (3, -2),
-(3, 7)]]}, 3603: {'charcode': 3603, 'left': -8, 'right': 6, 'lines':
-[[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -3),
-(-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)],
-[(-4, -3), (0, -4), (2, -5), (3, -4), (5, -3), (6, -3)], [(1, -4), (2,
--3), (4, -3)], [(-2, -3), (0, -4), (2, -2), (4, -2), (6, -3)]]}, 3604:
-{'charcode': 3604, 'left': -9, 'right': 8, 'lines': [[(0, -5), (-2, -4),
-(-5, -3), (-5, 6), (-7, 7)], [(-4, -3), (-4, 6), (-1, 8)], [(0, -5),
-(-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2,
-9), (0, 8), (3, 7), (5, 7)], [(-5, -10), (-2, -12), (-1, -9), (5, -3),
-(5, 7)], [(-2, -9), (-4, -10), (-3, -11), (-2, -9), (4, -3), (4, 6)],
-[(-5, -10), (3, -2), (3, 7)]]}, 3605: {'charcode': 3605, 'left': -8,
-'right': 6, 'lines': [[(-4, -3), (-4, 6), (-6, 7), (-5, 7), (-3, 8),
-(-2, 9)], [(-3, -3), (-3, 7), (-1, 8)], [(-2, -3), (-2, 6), (0, 7),
-(1, 7), (-1, 8), (-2, 9)], [(-4, -3), (0, -4), (2, -5), (5, -1), (3,
-0), (-2, 3)], [(1, -4), (4, -1)], [(-2, -3), (0, -4), (3, 0)]]}, 3606:
-{'charcode': 3606, 'left': -8, 'right': 5, 'lines': [[(-4, -10), (-4, 6),
-(-6, 7), (-5, 7), (-3, 8), (-2, 9)], [(-3, -10), (-3, 7), (-1, 8)], [(-2,
--10), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-4, -10), (-1, -11),
-(1, -12), (2, -11), (4, -10), (5, -10)], [(0, -11), (1, -10), (3, -10)],
-[(-2, -10), (-1, -11), (1, -9), (3, -9), (5, -10)], [(-7, -5), (-4, -5)],
-[(-2, -5), (2, -5)]]}, 3607: {'charcode': 3607, 'left': -9, 'right': 9,
-'lines': [[(-5, -3), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2,
-8), (0, 7), (3, 6)], [(-4, -2), (-4, 7), (-2, 8)], [(-3, -3), (-3, 6),
-(-1, 7), (0, 7)], [(-5, -3), (-3, -3), (0, -4), (2, -5), (3, -4), (5, -3),
-(7, -3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14),
-(-5, 14)], [(1, -4), (4, -2), (4, 10)], [(1, 15), (-1, 14), (-2, 14)],
-[(0, -4), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14),
-(-1, 13), (-3, 13), (-5, 14)]]}, 3608: {'charcode': 3608, 'left': -9,
-'right': 9, 'lines': [[(-6, -10), (-5, -8), (-5, 6), (-7, 7), (-6, 7),
-(-4, 8), (-3, 9)], [(-4, -8), (-5, -10), (-4, -11), (-4, 7), (-2, 8)],
-[(-6, -10), (-3, -12), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3),
-(2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 7), (3, 9),
-(2, 11)], [(2, -4), (4, -3), (4, 7), (3, 9)], [(0, -3), (1, -3), (3, -2),
-(3, 7), (2, 11), (2, 14), (3, 16), (4, 16), (2, 14)]]}, 3609: {'charcode':
-3609, 'left': -5, 'right': 5, 'lines': [[(0, -12), (-2, -10), (0, -9),
-(2, -10), (0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0,
--5), (-1, -4), (-3, -3), (-1, -2), (-1, 7), (1, 9), (3, 7)], [(0, -2),
-(1, -3), (0, -4), (-1, -3), (0, -2), (0, 7), (1, 8)], [(0, -5), (1, -4),
-(3, -3), (1, -2), (1, 6), (2, 7), (3, 7)]]}, 3610: {'charcode': 3610,
-'left': -5, 'right': 5, 'lines': [[(0, -12), (-2, -10), (0, -9), (2, -10),
-(0, -12)], [(0, -11), (-1, -10), (1, -10), (0, -11)], [(0, -5), (-1, -4),
-(-3, -3), (-1, -2), (-1, 7), (1, 9), (2, 11)], [(0, -2), (1, -3), (0, -4),
-(-1, -3), (0, -2), (0, 7), (1, 9)], [(0, -5), (1, -4), (3, -3), (1, -2),
-(1, 7), (2, 11), (2, 14), (0, 16), (-2, 16), (-2, 15), (0, 16)]]}, 3611:
-{'charcode': 3611, 'left': -9, 'right': 8, 'lines': [[(-6, -10), (-5,
--8), (-5, 6), (-7, 7), (-6, 7), (-4, 8), (-3, 9)], [(-4, -8), (-5, -10),
-(-4, -11), (-4, 7), (-2, 8)], [(-6, -10), (-3, -12), (-3, 6), (-1, 7),
-(-3, 9)], [(-3, -2), (0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1,
--4), (3, -2)], [(0, -4), (2, -1)], [(1, 0), (2, 1), (4, 6), (5, 7), (6,
-7)], [(1, 1), (2, 2), (3, 7), (4, 8)], [(0, 1), (1, 2), (2, 7), (4, 9),
-(6, 7)]]}, 3612: {'charcode': 3612, 'left': -5, 'right': 5, 'lines':
-[[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8), (1, 9)],
-[(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10), (1, -12),
-(1, 6), (3, 7), (4, 7), (2, 8), (1, 9)]]}, 3613: {'charcode': 3613,
-'left': -13, 'right': 13, 'lines': [[(-11, -3), (-10, -3), (-9, -2),
-(-9, 6), (-11, 7), (-10, 7), (-8, 8), (-7, 9)], [(-9, -4), (-8, -3),
-(-8, 7), (-6, 8)], [(-11, -3), (-9, -5), (-7, -3), (-7, 6), (-5, 7),
-(-7, 9)], [(-7, -2), (-4, -3), (-2, -4), (-1, -5), (1, -3), (1, 6), (3,
-7), (1, 9)], [(-2, -4), (0, -3), (0, 7), (2, 8)], [(-4, -3), (-3, -3),
-(-1, -2), (-1, 6), (-2, 7), (0, 8), (1, 9)], [(1, -2), (4, -3), (6, -4),
-(7, -5), (8, -4), (10, -3), (11, -3), (9, -2), (9, 6), (10, 7), (11, 7)],
-[(6, -4), (8, -3), (8, 7), (9, 8)], [(4, -3), (5, -3), (7, -2), (7, 7),
-(9, 9), (11, 7)]]}, 3614: {'charcode': 3614, 'left': -9, 'right': 9,
-'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7), (-6, 7),
-(-4, 8), (-3, 9)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3),
-(-5, -5), (-3, -3), (-3, 6), (-1, 7), (-3, 9)], [(-3, -2), (0, -3),
-(2, -4), (3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7),
-(7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(0, -3), (1, -3), (3,
--2), (3, 7), (5, 9), (7, 7)]]}, 3615: {'charcode': 3615, 'left': -9,
-'right': 9, 'lines': [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4,
-6), (-1, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 8)], [(-7, 7), (-5, 7),
-(-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-5, -3), (-3, -3), (0, -4),
-(2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 7)], [(1, -4), (4, -2),
-(4, 6)], [(0, -4), (1, -3), (3, -2), (3, 7)]]}, 3616: {'charcode': 3616,
-'left': -9, 'right': 9, 'lines': [[(-6, -5), (-5, -3), (-5, 6), (-7, 7),
-(-5, 7), (-5, 16)], [(-5, -4), (-4, -3), (-4, 15), (-3, 14), (-4, 12)],
-[(-4, 7), (-3, 7), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6),
-(-1, 7), (0, 8)], [(-3, 8), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-3, 8),
-(-3, 12), (-2, 14), (-5, 16)], [(-3, -2), (0, -3), (2, -4), (3, -5),
-(4, -4), (6, -3), (7, -3), (5, -2), (5, 7)], [(2, -4), (4, -3), (4, 6)],
-[(0, -3), (1, -3), (3, -2), (3, 7)]]}, 3617: {'charcode': 3617, 'left':
--9, 'right': 9, 'lines': [[(-5, -3), (-5, 6), (-7, 7)], [(-4, -2), (-4,
-7), (-2, 8)], [(-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7),
-(-4, 8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(-5, -3), (-3, -3), (0, -4),
-(2, -5), (3, -4), (5, -3), (7, -3), (5, -2), (5, 16)], [(1, -4), (4, -2),
-(4, 15), (3, 14), (4, 12)], [(0, -4), (1, -3), (3, -2), (3, 12), (2, 14),
-(5, 16)]]}, 3618: {'charcode': 3618, 'left': -8, 'right': 6, 'lines':
-[[(-6, -3), (-5, -3), (-4, -2), (-4, 6), (-6, 7), (-5, 7), (-3, 8),
-(-2, 9)], [(-5, -4), (-3, -3), (-3, 7), (-1, 8)], [(-6, -3), (-4, -5),
-(-2, -3), (-2, 6), (0, 7), (1, 7), (-1, 8), (-2, 9)], [(-2, -3), (2, -5),
-(3, -4), (5, -3), (6, -3)], [(1, -4), (2, -3), (4, -3)], [(0, -4), (2,
--2), (4, -2), (6, -3)]]}, 3619: {'charcode': 3619, 'left': -8, 'right':
-8, 'lines': [[(-5, -3), (-5, 1), (-3, 2), (3, 2), (5, 3), (5, 7)], [(-4,
--3), (-4, 1)], [(4, 3), (4, 7)], [(-2, -4), (-3, -3), (-3, 1), (-1, 2)],
-[(1, 2), (3, 3), (3, 7), (2, 8)], [(-5, -3), (-2, -4), (0, -5), (2, -4),
-(4, -4), (5, -5)], [(-1, -4), (1, -4)], [(-2, -4), (0, -3), (2, -3),
-(4, -4)], [(5, 7), (2, 8), (0, 9), (-2, 8), (-4, 8), (-6, 9)], [(1, 8),
-(-1, 8)], [(2, 8), (0, 7), (-3, 7), (-6, 9)], [(5, -5), (4, -3), (2, 0),
-(-3, 5), (-6, 9)]]}, 3620: {'charcode': 3620, 'left': -5, 'right': 5,
-'lines': [[(-2, -10), (-1, -8), (-1, 6), (-3, 7), (-2, 7), (0, 8),
-(1, 9)], [(0, -8), (-1, -10), (0, -11), (0, 7), (2, 8)], [(-2, -10),
-(1, -12), (1, 6), (3, 7), (4, 7), (2, 8), (1, 9)], [(-4, -5), (-1, -5)],
-[(1, -5), (4, -5)]]}, 3621: {'charcode': 3621, 'left': -9, 'right': 9,
-'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-7, 7)], [(-6, -4),
-(-4, -3), (-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6),
-(-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4, 8), (-3, 9), (-2, 8), (0, 7),
-(3, 6)], [(3, -5), (4, -4), (6, -3), (7, -3), (5, -2), (5, 6), (6, 7),
-(7, 7)], [(2, -4), (4, -3), (4, 7), (5, 8)], [(3, -5), (1, -3), (3, -2),
-(3, 7), (5, 9), (7, 7)]]}, 3622: {'charcode': 3622, 'left': -9, 'right':
-9, 'lines': [[(-6, -5), (-5, -3), (-5, 6), (-2, 9), (0, 7), (3, 6),
-(5, 6)], [(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4),
-(-3, -3), (-3, 5), (-2, 6), (0, 7)], [(3, -5), (4, -4), (6, -3), (7, -3),
-(5, -2), (5, 6)], [(2, -4), (4, -3), (4, 5)], [(3, -5), (1, -3), (3, -2),
-(3, 6)]]}, 3623: {'charcode': 3623, 'left': -13, 'right': 13, 'lines':
-[[(-10, -5), (-9, -3), (-9, 6), (-6, 9), (-4, 7), (-1, 6)], [(-9, -4),
-(-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5),
-(-6, 6), (-4, 7)], [(-1, -5), (-3, -3), (-1, -2), (-1, 6), (2, 9), (4,
-7), (7, 6), (9, 6)], [(-2, -4), (0, -3), (0, 6), (3, 8)], [(-1, -5),
-(0, -4), (2, -3), (1, -2), (1, 5), (2, 6), (4, 7)], [(7, -5), (8, -4),
-(10, -3), (11, -3), (9, -2), (9, 6)], [(6, -4), (8, -3), (8, 5)], [(7,
--5), (5, -3), (7, -2), (7, 6)]]}, 3624: {'charcode': 3624, 'left': -10,
-'right': 9, 'lines': [[(-7, -3), (-6, -3), (-4, -2), (-3, -1), (1, 7),
-(2, 8), (4, 9), (6, 7)], [(-5, -4), (-3, -3), (2, 7), (4, 8)], [(-7, -3),
-(-5, -5), (-3, -4), (-2, -3), (2, 5), (3, 6), (5, 7), (6, 7)], [(0, 1),
-(3, -5), (4, -4), (6, -4), (7, -5)], [(3, -4), (4, -3), (5, -3)], [(2,
--3), (4, -2), (6, -3), (7, -5)], [(-1, 3), (-4, 9), (-5, 8), (-7, 8),
-(-8, 9)], [(-4, 8), (-5, 7), (-6, 7)], [(-3, 7), (-5, 6), (-7, 7),
-(-8, 9)], [(-5, 2), (-2, 2)], [(1, 2), (4, 2)]]}, 3625: {'charcode':
-3625, 'left': -9, 'right': 9, 'lines': [[(-7, -3), (-6, -3), (-5, -2),
-(-5, 6), (-7, 7)], [(-6, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7, -3),
-(-5, -5), (-3, -3), (-3, 6), (-1, 7), (0, 7)], [(-7, 7), (-6, 7), (-4,
-8), (-3, 9), (-2, 8), (0, 7), (3, 6)], [(3, -5), (4, -4), (6, -3), (7,
--3), (5, -2), (5, 10), (4, 13), (2, 15), (0, 16), (-1, 15), (-3, 14),
-(-5, 14)], [(2, -4), (4, -3), (4, 10)], [(1, 15), (-1, 14), (-2, 14)],
-[(3, -5), (1, -3), (3, -2), (3, 8), (4, 11), (4, 13)], [(2, 15), (1, 14),
-(-1, 13), (-3, 13), (-5, 14)]]}, 3626: {'charcode': 3626, 'left': -9,
-'right': 9, 'lines': [[(6, -5), (-6, 9)], [(-6, -3), (-4, -2), (-1, -2),
-(2, -3), (6, -5)], [(-5, -4), (-3, -3), (1, -3)], [(-6, -3), (-4, -5),
-(-2, -4), (2, -4), (6, -5)], [(-6, 9), (-2, 7), (1, 6), (4, 6), (6, 7)],
-[(-1, 7), (3, 7), (5, 8)], [(-6, 9), (-2, 8), (2, 8), (4, 9), (6, 7)],
-[(-4, 2), (4, 2)]]}, 3697: {'charcode': 3697, 'left': 0, 'right': 0,
-'lines': [[]]}, 3698: {'charcode': 3698, 'left': -4, 'right': 4, 'lines':
-[[]]}, 3699: {'charcode': 3699, 'left': -8, 'right': 8, 'lines': [[]]},
-3700: {'charcode': 3700, 'left': -10, 'right': 10, 'lines': [[(-6, -10),
-(-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6),
-(-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (1, -11), (3, -12)], [(1, -11),
-(2, -10), (4, -9), (4, 7)], [(2, -11), (5, -9), (5, 6)], [(3, -12), (4,
--11), (6, -10), (8, -10), (6, -9), (6, 7)], [(-8, 7), (-6, 7), (-4, 8),
-(-3, 9), (-1, 8), (4, 7), (6, 7)]]}, 3701: {'charcode': 3701, 'left': -10,
-'right': 10, 'lines': [[(-3, -10), (-2, -9), (-1, -7), (-1, 6), (-3, 7)],
-[(-1, -9), (-2, -10), (-1, -11), (0, -9), (0, 7), (2, 8)], [(-3, -10),
-(0, -12), (1, -10), (1, 6), (3, 7), (4, 7)], [(-3, 7), (-2, 7), (0, 8),
-(1, 9), (2, 8), (4, 7)]]}, 3702: {'charcode': 3702, 'left': -10, 'right':
-10, 'lines': [[(-6, -10), (-4, -10), (-2, -11), (-1, -12), (1, -11), (4,
--10), (6, -10)], [(-2, -10), (0, -11)], [(-6, -10), (-4, -9), (-2, -9),
-(0, -10), (1, -11)], [(4, -10), (4, -2)], [(5, -9), (5, -3)], [(6, -10),
-(6, -2), (-1, -2), (-4, -1), (-6, 1), (-7, 4), (-7, 9)], [(-7, 9), (-3,
-7), (1, 6), (4, 6), (8, 7)], [(-4, 8), (-1, 7), (4, 7), (7, 8)], [(-7, 9),
-(-2, 8), (3, 8), (6, 9), (8, 7)]]}, 3703: {'charcode': 3703, 'left': -10,
-'right': 10, 'lines': [[(-6, -10), (-5, -10), (-3, -11), (-2, -12), (0,
--11), (4, -10), (6, -10)], [(-3, -10), (-1, -11)], [(-6, -10), (-4, -9),
-(-2, -9), (0, -11)], [(4, -10), (4, -3)], [(5, -9), (5, -4)], [(6, -10),
-(6, -3), (4, -3), (1, -2), (-1, -1)], [(-1, -2), (1, -1), (4, 0), (6, 0),
-(6, 7)], [(5, 1), (5, 6)], [(4, 0), (4, 7)], [(-7, 7), (-5, 6), (-3, 6),
-(-1, 7), (0, 8)], [(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2,
-9), (0, 8), (4, 7), (6, 7)]]}, 3704: {'charcode': 3704, 'left': -10,
-'right': 10, 'lines': [[(3, -12), (-7, -2), (-7, 3), (2, 3)], [(4, 3),
-(8, 3), (9, 4), (9, 2), (8, 3)], [(-6, -2), (-6, 2)], [(-5, -4), (-5, 3)],
-[(2, -11), (2, 6), (0, 7)], [(3, -8), (4, -10), (3, -11), (3, 7), (5, 8)],
-[(3, -12), (5, -10), (4, -8), (4, 6), (6, 7), (7, 7)], [(0, 7), (1, 7),
-(3, 8), (4, 9), (5, 8), (7, 7)]]}, 3705: {'charcode': 3705, 'left': -10,
-'right': 10, 'lines': [[(-6, -12), (-6, -3)], [(-6, -12), (6, -12)],
-[(-5, -11), (4, -11)], [(-6, -10), (3, -10), (5, -11), (6, -12)], [(4,
--6), (3, -5), (1, -4), (-3, -3), (-6, -3)], [(1, -4), (2, -4), (4, -3),
-(4, 7)], [(3, -5), (5, -4), (5, 6)], [(4, -6), (5, -5), (7, -4), (8, -4),
-(6, -3), (6, 7)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)], [(-3, 7),
-(-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7), (6, 7)]]},
-3706: {'charcode': 3706, 'left': -10, 'right': 10, 'lines': [[(-6, -10),
-(-6, 6), (-8, 7)], [(-5, -9), (-5, 6), (-2, 8)], [(-4, -10), (-4, 6),
-(-2, 7), (-1, 8)], [(-6, -10), (-4, -10), (0, -11), (2, -12), (3, -11),
-(5, -10), (6, -10)], [(1, -11), (3, -10)], [(0, -11), (2, -9), (4, -9),
-(6, -10)], [(-4, -2), (-3, -2), (1, -3), (3, -4), (4, -5)], [(1, -3),
-(2, -3), (4, -2), (4, 7)], [(3, -4), (5, -2), (5, 6)], [(4, -5), (5,
--4), (7, -3), (8, -3), (6, -2), (6, 7)], [(-8, 7), (-6, 7), (-4, 8),
-(-3, 9), (-1, 8), (4, 7), (6, 7)]]}, 3707: {'charcode': 3707, 'left':
--10, 'right': 10, 'lines': [[(-7, -10), (-5, -12), (-2, -11), (3, -11),
-(8, -12)], [(-6, -11), (-3, -10), (2, -10), (5, -11)], [(-7, -10), (-3,
--9), (0, -9), (4, -10), (8, -12)], [(8, -12), (7, -10), (5, -7), (1,
--3), (-1, 0), (-2, 3), (-2, 6), (-1, 9)], [(0, -1), (-1, 2), (-1, 5),
-(0, 8)], [(3, -5), (1, -2), (0, 1), (0, 4), (1, 7), (-1, 9)]]}, 3708:
-{'charcode': 3708, 'left': -10, 'right': 10, 'lines': [[(-6, -9), (-6,
--3)], [(-5, -8), (-5, -4)], [(-4, -9), (-4, -3)], [(-6, -9), (-4, -9),
-(1, -10), (3, -11), (4, -12)], [(1, -10), (2, -10), (4, -9), (4, -3)],
-[(3, -11), (5, -10), (5, -4)], [(4, -12), (5, -11), (7, -10), (8, -10),
-(6, -9), (6, -3)], [(-6, -3), (-4, -3), (4, 0), (6, 0)], [(6, -3),
-(4, -3), (-4, 0), (-6, 0)], [(-6, 0), (-6, 6), (-8, 7)], [(-5, 1),
-(-5, 6), (-2, 8)], [(-4, 0), (-4, 6), (-2, 7), (-1, 8)], [(4, 0), (4,
-7)], [(5, 1), (5, 6)], [(6, 0), (6, 7)], [(-8, 7), (-6, 7), (-4, 8),
-(-3, 9), (-1, 8), (4, 7), (6, 7)]]}, 3709: {'charcode': 3709, 'left':
--10, 'right': 10, 'lines': [[(-6, -10), (-6, -1), (-8, 0)], [(-5, -9),
-(-5, 0), (-3, 1)], [(-4, -10), (-4, -1), (-2, 0), (-1, 0)], [(-6, -10),
-(-4, -10), (1, -11), (3, -12)], [(1, -11), (2, -10), (4, -9), (4, 7)],
-[(2, -11), (5, -9), (5, 6)], [(3, -12), (4, -11), (6, -10), (8, -10),
-(6, -9), (6, 7)], [(-8, 0), (-7, 0), (-5, 1), (-4, 2), (-3, 1), (-1,
-0), (3, -1), (4, -1)], [(-7, 7), (-5, 6), (-3, 6), (-1, 7), (0, 8)],
-[(-3, 7), (-1, 8)], [(-7, 7), (-5, 7), (-3, 8), (-2, 9), (0, 8), (4, 7),
-(6, 7)]]}, 3710: {'charcode': 3710, 'left': -6, 'right': 6, 'lines':
-[[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8),
-(0, 7)]]}, 3711: {'charcode': 3711, 'left': -6, 'right': 6, 'lines':
-[[(0, 12), (0, 10), (-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)],
-[(0, 7), (-1, 8), (0, 9), (0, 7)]]}, 3712: {'charcode': 3712, 'left': -6,
-'right': 6, 'lines': [[(0, -5), (-2, -3), (0, -2), (2, -3), (0, -5)],
-[(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 6), (-2, 8), (0, 9), (2, 8),
-(0, 6)], [(0, 7), (-1, 8), (1, 8), (0, 7)]]}, 3713: {'charcode': 3713,
-'left': -6, 'right': 6, 'lines': [[(0, -5), (-2, -3), (0, -2), (2, -3),
-(0, -5)], [(0, -4), (-1, -3), (1, -3), (0, -4)], [(0, 12), (0, 10),
-(-2, 8), (0, 6), (1, 8), (1, 10), (0, 12), (-2, 13)], [(0, 7), (-1, 8),
-(0, 9), (0, 7)]]}, 3714: {'charcode': 3714, 'left': -6, 'right': 6,
-'lines': [[(0, -12), (-1, -11), (-3, -10), (-1, -9), (0, 2)], [(0, -9),
-(1, -10), (0, -11), (-1, -10), (0, -9), (0, 2)], [(0, -12), (1, -11),
-(3, -10), (1, -9), (0, 2)], [(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)],
-[(0, 7), (-1, 8), (1, 8), (0, 7)]]}, 3715: {'charcode': 3715, 'left': -9,
-'right': 9, 'lines': [[(-6, -8), (-5, -10), (-4, -11), (-1, -12), (1,
--12), (4, -11), (5, -10), (6, -8), (6, -6), (5, -4), (3, -2), (1, -1)],
-[(-5, -8), (-4, -10)], [(4, -10), (5, -9), (5, -5), (4, -4)], [(-6, -8),
-(-4, -7), (-4, -9), (-3, -11), (-1, -12)], [(1, -12), (3, -11), (4, -9),
-(4, -5), (3, -3), (1, -1)], [(0, -1), (0, 2), (1, -1), (-1, -1), (0, 2)],
-[(0, 6), (-2, 8), (0, 9), (2, 8), (0, 6)], [(0, 7), (-1, 8), (1, 8),
-(0, 7)]]}, 3716: {'charcode': 3716, 'left': -6, 'right': 6, 'lines':
-[[(2, -12), (0, -11), (-1, -9), (-1, -7), (0, -5), (2, -7), (0, -9),
-(0, -11)], [(0, -8), (0, -6), (1, -7), (0, -8)]]}, 3717: {'charcode':
-3717, 'left': -6, 'right': 6, 'lines': [[(0, -6), (0, -8), (-2, -10),
-(0, -12), (1, -10), (1, -8), (0, -6), (-2, -5)], [(0, -11), (-1, -10),
-(0, -9), (0, -11)]]}, 3718: {'charcode': 3718, 'left': -13, 'right': 13,
-'lines': [[(7, -4), (8, -3), (9, -3), (10, -4)], [(6, -3), (7, -2),
-(9, -2)], [(6, -2), (7, -1), (8, -1), (9, -2), (10, -4)], [(7, -4),
-(1, 2)], [(0, 3), (-6, 9), (-10, 4), (-4, -2)], [(-3, -3), (1, -7),
-(-3, -12), (-8, -6), (-2, 0), (2, 6), (4, 8), (6, 9), (8, 9), (9, 8),
-(10, 6)], [(-6, 8), (-9, 4)], [(0, -7), (-3, -11)], [(-7, -6), (-2, -1),
-(2, 5), (4, 7), (6, 8), (9, 8)], [(-5, 8), (-9, 3)], [(0, -6), (-4,
--11)], [(-7, -7), (-1, -1), (3, 5), (4, 6), (6, 7), (9, 7), (10, 6)]]},
-3719: {'charcode': 3719, 'left': -10, 'right': 10, 'lines': [[(-2, -16),
-(-2, 13)], [(2, -16), (2, 13)], [(2, -12), (4, -11), (5, -9), (5, -7),
-(7, -8), (6, -10), (5, -11), (2, -12), (-2, -12), (-5, -11), (-7, -9),
-(-7, -6), (-6, -4), (-3, -2), (3, 0), (5, 1), (6, 3), (6, 6), (5, 8)],
-[(6, -8), (5, -10)], [(-6, -6), (-5, -4), (-3, -3), (3, -1), (5, 0),
-(6, 2)], [(-5, 7), (-6, 5)], [(-5, -11), (-6, -9), (-6, -7), (-5, -5),
-(-3, -4), (3, -2), (6, 0), (7, 2), (7, 5), (6, 7), (5, 8), (2, 9),
-(-2, 9), (-5, 8), (-6, 7), (-7, 5), (-5, 4), (-5, 6), (-4, 8), (-2,
-9)]]}, 3720: {'charcode': 3720, 'left': -11, 'right': 12, 'lines':
-[[(9, -16), (-9, 16), (-8, 16)], [(9, -16), (10, -16), (-8, 16)]]},
-3721: {'charcode': 3721, 'left': -7, 'right': 7, 'lines': [[(3, -16),
-(1, -14), (-1, -11), (-3, -7), (-4, -2), (-4, 2), (-3, 7), (-1, 11),
-(1, 14), (3, 16)], [(-1, -10), (-2, -7), (-3, -3), (-3, 3), (-2, 7),
-(-1, 10)], [(1, -14), (0, -12), (-1, -9), (-2, -3), (-2, 3), (-1, 9),
-(0, 12), (1, 14)]]}, 3722: {'charcode': 3722, 'left': -7, 'right': 7,
-'lines': [[(-3, -16), (-1, -14), (1, -11), (3, -7), (4, -2), (4, 2), (3,
-7), (1, 11), (-1, 14), (-3, 16)], [(1, -10), (2, -7), (3, -3), (3, 3),
-(2, 7), (1, 10)], [(-1, -14), (0, -12), (1, -9), (2, -3), (2, 3), (1, 9),
-(0, 12), (-1, 14)]]}, 3723: {'charcode': 3723, 'left': -8, 'right': 8,
-'lines': [[(0, -12), (-1, -11), (1, -1), (0, 0)], [(0, -12), (0, 0)],
-[(0, -12), (1, -11), (-1, -1), (0, 0)], [(-5, -9), (-4, -9), (4, -3),
-(5, -3)], [(-5, -9), (5, -3)], [(-5, -9), (-5, -8), (5, -4), (5, -3)],
-[(5, -9), (4, -9), (-4, -3), (-5, -3)], [(5, -9), (-5, -3)], [(5, -9),
-(5, -8), (-5, -4), (-5, -3)]]}, 3724: {'charcode': 3724, 'left': -12,
-'right': 13, 'lines': [[(-8, -1), (9, -1), (9, 0)], [(-8, -1), (-8, 0),
-(9, 0)]]}, 3725: {'charcode': 3725, 'left': -12, 'right': 13, 'lines':
-[[(0, -9), (0, 8), (1, 8)], [(0, -9), (1, -9), (1, 8)], [(-8, -1), (9,
--1), (9, 0)], [(-8, -1), (-8, 0), (9, 0)]]}, 3726: {'charcode': 3726,
-'left': -12, 'right': 13, 'lines': [[(-8, -5), (9, -5), (9, -4)], [(-8,
--5), (-8, -4), (9, -4)], [(-8, 3), (9, 3), (9, 4)], [(-8, 3), (-8, 4),
-(9, 4)]]}, 3727: {'charcode': 3727, 'left': -4, 'right': 5, 'lines':
-[[(1, -12), (0, -11), (0, -5)], [(1, -11), (0, -5)], [(1, -12), (2, -11),
-(0, -5)]]}, 3728: {'charcode': 3728, 'left': -9, 'right': 9, 'lines':
-[[(-4, -12), (-5, -11), (-5, -5)], [(-4, -11), (-5, -5)], [(-4, -12),
-(-3, -11), (-5, -5)], [(5, -12), (4, -11), (4, -5)], [(5, -11), (4, -5)],
-[(5, -12), (6, -11), (4, -5)]]}, 3729: {'charcode': 3729, 'left': -7,
-'right': 7, 'lines': [[(-1, -12), (-3, -11), (-4, -9), (-4, -7), (-3,
--5), (-1, -4), (1, -4), (3, -5), (4, -7), (4, -9), (3, -11), (1, -12),
-(-1, -12)], [(-1, -12), (-4, -9), (-3, -5), (1, -4), (4, -7), (3, -11),
-(-1, -12)], [(1, -12), (-3, -11), (-4, -7), (-1, -4), (3, -5), (4, -9),
-(1, -12)]]}, 3801: {'charcode': 3801, 'left': -13, 'right': 13, 'lines':
-[[(-4, -10), (-6, -9), (-8, -7), (-9, -5), (-10, -2), (-10, 1), (-9, 3),
-(-7, 4)], [(-8, -6), (-9, -3), (-9, 1), (-8, 3)], [(-4, -10), (-6, -8),
-(-7, -6), (-8, -3), (-8, 0), (-7, 4), (-7, 6), (-8, 8), (-10, 9)], [(4,
--10), (6, -10), (6, 7), (4, 7)], [(7, -10), (7, 7)], [(8, -11), (8, 8)],
-[(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10, -12)], [(-8,
--2), (6, -2)], [(-10, 9), (-7, 8), (-1, 7), (4, 7), (8, 8), (10, 9)]]},
-3802: {'charcode': 3802, 'left': -13, 'right': 13, 'lines': [[(-6, -11),
-(-6, 8)], [(-5, -11), (-5, 8)], [(-2, -12), (-4, -11), (-4, 8), (-2, 9)],
-[(-10, -8), (-8, -10), (-6, -11), (-2, -12), (3, -12), (6, -11), (8, -9),
-(8, -7), (7, -5)], [(6, -10), (7, -9), (7, -7), (6, -5)], [(3, -12),
-(5, -11), (6, -9), (6, -7), (5, -6)], [(-1, 3), (-3, 2), (-4, 0), (-4,
--2), (-3, -4), (-2, -5), (1, -6), (4, -6), (7, -5), (9, -3), (10, -1),
-(10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-6, 8), (-8, 7),
-(-10, 5)], [(8, -3), (9, -1), (9, 3), (8, 5)], [(4, -6), (7, -4), (8,
--1), (8, 3), (7, 6), (5, 8)]]}, 3803: {'charcode': 3803, 'left': -13,
-'right': 13, 'lines': [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11),
-(1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3),
-(-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8),
-(6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)],
-[(8, -7), (7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7),
-(-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4),
-(-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6),
-(7, 4), (8, 1)]]}, 3804: {'charcode': 3804, 'left': -13, 'right': 13,
-'lines': [[(-7, -11), (-7, 8)], [(-6, -11), (-6, 8)], [(-4, -12), (-5,
--11), (-5, 8), (-4, 9)], [(-10, -7), (-9, -9), (-7, -11), (-4, -12), (1,
--12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3), (10, 0), (9, 3),
-(8, 5), (6, 7), (4, 8), (1, 9), (-4, 9), (-7, 8), (-9, 6), (-10, 4)],
-[(8, -7), (9, -4), (9, 1), (8, 4)], [(4, -11), (6, -9), (7, -7), (8, -4),
-(8, 1), (7, 4), (6, 6), (4, 8)]]}, 3805: {'charcode': 3805, 'left': -13,
-'right': 13, 'lines': [[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11),
-(1, -12), (-1, -12), (-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3),
-(-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8),
-(6, 7), (8, 5), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)],
-[(8, -7), (7, -8)], [(8, -5), (6, -9), (4, -11)], [(-8, -7), (-9, -4),
-(-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 4)], [(4, 8), (6, 6), (7, 4),
-(8, 1)], [(-8, -2), (-7, -3), (-4, -3), (3, -1), (6, -1), (8, -2)],
-[(-2, -2), (0, -1), (3, 0), (5, 0), (7, -1)], [(-5, -3), (0, 0), (3, 1),
-(5, 1), (7, 0), (8, -2)], [(8, -5), (7, -6), (6, -6), (5, -5), (6, -4),
-(7, -5)]]}, 3806: {'charcode': 3806, 'left': -13, 'right': 13, 'lines':
-[[(-8, -10), (-8, 8)], [(-5, -11), (-7, -10), (-7, 7)], [(-3, -12),
-(-5, -11), (-6, -9), (-6, 7), (-4, 7)], [(-10, -8), (-8, -10), (-6,
--11), (-3, -12), (1, -12), (4, -11), (6, -10), (7, -9), (10, -12)],
-[(10, -12), (9, -10), (8, -6), (8, -3), (9, 1), (10, 3)], [(8, -9), (7,
--7)], [(4, -11), (6, -9), (7, -6), (8, -3)], [(-6, -2), (-5, -3), (-3,
--3), (2, -2), (5, -2), (7, -3)], [(-1, -2), (2, -1), (4, -1), (6, -2)],
-[(-4, -3), (2, 0), (4, 0), (6, -1), (7, -3), (7, -6), (6, -7), (5, -7),
-(4, -6), (5, -5), (6, -6)], [(-10, 9), (-8, 8), (-4, 7), (1, 7), (7, 8),
-(10, 9)]]}, 3807: {'charcode': 3807, 'left': -13, 'right': 13, 'lines':
-[[(10, -12), (9, -10), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12),
-(-4, -11), (-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3),
-(-8, 5), (-6, 7), (-4, 8), (-1, 9), (2, 9), (4, 8), (6, 7), (7, 6), (8,
-4), (9, 7), (10, 9)], [(9, -10), (8, -5), (8, 2), (9, 7)], [(8, -7),
-(7, -8)], [(8, -4), (7, -7), (6, -9), (4, -11)], [(-8, -7), (-9, -4),
-(-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4), (-8, 1),
-(-7, 4), (-6, 6), (-4, 8)], [(6, 6), (7, 4), (7, 0)], [(4, 8), (5, 7),
-(6, 4), (6, -1)], [(-7, 1), (-6, 0), (-5, 1), (-6, 2), (-7, 2), (-8, 1)],
-[(-8, -2), (-7, -4), (-5, -5), (-3, -5), (0, -4), (3, -2), (5, -1)],
-[(-7, -3), (-5, -4), (-3, -4), (0, -3), (2, -2)], [(-8, -2), (-6, -3),
-(-3, -3), (3, -1), (7, -1), (8, -2)]]}, 3808: {'charcode': 3808, 'left':
--13, 'right': 13, 'lines': [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10),
-(-7, 8)], [(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4,
--10), (1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6),
-(0, -7), (4, -7), (7, -6), (9, -4), (10, -1), (10, 2), (9, 3), (7, 4)],
-[(8, -4), (9, -2), (9, 1), (8, 3)], [(4, -7), (6, -6), (7, -5), (8, -3),
-(8, 1), (7, 4), (7, 6), (8, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8),
-(3, 9)]]}, 3809: {'charcode': 3809, 'left': -13, 'right': 13, 'lines':
-[[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)], [(-10,
--12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9),
-(-7, 8), (-3, 7), (3, 7), (7, 8), (10, 9)]]}, 3810: {'charcode': 3810,
-'left': -13, 'right': 13, 'lines': [[(2, -9), (4, -9), (4, 6), (3, 8),
-(1, 9)], [(5, -9), (5, 6), (4, 7)], [(6, -10), (6, 7)], [(-10, -12),
-(-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-9, -3), (-10, -1),
-(-10, 3), (-9, 6), (-7, 8), (-4, 9), (1, 9), (4, 8), (6, 7), (8, 5),
-(10, 2)], [(-9, 3), (-8, 6), (-7, 7)], [(-10, 1), (-8, 3), (-7, 6),
-(-6, 8), (-4, 9)]]}, 3811: {'charcode': 3811, 'left': -13, 'right':
-13, 'lines': [[(-8, -11), (-8, 8), (-10, 9)], [(-7, -10), (-7, 8)],
-[(-4, -10), (-6, -10), (-6, 8)], [(-10, -12), (-8, -11), (-4, -10),
-(1, -10), (7, -11), (10, -12)], [(-6, -2), (-5, -4), (-3, -6), (0, -7),
-(3, -7), (6, -6), (7, -5), (7, -3), (6, -2), (1, 0), (-1, 1), (-2, 2),
-(-2, 3), (-1, 4), (0, 3), (-1, 2)], [(5, -6), (6, -5), (6, -3), (5,
--2)], [(3, -7), (5, -5), (5, -3), (4, -2), (1, 0)], [(1, 0), (4, 0),
-(7, 1), (8, 3), (8, 5), (7, 6)], [(5, 1), (7, 3), (7, 5)], [(1, 0),
-(4, 1), (6, 3), (7, 6), (8, 8), (9, 9), (10, 9)], [(-10, 9), (-6, 8),
-(-2, 8), (3, 9)]]}, 3812: {'charcode': 3812, 'left': -13, 'right': 13,
-'lines': [[(-8, -11), (-8, 8)], [(-7, -10), (-7, 7)], [(-4, -10), (-6,
--10), (-6, 7), (-4, 7)], [(10, -7), (8, -4), (7, -2), (6, 1), (6, 3),
-(7, 5), (9, 6)], [(8, -3), (7, 0), (7, 3), (8, 5)], [(10, -7), (9, -5),
-(8, -1), (8, 2), (9, 6), (10, 9)], [(-10, -12), (-8, -11), (-4, -10),
-(1, -10), (7, -11), (10, -12)], [(-10, 9), (-8, 8), (-4, 7), (1, 7),
-(7, 8), (10, 9)]]}, 3813: {'charcode': 3813, 'left': -13, 'right': 13,
-'lines': [[(-1, -9), (-1, 7)], [(0, -8), (0, 6)], [(1, -9), (1, 7)],
-[(-4, 7), (-6, 5), (-8, 4), (-9, 3), (-10, 0), (-10, -5), (-9, -8),
-(-7, -10), (-5, -11), (-2, -12), (2, -12), (5, -11), (7, -10), (9, -8),
-(10, -5), (10, 0), (9, 3), (8, 4), (6, 5), (4, 7)], [(-8, 3), (-9, 0),
-(-9, -5), (-8, -8)], [(-6, 5), (-7, 3), (-8, 0), (-8, -6), (-7, -9),
-(-5, -11)], [(8, -8), (9, -5), (9, 0), (8, 3)], [(5, -11), (7, -9),
-(8, -6), (8, 0), (7, 3), (6, 5)], [(-10, -12), (-6, -10), (-2, -9), (2,
--9), (6, -10), (10, -12)], [(-10, 9), (-7, 8), (-3, 7), (3, 7), (7, 8),
-(10, 9)]]}, 3814: {'charcode': 3814, 'left': -13, 'right': 13, 'lines':
-[[(-8, -10), (-8, 8), (-10, 9)], [(-6, -10), (-7, -9), (-7, 8)], [(-3,
--12), (-5, -11), (-6, -9), (-6, 8)], [(-10, -8), (-8, -10), (-6, -11),
-(-3, -12), (1, -12), (4, -11), (6, -10), (8, -8), (9, -6), (10, -3),
-(10, 1), (9, 3), (7, 4)], [(8, -7), (9, -4), (9, 0), (8, 3)], [(4, -11),
-(6, -9), (7, -7), (8, -4), (8, 0), (7, 4), (7, 6), (8, 8), (9, 9), (10,
-9)], [(-10, 9), (-6, 8), (-2, 8), (3, 9)]]}, 3815: {'charcode': 3815,
-'left': -13, 'right': 13, 'lines': [[(-1, -12), (-4, -11), (-6, -10),
-(-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7), (-4,
-8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0), (10, -3),
-(9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)], [(-8, -7),
-(-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7), (-8, -4),
-(-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4), (8, -7)],
-[(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9), (4, -11)]]},
-3816: {'charcode': 3816, 'left': -13, 'right': 13, 'lines': [[(-8, -9),
-(-8, 8)], [(-5, -10), (-7, -8), (-7, 7)], [(-1, -12), (-3, -11), (-5, -9),
-(-6, -7), (-6, 7), (-4, 7)], [(-10, -7), (-8, -9), (-4, -11), (-1, -12),
-(2, -12), (5, -11), (7, -10), (9, -8), (10, -5), (10, -3), (9, 0), (7, 2),
-(4, 3), (0, 3), (-3, 2), (-5, 0), (-6, -3)], [(8, -8), (9, -6), (9, -2),
-(8, 0)], [(5, -11), (7, -9), (8, -6), (8, -2), (7, 1), (4, 3)], [(-10, 9),
-(-8, 8), (-4, 7), (1, 7), (7, 8), (10, 9)]]}, 3817: {'charcode': 3817,
-'left': -13, 'right': 13, 'lines': [[(-1, -12), (-4, -11), (-6, -10),
-(-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5), (-6, 7),
-(-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7), (8, 5), (9, 3), (10, 0),
-(10, -3), (9, -6), (8, -8), (6, -10), (4, -11), (1, -12), (-1, -12)],
-[(-8, -7), (-9, -4), (-9, 1), (-8, 4)], [(-4, -11), (-6, -9), (-7, -7),
-(-8, -4), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(8, 4), (9, 1), (9, -4),
-(8, -7)], [(4, 8), (6, 6), (7, 4), (8, 1), (8, -4), (7, -7), (6, -9),
-(4, -11)], [(-8, 1), (-7, 3), (-4, 4), (2, 5), (9, 5), (10, 6), (10, 8),
-(9, 9), (9, 8), (10, 7)], [(-2, 5), (0, 5)], [(-7, 3), (-4, 5), (-1, 6),
-(1, 6), (2, 5)]]}, 3818: {'charcode': 3818, 'left': -13, 'right': 13,
-'lines': [[(-8, -9), (-8, 8), (-10, 9)], [(-7, -9), (-7, 8)], [(-6,
--10), (-6, 8)], [(-10, -7), (-8, -9), (-6, -10), (-4, -11), (-1, -12),
-(3, -12), (7, -11), (9, -9), (10, -7), (10, -4), (9, -2), (8, -1)],
-[(7, -10), (8, -9), (9, -7), (9, -4), (8, -2)], [(3, -12), (5, -11),
-(7, -9), (8, -7), (8, -3), (7, -1)], [(6, 0), (3, 1), (0, 1), (-2, 0),
-(-2, -2), (0, -3), (3, -3), (6, -2), (8, 0), (10, 3), (10, 5), (9, 6),
-(8, 6)], [(6, -1), (7, 0), (9, 4), (9, 5), (8, 2)], [(2, -3), (4, -2),
-(6, 0), (7, 2), (8, 6), (9, 8), (10, 9)], [(-10, 9), (-6, 8), (-2, 8),
-(3, 9)]]}, 3819: {'charcode': 3819, 'left': -13, 'right': 13, 'lines':
-[[(2, -12), (8, -11), (10, -12), (9, -10), (9, -8), (7, -10), (5, -11),
-(2, -12), (-2, -12), (-5, -11), (-8, -8), (-9, -5), (-9, -3), (-8, 0),
-(-6, 2), (-3, 3), (0, 3), (2, 2), (3, 1), (4, -1), (4, -2)], [(9, -11),
-(8, -10), (9, -8)], [(-8, -2), (-7, 0), (-6, 1), (-3, 2), (0, 2), (2,
-1)], [(-7, -9), (-8, -7), (-8, -4), (-7, -2), (-5, 0), (-2, 1), (0, 1),
-(2, 0), (4, -2), (5, -3), (6, -3)], [(-6, -1), (-5, -1), (-4, -2), (-2,
--4), (0, -5), (3, -5), (5, -4), (7, -2), (8, 0), (8, 3), (7, 6), (5, 8)],
-[(-2, -5), (0, -6), (3, -6), (6, -5), (8, -3), (9, 0), (9, 3), (8, 5)],
-[(-9, 5), (-8, 7), (-9, 8)], [(-4, -2), (-4, -3), (-3, -5), (-2, -6),
-(0, -7), (3, -7), (6, -6), (9, -3), (10, 0), (10, 2), (9, 5), (7, 7),
-(5, 8), (2, 9), (-2, 9), (-5, 8), (-7, 7), (-9, 5), (-9, 7), (-10, 9),
-(-8, 8), (-2, 9)]]}, 3820: {'charcode': 3820, 'left': -13, 'right': 13,
-'lines': [[(-1, -10), (-5, -10), (-7, -9), (-8, -8), (-9, -6), (-10, -3),
-(-10, 1), (-9, 4), (-8, 6), (-7, 7), (-5, 8), (-2, 9), (1, 9), (4, 8),
-(6, 7), (8, 5), (9, 3), (10, 0), (10, -4), (9, -7), (7, -9), (5, -10)],
-[(3, -10), (2, -9), (2, -7), (3, -6), (4, -7), (3, -8)], [(-9, 1), (-8,
-4), (-6, 6), (-4, 7), (-1, 8), (2, 8), (5, 7)], [(-8, -8), (-9, -4),
-(-9, -1), (-8, 2), (-6, 5), (-4, 6), (-1, 7), (2, 7), (5, 6), (7, 5),
-(9, 2), (10, 0)], [(-10, -12), (-7, -9)], [(-7, -10), (-6, -11)], [(-9,
--11), (-8, -11), (-7, -12), (-5, -11), (-1, -10), (5, -10), (8, -11),
-(10, -12)]]}, 3821: {'charcode': 3821, 'left': -13, 'right': 13, 'lines':
-[[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10, 0), (-9, 3), (-8, 5),
-(-6, 7), (-4, 8), (-1, 9), (3, 9), (6, 8), (8, 7)], [(-7, -8), (-8, -6),
-(-9, -3), (-9, 1), (-8, 4)], [(-7, -9), (-6, -8), (-6, -7), (-7, -5),
-(-8, -2), (-8, 1), (-7, 4), (-6, 6), (-4, 8)], [(4, -10), (6, -10),
-(6, 6), (5, 8), (3, 9)], [(7, -10), (7, 6), (6, 7)], [(8, -11), (8, 7),
-(10, 9)], [(-10, -12), (-7, -11), (-1, -10), (4, -10), (8, -11), (10,
--12)]]}, 3822: {'charcode': 3822, 'left': -13, 'right': 13, 'lines':
-[[(-10, -12), (0, 9)], [(-9, -11), (-8, -10), (-1, 5), (0, 7)], [(-8,
--11), (-7, -10), (0, 5), (1, 6)], [(10, -12), (0, 9)], [(5, -4), (3, 1)],
-[(7, -6), (3, -1), (2, 2), (2, 4)], [(-10, -12), (-8, -11), (-3, -10),
-(3, -10), (8, -11), (10, -12)]]}, 3823: {'charcode': 3823, 'left': -13,
-'right': 13, 'lines': [[(-6, -10), (-8, -8), (-9, -6), (-10, -3), (-10,
-0), (-9, 3), (-8, 5), (-6, 7), (-4, 8), (-1, 9), (1, 9), (4, 8), (6, 7),
-(8, 5), (9, 3), (10, 0), (10, -3), (9, -6), (8, -8), (6, -10)], [(-8,
--6), (-9, -3), (-9, 0), (-8, 3), (-7, 5)], [(-8, -8), (-7, -7), (-7, -6),
-(-8, -3), (-8, 0), (-7, 4), (-6, 6), (-4, 8)], [(7, 5), (8, 3), (9, 0),
-(9, -3), (8, -6)], [(4, 8), (6, 6), (7, 4), (8, 0), (8, -3), (7, -6),
-(7, -7), (8, -8)], [(-1, -9), (-1, 9)], [(0, -8), (0, 8)], [(1, -9),
-(1, 9)], [(-10, -12), (-6, -10), (-2, -9), (2, -9), (6, -10), (10,
--12)]]}, 3824: {'charcode': 3824, 'left': -13, 'right': 13, 'lines':
-[[(-10, -12), (6, 7), (7, 8)], [(-9, -11), (-7, -10), (8, 8)], [(-6, -10),
-(10, 9)], [(10, -12), (1, -2)], [(-1, 0), (-8, 8)], [(-2, 1), (-5, 3),
-(-6, 5)], [(-1, 0), (-5, 2), (-6, 3), (-7, 5), (-7, 7)], [(-10, -12),
-(-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 9), (-8, 8),
-(-4, 7), (1, 7), (7, 8), (10, 9)]]}, 3825: {'charcode': 3825, 'left': -13,
-'right': 13, 'lines': [[(6, -10), (6, 8)], [(7, -10), (7, 7)], [(8, -11),
-(8, 7)], [(-7, -10), (-9, -8), (-10, -5), (-10, -2), (-9, 1), (-7, 3),
-(-5, 4), (-2, 5), (1, 5), (4, 4), (6, 3)], [(-6, 3), (-3, 4), (3, 4)],
-[(-10, -2), (-9, 0), (-7, 2), (-4, 3), (2, 3), (4, 4)], [(-10, -12),
-(-6, -10), (-2, -9), (2, -9), (6, -10), (10, -12)], [(-10, 5), (-8, 7),
-(-6, 8), (-2, 9), (2, 9), (6, 8), (10, 6)]]}, 3826: {'charcode': 3826,
-'left': -13, 'right': 13, 'lines': [[(-10, -12), (-9, -11), (-7, -10),
-(-4, -10), (1, -12), (4, -12), (7, -11), (8, -9), (8, -7), (7, -5)],
-[(6, -11), (7, -9), (7, -7), (6, -5)], [(4, -12), (5, -11), (6, -9),
-(6, -6)], [(6, -4), (2, -3), (0, -3), (-2, -4), (-2, -6), (0, -7), (2,
--7), (6, -6)], [(2, -7), (4, -6), (5, -5), (4, -4), (2, -3)], [(7, -5),
-(9, -3), (10, 0), (10, 2), (9, 5), (7, 7), (5, 8), (2, 9), (-2, 9), (-5,
-8), (-7, 7), (-9, 5), (-10, 2), (-10, 0), (-9, -3), (-8, -4), (-6, -5),
-(-4, -5), (-2, -4), (-2, -2), (-3, -1), (-4, -2), (-3, -3)], [(6, -5),
-(8, -3), (9, -1), (9, 3), (8, 5)], [(6, -4), (7, -3), (8, -1), (8, 3), (7,
-6), (5, 8)]]}, 3901: {'charcode': 3901, 'left': -8, 'right': 9, 'lines':
-[[(-2, -1), (-5, 2), (-5, 6), (-2, 9), (2, 7)], [(-4, 2), (-4, 6), (-2,
-8)], [(-3, 0), (-3, 5), (0, 8)], [(0, 1), (-5, -4), (-4, -5), (-3, -4),
-(-4, -3)], [(-3, -4), (1, -4), (3, -5), (5, -3), (5, 6), (6, 7)], [(3,
--4), (4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(1, -4), (3, -2),
-(3, 6), (2, 7), (4, 9), (6, 7)]]}, 3902: {'charcode': 3902, 'left': -9,
-'right': 8, 'lines': [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-2, 9),
-(3, 7), (5, 6)], [(-4, -10), (-4, 6), (-2, 8)], [(-4, -10), (-2, -12),
-(-3, -8), (-3, 5), (0, 8)], [(-3, -3), (2, -5), (5, -2), (5, 6)], [(2,
--4), (4, -2), (4, 6)], [(0, -4), (3, -1), (3, 7)]]}, 3903: {'charcode':
-3903, 'left': -7, 'right': 5, 'lines': [[(-4, -2), (-4, 7), (-2, 9),
-(0, 7)], [(-3, -2), (-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7),
-(0, 7)], [(-4, -2), (2, -5), (4, -3), (2, -2), (0, -4)], [(1, -4), (3,
--3)]]}, 3904: {'charcode': 3904, 'left': -8, 'right': 8, 'lines': [[(0,
--5), (-5, -2), (-5, 6), (-2, 9), (0, 8), (3, 7), (5, 7)], [(-4, -2),
-(-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-2, -9), (-2, -12),
-(-1, -9), (5, -2), (5, 7)], [(-2, -9), (4, -2), (4, 6)], [(-2, -9), (-5,
--9), (-2, -8), (3, -2), (3, 7)]]}, 3905: {'charcode': 3905, 'left': -7,
-'right': 6, 'lines': [[(-4, -2), (-4, 7), (-2, 9), (0, 7)], [(-3, -2),
-(-3, 7), (-2, 8)], [(-2, -3), (-2, 6), (-1, 7), (0, 7)], [(-4, -2), (2,
--5), (5, -1), (-2, 3)], [(1, -4), (4, -1)], [(0, -4), (3, 0)]]}, 3906:
-{'charcode': 3906, 'left': -7, 'right': 5, 'lines': [[(-3, -9), (-3, 6),
-(-4, 7), (-2, 9)], [(-2, -9), (-2, 6), (-3, 7), (-2, 8), (-1, 7), (-2,
-6)], [(-1, -10), (-1, 6), (0, 7), (-2, 9)], [(-3, -9), (3, -12), (5, -10),
-(3, -9), (1, -11)], [(2, -11), (4, -10)], [(-6, -5), (-3, -5)], [(-1, -5),
-(3, -5)]]}, 3907: {'charcode': 3907, 'left': -8, 'right': 9, 'lines':
-[[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)],
-[(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2), (5,
-11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3, 16),
-(-1, 15)], [(2, -4), (4, -2), (4, 11), (3, 13)], [(-2, 15), (-4, 15)],
-[(0, -4), (3, -1), (3, 12), (2, 14), (1, 15)]]}, 3908: {'charcode': 3908,
-'left': -9, 'right': 9, 'lines': [[(-4, -10), (-6, -12), (-5, -8), (-5,
-6), (-6, 7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7),
-(-4, 6)], [(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)],
-[(-3, -3), (0, -4), (2, -5), (5, -2), (5, 7), (2, 11), (2, 14), (3, 16),
-(4, 16), (2, 14)], [(2, -4), (4, -2), (4, 7), (3, 9)], [(0, -4), (3, -1),
-(3, 8), (2, 11)]]}, 3909: {'charcode': 3909, 'left': -5, 'right': 5,
-'lines': [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11),
-(-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2),
-(-1, 6), (-2, 7), (0, 9)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2),
-(0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -5), (2, -3), (1, -2), (1,
-6), (2, 7), (0, 9)]]}, 3910: {'charcode': 3910, 'left': -5, 'right': 5,
-'lines': [[(0, -12), (-2, -10), (0, -8), (2, -10), (0, -12)], [(0, -11),
-(-1, -10), (0, -9), (1, -10), (0, -11)], [(0, -5), (-2, -3), (-1, -2),
-(-1, 7), (2, 11)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 7),
-(1, 9)], [(0, -5), (2, -3), (1, -2), (1, 8), (2, 11), (2, 14), (0, 16),
-(-2, 15), (-2, 16), (0, 16)]]}, 3911: {'charcode': 3911, 'left': -9,
-'right': 8, 'lines': [[(-4, -10), (-6, -12), (-5, -8), (-5, 6), (-6,
-7), (-4, 9)], [(-4, -10), (-4, 6), (-5, 7), (-4, 8), (-3, 7), (-4, 6)],
-[(-4, -10), (-2, -12), (-3, -8), (-3, 6), (-2, 7), (-4, 9)], [(-3, -2),
-(0, -4), (2, -5), (4, -2), (1, 0), (-3, 3)], [(1, -4), (3, -2)], [(0,
--4), (2, -1)], [(0, 1), (1, 2), (2, 7), (4, 9), (6, 7)], [(1, 1), (2,
-3), (3, 7), (4, 8)], [(1, 0), (2, 1), (4, 6), (5, 7), (6, 7)]]}, 3912:
-{'charcode': 3912, 'left': -5, 'right': 5, 'lines': [[(0, -10), (-2,
--12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10), (0, 6), (-1, 7),
-(0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8), (1, 6), (2, 7),
-(0, 9)]]}, 3913: {'charcode': 3913, 'left': -13, 'right': 13, 'lines':
-[[(-11, -3), (-10, -3), (-9, -2), (-9, 6), (-10, 7), (-8, 9)], [(-9, -4),
-(-8, -3), (-8, 6), (-9, 7), (-8, 8), (-7, 7), (-8, 6)], [(-11, -3),
-(-9, -5), (-7, -3), (-7, 6), (-6, 7), (-8, 9)], [(-7, -3), (-4, -4),
-(-2, -5), (1, -3), (1, 6), (2, 7), (0, 9)], [(-2, -4), (0, -3), (0, 6),
-(-1, 7), (0, 8), (1, 7), (0, 6)], [(-4, -4), (-1, -2), (-1, 6), (-2, 7),
-(0, 9)], [(1, -3), (4, -4), (6, -5), (9, -3), (9, 6), (10, 7), (8, 9)],
-[(6, -4), (8, -3), (8, 6), (7, 7), (8, 8), (9, 7), (8, 6)], [(4, -4),
-(7, -2), (7, 6), (6, 7), (8, 9)]]}, 3914: {'charcode': 3914, 'left': -9,
-'right': 9, 'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5, 6), (-6, 7),
-(-4, 9)], [(-5, -4), (-4, -3), (-4, 6), (-5, 7), (-4, 8), (-3, 7),
-(-4, 6)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (-2, 7), (-4, 9)],
-[(-3, -3), (0, -4), (2, -5), (5, -3), (5, 6), (6, 7), (4, 9)], [(2, -4),
-(4, -3), (4, 6), (3, 7), (4, 8), (5, 7), (4, 6)], [(0, -4), (3, -2),
-(3, 6), (2, 7), (4, 9)]]}, 3915: {'charcode': 3915, 'left': -8, 'right':
-8, 'lines': [[(-5, -2), (-5, 6), (-2, 9), (3, 7), (5, 6)], [(-4, -2),
-(-4, 6), (-2, 8)], [(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2,
--5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1),
-(3, 7)]]}, 3916: {'charcode': 3916, 'left': -9, 'right': 8, 'lines':
-[[(-6, -5), (-5, -3), (-5, 6), (-7, 7), (-5, 7), (-5, 13), (-6, 16),
-(-4, 14)], [(-4, -3), (-4, 14)], [(-6, -5), (-4, -4), (-3, -3), (-3, 6),
-(-1, 7), (0, 8)], [(-4, 7), (-3, 7), (-1, 8)], [(-3, 8), (-2, 9), (3, 7),
-(5, 6)], [(-3, 8), (-3, 13), (-2, 16), (-4, 14)], [(-3, -3), (0, -4),
-(2, -5), (5, -2), (5, 6)], [(2, -4), (4, -2), (4, 6)], [(0, -4), (3, -1),
-(3, 7)]]}, 3917: {'charcode': 3917, 'left': -8, 'right': 9, 'lines':
-[[(-5, -2), (-5, 6), (-2, 9), (3, 7)], [(-4, -2), (-4, 6), (-2, 8)],
-[(-3, -3), (-3, 5), (0, 8)], [(-5, -2), (-3, -3), (2, -5), (5, -2),
-(5, 13), (6, 16), (4, 14)], [(2, -4), (4, -2), (4, 14)], [(0, -4), (3,
--1), (3, 13), (2, 16), (4, 14)]]}, 3918: {'charcode': 3918, 'left': -7,
-'right': 6, 'lines': [[(-5, -3), (-4, -3), (-3, -2), (-3, 6), (-4, 7),
-(-2, 9)], [(-3, -4), (-2, -3), (-2, 6), (-3, 7), (-2, 8), (-1, 7),
-(-2, 6)], [(-5, -3), (-3, -5), (-1, -3), (-1, 6), (0, 7), (-2, 9)],
-[(-1, -3), (3, -5), (5, -3), (3, -2), (1, -4)], [(2, -4), (4, -3)]]},
-3919: {'charcode': 3919, 'left': -8, 'right': 8, 'lines': [[(-5, -2),
-(-5, 1), (-3, 3), (3, 0), (5, 2), (5, 6)], [(-4, -2), (-4, 1), (-3,
-2)], [(-3, -3), (-3, 1), (-2, 2)], [(3, 1), (4, 2), (4, 6)], [(2, 1),
-(3, 2), (3, 7)], [(-5, -2), (1, -5), (4, -4), (2, -3), (-1, -4)], [(0,
--4), (3, -4)], [(5, 6), (-1, 9), (-5, 7), (-3, 6), (1, 8)], [(-3, 7),
-(-1, 8)]]}, 3920: {'charcode': 3920, 'left': -5, 'right': 5, 'lines':
-[[(0, -10), (-2, -12), (-1, -8), (-1, 6), (-2, 7), (0, 9)], [(0, -10),
-(0, 6), (-1, 7), (0, 8), (1, 7), (0, 6)], [(0, -10), (2, -12), (1, -8),
-(1, 6), (2, 7), (0, 9)], [(-4, -5), (-1, -5)], [(1, -5), (4, -5)]]},
-3921: {'charcode': 3921, 'left': -9, 'right': 9, 'lines': [[(-7, -3),
-(-6, -3), (-5, -2), (-5, 7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3),
-(-4, 7), (-2, 8)], [(-7, -3), (-5, -5), (-3, -3), (-3, 6), (0, 8)],
-[(4, -5), (6, -3), (5, -2), (5, 6), (6, 7), (7, 7)], [(4, -2), (5, -3),
-(4, -4), (3, -3), (4, -2), (4, 7), (5, 8)], [(4, -5), (2, -3), (3, -2),
-(3, 7), (5, 9), (7, 7)]]}, 3922: {'charcode': 3922, 'left': -9, 'right':
-9, 'lines': [[(-6, -5), (-5, -3), (-5, 6), (-1, 9), (1, 7), (5, 5)],
-[(-5, -4), (-4, -3), (-4, 6), (-1, 8)], [(-6, -5), (-4, -4), (-3, -3),
-(-3, 5), (0, 7), (1, 7)], [(4, -5), (6, -3), (5, -2), (5, 5)], [(4, -2),
-(5, -3), (4, -4), (3, -3), (4, -2), (4, 5)], [(4, -5), (2, -3), (3, -2),
-(3, 6)]]}, 3923: {'charcode': 3923, 'left': -13, 'right': 13, 'lines':
-[[(-10, -5), (-9, -3), (-9, 6), (-5, 9), (-3, 7), (-1, 6)], [(-9, -4),
-(-8, -3), (-8, 6), (-5, 8)], [(-10, -5), (-8, -4), (-7, -3), (-7, 5),
-(-4, 7), (-3, 7)], [(0, -5), (-2, -3), (-1, -2), (-1, 6), (3, 9), (5, 7),
-(9, 5)], [(0, -2), (1, -3), (0, -4), (-1, -3), (0, -2), (0, 6), (3, 8)],
-[(0, -5), (2, -3), (1, -2), (1, 5), (4, 7), (5, 7)], [(8, -5), (10, -3),
-(9, -2), (9, 5)], [(8, -2), (9, -3), (8, -4), (7, -3), (8, -2), (8, 5)],
-[(8, -5), (6, -3), (7, -2), (7, 6)]]}, 3924: {'charcode': 3924, 'left':
--9, 'right': 9, 'lines': [[(-6, -3), (-4, -2), (3, 8), (4, 9), (6, 7)],
-[(-5, -4), (-3, -3), (3, 7), (5, 8)], [(-6, -3), (-4, -5), (-3, -4),
-(4, 6), (6, 7)], [(6, -5), (4, -5), (4, -3), (6, -3), (6, -5), (4, -3),
-(1, 1)], [(-1, 3), (-4, 7), (-6, 9), (-4, 9), (-4, 7), (-6, 7), (-6,
-9)], [(-4, 2), (-1, 2)], [(1, 2), (4, 2)]]}, 3925: {'charcode': 3925,
-'left': -9, 'right': 9, 'lines': [[(-7, -3), (-6, -3), (-5, -2), (-5,
-7), (-2, 9), (3, 7)], [(-5, -4), (-4, -3), (-4, 7), (-2, 8)], [(-7,
--3), (-5, -5), (-3, -3), (-3, 6), (0, 8)], [(4, -5), (6, -3), (5, -2),
-(5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14), (-5, 15), (-3,
-16), (-1, 15)], [(4, -2), (5, -3), (4, -4), (3, -3), (4, -2), (4, 12),
-(3, 13)], [(-2, 15), (-4, 15)], [(4, -5), (2, -3), (3, -2), (3, 12),
-(2, 14), (1, 15)]]}, 3926: {'charcode': 3926, 'left': -6, 'right': 9,
-'lines': [[(0, -4), (-3, -2), (-3, -3), (0, -4), (2, -5), (5, -3), (5, 1),
-(0, 3)], [(2, -4), (4, -3), (4, 1)], [(0, -4), (3, -2), (3, 1), (2, 2)],
-[(0, 3), (5, 5), (5, 11), (4, 13), (3, 14), (1, 15), (-1, 15), (-3, 14),
-(-5, 15), (-3, 16), (-1, 15)], [(4, 5), (4, 12), (3, 13)], [(-2, 15),
-(-4, 15)], [(2, 4), (3, 5), (3, 12), (2, 14), (1, 15)]]}}
 
-# fmt: on
+def ltext(x, y, s, scale=1.0, side="top", linewidth=0.08, quad_segs=16):
+    o = _outline("ltext", s, scale, side, linewidth, quad_segs)
+    return sa.translate(o, x, y)
@@ -3,13 +3,13 @@
 # KiCad part/footprint importer
 #
 import os
-import glob
 
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 
 from .sexp_parser import *
+from .fpcache import footprint_cache, FootprintIndex
 from pcbflow import *
 
 KI_LAYER_DICT = {
@@ -21,112 +21,39 @@ KI_LAYER_DICT = {
 }
 
 FP_LIB_PATH = None
-ALL_KICAD_MOD_FILES = None
+FP_INDEX = None
 
 
-class KiCadPart(PCBPart):
-    def __init__(self, dc, val=None, source=None, libraryfile=None, **kwargs):
+FOOTPRINT_RECORD_KEYS = (
+    "footprint",
+    "smd_pads",
+    "pin_pads",
+    "polys",
+    "lines",
+    "circles",
+    "labels",
+)
+
+
+class KiCadFootprint:
+    """Parsed contents of a KiCad .kicad_mod footprint file.
+    The parsed entities are kept as plain lists of dicts so that they can be
+    cached and shared between every part instance using the same footprint.
+    """
+
+    def __init__(self, libraryfile):
         self.libraryfile = libraryfile
+        self.footprint = None
         self.smd_pads = []
         self.pin_pads = []
         self.polys = []
         self.lines = []
         self.circles = []
         self.labels = []
-        self.docu = []
-        if "side" not in self.__dict__:
-            self.side = "top"
-        if "side" in kwargs:
-            self.side = kwargs["side"]
         self.parse()
-        if "family" in kwargs:
-            self.family = kwargs["family"]
-        super().__init__(dc, val, source, **kwargs)
 
-    def _add_obj_to_layer(self, obj, layer):
-        if layer == "GTO":
-            self.board.get_silk_layer(side=self.side).add(obj)
-        elif layer == "GTD":
-            self.board.get_docu_layer(side=self.side).add(obj)
-        elif layer == "GTP":
-            self.board.get_paste_layer(side=self.side).add(obj)
-        elif layer == "GTL":
-            if self.side == "bottom":
-                self.board.layers["GBL"].add(obj)
-            else:
-                self.board.layers["GTL"].add(obj)
-
-    def place(self, dc):
-        for line in self.lines:
-            p0 = dc.copy().goxy(*line["coords"][0])
-            p1 = dc.copy().goxy(*line["coords"][1])
-            width = self.board.drc.silk_width
-            if line["width"] > 0:
-                width = line["width"]
-            g = sg.LineString([p0.xy, p1.xy]).buffer(width / 2)
-            self._add_obj_to_layer(g, line["layers"][0])
-
-        for poly in self.polys:
-            width = self.board.drc.silk_width
-            if poly["width"] > 0:
-                width = poly["width"]
-            coords = []
-            xyc = self.center.xy
-            for c in poly["coords"]:
-                coords.append((xyc[0] + c[0], xyc[1] + c[1]))
-            g = sg.Polygon(coords).buffer(width / 2)
-            self._add_obj_to_layer(g, poly["layer"])
-
-        for circle in self.circles:
-            width = self.board.drc.silk_width
-            if circle["width"] > 0:
-                width = circle["width"]
-            xyc = self.center.xy
-            xyc = (xyc[0] + circle["center"][0], xyc[1] + circle["center"][1])
-            gc = sg.Point(xyc).buffer(circle["diameter"] / 2)
-            g = sg.Polygon(gc.exterior.coords).buffer(width)
-            self._add_obj_to_layer(g, circle["layer"])
-
-        for pad in self.smd_pads:
-            p = dc.copy().goxy(*pad["xy"])
-            p.rect(*pad["size"])
-            p.set_name(pad["name"])
-            if "GTL" in pad["layers"]:
-                no_paste = True if "GTP" not in pad["layers"] else False
-                self.smd_pad(p, ignore_paste=no_paste)
-            elif "GTP" in pad["layers"]:
-                self.board.get_paste_layer(side=self.side).add(p.poly())
-
-        for pad in self.pin_pads:
-            diameter = pad["size"][0]
-            dc.push()
-            dc.goxy(*pad["xy"])
-            dc.board.add_drill(dc.xy, pad["drill"])
-            shape = pad["shape"]
-            if shape in ["long", "circle", "octagon", "rect"]:
-                n = {"long": 60, "circle": 60, "octagon": 8, "rect": 4}[shape]
-                if shape == "rect":
-                    diameter /= 1.1
-                p = dc.copy()
-                p.n_agon(diameter / 2, n)
-                p.set_name(pad["name"])
-                p.part = self.id
-                self.pads.append(p)
-                p.pin_pad()
-                dc.pop()
-
-        if len(self.labels) > 0:
-            for label in self.labels:
-                xyc = self.center.xy
-                xy = (xyc[0] + label["xy"][0], xyc[1] + label["xy"][1])
-                self.board.add_text(
-                    xy,
-                    self.id,
-                    angle=0,
-                    scale=1.0,
-                    side=self.side,
-                    justify="center",
-                )
+    def record(self):
+        return {k: self.__dict__[k] for k in FOOTPRINT_RECORD_KEYS}
 
     def _map_layers(self, layers):
         ml = []
@@ -249,7 +176,6 @@ class KiCadPart(PCBPart):
             if not isinstance(item, list):
                 if item == "module":
                     self.footprint = module[idx + 1]
-                    self.family = infer_family(self.footprint)
                     break
 
         d = {str(k[0]): k[1:] for k in module if isinstance(k, list)}
@@ -276,6 +202,130 @@ class KiCadPart(PCBPart):
                 self._parse_fp_circle(v["fp_circle"])
 
 
+def parse_kicad_footprint(libraryfile):
+    """Parses a .kicad_mod file and returns its footprint record dict"""
+    return KiCadFootprint(libraryfile).record()
+
+
+class KiCadPart(PCBPart):
+    def __init__(self, dc, val=None, source=None, libraryfile=None, **kwargs):
+        self.libraryfile = libraryfile
+        self.smd_pads = []
+        self.pin_pads = []
+        self.polys = []
+        self.lines = []
+        self.circles = []
+        self.labels = []
+        self.docu = []
+        if "side" not in self.__dict__:
+            self.side = "top"
+        if "side" in kwargs:
+            self.side = kwargs["side"]
+        self.parse()
+        if "family" in kwargs:
+            self.family = kwargs["family"]
+        super().__init__(dc, val, source, **kwargs)
+
+    def _add_obj_to_layer(self, obj, layer):
+        if layer == "GTO":
+            self.board.get_silk_layer(side=self.side).add(obj)
+        elif layer == "GTD":
+            self.board.get_docu_layer(side=self.side).add(obj)
+        elif layer == "GTP":
+            self.board.get_paste_layer(side=self.side).add(obj)
+        elif layer == "GTL":
+            if self.side == "bottom":
+                self.board.layers["GBL"].add(obj)
+            else:
+                self.board.layers["GTL"].add(obj)
+
+    def place(self, dc):
+        drc = self.board.drc
+        for line in self.lines:
+            p0 = dc.copy().goxy(*line["coords"][0])
+            p1 = dc.copy().goxy(*line["coords"][1])
+            width = self.board.drc.silk_width
+            if line["width"] > 0:
+                width = line["width"]
+            q = drc.quad_segs(width / 2)
+            g = sg.LineString([p0.xy, p1.xy]).buffer(width / 2, quad_segs=q)
+            self._add_obj_to_layer(g, line["layers"][0])
+
+        for poly in self.polys:
+            width = self.board.drc.silk_width
+            if poly["width"] > 0:
+                width = poly["width"]
+            coords = []
+            xyc = self.center.xy
+            for c in poly["coords"]:
+                coords.append((xyc[0] + c[0], xyc[1] + c[1]))
+            g = sg.Polygon(coords).buffer(width / 2, quad_segs=drc.quad_segs(width / 2))
+            self._add_obj_to_layer(g, poly["layer"])
+
+        for circle in self.circles:
+            width = self.board.drc.silk_width
+            if circle["width"] > 0:
+                width = circle["width"]
+            xyc = self.center.xy
+            xyc = (xyc[0] + circle["center"][0], xyc[1] + circle["center"][1])
+            r = circle["diameter"] / 2
+            gc = sg.Point(xyc).buffer(r, quad_segs=drc.quad_segs(r + width))
+            g = sg.Polygon(gc.exterior.coords).buffer(
+                width, quad_segs=drc.quad_segs(width)
+            )
+            self._add_obj_to_layer(g, circle["layer"])
+
+        for pad in self.smd_pads:
+            p = dc.copy().goxy(*pad["xy"])
+            p.rect(*pad["size"])
+            p.set_name(pad["name"])
+            if "GTL" in pad["layers"]:
+                no_paste = True if "GTP" not in pad["layers"] else False
+                self.smd_pad(p, ignore_paste=no_paste)
+            elif "GTP" in pad["layers"]:
+                self.board.get_paste_layer(side=self.side).add(p.poly())
+
+        for pad in self.pin_pads:
+            diameter = pad["size"][0]
+            dc.push()
+            dc.goxy(*pad["xy"])
+            dc.board.add_drill(dc.xy, pad["drill"])
+            shape = pad["shape"]
+            if shape in ["long", "circle", "octagon", "rect"]:
+                # round pads get the number of sides of their arc_error
+                n = {"octagon": 8, "rect": 4}.get(shape)
+                if shape == "rect":
+                    diameter /= 1.1
+                p = dc.copy()
+                p.n_agon(diameter / 2, n)
+                p.set_name(pad["name"])
+                p.part = self.id
+                self.pads.append(p)
+                p.pin_pad()
+                dc.pop()
+
+        if len(self.labels) > 0:
+            for label in self.labels:
+                xyc = self.center.xy
+                xy = (xyc[0] + label["xy"][0], xyc[1] + label["xy"][1])
+                self.board.add_text(
+                    xy,
+                    self.id,
+                    angle=0,
+                    scale=1.0,
+                    side=self.side,
+                    justify="center",
+                )
+
+    def parse(self):
+        record = footprint_cache.get(self.libraryfile, parse_kicad_footprint)
+        if record["footprint"] is not None:
+            self.footprint = record["footprint"]
+            self.family = infer_family(self.footprint)
+        for k in FOOTPRINT_RECORD_KEYS[1:]:
+            self.__dict__[k] = list(record[k])
+
+
 # TODO   (fp_arc (start 0 0) (end 0 4) (angle -65) (layer F.Fab) (width 0.1))
 
 
@@ -299,25 +349,28 @@ class SkiPart(KiCadPart):
                         pad.name = pin.nets[0].name
 
     def _find_footprint_file(self, libraryfile):
-        from skidl import footprint_search_paths
-
-        global ALL_KICAD_MOD_FILES, FP_LIB_PATH
-        if ALL_KICAD_MOD_FILES is None:
-            for path in footprint_search_paths["kicad"]:
-                kicadfn = path + os.sep + "kicad_common"
-                if os.path.isfile(full_path(kicadfn)):
-                    with open(kicadfn, "r") as f:
-                        kf = f.readlines()
-                    for line in kf:
-                        ls = line.split("=")
-                        if ls[0] == "KISYSMOD":
-                            FP_LIB_PATH = ls[1].rstrip()
-            if FP_LIB_PATH is None:
-                raise FileNotFoundError("Unable to find KiCAD footprints directory")
-            ALL_KICAD_MOD_FILES = glob.glob(
-                FP_LIB_PATH + os.sep + "**/*.kicad_mod", recursive=True
-            )
-        for f in ALL_KICAD_MOD_FILES:
-            if libraryfile in f:
-                return f
-        return None
+        global FP_INDEX
+        if FP_INDEX is None:
+            FP_INDEX = FootprintIndex(kicad_footprint_path())
+        return FP_INDEX.find(libraryfile)
+
+
+def kicad_footprint_path():
+    """Returns the KiCad footprint library directory (KISYSMOD) configured in
+    the kicad_common file found on the SKiDL footprint search paths."""
+    from skidl import footprint_search_paths
+
+    global FP_LIB_PATH
+    if FP_LIB_PATH is None:
+        for path in footprint_search_paths["kicad"]:
+            kicadfn = path + os.sep + "kicad_common"
+            if os.path.isfile(full_path(kicadfn)):
+                with open(kicadfn, "r") as f:
+                    kf = f.readlines()
+                for line in kf:
+                    ls = line.split("=")
+                    if ls[0] == "KISYSMOD":
+                        FP_LIB_PATH = ls[1].rstrip()
+        if FP_LIB_PATH is None:
+            raise FileNotFoundError("Unable to find KiCAD footprints directory")
+    return FP_LIB_PATH
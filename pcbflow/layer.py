@@ -4,11 +4,14 @@
 
 from collections import defaultdict
 
+import shapely
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 
 from pcbflow import *
+from .util import board_state, rebind_board
+from . import perf
 
 DEFAULT_LAYER_ORDER = [
     "GTD",
@@ -97,9 +100,11 @@ DEFAULT_LAYERS = {
 
 class Layer:
     def __init__(self, board=None, **kwargs):
+        self.name = None
         self.polys = []
         self.named_polys = []
         self.fill_poly = None
+        self.fill_net = None
         self.desc = ""
         self.function = ""
         self.enabled = True
@@ -120,6 +125,12 @@ class Layer:
         for k, v in kwargs.items():
             self.__dict__[k] = v
 
+    def __getstate__(self):
+        return board_state(self)
+
+    def __setstate__(self, state):
+        rebind_board(self, state)
+
     def __str__(self):
         return (
             "%-16s Order: %d Inner: %-5s Cu: %-5s Mask: %-5s Paste: %-5s Silk: %-5s Outline: %-5s Docu: %-5s"
@@ -136,39 +147,77 @@ class Layer:
             )
         )
 
+    def _live_drc(self):
+        if self.board is None or not self.is_copper:
+            return None
+        return self.board.live_drc
+
+    def _count(self, g):
+        perf.count("polygons.%s" % (self.name))
+        perf.count("vertices.%s" % (self.name), int(shapely.get_num_coordinates(g)))
+
+    @perf.timed("Layer.add")
     def add(self, obj, name=None):
-        self.polys.append((name, obj.simplify(0.001, preserve_topology=False)))
+        g = obj.simplify(self.drc.simplify, preserve_topology=False)
+        self.polys.append((name, g))
         self.preview_poly = None
+        if perf.active:
+            self._count(g)
+        live_drc = self._live_drc()
+        if live_drc is not None:
+            live_drc.add(self.name, name, g)
 
+    @perf.timed("Layer.add_named")
     def add_named(self, obj, name):
-        self.named_polys.append((name, obj.simplify(0.001, preserve_topology=False)))
+        g = obj.simplify(self.drc.simplify, preserve_topology=False)
+        self.named_polys.append((name, g))
         self.preview_poly = None
+        if perf.active:
+            self._count(g)
+        live_drc = self._live_drc()
+        if live_drc is not None:
+            live_drc.add(self.name, name, g, pour=True)
+
+    def named_copper(self):
+        """Returns a list of (netname, polygon) tuples for the named regions
+        of this layer after they have been cleared from the other copper."""
+        name_dict = defaultdict(int)
+        for netname, _ in self.named_polys:
+            if netname is not None:
+                name_dict[netname] += 1
+        exclusions = []
+        for netname in name_dict:
+            exc = so.unary_union([o for (name, o) in self.polys if name != netname])
+            exclusions.append(exc.simplify(self.drc.simplify, preserve_topology=False))
+        perf.count("unions", len(exclusions))
+        if not exclusions:
+            return list(self.named_polys)
+        perf.count("unions", 2 if self.board is not None else 1)
+        diff_exc = so.unary_union([p for p in exclusions]).buffer(
+            self.drc.clearance,
+            quad_segs=self.drc.clearance_segs(self.drc.clearance),
+            join_style=self.drc.pour_join,
+        )
+        if self.board is not None:
+            ko = so.unary_union([*self.keepouts, *self.board.keepouts])
+            diff_exc = diff_exc.union(ko)
+        named = []
+        for netname, p in self.named_polys:
+            named.append((netname, p.difference(diff_exc)))
+        return named
 
     def preview(self, as_collection=False):
         if self.preview_poly is None:
-            named_polys = [p for (_, p) in self.named_polys]
-            all_polys = [p for (_, p) in self.polys]
-            name_dict = defaultdict(int)
-            for netname, _ in self.named_polys:
-                if netname is not None:
-                    name_dict[netname] += 1
-            exclusions = []
-            for netname in name_dict:
-                exc = so.unary_union([o for (name, o) in self.polys if name != netname])
-                exclusions.append(exc.simplify(0.001, preserve_topology=False))
-            if len(exclusions) > 0:
-                diff_exc = so.unary_union([p for p in exclusions]).buffer(
-                    self.drc.clearance
-                )
-                ncp = so.unary_union(named_polys).difference(diff_exc)
-                if self.board is not None:
-                    ko = so.unary_union([*self.keepouts, *self.board.keepouts])
-                    ncp = ncp.difference(ko)
-                self.preview_poly = so.unary_union([*all_polys, ncp])
-            else:
+            with perf.span("Layer.preview"):
+                all_polys = [p for (_, p) in self.polys]
+                named_polys = [p for (_, p) in self.named_copper()]
                 self.preview_poly = so.unary_union([*all_polys, *named_polys])
-        if self.fill_poly is not None:
-            self.preview_poly = so.unary_union([self.preview_poly, self.fill_poly])
+                perf.count("unions")
+                if self.fill_poly is not None:
+                    self.preview_poly = so.unary_union(
+                        [self.preview_poly, self.fill_poly]
+                    )
+                    perf.count("unions")
         if isinstance(self.preview_poly, sg.Polygon):
             return self.preview_poly
         if as_collection:
@@ -180,21 +229,35 @@ class Layer:
         # touching the included, avoiding the others by distance r
         ingrp = so.unary_union([bg] + [o for (nm, o) in self.polys if nm == include])
         exgrp = so.unary_union([o for (nm, o) in self.polys if nm != include])
-        self.powered = so.unary_union(ingrp).difference(exgrp.buffer(clearance))
+        grown = exgrp.buffer(
+            clearance,
+            quad_segs=self.drc.clearance_segs(clearance),
+            join_style=self.drc.pour_join,
+        )
+        self.powered = so.unary_union(ingrp).difference(grown)
+        perf.count("unions", 3)
         return exgrp.union(self.powered)
 
     def fill(self, bg, include, clearance):
         self.polys = [("filled", self.paint(bg, include, clearance))]
 
-    def save(self, f):
-        surface = self.preview()
-        g = Gerber(f, self.desc)
-        g.file_function(self.function)
+    @perf.timed("Layer.render")
+    def render(self, g, xy=(0, 0), rotate=0):
+        """Writes the regions of this layer to Gerber g, rotated
+        counter-clockwise by rotate degrees about the origin and then moved
+        by xy."""
+        surface = self.preview(as_collection=True)
+        if rotate:
+            surface = sa.rotate(surface, rotate, origin=(0, 0))
+        if xy != (0, 0):
+            surface = sa.translate(surface, *xy)
 
         def renderpoly(g, po):
-            if type(po) == sg.MultiPolygon:
+            if type(po) in (sg.MultiPolygon, sg.GeometryCollection):
                 [renderpoly(g, p) for p in po.geoms]
                 return
+            if type(po) != sg.Polygon:
+                return
             # Subdivide a poly if it has holes
             if len(po.interiors) == 0:
                 g.poly(po.exterior.coords)
@@ -208,23 +271,27 @@ class Layer:
                 renderpoly(g, po.intersection(sg.box(x0, y0, xm + eps, y1)))
                 renderpoly(g, po.intersection(sg.box(xm - eps, y0, x1, y1)))
 
-        if isinstance(surface, sg.Polygon):
-            renderpoly(g, surface)
-        else:
-            [renderpoly(g, po) for po in surface]
+        renderpoly(g, surface)
+
+    def save(self, f):
+        g = Gerber(f, self.desc)
+        g.file_function(self.function)
+        self.render(g)
         g.finish()
 
     def povray(self, f, prefix="polygon {", mask=None, invert=False):
-        surface = self.preview()
+        surface = self.preview(as_collection=True)
         if invert:
             surface = mask.difference(surface)
         elif mask is not None:
             surface = surface.intersection(mask)
 
         def renderpoly(po):
-            if type(po) == sg.MultiPolygon:
+            if type(po) in (sg.MultiPolygon, sg.GeometryCollection):
                 [renderpoly(p) for p in po.geoms]
                 return
+            if type(po) != sg.Polygon:
+                return
             allc = [po.exterior.coords] + [c.coords for c in po.interiors]
             total = sum([len(c) for c in allc])
             f.write(prefix)
@@ -233,10 +300,7 @@ class Layer:
                 f.write(" ".join(["<%f,%f>" % (x, y) for (x, y) in c]) + "\n")
             f.write("}\n")
 
-        if isinstance(surface, sg.Polygon):
-            renderpoly(surface)
-        else:
-            [renderpoly(po) for po in surface]
+        renderpoly(surface)
 
 
 class OutlineLayer(Layer):
@@ -256,8 +320,15 @@ class OutlineLayer(Layer):
         po = sg.Polygon(self.lines[0]).difference(o.buffer(0))
         self.lines = [po.exterior]
 
-    def save(self, f):
-        g = Gerber(f, self.desc)
+    def render(self, g, xy=(0, 0), rotate=0):
         for ls in self.lines:
+            if rotate:
+                ls = sa.rotate(ls, rotate, origin=(0, 0))
+            if xy != (0, 0):
+                ls = sa.translate(ls, *xy)
             g.linestring(ls.coords)
+
+    def save(self, f):
+        g = Gerber(f, self.desc)
+        self.render(g)
         g.finish()
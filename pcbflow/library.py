@@ -0,0 +1,241 @@
+#! /usr/bin/env python3
+#
+# Bulk footprint library loading
+#
+
+import os
+from collections import namedtuple
+
+from .fpcache import footprint_cache
+from .kicad import KiCadPart, parse_kicad_footprint
+from .eagle import EaglePart, lbr_packages, parse_rotation
+
+# libraries with fewer files than this are loaded in-process since starting
+# worker processes would take longer than parsing the files
+PARALLEL_MIN_FILES = 64
+
+# A compact summary of a library footprint.
+#   pads is a tuple of (name, x, y, width, height, drill) tuples
+#   bounds is the (minx, miny, maxx, maxy) extent of the pads and drawing
+FootprintInfo = namedtuple(
+    "FootprintInfo", ["name", "library", "path", "pad_count", "bounds", "pads"]
+)
+
+
+def _bounds(pts):
+    if not pts:
+        return (0.0, 0.0, 0.0, 0.0)
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _pad_corners(x, y, w, h):
+    return [(x - w / 2, y - h / 2), (x + w / 2, y + h / 2)]
+
+
+def kicad_footprint_info(fn, library=None):
+    """Returns a FootprintInfo summary of a KiCad .kicad_mod file"""
+    record = footprint_cache.get(fn, parse_kicad_footprint)
+    pads = []
+    pts = []
+    for pad in record["smd_pads"]:
+        pads.append((pad["name"], *pad["xy"], *pad["size"], 0.0))
+    for pad in record["pin_pads"]:
+        pads.append((pad["name"], *pad["xy"], *pad["size"], pad["drill"]))
+    for pad in pads:
+        pts.extend(_pad_corners(*pad[1:5]))
+    for line in record["lines"]:
+        pts.extend(line["coords"])
+    for poly in record["polys"]:
+        pts.extend(poly["coords"])
+    for circle in record["circles"]:
+        (x, y), r = circle["center"], circle["diameter"] / 2
+        pts.extend(_pad_corners(x, y, 2 * r, 2 * r))
+    name = record["footprint"]
+    if name is None:
+        name = os.path.basename(fn)[: -len(".kicad_mod")]
+    return FootprintInfo(name, library, fn, len(pads), _bounds(pts), tuple(pads))
+
+
+def eagle_package_info(package, library=None, path=None):
+    """Returns a FootprintInfo summary of an Eagle package XML element"""
+    pads = []
+    pts = []
+    for c in package:
+        attr = c.attrib
+        if c.tag == "smd":
+            x, y, dx, dy = [float(attr[t]) for t in "x y dx dy".split()]
+            if parse_rotation(attr) % 180 == 90:
+                dx, dy = dy, dx
+            pads.append((attr["name"], x, y, dx, dy, 0.0))
+        elif c.tag == "pad":
+            x, y, drill = [float(attr[t]) for t in "x y drill".split()]
+            diameter = float(attr.get("diameter", drill))
+            pads.append((attr["name"], x, y, diameter, diameter, drill))
+        elif c.tag in ("wire", "rectangle"):
+            pts.append((float(attr["x1"]), float(attr["y1"])))
+            pts.append((float(attr["x2"]), float(attr["y2"])))
+        elif c.tag == "circle":
+            x, y, r = [float(attr[t]) for t in "x y radius".split()]
+            pts.extend(_pad_corners(x, y, 2 * r, 2 * r))
+    for pad in pads:
+        pts.extend(_pad_corners(*pad[1:5]))
+    name = package.attrib["name"]
+    return FootprintInfo(name, library, path, len(pads), _bounds(pts), tuple(pads))
+
+
+def lbr_library_info(fn):
+    """Returns a list of FootprintInfo for every package in an Eagle .lbr"""
+    library = os.path.splitext(os.path.basename(fn))[0]
+    packages = lbr_packages(fn)
+    return [
+        eagle_package_info(packages[k], library=library, path=fn)
+        for k in sorted(packages)
+    ]
+
+
+def _load_file(job):
+    # runs in a worker process so all exceptions are returned as errors
+    kind, fn, library = job
+    try:
+        if kind == "kicad":
+            return [kicad_footprint_info(fn, library=library)], None
+        return lbr_library_info(fn), None
+    except Exception as e:
+        return [], "%s: %s" % (fn, e)
+
+
+def _library_name(path):
+    library = os.path.basename(path)
+    if library.endswith(".pretty"):
+        library = library[: -len(".pretty")]
+    return library
+
+
+def _library_jobs(path):
+    path = os.path.expanduser(path)
+    if path.endswith(".lbr"):
+        return [("lbr", path, None)]
+    if path.endswith(".kicad_mod"):
+        return [("kicad", path, _library_name(os.path.dirname(path)))]
+    jobs = []
+    for root, dirs, files in os.walk(path):
+        dirs.sort()
+        library = _library_name(root)
+        for fn in sorted(files):
+            if fn.endswith(".kicad_mod"):
+                jobs.append(("kicad", os.path.join(root, fn), library))
+            elif fn.endswith(".lbr"):
+                jobs.append(("lbr", os.path.join(root, fn), None))
+    return jobs
+
+
+class FootprintLibrary:
+    """In-memory catalogue of footprints loaded from KiCad .pretty
+    directories and/or Eagle .lbr files. Footprints can be looked up
+    either as "Library:Footprint" or by their bare footprint name.
+    """
+
+    def __init__(self, footprints=None):
+        self.footprints = []
+        self.by_name = {}
+        self.by_lib_name = {}
+        self.errors = []
+        for fp in footprints or []:
+            self.add(fp)
+
+    def __len__(self):
+        return len(self.footprints)
+
+    def __iter__(self):
+        return iter(self.footprints)
+
+    def __contains__(self, name):
+        return self.find(name) is not None
+
+    def __getitem__(self, name):
+        fp = self.find(name)
+        if fp is None:
+            raise KeyError(name)
+        return fp
+
+    def add(self, fp):
+        self.footprints.append(fp)
+        self.by_lib_name.setdefault("%s:%s" % (fp.library, fp.name), fp)
+        self.by_name.setdefault(fp.name, fp)
+
+    def find(self, name):
+        """Returns the FootprintInfo for name or None if it is not found"""
+        if ":" in name:
+            fp = self.by_lib_name.get(name, None)
+            if fp is not None:
+                return fp
+            name = name.split(":", 1)[1]
+        return self.by_name.get(name, None)
+
+    def search(self, *terms, ignore_case=False):
+        """Returns the footprints whose name contains every search term"""
+        if ignore_case:
+            terms = [t.lower() for t in terms]
+        fps = []
+        for fp in self.footprints:
+            name = fp.name.lower() if ignore_case else fp.name
+            if all([t in name for t in terms]):
+                fps.append(fp)
+        return fps
+
+    def table(self, fps=None):
+        """Returns a text table of pad counts and sizes of footprints fps
+        (all of the footprints in the library by default)"""
+        fps = self.footprints if fps is None else fps
+        s = []
+        for fp in fps:
+            w, h = fp.bounds[2] - fp.bounds[0], fp.bounds[3] - fp.bounds[1]
+            name = fp.name if fp.library is None else "%s:%s" % (fp.library, fp.name)
+            s.append("%-48s %4d pads  %7.2f x %7.2f mm" % (name, fp.pad_count, w, h))
+        return "\n".join(s)
+
+    def part(self, dc, name, **kwargs):
+        """Places footprint name from the library as a new part at dc"""
+        fp = self[name]
+        if fp.path.endswith(".lbr"):
+            return EaglePart(dc, libraryfile=fp.path, partname=fp.name, **kwargs)
+        return KiCadPart(dc, libraryfile=fp.path, **kwargs)
+
+
+def load_library(paths, processes=None):
+    """Loads every footprint found in paths into a FootprintLibrary.
+    paths can be a single path or a list of paths to KiCad .pretty
+    directories, .kicad_mod files, Eagle .lbr files or directories
+    containing any of these. Files are parsed in parallel by a pool of
+    processes (os.cpu_count() by default) unless there are only a few of
+    them or processes is 1. Parsed KiCad footprints are also stored in
+    the on-disk footprint cache (if enabled) for use by KiCadPart.
+
+    :param paths: library path or list of library paths
+    :param processes: maximum number of worker processes
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    jobs = []
+    for path in paths:
+        jobs.extend(_library_jobs(str(path)))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = min(processes, len(jobs))
+    if processes > 1 and len(jobs) >= PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(jobs) // (processes * 8))
+        with ProcessPoolExecutor(max_workers=processes) as ex:
+            results = list(ex.map(_load_file, jobs, chunksize=chunksize))
+    else:
+        results = [_load_file(job) for job in jobs]
+    library = FootprintLibrary()
+    for fps, error in results:
+        for fp in fps:
+            library.add(fp)
+        if error is not None:
+            library.errors.append(error)
+    return library
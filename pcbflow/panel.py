@@ -0,0 +1,236 @@
+#! /usr/bin/env python3
+#
+# Panelization
+#
+
+import math
+
+import numpy as np
+import shapely.geometry as sg
+import shapely.affinity as sa
+import shapely.ops as so
+
+from pcbflow import *
+from .excellon import excellon_repeat
+
+
+def _place(xys, rotate, xy):
+    # rotates points counter-clockwise about the origin and then moves them
+    pts = np.asarray(xys, dtype=float).reshape(-1, 2)
+    if rotate:
+        a = math.radians(rotate)
+        c, s = math.cos(a), math.sin(a)
+        pts = pts @ np.array([[c, s], [-s, c]])
+    return [tuple(p) for p in (pts + xy).tolist()]
+
+
+class Panel:
+    """A fabrication panel of copies of one finished board.
+
+    Boards are added as arrays (see array and place) which refer to the
+    board rather than copying it. Each layer of the board is rendered once
+    per array and written to the panel Gerber inside a %SR step and repeat
+    block; drill hits are repeated with Excellon R commands. The boards
+    sit between rails along the bottom and top of the panel which carry
+    tooling holes and fiducials. Boards are held in by tabs at the middle
+    of each side of their outline, perforated with mouse-bite holes.
+
+    :param board: Board to panelize
+    :param gap: milled gap between boards and between boards and rails
+    :param rail: width of the top and bottom rails
+    :param tab: width of the breakaway tabs (0 for no tabs)
+    :param bite_drill: mouse-bite hole diameter
+    :param bite_pitch: mouse-bite hole spacing
+    :param fiducials: add three fiducials to the rails
+    :param tooling_hole: diameter of the rail tooling holes (0 for none)
+    """
+
+    def __init__(
+        self,
+        board,
+        gap=2.0,
+        rail=5.0,
+        tab=3.0,
+        bite_drill=0.5,
+        bite_pitch=0.8,
+        fiducials=True,
+        tooling_hole=2.0,
+    ):
+        self.board = board
+        self.gap = gap
+        self.rail = rail
+        self.tab = tab
+        self.bite_drill = bite_drill
+        self.bite_pitch = bite_pitch
+        self.fiducials = fiducials
+        self.tooling_hole = tooling_hole
+        self.fiducial_width = 1.0
+        self.fiducial_mask = 2.0
+        # (nx, ny, dx, dy, rotate, xy) of each array
+        self.arrays = []
+
+    def __len__(self):
+        return sum([nx * ny for nx, ny, *_ in self.arrays])
+
+    def _footprint(self, rotate):
+        w, h = self.board.size
+        return sa.rotate(sg.box(0, 0, w, h), rotate, origin=(0, 0)).bounds
+
+    def array(self, nx, ny, xy=(0, 0), rotate=0):
+        """Adds nx by ny copies of the board, gap apart.
+
+        :param nx: number of columns
+        :param ny: number of rows
+        :param xy: lower left corner of the array above the bottom rail
+        :param rotate: counter-clockwise rotation of the boards, a multiple
+        of 90 degrees
+        """
+        if rotate % 90:
+            raise ValueError("panel boards can only be rotated by multiples of 90")
+        x0, y0, x1, y1 = self._footprint(rotate)
+        dx = x1 - x0 + self.gap
+        dy = y1 - y0 + self.gap
+        base = self.rail + self.gap
+        self.arrays.append(
+            (nx, ny, dx, dy, rotate % 360, (xy[0] - x0, xy[1] + base - y0))
+        )
+        return self
+
+    def place(self, xy, rotate=0):
+        """Adds one copy of the board (see array)"""
+        return self.array(1, 1, xy, rotate)
+
+    def placements(self):
+        """Returns the (xy, rotate) transform of every copy of the board:
+        board coordinates are rotated about the origin and then moved by xy"""
+        pl = []
+        for nx, ny, dx, dy, rotate, (x, y) in self.arrays:
+            for j in range(ny):
+                for i in range(nx):
+                    pl.append(((x + i * dx, y + j * dy), rotate))
+        return pl
+
+    @property
+    def size(self):
+        x1, y1 = 0, 0
+        for nx, ny, dx, dy, rotate, xy in self.arrays:
+            b = self._footprint(rotate)
+            x1 = max(x1, xy[0] + b[2] + (nx - 1) * dx)
+            y1 = max(y1, xy[1] + b[3] + (ny - 1) * dy)
+        return (x1, y1 + self.gap + self.rail)
+
+    def _tabs(self):
+        # centre and direction of each tab of the board outline
+        if not self.tab:
+            return []
+        w, h = self.board.size
+        return [
+            ((w / 2, 0), (1, 0)),
+            ((w / 2, h), (1, 0)),
+            ((0, h / 2), (0, 1)),
+            ((w, h / 2), (0, 1)),
+        ]
+
+    def outline(self):
+        """Returns the board outline broken at the tabs as a list of
+        linestrings in board coordinates"""
+        lines = self.board.layers["GML"].lines
+        cuts = [
+            sg.box(
+                x - self.tab / 2 * ux - self.gap * uy,
+                y - self.tab / 2 * uy - self.gap * ux,
+                x + self.tab / 2 * ux + self.gap * uy,
+                y + self.tab / 2 * uy + self.gap * ux,
+            )
+            for (x, y), (ux, uy) in self._tabs()
+        ]
+        g = so.unary_union([sg.LineString(ls.coords) for ls in lines])
+        if cuts:
+            g = so.linemerge(g.difference(so.unary_union(cuts)))
+        return [g] if type(g) == sg.LineString else list(getattr(g, "geoms", []))
+
+    def mouse_bites(self):
+        """Returns the centres of the mouse-bite holes in board coordinates"""
+        n = max(2, int(self.tab / self.bite_pitch))
+        bites = []
+        for (x, y), (ux, uy) in self._tabs():
+            for k in range(n):
+                d = (k - (n - 1) / 2) * self.bite_pitch
+                bites.append((x + d * ux, y + d * uy))
+        return bites
+
+    def rail_features(self):
+        """Returns the panel coordinates of the fiducials and tooling holes"""
+        w, h = self.size
+        r = self.rail
+        fiducials = []
+        if self.fiducials:
+            fiducials = [(1.5 * r, r / 2), (w - 1.5 * r, r / 2), (1.5 * r, h - r / 2)]
+        tooling = []
+        if self.tooling_hole:
+            tooling = [(r / 2, r / 2), (w - r / 2, r / 2)]
+            tooling += [(r / 2, h - r / 2), (w - r / 2, h - r / 2)]
+        return fiducials, tooling
+
+    def _render_rails(self, g, name):
+        layer = self.board.layers[name]
+        fiducials, _ = self.rail_features()
+        if layer.is_outline:
+            w, h = self.size
+            g.linestring([(0, 0), (w, 0), (w, h), (0, h), (0, 0)])
+        elif name in ("GTL", "GBL"):
+            r = self.fiducial_width / 2
+            q = self.board.drc.quad_segs(r)
+            for xy in fiducials:
+                g.poly(sg.Point(xy).buffer(r, quad_segs=q).exterior.coords)
+        elif name in ("GTS", "GBS"):
+            r = self.fiducial_mask / 2
+            q = self.board.drc.quad_segs(r)
+            for xy in fiducials:
+                g.poly(sg.Point(xy).buffer(r, quad_segs=q).exterior.coords)
+
+    def _drill_patterns(self, holes):
+        patterns = []
+        for nx, ny, dx, dy, rotate, xy in self.arrays:
+            placed = {d: _place(xys, rotate, xy) for d, xys in holes.items()}
+            patterns.append((placed, nx, ny, dx, dy))
+        return patterns
+
+    def save_gerbers(self, basename, in_subdir=True, subdir=None):
+        """Writes the Gerber and Excellon files of the panel, named as in
+        Board.save_gerbers"""
+        assetpath = self.board._get_asset_path(basename, in_subdir, subdir=subdir)
+        outline = self.outline()
+        for name, layer in self.board.layers.items():
+            fn = gerber_filename(assetpath, name)
+            with open(fn, "wt") as f:
+                g = Gerber(f, layer.desc)
+                if not layer.is_outline:
+                    g.file_function(layer.function)
+                for nx, ny, dx, dy, rotate, xy in self.arrays:
+                    if nx * ny > 1:
+                        g.step_repeat(nx, ny, dx, dy)
+                    if layer.is_outline:
+                        for ls in outline:
+                            g.linestring(_place(ls.coords, rotate, xy))
+                    else:
+                        layer.render(g, xy, rotate)
+                    if nx * ny > 1:
+                        g.end_step_repeat()
+                self._render_rails(g, name)
+                g.finish()
+
+        ls = "1,%d" % (len(self.board.get_copper_layers()))
+        with open(assetpath + "_PTH.DRL", "wt") as f:
+            excellon_repeat(
+                f, self._drill_patterns(self.board.holes), "Plated,%s,PTH" % (ls)
+            )
+        npth = {d: list(xys) for d, xys in self.board.npth.items()}
+        if self.tab:
+            npth.setdefault(self.bite_drill, []).extend(self.mouse_bites())
+        patterns = self._drill_patterns(npth)
+        _, tooling = self.rail_features()
+        if tooling:
+            patterns.append(({self.tooling_hole: tooling}, 1, 1, 0, 0))
+        with open(assetpath + "_NPTH.DRL", "wt") as f:
+            excellon_repeat(f, patterns, "NonPlated,%s,NPTH" % (ls))
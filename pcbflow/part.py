@@ -8,13 +8,14 @@ import re
 import math
 import csv
 
-from PIL import Image
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
 import math
 
 from pcbflow import *
+from .util import board_state, rebind_board
+from . import perf
 
 
 def pretty_parts(nms):
@@ -74,9 +75,17 @@ class PCBPart:
         for k, v in kwargs.items():
             self.__dict__[k] = v
 
-        self.place(dc)
+        with perf.span("PCBPart.place"):
+            self.place(dc)
+        perf.count("parts")
         self.bounds = self.get_bounds()
 
+    def __getstate__(self):
+        return board_state(self)
+
+    def __setstate__(self, state):
+        rebind_board(self, state)
+
     def place(self, dc):
         raise NotImplementedError(
             "PCBPart class must be inherited from a class that implements the place method"
@@ -141,14 +150,24 @@ class PCBPart:
         (x, y) = dc.xy
         dc.board.get_silk_layer(self.side).add(
             hershey.ctext(
-                x, y, s, side=self.side, linewidth=dc.board.drc.text_silk_width
+                x,
+                y,
+                s,
+                side=self.side,
+                linewidth=dc.board.drc.text_silk_width,
+                quad_segs=dc.board.drc.quad_segs(dc.board.drc.text_silk_width / 2),
             )
         )
 
     def label(self, dc, angle=0):
         (x, y) = dc.xy
         gt = hershey.ctext(
-            x, y, self.id, side=self.side, linewidth=dc.board.drc.text_silk_width
+            x,
+            y,
+            self.id,
+            side=self.side,
+            linewidth=dc.board.drc.text_silk_width,
+            quad_segs=dc.board.drc.quad_segs(dc.board.drc.text_silk_width / 2),
         )
         gt = sa.rotate(gt, angle)
         dc.board.get_silk_layer(self.side).add(gt)
@@ -161,7 +180,12 @@ class PCBPart:
         (x, y) = dc.xy
         dc.board.get_silk_layer(self.side).add(
             hershey.ctext(
-                x, y, s, side=self.side, linewidth=dc.board.drc.text_silk_width
+                x,
+                y,
+                s,
+                side=self.side,
+                linewidth=dc.board.drc.text_silk_width,
+                quad_segs=dc.board.drc.quad_segs(dc.board.drc.text_silk_width / 2),
             )
         )
         dc.pop()
@@ -177,6 +201,7 @@ class PCBPart:
                 scale=0.1,
                 side=self.side,
                 linewidth=dc.board.drc.text_silk_width,
+                quad_segs=dc.board.drc.quad_segs(0.05 * dc.board.drc.text_silk_width),
             )
         )
 
@@ -201,6 +226,7 @@ class PCBPart:
         dc.right(90)
         dc.goxy(*idoffset)
         (x, y) = dc.xy
+        q = dc.board.drc.quad_segs(dc.board.drc.text_silk_width / 2)
         if drawid:
             dc.board.get_silk_layer(self.side).add(
                 hershey.ctext(
@@ -209,6 +235,7 @@ class PCBPart:
                     self.id,
                     side=self.side,
                     linewidth=dc.board.drc.text_silk_width,
+                    quad_segs=q,
                 )
             )
         dc.pop()
@@ -216,7 +243,8 @@ class PCBPart:
     def smd_pad(self, dc, ignore_paste=False):
         for layer in dc.board.get_smd_pad_layers(self.side, ignore_paste=ignore_paste):
             if layer.is_mask:
-                g = dc.poly().buffer(dc.board.drc.soldermask_margin)
+                r = dc.board.drc.soldermask_margin
+                g = dc.poly().buffer(r, quad_segs=dc.board.drc.quad_segs(r))
             else:
                 g = dc.poly()
             layer.add(g)
@@ -231,11 +259,13 @@ class PCBPart:
         dc.left(90)
 
     def roundpad(self, dc, d, ignore_paste=False):
-        (dc.w, dc.h) = (d, d)
-        g = sg.Point(dc.xy).buffer(d / 2)
+        (dc.pw, dc.h) = (d, d)
+        g = sg.Point(dc.xy).buffer(d / 2, quad_segs=dc.board.drc.quad_segs(d / 2))
+        r = dc.board.drc.soldermask_margin
+        q = dc.board.drc.quad_segs(d / 2 + r)
         for layer in dc.board.get_smd_pad_layers(self.side, ignore_paste=ignore_paste):
             if layer.is_mask:
-                layer.add(g).buffer(dc.board.drc.soldermask_margin)
+                layer.add(sg.Point(dc.xy).buffer(d / 2 + r, quad_segs=q))
             else:
                 layer.add(g)
         p = dc.copy()
@@ -0,0 +1,190 @@
+#! /usr/bin/env python3
+#
+# Opt-in timers and counters for the hot paths of board scripts
+#
+
+import os
+import json
+import time
+import threading
+import functools
+from collections import defaultdict
+from contextlib import contextmanager
+
+# True while instrumentation is enabled. Instrumented code checks this
+# before doing any work so that the cost when disabled is one attribute read.
+active = False
+
+# maximum number of trace events kept; timings and counters are still
+# accumulated once it is reached
+MAX_EVENTS = 1000000
+
+_lock = threading.Lock()
+_events = []
+_timings = {}
+_counters = defaultdict(int)
+_origin = time.perf_counter()
+
+
+def enable():
+    """Starts collecting timings and counters"""
+    global active
+    active = True
+
+
+def disable():
+    """Stops collecting timings and counters (they are kept until reset)"""
+    global active
+    active = False
+
+
+def reset():
+    """Discards the collected timings, counters and trace events"""
+    global _origin
+    with _lock:
+        _events.clear()
+        _timings.clear()
+        _counters.clear()
+        _origin = time.perf_counter()
+
+
+@contextmanager
+def profiling(reset_first=True):
+    """Context manager which enables instrumentation for its block.
+
+    :param reset_first: discard earlier results on entry
+    """
+    was_active = active
+    if reset_first:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_active:
+            disable()
+
+
+def _record(name, start):
+    end = time.perf_counter()
+    with _lock:
+        t = _timings.get(name)
+        if t is None:
+            t = _timings[name] = [0, 0.0, 0.0]
+        t[0] += 1
+        t[1] += end - start
+        t[2] = max(t[2], end - start)
+        if len(_events) < MAX_EVENTS:
+            _events.append((name, start, end - start, threading.get_ident()))
+
+
+@contextmanager
+def _span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, start)
+
+
+@contextmanager
+def _nothing():
+    yield
+
+
+def span(name):
+    """Returns a context manager which times its block as name"""
+    if not active:
+        return _nothing()
+    return _span(name)
+
+
+def timed(name):
+    """Decorator which times each call of a function as name"""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not active:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _record(name, start)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name, n=1):
+    """Adds n to the counter name"""
+    if active:
+        with _lock:
+            _counters[name] += n
+
+
+def timings():
+    """Returns a dict of (calls, total seconds, longest call seconds) for
+    each timed name"""
+    with _lock:
+        return {name: tuple(t) for name, t in _timings.items()}
+
+
+def counters():
+    """Returns a dict of the counters"""
+    with _lock:
+        return dict(_counters)
+
+
+def report():
+    """Returns a text table of the timings, longest total first, and the
+    counters"""
+    s = ["%-32s %8s %10s %10s" % ("Timer", "Calls", "Total ms", "Max ms")]
+    for name, (calls, total, longest) in sorted(
+        timings().items(), key=lambda kv: -kv[1][1]
+    ):
+        s.append(
+            "%-32s %8d %10.2f %10.2f" % (name, calls, total * 1000, longest * 1000)
+        )
+    s.append("")
+    s.append("%-32s %8s" % ("Counter", "Value"))
+    for name, value in sorted(counters().items()):
+        s.append("%-32s %8d" % (name, value))
+    return "\n".join(s)
+
+
+def trace():
+    """Returns the collected timings as a Chrome trace (the JSON object
+    format read by chrome://tracing and Perfetto) with the counters as a
+    final counter event"""
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+        origin = _origin
+        values = dict(_counters)
+    te = [
+        {
+            "name": name,
+            "cat": "pcbflow",
+            "ph": "X",
+            "ts": (start - origin) * 1e6,
+            "dur": dur * 1e6,
+            "pid": pid,
+            "tid": tid,
+        }
+        for name, start, dur, tid in events
+    ]
+    if values:
+        end = max([e["ts"] + e["dur"] for e in te], default=0.0)
+        te.append(
+            {"name": "counters", "ph": "C", "ts": end, "pid": pid, "args": values}
+        )
+    return {"traceEvents": te, "displayTimeUnit": "ms"}
+
+
+def save_trace(fn):
+    """Writes the Chrome trace of the collected timings to fn"""
+    with open(fn, "wt") as f:
+        json.dump(trace(), f)
@@ -0,0 +1,326 @@
+#! /usr/bin/env python3
+#
+# Board output task graph
+#
+
+import os
+import time
+
+from pcbflow import *
+from .svgout import board_block, drill_layer, svg_write
+from .buildcache import layer_digest, holes_digest, drc_digest
+from . import perf
+
+# preview file suffixes and their SVG styles
+PREVIEWS = [
+    ("preview_top", "top"),
+    ("preview_top_docu", "top_docu"),
+    ("preview_bot", "bottom"),
+    ("preview_bot_docu", "bottom_docu"),
+    ("preview_all", "all"),
+]
+
+
+class SaveTask:
+    """A step of a SavePipeline. func is called once the tasks named in deps
+    have completed and its return value is kept in result for the tasks
+    which depend on it. An output task lists the suffixes of the files it
+    writes and, if they can be cached, a function returning its cache key
+    parts. status is "run", "cached" or "skipped" (an intermediate which
+    no output needed) after the pipeline has run."""
+
+    def __init__(self, name, func, deps=(), outputs=(), key=None):
+        self.name = name
+        self.func = func
+        self.deps = list(deps)
+        self.outputs = list(outputs)
+        self.key = key
+        self.cache_key = None
+        self.status = None
+        self.result = None
+        self.seconds = 0.0
+
+
+class SavePipeline:
+    """The output files of a board as a graph of tasks.
+
+    Intermediate results shared by several outputs (the preview geometry of
+    each layer, the substrate and the hole geometry) are tasks of their own
+    which are computed once. Tasks whose dependencies are complete run
+    concurrently on a thread pool; every output is written by exactly one
+    task from the same inputs, so the files are identical to those of a
+    serial run.
+
+    :param board: Board to save
+    :param assetpath: path and base name of the output files
+    :param gerber: write Gerber and Excellon files
+    :param pdf: write PDF previews
+    :param svg: write SVG previews
+    :param png: write PNG previews
+    :param bom: write the bill of materials
+    :param centroids: write the part centroids
+    :param povray: write POV-Ray scene includes
+    :param cache: :obj:`BuildCache` to reuse unchanged Gerber, drill,
+    preview and POV-Ray files from
+    """
+
+    def __init__(
+        self,
+        board,
+        assetpath,
+        gerber=True,
+        pdf=True,
+        svg=False,
+        bom=True,
+        centroids=True,
+        povray=False,
+        cache=None,
+        png=False,
+    ):
+        self.board = board
+        self.assetpath = assetpath
+        self.cache = cache
+        self.tasks = {}
+        self.seconds = 0.0
+        self._digests = {}
+        layers = [n for n, l in board.layers.items() if not l.is_outline]
+        for name in layers:
+            self.add("layer.%s" % (name), board.layers[name].preview)
+        copper = len(board.get_copper_layers())
+        if gerber:
+            for name in board.layers:
+                deps = ["layer.%s" % (name)] if name in layers else []
+                self.add(
+                    "gerber.%s" % (name),
+                    self._gerber(name),
+                    deps,
+                    outputs=[gerber_filename("", name)],
+                    key=self._digest_key(name),
+                )
+            for holes, kind, suffix in (
+                (board.holes, "Plated", "PTH"),
+                (board.npth, "NonPlated", "NPTH"),
+            ):
+                self.add(
+                    "drill.%s" % (suffix),
+                    self._drill(holes, kind, suffix),
+                    outputs=["_%s.DRL" % (suffix)],
+                    key=lambda holes=holes: (holes_digest(holes), copper),
+                )
+        formats = [f for f, on in (("svg", svg), ("pdf", pdf), ("png", png)) if on]
+        if formats:
+            self.add("block", lambda: board_block(board))
+            self.add("drl", self._drl)
+            deps = ["block", "drl"] + ["layer.%s" % (name) for name in layers]
+            for suffix, style in PREVIEWS:
+                self.add(
+                    "%s.%s" % (suffix, "+".join(formats)),
+                    self._preview(suffix, style, formats),
+                    deps,
+                    outputs=["_%s.%s" % (suffix, f) for f in formats],
+                    key=self._digest_key(*board.layers, holes=True),
+                )
+        if povray:
+            self.add("substrate", self._substrate)
+            deps = ["substrate"] + ["layer.%s" % (n) for n in ("GTO", "GTL", "GTS")]
+            self.add(
+                "povray",
+                self._povray,
+                deps,
+                outputs=[".sub.pov", ".gto.pov", ".gtl.pov", ".gts.pov"],
+                key=self._digest_key("GML", "GTO", "GTL", "GTS", holes=True),
+            )
+        if bom:
+            self.add(
+                "bom",
+                lambda: board.save_bom(assetpath, in_subdir=False),
+                outputs=["-bom.csv"],
+            )
+        if centroids:
+            self.add(
+                "centroids",
+                lambda: board.save_centroids(assetpath, in_subdir=False),
+                outputs=["-centroids.csv"],
+            )
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def add(self, name, func, deps=(), outputs=(), key=None):
+        """Adds a task after the tasks it depends on"""
+        for d in deps:
+            if d not in self.tasks:
+                raise KeyError("task %s depends on unknown task %s" % (name, d))
+        self.tasks[name] = SaveTask(name, func, deps, outputs, key)
+
+    def _digest_key(self, *layers, holes=False):
+        # the key parts of an output made from layers (and the holes)
+        def key():
+            parts = [drc_digest(self.board.drc)]
+            for name in layers:
+                if name not in self._digests:
+                    self._digests[name] = layer_digest(self.board.layers[name])
+                parts.append((name, self._digests[name]))
+            if holes:
+                parts.append(holes_digest(self.board.holes))
+                parts.append(holes_digest(self.board.npth))
+            return parts
+
+        return key
+
+    def _gerber(self, name):
+        def write():
+            with open(gerber_filename(self.assetpath, name), "wt") as f:
+                self.board.layers[name].save(f)
+
+        return write
+
+    def _drill(self, holes, kind, suffix):
+        def write():
+            ls = "1,%d" % (len(self.board.get_copper_layers()))
+            with open("%s_%s.DRL" % (self.assetpath, suffix), "wt") as f:
+                excellon(f, holes, "%s,%s,%s" % (kind, ls, suffix))
+
+        return write
+
+    def _drl(self):
+        drl = drill_layer(self.board)
+        drl.preview()
+        return drl
+
+    def _preview(self, suffix, style, formats):
+        def write():
+            svg_write(
+                self.board,
+                "%s_%s.svg" % (self.assetpath, suffix),
+                style=style,
+                formats=formats,
+                block=self.tasks["block"].result,
+                drl=self.tasks["drl"].result,
+            )
+
+        return write
+
+    def _substrate(self):
+        substrate = self.board.substrate()
+        substrate.preview()
+        return substrate
+
+    def _povray(self):
+        substrate = self.tasks["substrate"].result
+        mask = substrate.preview(as_collection=True)
+        path = self.assetpath
+        with open(path + ".sub.pov", "wt") as f:
+            substrate.povray(f, "prism { linear_sweep linear_spline 0 1")
+        with open(path + ".gto.pov", "wt") as f:
+            self.board.layers["GTO"].povray(f, mask=mask)
+        with open(path + ".gtl.pov", "wt") as f:
+            self.board.layers["GTL"].povray(f, mask=mask)
+        with open(path + ".gts.pov", "wt") as f:
+            self.board.layers["GTS"].povray(f, mask=mask, invert=True)
+
+    def _run_task(self, task):
+        t = time.perf_counter()
+        with perf.span("save %s" % (task.name)):
+            task.result = task.func()
+        task.seconds = time.perf_counter() - t
+        task.status = "run"
+        if perf.active:
+            for fn in self._paths(task):
+                perf.count("bytes written", os.path.getsize(fn))
+        if task.cache_key is not None:
+            self.cache.store(task.cache_key, self._paths(task))
+        return task
+
+    def _paths(self, task):
+        return [self.assetpath + suffix for suffix in task.outputs]
+
+    def _plan(self):
+        # restores the cached outputs and returns the tasks still to run
+        if self.cache is not None:
+            for task in self.tasks.values():
+                if task.key is None:
+                    continue
+                key = self.cache.key(task.name, task.outputs, *task.key())
+                if self.cache.restore(key, self._paths(task)):
+                    task.status = "cached"
+                else:
+                    task.cache_key = key
+        needed = set()
+        for task in reversed(list(self.tasks.values())):
+            if task.status is None and (task.outputs or task.name in needed):
+                needed.add(task.name)
+                needed.update(task.deps)
+        for task in self.tasks.values():
+            if task.status is None and task.name not in needed:
+                task.status = "skipped"
+        return [t for t in self.tasks.values() if t.name in needed]
+
+    def run(self, workers=None, progress=None):
+        """Runs the tasks.
+
+        :param workers: number of threads (os.cpu_count() if None, 1 runs
+        the tasks one after another in the order they were added)
+        :param progress: function called as progress(task, done, total)
+        after each task completes
+        :returns: :obj:`dict` of the seconds taken by each task
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        t = time.perf_counter()
+        active = self._plan()
+        cached = [task for task in self.tasks.values() if task.status == "cached"]
+        total = len(cached) + len(active)
+        if progress is not None:
+            for done, task in enumerate(cached, 1):
+                progress(task, done, total)
+        if workers <= 1:
+            for done, task in enumerate(active, len(cached) + 1):
+                self._run_task(task)
+                if progress is not None:
+                    progress(task, done, total)
+        else:
+            self._run_pool(active, workers, progress, len(cached), total)
+        if self.cache is not None:
+            self.cache.evict()
+        self.seconds = time.perf_counter() - t
+        return self.timings()
+
+    def _run_pool(self, active, workers, progress, done, total):
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        waiting = {task.name: task for task in active}
+        finished = set()
+        running = set()
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            while waiting or running:
+                for name in list(waiting):
+                    if all(d in finished for d in waiting[name].deps):
+                        running.add(ex.submit(self._run_task, waiting.pop(name)))
+                complete, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in complete:
+                    # re-raises the exception of a failed task
+                    task = future.result()
+                    finished.add(task.name)
+                    if progress is not None:
+                        progress(task, done + len(finished), total)
+
+    def timings(self):
+        """Returns a dict of the seconds taken by each task"""
+        return {name: task.seconds for name, task in self.tasks.items()}
+
+    def cache_report(self):
+        """Returns a dict of "hit" or "miss" for each cacheable output"""
+        return {
+            name: "hit" if task.status == "cached" else "miss"
+            for name, task in self.tasks.items()
+            if task.key is not None
+        }
+
+    def report(self):
+        """Returns a text table of the tasks, slowest first"""
+        s = []
+        for task in sorted(self.tasks.values(), key=lambda t: -t.seconds):
+            s.append("%-28s %8.3f s  %s" % (task.name, task.seconds, task.status))
+        s.append("%-28s %8.3f s" % ("Total (elapsed)", self.seconds))
+        return "\n".join(s)
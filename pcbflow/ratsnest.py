@@ -0,0 +1,170 @@
+#! /usr/bin/env python3
+#
+# Ratsnest (airwire) calculation
+#
+
+from collections import defaultdict, namedtuple
+
+import numpy as np
+import shapely
+import shapely.geometry as sg
+
+from .connectivity import Connectivity
+
+# An unrouted connection between two pads of a net.
+#   a, b are the (part, pad) terminals and xy_a, xy_b their pad centres
+Airwire = namedtuple("Airwire", ["net", "a", "b", "xy_a", "xy_b", "length"])
+
+# nets with up to this many pads compare every pair of pads directly
+PAIRWISE_MAX_PADS = 16
+
+
+def _candidate_edges(xy):
+    # returns (i, j) index arrays of the candidate minimum spanning tree
+    # edges between the points xy
+    n = len(xy)
+    if n <= PAIRWISE_MAX_PADS:
+        i, j = np.triu_indices(n, 1)
+        return i, j
+    # the Euclidean MST is a subgraph of the Delaunay triangulation. Points
+    # at the same position are merged by the triangulation so they are
+    # joined to their first occurrence separately.
+    pts, first, inverse = np.unique(xy, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    lookup = {tuple(p): k for k, p in zip(first.tolist(), pts.tolist())}
+    tri = shapely.delaunay_triangles(shapely.multipoints(pts), only_edges=True)
+    ends = shapely.get_coordinates(tri).reshape(-1, 2, 2).tolist()
+    i = [lookup[tuple(a)] for a, _ in ends]
+    j = [lookup[tuple(b)] for _, b in ends]
+    dup = np.nonzero(first[inverse] != np.arange(n))[0]
+    i.extend(first[inverse[dup]].tolist())
+    j.extend(dup.tolist())
+    return np.array(i, dtype=np.int64), np.array(j, dtype=np.int64)
+
+
+def spanning_airwires(xy, clusters):
+    """Returns the (i, j) pairs of points xy which complete a Euclidean
+    minimum spanning tree when the points of each cluster are already
+    connected to each other.
+
+    :param xy: (n, 2) array of point coordinates
+    :param clusters: sequence of n cluster ids
+    """
+    n = len(xy)
+    parent = list(range(n))
+    first = {}
+    for k, c in enumerate(clusters):
+        parent[k] = first.setdefault(c, k)
+    groups = len(first)
+    if groups < 2:
+        return []
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    i, j = _candidate_edges(xy)
+    d = np.hypot(*(xy[i] - xy[j]).T)
+    wires = []
+    for k in np.argsort(d, kind="stable").tolist():
+        a, b = int(i[k]), int(j[k])
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[ra] = rb
+            wires.append((a, b))
+            if len(wires) == groups - 1:
+                break
+    return wires
+
+
+class Ratsnest:
+    """The unrouted connections of every net of a board.
+
+    Pads are grouped into nets from Board.nets and (with pad_nets) their
+    names, as in Connectivity. Pads which are already joined by copper are
+    treated as one node and the remaining connections of each net form a
+    Euclidean minimum spanning tree, found from the Delaunay triangulation
+    of the net's pads.
+
+    :param board: Board to analyse
+    :param connectivity: a previously extracted Connectivity of the board
+    :param pad_nets: group pads by their name if it is a net name
+    """
+
+    def __init__(self, board, connectivity=None, pad_nets=True):
+        if connectivity is None:
+            connectivity = Connectivity(board, pad_nets=pad_nets)
+        self.board = board
+        self.connectivity = connectivity
+        pads = connectivity.pads
+        pad_index = defaultdict(list)
+        for k, (t, _) in enumerate(pads):
+            pad_index[t].append(k)
+        all_xy = np.array(connectivity.pad_xy, dtype=float).reshape(-1, 2)
+        self.airwires = []
+        self.unrouted = {}
+        for net in sorted(connectivity.nets):
+            idx = [k for t in connectivity.nets[net] for k in pad_index.get(t, [])]
+            # pads off the copper are clusters of their own
+            clusters = [pads[k][1] if pads[k][1] is not None else -1 - k for k in idx]
+            xy = all_xy[idx]
+            length = 0.0
+            for a, b in spanning_airwires(xy, clusters):
+                ka, kb = idx[a], idx[b]
+                d = float(np.hypot(*(xy[a] - xy[b])))
+                self.airwires.append(
+                    Airwire(
+                        net,
+                        pads[ka][0],
+                        pads[kb][0],
+                        tuple(xy[a].tolist()),
+                        tuple(xy[b].tolist()),
+                        d,
+                    )
+                )
+                length += d
+            if length > 0 or len(set(clusters)) > 1:
+                self.unrouted[net] = length
+
+    def __len__(self):
+        return len(self.airwires)
+
+    def total_length(self):
+        """Returns the total length of all airwires"""
+        return sum(self.unrouted.values())
+
+    def net_airwires(self, net):
+        """Returns the airwires of net"""
+        return [w for w in self.airwires if w.net == net]
+
+    def draw(self, layer="GTD", width=None):
+        """Draws the airwires as thin lines on a documentation layer
+
+        :param layer: layer name
+        :param width: line width (drc.silk_width / 2 by default)
+        """
+        if width is None:
+            width = self.board.drc.silk_width / 2
+        lyr = self.board.layers[layer]
+        q = self.board.drc.quad_segs(width / 2)
+        for w in self.airwires:
+            if w.length > 0:
+                g = sg.LineString([w.xy_a, w.xy_b]).buffer(width / 2, quad_segs=q)
+                lyr.add(g, w.net)
+
+    def report(self):
+        """Returns a text table of the unrouted connections of each net"""
+        s = []
+        counts = defaultdict(int)
+        for w in self.airwires:
+            counts[w.net] += 1
+        for net in sorted(self.unrouted):
+            s.append(
+                "%-24s %4d unrouted  %8.2f mm" % (net, counts[net], self.unrouted[net])
+            )
+        s.append(
+            "%-24s %4d unrouted  %8.2f mm" % ("Total", len(self), self.total_length())
+        )
+        return "\n".join(s)
@@ -9,6 +9,22 @@ import shapely.affinity as sa
 import shapely.ops as so
 
 from pcbflow import *
+from .draw import meander_gain
+
+
+def extend(dst, traces):
+    # extend parallel traces so that they are all level with dst
+    assert len({t.dir for t in traces}) == 1, "All traces must be parallel"
+
+    finish_line = dst.copy()
+    finish_line.left(90)
+    for t in traces:
+        t.approach(0, finish_line)
+
+
+def extend2(traces):
+    by_y = {p.seek(traces[0])[1]: p for p in traces}
+    extend(by_y[min(by_y)], traces)
 
 
 class Route(Turtle):
@@ -60,7 +76,7 @@ class Route(Turtle):
         if a < 0:
             return self.left(-a)
         fd = (self.tt[0].dir + a) % 360
-        n = int(a + 1)
+        n = self.board.drc.arc_segments(self.r(), a)
         ra = 2 * math.pi * a / 360
         for i in range(n):
             self.rpivot(-ra / n)
@@ -72,7 +88,7 @@ class Route(Turtle):
         if a < 0:
             return self.right(-a)
         fd = (self.tt[0].dir - a) % 360
-        n = int(a + 1)
+        n = self.board.drc.arc_segments(self.r(), a)
         ra = 2 * math.pi * a / 360
         for i in range(n):
             self.lpivot(ra / n)
@@ -148,10 +164,14 @@ class Route(Turtle):
             ((a.part, a.name), (b.part, b.name))
             for (a, b) in zip(self.tt, other.tt[::-1])
         ]
-        """
-        for (a, b) in zip(self.tt, other.tt[::-1]):
-            print(a.name, b.name, a.length + b.length)
-        """
+        return self.pair_lengths(other)
+
+    def pair_lengths(self, other):
+        """Returns (name, name, length) of each signal joined by meet()"""
+        return [
+            (a.name, b.name, a.total_length() + b.total_length())
+            for (a, b) in zip(self.tt, other.tt[::-1])
+        ]
 
     def meet0(self, other):
         d = self.tt[0].distance(other.tt[0])
@@ -232,3 +252,61 @@ class Route(Turtle):
             t.left(th_d).forward((len(self.tt) - 1 - i) * a)
         self.wire()
         return self
+
+    def lengths(self):
+        """Returns the length of each signal of the route so far"""
+        return [t.total_length() for t in self.tt]
+
+    def length_report(self, tolerance=None):
+        """Returns a text table of the signal lengths and their difference
+        from the longest. Signals more than tolerance shorter are marked."""
+        lengths = self.lengths()
+        longest = max(lengths)
+        s = []
+        for i, (t, l) in enumerate(zip(self.tt, lengths)):
+            name = t.name if t.name is not None else str(i)
+            mark = ""
+            if tolerance is not None and longest - l > tolerance:
+                mark = "  *"
+            s.append("%-16s %9.3f mm %+9.3f%s" % (name, l, l - longest, mark))
+        s.append("%-16s %9.3f mm %+9.3f" % ("Skew", longest, min(lengths) - longest))
+        return "\n".join(s)
+
+    def spacing(self):
+        # closest distance between neighbouring signals across the route
+        if len(self.tt) < 2:
+            return None
+        return min(abs(a.seek(b)[0]) for (a, b) in zip(self.tt, self.tt[1:]))
+
+    def tune(
+        self, tolerance=0.1, amplitude=None, pitch=None, style="trombone", target=None
+    ):
+        """Lengthens the shorter signals with meanders (see Draw.meander) so
+        that every signal is within tolerance of target. All signals go
+        forward by the same distance so the route stays level. Meanders turn
+        left, into the gap to the next signal.
+
+        :param tolerance: allowed length mismatch in mm
+        :param amplitude: meander height (the spacing of the signals less
+        drc.channel() by default)
+        :param pitch: spacing of the meander legs (drc.channel() by default)
+        :param style: "trombone" or "sawtooth"
+        :param target: length to match (the longest signal by default)
+        """
+        c = self.board.drc.channel()
+        if pitch is None:
+            pitch = c
+        if amplitude is None:
+            gap = self.spacing()
+            amplitude = 2 * c if gap is None else gap - c
+        if amplitude <= 0:
+            raise ValueError("no room for meanders, spread() the route first")
+        lengths = self.lengths()
+        if target is None:
+            target = max(lengths)
+        extra = [target - l if target - l > tolerance else 0 for l in lengths]
+        most = meander_gain(style, amplitude, pitch)
+        count = max(1, math.ceil(max(extra) / most - 1e-9))
+        for t, e in zip(self.tt, extra):
+            t.meander(e, amplitude, pitch, style, count)
+        return self
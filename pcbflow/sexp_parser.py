@@ -14,6 +14,7 @@ the list-based representation
 
 import sys
 import re
+import gc
 import logging
 import traceback
 import bisect
@@ -721,6 +722,90 @@ def parseFloat4(obj, sexp):
     return parseCopy(obj, sexp, 4, float)
 
 
+# Scanner for lines containing quoted strings (or the '^' character which is
+# never part of a token). All other lines are tokenized with str.split()
+SEXP_TOKENS = re.compile(r'"[^"]*"|[()]|[^(^)\s]+')
+
+
+def _unterminated(tok):
+    return tok[0] == '"' and (len(tok) == 1 or tok[-1] != '"')
+
+
+def _sexpLines(lines):
+    """Yields (line number, tokens) for each line of S-expression text.
+    A quoted string which spans several lines is tokenized as if the lines
+    were joined without any separator."""
+    findall = SEXP_TOKENS.findall
+    lineno = 0
+    lines = iter(lines)
+    for l in lines:
+        lineno += 1
+        if '"' not in l and "^" not in l:
+            yield (lineno, l.replace("(", " ( ").replace(")", " ) ").split())
+            continue
+        toks = findall(l)
+        if not any([_unterminated(t) for t in toks if t[0] == '"']):
+            yield (lineno, toks)
+            continue
+        # join following lines until the quoted string is closed and
+        # attribute each token to the line where it starts
+        chunk = [l.rstrip("\r\n")]
+        ends = [len(chunk[0])]
+        while True:
+            text = "".join(chunk)
+            toks = [(m.start(), m.group()) for m in SEXP_TOKENS.finditer(text)]
+            if not any([_unterminated(t) for _, t in toks]):
+                break
+            l = next(lines, None)
+            if l is None:
+                break
+            chunk.append(l.rstrip("\r\n"))
+            ends.append(ends[-1] + len(chunk[-1]))
+        line_toks = [[] for _ in chunk]
+        for pos, tok in toks:
+            line_toks[bisect.bisect_right(ends, pos)].append(tok)
+        for i, toks in enumerate(line_toks):
+            yield (lineno + i, toks)
+        lineno += len(chunk) - 1
+
+
+def _sexpBuild(lines, depth=None):
+    """Builds the list representation from (line number, tokens) tuples. If
+    depth is specified, then each list completed at that nesting depth is
+    yielded as soon as it is closed and is not retained by its parent."""
+    stack = []
+    out = []
+    push = stack.append
+    pop = stack.pop
+    lineno = 0
+    for lineno, toks in lines:
+        for tok in toks:
+            c = tok[0]
+            if c == "(":
+                push(out)
+                out = []
+            elif c == ")":
+                if not stack:
+                    raise AssertionError(
+                        "Trouble with nesting of brackets at line %d" % (lineno)
+                    )
+                tmpout = out
+                out = pop()
+                if len(stack) == depth:
+                    yield tmpout
+                else:
+                    out.append(tmpout)
+            elif out:
+                out.append(tok)
+            else:
+                # insert line number as the first element
+                out = [lineno, tok]
+    if stack:
+        raise AssertionError("Trouble with nesting of brackets at line %d" % (lineno))
+    if depth is None:
+        yield out
+
+
 def parseSexp(sexp):
     """Parses S-expressions and return a ``list`` represention
 
@@ -729,63 +814,37 @@ def parseSexp(sexp):
     * Do not parse numbers
     * Do not strip quotes (for easy export back to S-expression)
     * Added line number information for easy debugging
-    """
 
-    if not hasattr(parseSexp, "regex"):
-        parseSexp.regex = re.compile(
-            r"""(?mx)
-                    \s*(?:
-                    (?P<l>\()|
-                    (?P<r>\))|
-                    (?P<q>"[^"]*")|
-                    (?P<s>[^(^)\s]+)
-                )"""
-        )
-
-    # Pre-process data to get index position of each line end
-    lines = []
-    count = 0
+    ``sexp`` can either be a string or a list of lines
+    """
     if isinstance(sexp, string_types):
         sexp = sexp.splitlines(False)
-    for l in iter(sexp):
-        count += len(l)
-        lines.append(count)
-    sexp = "".join(sexp)
-
-    stack = []
-    out = []
-    if logger.isEnabledFor(logging.DEBUG):
-        logger.debug("%-6s %-14s %-44s %-s" % tuple("term value out stack".split()))
-    for termtypes in re.finditer(parseSexp.regex, sexp):
-        term, value = [(t, v) for t, v in termtypes.groupdict().items() if v][0]
-        if logger.isEnabledFor(logging.DEBUG):
-            logging.debug("%-7s %-14s %-44r %-r" % (term, value, out, stack))
-        if term == "l":  # left bracket
-            stack.append(out)
-            out = []
-        elif term == "r":  # right bracket
-            assert stack, "Trouble with nesting of brackets"
-            tmpout, out = out, stack.pop(-1)
-            out.append(tmpout)
-        else:
-            if not out:
-                # insert line number as the first element
-                out.append(bisect.bisect_right(lines, termtypes.start()) + 1)
-            if term == "q":  # quoted string
-                # out.append(value[1:-1]) # strip quotes
-                out.append(value)  # do not strip quotes
-            elif term == "s":  # simple string
-                out.append(value)
-            else:
-                raise NotImplementedError("Error: {}, {}".format(term, value))
-
-    assert not stack, "Trouble with nesting of brackets"
-
+    # the cyclic garbage collector repeatedly scans the many small lists
+    # being created, yet none of them can form a reference cycle
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        out = next(_sexpBuild(_sexpLines(sexp)))
+    finally:
+        if gc_enabled:
+            gc.enable()
     if not out:
         return []
     return out[0]
 
 
+def parseSexpStream(f, depth=1):
+    """Incrementally parses S-expressions read line by line from file ``f``.
+
+    Rather than building the complete list representation in memory, each
+    expression at nesting ``depth`` is yielded as soon as it is complete and
+    is then discarded. For example, with the default ``depth=1`` each child
+    of the top level expression (e.g. every ``(module ...)`` of a
+    ``.kicad_pcb`` file) is yielded one at a time.
+    """
+    return _sexpBuild(_sexpLines(f), depth=depth)
+
+
 def exportSexp(sexp, out, prefix="", indent="  "):
     if not isinstance(sexp, Sexp):
         sexp = Sexp(None, sexp)
@@ -0,0 +1,111 @@
+#! /usr/bin/env python3
+#
+# Binary board snapshots
+#
+
+import io
+import os
+import pickle
+import struct
+import uuid
+
+import numpy as np
+import shapely
+
+SNAPSHOT_MAGIC = b"PCBFLOWSN"
+SNAPSHOT_FORMAT = 4
+
+# format, number of geometries, size of the geometry table, size of the manifest
+_HEADER = struct.Struct("<IQQQ")
+
+
+class _SnapshotPickler(pickle.Pickler):
+    # shapely geometries are collected in a table and written together as
+    # WKB. Strings are written by value rather than by identity and the uid
+    # of the board as a token, so that snapshots of the same layout are
+    # identical however the board was built or loaded.
+    def __init__(self, f, board):
+        super().__init__(f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.uid = board.uid
+        self.geoms = []
+        self.index = {}
+        self.strings = {}
+
+    def persistent_id(self, obj):
+        if isinstance(obj, str):
+            if obj == self.uid:
+                return -1
+            return self.strings.setdefault(obj, obj)
+        if isinstance(obj, shapely.Geometry):
+            k = self.index.get(id(obj), None)
+            if k is None:
+                k = self.index[id(obj)] = len(self.geoms)
+                self.geoms.append(obj)
+            return k
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, f, geoms):
+        super().__init__(f)
+        self.geoms = geoms
+        self.uid = uuid.uuid4().hex
+
+    def persistent_load(self, pid):
+        if isinstance(pid, str):
+            return pid
+        if pid == -1:
+            return self.uid
+        return self.geoms[pid]
+
+
+def dump_board(board, fn):
+    """Writes a snapshot of board to fn: the layer stack with its net named
+    geometry, holes, parts and pads, nets and DRC settings. Geometry is
+    stored as a table of WKB records and everything else as a pickled
+    manifest which refers to it.
+
+    :param board: Board to save
+    :param fn: snapshot file name
+    """
+    manifest = io.BytesIO()
+    pickler = _SnapshotPickler(manifest, board)
+    pickler.dump(board)
+    wkb = shapely.to_wkb(np.array(pickler.geoms, dtype=object))
+    offsets = np.zeros(len(wkb) + 1, dtype="<i8")
+    np.cumsum([len(b) for b in wkb], out=offsets[1:])
+    table = offsets.tobytes() + b"".join(wkb.tolist())
+    tmp = "%s.%d.tmp" % (fn, os.getpid())
+    with open(tmp, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(_HEADER.pack(SNAPSHOT_FORMAT, len(wkb), len(table), manifest.tell()))
+        f.write(table)
+        f.write(manifest.getbuffer())
+    os.replace(tmp, fn)
+
+
+def load_board(fn):
+    """Returns a new board restored from a snapshot written by dump_board.
+
+    :param fn: snapshot file name
+    """
+    with open(fn, "rb") as f:
+        data = f.read()
+    start = len(SNAPSHOT_MAGIC) + _HEADER.size
+    if data[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or len(data) < start:
+        raise ValueError("%s is not a pcbflow board snapshot" % (fn))
+    fmt, count, table_size, manifest_size = _HEADER.unpack_from(
+        data, len(SNAPSHOT_MAGIC)
+    )
+    if fmt != SNAPSHOT_FORMAT:
+        raise ValueError("%s has unsupported snapshot format %d" % (fn, fmt))
+    if len(data) != start + table_size + manifest_size:
+        raise ValueError("%s is truncated" % (fn))
+    view = memoryview(data)
+    offsets = np.frombuffer(data, dtype="<i8", count=count + 1, offset=start)
+    blob = view[start + offsets.nbytes : start + table_size]
+    o = offsets.tolist()
+    wkb = np.array([bytes(blob[a:b]) for a, b in zip(o, o[1:])], dtype=object)
+    geoms = shapely.from_wkb(wkb).tolist() if count else []
+    manifest = io.BytesIO(view[start + table_size :])
+    return _SnapshotUnpickler(manifest, geoms).load()
@@ -7,10 +7,9 @@ import decimal
 import shapely.geometry as sg
 import shapely.affinity as sa
 import shapely.ops as so
-import svgwrite
-from cairosvg import svg2png, svg2pdf
 
 from pcbflow import *
+from . import perf
 
 SCALE_FACTOR = 4
 
@@ -69,14 +68,56 @@ SVG_STYLE = {
 }
 
 
-def svg_write(board, filename, style="top", formats=["svg"]):
+def board_block(board):
+    """Returns the board outline less its plated holes"""
     gml = board.layers["GML"].lines
     block = sg.Polygon(gml[-1], gml[:-1])
-    block = block.buffer(1).buffer(-1)
+    q = board.drc.quad_segs(1)
+    block = block.buffer(1, quad_segs=q).buffer(-1, quad_segs=q)
     for d, xys in board.holes.items():
         if d > 0.1:
-            hlist = so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
+            q = board.drc.quad_segs(d / 2)
+            hlist = so.unary_union(
+                [sg.Point(xy).buffer(d / 2, quad_segs=q) for xy in xys]
+            )
             block = block.difference(hlist)
+    return block
+
+
+def drill_layer(board):
+    """Returns a layer with representations of the holes of board"""
+    drl = Layer(drc=board.drc)
+    for d, xys in board.holes.items():
+        q = board.drc.quad_segs(d / 2)
+        dp = so.unary_union([sg.Point(xy).buffer(d / 2, quad_segs=q) for xy in xys])
+        drl.add(dp)
+    for d, xys in board.npth.items():
+        q = board.drc.quad_segs(d / 2)
+        dp = so.unary_union([sg.Point(xy).buffer(d / 2, quad_segs=q) for xy in xys])
+        drl.add(dp)
+    return drl
+
+
+@perf.timed("svg_write")
+def svg_write(board, filename, style="top", formats=["svg"], block=None, drl=None):
+    """Renders a preview of board.
+
+    :param style: name of a style in SVG_STYLE
+    :param formats: list of "svg", "png" and "pdf"
+    :param block: board_block(board) if it has already been computed
+    :param drl: drill_layer(board) if it has already been computed
+    """
+    # svgwrite and cairosvg (which loads the native cairo library) are only
+    # imported when a preview is actually rendered
+    import svgwrite
+
+    if block is None:
+        block = board_block(board)
+    if drl is None:
+        drl = drill_layer(board)
+    # the layers to render, with the holes as a DRL layer
+    layers = dict(board.layers)
+    layers["DRL"] = drl
 
     block = sa.scale(block, SCALE_FACTOR, -SCALE_FACTOR, origin=(0, 0))
     (x0, y0, x1, y1) = block.bounds
@@ -98,7 +139,7 @@ def svg_write(board, filename, style="top", formats=["svg"]):
         dwg.add(dwg.polyline(better_coords(l.coords), **args))
 
     def renderlayer(layer, fill_colour="black", line_colour="black", fill_opacity=1.0):
-        gto = board.layers[layer].preview(as_collection=True)
+        gto = layers[layer].preview(as_collection=True)
         gto = sa.scale(gto, SCALE_FACTOR, -SCALE_FACTOR, origin=(0, 0))
         gto = sa.translate(gto, -x0, -y0)
 
@@ -144,27 +185,22 @@ def svg_write(board, filename, style="top", formats=["svg"]):
                 for l in li:
                     dwg.add(dwg.polyline(better_coords(l.coords), **args))
 
-    # make a temporary DRL layer to render representations of holes
-    board.layers["DRL"] = Layer()
-    for d, xys in board.holes.items():
-        dp = so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
-        board.layers["DRL"].add(dp)
-    for d, xys in board.npth.items():
-        dp = so.unary_union([sg.Point(xy).buffer(d / 2) for xy in xys])
-        board.layers["DRL"].add(dp)
-
     if style not in SVG_STYLE:
         raise KeyError("Cannot find a style called %s in SVG_STYLE" % (style))
     style = SVG_STYLE[style.lower()]
     for layer, fc, lc, op in style:
-        if layer in board.layers:
+        if layer in layers:
             renderlayer(layer, fill_colour=fc, line_colour=lc, fill_opacity=op)
 
     if "svg" in formats:
         dwg.save()
     if "png" in formats:
+        from cairosvg import svg2png
+
         fn = filename.replace(".svg", ".png")
         svg2png(bytestring=dwg.tostring(), write_to=fn)
     if "pdf" in formats:
+        from cairosvg import svg2pdf
+
         fn = filename.replace(".svg", ".pdf")
         svg2pdf(bytestring=dwg.tostring(), write_to=fn)
@@ -4,7 +4,13 @@
 #
 
 import os
+import sys
+import math
 import decimal
+import weakref
+import threading
+
+import numpy as np
 
 REFDES_DICT = {
     "U": "BGA FBGA TFBGA UFBGA WLP XBGA XFBGA Xilinx LFCSP ST_WLCSP WLCSP DFN HVQFN \
@@ -96,6 +102,47 @@ def pad_bound(pad):
     return (minx, miny, maxx, maxy)
 
 
+def bitmap_boxes(bits):
+    """Returns the (x0, y0, x1, y1) pixel coordinate arrays of rectangles
+    which exactly cover the set pixels of a 2D boolean array. Each row is
+    run-length encoded and runs with identical extents in vertically
+    adjacent rows are merged into a single rectangle.
+
+    :param bits: 2D boolean array indexed as [y, x]
+    """
+    h, w = bits.shape
+    padded = np.zeros((h, w + 2), dtype=np.int8)
+    padded[:, 1:-1] = bits
+    edges = np.diff(padded, axis=1)
+    rows, x0 = np.nonzero(edges == 1)
+    _, x1 = np.nonzero(edges == -1)
+    if not len(rows):
+        return tuple([np.zeros(0, dtype=int)] * 4)
+    # sort runs by extent then row so that stacked runs are adjacent
+    order = np.lexsort((rows, x1, x0))
+    rows, x0, x1 = rows[order], x0[order], x1[order]
+    new = np.ones(len(rows), dtype=bool)
+    new[1:] = (x0[1:] != x0[:-1]) | (x1[1:] != x1[:-1]) | (rows[1:] != rows[:-1] + 1)
+    first = np.nonzero(new)[0]
+    last = np.append(first[1:], len(rows)) - 1
+    return (x0[first], rows[first], x1[first], rows[last] + 1)
+
+
+def arc_segments(radius, tolerance, angle=360):
+    """Returns the number of chords which approximate an arc of radius
+    within tolerance, i.e. no point of the arc is further than tolerance
+    from the chords. Each chord spans at most 90 degrees.
+
+    :param radius: radius of the arc
+    :param tolerance: largest allowed chord error
+    :param angle: angle of the arc in degrees
+    """
+    step = 90.0
+    if radius > tolerance:
+        step = min(step, math.degrees(2 * math.acos(1 - tolerance / radius)))
+    return max(1, math.ceil(abs(angle) / step - 1e-9))
+
+
 def max_bounds(bounds, min_bound=5):
     mbounds = [1e18, 1e18, -1e18, -1e18]
     for b in bounds:
@@ -122,3 +169,62 @@ def full_path(file):
     if "~" in str(file):
         return os.path.expanduser(file)
     return os.path.expanduser(os.path.abspath(file))
+
+
+# boards of this process by uid, so that pickled layers, drawing contexts and
+# parts can be rebound to their board
+_boards = weakref.WeakValueDictionary()
+# boards being unpickled by this thread, by the uid they were pickled with
+_loading = threading.local()
+
+
+def register_board(board):
+    _boards[board.uid] = board
+
+
+def board_by_id(uid):
+    """Returns the board of this process with uid or None. While a board is
+    being unpickled its uid refers to the copy being loaded."""
+    if uid is None:
+        return None
+    loading = getattr(_loading, "boards", {})
+    if uid in loading:
+        return loading[uid]
+    return _boards.get(uid, None)
+
+
+def begin_board_load(uid, board):
+    """Makes uid refer to board until end_board_load, so that the layers,
+    drawing contexts and parts unpickled with a board are rebound to it
+    even if the board was given a new uid"""
+    if not hasattr(_loading, "boards"):
+        _loading.boards = {}
+    _loading.boards[uid] = board
+
+
+def end_board_load(uid):
+    getattr(_loading, "boards", {}).pop(uid, None)
+
+
+def board_state(obj):
+    """Returns the pickled state of an object which refers to a board. The
+    board is replaced by its uid so that the object can be sent to another
+    process without the rest of the board."""
+    state = dict(obj.__dict__)
+    board = state.get("board", None)
+    state["board"] = board.uid if board is not None else None
+    return state
+
+
+def restore_state(obj, state):
+    """Restores the attributes of an unpickled object. Their names are
+    interned like those restored by the default unpickling, so that a
+    loaded board pickles to the same bytes as the original."""
+    obj.__dict__.update({sys.intern(k): v for k, v in state.items()})
+
+
+def rebind_board(obj, state):
+    """Restores the state of an object pickled with board_state and rebinds
+    it to the board with the same uid (or None if there is none)."""
+    restore_state(obj, state)
+    obj.board = board_by_id(state["board"])
@@ -63,6 +63,13 @@ if __name__ == "__main__":
         default=False,
         help="Search footprints library",
     )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        default=False,
+        help="Show pad count and size of matching footprints",
+    )
     parser.add_argument(
         "-s",
         "--symbols",
@@ -91,12 +98,17 @@ if __name__ == "__main__":
                 print(crayons.red("Unable to KiCAD footprints directory"))
             if SYM_LIB_PATH is None:
                 print(crayons.red("Unable to KiCAD symbols directory"))
-    if argsd["footprints"]:
+    if argsd["footprints"] and argsd["info"]:
+        print(crayons.cyan("Loading footprints in %s..." % (FP_LIB_PATH)))
+        lib = load_library(FP_LIB_PATH)
+        fps = lib.search(*argsd["searchspec"], ignore_case=argsd["ignore_case"])
+        print(lib.table(fps))
+        for error in lib.errors:
+            print(crayons.red(error))
+        print(crayons.green("%d footprints found" % (len(fps))))
+    elif argsd["footprints"]:
         print(crayons.cyan("Searching for footprints in %s..." % (FP_LIB_PATH)))
-        ALL_KICAD_FILES = glob.glob(
-            FP_LIB_PATH + os.sep + "**/*.kicad_mod", recursive=True
-        )
-        file_list = file_search(ALL_KICAD_FILES)
+        file_list = file_search(FootprintIndex(FP_LIB_PATH).paths())
         col_print(file_list)
         print(crayons.green("%d footprint module files found" % (len(file_list))))
 
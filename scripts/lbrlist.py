@@ -27,6 +27,13 @@ if __name__ == "__main__":
         default=False,
         help="Show verbose entities of part",
     )
+    parser.add_argument(
+        "-i",
+        "--info",
+        action="store_true",
+        default=False,
+        help="Show pad count and size of every package",
+    )
     parser.add_argument(
         "-s",
         "--svg",
@@ -69,6 +76,10 @@ if __name__ == "__main__":
             brd.layers["GML"].add(g)
             svg_write(brd, part + ".svg")
             print(crayons.green("%s exported to %s.svg" % (part, part)))
+    elif argsd["info"]:
+        lib = load_library(argsd["library"])
+        print(lib.table())
+        print(crayons.green("%d packages found in %s" % (len(lib), argsd["library"])))
     else:
         print(
             "Package list of Eagle library " + crayons.green("%s:" % (argsd["library"]))
@@ -85,6 +85,7 @@ setuptools.setup(
     author="Michael Gale",
     author_email="michael@fxbricks.com",
     packages=setuptools.find_packages(),
+    package_data={"pcbflow": ["hershey-occidental.dat"]},
     long_description=build_description(),
     license="MIT",
     classifiers=[
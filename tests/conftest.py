@@ -0,0 +1,40 @@
+import io
+import os
+import runpy
+import contextlib
+
+import pytest
+
+import pcbflow
+
+EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "examples")
+
+
+class _Saved(Exception):
+    pass
+
+
+@pytest.fixture
+def example(monkeypatch):
+    """Returns a function which runs an example script, given by its path
+    below examples/, up to its call of Board.save and returns the board"""
+
+    def build(script):
+        boards = []
+
+        def save(self, *args, **kwargs):
+            boards.append(self)
+            raise _Saved()
+
+        path = os.path.join(EXAMPLES, script)
+        with monkeypatch.context() as m:
+            m.setattr(pcbflow.Board, "save", save)
+            m.chdir(os.path.dirname(path))
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    runpy.run_path(path, run_name="__main__")
+            except _Saved:
+                pass
+        return boards[0]
+
+    return build
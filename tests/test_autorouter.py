@@ -0,0 +1,75 @@
+import os
+import random
+
+from pcbflow import *
+
+
+def test_autorouter():
+    brd = Board((30, 20))
+    brd.add_outline()
+    r1 = R0603(brd.DC((6, 10))).assign_pads("1", "2")
+    r2 = R0603(brd.DC((24, 10))).assign_pads("1", "2")
+    brd.addnet(r1.pads[1], r2.pads[0])
+    # a wall of another net across the top layer forces a detour below
+    brd.DC((15, 0)).forward(20).set_name("GND").wire(layer="GTL")
+    router = brd.autoroute(rip_up=0)
+    # the pool uses every CPU unless told otherwise
+    assert router.processes == (os.cpu_count() or 1)
+    assert len(router.routes) == 1 and router.failed == []
+    assert len(router.routes[0].vias()) == 2
+    assert router.connections_per_second() > 0
+    conn = brd.connectivity()
+    assert conn.opens == [] and conn.shorts == []
+    assert brd.check(verbose=False) == []
+    assert len(brd.ratsnest()) == 0
+
+
+def test_autorouter_parallel():
+    def build():
+        brd = Board((100, 60))
+        brd.add_outline()
+        for x in range(8, 100, 12):
+            for y in range(8, 60, 12):
+                r1 = R0603(brd.DC((x - 2, y))).assign_pads("1", "2")
+                r2 = R0603(brd.DC((x + 2, y))).assign_pads("1", "2")
+                brd.addnet(r1.pads[1], r2.pads[0])
+        return brd
+
+    routes = []
+    for processes in (1, 2):
+        brd = build()
+        router = AutoRouter(brd, processes=processes, window=2.0)
+        # far apart connections can all be routed at once
+        assert len(router.waves(router._ordered())) == 1
+        router.route()
+        assert router.failed == []
+        routes.append([r.points for r in router.routes])
+    assert router.parallel == len(router.routes)
+    assert routes[0] == routes[1]
+    assert brd.connectivity().opens == []
+    assert brd.check(verbose=False) == []
+
+
+def test_autorouter_processes():
+    def build():
+        rng = random.Random(7)
+        brd = Board((60, 60))
+        brd.add_outline()
+        parts = []
+        for x in range(5, 60, 6):
+            for y in range(5, 60, 6):
+                parts.append(R0603(brd.DC((x, y))).assign_pads("1", "2"))
+        rng.shuffle(parts)
+        for a, b in zip(parts[0:40], parts[40:80]):
+            brd.addnet(a.pads[1], b.pads[0])
+        return brd
+
+    routes = []
+    for processes in (1, 2):
+        router = AutoRouter(
+            build(), processes=processes, pitch=0.5, rip_up=0, max_expansions=20000
+        )
+        router.route()
+        assert router.parallel > 0
+        routes.append([r.points for r in router.routes])
+    assert routes[0] == routes[1]
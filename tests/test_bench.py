@@ -0,0 +1,37 @@
+import os
+import sys
+import json
+
+import shapely.ops as so
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "..", "benchmarks"))
+
+import bench
+import generators
+
+
+def test_bench_smoke(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        generators.GENERATORS, "grid", (generators.discrete_grid, {"small": 4})
+    )
+    results = bench.run(["grid"], ["small"], ["place", "pour", "gerber"], verbose=False)
+    assert [r["stage"] for r in results] == ["place", "pour", "gerber"]
+    assert all(r["seconds"] is not None for r in results)
+    assert results[-1]["bytes"] > 0
+    doc = bench.environment()
+    doc["results"] = results
+    fn = str(tmp_path / "results.json")
+    with open(fn, "wt") as f:
+        json.dump(doc, f, indent=1)
+    with open(fn) as f:
+        loaded = json.load(f)
+    assert loaded["pcbflow"] == bench.__version__
+    assert len(loaded["results"]) == 3
+
+
+def test_bench_logos():
+    brd = generators.logos(2)
+    for name in ("GTO", "GBO"):
+        layer = brd.layers[name]
+        assert so.unary_union([g for _, g in layer.polys]).area > 0
@@ -0,0 +1,66 @@
+from pcbflow import *
+
+
+def test_connectivity():
+    brd = Board((40, 30))
+    brd.add_outline()
+    r1 = R0402(brd.DC((10, 10)), val="1k").assign_pads("1", "2")
+    r2 = R0402(brd.DC((20, 10)), val="1k").assign_pads("1", "2")
+    r3 = R0402(brd.DC((30, 10)), val="1k").assign_pads("1", "2")
+    brd.addnet(r1.pads[1], r2.pads[0])
+    brd.addnet(r2.pads[1], r3.pads[0])
+    # R1.2 to R2.1 on the top layer
+    r1.pads[1].copy().goto(r2.pads[0]).wire()
+    conn = brd.connectivity()
+    assert conn.connected(("R1", "2"), ("R2", "1"))
+    assert not conn.connected(("R2", "2"), ("R3", "1"))
+    assert conn.shorts == []
+    assert len(conn.opens) == 1
+    assert conn.opens[0].islands == [(("R2", "2"),), (("R3", "1"),)]
+
+    # R2.2 to R3.1 through the bottom layer
+    t = brd.DC(r2.pads[1].xy)
+    t.goxy(0, -3).wire()
+    t.via_to("GBL")
+    t.goxy(8.9, 0).wire()
+    t.via_to("GTL")
+    t.goto(r3.pads[0]).wire()
+    conn = brd.connectivity()
+    assert conn.opens == []
+    assert conn.shorts == []
+    assert conn.connected(("R2", "2"), ("R3", "1"))
+
+    # a stray trace across both nets
+    brd.DC(r2.pads[0].xy).goto(r2.pads[1]).wire()
+    conn = brd.connectivity()
+    assert len(conn.shorts) == 1
+    assert conn.shorts[0].terminals == [
+        ("R1", "2"),
+        ("R2", "1"),
+        ("R2", "2"),
+        ("R3", "1"),
+    ]
+    assert len(conn.shorts[0].nets) == 2
+    assert conn.shorts[0].layer == "GTL"
+
+
+def test_ratsnest():
+    brd = Board((40, 30))
+    brd.add_outline()
+    r = [
+        R0402(brd.DC((10 * k, 10)), val="1k").assign_pads("1", "2")
+        for k in range(1, 4)
+    ]
+    brd.addnet(r[0].pads[1], r[1].pads[0])
+    brd.addnet(r[1].pads[0], r[2].pads[0])
+    rats = brd.ratsnest()
+    assert len(rats) == 2
+    assert abs(rats.total_length() - 19.0) < 1e-6
+    # connected copper removes the airwire
+    r[0].pads[1].copy().goto(r[1].pads[0]).wire()
+    rats = brd.ratsnest(layer="GTD")
+    assert len(rats) == 1
+    w = rats.airwires[0]
+    assert {w.a, w.b} == {("R2", "1"), ("R3", "1")}
+    assert abs(w.length - 10.0) < 1e-6
+    assert brd.layers["GTD"].polys[-1][0] == w.net
@@ -0,0 +1,179 @@
+import os
+import math
+
+import pytest
+import numpy as np
+import shapely
+import shapely.geometry as sg
+
+from pcbflow import *
+
+
+def test_clearance_violation():
+    brd = Board((40, 30))
+    brd.add_outline()
+    brd.DC((5, 5)).forward(10).wire()
+    brd.DC((5.35, 5)).forward(10).wire()
+    brd.DC((10, 5)).forward(10).wire()
+    v = brd.check(verbose=False)
+    assert len(v) == 1
+    assert abs(v[0].distance - (0.35 - brd.drc.trace_width)) < 1e-3
+    assert abs(v[0].xy[0] - 5.175) < 1e-3
+    assert v[0].layer == "GTL"
+
+
+def test_clearance_nets():
+    brd = Board((40, 30))
+    brd.add_outline()
+    p = brd.DC((20, 10)).rect(1, 1)
+    p.set_name("GND")
+    p.smd_pad()
+    # unnamed trace touching the pad belongs to the same conductor
+    brd.DC((20, 10)).right(90).forward(5).wire()
+    # pads on the same net may be closer than the clearance
+    p = brd.DC((20, 5)).rect(1, 1)
+    p.set_name("GND")
+    p.smd_pad()
+    p = brd.DC((21.1, 5)).rect(1, 1)
+    p.set_name("GND")
+    p.smd_pad()
+    brd.fill_layer("GTL", "GND")
+    assert brd.check(verbose=False) == []
+
+    p = brd.DC((21.0, 10)).rect(1, 1)
+    p.set_name("VCC")
+    p.smd_pad()
+    # the new pad shorts both the GND pad and the previously poured GND fill
+    v = check_clearance(brd, layers=["GTL"])
+    assert len(v) == 2
+    assert all([e.distance == 0 for e in v])
+    assert all([set(e.nets) == {"GND", "VCC"} for e in v])
+
+
+def test_live_drc():
+    brd = Board((40, 30))
+    brd.add_outline()
+    live = brd.enable_live_drc()
+    p = brd.DC((20, 10)).rect(1, 1)
+    p.set_name("GND")
+    p.smd_pad()
+    brd.DC((20, 10)).right(90).forward(5).wire()
+    assert live.violations == []
+    brd.DC((5, 5)).forward(10).wire()
+    brd.DC((5.35, 5)).forward(10).wire()
+    assert len(live.violations) == 1
+    v = live.violations[0]
+    assert v.site.startswith(__file__)
+    assert abs(v.distance - (0.35 - brd.drc.trace_width)) < 1e-3
+
+    brd.enable_live_drc(raise_errors=True)
+    with pytest.raises(ClearanceError):
+        p = brd.DC((20.9, 10)).rect(1, 1)
+        p.set_name("VCC")
+        p.smd_pad()
+
+
+def test_live_drc_quality():
+    # the arc error allowance follows quality changes after enabling
+    brd = Board((40, 30))
+    brd.drc.set_quality("fab")
+    live = brd.enable_live_drc()
+    gap = brd.drc.trace_width + brd.drc.clearance - MICRONS(5)
+    brd.DC((5, 5)).forward(10).wire()
+    brd.DC((5 + gap, 5)).forward(10).wire()
+    assert len(live.violations) == 1
+    brd.drc.set_quality("draft")
+    brd.DC((25, 5)).forward(10).wire()
+    brd.DC((25 + gap, 5)).forward(10).wire()
+    assert len(live.violations) == 1
+
+
+def test_live_drc_long_traces():
+    # long traces are indexed in coarser grids, so a new feature is only
+    # compared with the traces near it
+    brd = Board((200, 200))
+    live = brd.enable_live_drc()
+    for i in range(200):
+        dc = brd.DC((25, 2 + 0.9 * i)).set_name("N%d" % (i))
+        dc.right(90).forward(150).wire()
+    assert live.levels["GTL"] > 0
+    bounds = sg.Point(100, 92).buffer(0.5).bounds
+    candidates = live._candidates("GTL", bounds)
+    assert 0 < len(candidates) < 20
+    # and they are still checked
+    brd.DC((100, 92.45)).via("VIA")
+    assert {v.nets for v in live.violations} == {("N100", "VIA"), ("N101", "VIA")}
+
+
+def test_quality_profiles():
+    def build(quality):
+        brd = Board((30, 20), quality=quality)
+        brd.DC((10, 10)).via("A")
+        brd.DC((20, 5)).forward(10).wire()
+        brd.add_hole((5, 5), 2.0)
+        brd.add_text((15, 17), "DRAFT")
+        brd.add_outline()
+        brd.fill_layer("GTL", "GND")
+        return brd
+
+    fab, draft = build("fab"), build("draft")
+    assert fab.drc.quality == "fab" and draft.drc.quality == "draft"
+    # thin text strokes have few arc segments even in fab
+    for layer, ratio in (("GTL", 0.5), ("GTO", 0.75), ("GTS", 0.5)):
+        nf = shapely.get_num_coordinates(fab.layers[layer].preview(as_collection=True))
+        nd = shapely.get_num_coordinates(
+            draft.layers[layer].preview(as_collection=True)
+        )
+        assert nd < ratio * nf
+    # draft geometry stays within the arc error and simplification of the
+    # fab geometry
+    tolerance = draft.drc.arc_error + draft.drc.simplify + MICRONS(1)
+    report = compare_boards(
+        fab, draft, area_tolerance=1.0, distance_tolerance=tolerance
+    )
+    assert report.ok, str(report)
+    assert draft.check(verbose=False) == []
+
+    # round pads have fewer sides in draft, other shapes are kept
+    dc, fc = draft.DC((25, 10)), fab.DC((25, 10))
+    dc.n_agon(0.5)
+    fc.n_agon(0.5)
+    assert (len(dc.path) - 1) % 8 == 0 and len(dc.path) < len(fc.path)
+    dc.n_agon(0.5, 8)
+    assert len(dc.path) == 17
+
+    with pytest.raises(ValueError):
+        DRC().set_quality("best")
+
+
+def test_arc_segments():
+    # the chord error stays within the tolerance
+    for r in (0.05, 0.1, 0.45, 1.5, 10.0):
+        for tolerance in (MICRONS(1), MICRONS(10)):
+            for angle in (90, 360, 17.5):
+                n = arc_segments(r, tolerance, angle)
+                step = math.radians(angle / n)
+                assert r * (1 - math.cos(step / 2)) <= tolerance + 1e-12
+                assert step <= math.pi / 2 + 1e-12
+                if n > 1:
+                    coarser = math.radians(angle / (n - 1))
+                    assert r * (1 - math.cos(coarser / 2)) > tolerance
+    assert arc_segments(MICRONS(0.5), MICRONS(1)) == 4
+    assert arc_segments(1.0, MICRONS(1), 0) == 1
+
+    # small features carry fewer vertices than large ones
+    brd = Board((30, 20))
+    brd.DC((10, 10)).via("A")
+    brd.add_hole((20, 10), 3.0)
+    via = brd.layers["GTL"].polys[0][1]
+    hole = brd.keepouts[0]
+    assert len(via.exterior.coords) < len(hole.exterior.coords)
+    r = 0.5 * brd.drc.via_drill + brd.drc.via_annular_ring
+    xy = shapely.get_coordinates(via.exterior) - (10, 10)
+    mid = (xy[1:] + xy[:-1]) / 2
+    assert r - min(abs(np.hypot(*mid.T))) <= brd.drc.arc_error + 1e-9
+
+    # route turns are stepped by the radius of the outermost trace
+    tt = [brd.DC((5 - 0.5 * i, 2)) for i in range(4)]
+    Route(brd, tt).right(90)
+    assert len(tt[-1].path) - 1 == brd.drc.arc_segments(Route(brd, tt).r(), 90)
@@ -0,0 +1,138 @@
+import os
+import sys
+
+import pytest
+
+from pcbflow import *
+from pcbflow.equivalence import layer_shape
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# layer geometry and drills of known-good builds of the boards below, written
+# again by running the tests with PCBFLOW_UPDATE_REFERENCES=1 after a
+# deliberate change of the geometry
+REFERENCES = os.path.join(HERE, "data", "equivalence")
+UPDATE_REFERENCES = bool(os.environ.get("PCBFLOW_UPDATE_REFERENCES"))
+sys.path.insert(0, os.path.join(HERE, "..", "benchmarks"))
+
+import generators
+
+# examples which only need pcbflow and the files next to them
+EXAMPLE_SCRIPTS = [
+    "basic/bitmap.py",
+    "basic/blank.py",
+    "basic/headers.py",
+    "basic/holes.py",
+    "basic/namedrect.py",
+    "basic/parts.py",
+    "basic/text.py",
+    "basic/vias.py",
+    "kicad_import/kicad.py",
+]
+
+BENCHMARK_BOARDS = [
+    (generators.discrete_grid, 9),
+    (generators.bga_fanout, 1),
+    (generators.dense_bus, 8),
+    (generators.pour, 4),
+    (generators.logos, 2),
+]
+
+
+def _reference(build):
+    # footprints parsed from scratch, no instrumentation
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(footprint_cache, "enabled", False)
+        return build()
+
+
+def _optimized(build, tmp_path):
+    # footprints from a warm on-disk cache, instrumentation on and the
+    # board restored from a snapshot
+    with pytest.MonkeyPatch.context() as m:
+        m.setattr(footprint_cache, "cache_dir", str(tmp_path / "fp"))
+        footprint_cache.clear()
+        with perf.profiling():
+            build()
+            footprint_cache.clear()
+            brd = build()
+        perf.reset()
+    fn = str(tmp_path / "board.snap")
+    brd.dump(fn)
+    return Board.load(fn)
+
+
+def _check(build, name, tmp_path):
+    # both configurations must match the stored known-good geometry
+    fn = os.path.join(REFERENCES, name + ".json.gz")
+    reference = _reference(build)
+    if UPDATE_REFERENCES:
+        os.makedirs(REFERENCES, exist_ok=True)
+        save_reference(reference, fn)
+    for brd in (reference, _optimized(build, tmp_path)):
+        report = compare_reference(brd, fn)
+        assert report.ok, str(report)
+
+
+@pytest.mark.parametrize("script", EXAMPLE_SCRIPTS)
+def test_equivalence_examples(script, tmp_path, example):
+    def build():
+        return example(script)
+
+    name = os.path.splitext(script)[0].replace("/", "_")
+    _check(build, name, tmp_path)
+
+
+@pytest.mark.parametrize("gen, n", BENCHMARK_BOARDS)
+def test_equivalence_benchmarks(gen, n, tmp_path):
+    def build():
+        brd = gen(n)
+        brd.fill_layer("GTL", "GND")
+        brd.fill_layer("GBL", "GND")
+        return brd
+
+    _check(build, "%s_%d" % (gen.__name__, n), tmp_path)
+
+
+def test_equivalence_differences():
+    def build(dx=0.0, hole=True):
+        brd = Board((30, 20))
+        brd.DC((10 + dx, 10)).via("A")
+        brd.DC((20, 10)).right(90).forward(5).wire()
+        if hole:
+            brd.add_hole((5, 5), 2.0)
+        brd.add_outline()
+        brd.fill_layer("GTL", "GND")
+        return brd
+
+    report = compare_boards(build(), build(dx=0.05))
+    assert not report.ok
+    layers = {d.layer for d in report.differences}
+    assert {"GTL", "GBL"} <= layers
+    for d in report.differences:
+        # the differences are pinpointed around the moved via
+        x0, y0, x1, y1 = d.bounds
+        assert 8 < x0 < x1 < 12 and 8 < y0 < y1 < 12, str(d)
+        assert d.distance > 0.04
+    assert [d for d, _ in report.drills["PTH"][0]] == [0.5]
+    assert [d for d, _ in report.drills["PTH"][1]] == [0.5]
+
+    # only the surroundings of the moved via are compared as vectors
+    gtl = layer_shape(build().layers["GTL"])
+    region = changed_region(gtl, layer_shape(build(dx=0.05).layers["GTL"]))
+    x0, y0, x1, y1 = region.bounds
+    assert 8 < x0 < x1 < 12 and 8 < y0 < y1 < 12
+    assert changed_region(gtl, layer_shape(build().layers["GTL"])).is_empty
+
+    report = compare_boards(build(), build(hole=False))
+    assert report.drills == {"NPTH": ([(2.0, (5, 5))], [])}
+    assert {d.layer for d in report.differences} == {"GTL", "GTS", "GBS"}
+
+    # the raster comparison alone finds the same regions
+    quick = compare_boards(build(), build(dx=0.05), exact=False)
+    assert {d.layer for d in quick.differences} == layers
+    assert all(d.distance is None and d.pixels > 0 for d in quick.differences)
+
+    # a sub-micron change of the copper is within the tolerances but the
+    # drills must match exactly
+    report = compare_boards(build(), build(dx=1e-7))
+    assert report.differences == [] and list(report.drills) == ["PTH"]
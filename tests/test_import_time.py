@@ -0,0 +1,33 @@
+import os
+import subprocess
+import sys
+
+# modules which should only be loaded when they are actually used
+LAZY_MODULES = ("PIL", "svgwrite", "cairosvg", "cairocffi", "skidl")
+
+# generous upper limit on the time to import pcbflow in a fresh interpreter
+IMPORT_TIME_BUDGET = 1.5
+
+IMPORT_SCRIPT = """
+import sys, time
+t0 = time.perf_counter()
+import pcbflow
+t1 = time.perf_counter()
+print(t1 - t0)
+print(",".join([m for m in %r if m in sys.modules]))
+""" % (
+    LAZY_MODULES,
+)
+
+
+def test_import_time():
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    dt, loaded = out.stdout.splitlines()[-2:]
+    assert loaded == ""
+    assert float(dt) < IMPORT_TIME_BUDGET
@@ -0,0 +1,116 @@
+import os
+
+from pcbflow import *
+import pcbflow.kicad
+import pcbflow.library
+
+KC_PATH = os.path.join(os.path.dirname(__file__), "..", "examples", "kicad_import")
+
+
+def test_kicad_footprint():
+    fp = KiCadFootprint(os.path.join(KC_PATH, "kc1.kicad_mod"))
+    assert fp.footprint == "TerminalBlock_TE_282834-5_1x05_P2.54mm_Horizontal"
+    assert len(fp.pin_pads) == 5
+    assert len(fp.circles) == 5
+    assert fp.pin_pads[0]["drill"] == 1.1
+
+
+def test_footprint_cache(monkeypatch):
+    footprint_cache.clear()
+    fn = os.path.join(KC_PATH, "kc2.kicad_mod")
+    brd = Board()
+    p0 = KiCadPart(brd.DC((10, 10)), libraryfile=fn)
+    assert footprint_cache.misses == 1
+
+    def no_parse(fn):
+        raise AssertionError("footprint should not be re-parsed")
+
+    monkeypatch.setattr(pcbflow.kicad, "parse_kicad_footprint", no_parse)
+    p1 = KiCadPart(brd.DC((30, 10)), libraryfile=fn)
+    assert footprint_cache.hits == 1
+    assert p0.footprint == p1.footprint
+    assert len(p0.pads) == len(p1.pads)
+    assert p0.smd_pads is not p1.smd_pads
+
+
+def test_footprint_cache_disk(tmp_path):
+    fn = os.path.join(KC_PATH, "kc3.kicad_mod")
+    cache = FootprintCache(cache_dir=str(tmp_path))
+    r0 = cache.get(fn, pcbflow.kicad.parse_kicad_footprint)
+    assert cache.misses == 1
+    assert len(os.listdir(str(tmp_path))) == 1
+
+    # a fresh cache (i.e. a new process) loads the record from disk
+    cache = FootprintCache(cache_dir=str(tmp_path))
+    r1 = cache.get(fn, None)
+    assert cache.hits == 1
+    assert r0 == r1
+
+
+def test_footprint_index(tmp_path):
+    root = tmp_path / "footprints"
+    for lib, names in (
+        ("R_SMD", ["R_0603", "R_0603_HandSolder"]),
+        ("C_SMD", ["C_0603"]),
+    ):
+        (root / (lib + ".pretty")).mkdir(parents=True)
+        for name in names:
+            (root / (lib + ".pretty") / (name + ".kicad_mod")).write_text("(module)")
+    idx_file = str(tmp_path / "fp.idx")
+    idx = FootprintIndex(str(root), index_file=idx_file)
+    assert len(idx) == 3
+    # exact lookups, not substring matches
+    assert idx.find("R_SMD:R_0603").endswith("R_0603.kicad_mod")
+    assert idx.find("R_0603_HandSolder").endswith("R_0603_HandSolder.kicad_mod")
+    assert idx.find("C_SMD:C_0603").endswith(
+        os.path.join("C_SMD.pretty", "C_0603.kicad_mod")
+    )
+    assert idx.find("R_SMD:R_0402") is None
+    assert "C_0603" in idx
+
+    # a reloaded index is unchanged; new footprints are picked up by refresh
+    idx = FootprintIndex(str(root), index_file=idx_file)
+    assert not idx.refresh()
+    (root / "C_SMD.pretty" / "C_0402.kicad_mod").write_text("(module)")
+    os.utime(str(root / "C_SMD.pretty"), ns=(1, 1))
+    assert idx.refresh()
+    assert idx.find("C_SMD:C_0402") is not None
+    assert len(idx.paths()) == 4
+
+
+LBR = """<?xml version="1.0" encoding="utf-8"?>
+<eagle version="6.0"><drawing><library><packages>
+<package name="R0603">
+<smd name="1" x="-0.8" y="0" dx="0.9" dy="1.0" layer="1"/>
+<smd name="2" x="0.8" y="0" dx="0.9" dy="1.0" layer="1"/>
+</package>
+<package name="HDR2">
+<pad name="1" x="0" y="0" drill="1.0" diameter="1.8" shape="square"/>
+<pad name="2" x="2.54" y="0" drill="1.0" diameter="1.8"/>
+<wire x1="-1.27" y1="-1.27" x2="3.81" y2="-1.27" width="0.2" layer="21"/>
+</package>
+</packages></library></drawing></eagle>
+"""
+
+
+def test_load_library(tmp_path, monkeypatch):
+    lib = load_library(KC_PATH)
+    assert len(lib) == 6 and not lib.errors
+    fp = lib.find("kicad_import:TerminalBlock_TE_282834-5_1x05_P2.54mm_Horizontal")
+    assert fp.pad_count == 5 and fp.pads[0][5] == 1.1
+    assert lib.search("terminalblock", ignore_case=True) == [fp]
+
+    lbr = tmp_path / "test.lbr"
+    lbr.write_text(LBR)
+    monkeypatch.setattr(pcbflow.library, "PARALLEL_MIN_FILES", 1)
+    lib = load_library([KC_PATH, str(lbr)], processes=2)
+    assert len(lib) == 8
+    hdr = lib["test:HDR2"]
+    assert hdr.pad_count == 2
+    assert hdr.bounds == (-1.27, -1.27, 3.81, 0.9)
+    assert lib["R0603"].pads[1] == ("2", 0.8, 0, 0.9, 1.0, 0.0)
+
+    brd = Board((50, 50))
+    p0 = lib.part(brd.DC((10, 10)), "HDR2")
+    p1 = lib.part(brd.DC((20, 10)), "HDR2")
+    assert len(p0.pads) == len(p1.pads) == 2
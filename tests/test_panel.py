@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from pcbflow import *
+
+
+def _board():
+    brd = Board((20, 15))
+    SOIC8(brd.DC((10, 7.5)))
+    brd.DC((3, 3)).via()
+    brd.add_hole((17, 12), 2.0)
+    brd.add_outline()
+    brd.fill_layer("GTL", "GND")
+    return brd
+
+
+def test_panel(tmp_path, capsys):
+    brd = _board()
+    panel = Panel(brd).array(4, 6)
+    assert len(panel) == 24 and len(panel.placements()) == 24
+    assert panel.size == (4 * 20 + 3 * 2, 6 * 15 + 5 * 2 + 2 * (2 + 5))
+    base = str(tmp_path / "board")
+    brd.save_gerbers(base, in_subdir=False)
+    panel.save_gerbers(str(tmp_path / "panel"), in_subdir=False)
+    # like Board.save, panels are written without progress output
+    assert capsys.readouterr().out == ""
+    with open(base + ".GTL") as f:
+        board_gtl = f.read()
+    with open(str(tmp_path / "panel.GTL")) as f:
+        panel_gtl = f.read()
+    # the board is written once inside a step and repeat block
+    assert panel_gtl.count("%SRX4Y6I22.0000J17.0000*%") == 1
+    assert panel_gtl.count("G36*") == board_gtl.count("G36*") + 3
+    assert len(panel_gtl) < 1.5 * len(board_gtl)
+    with open(str(tmp_path / "panel_PTH.DRL")) as f:
+        drl = f.read()
+    assert "R3X22000" in drl and drl.count("X3000Y") == 6
+    with open(str(tmp_path / "panel_NPTH.DRL")) as f:
+        npth = f.read()
+    # mouse bites and tooling holes
+    assert "C0.500" in npth and "C2.000" in npth
+    with open(str(tmp_path / "panel.GML")) as f:
+        assert f.read().count("D10*") == 4 + 1
+
+
+def test_panel_rotated(tmp_path):
+    brd = _board()
+    panel = Panel(brd, tab=0, fiducials=False).place((0, 0)).place((22, 0), 90)
+    assert panel.size == (22 + 15, 20 + 2 * (2 + 5))
+    assert panel.placements()[1] == ((22 + 15, 7), 90)
+    with pytest.raises(ValueError):
+        panel.place((0, 30), 45)
+    panel.save_gerbers(str(tmp_path / "panel"), in_subdir=False)
+    assert "%SR" not in open(str(tmp_path / "panel.GTL")).read()
@@ -50,3 +50,17 @@ def test_pinheaders():
     assert p0.N == 14
     assert p0.diameter == 0.8
     assert p0.pitch == INCHES(0.1)
+
+
+def test_roundpad():
+    brd = Board((30, 30))
+    bga = brd.add_part((15, 15), FTG256, side="top")
+    assert len(bga.pads) == 256
+    pad = bga.pads[0]
+    assert pad.pw == 0.4 and pad.h == 0.4
+    x0, y0, x1, y1 = pad_bound(pad)
+    assert abs((x1 - x0) - 0.4) < 1e-9 and abs((y1 - y0) - 0.4) < 1e-9
+    # the mask opening is the pad grown by the soldermask margin
+    mask = brd.layers["GTS"].polys[0][1]
+    d = 0.4 + 2 * brd.drc.soldermask_margin
+    assert abs((mask.bounds[2] - mask.bounds[0]) - d) < 1e-3
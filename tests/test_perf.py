@@ -0,0 +1,51 @@
+import json
+
+from pcbflow import *
+
+
+def _board():
+    brd = Board((40, 30))
+    brd.add_part((10, 20), SOT23, side="top")
+    DIP8(brd.DC((10, 8)))
+    brd.DC((30, 25)).via()
+    brd.DC((5, 5)).forward(10).right(90).forward(5).wire()
+    brd.add_text((20, 5), "PERF")
+    brd.add_outline()
+    brd.fill_layer("GTL", "GND")
+    return brd
+
+
+def test_perf_disabled():
+    perf.reset()
+    _board().layers["GTL"].preview()
+    assert perf.timings() == {}
+    assert perf.counters() == {}
+
+
+def test_perf_report(tmp_path):
+    with perf.profiling():
+        brd = _board()
+        brd.layers["GTL"].preview()
+    assert not perf.active
+    timings = perf.timings()
+    for name in ("Layer.add", "Draw.wire", "Draw.via", "PCBPart.place"):
+        assert timings[name][0] > 0
+    assert timings["Board.fill_layer"][0] == 1
+    assert timings["Board.add_text"][0] == 1
+    assert timings["Layer.preview"][0] == 1
+    counters = perf.counters()
+    assert counters["parts"] == 2
+    assert counters["unions"] > 0
+    assert counters["vertices.GTL"] > counters["polygons.GTL"] > 0
+
+    report = brd.perf_report()
+    assert "Layer.add" in report and "GTL" in report
+
+    fn = str(tmp_path / "trace.json")
+    perf.save_trace(fn)
+    with open(fn) as f:
+        events = json.load(f)["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    assert len(spans) == sum([calls for calls, _, _ in timings.values()])
+    assert events[-1]["ph"] == "C" and events[-1]["args"] == counters
+    perf.reset()
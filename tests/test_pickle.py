@@ -0,0 +1,71 @@
+import pickle
+
+from pcbflow import *
+
+
+def _parts_board():
+    # as examples/basic/parts.py
+    brd = Board((50, 30))
+    brd.add_part((5, 20), SOT23, side="top")
+    brd.add_part((15, 20), SOT223, side="top")
+    brd.add_part((25, 20), TSSOP14, side="top")
+    brd.add_part((35, 10), QFN64, side="top")
+    brd.add_part((40, 22), HDMI, side="top")
+    brd.add_part((5, 10), SOT23, side="bottom")
+    brd.add_part((15, 10), SOT223, side="bottom")
+    brd.add_part((25, 10), SOIC8, side="bottom")
+    brd.add_outline()
+    brd.fill_layer("GTL", "GND")
+    brd.fill_layer("GBL", "VCC")
+    return brd
+
+
+def test_pickle_board():
+    brd = _parts_board()
+    brd.enable_live_drc()
+    b2 = pickle.loads(pickle.dumps(brd))
+    # the original is still alive, so the copy gets a uid of its own
+    assert b2 is not brd and b2.uid != brd.uid
+    assert board_by_id(brd.uid) is brd and board_by_id(b2.uid) is b2
+    assert b2.live_drc is None
+    assert [(p.id, [pad.xy for pad in p.pads]) for p in b2.parts["U"]] == [
+        (p.id, [pad.xy for pad in p.pads]) for p in brd.parts["U"]
+    ]
+    for name in brd.get_copper_layers(as_names=True):
+        assert b2.layers[name].board is b2
+        assert b2.layers[name].preview(True).equals(brd.layers[name].preview(True))
+    for parts in b2.parts.values():
+        for part in parts:
+            assert part.board is b2 and part.center.board is b2
+            assert all(pad.board is b2 for pad in part.pads)
+    b2.counters["x"] += 1
+
+
+def test_pickle_board_refs():
+    brd = _parts_board()
+    layer = pickle.dumps(brd.layers["GTL"])
+    pad = pickle.dumps(brd.get_part("U1").pads[0])
+    # only the board's uid is sent along
+    assert len(layer) < len(pickle.dumps(brd)) / 2
+    assert len(pad) < 1000
+    assert pickle.loads(layer).board is brd
+    assert pickle.loads(pad).board is brd
+
+
+def test_pickle_refs_after_copy(tmp_path):
+    # loading a copy of a board must not take over references to it
+    brd = _parts_board()
+    b2 = pickle.loads(pickle.dumps(brd))
+    assert pickle.loads(pickle.dumps(brd.get_part("U1").pads[0])).board is brd
+    assert pickle.loads(pickle.dumps(brd.layers["GTL"])).board is brd
+    assert pickle.loads(pickle.dumps(brd.get_part("U1"))).board is brd
+    # and references to the copy resolve to the copy
+    assert pickle.loads(pickle.dumps(b2.get_part("U1").pads[0])).board is b2
+    assert pickle.loads(pickle.dumps(b2.layers["GTL"])).board is b2
+    # a snapshot load is a copy too
+    fn = str(tmp_path / "board.pcb")
+    brd.dump(fn)
+    b3 = Board.load(fn)
+    assert b3.uid not in (brd.uid, b2.uid)
+    assert all(pad.board is b3 for pad in b3.get_part("U1").pads)
+    assert pickle.loads(pickle.dumps(brd.get_part("U1").pads[0])).board is brd
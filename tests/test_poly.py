@@ -44,3 +44,31 @@ def test_add_named_poly():
 
     mb = brd.layers["GTL"].named_polys[0][1].bounds
     assert mb == (5.0, 10.0, 20.0, 30.0)
+
+
+def test_bitmap_boxes():
+    import numpy as np
+
+    bits = np.array(
+        [
+            [0, 1, 1, 0, 1],
+            [0, 1, 1, 0, 0],
+            [1, 1, 1, 0, 1],
+        ],
+        dtype=bool,
+    )
+    x0, y0, x1, y1 = bitmap_boxes(bits)
+    boxes = sorted(zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()))
+    assert boxes == [(0, 2, 3, 3), (1, 0, 3, 2), (4, 0, 5, 1), (4, 2, 5, 3)]
+    x0, y0, x1, y1 = bitmap_boxes(np.zeros((3, 3), dtype=bool))
+    assert len(x0) == 0
+
+
+def test_add_bitmap():
+    fn = os.path.join(os.path.dirname(__file__), "..", "examples", "basic", "fxlogo.png")
+    brd = Board((40, 30))
+    brd.add_bitmap((10, 10), fn, scale=0.5)
+    g = brd.layers["GTO"].polys[-1][1]
+    assert g.is_valid
+    assert abs(g.area - 80.4189) < 0.01
+    assert abs(g.centroid.x - 10) < 2 and abs(g.centroid.y - 10) < 2
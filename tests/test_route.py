@@ -0,0 +1,36 @@
+import pytest
+
+from pcbflow import *
+
+
+def _bus(brd, n, spacing):
+    tt = [brd.DC((5 + i * spacing, 5)).set_name("D%d" % (i)) for i in range(n)]
+    # stagger the starts so that the signals differ in length
+    for i, t in enumerate(tt):
+        t.forward(i * 0.7)
+    return Route(brd, tt)
+
+
+def test_route_tune():
+    for style in ("trombone", "sawtooth"):
+        brd = Board((40, 40))
+        bus = _bus(brd, 4, 1.0)
+        lengths = bus.lengths()
+        assert abs(max(lengths) - min(lengths) - 2.1) < 1e-9
+        assert "*" in bus.length_report(tolerance=0.1)
+        start = [t.xy[1] for t in bus.tt]
+        bus.tune(tolerance=0.05, style=style)
+        bus.forward(2).wire()
+        lengths = bus.lengths()
+        assert max(lengths) - min(lengths) < 0.05
+        assert "*" not in bus.length_report(tolerance=0.05)
+        # the signals go forward together and the meanders keep clearance
+        assert len({round(t.xy[1] - y, 6) for t, y in zip(bus.tt, start)}) == 1
+        assert brd.check(verbose=False) == []
+
+
+def test_route_tune_no_room():
+    brd = Board((40, 40))
+    bus = _bus(brd, 3, brd.drc.channel())
+    with pytest.raises(ValueError):
+        bus.tune()
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+import pcbflow
+from pcbflow import *
+
+
+def _board():
+    brd = Board((40, 30))
+    brd.add_part((10, 20), SOT23, side="top")
+    brd.add_part((25, 15), SOIC8, side="bottom")
+    DIP8(brd.DC((10, 8)))
+    brd.DC((30, 25)).via()
+    brd.add_hole((35, 5), 2.0)
+    brd.add_outline()
+    brd.fill_layer("GTL", "GND")
+    brd.fill_layer("GBL", "VCC")
+    return brd
+
+
+def _files(path):
+    files = {}
+    for fn in sorted(os.listdir(path)):
+        with open(os.path.join(path, fn), "rb") as f:
+            files[fn] = f.read()
+    return files
+
+
+def _legacy_gerbers(brd, assetpath):
+    # the Gerber and Excellon writer of Board.save_gerbers before it was
+    # built on SavePipeline
+    for name, layer in brd.layers.items():
+        with open(gerber_filename(assetpath, name), "wt") as f:
+            layer.save(f)
+    ls = "1,%d" % (len(brd.get_copper_layers()))
+    with open(assetpath + "_PTH.DRL", "wt") as f:
+        excellon(f, brd.holes, "Plated,%s,PTH" % (ls))
+    with open(assetpath + "_NPTH.DRL", "wt") as f:
+        excellon(f, brd.npth, "NonPlated,%s,NPTH" % (ls))
+
+
+def test_save_pipeline(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    outputs = []
+    for workers in (1, 4):
+        brd = _board()
+        done = []
+        path = "w%d" % (workers)
+        pipeline = brd.save(
+            "board",
+            subdir=path,
+            pdf=False,
+            svg=True,
+            povray=True,
+            workers=workers,
+            progress=lambda task, n, total: done.append((task.name, n, total)),
+        )
+        assert len(done) == len(pipeline)
+        assert [n for _, n, _ in done] == list(range(1, len(pipeline) + 1))
+        assert set(pipeline.timings()) == {name for name, _, _ in done}
+        assert "DRL" not in brd.layers
+        outputs.append(_files(path))
+    assert "board.GTL" in outputs[0] and "board_preview_all.svg" in outputs[0]
+    assert "board.sub.pov" in outputs[0] and "board-bom.csv" in outputs[0]
+    assert outputs[0] == outputs[1]
+
+
+@pytest.mark.parametrize("script", ["basic/parts.py", "kicad_import/kicad.py"])
+def test_save_legacy_gerbers(script, tmp_path, example):
+    brd = example(script)
+    for path in ("legacy", "pipeline", "save_gerbers"):
+        os.makedirs(str(tmp_path / path))
+    _legacy_gerbers(brd, str(tmp_path / "legacy" / "board"))
+    brd.save(
+        str(tmp_path / "pipeline" / "board"),
+        in_subdir=False,
+        pdf=False,
+        bom=False,
+        centroids=False,
+        workers=4,
+    )
+    brd.save_gerbers(str(tmp_path / "save_gerbers" / "board"), in_subdir=False)
+    legacy = _files(str(tmp_path / "legacy"))
+    assert "board.GTL" in legacy and "board_PTH.DRL" in legacy
+    assert _files(str(tmp_path / "pipeline")) == legacy
+    assert _files(str(tmp_path / "save_gerbers")) == legacy
+
+
+def test_save_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache = BuildCache(str(tmp_path / "cache"))
+    options = dict(pdf=False, svg=True, povray=True, workers=1, cache=cache)
+    first = _board().save("board", subdir="first", **options)
+    assert set(first.cache_report().values()) == {"miss"}
+    second = _board().save("board", subdir="second", **options)
+    assert set(second.cache_report().values()) == {"hit"}
+    assert {t.status for t in second.tasks.values()} == {"run", "cached", "skipped"}
+    assert _files("first") == _files("second")
+
+    brd = _board()
+    brd.add_text((20, 5), "REV2", side="top")
+    third = brd.save("board", subdir="third", **options)
+    missed = {n for n, s in third.cache_report().items() if s == "miss"}
+    assert "gerber.GTO" in missed and "gerber.GTL" not in missed
+    assert "drill.PTH" not in missed
+    assert "preview_all.svg" in missed
+
+    # another pcbflow version does not reuse the files
+    monkeypatch.setattr(pcbflow.buildcache, "__version__", "0.0.0")
+    fourth = _board().save("board", subdir="fourth", **options)
+    assert set(fourth.cache_report().values()) == {"miss"}
+
+    cache.max_size = 0
+    cache.evict()
+    assert cache.entries() == []
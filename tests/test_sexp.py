@@ -0,0 +1,36 @@
+import io
+import os
+
+from pcbflow.sexp_parser import parseSexp, parseSexpStream
+
+KC_PATH = os.path.join(os.path.dirname(__file__), "..", "examples", "kicad_import")
+
+
+def test_parse_sexp():
+    s = '(module R_0603 (layer F.Cu)\n  (descr "Resistor (0603)")\n  (pad 1 smd rect)\n)'
+    m = parseSexp(s)
+    assert m[:3] == [1, "module", "R_0603"]
+    assert m[3] == [1, "layer", "F.Cu"]
+    assert m[4] == [2, "descr", '"Resistor (0603)"']
+    assert m[5] == [3, "pad", "1", "smd", "rect"]
+    assert parseSexp("") == []
+    assert parseSexp("((a) b)") == [[1, "a"], "b"]
+
+
+def test_parse_sexp_multiline_quote():
+    # a line ending inside a quoted string is joined to the next line
+    m = parseSexp('(descr "a\\" b (c)\n  d")\n(tags x)')
+    assert m == [1, "descr", '"a\\"', "b", [1, "c"], 'd"']
+    m = parseSexp('(a (descr "x\ny")\n (b 1))')
+    assert m == [1, "a", [1, "descr", '"xy"'], [3, "b", "1"]]
+
+
+def test_parse_sexp_stream():
+    fn = os.path.join(KC_PATH, "kc4.kicad_mod")
+    with open(fn, "r") as f:
+        m = parseSexp(f.read())
+    with open(fn, "r") as f:
+        items = list(parseSexpStream(f))
+    assert items == [e for e in m if isinstance(e, list)]
+    pads = [e for e in parseSexpStream(io.StringIO("(x (pad 1) (pad 2))"))]
+    assert pads == [[1, "pad", "1"], [1, "pad", "2"]]
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from pcbflow import *
+
+KC_PATH = os.path.join(os.path.dirname(__file__), "..", "examples", "kicad_import")
+
+
+def _board():
+    brd = Board((40, 30))
+    brd.add_outline()
+    brd.add_inner_copper_layer()
+    r1 = R0603(brd.DC((10, 10)), val="10k").assign_pads("1", "2")
+    r2 = R0603(brd.DC((20, 10))).assign_pads("1", "2")
+    KiCadPart(brd.DC((20, 20)), libraryfile=os.path.join(KC_PATH, "kc1.kicad_mod"))
+    brd.addnet(r1.pads[1], r2.pads[0])
+    brd.DC((10, 5)).set_name("VCC").right(90).forward(10).wire()
+    brd.add_hole((35, 25), 2.0)
+    brd.add_named_rect((1, 29), (39, 1), "GBL", "GND")
+    brd.drc.clearance = 0.2
+    return brd
+
+
+def _read(fn):
+    with open(fn, "rb") as f:
+        return f.read()
+
+
+def test_board_snapshot(tmp_path):
+    brd = _board()
+    r1 = brd.get_part("R1")
+    fn = str(tmp_path / "board.pcb")
+    brd.dump(fn)
+
+    b2 = Board.load(fn)
+    assert b2.size == brd.size and b2.nets == brd.nets
+    assert b2.drc.clearance == 0.2
+    assert dict(b2.holes) == dict(brd.holes)
+    assert list(b2.layers) == list(brd.layers)
+    for name, layer in brd.layers.items():
+        if name == "GML":
+            assert [g.wkb for g in b2.layers[name].lines] == [
+                g.wkb for g in layer.lines
+            ]
+            continue
+        assert b2.layers[name].board is b2
+        polys = [(n, g.wkb) for n, g in layer.polys + layer.named_polys]
+        assert [(n, g.wkb) for n, g in b2.layers[name].polys] + [
+            (n, g.wkb) for n, g in b2.layers[name].named_polys
+        ] == polys
+    p = b2.get_part(r1.id)
+    assert p.val == "10k" and p.board is b2 and p.pads[1].board is b2
+    assert [pad.xy for pad in p.pads] == [pad.xy for pad in r1.pads]
+    # the restored board carries on like the original
+    assert R0603(b2.DC((30, 10))).id == "R3"
+    assert len(b2.check(verbose=False)) == len(brd.check(verbose=False))
+
+
+def test_board_snapshot_bytes(tmp_path, monkeypatch):
+    # separate builds of the same layout give identical snapshots, even if
+    # one parses its footprints from scratch
+    fa, fb, fc = [str(tmp_path / fn) for fn in ("a.pcb", "b.pcb", "c.pcb")]
+    _board().dump(fa)
+    monkeypatch.setattr(footprint_cache, "enabled", False)
+    _board().dump(fb)
+    assert _read(fa) == _read(fb)
+    # and so does a loaded snapshot
+    Board.load(fa).dump(fc)
+    assert _read(fc) == _read(fa)
+
+
+def test_board_snapshot_bad_file(tmp_path):
+    fn = str(tmp_path / "board.pcb")
+    with open(fn, "wb") as f:
+        f.write(b"not a board")
+    with pytest.raises(ValueError):
+        Board.load(fn)
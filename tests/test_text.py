@@ -83,3 +83,29 @@ def test_add_text_masked():
     assert n1 == 1
     assert k1 - k0 == 1
     assert k1 == 1
+
+
+def test_hershey_glyphs():
+    from pcbflow.hershey import hf, codes
+
+    assert len(hf) == 1597
+    a = hf[codes[ord("A")]]
+    assert a["charcode"] == 501
+    assert (a["left"], a["right"]) == (-9, 9)
+    assert a["lines"] == [[(0, -12), (-8, 9)], [(0, -12), (8, 9)], [(-5, 2), (5, 2)]]
+    assert hf[codes[ord("A")]] is a
+
+
+def test_text_cache():
+    from pcbflow import hershey
+
+    g0 = hershey.ctext(0, 0, "R12")
+    g1 = hershey.ctext(10, 5, "R12")
+    assert g0 is not g1
+    assert abs(g0.area - g1.area) < 1e-9
+    assert abs(g1.centroid.x - g0.centroid.x - 10) < 1e-9
+    assert abs(g1.centroid.y - g0.centroid.y - 5) < 1e-9
+    assert hershey.chars("R12") is hershey.chars("R12")
+    g2 = hershey.ctext(10, 5, "R12", side="bottom")
+    assert abs(g2.area - g1.area) < 1e-9
+    assert not g2.equals(g1)